@@ -15,6 +15,7 @@ __all__ = [
     "ColumnTemporalDriftDiscreteAnalyzer",
     "ColumnTemporalNullValueAnalyzer",
     "ContentAnalyzer",
+    "ContinuousColumnsAnalyzer",
     "DataFrameSummaryAnalyzer",
     "DataTypeAnalyzer",
     "DuplicatedRowAnalyzer",
@@ -36,6 +37,7 @@ from flamme.analyzer.column import ColumnSubsetAnalyzer
 from flamme.analyzer.content import ContentAnalyzer
 from flamme.analyzer.continuous import ColumnContinuousAnalyzer
 from flamme.analyzer.continuous_advanced import ColumnContinuousAdvancedAnalyzer
+from flamme.analyzer.continuous_columns import ContinuousColumnsAnalyzer
 from flamme.analyzer.continuous_drift import ColumnContinuousTemporalDriftAnalyzer
 from flamme.analyzer.continuous_temp import ColumnTemporalContinuousAnalyzer
 from flamme.analyzer.count_rows import TemporalRowCountAnalyzer
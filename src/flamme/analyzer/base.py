@@ -6,7 +6,7 @@ __all__ = ["BaseAnalyzer", "is_analyzer_config", "setup_analyzer"]
 
 import logging
 from abc import ABC
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from objectory import AbstractFactory
 from objectory.utils import is_object_config
@@ -87,6 +87,182 @@ class BaseAnalyzer(ABC, metaclass=AbstractFactory):
         ```
         """
 
+    def get_expressions(self, schema: pl.Schema) -> dict[str, pl.Expr]:  # noqa: ARG002
+        r"""Return the aggregations required by the analyzer.
+
+        The aggregations are declared as polars expressions, so the
+        aggregations of several analyzers can be merged and computed
+        with a single ``collect``. Each expression must return a
+        single value. The results are then given to
+        ``analyze_results`` to create the section. By default, an
+        analyzer does not declare any aggregation.
+
+        Args:
+            schema: The schema of the DataFrame to analyze.
+
+        Returns:
+            The aggregations to compute. The keys are used to find
+                the results in ``analyze_results``.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import polars as pl
+        >>> from flamme.analyzer import NullValueAnalyzer
+        >>> analyzer = NullValueAnalyzer()
+        >>> exprs = analyzer.get_expressions(pl.Schema({"float": pl.Float64, "int": pl.Int64}))
+        >>> sorted(exprs)
+        ['null_count/float', 'null_count/int', 'num_rows']
+
+        ```
+        """
+        return {}
+
+    def analyze_results(
+        self, frame: pl.DataFrame, results: dict[str, Any]  # noqa: ARG002
+    ) -> BaseSection:
+        r"""Analyze the data in a DataFrame by using the precomputed
+        aggregation results.
+
+        Args:
+            frame: The DataFrame with the data to analyze.
+            results: The results of the aggregations returned by
+                ``get_expressions``.
+
+        Returns:
+            The section report.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import polars as pl
+        >>> from flamme.analyzer import NullValueAnalyzer
+        >>> from flamme.utils.lazy import collect_expressions
+        >>> analyzer = NullValueAnalyzer()
+        >>> frame = pl.DataFrame(
+        ...     {
+        ...         "float": [1.2, 4.2, None, 2.2],
+        ...         "int": [None, 1, 0, 1],
+        ...         "str": ["A", "B", None, None],
+        ...     },
+        ...     schema={"float": pl.Float64, "int": pl.Int64, "str": pl.String},
+        ... )
+        >>> results = collect_expressions(frame, analyzer.get_expressions(frame.schema))
+        >>> section = analyzer.analyze_results(frame, results)
+        >>> section
+        NullValueSection(
+          (columns): ('float', 'int', 'str')
+          (null_count): array([1, 1, 2])
+          (total_count): array([4, 4, 4])
+          (figsize): None
+        )
+
+        ```
+        """
+        return self.analyze(frame)
+
+    def is_streamable(self) -> bool:
+        r"""Indicate if the analyzer can analyze the data by batches.
+
+        A streamable analyzer updates a bounded state with each batch
+        in ``update`` and creates the section from this state in
+        ``finalize``, so the data do not need to fit in memory.
+        By default, an analyzer is not streamable.
+
+        Returns:
+            ``True`` if the analyzer can analyze the data by batches,
+                otherwise ``False``.
+
+        Example usage:
+
+        ```pycon
+
+        >>> from flamme.analyzer import DuplicatedRowAnalyzer, NullValueAnalyzer
+        >>> NullValueAnalyzer().is_streamable()
+        True
+        >>> DuplicatedRowAnalyzer().is_streamable()
+        False
+
+        ```
+        """
+        return False
+
+    def update(self, batch: pl.DataFrame) -> None:  # noqa: ARG002
+        r"""Update the state of the analyzer with a batch of data.
+
+        All the batches must have the same schema. By default, the
+        batches are ignored and the section is created from a sample
+        of the data in ``finalize``.
+
+        Args:
+            batch: The batch of data.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import polars as pl
+        >>> from flamme.analyzer import NullValueAnalyzer
+        >>> analyzer = NullValueAnalyzer()
+        >>> analyzer.update(pl.DataFrame({"float": [1.2, None], "str": ["A", None]}))
+        >>> analyzer.update(pl.DataFrame({"float": [None, 2.2], "str": ["B", "C"]}))
+        >>> analyzer.finalize()
+        NullValueSection(
+          (columns): ('float', 'str')
+          (null_count): array([2, 1])
+          (total_count): array([4, 4])
+          (figsize): None
+        )
+
+        ```
+        """
+        return
+
+    def finalize(self, sample: pl.DataFrame | None = None) -> BaseSection:
+        r"""Create the section from the state updated by the batches
+        and reset the state.
+
+        The analyzers that are not streamable analyze a sample of the
+        data instead.
+
+        Args:
+            sample: A sample of the data. It is only used by the
+                analyzers that are not streamable.
+
+        Returns:
+            The section report.
+
+        Raises:
+            RuntimeError: if the analyzer is not streamable and no
+                sample is given.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import polars as pl
+        >>> from flamme.analyzer import DuplicatedRowAnalyzer
+        >>> analyzer = DuplicatedRowAnalyzer()
+        >>> analyzer.update(pl.DataFrame({"col": [1, 2, 1]}))
+        >>> analyzer.finalize(sample=pl.DataFrame({"col": [1, 1]}))
+        DuplicatedRowSection(
+          (frame): (2, 1)
+          (columns): None
+          (figsize): None
+        )
+
+        ```
+        """
+        if sample is None:
+            msg = (
+                f"{self.__class__.__qualname__} cannot analyze the data by batches, "
+                "so a sample of the data is required"
+            )
+            raise RuntimeError(msg)
+        return self.analyze(sample)
+
 
 def is_analyzer_config(config: dict) -> bool:
     r"""Indicate if the input configuration is a configuration for a
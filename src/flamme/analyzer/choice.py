@@ -6,16 +6,17 @@ from __future__ import annotations
 __all__ = ["ChoiceAnalyzer", "NumUniqueSelection"]
 
 from collections.abc import Callable, Mapping
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+import polars as pl
 from coola.utils import str_indent, str_mapping
 
 from flamme.analyzer.base import BaseAnalyzer, setup_analyzer
+from flamme.utils.count import estimate_nunique
+from flamme.utils.lazy import collect_expressions
+from flamme.utils.mapping import add_key_prefix, remove_key_prefix
 
 if TYPE_CHECKING:
-
-    import polars as pl
-
     from flamme.section import BaseSection
 
 
@@ -27,7 +28,13 @@ class ChoiceAnalyzer(BaseAnalyzer):
             is used to organize the metrics and report.
         selection_fn: Specifies a callable with the selection logic.
             The callable returns the key of the analyzer to use based
-            on the data in the input DataFrame.
+            on the data in the input DataFrame. If the callable also
+            implements ``get_expressions`` and ``select_results``
+            (e.g. ``NumUniqueSelection``), its aggregations are
+            computed in the same query as the other analyzers.
+            Only the selected analyzer is run, with its own query,
+            so the aggregations of the other analyzers are never
+            computed.
 
     Example usage:
 
@@ -85,8 +92,27 @@ class ChoiceAnalyzer(BaseAnalyzer):
         return self._analyzers
 
     def analyze(self, frame: pl.DataFrame) -> BaseSection:
-        analyzer = self._analyzers[self._selection_fn(frame)]
-        return analyzer.analyze(frame)
+        return self.analyze_results(
+            frame, collect_expressions(frame, self.get_expressions(frame.schema))
+        )
+
+    def get_expressions(self, schema: pl.Schema) -> dict[str, pl.Expr]:
+        # Only the selection aggregations are declared. The analyzer
+        # is not known before the query, so declaring the
+        # aggregations of all the analyzers would compute the
+        # aggregations of the discarded analyzers.
+        if not hasattr(self._selection_fn, "get_expressions"):
+            return {}
+        return add_key_prefix(self._selection_fn.get_expressions(schema), prefix="selection/")
+
+    def analyze_results(self, frame: pl.DataFrame, results: dict[str, Any]) -> BaseSection:
+        if hasattr(self._selection_fn, "select_results"):
+            name = self._selection_fn.select_results(
+                frame, remove_key_prefix(results, prefix="selection/")
+            )
+        else:
+            name = self._selection_fn(frame)
+        return self._analyzers[name].analyze(frame)
 
 
 class NumUniqueSelection(Callable):
@@ -100,6 +126,9 @@ class NumUniqueSelection(Callable):
             values is lower than the threshold.
         large: The string to return if the number of unique
             values is greater than the threshold.
+        approximate: If ``True``, the number of unique values is
+            estimated with a ``HyperLogLog`` sketch instead of
+            computing the exact number of unique values.
 
     Example usage:
 
@@ -110,7 +139,7 @@ class NumUniqueSelection(Callable):
     >>> from flamme.analyzer.choice import NumUniqueSelection
     >>> selection = NumUniqueSelection(column="col")
     >>> selection
-    NumUniqueSelection(column=col, threshold=100, small=small, large=large)
+    NumUniqueSelection(column=col, threshold=100, small=small, large=large, approximate=False)
     >>> selection(pl.DataFrame({"col": np.arange(10)}))
     small
     >>> selection(pl.DataFrame({"col": np.arange(1000)}))
@@ -120,19 +149,81 @@ class NumUniqueSelection(Callable):
     """
 
     def __init__(
-        self, column: str, threshold: int = 100, small: str = "small", large: str = "large"
+        self,
+        column: str,
+        threshold: int = 100,
+        small: str = "small",
+        large: str = "large",
+        approximate: bool = False,
     ) -> None:
         self._column = column
         self._threshold = threshold
         self._small = small
         self._large = large
+        self._approximate = bool(approximate)
 
     def __repr__(self) -> str:
         return (
             f"{self.__class__.__qualname__}(column={self._column}, threshold={self._threshold}, "
-            f"small={self._small}, large={self._large})"
+            f"small={self._small}, large={self._large}, approximate={self._approximate})"
         )
 
     def __call__(self, frame: pl.DataFrame) -> str:
-        nunique = frame[self._column].n_unique()
+        series = frame[self._column]
+        nunique = estimate_nunique(series) if self._approximate else series.n_unique()
         return self._small if nunique <= self._threshold else self._large
+
+    def get_expressions(self, schema: pl.Schema) -> dict[str, pl.Expr]:
+        r"""Return the aggregations required to select the analyzer.
+
+        Args:
+            schema: The schema of the DataFrame to analyze.
+
+        Returns:
+            The aggregations to compute. The number of unique values
+                is computed only if it is exact and the column exists.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import polars as pl
+        >>> from flamme.analyzer.choice import NumUniqueSelection
+        >>> selection = NumUniqueSelection(column="col")
+        >>> list(selection.get_expressions(pl.Schema({"col": pl.Int64})))
+        ['nunique']
+
+        ```
+        """
+        if self._approximate or self._column not in schema:
+            return {}
+        return {"nunique": pl.col(self._column).n_unique()}
+
+    def select_results(self, frame: pl.DataFrame, results: dict[str, Any]) -> str:
+        r"""Return the key of the analyzer to use from the computed
+        aggregations.
+
+        Args:
+            frame: The DataFrame to analyze.
+            results: The results of the aggregations returned by
+                ``get_expressions``.
+
+        Returns:
+            The key of the analyzer to use.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> import polars as pl
+        >>> from flamme.analyzer.choice import NumUniqueSelection
+        >>> selection = NumUniqueSelection(column="col")
+        >>> selection.select_results(pl.DataFrame({"col": np.arange(10)}), {"nunique": 1000})
+        large
+
+        ```
+        """
+        if "nunique" not in results:
+            return self(frame)
+        return self._small if results["nunique"] <= self._threshold else self._large
@@ -5,18 +5,19 @@ from __future__ import annotations
 __all__ = ["ColumnSubsetAnalyzer"]
 
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+import polars as pl
 from coola.utils import str_indent, str_mapping
 
 from flamme.analyzer.base import BaseAnalyzer
 from flamme.utils import setup_object
+from flamme.utils.lazy import collect_expressions
+from flamme.utils.mapping import add_key_prefix, remove_key_prefix
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
-    import polars as pl
-
     from flamme.section import BaseSection
 
 logger = logging.getLogger(__name__)
@@ -76,5 +77,32 @@ class ColumnSubsetAnalyzer(BaseAnalyzer):
         return f"{self.__class__.__qualname__}(\n  {args}\n)"
 
     def analyze(self, frame: pl.DataFrame) -> BaseSection:
+        return self.analyze_results(
+            frame, collect_expressions(frame, self.get_expressions(frame.schema))
+        )
+
+    def get_expressions(self, schema: pl.Schema) -> dict[str, pl.Expr]:
+        if any(col not in schema for col in self._columns):
+            # The column selection fails in ``analyze_results``.
+            return {}
+        # The expressions of the analyzer refer to the columns by name,
+        # so they can be computed on the DataFrame with all the columns.
+        schema = pl.Schema({col: schema[col] for col in self._columns})
+        return add_key_prefix(self._analyzer.get_expressions(schema), prefix="analyzer/")
+
+    def analyze_results(self, frame: pl.DataFrame, results: dict[str, Any]) -> BaseSection:
         logger.info(f"Selecting {len(self._columns):,} columns: {self._columns}")
-        return self._analyzer.analyze(frame.select(self._columns))
+        return self._analyzer.analyze_results(
+            frame.select(self._columns), remove_key_prefix(results, prefix="analyzer/")
+        )
+
+    def is_streamable(self) -> bool:
+        return self._analyzer.is_streamable()
+
+    def update(self, batch: pl.DataFrame) -> None:
+        self._analyzer.update(batch.select(self._columns))
+
+    def finalize(self, sample: pl.DataFrame | None = None) -> BaseSection:
+        if sample is not None:
+            sample = sample.select(self._columns)
+        return self._analyzer.finalize(sample)
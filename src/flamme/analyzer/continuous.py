@@ -5,13 +5,11 @@ from __future__ import annotations
 __all__ = ["ColumnContinuousAnalyzer"]
 
 import logging
-from typing import TYPE_CHECKING
+import polars as pl
 
 from flamme.analyzer.base import BaseAnalyzer
 from flamme.section import ColumnContinuousSection, EmptySection
-
-if TYPE_CHECKING:
-    import polars as pl
+from flamme.utils.stats import ContinuousStatisticsSketch
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +32,15 @@ class ColumnContinuousAnalyzer(BaseAnalyzer):
             ``0`` is the minimum value and ``1`` is the maximum value.
         figsize: The figure size in inches. The first
             dimension is the width and the second is the height.
+        num_quantiles: The number of quantiles of the sketch used to
+            draw the figures when the data are analyzed by batches.
+
+    The analyzer can analyze the data by batches (see ``update``). The
+    descriptive statistics are then computed with
+    ``ContinuousStatisticsSketch``, and the figures are drawn from
+    ``num_quantiles`` evenly spaced quantiles of the values, so they
+    show the shape of the distribution but not the number of
+    occurrences.
 
     Example usage:
 
@@ -65,6 +72,8 @@ class ColumnContinuousAnalyzer(BaseAnalyzer):
         xmin: float | str | None = "q0",
         xmax: float | str | None = "q1",
         figsize: tuple[float, float] | None = None,
+        *,
+        num_quantiles: int = 1000,
     ) -> None:
         self._column = column
         self._nbins = nbins
@@ -72,6 +81,8 @@ class ColumnContinuousAnalyzer(BaseAnalyzer):
         self._xmin = xmin
         self._xmax = xmax
         self._figsize = figsize
+        self._num_quantiles = num_quantiles
+        self._state: tuple[pl.DataType, ContinuousStatisticsSketch] | None = None
 
     def __repr__(self) -> str:
         return (
@@ -96,3 +107,39 @@ class ColumnContinuousAnalyzer(BaseAnalyzer):
             xmax=self._xmax,
             figsize=self._figsize,
         )
+
+    def is_streamable(self) -> bool:
+        return True
+
+    def update(self, batch: pl.DataFrame) -> None:
+        if self._column not in batch:
+            return
+        if self._state is None:
+            self._state = (batch.schema[self._column], ContinuousStatisticsSketch())
+        self._state[1].update(batch[self._column])
+
+    def finalize(
+        self, sample: pl.DataFrame | None = None  # noqa: ARG002
+    ) -> ColumnContinuousSection | EmptySection:
+        state, self._state = self._state, None
+        logger.info(f"Analyzing the continuous distribution of {self._column}")
+        if state is None:
+            logger.warning(
+                "Skipping temporal continuous distribution analysis because the column "
+                f"({self._column}) is not in the DataFrame"
+            )
+            return EmptySection()
+        dtype, sketch = state
+        series = pl.Series(self._column, sketch.get_quantile_values(self._num_quantiles))
+        if dtype.is_integer():
+            series = series.round()
+        return ColumnContinuousSection(
+            column=self._column,
+            series=series.cast(dtype),
+            nbins=self._nbins,
+            yscale=self._yscale,
+            xmin=self._xmin,
+            xmax=self._xmax,
+            figsize=self._figsize,
+            statistics=sketch.get_statistics(),
+        )
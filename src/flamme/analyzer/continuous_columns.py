@@ -0,0 +1,279 @@
+r"""Implement an analyzer to analyze the continuous distribution of
+multiple columns."""
+
+from __future__ import annotations
+
+__all__ = ["ContinuousColumnsAnalyzer"]
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+from flamme.analyzer.base import BaseAnalyzer
+from flamme.section import (
+    ColumnContinuousAdvancedSection,
+    ColumnContinuousSection,
+    ColumnTemporalContinuousSection,
+    SectionDict,
+)
+from flamme.utils.cube import get_temporal_cube
+from flamme.utils.lazy import collect_expressions
+from flamme.utils.stats import get_statistics_continuous_expression
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import polars as pl
+
+    from flamme.section import BaseSection
+
+logger = logging.getLogger(__name__)
+
+
+class ContinuousColumnsAnalyzer(BaseAnalyzer):
+    r"""Implement an analyzer to analyze the continuous distribution of
+    multiple columns.
+
+    The analyzer creates the same sections as
+    ``ColumnContinuousAnalyzer``, ``ColumnTemporalContinuousAnalyzer``
+    and ``ColumnContinuousAdvancedAnalyzer`` for each column, but the
+    descriptive statistics of all the columns are computed with a
+    single query (see ``get_expressions``), and the temporal
+    statistics of all the columns are computed with a single
+    group-by when ``base_period`` is set. The histograms, the
+    boxplots and the temporal sections without ``base_period`` are
+    still computed from the values of each column.
+
+    Args:
+        columns: The columns to analyze. If ``None``, all the numeric
+            columns are analyzed. The columns that are not numeric
+            are skipped.
+        dt_column: The datetime column used to analyze the temporal
+            distribution. If ``None``, the temporal distribution is
+            not analyzed.
+        periods: The temporal periods to analyze e.g. monthly or
+            daily.
+        nbins: The number of bins in the histograms.
+        yscale: The y-axis scale. If ``'auto'``, the
+            ``'linear'`` or ``'log'/'symlog'`` scale is chosen based
+            on the distribution.
+        xmin: The minimum value of the range or its
+            associated quantile. ``q0.1`` means the 10% quantile.
+            ``0`` is the minimum value and ``1`` is the maximum value.
+        xmax: The maximum value of the range or its
+            associated quantile. ``q0.9`` means the 90% quantile.
+            ``0`` is the minimum value and ``1`` is the maximum value.
+        figsize: The figure size in inches. The first
+            dimension is the width and the second is the height.
+        advanced: If ``True``, an advanced section is created for
+            each column.
+        base_period: If not ``None``, the temporal statistics are
+            computed from the temporal cube with this base period.
+            The windows of each period must be unions of windows of
+            ``base_period`` e.g. ``'1d'`` for a weekly or monthly
+            analysis.
+        max_toc_depth: The maximum level to show in the
+            table of content.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from datetime import datetime, timezone
+    >>> import polars as pl
+    >>> from flamme.analyzer import ContinuousColumnsAnalyzer
+    >>> analyzer = ContinuousColumnsAnalyzer(dt_column="datetime", periods=["1mo"])
+    >>> analyzer
+    ContinuousColumnsAnalyzer(columns=None, dt_column=datetime, periods=('1mo',), nbins=None, yscale=auto, xmin=q0, xmax=q1, figsize=None, advanced=True, base_period=None)
+    >>> frame = pl.DataFrame(
+    ...     {
+    ...         "float": [1.2, 4.2, None, 2.2],
+    ...         "int": [None, 1, 0, 1],
+    ...         "str": ["A", "B", None, None],
+    ...         "datetime": [
+    ...             datetime(year=2020, month=1, day=3, tzinfo=timezone.utc),
+    ...             datetime(year=2020, month=1, day=4, tzinfo=timezone.utc),
+    ...             datetime(year=2020, month=2, day=3, tzinfo=timezone.utc),
+    ...             datetime(year=2020, month=3, day=3, tzinfo=timezone.utc),
+    ...         ],
+    ...     },
+    ... )
+    >>> section = analyzer.analyze(frame)
+    >>> list(section.sections)
+    ['float', 'int']
+    >>> list(section.sections["float"].sections)
+    ['overall', '1mo', 'advanced']
+    >>> section.sections["float"].sections["overall"].get_statistics()["mean"]
+    2.533...
+
+    ```
+    """
+
+    def __init__(
+        self,
+        columns: Sequence[str] | None = None,
+        dt_column: str | None = None,
+        periods: Sequence[str] = (),
+        *,
+        nbins: int | None = None,
+        yscale: str = "auto",
+        xmin: float | str | None = "q0",
+        xmax: float | str | None = "q1",
+        figsize: tuple[float, float] | None = None,
+        advanced: bool = True,
+        base_period: str | None = None,
+        max_toc_depth: int = 0,
+    ) -> None:
+        self._columns = tuple(columns) if columns is not None else None
+        self._dt_column = dt_column
+        self._periods = tuple(periods)
+        self._nbins = nbins
+        self._yscale = yscale
+        self._xmin = xmin
+        self._xmax = xmax
+        self._figsize = figsize
+        self._advanced = advanced
+        self._base_period = base_period
+        self._max_toc_depth = max_toc_depth
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__qualname__}(columns={self._columns}, "
+            f"dt_column={self._dt_column}, periods={self._periods}, nbins={self._nbins}, "
+            f"yscale={self._yscale}, xmin={self._xmin}, xmax={self._xmax}, "
+            f"figsize={self._figsize}, advanced={self._advanced}, "
+            f"base_period={self._base_period})"
+        )
+
+    def analyze(self, frame: pl.DataFrame) -> SectionDict:
+        return self.analyze_results(
+            frame, collect_expressions(frame, self.get_expressions(frame.schema))
+        )
+
+    def get_expressions(self, schema: pl.Schema) -> dict[str, pl.Expr]:
+        return {
+            f"statistics/{col}": get_statistics_continuous_expression(col)
+            for col in self._find_columns(schema)
+        }
+
+    def analyze_results(self, frame: pl.DataFrame, results: dict[str, Any]) -> SectionDict:
+        columns = self._find_columns(frame.schema)
+        logger.info(f"Analyzing the continuous distribution of {len(columns):,} columns...")
+        temporal = self._is_temporal(frame.schema)
+        if temporal and self._base_period is not None and columns:
+            get_temporal_cube(frame, dt_column=self._dt_column, period=self._base_period).prepare(
+                columns
+            )
+        return SectionDict(
+            sections={
+                col: self._create_column_section(
+                    frame, column=col, statistics=results[f"statistics/{col}"], temporal=temporal
+                )
+                for col in columns
+            },
+            max_toc_depth=self._max_toc_depth,
+        )
+
+    def _create_column_section(
+        self, frame: pl.DataFrame, column: str, statistics: dict[str, float], temporal: bool
+    ) -> SectionDict:
+        r"""Create the sections to analyze a column.
+
+        Args:
+            frame: The DataFrame to analyze.
+            column: The column to analyze.
+            statistics: The precomputed descriptive statistics of the
+                column.
+            temporal: If ``True``, the temporal sections are created.
+
+        Returns:
+            The sections of the column.
+        """
+        series = frame[column]
+        sections: dict[str, BaseSection] = {
+            "overall": ColumnContinuousSection(
+                series=series,
+                column=column,
+                nbins=self._nbins,
+                yscale=self._yscale,
+                xmin=self._xmin,
+                xmax=self._xmax,
+                figsize=self._figsize,
+                statistics=statistics,
+            )
+        }
+        if temporal:
+            for period in self._periods:
+                sections[period] = ColumnTemporalContinuousSection(
+                    frame=frame,
+                    column=column,
+                    dt_column=self._dt_column,
+                    period=period,
+                    yscale=self._yscale,
+                    figsize=self._figsize,
+                    base_period=self._base_period,
+                )
+        if self._advanced:
+            sections["advanced"] = ColumnContinuousAdvancedSection(
+                series=series,
+                column=column,
+                nbins=self._nbins,
+                yscale=self._yscale,
+                figsize=self._figsize,
+                statistics=statistics,
+            )
+        return SectionDict(sections)
+
+    def _find_columns(self, schema: pl.Schema) -> list[str]:
+        r"""Find the columns to analyze.
+
+        Args:
+            schema: The schema of the DataFrame to analyze.
+
+        Returns:
+            The columns to analyze.
+        """
+        if self._columns is None:
+            return [
+                col
+                for col, dtype in schema.items()
+                if dtype.is_numeric() and col != self._dt_column
+            ]
+        missing = [col for col in self._columns if col not in schema]
+        if missing:
+            logger.warning(
+                "Skipping the continuous distribution analysis of the following columns "
+                f"because they are not in the DataFrame: {missing}"
+            )
+        non_numeric = [
+            col for col in self._columns if col in schema and not schema[col].is_numeric()
+        ]
+        if non_numeric:
+            logger.warning(
+                "Skipping the continuous distribution analysis of the following columns "
+                f"because they are not numeric: {non_numeric}"
+            )
+        return [
+            col
+            for col in self._columns
+            if col in schema and schema[col].is_numeric() and col != self._dt_column
+        ]
+
+    def _is_temporal(self, schema: pl.Schema) -> bool:
+        r"""Indicate if the temporal distribution can be analyzed.
+
+        Args:
+            schema: The schema of the DataFrame to analyze.
+
+        Returns:
+            ``True`` if the temporal distribution can be analyzed,
+                otherwise ``False``.
+        """
+        if self._dt_column is None or not self._periods:
+            return False
+        if self._dt_column not in schema:
+            logger.info(
+                "Skipping temporal continuous distribution analysis because the datetime column "
+                f"({self._dt_column}) is not in the DataFrame"
+            )
+            return False
+        return True
@@ -32,6 +32,12 @@ class ColumnTemporalContinuousAnalyzer(BaseAnalyzer):
             on the distribution.
         figsize: The figure size in inches. The first
             dimension is the width and the second is the height.
+        base_period: If not ``None``, the statistics are computed
+            from the temporal cube with this base period, which is
+            shared by all the analyzers with the same DataFrame,
+            datetime column and base period. The windows of
+            ``period`` must be unions of windows of ``base_period``
+            e.g. ``'1d'`` for a weekly or monthly analysis.
 
     Example usage:
 
@@ -44,7 +50,7 @@ class ColumnTemporalContinuousAnalyzer(BaseAnalyzer):
     ...     column="col", dt_column="datetime", period="1mo"
     ... )
     >>> analyzer
-    ColumnTemporalContinuousAnalyzer(column=col, dt_column=datetime, period=1mo, yscale=auto, figsize=None)
+    ColumnTemporalContinuousAnalyzer(column=col, dt_column=datetime, period=1mo, yscale=auto, figsize=None, base_period=None)
     >>> frame = pl.DataFrame(
     ...     {
     ...         "col": [0.0, 1.0, 2.0, 3.0, 4.0, 5.0],
@@ -70,6 +76,7 @@ class ColumnTemporalContinuousAnalyzer(BaseAnalyzer):
       (period): 1mo
       (yscale): auto
       (figsize): None
+      (base_period): None
     )
 
     ```
@@ -82,18 +89,21 @@ class ColumnTemporalContinuousAnalyzer(BaseAnalyzer):
         period: str,
         yscale: str = "auto",
         figsize: tuple[float, float] | None = None,
+        *,
+        base_period: str | None = None,
     ) -> None:
         self._column = column
         self._dt_column = dt_column
         self._period = period
         self._yscale = yscale
         self._figsize = figsize
+        self._base_period = base_period
 
     def __repr__(self) -> str:
         return (
             f"{self.__class__.__qualname__}(column={self._column}, "
             f"dt_column={self._dt_column}, period={self._period}, "
-            f"yscale={self._yscale}, figsize={self._figsize})"
+            f"yscale={self._yscale}, figsize={self._figsize}, base_period={self._base_period})"
         )
 
     def analyze(self, frame: pl.DataFrame) -> ColumnTemporalContinuousSection | EmptySection:
@@ -121,4 +131,5 @@ class ColumnTemporalContinuousAnalyzer(BaseAnalyzer):
             period=self._period,
             yscale=self._yscale,
             figsize=self._figsize,
+            base_period=self._base_period,
         )
@@ -27,6 +27,12 @@ class TemporalRowCountAnalyzer(BaseAnalyzer):
         period: The temporal period e.g. monthly or daily.
         figsize: The figure size in inches. The first
             dimension is the width and the second is the height.
+        base_period: If not ``None``, the statistics are computed
+            from the temporal cube with this base period, which is
+            shared by all the analyzers with the same DataFrame,
+            datetime column and base period. The windows of
+            ``period`` must be unions of windows of ``base_period``
+            e.g. ``'1d'`` for a weekly or monthly analysis.
 
     Example usage:
 
@@ -37,7 +43,7 @@ class TemporalRowCountAnalyzer(BaseAnalyzer):
     >>> from flamme.analyzer import TemporalRowCountAnalyzer
     >>> analyzer = TemporalRowCountAnalyzer(dt_column="datetime", period="1mo")
     >>> analyzer
-    TemporalRowCountAnalyzer(dt_column=datetime, period=1mo, figsize=None)
+    TemporalRowCountAnalyzer(dt_column=datetime, period=1mo, figsize=None, base_period=None)
     >>> frame = pl.DataFrame(
     ...     {
     ...         "datetime": [
@@ -51,7 +57,7 @@ class TemporalRowCountAnalyzer(BaseAnalyzer):
     ... )
     >>> section = analyzer.analyze(frame)
     >>> section
-    TemporalRowCountSection(dt_column=datetime, period=1mo, figsize=None)
+    TemporalRowCountSection(dt_column=datetime, period=1mo, figsize=None, base_period=None)
 
     ```
     """
@@ -61,15 +67,18 @@ class TemporalRowCountAnalyzer(BaseAnalyzer):
         dt_column: str,
         period: str,
         figsize: tuple[float, float] | None = None,
+        *,
+        base_period: str | None = None,
     ) -> None:
         self._dt_column = dt_column
         self._period = period
         self._figsize = figsize
+        self._base_period = base_period
 
     def __repr__(self) -> str:
         return (
             f"{self.__class__.__qualname__}(dt_column={self._dt_column}, "
-            f"period={self._period}, figsize={self._figsize})"
+            f"period={self._period}, figsize={self._figsize}, base_period={self._base_period})"
         )
 
     def analyze(self, frame: pl.DataFrame) -> TemporalRowCountSection | EmptySection:
@@ -88,4 +97,5 @@ class TemporalRowCountAnalyzer(BaseAnalyzer):
             dt_column=self._dt_column,
             period=self._period,
             figsize=self._figsize,
+            base_period=self._base_period,
         )
@@ -5,11 +5,11 @@ from __future__ import annotations
 __all__ = ["ColumnDiscreteAnalyzer"]
 
 import logging
-from collections import Counter
 from typing import TYPE_CHECKING
 
 from flamme.analyzer.base import BaseAnalyzer
 from flamme.section import ColumnDiscreteSection, EmptySection
+from flamme.utils.count import compute_frequency_table
 
 if TYPE_CHECKING:
     import polars as pl
@@ -31,6 +31,10 @@ class ColumnDiscreteAnalyzer(BaseAnalyzer):
             distribution.
         figsize: The figure size in inches. The first
             dimension is the width and the second is the height.
+        capacity: If not ``None``, the number of occurrences are
+            approximated with a ``SpaceSaving`` sketch that keeps
+            the ``capacity`` most frequent values. It bounds the
+            memory for columns with many unique values.
 
     Example usage:
 
@@ -40,7 +44,8 @@ class ColumnDiscreteAnalyzer(BaseAnalyzer):
     >>> from flamme.analyzer import ColumnDiscreteAnalyzer
     >>> analyzer = ColumnDiscreteAnalyzer(column="str")
     >>> analyzer
-    ColumnDiscreteAnalyzer(column=str, drop_nulls=False, max_rows=20, yscale=auto, figsize=None)
+    ColumnDiscreteAnalyzer(column=str, drop_nulls=False, max_rows=20, yscale=auto, figsize=None,
+      capacity=None)
     >>> frame = pl.DataFrame(
     ...     {
     ...         "int": [None, 1, 0, 1],
@@ -68,18 +73,21 @@ class ColumnDiscreteAnalyzer(BaseAnalyzer):
         max_rows: int = 20,
         yscale: str = "auto",
         figsize: tuple[float, float] | None = None,
+        *,
+        capacity: int | None = None,
     ) -> None:
         self._column = column
         self._drop_nulls = bool(drop_nulls)
         self._max_rows = max_rows
         self._yscale = yscale
         self._figsize = figsize
+        self._capacity = capacity
 
     def __repr__(self) -> str:
         return (
             f"{self.__class__.__qualname__}(column={self._column}, "
             f"drop_nulls={self._drop_nulls}, max_rows={self._max_rows}, yscale={self._yscale}, "
-            f"figsize={self._figsize})"
+            f"figsize={self._figsize}, capacity={self._capacity})"
         )
 
     def analyze(self, frame: pl.DataFrame) -> ColumnDiscreteSection | EmptySection:
@@ -94,7 +102,9 @@ class ColumnDiscreteAnalyzer(BaseAnalyzer):
         if self._drop_nulls:
             series = series.drop_nulls()
         return ColumnDiscreteSection(
-            counter=Counter(series.to_list()),
+            counter=compute_frequency_table(
+                frame, column=self._column, drop_nulls=self._drop_nulls, capacity=self._capacity
+            ),
             null_values=series.null_count(),
             dtype=series.dtype,
             column=self._column,
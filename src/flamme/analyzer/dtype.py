@@ -6,14 +6,14 @@ from __future__ import annotations
 __all__ = ["DataTypeAnalyzer"]
 
 import logging
-from typing import TYPE_CHECKING
+from typing import Any
+
+import polars as pl
 
 from flamme.analyzer.base import BaseAnalyzer
 from flamme.section import DataTypeSection
-from flamme.utils.dtype import frame_types
-
-if TYPE_CHECKING:
-    import polars as pl
+from flamme.utils.dtype import dtype_types, frame_types, series_types
+from flamme.utils.lazy import collect_expressions
 
 logger = logging.getLogger(__name__)
 
@@ -48,9 +48,48 @@ class DataTypeAnalyzer(BaseAnalyzer):
     ```
     """
 
+    def __init__(self) -> None:
+        # The data types and value types of the batches.
+        self._state: tuple[dict[str, pl.DataType], dict[str, set[type]]] | None = None
+
     def __repr__(self) -> str:
         return f"{self.__class__.__qualname__}()"
 
     def analyze(self, frame: pl.DataFrame) -> DataTypeSection:
+        return self.analyze_results(
+            frame, collect_expressions(frame, self.get_expressions(frame.schema))
+        )
+
+    def get_expressions(self, schema: pl.Schema) -> dict[str, pl.Expr]:
+        # The value types are found from the data types and the null
+        # values, so the values are not converted to Python objects.
+        return {"num_rows": pl.len()} | {
+            f"null_count/{col}": pl.col(col).null_count() for col in schema
+        }
+
+    def analyze_results(self, frame: pl.DataFrame, results: dict[str, Any]) -> DataTypeSection:
+        logger.info("Analyzing the data types...")
+        types = {}
+        for col, dtype in frame.schema.items():
+            col_types = dtype_types(
+                dtype, null_count=results[f"null_count/{col}"], num_rows=results["num_rows"]
+            )
+            types[col] = series_types(frame[col]) if col_types is None else col_types
+        return DataTypeSection(dtypes=dict(frame.schema), types=types)
+
+    def is_streamable(self) -> bool:
+        return True
+
+    def update(self, batch: pl.DataFrame) -> None:
+        types = frame_types(batch)
+        if self._state is None:
+            self._state = (dict(batch.schema), types)
+            return
+        for col, value_types in types.items():
+            self._state[1][col] |= value_types
+
+    def finalize(self, sample: pl.DataFrame | None = None) -> DataTypeSection:  # noqa: ARG002
+        dtypes, types = self._state or ({}, {})
+        self._state = None
         logger.info("Analyzing the data types...")
-        return DataTypeSection(dtypes=dict(frame.schema), types=frame_types(frame))
+        return DataTypeSection(dtypes=dtypes, types=types)
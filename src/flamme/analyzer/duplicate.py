@@ -6,16 +6,17 @@ from __future__ import annotations
 __all__ = ["DuplicatedRowAnalyzer"]
 
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+
+import polars as pl
 
 from flamme.analyzer.base import BaseAnalyzer
 from flamme.section import DuplicatedRowSection
+from flamme.utils.lazy import collect_expressions
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
-    import polars as pl
-
 
 logger = logging.getLogger(__name__)
 
@@ -69,5 +70,23 @@ class DuplicatedRowAnalyzer(BaseAnalyzer):
         return f"{self.__class__.__qualname__}(columns={self._columns}, figsize={self._figsize})"
 
     def analyze(self, frame: pl.DataFrame) -> DuplicatedRowSection:
+        return self.analyze_results(
+            frame, collect_expressions(frame, self.get_expressions(frame.schema))
+        )
+
+    def get_expressions(self, schema: pl.Schema) -> dict[str, pl.Expr]:
+        columns = list(schema) if self._columns is None else list(self._columns)
+        if not columns or any(col not in schema for col in columns):
+            # The section computes the number of unique rows, so a
+            # missing column does not break the other aggregations.
+            return {}
+        return {"num_unique_rows": pl.struct(columns).n_unique()}
+
+    def analyze_results(self, frame: pl.DataFrame, results: dict[str, Any]) -> DuplicatedRowSection:
         logger.info(f"Analyzing the duplicated rows section using the columns: {self._columns}")
-        return DuplicatedRowSection(frame=frame, columns=self._columns, figsize=self._figsize)
+        return DuplicatedRowSection(
+            frame=frame,
+            columns=self._columns,
+            figsize=self._figsize,
+            num_unique_rows=results.get("num_unique_rows"),
+        )
@@ -5,13 +5,15 @@ from __future__ import annotations
 __all__ = ["DataFrameSummaryAnalyzer"]
 
 import logging
-from typing import TYPE_CHECKING
+from typing import Any
+
+import numpy as np
+import polars as pl
 
 from flamme.analyzer.base import BaseAnalyzer
 from flamme.section import DataFrameSummarySection
-
-if TYPE_CHECKING:
-    import polars as pl
+from flamme.utils.lazy import collect_expressions
+from flamme.utils.sketch import HyperLogLog, SpaceSaving
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +24,16 @@ class DataFrameSummaryAnalyzer(BaseAnalyzer):
     Args:
         top: The number of most frequent values to show.
         sort: If ``True``, sort the columns by alphabetical order.
+        approximate: If ``True``, the number of unique values is
+            estimated with a ``HyperLogLog`` sketch. It is faster and
+            uses less memory on columns with many unique values.
+            The analyzer can analyze the data by batches (see
+            ``update``) only if ``approximate`` is ``True``. The most
+            frequent values are then counted with a ``SpaceSaving``
+            sketch.
+        capacity: The number of values kept by the ``SpaceSaving``
+            sketch of each column when the data are analyzed by
+            batches.
 
     Example usage:
 
@@ -31,7 +43,7 @@ class DataFrameSummaryAnalyzer(BaseAnalyzer):
     >>> from flamme.analyzer import DataFrameSummaryAnalyzer
     >>> analyzer = DataFrameSummaryAnalyzer()
     >>> analyzer
-    DataFrameSummaryAnalyzer(top=5, sort=False)
+    DataFrameSummaryAnalyzer(top=5, sort=False, approximate=False)
     >>> frame = pl.DataFrame(
     ...     {
     ...         "col1": [0, 1, 0, 1],
@@ -42,23 +54,103 @@ class DataFrameSummaryAnalyzer(BaseAnalyzer):
     ... )
     >>> section = analyzer.analyze(frame)
     >>> section
-    DataFrameSummarySection(top=5)
+    DataFrameSummarySection(top=5, approximate=False)
 
     ```
     """
 
-    def __init__(self, top: int = 5, sort: bool = False) -> None:
+    def __init__(
+        self, top: int = 5, sort: bool = False, approximate: bool = False, *, capacity: int = 1000
+    ) -> None:
         if top < 0:
             msg = f"Incorrect top value ({top}). top must be positive"
             raise ValueError(msg)
         self._top = top
         self._sort = bool(sort)
+        self._approximate = bool(approximate)
+        self._capacity = capacity
+        self._state: (
+            tuple[pl.Schema, int, np.ndarray, list[HyperLogLog], list[SpaceSaving]] | None
+        ) = None
 
     def __repr__(self) -> str:
-        return f"{self.__class__.__qualname__}(top={self._top:,}, sort={self._sort})"
+        return (
+            f"{self.__class__.__qualname__}(top={self._top:,}, sort={self._sort}, "
+            f"approximate={self._approximate})"
+        )
 
     def analyze(self, frame: pl.DataFrame) -> DataFrameSummarySection:
+        return self.analyze_results(
+            frame, collect_expressions(frame, self.get_expressions(frame.schema))
+        )
+
+    def get_expressions(self, schema: pl.Schema) -> dict[str, pl.Expr]:
+        expressions = {f"null_count/{col}": pl.col(col).null_count() for col in schema}
+        if not self._approximate:
+            # The HyperLogLog estimates are computed by the section
+            # because they cannot be expressed as polars expressions.
+            expressions |= {f"nunique/{col}": pl.col(col).n_unique() for col in schema}
+        return expressions
+
+    def analyze_results(
+        self, frame: pl.DataFrame, results: dict[str, Any]
+    ) -> DataFrameSummarySection:
         logger.info("Analyzing the DataFrame...")
         if self._sort:
             frame = frame.select(sorted(frame.columns))
-        return DataFrameSummarySection(frame=frame, top=self._top)
+        columns = frame.columns
+        return DataFrameSummarySection(
+            frame=frame,
+            top=self._top,
+            approximate=self._approximate,
+            null_count=[results[f"null_count/{col}"] for col in columns],
+            nunique=None if self._approximate else [results[f"nunique/{col}"] for col in columns],
+        )
+
+    def is_streamable(self) -> bool:
+        return self._approximate
+
+    def update(self, batch: pl.DataFrame) -> None:
+        if not self._approximate:
+            return
+        if self._sort:
+            batch = batch.select(sorted(batch.columns))
+        if self._state is None:
+            self._state = (
+                batch.schema,
+                0,
+                np.zeros(batch.width, dtype=np.int64),
+                [HyperLogLog() for _ in batch.columns],
+                [SpaceSaving(capacity=self._capacity) for _ in batch.columns],
+            )
+        schema, num_rows, null_count, nunique, most_frequent = self._state
+        for series, hll, sketch in zip(batch, nunique, most_frequent):
+            hll.update(series)
+            sketch.update(series)
+        null_count += batch.null_count().to_numpy().astype(np.int64).ravel()
+        self._state = (schema, num_rows + batch.height, null_count, nunique, most_frequent)
+
+    def finalize(self, sample: pl.DataFrame | None = None) -> DataFrameSummarySection:
+        if not self._approximate:
+            return super().finalize(sample)
+        state, self._state = self._state, None
+        logger.info("Analyzing the DataFrame...")
+        if state is None:
+            state = (pl.Schema(), 0, np.zeros(0, dtype=np.int64), [], [])
+        schema, num_rows, null_count, nunique, most_frequent = state
+        section = DataFrameSummarySection(
+            frame=pl.DataFrame(schema=schema),
+            top=self._top,
+            approximate=True,
+            null_count=null_count.tolist(),
+            nunique=[hll.estimate() for hll in nunique],
+            num_rows=num_rows,
+            most_frequent_values=[
+                [(value, count) for value, count in sketch.to_counter().most_common(self._top)]
+                for sketch in most_frequent
+            ],
+        )
+        # The section does not need the empty DataFrame used to
+        # describe the schema.
+        section.materialize()
+        return section
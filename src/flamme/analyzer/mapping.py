@@ -4,22 +4,32 @@ from __future__ import annotations
 
 __all__ = ["MappingAnalyzer"]
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from coola.utils import str_indent, str_mapping
 
 from flamme.analyzer.base import BaseAnalyzer, setup_analyzer
 from flamme.section import SectionDict
+from flamme.utils.executor import parallel_map
+from flamme.utils.lazy import collect_expressions
+from flamme.utils.mapping import add_key_prefix, remove_key_prefix
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
 
     import polars as pl
 
+    from flamme.section import BaseSection
+
 
 class MappingAnalyzer(BaseAnalyzer):
     r"""Implement an analyzer that combine multiple analyzers.
 
+    The aggregations declared by the analyzers (see
+    ``BaseAnalyzer.get_expressions``) are merged into a single query,
+    so the data are scanned only once for all the analyzers in the
+    tree.
+
     Args:
         analyzers: The mappings to analyze.
             The key of each analyzer is used to organize the metrics
@@ -27,6 +37,21 @@ class MappingAnalyzer(BaseAnalyzer):
         max_toc_depth: The maximum level to show in the
             table of content. Set this value to ``0`` to not show
             the table of content at the beginning of the section.
+        executor: The executor used to run the analyzers. If
+            ``None``, the analyzers are run sequentially. If
+            ``'thread'``, the analyzers are run concurrently in a
+            thread pool. The analyzers of nested ``MappingAnalyzer``
+            are run sequentially inside the workers, so only the
+            top-level pool is used.
+        max_workers: The maximum number of threads. If ``None``, it
+            is the size of the polars thread pool.
+        render_executor: The executor used to render the HTML of the
+            sections. If ``None``, the sections are rendered
+            sequentially. If ``'process'``, the sections are rendered
+            in a process pool. See ``SectionDict`` for more
+            information.
+        render_max_workers: The maximum number of processes used to
+            render the sections. If ``None``, it is the number of CPUs.
 
     Example usage:
 
@@ -74,10 +99,30 @@ class MappingAnalyzer(BaseAnalyzer):
     """
 
     def __init__(
-        self, analyzers: Mapping[str, BaseAnalyzer | dict], max_toc_depth: int = 0
+        self,
+        analyzers: Mapping[str, BaseAnalyzer | dict],
+        max_toc_depth: int = 0,
+        *,
+        executor: str | None = None,
+        max_workers: int | None = None,
+        render_executor: str | None = None,
+        render_max_workers: int | None = None,
     ) -> None:
         self._analyzers = {name: setup_analyzer(analyzer) for name, analyzer in analyzers.items()}
         self._max_toc_depth = max_toc_depth
+        if executor not in {None, "thread"}:
+            msg = f"Incorrect executor: {executor}. The valid values are: None and 'thread'"
+            raise ValueError(msg)
+        self._executor = executor
+        self._max_workers = max_workers
+        if render_executor not in {None, "process"}:
+            msg = (
+                f"Incorrect render_executor: {render_executor}. "
+                "The valid values are: None and 'process'"
+            )
+            raise ValueError(msg)
+        self._render_executor = render_executor
+        self._render_max_workers = render_max_workers
 
     def __repr__(self) -> str:
         return f"{self.__class__.__qualname__}(\n  {str_indent(str_mapping(self._analyzers))}\n)"
@@ -87,9 +132,49 @@ class MappingAnalyzer(BaseAnalyzer):
         return self._analyzers
 
     def analyze(self, frame: pl.DataFrame) -> SectionDict:
+        return self.analyze_results(
+            frame, collect_expressions(frame, self.get_expressions(frame.schema))
+        )
+
+    def get_expressions(self, schema: pl.Schema) -> dict[str, pl.Expr]:
+        expressions = {}
+        for i, analyzer in enumerate(self._analyzers.values()):
+            expressions |= add_key_prefix(analyzer.get_expressions(schema), prefix=f"{i}/")
+        return expressions
+
+    def analyze_results(self, frame: pl.DataFrame, results: dict[str, Any]) -> SectionDict:
+        def analyze(item: tuple[int, BaseAnalyzer]) -> BaseSection:
+            i, analyzer = item
+            return analyzer.analyze_results(frame, remove_key_prefix(results, prefix=f"{i}/"))
+
+        sections = parallel_map(
+            analyze,
+            enumerate(self._analyzers.values()),
+            executor=self._executor,
+            max_workers=self._max_workers,
+        )
+        return SectionDict(
+            sections=dict(zip(self._analyzers.keys(), sections)),
+            max_toc_depth=self._max_toc_depth,
+            executor=self._render_executor,
+            max_workers=self._render_max_workers,
+        )
+
+    def is_streamable(self) -> bool:
+        return all(analyzer.is_streamable() for analyzer in self._analyzers.values())
+
+    def update(self, batch: pl.DataFrame) -> None:
+        for analyzer in self._analyzers.values():
+            analyzer.update(batch)
+
+    def finalize(self, sample: pl.DataFrame | None = None) -> SectionDict:
         return SectionDict(
-            sections={name: analyzer.analyze(frame) for name, analyzer in self._analyzers.items()},
+            sections={
+                name: analyzer.finalize(sample) for name, analyzer in self._analyzers.items()
+            },
             max_toc_depth=self._max_toc_depth,
+            executor=self._render_executor,
+            max_workers=self._render_max_workers,
         )
 
     def add_analyzer(self, key: str, analyzer: BaseAnalyzer, replace_ok: bool = False) -> None:
@@ -53,3 +53,9 @@ class MarkdownAnalyzer(BaseAnalyzer):
 
     def analyze(self, frame: pl.DataFrame) -> MarkdownSection:  # noqa: ARG002
         return MarkdownSection(desc=self._desc)
+
+    def is_streamable(self) -> bool:
+        return True
+
+    def finalize(self, sample: pl.DataFrame | None = None) -> MarkdownSection:  # noqa: ARG002
+        return MarkdownSection(desc=self._desc)
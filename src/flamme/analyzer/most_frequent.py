@@ -6,11 +6,12 @@ from __future__ import annotations
 __all__ = ["MostFrequentValuesAnalyzer"]
 
 import logging
-from collections import Counter
 from typing import TYPE_CHECKING
 
 from flamme.analyzer.base import BaseAnalyzer
 from flamme.section import EmptySection, MostFrequentValuesSection
+from flamme.utils.count import FrequencyTable, compute_frequency_table
+from flamme.utils.sketch import SpaceSaving
 
 if TYPE_CHECKING:
     import polars as pl
@@ -26,6 +27,13 @@ class MostFrequentValuesAnalyzer(BaseAnalyzer):
         drop_nulls: If ``True``, the null values are not included in
             the analysis.
         top: The maximum number of values to show.
+        capacity: If not ``None``, the number of occurrences are
+            approximated with a ``SpaceSaving`` sketch that keeps
+            the ``capacity`` most frequent values. It bounds the
+            memory for columns with many unique values. It should
+            be several times larger than ``top``. The analyzer can
+            analyze the data by batches (see ``update``) only if
+            ``capacity`` is set.
 
     Example usage:
 
@@ -36,12 +44,12 @@ class MostFrequentValuesAnalyzer(BaseAnalyzer):
     >>> from flamme.analyzer import MostFrequentValuesAnalyzer
     >>> analyzer = MostFrequentValuesAnalyzer(column="col")
     >>> analyzer
-    MostFrequentValuesAnalyzer(column=col, drop_nulls=False, top=100)
+    MostFrequentValuesAnalyzer(column=col, drop_nulls=False, top=100, capacity=None)
     >>> frame = pl.DataFrame({"col": [None, 1, 0, 1]}, schema={"col": pl.Int64})
     >>> section = analyzer.analyze(frame)
     >>> section
     MostFrequentValuesSection(
-      (counter): Counter({1: 2, None: 1, 0: 1})
+      (counter): FrequencyTable(num_values=3, total=4, null_count=1, other_count=0)
       (column): col
       (top): 100
       (total): 4
@@ -50,15 +58,24 @@ class MostFrequentValuesAnalyzer(BaseAnalyzer):
     ```
     """
 
-    def __init__(self, column: str, drop_nulls: bool = False, top: int = 100) -> None:
+    def __init__(
+        self,
+        column: str,
+        drop_nulls: bool = False,
+        top: int = 100,
+        *,
+        capacity: int | None = None,
+    ) -> None:
         self._column = column
         self._drop_nulls = bool(drop_nulls)
         self._top = top
+        self._capacity = capacity
+        self._sketch: SpaceSaving | None = None
 
     def __repr__(self) -> str:
         return (
             f"{self.__class__.__qualname__}(column={self._column}, "
-            f"drop_nulls={self._drop_nulls}, top={self._top:,})"
+            f"drop_nulls={self._drop_nulls}, top={self._top:,}, capacity={self._capacity})"
         )
 
     def analyze(self, frame: pl.DataFrame) -> MostFrequentValuesSection | EmptySection:
@@ -69,11 +86,38 @@ class MostFrequentValuesAnalyzer(BaseAnalyzer):
                 f"because the column is missing"
             )
             return EmptySection()
-        series = frame[self._column]
-        if self._drop_nulls:
-            series = series.drop_nulls()
         return MostFrequentValuesSection(
-            counter=Counter(series.to_list()),
+            counter=compute_frequency_table(
+                frame, column=self._column, drop_nulls=self._drop_nulls, capacity=self._capacity
+            ),
             column=self._column,
             top=self._top,
         )
+
+    def is_streamable(self) -> bool:
+        return self._capacity is not None
+
+    def update(self, batch: pl.DataFrame) -> None:
+        if self._capacity is None or self._column not in batch:
+            return
+        if self._sketch is None:
+            self._sketch = SpaceSaving(capacity=self._capacity)
+        series = batch[self._column]
+        self._sketch.update(series.drop_nulls() if self._drop_nulls else series)
+
+    def finalize(
+        self, sample: pl.DataFrame | None = None
+    ) -> MostFrequentValuesSection | EmptySection:
+        if self._capacity is None:
+            return super().finalize(sample)
+        sketch, self._sketch = self._sketch, None
+        logger.info(f"Analyzing the most frequent values of {self._column}")
+        if sketch is None:
+            logger.warning(
+                f"Skipping most frequent values analysis of column {self._column} "
+                f"because the column is missing"
+            )
+            return EmptySection()
+        return MostFrequentValuesSection(
+            counter=FrequencyTable.from_sketch(sketch), column=self._column, top=self._top
+        )
@@ -6,16 +6,14 @@ from __future__ import annotations
 __all__ = ["NullValueAnalyzer"]
 
 import logging
-from typing import TYPE_CHECKING
+from typing import Any
 
 import numpy as np
+import polars as pl
 
 from flamme.analyzer.base import BaseAnalyzer
 from flamme.section import NullValueSection
-from flamme.utils.null import compute_null_count
-
-if TYPE_CHECKING:
-    import polars as pl
+from flamme.utils.lazy import collect_expressions
 
 logger = logging.getLogger(__name__)
 
@@ -58,16 +56,50 @@ class NullValueAnalyzer(BaseAnalyzer):
 
     def __init__(self, figsize: tuple[float, float] | None = None) -> None:
         self._figsize = figsize
+        # The columns, null counts and number of rows of the batches.
+        self._state: tuple[list[str], np.ndarray, int] | None = None
 
     def __repr__(self) -> str:
         return f"{self.__class__.__qualname__}(figsize={self._figsize})"
 
     def analyze(self, frame: pl.DataFrame) -> NullValueSection:
+        return self.analyze_results(
+            frame, collect_expressions(frame, self.get_expressions(frame.schema))
+        )
+
+    def get_expressions(self, schema: pl.Schema) -> dict[str, pl.Expr]:
+        return {"num_rows": pl.len()} | {
+            f"null_count/{col}": pl.col(col).null_count() for col in schema
+        }
+
+    def analyze_results(self, frame: pl.DataFrame, results: dict[str, Any]) -> NullValueSection:
+        logger.info("Analyzing the null value distribution of all columns...")
+        columns = list(frame.columns)
+        return NullValueSection(
+            columns=columns,
+            null_count=np.array([results[f"null_count/{col}"] for col in columns], dtype=np.int64),
+            total_count=np.full((len(columns),), results["num_rows"]),
+            figsize=self._figsize,
+        )
+
+    def is_streamable(self) -> bool:
+        return True
+
+    def update(self, batch: pl.DataFrame) -> None:
+        null_count = batch.null_count().to_numpy().astype(np.int64).ravel()
+        if self._state is None:
+            self._state = (list(batch.columns), null_count, batch.shape[0])
+            return
+        columns, total_null_count, num_rows = self._state
+        self._state = (columns, total_null_count + null_count, num_rows + batch.shape[0])
+
+    def finalize(self, sample: pl.DataFrame | None = None) -> NullValueSection:  # noqa: ARG002
+        columns, null_count, num_rows = self._state or ([], np.zeros(0, dtype=np.int64), 0)
+        self._state = None
         logger.info("Analyzing the null value distribution of all columns...")
-        nrows, ncols = frame.shape
         return NullValueSection(
-            columns=list(frame.columns),
-            null_count=compute_null_count(frame),
-            total_count=np.full((ncols,), nrows),
+            columns=columns,
+            null_count=null_count,
+            total_count=np.full((len(columns),), num_rows),
             figsize=self._figsize,
         )
@@ -33,6 +33,12 @@ class TemporalNullValueAnalyzer(BaseAnalyzer):
             daily.
         figsize: The figure size in inches. The first
             dimension is the width and the second is the height.
+        base_period: If not ``None``, the statistics are computed
+            from the temporal cube with this base period, which is
+            shared by all the analyzers with the same DataFrame,
+            datetime column and base period. The windows of
+            ``period`` must be unions of windows of ``base_period``
+            e.g. ``'1d'`` for a weekly or monthly analysis.
 
     Example usage:
 
@@ -48,6 +54,7 @@ class TemporalNullValueAnalyzer(BaseAnalyzer):
       (dt_column): datetime
       (period): M
       (figsize): None
+      (base_period): None
     )
     >>> frame = pl.DataFrame(
     ...     {
@@ -68,6 +75,7 @@ class TemporalNullValueAnalyzer(BaseAnalyzer):
       (dt_column): datetime
       (period): M
       (figsize): None
+      (base_period): None
     )
 
     ```
@@ -79,11 +87,14 @@ class TemporalNullValueAnalyzer(BaseAnalyzer):
         period: str,
         columns: Sequence[str] | None = None,
         figsize: tuple[float, float] | None = None,
+        *,
+        base_period: str | None = None,
     ) -> None:
         self._dt_column = dt_column
         self._period = period
         self._columns = columns
         self._figsize = figsize
+        self._base_period = base_period
 
     def __repr__(self) -> str:
         args = repr_indent(
@@ -93,6 +104,7 @@ class TemporalNullValueAnalyzer(BaseAnalyzer):
                     "dt_column": self._dt_column,
                     "period": self._period,
                     "figsize": self._figsize,
+                    "base_period": self._base_period,
                 }
             )
         )
@@ -120,4 +132,5 @@ class TemporalNullValueAnalyzer(BaseAnalyzer):
             dt_column=self._dt_column,
             period=self._period,
             figsize=self._figsize,
+            base_period=self._base_period,
         )
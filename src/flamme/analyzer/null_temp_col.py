@@ -26,7 +26,8 @@ class ColumnTemporalNullValueAnalyzer(BaseAnalyzer):
     r"""Implement an analyzer to show the temporal distribution of null
     values for all columns.
 
-    A plot is generated for each column.
+    A plot is generated for each column, or a single heatmap is
+    generated for all the columns if ``mode='heatmap'``.
 
     Args:
         dt_column: The datetime column used to analyze
@@ -37,6 +38,18 @@ class ColumnTemporalNullValueAnalyzer(BaseAnalyzer):
         ncols: The number of columns.
         figsize: The figure size in inches. The first
             dimension is the width and the second is the height.
+        base_period: If not ``None``, the statistics are computed
+            from the temporal cube with this base period, which is
+            shared by all the analyzers with the same DataFrame,
+            datetime column and base period. The windows of
+            ``period`` must be unions of windows of ``base_period``
+            e.g. ``'1d'`` for a weekly or monthly analysis.
+        mode: The rendering mode of the figure. ``'grid'`` draws a
+            figure for each column and ``'heatmap'`` draws a single
+            heatmap for all the columns.
+        cluster: If ``True`` and ``mode='heatmap'``, the columns with
+            similar temporal null patterns are next to each other in
+            the heatmap.
 
     Example usage:
 
@@ -53,6 +66,9 @@ class ColumnTemporalNullValueAnalyzer(BaseAnalyzer):
       (period): M
       (ncols): 2
       (figsize): (7, 5)
+      (base_period): None
+      (mode): grid
+      (cluster): False
     )
     >>> frame = pl.DataFrame(
     ...     {
@@ -81,6 +97,9 @@ class ColumnTemporalNullValueAnalyzer(BaseAnalyzer):
       (period): M
       (ncols): 2
       (figsize): (7, 5)
+      (base_period): None
+      (mode): grid
+      (cluster): False
     )
 
     ```
@@ -93,12 +112,19 @@ class ColumnTemporalNullValueAnalyzer(BaseAnalyzer):
         columns: Sequence[str] | None = None,
         ncols: int = 2,
         figsize: tuple[float, float] = (7, 5),
+        *,
+        base_period: str | None = None,
+        mode: str = "grid",
+        cluster: bool = False,
     ) -> None:
         self._dt_column = dt_column
         self._period = period
         self._columns = tuple(columns or [])
         self._ncols = ncols
         self._figsize = figsize
+        self._base_period = base_period
+        self._mode = mode
+        self._cluster = cluster
 
     def __repr__(self) -> str:
         args = repr_indent(
@@ -109,6 +135,9 @@ class ColumnTemporalNullValueAnalyzer(BaseAnalyzer):
                     "period": self._period,
                     "ncols": self._ncols,
                     "figsize": self._figsize,
+                    "base_period": self._base_period,
+                    "mode": self._mode,
+                    "cluster": self._cluster,
                 }
             )
         )
@@ -143,4 +172,7 @@ class ColumnTemporalNullValueAnalyzer(BaseAnalyzer):
             period=self._period,
             ncols=self._ncols,
             figsize=self._figsize,
+            base_period=self._base_period,
+            mode=self._mode,
+            cluster=self._cluster,
         )
@@ -5,7 +5,7 @@ from __future__ import annotations
 __all__ = ["TableOfContentAnalyzer"]
 
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from coola.utils import str_indent, str_mapping
 
@@ -80,3 +80,25 @@ class TableOfContentAnalyzer(BaseAnalyzer):
         return TableOfContentSection(
             section=self._analyzer.analyze(frame), max_toc_depth=self._max_toc_depth
         )
+
+    def get_expressions(self, schema: pl.Schema) -> dict[str, pl.Expr]:
+        return self._analyzer.get_expressions(schema)
+
+    def analyze_results(
+        self, frame: pl.DataFrame, results: dict[str, Any]
+    ) -> TableOfContentSection:
+        return TableOfContentSection(
+            section=self._analyzer.analyze_results(frame, results),
+            max_toc_depth=self._max_toc_depth,
+        )
+
+    def is_streamable(self) -> bool:
+        return self._analyzer.is_streamable()
+
+    def update(self, batch: pl.DataFrame) -> None:
+        self._analyzer.update(batch)
+
+    def finalize(self, sample: pl.DataFrame | None = None) -> TableOfContentSection:
+        return TableOfContentSection(
+            section=self._analyzer.finalize(sample), max_toc_depth=self._max_toc_depth
+        )
@@ -6,12 +6,13 @@ from __future__ import annotations
 __all__ = ["TransformAnalyzer"]
 
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from coola.utils import str_indent, str_mapping
 from grizz.transformer import BaseTransformer, setup_transformer
 
 from flamme.analyzer.base import BaseAnalyzer, setup_analyzer
+from flamme.utils.lazy import collect_expressions
 
 if TYPE_CHECKING:
     import polars as pl
@@ -28,6 +29,9 @@ class TransformAnalyzer(BaseAnalyzer):
     Args:
         transformer: Soecifies the transformer.
         analyzer: The analyzer or its configuration.
+        materialize: If ``True``, the section is materialized after
+            the analysis, so it does not keep a reference to the
+            transformed DataFrame. See ``BaseSection.materialize``.
 
     Example usage:
 
@@ -67,9 +71,16 @@ class TransformAnalyzer(BaseAnalyzer):
     ```
     """
 
-    def __init__(self, transformer: BaseTransformer | dict, analyzer: BaseAnalyzer | dict) -> None:
+    def __init__(
+        self,
+        transformer: BaseTransformer | dict,
+        analyzer: BaseAnalyzer | dict,
+        *,
+        materialize: bool = False,
+    ) -> None:
         self._transformer = setup_transformer(transformer)
         self._analyzer = setup_analyzer(analyzer)
+        self._materialize = bool(materialize)
 
     def __repr__(self) -> str:
         args = str_indent(
@@ -78,6 +89,23 @@ class TransformAnalyzer(BaseAnalyzer):
         return f"{self.__class__.__qualname__}(\n  {args}\n)"
 
     def analyze(self, frame: pl.DataFrame) -> BaseSection:
+        return self.analyze_results(frame, {})
+
+    def get_expressions(self, schema: pl.Schema) -> dict[str, pl.Expr]:  # noqa: ARG002
+        # The transformers work on eager DataFrames, so the
+        # aggregations of the analyzer cannot be computed in the query
+        # on the input DataFrame. They are computed in a single query
+        # on the transformed DataFrame in ``analyze_results``.
+        return {}
+
+    def analyze_results(
+        self, frame: pl.DataFrame, results: dict[str, Any]  # noqa: ARG002
+    ) -> BaseSection:
         logger.info("Transforming the DataFrame...")
         frame = self._transformer.transform(frame)
-        return self._analyzer.analyze(frame)
+        section = self._analyzer.analyze_results(
+            frame, collect_expressions(frame, self._analyzer.get_expressions(frame.schema))
+        )
+        if self._materialize:
+            section.materialize()
+        return section
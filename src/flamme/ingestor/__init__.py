@@ -0,0 +1,21 @@
+r"""Contain ingestors that read the data by batches."""
+
+from __future__ import annotations
+
+__all__ = [
+    "BaseBatchIngestor",
+    "CsvBatchIngestor",
+    "IpcBatchIngestor",
+    "ParquetBatchIngestor",
+    "is_batch_ingestor_config",
+    "setup_batch_ingestor",
+]
+
+from flamme.ingestor.base import (
+    BaseBatchIngestor,
+    is_batch_ingestor_config,
+    setup_batch_ingestor,
+)
+from flamme.ingestor.csv_batch import CsvBatchIngestor
+from flamme.ingestor.ipc import IpcBatchIngestor
+from flamme.ingestor.parquet import ParquetBatchIngestor
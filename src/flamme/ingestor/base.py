@@ -0,0 +1,130 @@
+r"""Contain the base class to implement an ingestor that reads the data
+by batches."""
+
+from __future__ import annotations
+
+__all__ = ["BaseBatchIngestor", "is_batch_ingestor_config", "setup_batch_ingestor"]
+
+import logging
+from abc import ABC
+from typing import TYPE_CHECKING
+
+from objectory import AbstractFactory
+from objectory.utils import is_object_config
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    import polars as pl
+
+logger = logging.getLogger(__name__)
+
+
+class BaseBatchIngestor(ABC, metaclass=AbstractFactory):
+    r"""Define the base class to implement an ingestor that reads the
+    data by batches.
+
+    Unlike the ingestors in ``grizz.ingestor``, the data are not
+    loaded in memory at once, so the ingestor can be used to analyze
+    datasets that are larger than the memory.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from flamme.ingestor import ParquetBatchIngestor
+    >>> ingestor = ParquetBatchIngestor(path="/path/to/frame.parquet")
+    >>> ingestor
+    ParquetBatchIngestor(path=/path/to/frame.parquet, batch_size=65,536)
+    >>> for batch in ingestor.iter_batches():  # doctest: +SKIP
+    ...     print(batch.shape)
+    ...
+
+    ```
+    """
+
+    def iter_batches(self) -> Iterator[pl.DataFrame]:
+        r"""Iterate over the batches of the data.
+
+        Returns:
+            An iterator over the batches. All the batches have the
+                same schema.
+
+        Example usage:
+
+        ```pycon
+
+        >>> from flamme.ingestor import ParquetBatchIngestor
+        >>> ingestor = ParquetBatchIngestor(path="/path/to/frame.parquet")
+        >>> for batch in ingestor.iter_batches():  # doctest: +SKIP
+        ...     print(batch.shape)
+        ...
+
+        ```
+        """
+
+
+def is_batch_ingestor_config(config: dict) -> bool:
+    r"""Indicate if the input configuration is a configuration for a
+    ``BaseBatchIngestor``.
+
+    This function only checks if the value of the key  ``_target_``
+    is valid. It does not check the other values. If ``_target_``
+    indicates a function, the returned type hint is used to check
+    the class.
+
+    Args:
+        config: The configuration to check.
+
+    Returns:
+        ``True`` if the input configuration is a configuration
+            for a ``BaseBatchIngestor`` object.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from flamme.ingestor import is_batch_ingestor_config
+    >>> is_batch_ingestor_config(
+    ...     {"_target_": "flamme.ingestor.ParquetBatchIngestor", "path": "/path/to/data.parquet"}
+    ... )
+    True
+
+    ```
+    """
+    return is_object_config(config, BaseBatchIngestor)
+
+
+def setup_batch_ingestor(
+    ingestor: BaseBatchIngestor | dict,
+) -> BaseBatchIngestor:
+    r"""Set up a batch ingestor.
+
+    The ingestor is instantiated from its configuration
+    by using the ``BaseBatchIngestor`` factory function.
+
+    Args:
+        ingestor: Specifies a batch ingestor or its configuration.
+
+    Returns:
+        An instantiated batch ingestor.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from flamme.ingestor import setup_batch_ingestor
+    >>> ingestor = setup_batch_ingestor(
+    ...     {"_target_": "flamme.ingestor.ParquetBatchIngestor", "path": "/path/to/data.parquet"}
+    ... )
+    >>> ingestor
+    ParquetBatchIngestor(path=/path/to/data.parquet, batch_size=65,536)
+
+    ```
+    """
+    if isinstance(ingestor, dict):
+        logger.info("Initializing a batch ingestor from its configuration... ")
+        ingestor = BaseBatchIngestor.factory(**ingestor)
+    if not isinstance(ingestor, BaseBatchIngestor):
+        logger.warning(f"ingestor is not a `BaseBatchIngestor` (received: {type(ingestor)})")
+    return ingestor
@@ -0,0 +1,87 @@
+r"""Contain the implementation of a CSV ingestor that reads the data by
+batches."""
+
+from __future__ import annotations
+
+__all__ = ["CsvBatchIngestor"]
+
+import logging
+from typing import TYPE_CHECKING
+
+import polars as pl
+from coola.utils.path import sanitize_path
+from pyarrow import csv
+
+from flamme.ingestor.base import BaseBatchIngestor
+from flamme.utils.path import human_file_size
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+    from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+class CsvBatchIngestor(BaseBatchIngestor):
+    r"""Implement a CSV ingestor that reads the data by batches.
+
+    The file is parsed incrementally with ``pyarrow.csv.open_csv``,
+    so the number of rows in each batch depends on ``block_size``.
+    The data types are inferred from the first block, so the later
+    blocks must be compatible with these data types. Like
+    ``polars.read_csv``, the empty strings are read as null values.
+
+    Args:
+        path: The path to the CSV file to ingest.
+        block_size: The number of bytes to parse in each batch.
+        columns: The columns to read. If ``None``, all the columns
+            are read.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from flamme.ingestor import CsvBatchIngestor
+    >>> ingestor = CsvBatchIngestor(path="/path/to/frame.csv")
+    >>> ingestor
+    CsvBatchIngestor(path=/path/to/frame.csv, block_size=16,777,216)
+    >>> for batch in ingestor.iter_batches():  # doctest: +SKIP
+    ...     print(batch.shape)
+    ...
+
+    ```
+    """
+
+    def __init__(
+        self, path: Path | str, block_size: int = 2**24, columns: Sequence[str] | None = None
+    ) -> None:
+        self._path = sanitize_path(path)
+        self._block_size = int(block_size)
+        self._columns = list(columns) if columns is not None else None
+
+    def __repr__(self) -> str:
+        columns = "" if self._columns is None else f", columns={self._columns}"
+        return (
+            f"{self.__class__.__qualname__}(path={self._path}, "
+            f"block_size={self._block_size:,}{columns})"
+        )
+
+    def iter_batches(self) -> Iterator[pl.DataFrame]:
+        logger.info(
+            f"Ingesting CSV data from {self._path} by blocks of {self._block_size:,} bytes "
+            f"| size={human_file_size(self._path)}..."
+        )
+        with csv.open_csv(
+            self._path,
+            read_options=csv.ReadOptions(block_size=self._block_size),
+            convert_options=csv.ConvertOptions(
+                include_columns=self._columns, strings_can_be_null=True
+            ),
+        ) as reader:
+            empty = True
+            for batch in reader:
+                empty = False
+                yield pl.from_arrow(batch)
+            if empty:
+                # Yield an empty batch, so the schema is known by the analyzers.
+                yield pl.from_arrow(reader.schema.empty_table())
@@ -0,0 +1,88 @@
+r"""Contain the implementation of an Arrow IPC ingestor that reads the
+data by batches."""
+
+from __future__ import annotations
+
+__all__ = ["IpcBatchIngestor"]
+
+import logging
+from typing import TYPE_CHECKING
+
+import polars as pl
+import pyarrow as pa
+from coola.utils.path import sanitize_path
+
+from flamme.ingestor.base import BaseBatchIngestor
+from flamme.utils.path import human_file_size
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+    from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+class IpcBatchIngestor(BaseBatchIngestor):
+    r"""Implement an Arrow IPC (a.k.a. feather) ingestor that reads the
+    data by batches.
+
+    The file is memory-mapped, so only the batch being analyzed is
+    loaded in memory. The record batches of the file are sliced if
+    they have more than ``batch_size`` rows.
+
+    Args:
+        path: The path to the Arrow IPC file to ingest.
+        batch_size: The maximum number of rows in each batch.
+        columns: The columns to read. If ``None``, all the columns
+            are read.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from flamme.ingestor import IpcBatchIngestor
+    >>> ingestor = IpcBatchIngestor(path="/path/to/frame.arrow", batch_size=1000)
+    >>> ingestor
+    IpcBatchIngestor(path=/path/to/frame.arrow, batch_size=1,000)
+    >>> for batch in ingestor.iter_batches():  # doctest: +SKIP
+    ...     print(batch.shape)
+    ...
+
+    ```
+    """
+
+    def __init__(
+        self, path: Path | str, batch_size: int = 65536, columns: Sequence[str] | None = None
+    ) -> None:
+        self._path = sanitize_path(path)
+        self._batch_size = int(batch_size)
+        self._columns = list(columns) if columns is not None else None
+
+    def __repr__(self) -> str:
+        columns = "" if self._columns is None else f", columns={self._columns}"
+        return (
+            f"{self.__class__.__qualname__}(path={self._path}, "
+            f"batch_size={self._batch_size:,}{columns})"
+        )
+
+    def iter_batches(self) -> Iterator[pl.DataFrame]:
+        logger.info(
+            f"Ingesting Arrow IPC data from {self._path} by batches of {self._batch_size:,} "
+            f"rows | size={human_file_size(self._path)}..."
+        )
+        with pa.memory_map(str(self._path)) as source:
+            reader = pa.ipc.open_file(source)
+            schema = reader.schema
+            if self._columns is not None:
+                schema = pa.schema([schema.field(col) for col in self._columns])
+            empty = True
+            for i in range(reader.num_record_batches):
+                batch = reader.get_batch(i)
+                if self._columns is not None:
+                    batch = batch.select(self._columns)
+                for offset in range(0, batch.num_rows, self._batch_size):
+                    empty = False
+                    yield pl.from_arrow(batch.slice(offset, self._batch_size))
+            if empty:
+                # Yield an empty batch, so the schema is known by the analyzers.
+                yield pl.from_arrow(schema.empty_table())
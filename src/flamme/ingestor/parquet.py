@@ -0,0 +1,75 @@
+r"""Contain the implementation of a parquet ingestor that reads the data
+by batches."""
+
+from __future__ import annotations
+
+__all__ = ["ParquetBatchIngestor"]
+
+import logging
+from typing import TYPE_CHECKING
+
+import polars as pl
+import pyarrow.parquet as pq
+from coola.utils.path import sanitize_path
+
+from flamme.ingestor.base import BaseBatchIngestor
+from flamme.utils.path import human_file_size
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+    from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+class ParquetBatchIngestor(BaseBatchIngestor):
+    r"""Implement a parquet ingestor that reads the data by batches.
+
+    Args:
+        path: The path to the parquet file to ingest.
+        batch_size: The maximum number of rows in each batch.
+        columns: The columns to read. If ``None``, all the columns
+            are read.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from flamme.ingestor import ParquetBatchIngestor
+    >>> ingestor = ParquetBatchIngestor(path="/path/to/frame.parquet", batch_size=1000)
+    >>> ingestor
+    ParquetBatchIngestor(path=/path/to/frame.parquet, batch_size=1,000)
+    >>> for batch in ingestor.iter_batches():  # doctest: +SKIP
+    ...     print(batch.shape)
+    ...
+
+    ```
+    """
+
+    def __init__(
+        self, path: Path | str, batch_size: int = 65536, columns: Sequence[str] | None = None
+    ) -> None:
+        self._path = sanitize_path(path)
+        self._batch_size = int(batch_size)
+        self._columns = list(columns) if columns is not None else None
+
+    def __repr__(self) -> str:
+        columns = "" if self._columns is None else f", columns={self._columns}"
+        return (
+            f"{self.__class__.__qualname__}(path={self._path}, "
+            f"batch_size={self._batch_size:,}{columns})"
+        )
+
+    def iter_batches(self) -> Iterator[pl.DataFrame]:
+        logger.info(
+            f"Ingesting parquet data from {self._path} by batches of {self._batch_size:,} rows "
+            f"| size={human_file_size(self._path)}..."
+        )
+        file = pq.ParquetFile(self._path)
+        if file.metadata.num_rows == 0:
+            # Yield an empty batch, so the schema is known by the analyzers.
+            table = file.schema_arrow.empty_table()
+            yield pl.from_arrow(table.select(self._columns) if self._columns else table)
+            return
+        for batch in file.iter_batches(batch_size=self._batch_size, columns=self._columns):
+            yield pl.from_arrow(batch)
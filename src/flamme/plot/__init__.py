@@ -5,20 +5,48 @@ from __future__ import annotations
 __all__ = [
     "bar_discrete",
     "bar_discrete_temporal",
+    "bar_figure_data",
     "boxplot_continuous",
     "boxplot_continuous_temporal",
+    "bxp_continuous_temporal",
+    "downsample_figure_data",
+    "figure_data2html",
+    "figure_data2svg",
+    "get_figure_data_script",
     "hist_continuous",
     "hist_continuous2",
+    "histogram_figure_data",
+    "null_temporal_figure_data",
     "plot_cdf",
+    "plot_histogram",
+    "plot_histogram2",
     "plot_null_temporal",
+    "plot_null_temporal_heatmap",
+    "render_figure_data",
+    "svg_bar",
+    "svg_histogram",
+    "svg_null_temporal",
 ]
 
 from flamme.plot.cdf import plot_cdf
 from flamme.plot.continuous import (
     boxplot_continuous,
     boxplot_continuous_temporal,
+    bxp_continuous_temporal,
     hist_continuous,
     hist_continuous2,
 )
 from flamme.plot.discrete import bar_discrete, bar_discrete_temporal
-from flamme.plot.null_temp import plot_null_temporal
+from flamme.plot.figure_data import (
+    bar_figure_data,
+    downsample_figure_data,
+    figure_data2html,
+    figure_data2svg,
+    get_figure_data_script,
+    histogram_figure_data,
+    null_temporal_figure_data,
+    render_figure_data,
+)
+from flamme.plot.hist import plot_histogram, plot_histogram2
+from flamme.plot.null_temp import plot_null_temporal, plot_null_temporal_heatmap
+from flamme.plot.svg import svg_bar, svg_histogram, svg_null_temporal
@@ -8,7 +8,7 @@ from typing import TYPE_CHECKING
 
 import numpy as np
 
-from flamme.utils.array import nonnan
+from flamme.utils.array import SortedArray, to_sorted_array
 
 if TYPE_CHECKING:
     from matplotlib.axes import Axes
@@ -16,7 +16,7 @@ if TYPE_CHECKING:
 
 def plot_cdf(
     ax: Axes,
-    array: np.ndarray,
+    array: np.ndarray | SortedArray,
     nbins: int | None = None,
     xmin: float = float("-inf"),
     xmax: float = float("inf"),
@@ -27,7 +27,7 @@ def plot_cdf(
 
     Args:
         ax: The axes of the matplotlib figure to update.
-        array: The array with the data.
+        array: The array with the data or a sorted view of the data.
         nbins: The number of bins to use to plot the CDF.
         xmin: The minimum value of the range or its
             associated quantile. ``q0.1`` means the 10% quantile.
@@ -50,15 +50,15 @@ def plot_cdf(
 
     ```
     """
-    array = nonnan(array.ravel())
+    array = to_sorted_array(array)
     if array.size == 0:
         return
     nbins = nbins or min(1000, array.size)
-    nleft = array[array < xmin].size
-    nright = array[array > xmax].size
-    counts, edges = np.histogram(array[np.logical_and(array >= xmin, array <= xmax)], bins=nbins)
+    nleft = array.size - array.count(lower=xmin)
+    nright = array.size - array.count(upper=xmax)
+    counts, edges = array.filter_range(xmin=xmin, xmax=xmax).histogram(bins=nbins)
     cdf = (np.cumsum(counts) + nleft) / (np.sum(counts) + nleft + nright)
-    x = [(left + right) * 0.5 for left, right in zip(edges[:-1], edges[1:])]
+    x = (edges[:-1] + edges[1:]) * 0.5
     ax.tick_params(axis="y", labelcolor=labelcolor)
     ax.plot(x, cdf, color=color, label="CDF")
     ax.set_ylim(0.0, 1.0)
@@ -5,6 +5,7 @@ from __future__ import annotations
 __all__ = [
     "boxplot_continuous",
     "boxplot_continuous_temporal",
+    "bxp_continuous_temporal",
     "hist_continuous",
     "hist_continuous2",
 ]
@@ -14,12 +15,16 @@ from typing import TYPE_CHECKING
 import numpy as np
 
 from flamme.plot.cdf import plot_cdf
+from flamme.plot.hist import plot_histogram, plot_histogram2
 from flamme.plot.utils import (
     auto_yscale_continuous,
+    auto_yscale_histogram,
     axvline_quantile,
     readable_xticklabels,
 )
-from flamme.utils.array import nonnan
+from flamme.utils.array import SortedArray, to_sorted_array
+from flamme.utils.boxplot import compute_boxplot_stats
+from flamme.utils.histogram import compute_histogram
 from flamme.utils.range import find_range
 
 if TYPE_CHECKING:
@@ -30,21 +35,27 @@ if TYPE_CHECKING:
 
 def boxplot_continuous(
     ax: Axes,
-    array: np.ndarray,
+    array: np.ndarray | SortedArray,
     xmin: float | str | None = None,
     xmax: float | str | None = None,
+    max_fliers: int = 100,
 ) -> None:
-    r"""Plot the histogram of an array containing continuous values.
+    r"""Plot the boxplot of an array containing continuous values.
+
+    The boxplot is drawn from precomputed statistics, so the number
+    of fliers is bounded.
 
     Args:
         ax: The axes of the matplotlib figure to update.
-        array: The array with the data.
+        array: The array with the data or a sorted view of the data.
         xmin: The minimum value of the range or its
             associated quantile. ``q0.1`` means the 10% quantile.
             ``0`` is the minimum value and ``1`` is the maximum value.
         xmax: The maximum value of the range or its
             associated quantile. ``q0.9`` means the 90% quantile.
             ``0`` is the minimum value and ``1`` is the maximum value.
+        max_fliers: The maximum number of fliers drawn on each side
+            of the whiskers. See ``compute_boxplot_stats``.
 
     Example usage:
 
@@ -58,13 +69,13 @@ def boxplot_continuous(
 
     ```
     """
-    array = array.ravel()
+    array = to_sorted_array(array)
     if array.size == 0:
         return
     xmin, xmax = find_range(array, xmin=xmin, xmax=xmax)
-    ax.boxplot(
-        array,
-        notch=True,
+    ax.bxp(
+        [compute_boxplot_stats(array, max_fliers=max_fliers)],
+        shownotches=True,
         vert=False,
         widths=0.7,
         patch_artist=True,
@@ -78,14 +89,19 @@ def boxplot_continuous(
 
 def boxplot_continuous_temporal(
     ax: Axes,
-    data: Sequence[np.ndarray],
+    data: Sequence[np.ndarray | SortedArray],
     steps: Sequence,
     ymin: float | str | None = None,
     ymax: float | str | None = None,
     yscale: str = "linear",
+    *,
+    max_fliers: int = 100,
 ) -> None:
     r"""Plot the histogram of an array containing continuous values.
 
+    The boxplots are drawn from the statistics of each time step,
+    see ``bxp_continuous_temporal``.
+
     Args:
         ax: The axes of the matplotlib figure to update.
         data: The sequence of data where each item is a 1-d array with
@@ -100,6 +116,9 @@ def boxplot_continuous_temporal(
         yscale: The y-axis scale. If ``'auto'``, the
             ``'linear'`` or ``'log'/'symlog'`` scale is chosen based
             on the distribution.
+        max_fliers: The maximum number of fliers drawn on each side
+            of the whiskers for each time step.
+            See ``compute_boxplot_stats``.
 
     Raises:
         RuntimeError: if ``data`` and ``steps`` have different lengths
@@ -123,29 +142,103 @@ def boxplot_continuous_temporal(
     if len(data) != len(steps):
         msg = f"data and steps have different lengths: {len(data):,} vs {len(steps):,}"
         raise RuntimeError(msg)
-    data = [nonnan(x) for x in data]
-    ax.boxplot(
-        data,
-        notch=True,
+    data = [to_sorted_array(x) for x in data]
+    array = SortedArray(np.concatenate([x.values for x in data]))
+    ymin, ymax = find_range(array, xmin=ymin, xmax=ymax)
+    if yscale == "auto":
+        yscale = auto_yscale_continuous(array=array, nbins=100)
+    bxp_continuous_temporal(
+        ax,
+        stats=[compute_boxplot_stats(x, max_fliers=max_fliers) for x in data],
+        steps=steps,
+        ymin=ymin,
+        ymax=ymax,
+        yscale=yscale,
+    )
+
+
+def bxp_continuous_temporal(
+    ax: Axes,
+    stats: Sequence[dict],
+    steps: Sequence,
+    *,
+    ymin: float | None = None,
+    ymax: float | None = None,
+    yscale: str = "linear",
+) -> None:
+    r"""Plot the boxplot of each time step from precomputed
+    statistics.
+
+    The cost of the plot does not depend on the number of values
+    because only the statistics and the bounded fliers are drawn.
+
+    Args:
+        ax: The axes of the matplotlib figure to update.
+        stats: The sequence of boxplot statistics where each item has
+            the statistics of a time step. See
+            ``compute_boxplot_stats`` and
+            ``compute_temporal_boxplot_stats``.
+        steps: The sequence time step names.
+        ymin: The minimum value of the y-axis. If ``None``, the
+            minimum of the whiskers and fliers is used.
+        ymax: The maximum value of the y-axis. If ``None``, the
+            maximum of the whiskers and fliers is used.
+        yscale: The y-axis scale.
+
+    Raises:
+        RuntimeError: if ``stats`` and ``steps`` have different lengths
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from matplotlib import pyplot as plt
+    >>> from flamme.plot import bxp_continuous_temporal
+    >>> from flamme.utils.boxplot import compute_boxplot_stats
+    >>> fig, ax = plt.subplots()
+    >>> rng = np.random.default_rng()
+    >>> stats = [compute_boxplot_stats(rng.standard_normal(1000)) for _ in range(10)]
+    >>> bxp_continuous_temporal(ax, stats=stats, steps=list(range(len(stats))))
+
+    ```
+    """
+    if len(stats) == 0:
+        return
+    if len(stats) != len(steps):
+        msg = f"stats and steps have different lengths: {len(stats):,} vs {len(steps):,}"
+        raise RuntimeError(msg)
+    ax.bxp(
+        stats,
+        positions=np.arange(len(stats)),
+        shownotches=True,
         vert=True,
         widths=0.7,
         patch_artist=True,
         boxprops={"facecolor": "lightblue"},
     )
-    array = np.concatenate(data)
-    ymin, ymax = find_range(array, xmin=ymin, xmax=ymax)
+    extrema = np.array(
+        [
+            value
+            for stat in stats
+            for value in (stat["whislo"], stat["whishi"], *stat["fliers"].tolist())
+        ],
+        dtype=np.float64,
+    )
+    if ymin is None:
+        ymin = np.nanmin(extrema, initial=np.inf).item()
+    if ymax is None:
+        ymax = np.nanmax(extrema, initial=-np.inf).item()
     if ymin < ymax:
         ax.set_ylim(ymin, ymax)
     ax.set_xticks(np.arange(len(steps)), labels=steps)
-    if yscale == "auto":
-        yscale = auto_yscale_continuous(array=array, nbins=100)
     ax.set_yscale(yscale)
     readable_xticklabels(ax)
 
 
 def hist_continuous(
     ax: Axes,
-    array: np.ndarray,
+    array: np.ndarray | SortedArray,
     nbins: int | None = None,
     density: bool = False,
     yscale: str = "linear",
@@ -156,9 +249,13 @@ def hist_continuous(
 ) -> None:
     r"""Plot the histogram of an array containing continuous values.
 
+    The values are sorted once, and the sorted values are used to
+    compute the range, the histogram, the CDF and the quantiles.
+    Only the bin counts and the bin edges are passed to matplotlib.
+
     Args:
         ax: The axes of the matplotlib figure to update.
-        array: The array with the data.
+        array: The array with the data or a sorted view of the data.
         nbins: The number of bins to use to plot.
         density: If True, draw and return a probability density:
             each bin will display the bin's raw count divided by the
@@ -189,17 +286,18 @@ def hist_continuous(
 
     ```
     """
-    array = array.ravel()
+    array = to_sorted_array(array)
     if array.size == 0:
         return
     xmin, xmax = find_range(array, xmin=xmin, xmax=xmax)
-    ax.hist(array, bins=nbins, range=(xmin, xmax), color="tab:blue", alpha=0.9, density=density)
+    counts, edges = array.histogram(bins=nbins, range=(xmin, xmax))
+    plot_histogram(ax, counts=counts, edges=edges, density=density)
     readable_xticklabels(ax, max_num_xticks=100)
     if xmin < xmax:
         ax.set_xlim(xmin, xmax)
     ax.set_ylabel("density (number of occurrences/total)" if density else "number of occurrences")
     if yscale == "auto":
-        yscale = auto_yscale_continuous(array=array, nbins=nbins)
+        yscale = auto_yscale_histogram(counts=counts, edges=edges)
     ax.set_yscale(yscale)
     if cdf:
         plot_cdf(
@@ -214,7 +312,7 @@ def hist_continuous(
 
     if not quantile:
         return
-    q05, q95 = np.quantile(array, q=[0.05, 0.95])
+    q05, q95 = array.quantile([0.05, 0.95])
     if xmin < q05 < xmax:
         axvline_quantile(ax, quantile=q05, label="q0.05 ", horizontalalignment="right")
     if xmin < q95 < xmax:
@@ -269,33 +367,19 @@ def hist_continuous2(
     ```
     """
     array1, array2 = array1.ravel(), array2.ravel()
-    array = np.concatenate([array1, array2])
+    array = SortedArray(np.concatenate([array1, array2]))
     if array.size == 0:
         return
     xmin, xmax = find_range(array, xmin=xmin, xmax=xmax)
-    ax.hist(
-        array1,
-        bins=nbins,
-        range=(xmin, xmax),
-        color="tab:blue",
-        alpha=0.5,
-        label=label1,
+    counts1, edges = compute_histogram(array1, bins=nbins, range=(xmin, xmax))
+    counts2 = compute_histogram(array2, bins=nbins, range=(xmin, xmax))[0]
+    plot_histogram2(
+        ax,
+        counts1=counts1,
+        counts2=counts2,
+        edges=edges,
+        label1=label1,
+        label2=label2,
         density=density,
+        yscale=yscale,
     )
-    ax.hist(
-        array2,
-        bins=nbins,
-        range=(xmin, xmax),
-        color="tab:orange",
-        alpha=0.5,
-        label=label2,
-        density=density,
-    )
-    readable_xticklabels(ax, max_num_xticks=100)
-    if xmin < xmax:
-        ax.set_xlim(xmin, xmax)
-    ax.set_ylabel("density (number of occurrences/total)" if density else "number of occurrences")
-    if yscale == "auto":
-        yscale = auto_yscale_continuous(array=array, nbins=nbins)
-    ax.set_yscale(yscale)
-    ax.legend()
@@ -0,0 +1,302 @@
+// Draw the figures embedded as JSON by flamme.plot.figure_data.figure_data2html.
+// The figures are drawn as inline SVG with the same layout as flamme.plot.svg.
+// The renderer has no dependency, so the report can be opened offline.
+(function () {
+  "use strict";
+
+  var COLORS = { blue: "#1f77b4", cyan: "#17becf", red: "#d62728", black: "#000000" };
+
+  function esc(text) {
+    return String(text)
+      .replace(/&/g, "&amp;")
+      .replace(/</g, "&lt;")
+      .replace(/>/g, "&gt;")
+      .replace(/"/g, "&quot;");
+  }
+
+  function fmt(value) {
+    var abs = Math.abs(value);
+    if (value !== 0 && (abs >= 1e5 || abs < 1e-3)) {
+      return value.toExponential(Math.pow(10, Math.round(Math.log10(abs))) === abs ? 0 : 2);
+    }
+    return String(Number(value.toPrecision(4)));
+  }
+
+  function niceTicks(vmin, vmax, num) {
+    var span = vmax - vmin;
+    if (!isFinite(span) || span <= 0) return [vmin];
+    var raw = span / (num || 5);
+    var magnitude = Math.pow(10, Math.floor(Math.log10(raw)));
+    var step = [1, 2, 2.5, 5, 10]
+      .map(function (m) { return m * magnitude; })
+      .filter(function (s) { return s >= raw; })[0];
+    var ticks = [];
+    for (var i = Math.floor(vmin / step); i <= Math.ceil(vmax / step); i++) {
+      ticks.push(Number((i * step).toFixed(12)));
+    }
+    return ticks;
+  }
+
+  function symlog(value) {
+    return Math.sign(value) * Math.log10(1 + Math.abs(value));
+  }
+
+  function paint(attribute, color, alpha) {
+    var out = attribute + '="' + color + '"';
+    if (alpha !== undefined && alpha < 1) out += " " + attribute + '-opacity="' + alpha + '"';
+    return out;
+  }
+
+  function XAxis(fig, vmin, vmax) {
+    if (vmin === vmax) { vmin -= 0.5; vmax += 0.5; }
+    this.ticks = function () {
+      return niceTicks(vmin, vmax).filter(function (t) { return vmin <= t && t <= vmax; });
+    };
+    this.px = function (value) {
+      return fig.left + ((value - vmin) / (vmax - vmin)) * (fig.right - fig.left);
+    };
+  }
+
+  function YAxis(fig, scale, vmin, vmax) {
+    if (scale === "log") {
+      vmin = vmin > 0 ? Math.pow(10, Math.floor(Math.log10(vmin))) : 1;
+      vmax = Math.pow(10, Math.ceil(Math.log10(Math.max(vmax, vmin * 10))));
+    } else if (scale !== "symlog") {
+      var nice = niceTicks(vmin, vmax > vmin ? vmax : vmin + 1);
+      vmin = Math.min(vmin, nice[0]);
+      vmax = Math.max(vmax, nice[nice.length - 1]);
+    }
+    vmax = Math.max(vmax, vmin + 1e-12);
+    this.ticks = function () {
+      var ticks = [];
+      if (scale === "log" || scale === "symlog") {
+        var low = scale === "symlog" ? 0 : Math.round(Math.log10(vmin));
+        var high = Math.ceil(Math.log10(Math.max(Math.abs(vmax), 1)));
+        var step = Math.max(1, Math.ceil((high - low) / 8));
+        if (scale === "symlog") ticks.push(0);
+        for (var i = low; i <= high; i += step) ticks.push(Math.pow(10, i));
+      } else {
+        ticks = niceTicks(vmin, vmax);
+      }
+      return ticks.filter(function (t) { return vmin <= t && t <= vmax; });
+    };
+    this.px = function (value) {
+      var v = value, lo = vmin, hi = vmax;
+      if (scale === "log") {
+        v = Math.log10(Math.max(value, vmin)); lo = Math.log10(vmin); hi = Math.log10(vmax);
+      } else if (scale === "symlog") {
+        v = symlog(value); lo = symlog(vmin); hi = symlog(vmax);
+      }
+      return fig.top + (1 - (v - lo) / (hi - lo)) * (fig.bottom - fig.top);
+    };
+  }
+
+  function Figure(width, height, labels, title, secondary) {
+    var maxLen = labels.reduce(function (m, l) { return Math.max(m, l.length); }, 0);
+    this.width = width;
+    this.height = height;
+    this.rotate = labels.length > 10 || maxLen > 20;
+    this.left = 70;
+    this.right = width - (secondary ? 70 : 20);
+    this.top = title ? 30 : 15;
+    this.bottom = height - (this.rotate ? Math.min(15 + 6 * maxLen, 150) : 45);
+    this.parts = [];
+    if (title) {
+      this.parts.push('<text x="' + width / 2 + '" y="18" text-anchor="middle" font-size="12">' +
+        esc(title) + "</text>");
+    }
+  }
+
+  Figure.prototype.bands = function (num) {
+    var band = (this.right - this.left) / num, w = band * (num < 50 ? 0.9 : 1), out = [];
+    for (var i = 0; i < num; i++) {
+      var c = this.left + (i + 0.5) * band;
+      out.push([c - w / 2, c + w / 2]);
+    }
+    return out;
+  };
+
+  Figure.prototype.bars = function (xs, ys, bottom, color, alpha) {
+    var d = "";
+    for (var i = 0; i < xs.length; i++) {
+      if (!isFinite(ys[i])) continue;
+      d += "M" + xs[i][0].toFixed(1) + " " + bottom.toFixed(1) + "H" + xs[i][1].toFixed(1) +
+        "V" + ys[i].toFixed(1) + "H" + xs[i][0].toFixed(1) + "Z";
+    }
+    this.parts.push('<path d="' + d + '" ' + paint("fill", color, alpha) + "/>");
+  };
+
+  Figure.prototype.line = function (xs, ys, color, markers) {
+    var points = [], d = "";
+    for (var i = 0; i < xs.length; i++) {
+      if (!isFinite(ys[i])) continue;
+      points.push(xs[i].toFixed(1) + "," + ys[i].toFixed(1));
+      d += "M" + xs[i].toFixed(1) + " " + ys[i].toFixed(1) + "h0";
+    }
+    this.parts.push('<polyline points="' + points.join(" ") + '" fill="none" ' +
+      paint("stroke", color) + ' stroke-width="1.5"/>');
+    if (markers) {
+      this.parts.push('<path d="' + d + '" ' + paint("stroke", color) +
+        ' stroke-width="6" stroke-linecap="round"/>');
+    }
+  };
+
+  Figure.prototype.vline = function (x, label, color) {
+    this.parts.push('<line x1="' + x.toFixed(1) + '" y1="' + this.top + '" x2="' + x.toFixed(1) +
+      '" y2="' + this.bottom + '" ' + paint("stroke", color) + ' stroke-dasharray="4 3"/>' +
+      '<text x="' + x.toFixed(1) + '" y="' + (this.top + 10) + '" text-anchor="middle">' +
+      esc(label) + "</text>");
+  };
+
+  Figure.prototype.legend = function (items) {
+    var x = this.right - 70, self = this;
+    items.forEach(function (item, i) {
+      var y = self.top + 8 + 16 * i;
+      self.parts.push('<rect x="' + x + '" y="' + y + '" width="14" height="9" ' +
+        paint("fill", item[1], item[2]) + '/><text x="' + (x + 18) + '" y="' + (y + 8) + '">' +
+        esc(item[0]) + "</text>");
+    });
+  };
+
+  Figure.prototype.xaxis = function (ticks, label) {
+    var y = this.bottom, self = this;
+    this.parts.push('<line x1="' + this.left + '" y1="' + y + '" x2="' + this.right + '" y2="' +
+      y + '" stroke="#000"/>');
+    ticks.forEach(function (tick) {
+      var x = tick[0].toFixed(1);
+      self.parts.push('<line x1="' + x + '" y1="' + y + '" x2="' + x + '" y2="' + (y + 4) +
+        '" stroke="#000"/>');
+      if (self.rotate) {
+        self.parts.push('<text transform="translate(' + (tick[0] + 3).toFixed(1) + "," + (y + 7) +
+          ') rotate(-90)" text-anchor="end">' + esc(tick[1]) + "</text>");
+      } else {
+        self.parts.push('<text x="' + x + '" y="' + (y + 15) + '" text-anchor="middle">' +
+          esc(tick[1]) + "</text>");
+      }
+    });
+    if (label) {
+      this.parts.push('<text x="' + (this.left + this.right) / 2 + '" y="' + (this.height - 5) +
+        '" text-anchor="middle">' + esc(label) + "</text>");
+    }
+  };
+
+  Figure.prototype.xaxisCategorical = function (labels, label) {
+    var band = (this.right - this.left) / labels.length, ticks = [];
+    var step = Math.ceil(labels.length / 100);
+    for (var i = 0; i < labels.length; i += step) {
+      ticks.push([this.left + (i + 0.5) * band, labels[i]]);
+    }
+    this.xaxis(ticks, label);
+  };
+
+  Figure.prototype.yaxis = function (axis, label, color, secondary) {
+    var x = secondary ? this.right : this.left, sign = secondary ? 1 : -1, self = this;
+    var fill = paint("fill", color || COLORS.black);
+    this.parts.push('<line x1="' + x + '" y1="' + this.top + '" x2="' + x + '" y2="' +
+      this.bottom + '" stroke="#000"/>');
+    axis.ticks().forEach(function (tick) {
+      var y = axis.px(tick);
+      self.parts.push('<line x1="' + x + '" y1="' + y.toFixed(1) + '" x2="' + (x + 4 * sign) +
+        '" y2="' + y.toFixed(1) + '" stroke="#000"/><text x="' + (x + 6 * sign) + '" y="' +
+        (y + 3).toFixed(1) + '" text-anchor="' + (secondary ? "start" : "end") + '" ' + fill +
+        ">" + fmt(tick) + "</text>");
+    });
+    if (label) {
+      this.parts.push('<text transform="translate(' + (x + 55 * sign) + "," +
+        ((this.top + this.bottom) / 2).toFixed(1) + ') rotate(-90)" text-anchor="middle" ' +
+        fill + ">" + esc(label) + "</text>");
+    }
+  };
+
+  Figure.prototype.toSvg = function () {
+    return '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 ' + this.width + " " +
+      this.height + '" style="width:100%; height:auto;" font-family="sans-serif" font-size="10">' +
+      this.parts.join("") + "</svg>";
+  };
+
+  function max(values) {
+    return values.reduce(function (m, v) { return isFinite(v) ? Math.max(m, v) : m; }, -Infinity);
+  }
+
+  function min(values) {
+    return values.reduce(function (m, v) { return isFinite(v) ? Math.min(m, v) : m; }, Infinity);
+  }
+
+  function drawBar(data, width, height) {
+    var fig = new Figure(width, height, data.labels, data.title, false);
+    var yscale = data.yscale === "auto" ? "linear" : data.yscale;
+    var yaxis = new YAxis(fig, yscale, Math.min(min(data.counts), 0), max(data.counts));
+    fig.bars(fig.bands(data.counts.length), data.counts.map(yaxis.px), yaxis.px(0), COLORS.blue);
+    fig.xaxisCategorical(data.labels, data.xlabel);
+    fig.yaxis(yaxis, data.ylabel);
+    return fig.toSvg();
+  }
+
+  function drawHistogram(data, width, height) {
+    var edges = data.edges, n = data.counts.length, fig;
+    fig = new Figure(width, height, [], data.title, data.cdf !== null);
+    var xaxis = new XAxis(fig, edges[0], edges[n]);
+    var yscale = data.yscale === "auto" ? "linear" : data.yscale;
+    var yaxis = new YAxis(fig, yscale, 0, max(data.counts));
+    var xs = [], centers = [];
+    for (var i = 0; i < n; i++) {
+      xs.push([xaxis.px(edges[i]), xaxis.px(edges[i + 1])]);
+      centers.push(xaxis.px((edges[i] + edges[i + 1]) / 2));
+    }
+    fig.bars(xs, data.counts.map(yaxis.px), yaxis.px(0), COLORS.blue, 0.9);
+    if (data.cdf !== null) {
+      var y2axis = new YAxis(fig, "linear", 0, 1);
+      fig.line(centers, data.cdf.map(y2axis.px), COLORS.red, false);
+      fig.yaxis(y2axis, "cumulative distribution function (CDF)", COLORS.red, true);
+    }
+    Object.keys(data.quantiles).forEach(function (label) {
+      var value = data.quantiles[label];
+      if (edges[0] < value && value < edges[n]) fig.vline(xaxis.px(value), label, COLORS.black);
+    });
+    fig.xaxis(xaxis.ticks().map(function (t) { return [xaxis.px(t), fmt(t)]; }), data.xlabel);
+    fig.yaxis(yaxis, data.ylabel);
+    return fig.toSvg();
+  }
+
+  function drawNullTemporal(data, width, height) {
+    var fig = new Figure(width, height, data.labels, data.title, true);
+    var yaxis = new YAxis(fig, "linear", 0, max(data.totals));
+    var bands = fig.bands(data.totals.length);
+    var ratios = data.nulls.map(function (v, i) { return v / data.totals[i]; });
+    var y2axis = new YAxis(fig, "linear", 0, Math.max(max(ratios.concat([0])), 1e-3));
+    fig.bars(bands, data.totals.map(yaxis.px), yaxis.px(0), COLORS.cyan, 0.5);
+    fig.bars(bands, data.nulls.map(yaxis.px), yaxis.px(0), COLORS.blue, 0.8);
+    fig.line(
+      bands.map(function (b) { return (b[0] + b[1]) / 2; }),
+      ratios.map(y2axis.px),
+      COLORS.black,
+      true
+    );
+    fig.legend([["total", COLORS.cyan, 0.5], ["null", COLORS.blue, 0.8]]);
+    fig.xaxisCategorical(data.labels, null);
+    fig.yaxis(yaxis, "number of null/total values", COLORS.blue, false);
+    fig.yaxis(y2axis, "percentage", COLORS.black, true);
+    return fig.toSvg();
+  }
+
+  var DRAW = { bar: drawBar, histogram: drawHistogram, null_temporal: drawNullTemporal };
+
+  function drawAll() {
+    var elements = document.querySelectorAll("div.flamme-figure:not([data-drawn])");
+    Array.prototype.forEach.call(elements, function (element) {
+      var script = element.querySelector('script[type="application/json"]');
+      if (script === null) return;
+      var data = JSON.parse(script.textContent);
+      var width = Number(element.getAttribute("data-width"));
+      var height = Number(element.getAttribute("data-height"));
+      element.insertAdjacentHTML("beforeend", DRAW[data.type](data, width, height));
+      element.setAttribute("data-drawn", "");
+    });
+  }
+
+  if (document.readyState === "loading") {
+    document.addEventListener("DOMContentLoaded", drawAll);
+  } else {
+    drawAll();
+  }
+})();
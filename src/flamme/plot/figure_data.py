@@ -0,0 +1,480 @@
+r"""Contain functions to manage the figure data, i.e. the pre-aggregated
+data used to draw the simple figures without matplotlib.
+
+The figure data is a JSON-serializable dictionary with the type of
+chart (``'bar'``, ``'histogram'`` or ``'null_temporal'``) and the
+aggregated values (e.g. bin counts or per-period values). It can be
+drawn as inline SVG by Python (``'svg'`` figure backend), or embedded
+as compact JSON in the report and drawn by the browser with a small
+bundled JavaScript renderer (``'client'`` figure backend), so Python
+never rasterizes the figure.
+"""
+
+from __future__ import annotations
+
+__all__ = [
+    "MAX_POINTS",
+    "bar_figure_data",
+    "downsample_figure_data",
+    "figure_data2html",
+    "figure_data2svg",
+    "get_figure_data_script",
+    "histogram_figure_data",
+    "null_temporal_figure_data",
+    "render_figure_data",
+]
+
+import json
+import math
+from importlib.resources import files
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from flamme.plot.svg import DEFAULT_FIGSIZE, DPI, svg_bar, svg_histogram, svg_null_temporal
+from flamme.plot.utils import auto_yscale_discrete, auto_yscale_histogram
+from flamme.utils.figure import MISSING_FIGURE_MESSAGE, get_figure_backend
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+# The default maximum number of bars, bins or periods of the figure data
+# embedded in the report. The longer series are downsampled.
+MAX_POINTS = 500
+
+
+def bar_figure_data(
+    labels: Sequence,
+    counts: Sequence[float],
+    *,
+    yscale: str = "linear",
+    title: str | None = None,
+    xlabel: str | None = None,
+    ylabel: str | None = None,
+    ordered: bool = False,
+) -> dict:
+    r"""Return the data to draw a bar chart.
+
+    Args:
+        labels: The label of each bar.
+        counts: The height of each bar.
+        yscale: The y-axis scale. If ``'auto'``, the
+            ``'linear'`` or ``'log'`` scale is chosen based on the
+            counts.
+        title: The figure title.
+        xlabel: The x-axis label.
+        ylabel: The y-axis label.
+        ordered: If ``True``, the bars are ordered (e.g. temporal
+            periods) and the adjacent bars are merged when the data
+            is downsampled. Otherwise, the last bars are merged.
+
+    Returns:
+        The figure data.
+
+    Raises:
+        RuntimeError: if ``labels`` and ``counts`` have different
+            lengths.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from flamme.plot.figure_data import bar_figure_data
+    >>> bar_figure_data(labels=["a", "b", "c"], counts=[5, 100, 42])
+    {'type': 'bar', 'labels': ['a', 'b', 'c'], 'counts': [5.0, 100.0, 42.0], 'yscale': 'linear',
+     'title': None, 'xlabel': None, 'ylabel': None, 'ordered': False}
+
+    ```
+    """
+    counts = np.asarray(counts, dtype=float)
+    if len(labels) != counts.size:
+        msg = f"labels ({len(labels):,}) and counts ({counts.size:,}) have different lengths"
+        raise RuntimeError(msg)
+    if yscale == "auto" and counts.size > 0:
+        yscale = auto_yscale_discrete(min_count=counts.min(), max_count=counts.max())
+    return {
+        "type": "bar",
+        "labels": list(map(str, labels)),
+        "counts": counts.tolist(),
+        "yscale": yscale,
+        "title": title,
+        "xlabel": xlabel,
+        "ylabel": ylabel,
+        "ordered": ordered,
+    }
+
+
+def histogram_figure_data(
+    counts: np.ndarray,
+    edges: np.ndarray,
+    *,
+    yscale: str = "linear",
+    title: str | None = None,
+    xlabel: str | None = None,
+    ylabel: str = "number of occurrences",
+    cdf: np.ndarray | None = None,
+    quantiles: dict[str, float] | None = None,
+) -> dict:
+    r"""Return the data to draw a histogram from its bin counts and bin
+    edges.
+
+    Args:
+        counts: The number of values in each bin.
+        edges: The bin edges. It must have one more item than
+            ``counts``.
+        yscale: The y-axis scale. If ``'auto'``, the
+            ``'linear'``, ``'log'`` or ``'symlog'`` scale is chosen
+            based on the histogram.
+        title: The figure title.
+        xlabel: The x-axis label.
+        ylabel: The y-axis label.
+        cdf: The value of the cumulative distribution function at the
+            right edge of each bin. If not ``None``, the CDF is drawn
+            on a secondary y-axis.
+        quantiles: The quantiles to show as vertical lines. The keys
+            are the labels and the values are the quantile values.
+
+    Returns:
+        The figure data.
+
+    Raises:
+        RuntimeError: if ``counts`` and ``edges`` have incompatible
+            lengths.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from flamme.plot.figure_data import histogram_figure_data
+    >>> data = histogram_figure_data(
+    ...     counts=np.array([2, 5, 3]), edges=np.array([0.0, 1.0, 2.0, 3.0])
+    ... )
+    >>> data["type"], data["counts"], data["edges"]
+    ('histogram', [2.0, 5.0, 3.0], [0.0, 1.0, 2.0, 3.0])
+
+    ```
+    """
+    counts = np.asarray(counts, dtype=float)
+    edges = np.asarray(edges, dtype=float)
+    if edges.size != counts.size + 1:
+        msg = f"edges must have one more item than counts: {edges.size:,} vs {counts.size:,}"
+        raise RuntimeError(msg)
+    if yscale == "auto" and counts.size > 0:
+        yscale = auto_yscale_histogram(counts=counts, edges=edges)
+    return {
+        "type": "histogram",
+        "counts": counts.tolist(),
+        "edges": edges.tolist(),
+        "yscale": yscale,
+        "title": title,
+        "xlabel": xlabel,
+        "ylabel": ylabel,
+        "cdf": None if cdf is None else np.asarray(cdf, dtype=float).tolist(),
+        "quantiles": {
+            label: float(value)
+            for label, value in (quantiles or {}).items()
+            if math.isfinite(value)
+        },
+    }
+
+
+def null_temporal_figure_data(
+    nulls: Sequence,
+    totals: Sequence,
+    labels: Sequence,
+    title: str | None = None,
+) -> dict:
+    r"""Return the data to draw the temporal distribution of the number
+    of missing values.
+
+    Args:
+        nulls: The number of null values for each temporal period.
+        totals: The number of total values for each temporal period.
+        labels: The labels for each temporal period.
+        title: The figure title.
+
+    Returns:
+        The figure data.
+
+    Raises:
+        RuntimeError: if ``nulls``, ``totals``, and ``labels`` have
+            different lengths.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from flamme.plot.figure_data import null_temporal_figure_data
+    >>> null_temporal_figure_data(nulls=[1, 2], totals=[10, 12], labels=["jan", "feb"])
+    {'type': 'null_temporal', 'nulls': [1.0, 2.0], 'totals': [10.0, 12.0], 'labels': ['jan', 'feb'],
+     'title': None}
+
+    ```
+    """
+    nulls = np.asarray(nulls, dtype=float)
+    totals = np.asarray(totals, dtype=float)
+    if nulls.size != totals.size:
+        msg = f"nulls ({nulls.size:,}) and totals ({totals.size:,}) have different lengths"
+        raise RuntimeError(msg)
+    if len(labels) != totals.size:
+        msg = f"nulls ({nulls.size:,}) and labels ({len(labels):,}) have different lengths"
+        raise RuntimeError(msg)
+    return {
+        "type": "null_temporal",
+        "nulls": nulls.tolist(),
+        "totals": totals.tolist(),
+        "labels": list(map(str, labels)),
+        "title": title,
+    }
+
+
+def downsample_figure_data(data: dict, max_points: int = MAX_POINTS) -> dict:
+    r"""Downsample the figure data so it has at most ``max_points``
+    bars, bins or periods.
+
+    The adjacent bins and periods are merged by summing their counts,
+    so the total counts are preserved. For the unordered bar charts
+    (e.g. the values sorted by decreasing number of occurrences), the
+    first bars are kept and the last bars are merged in a single bar.
+
+    Args:
+        data: The figure data to downsample.
+        max_points: The maximum number of bars, bins or periods.
+
+    Returns:
+        The downsampled figure data. The input is returned if it is
+            small enough.
+
+    Raises:
+        ValueError: if the figure type is not supported.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from flamme.plot.figure_data import bar_figure_data, downsample_figure_data
+    >>> data = downsample_figure_data(
+    ...     bar_figure_data(labels=["a", "b", "c", "d"], counts=[4, 3, 2, 1]), max_points=3
+    ... )
+    >>> data["labels"], data["counts"]
+    (['a', 'b', 'others (2)'], [4.0, 3.0, 3.0])
+    >>> data = downsample_figure_data(
+    ...     bar_figure_data(labels=["a", "b", "c", "d"], counts=[4, 3, 2, 1], ordered=True),
+    ...     max_points=3,
+    ... )
+    >>> data["labels"], data["counts"]
+    (['a', 'c'], [7.0, 3.0])
+
+    ```
+    """
+    kind = data["type"]
+    if kind not in {"bar", "histogram", "null_temporal"}:
+        msg = f"Incorrect figure type: {kind}"
+        raise ValueError(msg)
+    size = len(data["counts"] if kind != "null_temporal" else data["totals"])
+    if size <= max_points:
+        return data
+    data = data.copy()
+    if kind == "bar" and not data["ordered"]:
+        counts = data["counts"]
+        num_others = size - max_points + 1
+        data["counts"] = [*counts[: max_points - 1], math.fsum(counts[max_points - 1 :])]
+        data["labels"] = [*data["labels"][: max_points - 1], f"others ({num_others:,})"]
+        return data
+    starts = np.arange(0, size, math.ceil(size / max_points))
+    if kind == "bar":
+        data["counts"] = _sum_buckets(data["counts"], starts)
+        data["labels"] = [data["labels"][i] for i in starts]
+    elif kind == "histogram":
+        data["counts"] = _sum_buckets(data["counts"], starts)
+        data["edges"] = [*(data["edges"][i] for i in starts), data["edges"][-1]]
+        if data["cdf"] is not None:
+            # The CDF is defined at the right edge of each bin.
+            data["cdf"] = [data["cdf"][i - 1] for i in [*starts[1:].tolist(), size]]
+    else:
+        data["nulls"] = _sum_buckets(data["nulls"], starts)
+        data["totals"] = _sum_buckets(data["totals"], starts)
+        data["labels"] = [data["labels"][i] for i in starts]
+    return data
+
+
+def figure_data2html(
+    data: dict,
+    figsize: tuple[float, float] | None = None,
+    max_points: int = MAX_POINTS,
+) -> str:
+    r"""Convert the figure data to a HTML element that is drawn by the
+    browser.
+
+    The figure data is downsampled and embedded as compact JSON, so
+    the size of the HTML element is bounded. The figure is drawn by
+    the script returned by ``get_figure_data_script``, which must be
+    included once in the HTML page.
+
+    Args:
+        data: The figure data.
+        figsize: The figure size in inches. The first dimension is
+            the width and the second is the height.
+        max_points: The maximum number of bars, bins or periods
+            embedded in the HTML element.
+            See ``downsample_figure_data``.
+
+    Returns:
+        The HTML element, or a message if the figure data is empty.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from flamme.plot.figure_data import bar_figure_data, figure_data2html
+    >>> figure = figure_data2html(bar_figure_data(labels=["a", "b", "c"], counts=[5, 100, 42]))
+    >>> figure[:26]
+    '<div class="flamme-figure"'
+
+    ```
+    """
+    if _is_empty(data):
+        return MISSING_FIGURE_MESSAGE
+    data = downsample_figure_data(data, max_points=max_points)
+    width, height = figsize or DEFAULT_FIGSIZE
+    payload = json.dumps(data, separators=(",", ":"), allow_nan=False)
+    # Escape the sequences that could close the script element early.
+    payload = payload.replace("<", "\\u003c").replace(">", "\\u003e").replace("&", "\\u0026")
+    return (
+        f'<div class="flamme-figure" style="width:100%;" '
+        f'data-width="{round(width * DPI)}" data-height="{round(height * DPI)}">'
+        f'<script type="application/json">{payload}</script></div>'
+    )
+
+
+def figure_data2svg(data: dict, figsize: tuple[float, float] | None = None) -> str:
+    r"""Draw the figure data as inline SVG.
+
+    Args:
+        data: The figure data.
+        figsize: The figure size in inches. The first dimension is
+            the width and the second is the height.
+
+    Returns:
+        The SVG representation of the figure, or a message if the
+            figure data is empty.
+
+    Raises:
+        ValueError: if the figure type is not supported.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from flamme.plot.figure_data import bar_figure_data, figure_data2svg
+    >>> figure = figure_data2svg(bar_figure_data(labels=["a", "b", "c"], counts=[5, 100, 42]))
+    >>> figure[:4]
+    '<svg'
+
+    ```
+    """
+    kwargs = {key: value for key, value in data.items() if key not in {"type", "ordered"}}
+    if data["type"] == "bar":
+        return svg_bar(**kwargs, figsize=figsize)
+    if data["type"] == "histogram":
+        cdf = kwargs.pop("cdf")
+        return svg_histogram(
+            **kwargs, cdf=None if cdf is None else np.asarray(cdf), figsize=figsize
+        )
+    if data["type"] == "null_temporal":
+        return svg_null_temporal(**kwargs, figsize=figsize)
+    msg = f"Incorrect figure type: {data['type']}"
+    raise ValueError(msg)
+
+
+def get_figure_data_script() -> str:
+    r"""Return the HTML script element that draws the figures created
+    by ``figure_data2html``.
+
+    The renderer is bundled with the package and embedded in the
+    script element, so the report can be opened offline.
+
+    Returns:
+        The HTML script element.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from flamme.plot.figure_data import get_figure_data_script
+    >>> script = get_figure_data_script()
+    >>> script[:8]
+    '<script>'
+
+    ```
+    """
+    source = files("flamme.plot").joinpath("figure_data.js").read_text(encoding="utf-8")
+    return f"<script>\n{source}</script>"
+
+
+def render_figure_data(data: dict, figsize: tuple[float, float] | None = None) -> str:
+    r"""Render the figure data with the active figure backend.
+
+    The ``'svg'`` backend draws the figure as inline SVG and the
+    ``'client'`` backend embeds the figure data as JSON so the figure
+    is drawn by the browser.
+
+    Args:
+        data: The figure data.
+        figsize: The figure size in inches. The first dimension is
+            the width and the second is the height.
+
+    Returns:
+        The HTML representation of the figure.
+
+    Raises:
+        ValueError: if the active figure backend cannot draw the
+            figure data.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from flamme.plot.figure_data import bar_figure_data, render_figure_data
+    >>> from flamme.utils.figure import use_figure_backend
+    >>> with use_figure_backend("client"):
+    ...     figure = render_figure_data(bar_figure_data(labels=["a", "b"], counts=[5, 3]))
+    ...
+    >>> figure[:26]
+    '<div class="flamme-figure"'
+
+    ```
+    """
+    backend = get_figure_backend()
+    if backend == "svg":
+        return figure_data2svg(data, figsize=figsize)
+    if backend == "client":
+        return figure_data2html(data, figsize=figsize)
+    msg = f"The figure backend {backend!r} cannot draw the figure data"
+    raise ValueError(msg)
+
+
+def _is_empty(data: dict) -> bool:
+    r"""Indicate if the figure data has no bar, bin or period.
+
+    Args:
+        data: The figure data.
+
+    Returns:
+        ``True`` if the figure data is empty, otherwise ``False``.
+    """
+    return len(data["totals"] if data["type"] == "null_temporal" else data["counts"]) == 0
+
+
+def _sum_buckets(values: Sequence[float], starts: np.ndarray) -> list[float]:
+    r"""Sum the values of each bucket of adjacent values.
+
+    Args:
+        values: The values to sum.
+        starts: The index of the first value of each bucket.
+
+    Returns:
+        The sum of the values of each bucket.
+    """
+    return np.add.reduceat(np.asarray(values, dtype=float), starts).tolist()
@@ -0,0 +1,137 @@
+r"""Contain plotting functions to draw precomputed histograms."""
+
+from __future__ import annotations
+
+__all__ = ["plot_histogram", "plot_histogram2"]
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from flamme.plot.utils import auto_yscale_histogram, readable_xticklabels
+
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+
+
+def plot_histogram(
+    ax: Axes,
+    counts: np.ndarray,
+    edges: np.ndarray,
+    *,
+    density: bool = False,
+    color: str = "tab:blue",
+    alpha: float = 0.9,
+    label: str | None = None,
+) -> None:
+    r"""Plot a histogram from its bin counts and bin edges.
+
+    The values are not needed to plot the histogram, so the histogram
+    can be computed upstream e.g. with ``compute_histogram``.
+
+    Args:
+        ax: The axes of the matplotlib figure to update.
+        counts: The number of values in each bin.
+        edges: The bin edges. It must have one more item than
+            ``counts``.
+        density: If True, draw a probability density:
+            each bin will display the bin's raw count divided by the
+            total number of counts and the bin width, so that the area
+            under the histogram integrates to 1.
+        color: The histogram color.
+        alpha: The transparency of the histogram.
+        label: The label associated to the histogram.
+
+    Raises:
+        RuntimeError: if ``counts`` and ``edges`` have incompatible
+            lengths.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from matplotlib import pyplot as plt
+    >>> from flamme.plot import plot_histogram
+    >>> fig, ax = plt.subplots()
+    >>> plot_histogram(ax, counts=np.array([2, 5, 3]), edges=np.array([0.0, 1.0, 2.0, 3.0]))
+
+    ```
+    """
+    if len(edges) != len(counts) + 1:
+        msg = f"edges must have one more item than counts: {len(edges):,} vs {len(counts):,}"
+        raise RuntimeError(msg)
+    values = np.asarray(counts, dtype=float)
+    if density and values.sum() > 0:
+        values = values / (values.sum() * np.diff(edges))
+    ax.stairs(values, edges, fill=True, color=color, alpha=alpha, label=label)
+
+
+def plot_histogram2(
+    ax: Axes,
+    counts1: np.ndarray,
+    counts2: np.ndarray,
+    edges: np.ndarray,
+    *,
+    label1: str = "first",
+    label2: str = "second",
+    density: bool = False,
+    yscale: str = "linear",
+) -> None:
+    r"""Plot two histograms with the same bin edges to compare the
+    distributions.
+
+    Args:
+        ax: The axes of the matplotlib figure to update.
+        counts1: The number of values in each bin of the first
+            histogram.
+        counts2: The number of values in each bin of the second
+            histogram.
+        edges: The bin edges of both histograms.
+        label1: The label associated to the first histogram.
+        label2: The label associated to the second histogram.
+        density: If True, draw a probability density:
+            each bin will display the bin's raw count divided by the
+            total number of counts and the bin width, so that the area
+            under the histogram integrates to 1.
+        yscale: The y-axis scale. If ``'auto'``, the
+            ``'linear'`` or ``'log'/'symlog'`` scale is chosen based
+            on the distribution.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from matplotlib import pyplot as plt
+    >>> from flamme.plot import plot_histogram2
+    >>> fig, ax = plt.subplots()
+    >>> plot_histogram2(
+    ...     ax,
+    ...     counts1=np.array([2, 5, 3]),
+    ...     counts2=np.array([4, 1, 0]),
+    ...     edges=np.array([0.0, 1.0, 2.0, 3.0]),
+    ... )
+
+    ```
+    """
+    plot_histogram(
+        ax, counts=counts1, edges=edges, density=density, color="tab:blue", alpha=0.5, label=label1
+    )
+    plot_histogram(
+        ax,
+        counts=counts2,
+        edges=edges,
+        density=density,
+        color="tab:orange",
+        alpha=0.5,
+        label=label2,
+    )
+    readable_xticklabels(ax, max_num_xticks=100)
+    if edges[0] < edges[-1]:
+        ax.set_xlim(edges[0], edges[-1])
+    ax.set_ylabel("density (number of occurrences/total)" if density else "number of occurrences")
+    if yscale == "auto":
+        yscale = auto_yscale_histogram(counts=counts1 + counts2, edges=edges)
+    ax.set_yscale(yscale)
+    ax.legend()
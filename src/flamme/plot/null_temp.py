@@ -3,7 +3,7 @@ number of missing values."""
 
 from __future__ import annotations
 
-__all__ = ["plot_null_temporal"]
+__all__ = ["plot_null_temporal", "plot_null_temporal_heatmap"]
 
 from typing import TYPE_CHECKING
 
@@ -74,3 +74,68 @@ def plot_null_temporal(ax: Axes, nulls: Sequence, totals: Sequence, labels: Sequ
 
     ax.set_xticks(x, labels=labels)
     ax.set_xlim(-0.5, len(labels) - 0.5)
+
+
+def plot_null_temporal_heatmap(
+    ax: Axes, nulls: np.ndarray, totals: Sequence, columns: Sequence[str], labels: Sequence
+) -> None:
+    r"""Plot the temporal distribution of the percentage of missing
+    values of many columns as a heatmap.
+
+    Each row of the heatmap represents a column and each column of the
+    heatmap represents a temporal period.
+
+    Args:
+        ax: The Axes object that encapsulates all the elements of an
+            individual (sub-)plot in a figure.
+        nulls: The number of null values for each column and temporal
+            period. The shape of the array must be
+            ``(num_columns, num_periods)``.
+        totals: The number of total values for each temporal period.
+        columns: The name of each column.
+        labels: The labels for each temporal period.
+
+    Raises:
+        RuntimeError: if ``nulls``, ``totals``, ``columns``, and
+            ``labels`` have incompatible shapes.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from matplotlib import pyplot as plt
+    >>> from flamme.plot import plot_null_temporal_heatmap
+    >>> fig, ax = plt.subplots()
+    >>> plot_null_temporal_heatmap(
+    ...     ax,
+    ...     nulls=np.array([[1, 2, 3, 4], [0, 0, 5, 6]]),
+    ...     totals=[10, 12, 14, 16],
+    ...     columns=["col1", "col2"],
+    ...     labels=["jan", "feb", "mar", "apr"],
+    ... )
+
+    ```
+    """
+    nulls = np.asarray(nulls, dtype=float)
+    totals = np.asarray(totals, dtype=float)
+    if nulls.shape != (len(columns), len(totals)):
+        msg = (
+            f"nulls must have the shape (num_columns, num_periods)=({len(columns):,}, "
+            f"{len(totals):,}) but received {nulls.shape}"
+        )
+        raise RuntimeError(msg)
+    if len(labels) != len(totals):
+        msg = f"totals ({len(totals):,}) and labels ({len(labels):,}) have different lengths"
+        raise RuntimeError(msg)
+    if nulls.size == 0:
+        return
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        ratios = nulls / totals[None, :]
+    image = ax.imshow(
+        ratios, aspect="auto", interpolation="nearest", cmap="viridis_r", vmin=0.0, vmax=1.0
+    )
+    ax.figure.colorbar(image, ax=ax, label="percentage of null values")
+    ax.set_xticks(np.arange(len(labels)), labels=list(map(str, labels)))
+    ax.set_yticks(np.arange(len(columns)), labels=list(map(str, columns)))
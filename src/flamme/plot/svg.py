@@ -0,0 +1,566 @@
+r"""Contain functions to draw simple figures as inline SVG.
+
+The figures are drawn straight from pre-aggregated arrays without
+matplotlib, so they are much faster to create and much smaller than
+the PNG figures created with ``figure2html``. Only bar, histogram
+and line charts are supported, so matplotlib is still used for the
+other figures.
+"""
+
+from __future__ import annotations
+
+__all__ = ["svg_bar", "svg_histogram", "svg_null_temporal"]
+
+import math
+from html import escape
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from flamme.plot.utils import auto_yscale_discrete, auto_yscale_histogram
+from flamme.utils.figure import MISSING_FIGURE_MESSAGE
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+# The resolution used to convert the figure size in inches to pixels.
+# It is the default resolution of matplotlib.
+DPI = 100
+DEFAULT_FIGSIZE = (6.4, 4.8)
+
+COLORS = {
+    "tab:blue": "#1f77b4",
+    "tab:cyan": "#17becf",
+    "tab:red": "#d62728",
+    "black": "#000000",
+}
+
+
+def svg_bar(
+    labels: Sequence,
+    counts: Sequence[float],
+    *,
+    yscale: str = "linear",
+    title: str | None = None,
+    xlabel: str | None = None,
+    ylabel: str | None = None,
+    color: str = "tab:blue",
+    figsize: tuple[float, float] | None = None,
+    max_num_xticks: int = 100,
+) -> str:
+    r"""Draw a bar chart as inline SVG.
+
+    Args:
+        labels: The label of each bar.
+        counts: The height of each bar.
+        yscale: The y-axis scale. If ``'auto'``, the
+            ``'linear'`` or ``'log'`` scale is chosen based on the
+            counts.
+        title: The figure title.
+        xlabel: The x-axis label.
+        ylabel: The y-axis label.
+        color: The bar color.
+        figsize: The figure size in inches. The first dimension is
+            the width and the second is the height.
+        max_num_xticks: The maximum number of tick labels to show on
+            the x-axis.
+
+    Returns:
+        The SVG representation of the figure, or a message if there
+            is no bar.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from flamme.plot.svg import svg_bar
+    >>> figure = svg_bar(labels=["a", "b", "c"], counts=[5, 100, 42])
+    >>> figure[:4]
+    '<svg'
+
+    ```
+    """
+    counts = np.asarray(counts, dtype=float)
+    if len(labels) != counts.size:
+        msg = f"labels ({len(labels):,}) and counts ({counts.size:,}) have different lengths"
+        raise RuntimeError(msg)
+    if counts.size == 0:
+        return MISSING_FIGURE_MESSAGE
+    if yscale == "auto":
+        yscale = auto_yscale_discrete(min_count=counts.min(), max_count=counts.max())
+    labels = list(map(str, labels))
+    fig = _SvgFigure(figsize=figsize, xticklabels=labels, title=title)
+    yaxis = _YAxis(scale=yscale, vmin=min(counts.min(), 0.0), vmax=counts.max())
+    x0, x1 = fig.bands(counts.size)
+    fig.bars(x0, x1, yaxis.to_pixels(fig, counts), yaxis.to_pixels(fig, 0.0), color=color)
+    fig.xaxis_categorical(labels, max_num_xticks=max_num_xticks, label=xlabel)
+    fig.yaxis(yaxis, label=ylabel)
+    return fig.to_svg()
+
+
+def svg_histogram(
+    counts: np.ndarray,
+    edges: np.ndarray,
+    *,
+    yscale: str = "linear",
+    title: str | None = None,
+    xlabel: str | None = None,
+    ylabel: str = "number of occurrences",
+    cdf: np.ndarray | None = None,
+    quantiles: dict[str, float] | None = None,
+    figsize: tuple[float, float] | None = None,
+) -> str:
+    r"""Draw a histogram as inline SVG from its bin counts and bin
+    edges.
+
+    Args:
+        counts: The number of values in each bin.
+        edges: The bin edges. It must have one more item than
+            ``counts``.
+        yscale: The y-axis scale. If ``'auto'``, the
+            ``'linear'``, ``'log'`` or ``'symlog'`` scale is chosen
+            based on the histogram.
+        title: The figure title.
+        xlabel: The x-axis label.
+        ylabel: The y-axis label.
+        cdf: The value of the cumulative distribution function at the
+            center of each bin. If not ``None``, the CDF is drawn on
+            a secondary y-axis.
+        quantiles: The quantiles to show as vertical lines. The keys
+            are the labels and the values are the quantile values.
+        figsize: The figure size in inches. The first dimension is
+            the width and the second is the height.
+
+    Returns:
+        The SVG representation of the figure, or a message if there
+            is no bin.
+
+    Raises:
+        RuntimeError: if ``counts`` and ``edges`` have incompatible
+            lengths.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from flamme.plot.svg import svg_histogram
+    >>> figure = svg_histogram(counts=np.array([2, 5, 3]), edges=np.array([0.0, 1.0, 2.0, 3.0]))
+    >>> figure[:4]
+    '<svg'
+
+    ```
+    """
+    counts = np.asarray(counts, dtype=float)
+    edges = np.asarray(edges, dtype=float)
+    if edges.size != counts.size + 1:
+        msg = f"edges must have one more item than counts: {edges.size:,} vs {counts.size:,}"
+        raise RuntimeError(msg)
+    if counts.size == 0:
+        return MISSING_FIGURE_MESSAGE
+    if yscale == "auto":
+        yscale = auto_yscale_histogram(counts=counts, edges=edges)
+    fig = _SvgFigure(figsize=figsize, title=title, secondary=cdf is not None)
+    xaxis = _XAxis(vmin=edges[0], vmax=edges[-1])
+    yaxis = _YAxis(scale=yscale, vmin=0.0, vmax=counts.max())
+    fig.bars(
+        xaxis.to_pixels(fig, edges[:-1]),
+        xaxis.to_pixels(fig, edges[1:]),
+        yaxis.to_pixels(fig, counts),
+        yaxis.to_pixels(fig, 0.0),
+        color="tab:blue",
+        alpha=0.9,
+    )
+    if cdf is not None:
+        y2axis = _YAxis(scale="linear", vmin=0.0, vmax=1.0)
+        fig.line(
+            xaxis.to_pixels(fig, (edges[:-1] + edges[1:]) * 0.5),
+            y2axis.to_pixels(fig, np.asarray(cdf, dtype=float)),
+            color="tab:red",
+        )
+        fig.yaxis(
+            y2axis,
+            label="cumulative distribution function (CDF)",
+            color="tab:red",
+            secondary=True,
+        )
+    for label, value in (quantiles or {}).items():
+        if edges[0] < value < edges[-1]:
+            fig.vline(xaxis.to_pixels(fig, value), label=label, color="black")
+    fig.xaxis_continuous(xaxis, label=xlabel)
+    fig.yaxis(yaxis, label=ylabel)
+    return fig.to_svg()
+
+
+def svg_null_temporal(
+    nulls: Sequence,
+    totals: Sequence,
+    labels: Sequence,
+    *,
+    title: str | None = None,
+    figsize: tuple[float, float] | None = None,
+    max_num_xticks: int = 100,
+) -> str:
+    r"""Draw the temporal distribution of the number of missing values
+    as inline SVG.
+
+    It draws the same chart as ``plot_null_temporal``: the number of
+    null and total values of each period as bars, and the percentage
+    of null values as a line on a secondary y-axis.
+
+    Args:
+        nulls: The number of null values for each temporal period.
+        totals: The number of total values for each temporal period.
+        labels: The labels for each temporal period.
+        title: The figure title.
+        figsize: The figure size in inches. The first dimension is
+            the width and the second is the height.
+        max_num_xticks: The maximum number of tick labels to show on
+            the x-axis.
+
+    Returns:
+        The SVG representation of the figure, or a message if there
+            is no period.
+
+    Raises:
+        RuntimeError: if ``nulls``, ``totals``, and ``labels`` have
+            different lengths.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from flamme.plot.svg import svg_null_temporal
+    >>> figure = svg_null_temporal(
+    ...     nulls=[1, 2, 3, 4], totals=[10, 12, 14, 16], labels=["jan", "feb", "mar", "apr"]
+    ... )
+    >>> figure[:4]
+    '<svg'
+
+    ```
+    """
+    nulls = np.asarray(nulls, dtype=float)
+    totals = np.asarray(totals, dtype=float)
+    if nulls.size != totals.size:
+        msg = f"nulls ({nulls.size:,}) and totals ({totals.size:,}) have different lengths"
+        raise RuntimeError(msg)
+    if len(labels) != totals.size:
+        msg = f"nulls ({nulls.size:,}) and labels ({len(labels):,}) have different lengths"
+        raise RuntimeError(msg)
+    if nulls.size == 0:
+        return MISSING_FIGURE_MESSAGE
+    labels = list(map(str, labels))
+    fig = _SvgFigure(figsize=figsize, xticklabels=labels, title=title, secondary=True)
+    yaxis = _YAxis(scale="linear", vmin=0.0, vmax=totals.max())
+    x0, x1 = fig.bands(totals.size)
+    bottom = yaxis.to_pixels(fig, 0.0)
+    fig.bars(x0, x1, yaxis.to_pixels(fig, totals), bottom, color="tab:cyan", alpha=0.5)
+    fig.bars(x0, x1, yaxis.to_pixels(fig, nulls), bottom, color="tab:blue", alpha=0.8)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        ratios = nulls / totals
+    y2axis = _YAxis(scale="linear", vmin=0.0, vmax=max(np.nanmax(ratios, initial=0.0), 1e-3))
+    fig.line((x0 + x1) * 0.5, y2axis.to_pixels(fig, ratios), color="black", markers=True)
+    fig.legend({"total": ("tab:cyan", 0.5), "null": ("tab:blue", 0.8)})
+    fig.xaxis_categorical(labels, max_num_xticks=max_num_xticks)
+    fig.yaxis(yaxis, label="number of null/total values", color="tab:blue")
+    fig.yaxis(y2axis, label="percentage", secondary=True)
+    return fig.to_svg()
+
+
+class _XAxis:
+    r"""Implement a linear x-axis.
+
+    Args:
+        vmin: The minimum value of the axis.
+        vmax: The maximum value of the axis.
+    """
+
+    def __init__(self, vmin: float, vmax: float) -> None:
+        if vmin == vmax:
+            vmin, vmax = vmin - 0.5, vmax + 0.5
+        self.vmin = float(vmin)
+        self.vmax = float(vmax)
+
+    def ticks(self) -> list[float]:
+        r"""Return the tick values."""
+        return _nice_ticks(self.vmin, self.vmax)
+
+    def to_pixels(self, fig: _SvgFigure, values: np.ndarray | float) -> np.ndarray:
+        r"""Convert values to x-coordinates in pixels."""
+        ratio = (np.asarray(values, dtype=float) - self.vmin) / (self.vmax - self.vmin)
+        return fig.left + ratio * fig.plot_width
+
+
+class _YAxis:
+    r"""Implement a y-axis with a linear, log or symlog scale.
+
+    Args:
+        scale: The axis scale.
+        vmin: The minimum value to show.
+        vmax: The maximum value to show.
+
+    Raises:
+        ValueError: if the scale is not supported.
+    """
+
+    def __init__(self, scale: str, vmin: float, vmax: float) -> None:
+        if scale not in {"linear", "log", "symlog"}:
+            msg = f"Incorrect scale: {scale}. The valid scales are 'linear', 'log' and 'symlog'"
+            raise ValueError(msg)
+        self.scale = scale
+        vmin, vmax = float(vmin), float(vmax)
+        if scale == "log":
+            vmin = 10.0 ** math.floor(math.log10(vmin)) if vmin > 0 else 1.0
+            vmax = 10.0 ** math.ceil(math.log10(max(vmax, vmin * 10)))
+        elif scale == "linear":
+            ticks = _nice_ticks(vmin, vmax if vmax > vmin else vmin + 1.0)
+            vmin, vmax = min(vmin, ticks[0]), max(vmax, ticks[-1])
+        self.vmin, self.vmax = vmin, max(vmax, vmin + 1e-12)
+
+    def ticks(self) -> list[float]:
+        r"""Return the tick values."""
+        if self.scale == "linear":
+            ticks = _nice_ticks(self.vmin, self.vmax)
+        else:
+            low = 0 if self.scale == "symlog" else round(math.log10(self.vmin))
+            high = math.ceil(math.log10(max(abs(self.vmax), 1.0)))
+            step = max(1, math.ceil((high - low) / 8))
+            ticks = [10.0**i for i in range(low, high + 1, step)]
+            if self.scale == "symlog":
+                ticks = [0.0, *ticks]
+        return [tick for tick in ticks if self.vmin <= tick <= self.vmax]
+
+    def to_pixels(self, fig: _SvgFigure, values: np.ndarray | float) -> np.ndarray:
+        r"""Convert values to y-coordinates in pixels."""
+        values = np.asarray(values, dtype=float)
+        vmin, vmax = self.vmin, self.vmax
+        if self.scale == "log":
+            values = np.log10(np.clip(values, vmin, None))
+            vmin, vmax = math.log10(vmin), math.log10(vmax)
+        elif self.scale == "symlog":
+            values, vmin, vmax = _symlog(values), _symlog(vmin), _symlog(vmax)
+        ratio = (values - vmin) / (vmax - vmin)
+        return fig.top + (1.0 - ratio) * fig.plot_height
+
+
+class _SvgFigure:
+    r"""Implement a minimal SVG canvas with a plot area, axes and
+    labels.
+
+    Args:
+        figsize: The figure size in inches. The first dimension is
+            the width and the second is the height.
+        xticklabels: The categorical tick labels of the x-axis.
+            They are used to reserve enough space below the plot
+            area.
+        title: The figure title.
+        secondary: If ``True``, space is reserved for a secondary
+            y-axis on the right side.
+    """
+
+    def __init__(
+        self,
+        figsize: tuple[float, float] | None = None,
+        xticklabels: Sequence[str] = (),
+        title: str | None = None,
+        secondary: bool = False,
+    ) -> None:
+        width, height = figsize or DEFAULT_FIGSIZE
+        self.width = round(width * DPI)
+        self.height = round(height * DPI)
+        self.rotate = len(xticklabels) > 10 or any(len(label) > 20 for label in xticklabels)
+        max_len = max(map(len, xticklabels), default=0)
+        self.left = 70
+        self.right = self.width - (70 if secondary else 20)
+        self.top = 30 if title else 15
+        self.bottom = self.height - (min(15 + 6 * max_len, 150) if self.rotate else 45)
+        self._elements = []
+        if title:
+            self._elements.append(
+                f'<text x="{self.width / 2:.1f}" y="18" text-anchor="middle" '
+                f'font-size="12">{escape(title)}</text>'
+            )
+
+    @property
+    def plot_width(self) -> float:
+        r"""The width of the plot area in pixels."""
+        return self.right - self.left
+
+    @property
+    def plot_height(self) -> float:
+        r"""The height of the plot area in pixels."""
+        return self.bottom - self.top
+
+    def bands(self, num: int) -> tuple[np.ndarray, np.ndarray]:
+        r"""Return the left and right x-coordinates of the bars of a
+        categorical x-axis."""
+        band = self.plot_width / num
+        width = band * (0.9 if num < 50 else 1.0)
+        centers = self.left + (np.arange(num) + 0.5) * band
+        return centers - width / 2, centers + width / 2
+
+    def bars(
+        self,
+        x0: np.ndarray,
+        x1: np.ndarray,
+        y: np.ndarray,
+        bottom: np.ndarray | float,
+        color: str,
+        *,
+        alpha: float = 1.0,
+    ) -> None:
+        r"""Draw bars as a single path."""
+        y0 = np.broadcast_to(np.asarray(bottom, dtype=float), np.shape(y))
+        path = "".join(
+            f"M{a:.1f} {b:.1f}H{c:.1f}V{d:.1f}H{a:.1f}Z"
+            for a, b, c, d in zip(x0.tolist(), y0.tolist(), x1.tolist(), y.tolist())
+            if not math.isnan(d)
+        )
+        self._elements.append(f'<path d="{path}" {_paint("fill", color, alpha)}/>')
+
+    def line(self, x: np.ndarray, y: np.ndarray, color: str, markers: bool = False) -> None:
+        r"""Draw a line and optionally a marker at each point.
+
+        The NaN values are not drawn.
+        """
+        points = [(a, b) for a, b in zip(x.tolist(), y.tolist()) if not math.isnan(b)]
+        coords = " ".join(f"{a:.1f},{b:.1f}" for a, b in points)
+        self._elements.append(
+            f'<polyline points="{coords}" fill="none" {_paint("stroke", color)} '
+            'stroke-width="1.5"/>'
+        )
+        if markers:
+            path = "".join(f"M{a:.1f} {b:.1f}h0" for a, b in points)
+            self._elements.append(
+                f'<path d="{path}" {_paint("stroke", color)} stroke-width="6" '
+                'stroke-linecap="round"/>'
+            )
+
+    def vline(self, x: float, label: str, color: str) -> None:
+        r"""Draw a dashed vertical line with a label."""
+        self._elements.append(
+            f'<line x1="{x:.1f}" y1="{self.top}" x2="{x:.1f}" y2="{self.bottom}" '
+            f'{_paint("stroke", color)} stroke-dasharray="4 3"/>'
+            f'<text x="{x:.1f}" y="{self.top + 10}" text-anchor="middle">{escape(label)}</text>'
+        )
+
+    def legend(self, items: dict[str, tuple[str, float]]) -> None:
+        r"""Draw a legend with a colored box for each label."""
+        x = self.right - 70
+        for i, (label, (color, alpha)) in enumerate(items.items()):
+            y = self.top + 8 + 16 * i
+            self._elements.append(
+                f'<rect x="{x}" y="{y}" width="14" height="9" {_paint("fill", color, alpha)}/>'
+                f'<text x="{x + 18}" y="{y + 8}">{escape(label)}</text>'
+            )
+
+    def xaxis_categorical(
+        self, labels: Sequence[str], max_num_xticks: int = 100, label: str | None = None
+    ) -> None:
+        r"""Draw a categorical x-axis with at most ``max_num_xticks``
+        tick labels."""
+        band = self.plot_width / len(labels)
+        step = math.ceil(len(labels) / max_num_xticks)
+        ticks = [(self.left + (i + 0.5) * band, labels[i]) for i in range(0, len(labels), step)]
+        self._xaxis(ticks, label)
+
+    def xaxis_continuous(self, axis: _XAxis, label: str | None = None) -> None:
+        r"""Draw a continuous x-axis."""
+        ticks = [t for t in axis.ticks() if axis.vmin <= t <= axis.vmax]
+        self._xaxis([(axis.to_pixels(self, t).item(), _format_tick(t)) for t in ticks], label)
+
+    def yaxis(
+        self,
+        axis: _YAxis,
+        label: str | None = None,
+        color: str = "black",
+        secondary: bool = False,
+    ) -> None:
+        r"""Draw a y-axis on the left side, or on the right side if
+        ``secondary`` is ``True``."""
+        x = self.right if secondary else self.left
+        sign = 1 if secondary else -1
+        anchor = "start" if secondary else "end"
+        paint = _paint("fill", color)
+        parts = [f'<line x1="{x}" y1="{self.top}" x2="{x}" y2="{self.bottom}" stroke="#000"/>']
+        for tick in axis.ticks():
+            y = axis.to_pixels(self, tick).item()
+            parts.append(
+                f'<line x1="{x}" y1="{y:.1f}" x2="{x + 4 * sign}" y2="{y:.1f}" stroke="#000"/>'
+                f'<text x="{x + 6 * sign}" y="{y + 3:.1f}" text-anchor="{anchor}" {paint}>'
+                f"{_format_tick(tick)}</text>"
+            )
+        if label:
+            lx = x + 55 * sign
+            ly = (self.top + self.bottom) / 2
+            parts.append(
+                f'<text transform="translate({lx},{ly:.1f}) rotate(-90)" text-anchor="middle" '
+                f"{paint}>{escape(label)}</text>"
+            )
+        self._elements.append("".join(parts))
+
+    def to_svg(self) -> str:
+        r"""Return the SVG representation of the figure."""
+        body = "".join(self._elements)
+        return (
+            f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {self.width} {self.height}" '
+            'style="width:100%; height:auto;" font-family="sans-serif" font-size="10">'
+            f"{body}</svg>"
+        )
+
+    def _xaxis(self, ticks: Sequence[tuple[float, str]], label: str | None) -> None:
+        r"""Draw the x-axis line, the ticks and the label."""
+        y = self.bottom
+        parts = [f'<line x1="{self.left}" y1="{y}" x2="{self.right}" y2="{y}" stroke="#000"/>']
+        for x, text in ticks:
+            parts.append(f'<line x1="{x:.1f}" y1="{y}" x2="{x:.1f}" y2="{y + 4}" stroke="#000"/>')
+            if self.rotate:
+                parts.append(
+                    f'<text transform="translate({x + 3:.1f},{y + 7}) rotate(-90)" '
+                    f'text-anchor="end">{escape(text)}</text>'
+                )
+            else:
+                parts.append(
+                    f'<text x="{x:.1f}" y="{y + 15}" text-anchor="middle">{escape(text)}</text>'
+                )
+        if label:
+            parts.append(
+                f'<text x="{(self.left + self.right) / 2:.1f}" y="{self.height - 5}" '
+                f'text-anchor="middle">{escape(label)}</text>'
+            )
+        self._elements.append("".join(parts))
+
+
+def _format_tick(value: float) -> str:
+    r"""Return a short representation of a tick value."""
+    if value != 0 and (abs(value) >= 1e5 or abs(value) < 1e-3):
+        return f"{value:.0e}" if value == 10 ** round(math.log10(abs(value))) else f"{value:.2e}"
+    return f"{value:.4g}"
+
+
+def _nice_ticks(vmin: float, vmax: float, num: int = 5) -> list[float]:
+    r"""Return about ``num`` round tick values that cover the range
+    ``[vmin, vmax]``."""
+    span = vmax - vmin
+    if not math.isfinite(span) or span <= 0:
+        return [vmin]
+    raw = span / num
+    magnitude = 10.0 ** math.floor(math.log10(raw))
+    step = next(m * magnitude for m in (1, 2, 2.5, 5, 10) if m * magnitude >= raw)
+    start = math.floor(vmin / step)
+    stop = math.ceil(vmax / step)
+    return [round(i * step, 12) for i in range(start, stop + 1)]
+
+
+def _paint(attribute: str, color: str, alpha: float = 1.0) -> str:
+    r"""Return the SVG attributes to paint an element."""
+    paint = f'{attribute}="{COLORS.get(color, color)}"'
+    if alpha < 1.0:
+        paint += f' {attribute}-opacity="{alpha}"'
+    return paint
+
+
+def _symlog(values: np.ndarray | float) -> np.ndarray | float:
+    r"""Apply a symmetric log transformation with a linear region
+    around zero."""
+    return np.sign(values) * np.log10(1.0 + np.abs(values))
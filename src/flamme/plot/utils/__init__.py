@@ -5,11 +5,16 @@ from __future__ import annotations
 __all__ = [
     "auto_yscale_continuous",
     "auto_yscale_discrete",
+    "auto_yscale_histogram",
     "axvline_median",
     "axvline_quantile",
     "readable_xticklabels",
 ]
 
 from flamme.plot.utils.line import axvline_median, axvline_quantile
-from flamme.plot.utils.scale import auto_yscale_continuous, auto_yscale_discrete
+from flamme.plot.utils.scale import (
+    auto_yscale_continuous,
+    auto_yscale_discrete,
+    auto_yscale_histogram,
+)
 from flamme.plot.utils.tick import readable_xticklabels
@@ -8,13 +8,17 @@ import math
 
 import numpy as np
 
+from flamme.utils.array import SortedArray
 
-def adjust_nbins(nbins: int | None, array: np.ndarray) -> int | None:
+
+def adjust_nbins(nbins: int | None, array: np.ndarray | SortedArray) -> int | None:
     r"""Return the adjusted number of bins.
 
     Args:
         nbins: The initial number of bins.
         array: The array with the value to plot in the histogram.
+            If it is a ``SortedArray``, the extrema are read from
+            the sorted values.
 
     Returns:
         The adjusted number of bins.
@@ -32,9 +36,11 @@ def adjust_nbins(nbins: int | None, array: np.ndarray) -> int | None:
     """
     if array.size == 0 or nbins is None:
         return nbins
-    if np.issubdtype(array.dtype, np.integer):
-        return min(nbins, (np.max(array) - np.min(array) + 1).item())
-    return nbins
+    if not np.issubdtype(array.dtype, np.integer):
+        return nbins
+    if isinstance(array, SortedArray):
+        return min(nbins, array.max() - array.min() + 1)
+    return min(nbins, (np.max(array) - np.min(array) + 1).item())
 
 
 def find_nbins(bin_size: float, min: float, max: float) -> int:  # noqa: A002
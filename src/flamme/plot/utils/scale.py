@@ -2,19 +2,29 @@ r"""Contain scale utility functions."""
 
 from __future__ import annotations
 
-__all__ = ["auto_yscale_continuous", "auto_yscale_discrete"]
+__all__ = ["auto_yscale_continuous", "auto_yscale_discrete", "auto_yscale_histogram"]
 
+from typing import TYPE_CHECKING
 
-import numpy as np
+from flamme.utils.histogram import compute_histogram
 
-from flamme.utils.array import nonnan
+if TYPE_CHECKING:
+    import numpy as np
+    import polars as pl
 
+    from flamme.utils.array import SortedArray
 
-def auto_yscale_continuous(array: np.ndarray, nbins: int | None = None) -> str:
+
+def auto_yscale_continuous(
+    array: np.ndarray | SortedArray | pl.Series, nbins: int | None = None
+) -> str:
     r"""Find a good scale for y-axis based on the data distribution.
 
     Args:
-        array: The data to use to find the scale.
+        array: The data to use to find the scale. If it is a
+            ``SortedArray``, the histogram is computed from the
+            sorted values. If it is a series, the histogram is
+            computed with polars. See ``compute_histogram``.
         nbins: The number of bins in the histogram.
 
     Returns:
@@ -33,14 +43,8 @@ def auto_yscale_continuous(array: np.ndarray, nbins: int | None = None) -> str:
     """
     if nbins is None:
         nbins = 100
-    array = nonnan(array)
-    counts = np.histogram(array, bins=nbins)[0]
-    nonzero_count = [c for c in counts if c > 0]
-    if len(nonzero_count) <= 2 or (max(nonzero_count) / max(min(nonzero_count), 1)) < 50:
-        return "linear"
-    if np.nanmin(array) <= 0.0:
-        return "symlog"
-    return "log"
+    counts, edges = compute_histogram(array, bins=nbins)
+    return auto_yscale_histogram(counts=counts, edges=edges)
 
 
 def auto_yscale_discrete(min_count: int, max_count: int, threshold: int = 50) -> str:
@@ -71,3 +75,39 @@ def auto_yscale_discrete(min_count: int, max_count: int, threshold: int = 50) ->
     ```
     """
     return "log" if (max_count / max(min_count, 1)) >= threshold else "linear"
+
+
+def auto_yscale_histogram(counts: np.ndarray, edges: np.ndarray) -> str:
+    r"""Find a good scale for y-axis based on a histogram.
+
+    This function can be used to reuse the histogram that is plotted
+    instead of binning the values again.
+
+    Args:
+        counts: The number of values in each bin.
+        edges: The bin edges.
+
+    Returns:
+        The scale for y-axis.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from flamme.plot.utils import auto_yscale_histogram
+    >>> auto_yscale_histogram(counts=np.array([5, 3, 4]), edges=np.array([0, 1, 2, 3]))
+    linear
+    >>> auto_yscale_histogram(counts=np.array([500, 3, 4]), edges=np.array([1, 2, 3, 4]))
+    log
+    >>> auto_yscale_histogram(counts=np.array([500, 3, 4]), edges=np.array([-1, 0, 1, 2]))
+    symlog
+
+    ```
+    """
+    nonzero_count = counts[counts > 0]
+    if nonzero_count.size <= 2 or (nonzero_count.max() / max(nonzero_count.min(), 1)) < 50:
+        return "linear"
+    if edges[0] <= 0.0:
+        return "symlog"
+    return "log"
@@ -6,10 +6,12 @@ __all__ = [
     "BaseReporter",
     "NoRepeatReporter",
     "Reporter",
+    "StreamingReporter",
     "is_reporter_config",
     "setup_reporter",
 ]
 
 from flamme.reporter.base import BaseReporter, is_reporter_config, setup_reporter
 from flamme.reporter.no_repeat import NoRepeatReporter
+from flamme.reporter.streaming import StreamingReporter
 from flamme.reporter.vanilla import Reporter
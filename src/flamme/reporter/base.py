@@ -37,6 +37,10 @@ class BaseReporter(ABC, metaclass=AbstractFactory):
       (analyzer): NullValueAnalyzer(figsize=None)
       (report_path): /path/to/report.html
       (max_toc_depth): 6
+      (materialize): False
+      (cache_max_bytes): 0
+      (figure_backend): matplotlib
+      (figure_sink): inline
     )
     >>> report = reporter.compute()  # doctest: +SKIP
 
@@ -144,6 +148,10 @@ def setup_reporter(
       (analyzer): NullValueAnalyzer(figsize=None)
       (report_path): /path/to/report.html
       (max_toc_depth): 6
+      (materialize): False
+      (cache_max_bytes): 0
+      (figure_backend): matplotlib
+      (figure_sink): inline
     )
 
     ```
@@ -0,0 +1,199 @@
+r"""Contain the implementation of a reporter that analyzes the data by
+batches."""
+
+from __future__ import annotations
+
+__all__ = ["StreamingReporter"]
+
+import logging
+from typing import TYPE_CHECKING
+
+from coola.utils import str_indent, str_mapping
+from coola.utils.path import sanitize_path
+from grizz.transformer import BaseTransformer, setup_transformer
+
+from flamme.analyzer.base import BaseAnalyzer, setup_analyzer
+from flamme.ingestor.base import BaseBatchIngestor, setup_batch_ingestor
+from flamme.reporter.base import BaseReporter
+from flamme.reporter.utils import save_html_report
+from flamme.utils.figure import FIGURE_BACKENDS, use_figure_backend, use_figure_sink
+from flamme.utils.figure_sink import FIGURE_SINKS, create_figure_sink
+from flamme.utils.sampling import ReservoirSampler
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+class StreamingReporter(BaseReporter):
+    r"""Implement a reporter that analyzes the data by batches.
+
+    The batches are read one at a time from the ingestor,
+    transformed, and given to the analyzer (see
+    ``BaseAnalyzer.update``). The report is then created from the
+    final state of the analyzer (see ``BaseAnalyzer.finalize``).
+    The data are never loaded in memory at once, so the peak memory
+    usage is bounded by the batch size and the state of the
+    analyzers.
+
+    The analyzers that cannot analyze the data by batches (see
+    ``BaseAnalyzer.is_streamable``) analyze a uniform sample of the
+    rows. If ``sample_size`` is ``None``, the reporter fails before
+    reading the data.
+
+    Args:
+        ingestor: The batch ingestor or its configuration.
+        transformer: The data transformer or its configuration.
+            It is applied to each batch independently, so it must
+            only use the values of the batch (e.g. cast or filter
+            the rows).
+        analyzer: The analyzer or its configuration.
+        report_path: The path where to save the HTML report.
+        max_toc_depth: The maximum level to show in the
+            table of content.
+        sample_size: The number of rows in the sample analyzed by the
+            analyzers that are not streamable. If ``None``, all the
+            analyzers must be streamable.
+        seed: The random seed used to sample the rows.
+        figure_backend: The backend used to draw the figures.
+            ``'svg'`` draws the simple bar, histogram and line
+            figures as inline SVG, which is much faster and creates
+            smaller reports, and uses matplotlib for the other
+            figures. ``'client'`` embeds the data of these figures
+            as compact JSON and the figures are drawn by the
+            browser. See ``flamme.utils.figure.use_figure_backend``.
+        figure_sink: The sink used to store the images of the
+            matplotlib figures. ``'inline'`` inlines the images in
+            the report. ``'directory'`` writes the images in the
+            directory ``<report name>_figures`` next to the report,
+            and ``'archive'`` writes them in the ZIP archive
+            ``<report name>_figures.zip``, which must be extracted
+            next to the report. The images written next to the
+            report are compressed in background threads and
+            deduplicated. See ``flamme.utils.figure_sink``.
+
+    Raises:
+        ValueError: if ``figure_backend`` or ``figure_sink`` is not
+            valid.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from flamme.analyzer import NullValueAnalyzer
+    >>> from flamme.ingestor import ParquetBatchIngestor
+    >>> from grizz.transformer import SequentialTransformer
+    >>> from flamme.reporter import StreamingReporter
+    >>> reporter = StreamingReporter(
+    ...     ingestor=ParquetBatchIngestor("/path/to/data.parquet"),
+    ...     transformer=SequentialTransformer(transformers=[]),
+    ...     analyzer=NullValueAnalyzer(),
+    ...     report_path="/path/to/report.html",
+    ... )
+    >>> reporter
+    StreamingReporter(
+      (ingestor): ParquetBatchIngestor(path=/path/to/data.parquet, batch_size=65,536)
+      (transformer): SequentialTransformer()
+      (analyzer): NullValueAnalyzer(figsize=None)
+      (report_path): /path/to/report.html
+      (max_toc_depth): 6
+      (sample_size): None
+      (seed): 0
+      (figure_backend): matplotlib
+      (figure_sink): inline
+    )
+    >>> report = reporter.compute()  # doctest: +SKIP
+
+    ```
+    """
+
+    def __init__(
+        self,
+        ingestor: BaseBatchIngestor | dict,
+        transformer: BaseTransformer | dict,
+        analyzer: BaseAnalyzer | dict,
+        report_path: Path | str,
+        max_toc_depth: int = 6,
+        *,
+        sample_size: int | None = None,
+        seed: int = 0,
+        figure_backend: str = "matplotlib",
+        figure_sink: str = "inline",
+    ) -> None:
+        if figure_backend not in FIGURE_BACKENDS:
+            msg = (
+                f"Incorrect figure backend: {figure_backend}. "
+                f"The valid backends are {FIGURE_BACKENDS}"
+            )
+            raise ValueError(msg)
+        if figure_sink not in FIGURE_SINKS:
+            msg = f"Incorrect figure sink: {figure_sink}. The valid sinks are {FIGURE_SINKS}"
+            raise ValueError(msg)
+        self._ingestor = setup_batch_ingestor(ingestor)
+        logger.info(f"ingestor:\n{ingestor}")
+        self._transformer = setup_transformer(transformer)
+        logger.info(f"transformer:\n{transformer}")
+        self._analyzer = setup_analyzer(analyzer)
+        logger.info(f"analyzer:\n{analyzer}")
+        self._report_path = sanitize_path(report_path)
+        self._max_toc_depth = int(max_toc_depth)
+        self._sample_size = sample_size
+        self._seed = seed
+        self._figure_backend = figure_backend
+        self._figure_sink = figure_sink
+
+    def __repr__(self) -> str:
+        args = str_indent(
+            str_mapping(
+                {
+                    "ingestor": self._ingestor,
+                    "transformer": self._transformer,
+                    "analyzer": self._analyzer,
+                    "report_path": self._report_path,
+                    "max_toc_depth": self._max_toc_depth,
+                    "sample_size": self._sample_size,
+                    "seed": self._seed,
+                    "figure_backend": self._figure_backend,
+                    "figure_sink": self._figure_sink,
+                }
+            )
+        )
+        return f"{self.__class__.__qualname__}(\n  {args}\n)"
+
+    def compute(self) -> None:
+        sampler = None
+        if not self._analyzer.is_streamable():
+            if self._sample_size is None:
+                msg = (
+                    "Some analyzers cannot analyze the data by batches. "
+                    "Set sample_size to analyze a sample of the data with these analyzers"
+                )
+                raise RuntimeError(msg)
+            logger.info(
+                "Some analyzers cannot analyze the data by batches, "
+                f"so they analyze a sample of {self._sample_size:,} rows"
+            )
+            sampler = ReservoirSampler(num_rows=self._sample_size, seed=self._seed)
+
+        logger.info("Analyzing the data by batches...")
+        num_batches = num_rows = 0
+        for batch in self._ingestor.iter_batches():
+            batch = self._transformer.transform(batch)  # noqa: PLW2901
+            self._analyzer.update(batch)
+            if sampler is not None:
+                sampler.update(batch)
+            num_batches += 1
+            num_rows += batch.shape[0]
+            logger.debug(f"batch {num_batches:,} analyzed | total rows: {num_rows:,}")
+        logger.info(f"Analyzed {num_rows:,} rows in {num_batches:,} batches")
+        section = self._analyzer.finalize(None if sampler is None else sampler.sample)
+
+        logger.info(f"Creating the HTML report at {self._report_path}...")
+        sink = create_figure_sink(self._figure_sink, self._report_path)
+        with sink, use_figure_backend(self._figure_backend), use_figure_sink(sink):
+            save_html_report(
+                self._report_path,
+                toc=section.render_html_toc(max_depth=self._max_toc_depth),
+                body=section.iter_html_body(),
+            )
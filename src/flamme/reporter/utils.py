@@ -2,12 +2,28 @@ r"""Contain utility functions to generate reports."""
 
 from __future__ import annotations
 
+import io
+from typing import TYPE_CHECKING
+
 from coola.utils import str_indent
+from coola.utils.path import sanitize_path
+from iden.io.utils import generate_unique_tmp_path
+
+from flamme.plot.figure_data import get_figure_data_script
+from flamme.utils.figure import get_figure_backend
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+    from typing import TextIO
 
 
 def create_html_report(toc: str, body: str) -> str:
     r"""Create a HTML report.
 
+    If the active figure backend is ``'client'``, the script that
+    draws the figures from their data is embedded in the report.
+
     Args:
         toc: The table of contents of the report.
         body: The body of the report
@@ -15,7 +31,40 @@ def create_html_report(toc: str, body: str) -> str:
     Returns:
         The HTML report.
     """
-    return f"""
+    report = io.StringIO()
+    write_html_report(report, toc=toc, body=[body])
+    return report.getvalue()
+
+
+def write_html_report(file: TextIO, toc: str, body: Iterable[str]) -> None:
+    r"""Write a HTML report to a text stream.
+
+    The body is written fragment by fragment, so only one fragment
+    is held in memory at a time if ``body`` is an iterator (e.g. the
+    output of ``BaseSection.iter_html_body``). The written report is
+    identical to the output of ``create_html_report`` with the
+    fragments joined by a new line.
+
+    Args:
+        file: The text stream where to write the report.
+        toc: The table of contents of the report.
+        body: The fragments of the body of the report.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import io
+    >>> from flamme.reporter.utils import create_html_report, write_html_report
+    >>> file = io.StringIO()
+    >>> write_html_report(file, toc="<ul></ul>", body=["<p>meow</p>", "<p>bark</p>"])
+    >>> file.getvalue() == create_html_report(toc="<ul></ul>", body="<p>meow</p>\n<p>bark</p>")
+    True
+
+    ```
+    """
+    file.write(
+        f"""
 <!doctype html>
 <html>
     <head>
@@ -27,7 +76,61 @@ def create_html_report(toc: str, body: str) -> str:
     {str_indent(toc, num_spaces=4)}
     </div>
 
-    \t{str_indent(body, num_spaces=8)}
+    \t"""
+    )
+    for i, fragment in enumerate(body):
+        if i > 0:
+            file.write(f"\n{' ' * 8}")
+        file.write(str_indent(fragment, num_spaces=8))
+    # The script is read after the body is rendered because the body
+    # is rendered lazily with the active figure backend.
+    script = get_figure_data_script() if get_figure_backend() == "client" else ""
+    file.write(
+        f"""
+    {str_indent(script, num_spaces=4)}
     </body>
 </html>
 """
+    )
+
+
+def save_html_report(path: Path | str, toc: str, body: Iterable[str]) -> None:
+    r"""Save a HTML report to a file.
+
+    The report is written fragment by fragment with
+    ``write_html_report``, so the whole report is never held in
+    memory. The report is first written to a temporary file that is
+    renamed once the report is complete, so an interrupted rendering
+    never leaves a partial report. The file is overwritten if it
+    exists.
+
+    Args:
+        path: The path where to save the HTML report.
+        toc: The table of contents of the report.
+        body: The fragments of the body of the report.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import tempfile
+    >>> from pathlib import Path
+    >>> from flamme.reporter.utils import save_html_report
+    >>> with tempfile.TemporaryDirectory() as tmpdir:
+    ...     path = Path(tmpdir).joinpath("report.html")
+    ...     save_html_report(path, toc="<ul></ul>", body=["<p>meow</p>"])
+    ...     "<p>meow</p>" in path.read_text()
+    ...
+    True
+
+    ```
+    """
+    path = sanitize_path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = generate_unique_tmp_path(path)
+    try:
+        with tmp_path.open(mode="w") as file:
+            write_html_report(file, toc=toc, body=body)
+        tmp_path.replace(path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
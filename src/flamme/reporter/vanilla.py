@@ -11,11 +11,13 @@ from coola.utils import str_indent, str_mapping
 from coola.utils.path import sanitize_path
 from grizz.ingestor import BaseIngestor, setup_ingestor
 from grizz.transformer import BaseTransformer, setup_transformer
-from iden.io import save_text
 
 from flamme.analyzer.base import BaseAnalyzer, setup_analyzer
 from flamme.reporter.base import BaseReporter
-from flamme.reporter.utils import create_html_report
+from flamme.reporter.utils import save_html_report
+from flamme.utils.cache import ComputationCache, enable_computation_cache
+from flamme.utils.figure import FIGURE_BACKENDS, use_figure_backend, use_figure_sink
+from flamme.utils.figure_sink import FIGURE_SINKS, create_figure_sink
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -33,6 +35,35 @@ class Reporter(BaseReporter):
         report_path: The path where to save the HTML report.
         max_toc_depth: The maximum level to show in the
             table of content.
+        materialize: If ``True``, the sections compute their
+            aggregated data right after the analysis and release the
+            DataFrame, so the DataFrame can be freed before the
+            report is rendered. See ``BaseSection.materialize``.
+        cache_max_bytes: The maximum size in bytes of the cache
+            shared by the analyzers and sections to avoid computing
+            the same results several times (e.g. null counts or
+            temporal aggregations). ``0`` disables the cache.
+            See ``flamme.utils.cache.ComputationCache``.
+        figure_backend: The backend used to draw the figures.
+            ``'svg'`` draws the simple bar, histogram and line
+            figures as inline SVG, which is much faster and creates
+            smaller reports, and uses matplotlib for the other
+            figures. ``'client'`` embeds the data of these figures
+            as compact JSON and the figures are drawn by the
+            browser. See ``flamme.utils.figure.use_figure_backend``.
+        figure_sink: The sink used to store the images of the
+            matplotlib figures. ``'inline'`` inlines the images in
+            the report. ``'directory'`` writes the images in the
+            directory ``<report name>_figures`` next to the report,
+            and ``'archive'`` writes them in the ZIP archive
+            ``<report name>_figures.zip``, which must be extracted
+            next to the report. The images written next to the
+            report are compressed in background threads and
+            deduplicated. See ``flamme.utils.figure_sink``.
+
+    Raises:
+        ValueError: if ``figure_backend`` or ``figure_sink`` is not
+            valid.
 
     Example usage:
 
@@ -60,7 +91,21 @@ class Reporter(BaseReporter):
         analyzer: BaseAnalyzer | dict,
         report_path: Path | str,
         max_toc_depth: int = 6,
+        *,
+        materialize: bool = False,
+        cache_max_bytes: int = 0,
+        figure_backend: str = "matplotlib",
+        figure_sink: str = "inline",
     ) -> None:
+        if figure_backend not in FIGURE_BACKENDS:
+            msg = (
+                f"Incorrect figure backend: {figure_backend}. "
+                f"The valid backends are {FIGURE_BACKENDS}"
+            )
+            raise ValueError(msg)
+        if figure_sink not in FIGURE_SINKS:
+            msg = f"Incorrect figure sink: {figure_sink}. The valid sinks are {FIGURE_SINKS}"
+            raise ValueError(msg)
         self._ingestor = setup_ingestor(ingestor)
         logger.info(f"ingestor:\n{ingestor}")
         self._transformer = setup_transformer(transformer)
@@ -69,6 +114,10 @@ class Reporter(BaseReporter):
         logger.info(f"analyzer:\n{analyzer}")
         self._report_path = sanitize_path(report_path)
         self._max_toc_depth = int(max_toc_depth)
+        self._materialize = bool(materialize)
+        self._cache_max_bytes = int(cache_max_bytes)
+        self._figure_backend = figure_backend
+        self._figure_sink = figure_sink
 
     def __repr__(self) -> str:
         args = str_indent(
@@ -79,22 +128,44 @@ class Reporter(BaseReporter):
                     "analyzer": self._analyzer,
                     "report_path": self._report_path,
                     "max_toc_depth": self._max_toc_depth,
+                    "materialize": self._materialize,
+                    "cache_max_bytes": self._cache_max_bytes,
+                    "figure_backend": self._figure_backend,
+                    "figure_sink": self._figure_sink,
                 }
             )
         )
         return f"{self.__class__.__qualname__}(\n  {args}\n)"
 
     def compute(self) -> None:
+        if self._cache_max_bytes <= 0:
+            self._compute()
+            return
+        with enable_computation_cache(ComputationCache(max_bytes=self._cache_max_bytes)) as cache:
+            self._compute()
+        logger.info(f"computation cache: {cache}")
+
+    def _compute(self) -> None:
+        sink = create_figure_sink(self._figure_sink, self._report_path)
+        with sink, use_figure_backend(self._figure_backend), use_figure_sink(sink):
+            self._create_report()
+
+    def _create_report(self) -> None:
         logger.info("Ingesting the DataFrame...")
         frame = self._ingestor.ingest()
         logger.info(f"Transforming the DataFrame {frame.shape}...")
         frame = self._transformer.transform(frame)
         logger.info(f"Analyzing the DataFrame {frame.shape}...")
         section = self._analyzer.analyze(frame)
-        logger.info("Creating the HTML report...")
-        report = create_html_report(
+        if self._materialize:
+            logger.info("Materializing the sections...")
+            section.materialize()
+        # The sections keep a reference to the DataFrame if they are not
+        # materialized.
+        del frame
+        logger.info(f"Creating the HTML report at {self._report_path}...")
+        save_html_report(
+            self._report_path,
             toc=section.render_html_toc(max_depth=self._max_toc_depth),
-            body=section.render_html_body(),
+            body=section.iter_html_body(),
         )
-        logger.info(f"Saving HTML report at {self._report_path}...")
-        save_text(report, self._report_path, exist_ok=True)
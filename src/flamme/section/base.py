@@ -5,14 +5,23 @@ from __future__ import annotations
 __all__ = ["BaseSection"]
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, TypeVar
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Callable, Hashable, Iterator, Sequence
+
+T = TypeVar("T")
 
 
 class BaseSection(ABC):
-    r"""Define the base class to manage sections."""
+    r"""Define the base class to manage sections.
+
+    The child classes can use ``_memoize`` to cache the statistics and
+    the intermediate results (e.g. the values without nulls or the
+    temporal aggregations) that are used by several parts of the
+    section, so they are computed only once for the lifetime of the
+    section.
+    """
 
     @abstractmethod
     def get_statistics(self) -> dict:
@@ -52,3 +61,115 @@ class BaseSection(ABC):
         Returns:
             The HTML table of content associated to the section.
         """
+
+    def iter_html_body(
+        self, number: str = "", tags: Sequence[str] = (), depth: int = 0
+    ) -> Iterator[str]:
+        r"""Return an iterator over the fragments of the HTML body
+        associated to the section.
+
+        Joining the fragments with a new line gives the output of
+        ``render_html_body``, but the fragments can be written to a
+        file as soon as they are rendered, so the whole HTML body is
+        never held in memory. By default, the HTML body is rendered
+        as a single fragment. The sections that contain other
+        sections yield the fragments of each subsection.
+
+        Args:
+            number: The section number.
+            tags: The tags associated to the section.
+            depth: The depth in the report.
+
+        Returns:
+            An iterator over the fragments of the HTML body.
+
+        Example usage:
+
+        ```pycon
+
+        >>> from flamme.section import ContentSection, SectionDict
+        >>> section = SectionDict(
+        ...     {"meow": ContentSection(content="meow"), "bark": ContentSection(content="bark")},
+        ...     max_toc_depth=0,
+        ... )
+        >>> fragments = list(section.iter_html_body())
+        >>> len(fragments)
+        2
+        >>> "\n".join(fragments) == section.render_html_body()
+        True
+
+        ```
+        """
+        yield self.render_html_body(number=number, tags=tags, depth=depth)
+
+    def get_figure_data(self) -> dict[str, dict]:
+        r"""Return the pre-aggregated data of the simple figures of the
+        section.
+
+        The figure data (e.g. bin counts or per-period values) can be
+        drawn without matplotlib, either as inline SVG or by the
+        browser. See ``flamme.plot.figure_data`` for more information.
+        The sections without simple figures return an empty
+        dictionary.
+
+        Returns:
+            The figure data of each figure of the section.
+
+        Example usage:
+
+        ```pycon
+
+        >>> from collections import Counter
+        >>> from flamme.section import ColumnDiscreteSection
+        >>> section = ColumnDiscreteSection(counter=Counter({"a": 4, "b": 2, "c": 6}), column="col")
+        >>> data = section.get_figure_data()
+        >>> data["histogram"]["labels"], data["histogram"]["counts"]
+        (['c', 'a', 'b'], [6.0, 4.0, 2.0])
+
+        ```
+        """
+        return {}
+
+    def materialize(self) -> None:  # noqa: B027
+        r"""Compute the data required to render the section and release
+        the reference to the DataFrame.
+
+        After this call, the section only holds compact aggregated
+        data, so the DataFrame can be garbage collected before the
+        report is rendered. This method does nothing by default,
+        and calling it several times has no effect.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import polars as pl
+        >>> from flamme.section import DuplicatedRowSection
+        >>> section = DuplicatedRowSection(
+        ...     frame=pl.DataFrame({"col1": [1, 2, 2], "col2": [1, 2, 2]})
+        ... )
+        >>> section.materialize()
+        >>> section.frame is None
+        True
+        >>> section.get_statistics()
+        {'num_rows': 3, 'num_unique_rows': 2}
+
+        ```
+        """
+
+    def _memoize(self, key: Hashable, fn: Callable[[], T]) -> T:
+        r"""Return the value associated to a key and compute it only the
+        first time.
+
+        Args:
+            key: The key of the value in the section cache.
+            fn: The function to compute the value. It is called only
+                if the key is not in the cache.
+
+        Returns:
+            The cached value.
+        """
+        cache: dict[Hashable, Any] = self.__dict__.setdefault("_memo", {})
+        if key not in cache:
+            cache[key] = fn()
+        return cache[key]
@@ -7,6 +7,8 @@ __all__ = [
     "ColumnContinuousSection",
     "create_boxplot_figure",
     "create_histogram_figure",
+    "create_histogram_figure_data",
+    "create_histogram_svg",
     "create_section_template",
     "create_stats_table",
     "to_array",
@@ -15,29 +17,35 @@ __all__ = [
 import logging
 from typing import TYPE_CHECKING
 
+import numpy as np
 from coola.utils import repr_indent, repr_mapping
-from jinja2 import Template
 from matplotlib import pyplot as plt
 
-from flamme.plot import boxplot_continuous, hist_continuous
+from flamme.plot import (
+    boxplot_continuous,
+    figure_data2svg,
+    hist_continuous,
+    histogram_figure_data,
+    render_figure_data,
+)
 from flamme.plot.utils.hist import adjust_nbins
 from flamme.section.base import BaseSection
 from flamme.section.utils import (
     GO_TO_TOP,
+    get_template,
     render_html_toc,
     tags2id,
     tags2title,
     valid_h_tag,
 )
-from flamme.utils.array import filter_range, nonnan
-from flamme.utils.figure import figure2html
+from flamme.utils.array import SortedArray, to_sorted_array
+from flamme.utils.figure import figure2html, get_figure_backend
 from flamme.utils.range import find_range
 from flamme.utils.stats import compute_statistics_continuous
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
-    import numpy as np
     import polars as pl
 
 
@@ -63,6 +71,10 @@ class ColumnContinuousSection(BaseSection):
             ``0`` is the minimum value and ``1`` is the maximum value.
         figsize: The figure size in inches. The first
             dimension is the width and the second is the height.
+        statistics: The precomputed descriptive statistics of the
+            column, for example a row of the table returned by
+            ``compute_statistics_continuous_frame``. If ``None``,
+            the statistics are computed from the series.
 
     Example usage:
 
@@ -101,6 +113,8 @@ class ColumnContinuousSection(BaseSection):
         xmin: float | str | None = None,
         xmax: float | str | None = None,
         figsize: tuple[float, float] | None = None,
+        *,
+        statistics: dict[str, float] | None = None,
     ) -> None:
         self._series = series
         self._column = column
@@ -109,6 +123,7 @@ class ColumnContinuousSection(BaseSection):
         self._xmin = xmin
         self._xmax = xmax
         self._figsize = figsize
+        self._statistics = statistics
 
     def __repr__(self) -> str:
         args = repr_indent(
@@ -158,7 +173,11 @@ class ColumnContinuousSection(BaseSection):
         return self._figsize
 
     def get_statistics(self) -> dict[str, float]:
-        return compute_statistics_continuous(self._series)
+        if self._statistics is not None:
+            return dict(self._statistics)
+        return dict(
+            self._memoize("statistics", lambda: compute_statistics_continuous(self._series))
+        )
 
     def render_html_body(self, number: str = "", tags: Sequence[str] = (), depth: int = 0) -> str:
         logger.info(f"Rendering the continuous distribution of {self._column}")
@@ -166,8 +185,8 @@ class ColumnContinuousSection(BaseSection):
         null_values_pct = (
             f"{100 * stats['num_nulls'] / stats['count']:.2f}" if stats["count"] > 0 else "N/A"
         )
-        xmin, xmax = find_range(to_array(self._series), xmin=self._xmin, xmax=self._xmax)
-        return Template(create_section_template()).render(
+        xmin, xmax = find_range(self._get_array(), xmin=self._xmin, xmax=self._xmax)
+        return get_template(create_section_template()).render(
             {
                 "go_to_top": GO_TO_TOP,
                 "id": tags2id(tags),
@@ -195,9 +214,29 @@ class ColumnContinuousSection(BaseSection):
     ) -> str:
         return render_html_toc(number=number, tags=tags, depth=depth, max_depth=max_depth)
 
+    def get_figure_data(self) -> dict[str, dict]:
+        return {
+            "histogram": create_histogram_figure_data(
+                series=self._get_array(),
+                column=self._column,
+                nbins=self._nbins,
+                yscale=self._yscale,
+                xmin=self._xmin,
+                xmax=self._xmax,
+            )
+        }
+
+    def _get_array(self) -> SortedArray:
+        r"""Return the sorted values without the null values.
+
+        The values are sorted once and shared by the range, the
+        histogram and the boxplot.
+        """
+        return self._memoize("array", lambda: SortedArray(to_array(self._series)))
+
     def _create_boxplot_figure(self) -> str:
         fig = create_boxplot_figure(
-            series=self._series,
+            series=self._get_array(),
             xmin=self._xmin,
             xmax=self._xmax,
             figsize=self._figsize,
@@ -205,8 +244,10 @@ class ColumnContinuousSection(BaseSection):
         return figure2html(fig, close_fig=True)
 
     def _create_histogram_figure(self) -> str:
+        if get_figure_backend() != "matplotlib":
+            return render_figure_data(self.get_figure_data()["histogram"], figsize=self._figsize)
         fig = create_histogram_figure(
-            series=self._series,
+            series=self._get_array(),
             column=self._column,
             nbins=self._nbins,
             yscale=self._yscale,
@@ -258,7 +299,7 @@ The histogram shows the distribution of values in the range [{{xmin}}, {{xmax}}]
 
 
 def create_boxplot_figure(
-    series: pl.Series,
+    series: pl.Series | np.ndarray | SortedArray,
     xmin: float | str | None = None,
     xmax: float | str | None = None,
     figsize: tuple[float, float] | None = None,
@@ -266,7 +307,8 @@ def create_boxplot_figure(
     r"""Return a boxplot figure.
 
     Args:
-        series: The series/column to analyze.
+        series: The series/column to analyze, its values without
+            the null values (see ``to_array``), or its sorted values.
         xmin: The minimum value of the range or its
             associated quantile. ``q0.1`` means the 10% quantile.
             ``0`` is the minimum value and ``1`` is the maximum value.
@@ -289,7 +331,7 @@ def create_boxplot_figure(
 
     ```
     """
-    array = to_array(series)
+    array = _to_sorted_array(series)
     if array.size == 0:
         return None
     if figsize is not None:
@@ -300,7 +342,7 @@ def create_boxplot_figure(
 
 
 def create_histogram_figure(
-    series: pl.Series,
+    series: pl.Series | np.ndarray | SortedArray,
     column: str,
     nbins: int | None = None,
     yscale: str = "linear",
@@ -311,7 +353,8 @@ def create_histogram_figure(
     r"""Return a histogram figure.
 
     Args:
-        series: The series/column to analyze.
+        series: The series/column to analyze, its values without
+            the null values (see ``to_array``), or its sorted values.
         column: The column name.
         nbins: The number of bins in the histogram.
         yscale: The y-axis scale. If ``'auto'``, the
@@ -341,12 +384,12 @@ def create_histogram_figure(
 
     ```
     """
-    array = nonnan(to_array(series))
+    array = _to_sorted_array(series)
     if array.size == 0:
         return None
     fig, ax = plt.subplots(figsize=figsize)
     xmin, xmax = find_range(array, xmin=xmin, xmax=xmax)
-    nbins = adjust_nbins(nbins=nbins, array=filter_range(array, xmin=xmin, xmax=xmax))
+    nbins = adjust_nbins(nbins=nbins, array=array.filter_range(xmin=xmin, xmax=xmax))
     hist_continuous(
         ax=ax,
         array=array,
@@ -359,6 +402,125 @@ def create_histogram_figure(
     return fig
 
 
+def create_histogram_figure_data(
+    series: pl.Series | np.ndarray | SortedArray,
+    column: str,
+    *,
+    nbins: int | None = None,
+    yscale: str = "linear",
+    xmin: float | str | None = None,
+    xmax: float | str | None = None,
+) -> dict:
+    r"""Return the data to draw the same histogram figure as
+    ``create_histogram_figure`` without matplotlib.
+
+    Args:
+        series: The series/column to analyze, its values without
+            the null values (see ``to_array``), or its sorted values.
+        column: The column name.
+        nbins: The number of bins in the histogram.
+        yscale: The y-axis scale. If ``'auto'``, the
+            ``'linear'`` or ``'log'`` scale is chosen based on the
+            distribution.
+        xmin: The minimum value of the range or its
+            associated quantile. ``q0.1`` means the 10% quantile.
+            ``0`` is the minimum value and ``1`` is the maximum value.
+        xmax: The maximum value of the range or its
+            associated quantile. ``q0.9`` means the 90% quantile.
+            ``0`` is the minimum value and ``1`` is the maximum value.
+
+    Returns:
+        The figure data. See ``flamme.plot.figure_data``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import polars as pl
+    >>> from flamme.section.continuous import create_histogram_figure_data
+    >>> data = create_histogram_figure_data(
+    ...     series=pl.Series([None, *list(range(101)), None]), column="col", nbins=4
+    ... )
+    >>> data["counts"], data["edges"]
+    ([25.0, 25.0, 25.0, 26.0], [0.0, 25.0, 50.0, 75.0, 100.0])
+
+    ```
+    """
+    array = _to_sorted_array(series)
+    title = f"data distribution for column {column}"
+    if array.size == 0:
+        return histogram_figure_data(
+            counts=np.zeros(0), edges=np.zeros(1), yscale=yscale, title=title
+        )
+    xmin, xmax = find_range(array, xmin=xmin, xmax=xmax)
+    nbins = adjust_nbins(nbins=nbins, array=array.filter_range(xmin=xmin, xmax=xmax))
+    counts, edges = array.histogram(bins=nbins, range=(xmin, xmax))
+    # Like ``plot_cdf``, the values outside of the range are included
+    # in the CDF.
+    nleft = array.size - array.count(lower=xmin)
+    cdf = (np.cumsum(counts) + nleft) / array.size
+    q05, q95 = array.quantile([0.05, 0.95])
+    return histogram_figure_data(
+        counts=counts,
+        edges=edges,
+        yscale=yscale,
+        title=title,
+        cdf=cdf,
+        quantiles={"q0.05": q05, "q0.95": q95},
+    )
+
+
+def create_histogram_svg(
+    series: pl.Series | np.ndarray | SortedArray,
+    column: str,
+    *,
+    nbins: int | None = None,
+    yscale: str = "linear",
+    xmin: float | str | None = None,
+    xmax: float | str | None = None,
+    figsize: tuple[float, float] | None = None,
+) -> str:
+    r"""Return the same histogram figure as ``create_histogram_figure``
+    drawn as inline SVG.
+
+    Args:
+        series: The series/column to analyze, its values without
+            the null values (see ``to_array``), or its sorted values.
+        column: The column name.
+        nbins: The number of bins in the histogram.
+        yscale: The y-axis scale. If ``'auto'``, the
+            ``'linear'`` or ``'log'`` scale is chosen based on the
+            distribution.
+        xmin: The minimum value of the range or its
+            associated quantile. ``q0.1`` means the 10% quantile.
+            ``0`` is the minimum value and ``1`` is the maximum value.
+        xmax: The maximum value of the range or its
+            associated quantile. ``q0.9`` means the 90% quantile.
+            ``0`` is the minimum value and ``1`` is the maximum value.
+        figsize: The figure size in inches. The first
+            dimension is the width and the second is the height.
+
+    Returns:
+        The SVG representation of the figure.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import polars as pl
+    >>> from flamme.section.continuous import create_histogram_svg
+    >>> figure = create_histogram_svg(
+    ...     series=pl.Series([None, *list(range(101)), None]), column="col"
+    ... )
+
+    ```
+    """
+    data = create_histogram_figure_data(
+        series=series, column=column, nbins=nbins, yscale=yscale, xmin=xmin, xmax=xmax
+    )
+    return figure_data2svg(data, figsize=figsize)
+
+
 def create_stats_table(stats: dict, column: str) -> str:
     r"""Create the HTML code of the table with statistics.
 
@@ -406,7 +568,7 @@ def create_stats_table(stats: dict, column: str) -> str:
 
     ```
     """
-    return Template(
+    return get_template(
         """<details>
     <summary>[show statistics]</summary>
 
@@ -472,11 +634,12 @@ def create_stats_table(stats: dict, column: str) -> str:
     )
 
 
-def to_array(series: pl.Series) -> np.ndarray:
-    r"""Convert a series to a numpy array.
+def to_array(series: pl.Series | np.ndarray) -> np.ndarray:
+    r"""Convert a series to a numpy array without the null values.
 
     Args:
-        series: The series to convert.
+        series: The series to convert. If it is already a numpy
+            array, it is returned unchanged.
 
     Returns:
         The converted array.
@@ -493,4 +656,14 @@ def to_array(series: pl.Series) -> np.ndarray:
 
     ```
     """
+    if isinstance(series, np.ndarray):
+        return series
     return series.drop_nulls().to_numpy().ravel()
+
+
+def _to_sorted_array(series: pl.Series | np.ndarray | SortedArray) -> SortedArray:
+    r"""Return the sorted values of a series without the null and NaN
+    values."""
+    if isinstance(series, SortedArray):
+        return series
+    return to_sorted_array(to_array(series))
@@ -12,9 +12,7 @@ __all__ = [
 import logging
 from typing import TYPE_CHECKING
 
-import numpy as np
 from coola.utils import repr_indent, repr_mapping
-from jinja2 import Template
 from matplotlib import pyplot as plt
 
 from flamme.plot import hist_continuous
@@ -23,14 +21,17 @@ from flamme.section.continuous import (
     create_boxplot_figure,
     create_histogram_figure,
     create_stats_table,
+    to_array,
 )
 from flamme.section.utils import (
     GO_TO_TOP,
+    get_template,
     render_html_toc,
     tags2id,
     tags2title,
     valid_h_tag,
 )
+from flamme.utils.array import SortedArray
 from flamme.utils.figure import figure2html
 from flamme.utils.range import find_range
 from flamme.utils.stats import compute_statistics_continuous
@@ -38,6 +39,7 @@ from flamme.utils.stats import compute_statistics_continuous
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
+    import numpy as np
     import polars as pl
 
 
@@ -57,6 +59,10 @@ class ColumnContinuousAdvancedSection(BaseSection):
             on the distribution.
         figsize: The figure size in inches. The first
             dimension is the width and the second is the height.
+        statistics: The precomputed descriptive statistics of the
+            column, for example a row of the table returned by
+            ``compute_statistics_continuous_frame``. If ``None``,
+            the statistics are computed from the series.
 
     Example usage:
 
@@ -91,12 +97,15 @@ class ColumnContinuousAdvancedSection(BaseSection):
         nbins: int | None = None,
         yscale: str = "auto",
         figsize: tuple[float, float] | None = None,
+        *,
+        statistics: dict[str, float] | None = None,
     ) -> None:
         self._series = series
         self._column = column
         self._nbins = nbins
         self._yscale = yscale
         self._figsize = figsize
+        self._statistics = statistics
 
     def __repr__(self) -> str:
         args = repr_indent(
@@ -136,7 +145,11 @@ class ColumnContinuousAdvancedSection(BaseSection):
         return self._figsize
 
     def get_statistics(self) -> dict[str, float]:
-        return compute_statistics_continuous(self._series)
+        if self._statistics is not None:
+            return dict(self._statistics)
+        return dict(
+            self._memoize("statistics", lambda: compute_statistics_continuous(self._series))
+        )
 
     def render_html_body(self, number: str = "", tags: Sequence[str] = (), depth: int = 0) -> str:
         logger.info(f"Rendering the continuous distribution of {self._column}")
@@ -144,7 +157,7 @@ class ColumnContinuousAdvancedSection(BaseSection):
         null_values_pct = (
             f"{100 * stats['num_nulls'] / stats['count']:.2f}" if stats["count"] > 0 else "N/A"
         )
-        return Template(create_section_template()).render(
+        return get_template(create_section_template()).render(
             {
                 "go_to_top": GO_TO_TOP,
                 "id": tags2id(tags),
@@ -168,9 +181,17 @@ class ColumnContinuousAdvancedSection(BaseSection):
     ) -> str:
         return render_html_toc(number=number, tags=tags, depth=depth, max_depth=max_depth)
 
+    def _get_array(self) -> SortedArray:
+        r"""Return the sorted values without the null values.
+
+        The values are sorted once and shared by the ranges, the
+        histograms and the boxplot.
+        """
+        return self._memoize("array", lambda: SortedArray(to_array(self._series)))
+
     def _create_full_boxplot(self) -> str:
         fig = create_boxplot_figure(
-            series=self._series,
+            series=self._get_array(),
             xmin="q0",
             xmax="q1",
             figsize=self._figsize,
@@ -179,7 +200,7 @@ class ColumnContinuousAdvancedSection(BaseSection):
 
     def _create_full_histogram(self) -> str:
         fig = create_histogram_figure(
-            series=self._series,
+            series=self._get_array(),
             column=self._column,
             nbins=self._nbins,
             xmin="q0",
@@ -191,7 +212,7 @@ class ColumnContinuousAdvancedSection(BaseSection):
 
     def _create_iqr_histogram(self) -> str:
         fig = create_histogram_range_figure(
-            series=self._series,
+            series=self._get_array(),
             column=self._column,
             nbins=self._nbins,
             xmin="q0.25",
@@ -249,7 +270,7 @@ This section analyzes the discrete distribution of values for column <em>{{colum
 
 
 def create_histogram_range_figure(
-    series: pl.Series,
+    series: pl.Series | np.ndarray | SortedArray,
     column: str,
     nbins: int | None = None,
     yscale: str = "auto",
@@ -260,7 +281,8 @@ def create_histogram_range_figure(
     r"""Create a histogram figure.
 
     Args:
-        series: The series/column to analyze.
+        series: The series/column to analyze, its values without
+            the null values (see ``to_array``), or its sorted values.
         column: The column name.
         nbins: The number of bins in the histogram.
         yscale: The y-axis scale. If ``'auto'``, the
@@ -290,11 +312,11 @@ def create_histogram_range_figure(
 
     ```
     """
-    array = series.drop_nulls().to_numpy()
+    array = series if isinstance(series, SortedArray) else SortedArray(to_array(series))
     if array.size == 0:
         return None
     xmin, xmax = find_range(array, xmin=xmin, xmax=xmax)
-    array = array[np.logical_and(array >= xmin, array <= xmax)]
+    array = array.filter_range(xmin=xmin, xmax=xmax)
     fig, ax = plt.subplots(figsize=figsize)
     ax.set_title(f"data distribution for column {column}")
     hist_continuous(ax=ax, array=array, nbins=nbins, xmin=xmin, xmax=xmax, yscale=yscale)
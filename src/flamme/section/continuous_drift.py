@@ -5,30 +5,33 @@ from __future__ import annotations
 
 __all__ = [
     "ColumnContinuousTemporalDriftSection",
+    "compute_temporal_drift_histograms",
     "create_section_template",
     "create_temporal_drift_figure",
+    "create_temporal_drift_figure_from_counts",
 ]
 
 import logging
 from typing import TYPE_CHECKING
 
 from coola.utils import repr_indent, repr_mapping
-from jinja2 import Template
 from matplotlib import pyplot as plt
 
-from flamme.plot import hist_continuous2
+from flamme.plot import plot_histogram2
 from flamme.plot.utils import readable_xticklabels
 from flamme.plot.utils.hist import adjust_nbins
 from flamme.section import BaseSection
 from flamme.section.utils import (
     GO_TO_TOP,
+    get_template,
     render_html_toc,
     tags2id,
     tags2title,
     valid_h_tag,
 )
-from flamme.utils.array import filter_range
+from flamme.utils.array import SortedArray
 from flamme.utils.figure import figure2html
+from flamme.utils.histogram import compute_histogram
 from flamme.utils.mapping import sort_by_keys
 from flamme.utils.range import find_range
 from flamme.utils.temporal import to_temporal_frames
@@ -36,6 +39,7 @@ from flamme.utils.temporal import to_temporal_frames
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
+    import numpy as np
     import polars as pl
 
 logger = logging.getLogger(__name__)
@@ -157,7 +161,9 @@ class ColumnContinuousTemporalDriftSection(BaseSection):
         return f"{self.__class__.__qualname__}(\n  {args}\n)"
 
     @property
-    def frame(self) -> pl.DataFrame:
+    def frame(self) -> pl.DataFrame | None:
+        r"""The DataFrame to analyze or ``None`` if the section was
+        materialized."""
         return self._frame
 
     @property
@@ -203,9 +209,16 @@ class ColumnContinuousTemporalDriftSection(BaseSection):
     def get_statistics(self) -> dict[str, float]:
         return {}
 
+    def materialize(self) -> None:
+        if self._frame is None:
+            return
+        self._get_temporal_histograms()
+        self._frame = None
+
     def render_html_body(self, number: str = "", tags: Sequence[str] = (), depth: int = 0) -> str:
         logger.info(f"Rendering the temporal drift of {self._column}")
-        return Template(create_section_template()).render(
+        data = self._get_data()
+        return get_template(create_section_template()).render(
             {
                 "go_to_top": GO_TO_TOP,
                 "id": tags2id(tags),
@@ -214,7 +227,7 @@ class ColumnContinuousTemporalDriftSection(BaseSection):
                 "section": number,
                 "column": self._column,
                 "dt_column": self._dt_column,
-                "temporal_drift_figure": self._create_temporal_drift_figure(),
+                "temporal_drift_figure": data["temporal_drift_figure"],
             }
         )
 
@@ -223,20 +236,40 @@ class ColumnContinuousTemporalDriftSection(BaseSection):
     ) -> str:
         return render_html_toc(number=number, tags=tags, depth=depth, max_depth=max_depth)
 
-    def _create_temporal_drift_figure(self) -> str:
-        fig = create_temporal_drift_figure(
-            frame=self._frame,
-            column=self._column,
-            dt_column=self._dt_column,
-            period=self._period,
-            nbins=self._nbins,
-            density=self._density,
-            yscale=self._yscale,
-            xmin=self._xmin,
-            xmax=self._xmax,
-            figsize=self._figsize,
-        )
-        return figure2html(fig, close_fig=True)
+    def _get_data(self) -> dict[str, str]:
+        r"""Return the HTML elements of the section.
+
+        The figure is drawn from the histogram of each temporal window,
+        so it can be rendered after the section was materialized.
+        """
+        histograms = self._get_temporal_histograms()
+        fig = None
+        if histograms is not None:
+            fig = create_temporal_drift_figure_from_counts(
+                counts=histograms[0],
+                edges=histograms[1],
+                density=self._density,
+                yscale=self._yscale,
+                figsize=self._figsize,
+            )
+        return {"temporal_drift_figure": figure2html(fig, close_fig=True)}
+
+    def _get_temporal_histograms(self) -> tuple[dict[str, np.ndarray], np.ndarray] | None:
+        r"""Return the histogram of each temporal window or ``None`` if
+        there is no valid data."""
+
+        def compute() -> tuple[dict[str, np.ndarray], np.ndarray] | None:
+            return compute_temporal_drift_histograms(
+                frame=self._frame,
+                column=self._column,
+                dt_column=self._dt_column,
+                period=self._period,
+                nbins=self._nbins,
+                xmin=self._xmin,
+                xmax=self._xmax,
+            )
+
+        return self._memoize("temporal_histograms", compute)
 
 
 def create_section_template() -> str:
@@ -336,21 +369,156 @@ def create_temporal_drift_figure(
     ...     frame=data, column="col", dt_column="date", period="1mo"
     ... )
 
+    ```
+    """
+    histograms = compute_temporal_drift_histograms(
+        frame=frame,
+        column=column,
+        dt_column=dt_column,
+        period=period,
+        nbins=nbins,
+        xmin=xmin,
+        xmax=xmax,
+    )
+    if histograms is None:
+        return None
+    counts, edges = histograms
+    return create_temporal_drift_figure_from_counts(
+        counts=counts, edges=edges, density=density, yscale=yscale, figsize=figsize
+    )
+
+
+def compute_temporal_drift_histograms(
+    frame: pl.DataFrame,
+    column: str,
+    dt_column: str,
+    period: str,
+    *,
+    nbins: int | None = None,
+    xmin: float | str | None = None,
+    xmax: float | str | None = None,
+) -> tuple[dict[str, np.ndarray], np.ndarray] | None:
+    r"""Compute the histogram of the values of each temporal window.
+
+    All the histograms have the same bin edges, so the distributions
+    of the temporal windows can be compared.
+
+    Args:
+        frame: The DataFrame with the data.
+        column: The column name.
+        dt_column: The datetime column used to analyze
+            the temporal distribution.
+        period: The temporal period e.g. monthly or daily.
+        nbins: The number of bins in the histogram.
+        xmin: The minimum value of the range or its
+            associated quantile. ``q0.1`` means the 10% quantile.
+            ``0`` is the minimum value and ``1`` is the maximum value.
+        xmax: The maximum value of the range or its
+            associated quantile. ``q0.9`` means the 90% quantile.
+            ``0`` is the minimum value and ``1`` is the maximum value.
+
+    Returns:
+        A tuple with the bin counts of each temporal window sorted by
+            window name, and the bin edges, or ``None`` if there is no
+            valid data.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from datetime import datetime, timezone
+    >>> import polars as pl
+    >>> from flamme.section.continuous_drift import compute_temporal_drift_histograms
+    >>> counts, edges = compute_temporal_drift_histograms(
+    ...     frame=pl.DataFrame(
+    ...         {
+    ...             "col": [0.0, 1.0, 2.0, 3.0],
+    ...             "datetime": [
+    ...                 datetime(year=2020, month=1, day=1, tzinfo=timezone.utc),
+    ...                 datetime(year=2020, month=1, day=2, tzinfo=timezone.utc),
+    ...                 datetime(year=2020, month=2, day=1, tzinfo=timezone.utc),
+    ...                 datetime(year=2020, month=2, day=2, tzinfo=timezone.utc),
+    ...             ],
+    ...         },
+    ...         schema={
+    ...             "col": pl.Float64,
+    ...             "datetime": pl.Datetime(time_unit="us", time_zone="UTC"),
+    ...         },
+    ...     ),
+    ...     column="col",
+    ...     dt_column="datetime",
+    ...     period="1mo",
+    ...     nbins=3,
+    ... )
+    >>> counts
+    {'2020-01': array([1, 1, 0]), '2020-02': array([0, 0, 2])}
+    >>> edges
+    array([0., 1., 2., 3.])
+
     ```
     """
     if column not in frame or dt_column not in frame:
         return None
-    array = frame[column].drop_nulls().drop_nans().to_numpy()
+    array = SortedArray(frame[column].drop_nulls().to_numpy())
     if array.size == 0:
         return None
 
     xmin, xmax = find_range(array, xmin=xmin, xmax=xmax)
-    nbins = adjust_nbins(nbins=nbins, array=filter_range(array, xmin=xmin, xmax=xmax))
+    nbins = adjust_nbins(nbins=nbins, array=array.filter_range(xmin=xmin, xmax=xmax))
     frames, steps = to_temporal_frames(
         frame=frame.select(column, dt_column), dt_column=dt_column, period=period
     )
-    groups = sort_by_keys(dict(zip(steps, [fr[column].to_numpy() for fr in frames])))
+    counts, edges = {}, None
+    for step, fr in zip(steps, frames):
+        counts[step], edges = compute_histogram(fr[column], bins=nbins, range=(xmin, xmax))
+    return sort_by_keys(counts), edges
+
+
+def create_temporal_drift_figure_from_counts(
+    counts: dict[str, np.ndarray],
+    edges: np.ndarray,
+    *,
+    density: bool = False,
+    yscale: str = "linear",
+    figsize: tuple[float, float] | None = None,
+) -> plt.Figure | None:
+    r"""Return the figure to analyze the temporal drift from the
+    precomputed histogram of each temporal window.
+
+    Args:
+        counts: The bin counts of each temporal window.
+            See ``compute_temporal_drift_histograms``.
+        edges: The bin edges of the histograms.
+        density: If True, draw and return a probability density:
+            each bin will display the bin's raw count divided by the
+            total number of counts and the bin width, so that the area
+            under the histogram integrates to 1.
+        yscale: The y-axis scale. If ``'auto'``, the
+            ``'linear'`` or ``'log'`` scale is chosen based on the
+            distribution.
+        figsize: The figure size in inches. The first
+            dimension is the width and the second is the height.
 
+    Returns:
+        The generated figure or ``None`` if there is no temporal
+            window.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from flamme.section.continuous_drift import create_temporal_drift_figure_from_counts
+    >>> fig = create_temporal_drift_figure_from_counts(
+    ...     counts={"2020-01": np.array([2, 0, 0]), "2020-02": np.array([0, 1, 1])},
+    ...     edges=np.array([0.0, 1.0, 2.0, 3.0]),
+    ... )
+
+    ```
+    """
+    if not counts:
+        return None
+    steps = list(counts)
     nrows = len(steps)
     steps1, steps2 = steps[:-1], steps[1:]
     if len(steps) == 2:
@@ -363,15 +531,13 @@ def create_temporal_drift_figure(
 
     for i, (step1, step2) in enumerate(zip(steps1, steps2)):
         ax = axes[i] if nrows > 1 else axes
-        hist_continuous2(
-            ax=ax,
-            array1=groups[step1],
-            array2=groups[step2],
+        plot_histogram2(
+            ax,
+            counts1=counts[step1],
+            counts2=counts[step2],
+            edges=edges,
             label1=step1,
             label2=step2,
-            xmin=xmin,
-            xmax=xmax,
-            nbins=nbins,
             density=density,
             yscale=yscale,
         )
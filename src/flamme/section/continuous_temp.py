@@ -7,34 +7,39 @@ __all__ = [
     "ColumnTemporalContinuousSection",
     "create_section_template",
     "create_temporal_figure",
+    "create_temporal_figure_from_stats",
     "create_temporal_table",
+    "create_temporal_table_from_stats",
     "create_temporal_table_row",
 ]
 
 import logging
 from typing import TYPE_CHECKING
 
-import numpy as np
-import polars as pl
 from coola.utils import repr_indent, repr_mapping
-from jinja2 import Template
 from matplotlib import pyplot as plt
 
-from flamme.plot import boxplot_continuous_temporal
+from flamme.plot import bxp_continuous_temporal
+from flamme.plot.utils import auto_yscale_continuous
 from flamme.section.base import BaseSection
 from flamme.section.utils import (
     GO_TO_TOP,
+    get_template,
     render_html_toc,
+    render_table_rows,
     tags2id,
     tags2title,
     valid_h_tag,
 )
+from flamme.utils.boxplot import compute_temporal_boxplot_stats
 from flamme.utils.figure import figure2html
-from flamme.utils.temporal import compute_temporal_stats, to_step_names
+from flamme.utils.temporal import compute_temporal_stats
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
+    import polars as pl
+
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +59,11 @@ class ColumnTemporalContinuousSection(BaseSection):
             on the distribution.
         figsize: The figure size in inches. The first
             dimension is the width and the second is the height.
+        base_period: If not ``None``, the statistics of the table are computed
+            from the temporal cube with this base period, which is
+            shared by all the sections with the same DataFrame,
+            datetime column and base period. The windows of
+            ``period`` must be unions of windows of ``base_period``.
 
     Example usage:
 
@@ -91,6 +101,7 @@ class ColumnTemporalContinuousSection(BaseSection):
       (period): 1mo
       (yscale): auto
       (figsize): None
+      (base_period): None
     )
     >>> section.get_statistics()
     {}
@@ -106,6 +117,8 @@ class ColumnTemporalContinuousSection(BaseSection):
         period: str,
         yscale: str = "auto",
         figsize: tuple[float, float] | None = None,
+        *,
+        base_period: str | None = None,
     ) -> None:
         self._frame = frame
         self._column = column
@@ -113,6 +126,7 @@ class ColumnTemporalContinuousSection(BaseSection):
         self._period = period
         self._yscale = yscale
         self._figsize = figsize
+        self._base_period = base_period
 
     def __repr__(self) -> str:
         args = repr_indent(
@@ -123,6 +137,7 @@ class ColumnTemporalContinuousSection(BaseSection):
                     "period": self._period,
                     "yscale": self._yscale,
                     "figsize": self._figsize,
+                    "base_period": self._base_period,
                 }
             )
         )
@@ -152,15 +167,28 @@ class ColumnTemporalContinuousSection(BaseSection):
         """
         return self._figsize
 
+    @property
+    def base_period(self) -> str | None:
+        r"""The base period of the temporal cube or ``None`` if the
+        statistics are computed from the rows."""
+        return self._base_period
+
     def get_statistics(self) -> dict:
         return {}
 
+    def materialize(self) -> None:
+        if self._frame is None:
+            return
+        self._get_temporal_stats()
+        self._frame = None
+
     def render_html_body(self, number: str = "", tags: Sequence[str] = (), depth: int = 0) -> str:
         logger.info(
             f"Rendering the temporal continuous distribution of {self._column} | "
             f"datetime column: {self._dt_column} | period: {self._period}"
         )
-        return Template(create_section_template()).render(
+        data = self._get_data()
+        return get_template(create_section_template()).render(
             {
                 "go_to_top": GO_TO_TOP,
                 "id": tags2id(tags),
@@ -170,13 +198,8 @@ class ColumnTemporalContinuousSection(BaseSection):
                 "column": self._column,
                 "dt_column": self._dt_column,
                 "period": self._period,
-                "figure": self._create_temporal_figure(),
-                "table": create_temporal_table(
-                    frame=self._frame,
-                    column=self._column,
-                    dt_column=self._dt_column,
-                    period=self._period,
-                ),
+                "figure": data["figure"],
+                "table": data["table"],
             }
         )
 
@@ -185,16 +208,57 @@ class ColumnTemporalContinuousSection(BaseSection):
     ) -> str:
         return render_html_toc(number=number, tags=tags, depth=depth, max_depth=max_depth)
 
-    def _create_temporal_figure(self) -> str:
-        fig = create_temporal_figure(
-            frame=self._frame,
-            column=self._column,
-            dt_column=self._dt_column,
-            period=self._period,
-            yscale=self._yscale,
+    def _get_data(self) -> dict[str, str]:
+        r"""Return the HTML elements of the section.
+
+        The figure and the table are rendered from the temporal
+        statistics, so they can be rendered after the section was
+        materialized.
+        """
+        data = self._get_temporal_stats()
+        if data is None:
+            return {
+                "figure": figure2html(None),
+                "table": create_temporal_table_from_stats(stats=None, column=self._column),
+            }
+        fig = create_temporal_figure_from_stats(
+            stats=data["boxplot"],
+            steps=data["steps"],
+            yscale=data["yscale"],
             figsize=self._figsize,
         )
-        return figure2html(fig, close_fig=True)
+        return {
+            "figure": figure2html(fig, close_fig=True),
+            "table": create_temporal_table_from_stats(stats=data["table"], column=self._column),
+        }
+
+    def _get_temporal_stats(self) -> dict | None:
+        r"""Return the statistics used to draw the figure and the table
+        or ``None`` if the DataFrame is empty."""
+
+        def compute() -> dict | None:
+            if self._frame.is_empty():
+                return None
+            stats, steps = compute_temporal_boxplot_stats(
+                self._frame, column=self._column, dt_column=self._dt_column, period=self._period
+            )
+            yscale = self._yscale
+            if yscale == "auto":
+                yscale = auto_yscale_continuous(array=self._frame[self._column], nbins=100)
+            return {
+                "boxplot": stats,
+                "steps": steps,
+                "yscale": yscale,
+                "table": compute_temporal_stats(
+                    frame=self._frame,
+                    column=self._column,
+                    dt_column=self._dt_column,
+                    period=self._period,
+                    base_period=self._base_period,
+                ),
+            }
+
+        return self._memoize("temporal_stats", compute)
 
 
 def create_section_template() -> str:
@@ -238,6 +302,10 @@ def create_temporal_figure(
 ) -> plt.Figure | None:
     r"""Create a figure with the temporal value distribution.
 
+    The boxplot statistics of all the temporal windows are computed
+    with a single grouped query, so the cost of the figure does not
+    depend on the number of rows.
+
     Args:
         frame: The DataFrame to analyze.
         column: The column to analyze.
@@ -287,19 +355,64 @@ def create_temporal_figure(
     """
     if frame.is_empty():
         return None
-    groups = (
-        frame.select(pl.col(dt_column).alias("datetime"), pl.col(column).alias("value"))
-        .sort("datetime")
-        .group_by_dynamic("datetime", every=period)
+    stats, steps = compute_temporal_boxplot_stats(
+        frame, column=column, dt_column=dt_column, period=period
+    )
+    if yscale == "auto":
+        yscale = auto_yscale_continuous(array=frame[column], nbins=100)
+    return create_temporal_figure_from_stats(
+        stats=stats, steps=steps, yscale=yscale, figsize=figsize
     )
-    data = [np.sort(np.array(x["value"])) for _, x in groups]
-    steps = to_step_names(groups=groups, period=period)
+
+
+def create_temporal_figure_from_stats(
+    stats: Sequence[dict],
+    steps: Sequence[str],
+    *,
+    yscale: str = "linear",
+    figsize: tuple[float, float] | None = None,
+) -> plt.Figure:
+    r"""Create a figure with the temporal value distribution from the
+    precomputed boxplot statistics.
+
+    Args:
+        stats: The boxplot statistics of each temporal window.
+            See ``compute_temporal_boxplot_stats``.
+        steps: The name of each temporal window.
+        yscale: The y-axis scale.
+        figsize: The figure size in inches. The first
+            dimension is the width and the second is the height.
+
+    Returns:
+        The generated figure.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from flamme.section.continuous_temp import create_temporal_figure_from_stats
+    >>> from flamme.utils.boxplot import compute_boxplot_stats
+    >>> fig = create_temporal_figure_from_stats(
+    ...     stats=[compute_boxplot_stats(np.arange(10)), compute_boxplot_stats(np.arange(5))],
+    ...     steps=["2020-01", "2020-02"],
+    ... )
+
+    ```
+    """
     fig, ax = plt.subplots(figsize=figsize)
-    boxplot_continuous_temporal(ax=ax, data=data, steps=steps, yscale=yscale)
+    bxp_continuous_temporal(ax=ax, stats=stats, steps=steps, yscale=yscale)
     return fig
 
 
-def create_temporal_table(frame: pl.DataFrame, column: str, dt_column: str, period: str) -> str:
+def create_temporal_table(
+    frame: pl.DataFrame,
+    column: str,
+    dt_column: str,
+    period: str,
+    *,
+    base_period: str | None = None,
+) -> str:
     r"""Return a HTML representation of a table with some statistics
     about the temporal value distribution.
 
@@ -310,6 +423,8 @@ def create_temporal_table(frame: pl.DataFrame, column: str, dt_column: str, peri
             the temporal distribution.
         period: The temporal period e.g. monthly or
             daily.
+        base_period: If not ``None``, the statistics are computed
+            from the temporal cube with this base period.
 
     Returns:
         The HTML representation of the table.
@@ -347,12 +462,61 @@ def create_temporal_table(frame: pl.DataFrame, column: str, dt_column: str, peri
     ```
     """
     if frame.is_empty():
-        return "<span>&#9888;</span> No table is generated because the column is empty"
+        return create_temporal_table_from_stats(stats=None, column=column)
+    stats = compute_temporal_stats(
+        frame=frame, column=column, dt_column=dt_column, period=period, base_period=base_period
+    )
+    return create_temporal_table_from_stats(stats=stats, column=column)
+
+
+def create_temporal_table_from_stats(stats: pl.DataFrame | None, column: str) -> str:
+    r"""Return a HTML representation of a table with some statistics
+    about the temporal value distribution from the precomputed
+    statistics.
+
+    Args:
+        stats: The statistics of each temporal window or ``None`` if
+            the column is empty. See ``compute_temporal_stats``.
+        column: The column name.
+
+    Returns:
+        The HTML representation of the table.
 
-    stats = compute_temporal_stats(frame=frame, column=column, dt_column=dt_column, period=period)
+    Example usage:
+
+    ```pycon
+
+    >>> from datetime import datetime, timezone
+    >>> import polars as pl
+    >>> from flamme.section.continuous_temp import create_temporal_table_from_stats
+    >>> from flamme.utils.temporal import compute_temporal_stats
+    >>> stats = compute_temporal_stats(
+    ...     frame=pl.DataFrame(
+    ...         {
+    ...             "col": [0.0, 1.0, 2.0],
+    ...             "datetime": [
+    ...                 datetime(year=2020, month=1, day=1, tzinfo=timezone.utc),
+    ...                 datetime(year=2020, month=1, day=2, tzinfo=timezone.utc),
+    ...                 datetime(year=2020, month=2, day=3, tzinfo=timezone.utc),
+    ...             ],
+    ...         },
+    ...         schema={
+    ...             "col": pl.Float64,
+    ...             "datetime": pl.Datetime(time_unit="us", time_zone="UTC"),
+    ...         },
+    ...     ),
+    ...     column="col",
+    ...     dt_column="datetime",
+    ...     period="1mo",
+    ... )
+    >>> table = create_temporal_table_from_stats(stats=stats, column="col")
 
-    rows = [create_temporal_table_row(stat) for stat in stats.to_dicts()]
-    return Template(
+    ```
+    """
+    if stats is None:
+        return "<span>&#9888;</span> No table is generated because the column is empty"
+    rows = _render_temporal_table_rows(stats.to_dict(as_series=False))
+    return get_template(
         """<details>
     <summary>[show statistics per temporal period]</summary>
 
@@ -385,7 +549,7 @@ def create_temporal_table(frame: pl.DataFrame, column: str, dt_column: str, peri
     </table>
 </details>
 """
-    ).render({"rows": "\n".join(rows), "column": column, "period": period})
+    ).render({"rows": rows, "column": column})
 
 
 def create_temporal_table_row(stats: dict) -> str:
@@ -427,13 +591,30 @@ def create_temporal_table_row(stats: dict) -> str:
 
     ```
     """
+    return _render_temporal_table_rows({key: [value] for key, value in stats.items()})
+
+
+def _render_temporal_table_rows(stats: dict[str, Sequence]) -> str:
+    r"""Return the HTML code of the table rows with the statistics for
+    each temporal period.
+
+    Args:
+        stats: The values of each statistic for each row.
+
+    Returns:
+        The HTML code of the rows.
+    """
 
     def to_float(value: float | None) -> float:
         if value is None:
             return float("nan")
         return value
 
-    return Template(
+    columns = {"step": stats["step"], "count": [f"{value:,}" for value in stats["count"]]}
+    quantiles = ["q01", "q05", "q10", "q25", "median", "q75", "q90", "q95", "q99"]
+    for key in ["mean", "std", "min", *quantiles, "max"]:
+        columns[key] = [f"{to_float(value):,.4f}" for value in stats[key]]
+    return render_table_rows(
         """<tr>
     <th>{{step}}</th>
     <td {{num_style}}>{{count}}</td>
@@ -450,24 +631,7 @@ def create_temporal_table_row(stats: dict) -> str:
     <td {{num_style}}>{{q95}}</td>
     <td {{num_style}}>{{q99}}</td>
     <td {{num_style}}>{{max}}</td>
-</tr>"""
-    ).render(
-        {
-            "num_style": 'style="text-align: right;"',
-            "step": stats["step"],
-            "count": f"{stats['count']:,}",
-            "mean": f"{to_float(stats['mean']):,.4f}",
-            "median": f"{to_float(stats['median']):,.4f}",
-            "min": f"{to_float(stats['min']):,.4f}",
-            "max": f"{to_float(stats['max']):,.4f}",
-            "std": f"{to_float(stats['std']):,.4f}",
-            "q01": f"{to_float(stats['q01']):,.4f}",
-            "q05": f"{to_float(stats['q05']):,.4f}",
-            "q10": f"{to_float(stats['q10']):,.4f}",
-            "q25": f"{to_float(stats['q25']):,.4f}",
-            "q75": f"{to_float(stats['q75']):,.4f}",
-            "q90": f"{to_float(stats['q90']):,.4f}",
-            "q95": f"{to_float(stats['q95']):,.4f}",
-            "q99": f"{to_float(stats['q99']):,.4f}",
-        }
+</tr>""",
+        columns=columns,
+        num_style='style="text-align: right;"',
     )
@@ -7,27 +7,32 @@ __all__ = [
     "TemporalRowCountSection",
     "create_section_template",
     "create_temporal_count_figure",
+    "create_temporal_count_figure_from_counts",
     "create_temporal_count_table",
+    "create_temporal_count_table_from_counts",
     "create_temporal_count_table_row",
 ]
 
 import logging
 from typing import TYPE_CHECKING
 
-from jinja2 import Template
+import numpy as np
 from matplotlib import pyplot as plt
 
+from flamme.plot import bar_figure_data, render_figure_data
 from flamme.plot.utils import readable_xticklabels
 from flamme.section.base import BaseSection
 from flamme.section.utils import (
     GO_TO_TOP,
+    get_template,
     render_html_toc,
+    render_table_rows,
     tags2id,
     tags2title,
     valid_h_tag,
 )
 from flamme.utils.count import compute_temporal_count
-from flamme.utils.figure import figure2html
+from flamme.utils.figure import figure2html, get_figure_backend
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -49,6 +54,11 @@ class TemporalRowCountSection(BaseSection):
         period: The temporal period e.g. monthly or daily.
         figsize: The figure size in inches. The first
             dimension is the width and the second is the height.
+        base_period: If not ``None``, the statistics are computed
+            from the temporal cube with this base period, which is
+            shared by all the sections with the same DataFrame,
+            datetime column and base period. The windows of
+            ``period`` must be unions of windows of ``base_period``.
 
     Example usage:
 
@@ -75,7 +85,7 @@ class TemporalRowCountSection(BaseSection):
     ...     period="1mo",
     ... )
     >>> section
-    TemporalRowCountSection(dt_column=datetime, period=1mo, figsize=None)
+    TemporalRowCountSection(dt_column=datetime, period=1mo, figsize=None, base_period=None)
     >>> section.get_statistics()
     {}
 
@@ -88,6 +98,8 @@ class TemporalRowCountSection(BaseSection):
         dt_column: str,
         period: str,
         figsize: tuple[float, float] | None = None,
+        *,
+        base_period: str | None = None,
     ) -> None:
         if dt_column not in frame:
             msg = (
@@ -99,11 +111,12 @@ class TemporalRowCountSection(BaseSection):
         self._dt_column = dt_column
         self._period = period
         self._figsize = figsize
+        self._base_period = base_period
 
     def __repr__(self) -> str:
         return (
             f"{self.__class__.__qualname__}(dt_column={self._dt_column}, period={self._period}, "
-            f"figsize={self._figsize})"
+            f"figsize={self._figsize}, base_period={self._base_period})"
         )
 
     @property
@@ -129,15 +142,29 @@ class TemporalRowCountSection(BaseSection):
         """
         return self._figsize
 
+    @property
+    def base_period(self) -> str | None:
+        r"""The base period of the temporal cube or ``None`` if the
+        statistics are computed from the rows."""
+        return self._base_period
+
     def get_statistics(self) -> dict:
         return {}
 
+    def get_figure_data(self) -> dict[str, dict]:
+        counts, labels = self._get_temporal_count()
+        return {
+            "temporal_count": bar_figure_data(
+                labels=labels, counts=counts, ylabel="number of rows", ordered=True
+            )
+        }
+
     def render_html_body(self, number: str = "", tags: Sequence[str] = (), depth: int = 0) -> str:
         logger.info(
             "Rendering the number of rows per temporal window "
             f"| datetime column: {self._dt_column} | period: {self._period}"
         )
-        return Template(create_section_template()).render(
+        return get_template(create_section_template()).render(
             {
                 "go_to_top": GO_TO_TOP,
                 "id": tags2id(tags),
@@ -146,11 +173,7 @@ class TemporalRowCountSection(BaseSection):
                 "section": number,
                 "dt_column": self._dt_column,
                 "figure": self._create_temporal_count_figure(),
-                "table": create_temporal_count_table(
-                    frame=self._frame,
-                    dt_column=self._dt_column,
-                    period=self._period,
-                ),
+                "table": create_temporal_count_table_from_counts(*self._get_temporal_count()),
             }
         )
 
@@ -160,11 +183,30 @@ class TemporalRowCountSection(BaseSection):
         return render_html_toc(number=number, tags=tags, depth=depth, max_depth=max_depth)
 
     def _create_temporal_count_figure(self) -> str:
-        fig = create_temporal_count_figure(
-            frame=self._frame, dt_column=self._dt_column, period=self._period, figsize=self._figsize
+        if get_figure_backend() != "matplotlib":
+            return render_figure_data(self.get_figure_data()["temporal_count"], self._figsize)
+        counts, labels = self._get_temporal_count()
+        fig = create_temporal_count_figure_from_counts(
+            counts=counts, labels=labels, figsize=self._figsize
         )
         return figure2html(fig, close_fig=True)
 
+    def _get_temporal_count(self) -> tuple[np.ndarray, list[str]]:
+        r"""Return the number of rows and the label of each temporal
+        window."""
+
+        def compute() -> tuple[np.ndarray, list[str]]:
+            if self._frame.is_empty() or self._dt_column not in self._frame:
+                return np.zeros(0, dtype=np.int64), []
+            return compute_temporal_count(
+                frame=self._frame,
+                dt_column=self._dt_column,
+                period=self._period,
+                base_period=self._base_period,
+            )
+
+        return self._memoize("temporal_count", compute)
+
 
 def create_section_template() -> str:
     r"""Return the template of the section.
@@ -247,6 +289,38 @@ def create_temporal_count_figure(
         return None
 
     counts, labels = compute_temporal_count(frame=frame, dt_column=dt_column, period=period)
+    return create_temporal_count_figure_from_counts(counts=counts, labels=labels, figsize=figsize)
+
+
+def create_temporal_count_figure_from_counts(
+    counts: np.ndarray, labels: Sequence[str], figsize: tuple[float, float] | None = None
+) -> plt.Figure | None:
+    r"""Return a figure with number of rows per temporal windows from
+    the precomputed counts.
+
+    Args:
+        counts: The number of rows for each temporal window.
+        labels: The label of each temporal window.
+        figsize: The figure size in inches. The first
+            dimension is the width and the second is the height.
+
+    Returns:
+        The generated figure.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from flamme.section.count_rows import create_temporal_count_figure_from_counts
+    >>> fig = create_temporal_count_figure_from_counts(
+    ...     counts=np.array([3, 1, 1]), labels=["2020-01", "2020-02", "2020-03"]
+    ... )
+
+    ```
+    """
+    if len(labels) == 0:
+        return None
     fig, ax = plt.subplots(figsize=figsize)
     ax.bar(x=labels, height=counts, color="tab:blue")
     ax.set_ylabel("number of rows")
@@ -298,11 +372,36 @@ def create_temporal_count_table(frame: pl.DataFrame, dt_column: str, period: str
     if frame.is_empty():
         return ""
     counts, labels = compute_temporal_count(frame=frame, dt_column=dt_column, period=period)
-    rows = [
-        create_temporal_count_table_row(label=label, num_rows=num_rows)
-        for label, num_rows in zip(labels, counts)
-    ]
-    return Template(
+    return create_temporal_count_table_from_counts(counts=counts, labels=labels)
+
+
+def create_temporal_count_table_from_counts(counts: np.ndarray, labels: Sequence[str]) -> str:
+    r"""Return a HTML representation of a table with the number of rows
+    per temporal windows from the precomputed counts.
+
+    Args:
+        counts: The number of rows for each temporal window.
+        labels: The label of each temporal window.
+
+    Returns:
+        The HTML representation of the table.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from flamme.section.count_rows import create_temporal_count_table_from_counts
+    >>> table = create_temporal_count_table_from_counts(
+    ...     counts=np.array([3, 1, 1]), labels=["2020-01", "2020-02", "2020-03"]
+    ... )
+
+    ```
+    """
+    if len(labels) == 0:
+        return ""
+    rows = _render_temporal_count_table_rows(labels=labels, counts=counts)
+    return get_template(
         """<details>
     <summary>[show statistics per temporal period]</summary>
 
@@ -322,7 +421,7 @@ def create_temporal_count_table(frame: pl.DataFrame, dt_column: str, period: str
     </table>
 </details>
 """
-    ).render({"rows": "\n".join(rows), "period": period})
+    ).render({"rows": rows})
 
 
 def create_temporal_count_table_row(label: str, num_rows: int) -> str:
@@ -347,10 +446,25 @@ def create_temporal_count_table_row(label: str, num_rows: int) -> str:
 
     ```
     """
-    return Template("<tr><th>{{label}}</th><td {{num_style}}>{{num_rows}}</td></tr>").render(
-        {
-            "num_style": 'style="text-align: right;"',
-            "label": label,
-            "num_rows": f"{num_rows:,}",
-        }
+    return _render_temporal_count_table_rows(labels=[label], counts=[num_rows])
+
+
+def _render_temporal_count_table_rows(labels: Sequence[str], counts: Sequence[int]) -> str:
+    r"""Return the HTML code of the table rows with the number of rows
+    for each temporal period.
+
+    Args:
+        labels: The label of each row.
+        counts: The number of rows for each temporal period.
+
+    Returns:
+        The HTML code of the rows.
+    """
+    return render_table_rows(
+        "<tr><th>{{label}}</th><td {{num_style}}>{{num_rows}}</td></tr>",
+        columns={
+            "label": labels,
+            "num_rows": [f"{count:,}" for count in np.asarray(counts).tolist()],
+        },
+        num_style='style="text-align: right;"',
     )
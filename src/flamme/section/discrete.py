@@ -6,6 +6,7 @@ from __future__ import annotations
 __all__ = [
     "ColumnDiscreteSection",
     "create_histogram",
+    "create_histogram_figure_data",
     "create_histogram_section",
     "create_section_template",
     "create_table",
@@ -14,21 +15,23 @@ __all__ = [
 import logging
 from typing import TYPE_CHECKING
 
+import numpy as np
 from coola.utils import repr_indent, repr_mapping
-from jinja2 import Template
 from matplotlib import pyplot as plt
 
-from flamme.plot import bar_discrete
+from flamme.plot import bar_discrete, bar_figure_data, render_figure_data
 from flamme.section.base import BaseSection
 from flamme.section.most_frequent import create_frequent_values_table
 from flamme.section.utils import (
     GO_TO_TOP,
+    get_template,
     render_html_toc,
     tags2id,
     tags2title,
     valid_h_tag,
 )
-from flamme.utils.figure import MISSING_FIGURE_MESSAGE, figure2html
+from flamme.utils.count import FrequencyTable, to_frequency_table
+from flamme.utils.figure import MISSING_FIGURE_MESSAGE, figure2html, get_figure_backend
 
 if TYPE_CHECKING:
     from collections import Counter
@@ -44,8 +47,8 @@ class ColumnDiscreteSection(BaseSection):
     values.
 
     Args:
-        counter: The counter that represents the discrete
-            distribution.
+        counter: The counter or frequency table that represents the
+            discrete distribution.
         null_values: The number of null values.
         dtype: The column data type.
         column: The column name.
@@ -80,7 +83,7 @@ class ColumnDiscreteSection(BaseSection):
 
     def __init__(
         self,
-        counter: Counter,
+        counter: Counter | FrequencyTable,
         null_values: int = 0,
         dtype: pl.DataType | None = None,
         column: str = "N/A",
@@ -88,7 +91,7 @@ class ColumnDiscreteSection(BaseSection):
         yscale: str = "auto",
         figsize: tuple[float, float] | None = None,
     ) -> None:
-        self._counter = counter
+        self._counter = to_frequency_table(counter)
         self._null_values = null_values
         self._column = column
         self._max_rows = int(max_rows)
@@ -96,7 +99,7 @@ class ColumnDiscreteSection(BaseSection):
         self._figsize = figsize
         self._dtype = dtype
 
-        self._total = sum(self._counter.values())
+        self._total = self._counter.total
 
     def __repr__(self) -> str:
         args = repr_indent(
@@ -125,7 +128,9 @@ class ColumnDiscreteSection(BaseSection):
         return self._yscale
 
     def get_statistics(self) -> dict:
-        most_common = [(value, count) for value, count in self._counter.most_common() if count > 0]
+        # The values are sorted by decreasing count, so the values
+        # without occurrence are at the end.
+        most_common = self._counter.most_common(int(np.count_nonzero(self._counter.counts)))
         return {
             "most_common": most_common,
             "null_values": self._null_values,
@@ -133,13 +138,20 @@ class ColumnDiscreteSection(BaseSection):
             "total": self._total,
         }
 
+    def get_figure_data(self) -> dict[str, dict]:
+        return {
+            "histogram": create_histogram_figure_data(
+                counter=self._counter, column=self._column, yscale=self._yscale
+            )
+        }
+
     def render_html_body(self, number: str = "", tags: Sequence[str] = (), depth: int = 0) -> str:
         logger.info(f"Rendering the discrete distribution of {self._column}")
         stats = self.get_statistics()
         null_values_pct = (
             f"{100 * self._null_values / stats['total']:.2f}" if stats["total"] > 0 else "N/A"
         )
-        return Template(create_section_template()).render(
+        return get_template(create_section_template()).render(
             {
                 "go_to_top": GO_TO_TOP,
                 "id": tags2id(tags),
@@ -148,7 +160,13 @@ class ColumnDiscreteSection(BaseSection):
                 "section": number,
                 "column": self._column,
                 "total_values": f"{stats['total']:,}",
-                "unique_values": f"{stats['nunique']:,}",
+                # A sketch only keeps some values, so the number of
+                # values in the table is a lower bound.
+                "unique_values": (
+                    f"&ge;{stats['nunique']:,}"
+                    if self._counter.approximate
+                    else f"{stats['nunique']:,}"
+                ),
                 "null_values": f"{self._null_values:,}",
                 "null_values_pct": null_values_pct,
                 "figure": create_histogram_section(
@@ -209,7 +227,7 @@ This section analyzes the discrete distribution of values for column <em>{{colum
 
 
 def create_histogram_section(
-    counter: Counter,
+    counter: Counter | FrequencyTable,
     column: str = "N/A",
     yscale: str = "auto",
     figsize: tuple[float, float] | None = None,
@@ -217,8 +235,8 @@ def create_histogram_section(
     r"""Return the histogram section.
 
     Args:
-        counter: The counter that represents the discrete
-            distribution.
+        counter: The counter or frequency table that represents the
+            discrete distribution.
         column: The column name.
         yscale: The y-axis scale. If ``'auto'``, the
             ``'linear'`` or ``'log'`` scale is chosen based on the
@@ -241,19 +259,24 @@ def create_histogram_section(
 
     ```
     """
-    if sum(counter.values()) == 0:
+    table = to_frequency_table(counter)
+    if table.total == 0:
         return MISSING_FIGURE_MESSAGE
-    most_common = [
-        (value, count) for value, count in counter.most_common() if count > 0 and value is not None
-    ]
-    fig = create_histogram(
-        column=column,
-        names=[str(value) for value, _ in most_common],
-        counts=[count for _, count in most_common],
-        yscale=yscale,
-        figsize=figsize,
-    )
-    return Template(
+    if get_figure_backend() != "matplotlib":
+        figure = render_figure_data(
+            create_histogram_figure_data(table, column=column, yscale=yscale), figsize=figsize
+        )
+    else:
+        mask = (table.counts > 0) & table.values.is_not_null().to_numpy()
+        names = [str(value) for value in table.values.filter(mask).to_list()]
+        counts = table.counts[mask].tolist()
+        figure = figure2html(
+            create_histogram(
+                column=column, names=names, counts=counts, yscale=yscale, figsize=figsize
+            ),
+            close_fig=True,
+        )
+    return get_template(
         r"""<p style="margin-top: 1rem;">
 <b>Distribution of values in column {{column}}</b>
 
@@ -261,7 +284,50 @@ def create_histogram_section(
 
 {{figure}}
 """
-    ).render({"figure": figure2html(fig, close_fig=True), "column": column})
+    ).render({"figure": figure, "column": column})
+
+
+def create_histogram_figure_data(
+    counter: Counter | FrequencyTable, column: str = "N/A", yscale: str = "auto"
+) -> dict:
+    r"""Return the data to draw the histogram of discrete values
+    without matplotlib.
+
+    The null values and the values without occurrence are ignored.
+
+    Args:
+        counter: The counter or frequency table that represents the
+            discrete distribution.
+        column: The column name.
+        yscale: The y-axis scale. If ``'auto'``, the
+            ``'linear'`` or ``'log'`` scale is chosen based on the
+            distribution.
+
+    Returns:
+        The figure data. See ``flamme.plot.figure_data``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from collections import Counter
+    >>> from flamme.section.discrete import create_histogram_figure_data
+    >>> data = create_histogram_figure_data(counter=Counter({"a": 4, "b": 2, "c": 6}))
+    >>> data["labels"], data["counts"]
+    (['c', 'a', 'b'], [6.0, 4.0, 2.0])
+
+    ```
+    """
+    table = to_frequency_table(counter)
+    mask = (table.counts > 0) & table.values.is_not_null().to_numpy()
+    return bar_figure_data(
+        labels=[str(value) for value in table.values.filter(mask).to_list()],
+        counts=table.counts[mask],
+        yscale=yscale,
+        title=f"number of occurrences for each value of {column}",
+        xlabel="values",
+        ylabel="number of occurrences",
+    )
 
 
 def create_histogram(
@@ -306,21 +372,23 @@ def create_histogram(
 
 
 def create_table(
-    counter: Counter,
+    counter: Counter | FrequencyTable,
     column: str = "N/A",
     max_rows: int = 20,
 ) -> str:
     r"""Return a HTML table with the discrete distribution.
 
     Args:
-        counter: The counter that represents the discrete
-            distribution.
+        counter: The counter or frequency table that represents the
+            discrete distribution.
         column: The column name.
         max_rows: The maximum number of rows to show in the
             table.
 
     Returns:
-        The generated table.
+        The generated table. If the counts are estimated with a
+            sketch, the counts are flagged and the least common
+            values are not shown.
 
     Example usage:
 
@@ -332,10 +400,11 @@ def create_table(
 
     ```
     """
-    if sum(counter.values()) == 0:
+    table = to_frequency_table(counter)
+    if table.total == 0:
         return "<span>&#9888;</span> No table is generated because the column is empty"
 
-    return Template(
+    return get_template(
         """<details>
     <summary>[show head and tail values]</summary>
 
@@ -353,7 +422,7 @@ def create_table(
       </div>
       <div class="col">
         <p style="margin-top: 1rem;">
-        <b>Tail: {{max_values}} least common values in column <em>{{column}}</em></b>
+        <b>Tail: {{tail_values}}least common values in column <em>{{column}}</em></b>
         {{table_tail}}
       </div>
     </div>
@@ -361,9 +430,11 @@ def create_table(
 """
     ).render(
         {
-            "max_values": len(counter.most_common(max_rows)),
-            "table_head": create_frequent_values_table(counter=counter, top=max_rows),
-            "table_tail": create_frequent_values_table(counter=counter, top=max_rows, reverse=True),
+            "max_values": min(len(table), max_rows),
+            # The least common values of a sketch are not shown.
+            "tail_values": "" if table.approximate else f"{min(len(table), max_rows)} ",
+            "table_head": create_frequent_values_table(counter=table, top=max_rows),
+            "table_tail": create_frequent_values_table(counter=table, top=max_rows, reverse=True),
             "column": column,
         }
     )
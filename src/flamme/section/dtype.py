@@ -10,12 +10,13 @@ import logging
 from typing import TYPE_CHECKING
 
 from coola.utils import repr_indent, repr_mapping
-from jinja2 import Template
 
 from flamme.section.base import BaseSection
 from flamme.section.utils import (
     GO_TO_TOP,
+    get_template,
     render_html_toc,
+    render_table_rows,
     tags2id,
     tags2title,
     valid_h_tag,
@@ -82,7 +83,7 @@ class DataTypeSection(BaseSection):
         return copy.deepcopy(self._types)
 
     def render_html_body(self, number: str = "", tags: Sequence[str] = (), depth: int = 0) -> str:
-        return Template(create_section_template()).render(
+        return get_template(create_section_template()).render(
             {
                 "go_to_top": GO_TO_TOP,
                 "id": tags2id(tags),
@@ -158,10 +159,12 @@ def create_table(dtypes: dict[str, pl.DataType], types: dict[str, set]) -> str:
     ```
     """
     columns = sorted(types.keys())
-    rows = "\n".join(
-        [create_table_row(column=col, types=types[col], dtype=dtypes[col]) for col in columns]
+    rows = _render_table_rows(
+        columns=columns,
+        dtypes=[dtypes[col] for col in columns],
+        types=[types[col] for col in columns],
     )
-    return Template(
+    return get_template(
         """<table class="table table-hover table-responsive w-auto" >
     <thead class="thead table-group-divider">
         <tr>
@@ -200,11 +203,35 @@ def create_table_row(column: str, dtype: pl.DataType, types: set[type]) -> str:
 
     ```
     """
-    types = sorted([str(t).replace("<", "&lt;").replace(">", "&gt;") for t in types])
-    return Template(
+    return _render_table_rows(columns=[column], dtypes=[dtype], types=[types])
+
+
+def _render_table_rows(
+    columns: Sequence[str], dtypes: Sequence[pl.DataType], types: Sequence[set[type]]
+) -> str:
+    r"""Return the HTML code of the table rows with the data type and
+    the types of the values of each column.
+
+    Args:
+        columns: The column names.
+        dtypes: The data type of each column.
+        types: The types of the values of each column.
+
+    Returns:
+        The HTML code of the rows.
+    """
+    return render_table_rows(
         """<tr>
     <th>{{column}}</th>
     <td>{{dtype}}</td>
     <td>{{types}}</td>
-</tr>"""
-    ).render({"column": column, "dtype": dtype, "types": ", ".join(types)})
+</tr>""",
+        columns={
+            "column": columns,
+            "dtype": dtypes,
+            "types": [
+                ", ".join(sorted(str(t).replace("<", "&lt;").replace(">", "&gt;") for t in tps))
+                for tps in types
+            ],
+        },
+    )
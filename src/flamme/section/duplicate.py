@@ -6,14 +6,14 @@ from __future__ import annotations
 __all__ = ["DuplicatedRowSection", "create_duplicate_table", "create_section_template"]
 
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from coola.utils import repr_indent, repr_mapping
-from jinja2 import Template
 
 from flamme.section.base import BaseSection
 from flamme.section.utils import (
     GO_TO_TOP,
+    get_template,
     render_html_toc,
     tags2id,
     tags2title,
@@ -39,6 +39,9 @@ class DuplicatedRowSection(BaseSection):
         figsize: The figure
             size in inches. The first dimension is the width and the
             second is the height.
+        num_unique_rows: The number of unique rows if it was already
+            computed e.g. by ``DuplicatedRowAnalyzer``. ``None``
+            means it is computed from the DataFrame.
 
     Example usage:
 
@@ -74,22 +77,25 @@ class DuplicatedRowSection(BaseSection):
         frame: pl.DataFrame,
         columns: Sequence[str] | None = None,
         figsize: tuple[float, float] | None = None,
+        *,
+        num_unique_rows: int | None = None,
     ) -> None:
         self._frame = frame
         self._columns = columns if columns is None else tuple(columns)
         self._figsize = figsize
+        self._num_unique_rows = num_unique_rows
 
     def __repr__(self) -> str:
+        shape = self._get_data()["shape"] if self._frame is None else self._frame.shape
         args = repr_indent(
-            repr_mapping(
-                {"frame": self._frame.shape, "columns": self._columns, "figsize": self._figsize}
-            )
+            repr_mapping({"frame": shape, "columns": self._columns, "figsize": self._figsize})
         )
         return f"{self.__class__.__qualname__}(\n  {args}\n)"
 
     @property
-    def frame(self) -> pl.DataFrame:
-        r"""The DataFrame to analyze."""
+    def frame(self) -> pl.DataFrame | None:
+        r"""The DataFrame to analyze or ``None`` if the section was
+        materialized."""
         return self._frame
 
     @property
@@ -107,14 +113,20 @@ class DuplicatedRowSection(BaseSection):
         return self._figsize
 
     def get_statistics(self) -> dict:
-        frame_no_duplicate = self._frame.unique(subset=self._columns)
-        return {"num_rows": self._frame.shape[0], "num_unique_rows": frame_no_duplicate.shape[0]}
+        data = self._get_data()
+        return {"num_rows": data["num_rows"], "num_unique_rows": data["num_unique_rows"]}
+
+    def materialize(self) -> None:
+        if self._frame is None:
+            return
+        self._get_data()
+        self._frame = None
 
     def render_html_body(self, number: str = "", tags: Sequence[str] = (), depth: int = 0) -> str:
         logger.info(f"Rendering the duplicated rows section using the columns: {self._columns}")
         stats = self.get_statistics()
-        columns = self._frame.columns if self._columns is None else self._columns
-        return Template(create_section_template()).render(
+        columns = self._get_data()["columns"]
+        return get_template(create_section_template()).render(
             {
                 "go_to_top": GO_TO_TOP,
                 "id": tags2id(tags),
@@ -134,6 +146,22 @@ class DuplicatedRowSection(BaseSection):
     ) -> str:
         return render_html_toc(number=number, tags=tags, depth=depth, max_depth=max_depth)
 
+    def _get_data(self) -> dict[str, Any]:
+        r"""Return the data required to render the section."""
+        return self._memoize(
+            "data",
+            lambda: {
+                "shape": self._frame.shape,
+                "columns": tuple(self._frame.columns) if self._columns is None else self._columns,
+                "num_rows": self._frame.shape[0],
+                "num_unique_rows": (
+                    self._frame.unique(subset=self._columns).shape[0]
+                    if self._num_unique_rows is None
+                    else self._num_unique_rows
+                ),
+            },
+        )
+
 
 def create_section_template() -> str:
     r"""Return the template of the section.
@@ -187,7 +215,7 @@ def create_duplicate_table(num_rows: int, num_unique_rows: int) -> str:
     num_duplicated_rows = num_rows - num_unique_rows
     pct_unique_rows = num_unique_rows / num_rows if num_rows else float("nan")
     pct_duplicated_rows = 1.0 - pct_unique_rows
-    return Template(
+    return get_template(
         """
 <table class="table table-hover table-responsive w-auto" >
 <thead class="thead table-group-divider">
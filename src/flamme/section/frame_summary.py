@@ -11,20 +11,20 @@ __all__ = [
 ]
 
 import logging
-from collections import Counter
 from typing import TYPE_CHECKING, Any
 
-from jinja2 import Template
 
 from flamme.section.base import BaseSection
 from flamme.section.utils import (
     GO_TO_TOP,
+    get_template,
     render_html_toc,
+    render_table_rows,
     tags2id,
     tags2title,
     valid_h_tag,
 )
-from flamme.utils.count import compute_nunique
+from flamme.utils.count import FrequencyTable, compute_nunique
 from flamme.utils.null import compute_null_count
 
 if TYPE_CHECKING:
@@ -41,6 +41,24 @@ class DataFrameSummarySection(BaseSection):
     Args:
         frame: The DataFrame to analyze.
         top: The number of most frequent values to show.
+        approximate: If ``True``, the number of unique values is
+            estimated with a ``HyperLogLog`` sketch, and the estimated
+            values are flagged in the report.
+        null_count: The number of null values in each column if they
+            were already computed e.g. by ``DataFrameSummaryAnalyzer``.
+            ``None`` means they are computed from the DataFrame.
+        nunique: The number of unique values in each column if they
+            were already computed. ``None`` means they are computed
+            from the DataFrame.
+        num_rows: The number of rows if it was already computed.
+            ``None`` means it is the number of rows of the DataFrame.
+            With ``null_count``, ``nunique`` and
+            ``most_frequent_values``, it allows to create the section
+            from an empty DataFrame with the schema of the data e.g.
+            when the data are analyzed by batches.
+        most_frequent_values: The ``top`` most frequent values of each
+            column if they were already computed. ``None`` means they
+            are computed from the DataFrame.
 
     Example usage:
 
@@ -59,7 +77,7 @@ class DataFrameSummarySection(BaseSection):
     ...     )
     ... )
     >>> section
-    DataFrameSummarySection(top=5)
+    DataFrameSummarySection(top=5, approximate=False)
     >>> section.get_statistics()
     {'columns': ('col1', 'col2', 'col3'), 'null_count': (0, 0, 0), 'nunique': (3, 1, 2),
      'dtypes': (Float64, Int64, Int64)}
@@ -67,39 +85,80 @@ class DataFrameSummarySection(BaseSection):
     ```
     """
 
-    def __init__(self, frame: pl.DataFrame, top: int = 5) -> None:
+    def __init__(
+        self,
+        frame: pl.DataFrame,
+        top: int = 5,
+        approximate: bool = False,
+        *,
+        null_count: Sequence[int] | None = None,
+        nunique: Sequence[int] | None = None,
+        num_rows: int | None = None,
+        most_frequent_values: Sequence[Sequence[tuple[Any, int]]] | None = None,
+    ) -> None:
         self._frame = frame
         if top < 0:
             msg = f"Incorrect top value ({top}). top must be positive"
             raise ValueError(msg)
         self._top = top
+        self._approximate = bool(approximate)
+        if null_count is not None:
+            self._memoize("null_count", lambda: tuple(null_count))
+        if nunique is not None:
+            self._memoize("nunique", lambda: tuple(nunique))
+        if num_rows is not None:
+            self._memoize("shape", lambda: (num_rows, frame.shape[1]))
+        if most_frequent_values is not None:
+            self._memoize(
+                ("most_frequent_values", top),
+                lambda: tuple(tuple(values) for values in most_frequent_values),
+            )
 
     def __repr__(self) -> str:
-        return f"{self.__class__.__qualname__}(top={self._top})"
+        return f"{self.__class__.__qualname__}(top={self._top}, approximate={self._approximate})"
 
     @property
-    def frame(self) -> pl.DataFrame:
-        r"""The DataFrame to analyze."""
+    def frame(self) -> pl.DataFrame | None:
+        r"""The DataFrame to analyze or ``None`` if the section was
+        materialized."""
         return self._frame
 
     @property
     def top(self) -> int:
         return self._top
 
+    @property
+    def approximate(self) -> bool:
+        r"""Indicate if the number of unique values is estimated."""
+        return self._approximate
+
     def get_columns(self) -> tuple[str, ...]:
-        return tuple(self._frame.columns)
+        return self._memoize("columns", lambda: tuple(self._frame.columns))
 
     def get_null_count(self) -> tuple[int, ...]:
-        return tuple(compute_null_count(self._frame).tolist())
+        return self._memoize("null_count", lambda: tuple(compute_null_count(self._frame).tolist()))
 
     def get_nunique(self) -> tuple[int, ...]:
-        return tuple(compute_nunique(self._frame).tolist())
+        return self._memoize(
+            "nunique",
+            lambda: tuple(compute_nunique(self._frame, approximate=self._approximate).tolist()),
+        )
 
     def get_dtypes(self) -> tuple[pl.DataType, ...]:
-        return tuple(self._frame.schema.dtypes())
+        return self._memoize("dtypes", lambda: tuple(self._frame.schema.dtypes()))
 
     def get_most_frequent_values(self, top: int = 5) -> tuple[tuple[tuple[Any, int], ...], ...]:
-        return tuple(tuple(Counter(series.to_list()).most_common(top)) for series in self.frame)
+        if self._frame is None:
+            # Only the most frequent values shown in the section are
+            # kept after the materialization.
+            values = self._memoize(("most_frequent_values", self._top), tuple)
+            return tuple(value[:top] for value in values)
+        return self._memoize(
+            ("most_frequent_values", top),
+            lambda: tuple(
+                tuple(FrequencyTable.from_series(series).most_common(top)) for series in self._frame
+            ),
+        )
 
     def get_statistics(self) -> dict:
         return {
@@ -109,9 +168,17 @@ class DataFrameSummarySection(BaseSection):
             "dtypes": self.get_dtypes(),
         }
 
+    def materialize(self) -> None:
+        if self._frame is None:
+            return
+        self.get_statistics()
+        self.get_most_frequent_values(top=self._top)
+        self._get_shape()
+        self._frame = None
+
     def render_html_body(self, number: str = "", tags: Sequence[str] = (), depth: int = 0) -> str:
         logger.info("Rendering the DataFrame summary section...")
-        return Template(create_section_template()).render(
+        return get_template(create_section_template()).render(
             {
                 "go_to_top": GO_TO_TOP,
                 "id": tags2id(tags),
@@ -119,8 +186,13 @@ class DataFrameSummarySection(BaseSection):
                 "title": tags2title(tags),
                 "section": number,
                 "table": self._create_table(),
-                "nrows": f"{self._frame.shape[0]:,}",
-                "ncols": f"{self._frame.shape[1]:,}",
+                "nrows": f"{self._get_shape()[0]:,}",
+                "ncols": f"{self._get_shape()[1]:,}",
+                "unique_note": (
+                    " (estimated with HyperLogLog, the values are prefixed with ~)"
+                    if self._approximate
+                    else ""
+                ),
             }
         )
 
@@ -136,9 +208,13 @@ class DataFrameSummarySection(BaseSection):
             nunique=self.get_nunique(),
             dtypes=self.get_dtypes(),
             most_frequent_values=self.get_most_frequent_values(top=self._top),
-            total=self._frame.shape[0],
+            total=self._get_shape()[0],
+            approximate=self._approximate,
         )
 
+    def _get_shape(self) -> tuple[int, int]:
+        return self._memoize("shape", lambda: self._frame.shape)
+
 
 def create_section_template() -> str:
     r"""Return the template of the section.
@@ -167,7 +243,7 @@ This section shows a short summary of each column.
   <li> <b>column</b>: are the column names</li>
   <li> <b>types</b>: are the real object types for the objects in the column </li>
   <li> <b>null</b>: are the number (and percentage) of null values in the column </li>
-  <li> <b>unique</b>: are the number (and percentage) of unique values in the column </li>
+  <li> <b>unique</b>: are the number (and percentage) of unique values in the column{{unique_note}} </li>
 </ul>
 
 <p style="margin-top: 1rem;">
@@ -189,8 +265,10 @@ def create_table(
     null_count: Sequence[int],
     nunique: Sequence[int],
     dtypes: Sequence[pl.DataType],
-    most_frequent_values: Sequence[Sequence[tuple[Any, int]]],
+    most_frequent_values: Sequence[Sequence[tuple[Any, int]] | FrequencyTable],
     total: int,
+    *,
+    approximate: bool = False,
 ) -> str:
     r"""Return a HTML representation of a table with the temporal
     distribution of null values.
@@ -201,7 +279,11 @@ def create_table(
         nunique: The number of unique values for each column.
         dtypes: The data type for each column.
         most_frequent_values: The most frequent values for each column.
+            The most frequent values of a column can be represented
+            by a frequency table.
         total: The total number of rows.
+        approximate: If ``True``, the numbers of unique values are
+            flagged as estimated values.
 
     Returns:
         The HTML representation of the table.
@@ -227,26 +309,16 @@ def create_table(
 
     ```
     """
-    rows = []
-    for (
-        column,
-        null,
-        nuniq,
-        dtype,
-        mf_values,
-    ) in zip(columns, null_count, nunique, dtypes, most_frequent_values):
-        rows.append(
-            create_table_row(
-                column=column,
-                null=null,
-                dtype=dtype,
-                nunique=nuniq,
-                most_frequent_values=mf_values,
-                total=total,
-            )
-        )
-    rows = "\n".join(rows)
-    return Template(
+    rows = _render_table_rows(
+        columns=columns,
+        nulls=null_count,
+        nuniques=nunique,
+        dtypes=dtypes,
+        most_frequent_values=most_frequent_values,
+        total=total,
+        approximate=approximate,
+    )
+    return get_template(
         """<table class="table table-hover table-responsive w-auto" >
     <thead class="thead table-group-divider">
         <tr>
@@ -271,8 +343,10 @@ def create_table_row(
     null: int,
     nunique: int,
     dtype: pl.DataType,
-    most_frequent_values: Sequence[tuple[Any, int]],
+    most_frequent_values: Sequence[tuple[Any, int]] | FrequencyTable,
     total: int,
+    *,
+    approximate: bool = False,
 ) -> str:
     r"""Create the HTML code of a new table row.
 
@@ -281,8 +355,11 @@ def create_table_row(
         null: The number of null values.
         nunique: The number of unique values.
         dtype: The data type of the column.
-        most_frequent_values: The most frequent values.
+        most_frequent_values: The most frequent values or a frequency
+            table with the most frequent values.
         total: The total number of rows.
+        approximate: If ``True``, the number of unique values is
+            flagged as an estimated value.
 
     Returns:
         The HTML code of a row.
@@ -304,26 +381,69 @@ def create_table_row(
 
     ```
     """
-    null = f"{null:,} ({100 * null / total if total else float('nan'):.2f}%)"
-    nunique = f"{nunique:,} ({100 * nunique / total if total else float('nan'):.2f}%)"
-    most_frequent_values = ", ".join(
-        [f"{val} ({100 * c / total:.2f}%)" for val, c in most_frequent_values]
+    return _render_table_rows(
+        columns=[column],
+        nulls=[null],
+        nuniques=[nunique],
+        dtypes=[dtype],
+        most_frequent_values=[most_frequent_values],
+        total=total,
+        approximate=approximate,
     )
-    return Template(
+
+
+def _render_table_rows(
+    columns: Sequence[str],
+    nulls: Sequence[int],
+    nuniques: Sequence[int],
+    dtypes: Sequence[pl.DataType],
+    most_frequent_values: Sequence[Sequence[tuple[Any, int]] | FrequencyTable],
+    *,
+    total: int,
+    approximate: bool = False,
+) -> str:
+    r"""Return the HTML code of the table rows with the summary of each
+    column.
+
+    Args:
+        columns: The column names.
+        nulls: The number of null values of each column.
+        nuniques: The number of unique values of each column.
+        dtypes: The data type of each column.
+        most_frequent_values: The most frequent values or a frequency
+            table with the most frequent values of each column.
+        total: The total number of rows.
+        approximate: If ``True``, the number of unique values is
+            flagged as an estimated value.
+
+    Returns:
+        The HTML code of the rows.
+    """
+    mf_values = []
+    for values in most_frequent_values:
+        if isinstance(values, FrequencyTable):
+            values = values.most_common()  # noqa: PLW2901
+        mf_values.append(", ".join([f"{val} ({100 * c / total:.2f}%)" for val, c in values]))
+    prefix = "~" if approximate else ""
+    return render_table_rows(
         """<tr>
     <th>{{column}}</th>
     <td>{{dtype}}</td>
     <td {{num_style}}>{{null}}</td>
     <td {{num_style}}>{{nunique}}</td>
     <td>{{most_frequent_values}}</td>
-</tr>"""
-    ).render(
-        {
-            "num_style": 'style="text-align: right;"',
-            "column": column,
-            "null": null,
-            "dtype": dtype,
-            "nunique": nunique,
-            "most_frequent_values": most_frequent_values,
-        }
+</tr>""",
+        columns={
+            "column": columns,
+            "dtype": dtypes,
+            "null": [
+                f"{null:,} ({100 * null / total if total else float('nan'):.2f}%)" for null in nulls
+            ],
+            "nunique": [
+                f"{prefix}{nunique:,} ({100 * nunique / total if total else float('nan'):.2f}%)"
+                for nunique in nuniques
+            ],
+            "most_frequent_values": mf_values,
+        },
+        num_style='style="text-align: right;"',
     )
@@ -5,7 +5,7 @@ from __future__ import annotations
 
 __all__ = ["SectionDict"]
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from coola.utils import repr_indent, repr_mapping, str_indent
 
@@ -17,9 +17,18 @@ from flamme.section.utils import (
     tags2title,
     valid_h_tag,
 )
+from flamme.utils.executor import is_parallel_worker, parallel_map
+from flamme.utils.figure import (
+    get_figure_backend,
+    get_figure_sink,
+    use_figure_backend,
+    use_figure_sink,
+)
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterator, Sequence
+
+    from flamme.utils.figure_sink import BaseFigureSink
 
 
 class SectionDict(BaseSection):
@@ -30,6 +39,20 @@ class SectionDict(BaseSection):
         max_toc_depth: The maximum level to show in the
             table of content. Set this value to ``0`` to not show
             the table of content at the beginning of the section.
+        executor: The executor used to render the sections. If
+            ``None``, the sections are rendered sequentially. If
+            ``'process'``, the sections are rendered in a process
+            pool. The sections are sent only once to each worker
+            process, and the objects shared by several sections
+            (e.g. the DataFrame) are serialized only once.
+            The generated HTML is identical to the sequential
+            rendering. The sections of nested ``SectionDict`` are
+            rendered sequentially inside the workers. The workers
+            use the active figure backend and figure sink.
+            ``iter_html_body`` yields the subsections rendered by the
+            process pool once they are all rendered.
+        max_workers: The maximum number of processes. If ``None``,
+            it is the number of CPUs.
 
     Example usage:
 
@@ -60,7 +83,7 @@ class SectionDict(BaseSection):
     >>> section
     SectionDict(
       (content): ContentSection()
-      (rows): TemporalRowCountSection(dt_column=datetime, period=1mo, figsize=None)
+      (rows): TemporalRowCountSection(dt_column=datetime, period=1mo, figsize=None, base_period=None)
     )
     >>> section.get_statistics()
     {'content': {}, 'rows': {}}
@@ -68,9 +91,20 @@ class SectionDict(BaseSection):
     ```
     """
 
-    def __init__(self, sections: dict[str, BaseSection], max_toc_depth: int = 0) -> None:
+    def __init__(
+        self,
+        sections: dict[str, BaseSection],
+        max_toc_depth: int = 0,
+        executor: str | None = None,
+        max_workers: int | None = None,
+    ) -> None:
         self._sections = sections
         self._max_toc_depth = max_toc_depth
+        if executor not in {None, "process"}:
+            msg = f"Incorrect executor: {executor}. The valid values are: None and 'process'"
+            raise ValueError(msg)
+        self._executor = executor
+        self._max_workers = max_workers
 
     def __repr__(self) -> str:
         args = repr_indent(repr_mapping(self._sections))
@@ -87,7 +121,42 @@ class SectionDict(BaseSection):
     def get_statistics(self) -> dict:
         return {name: section.get_statistics() for name, section in self._sections.items()}
 
+    def get_figure_data(self) -> dict[str, dict]:
+        return {
+            f"{name}/{key}": data
+            for name, section in self._sections.items()
+            for key, data in section.get_figure_data().items()
+        }
+
+    def materialize(self) -> None:
+        for section in self._sections.values():
+            section.materialize()
+
     def render_html_body(self, number: str = "", tags: Sequence[str] = (), depth: int = 0) -> str:
+        report = self._render_html_body_header(number=number, tags=tags, depth=depth)
+        report.extend(self._render_html_body_subsections(number=number, tags=tags, depth=depth))
+        return "\n".join(report)
+
+    def iter_html_body(
+        self, number: str = "", tags: Sequence[str] = (), depth: int = 0
+    ) -> Iterator[str]:
+        report = self._render_html_body_header(number=number, tags=tags, depth=depth)
+        if not report and not self._sections:
+            # Same output as ``render_html_body`` for an empty section.
+            yield ""
+        yield from report
+        if self._executor is not None and len(self._sections) > 1 and not is_parallel_worker():
+            # The subsections are rendered together by the process pool.
+            yield from self._render_html_body_subsections(number=number, tags=tags, depth=depth)
+            return
+        for i, (name, section) in enumerate(self._sections.items()):
+            yield from section.iter_html_body(
+                number=f"{number}{i + 1}.", tags=[*list(tags), name], depth=depth + 1
+            )
+
+    def _render_html_body_header(
+        self, number: str = "", tags: Sequence[str] = (), depth: int = 0
+    ) -> list[str]:
         report = []
         if tags:
             report.append(
@@ -102,14 +171,29 @@ class SectionDict(BaseSection):
                     number=number, tags=tags, depth=0, max_depth=self._max_toc_depth
                 )
             )
+        return report
 
-        for i, (name, section) in enumerate(self._sections.items()):
-            report.append(
-                section.render_html_body(
-                    number=f"{number}{i + 1}.", tags=[*list(tags), name], depth=depth + 1
-                )
-            )
-        return "\n".join(report)
+    def _render_html_body_subsections(
+        self, number: str = "", tags: Sequence[str] = (), depth: int = 0
+    ) -> list[str]:
+        items = [
+            (i, f"{number}{i + 1}.", [*list(tags), name], depth + 1)
+            for i, name in enumerate(self._sections)
+        ]
+        sections = list(self._sections.values())
+        if self._executor is None or len(items) < 2 or is_parallel_worker():
+            return [
+                sections[i].render_html_body(number=num, tags=tgs, depth=dpt)
+                for i, num, tgs, dpt in items
+            ]
+        return parallel_map(
+            _render_worker_section,
+            items,
+            executor=self._executor,
+            max_workers=self._max_workers,
+            initializer=_set_worker_sections,
+            initargs=(sections, get_figure_backend(), get_figure_sink().for_worker()),
+        )
 
     def render_html_toc(
         self, number: str = "", tags: Sequence[str] = (), depth: int = 0, max_depth: int = 1
@@ -141,3 +225,33 @@ class SectionDict(BaseSection):
             subtoc.insert(0, "<ul>")
             subtoc.append("</ul>")
         return "\n".join(subtoc)
+
+
+# The sections rendered by the current worker process. They are sent
+# once by the process pool initializer, so each task only contains
+# the index of the section to render. The figure backend and the figure
+# sink of the parent process are also sent because the worker processes
+# are spawned, so they do not inherit its state.
+_worker_state: dict[str, Any] = {"sections": [], "backend": "matplotlib", "sink": None}
+
+
+def _set_worker_sections(sections: list[BaseSection], backend: str, sink: BaseFigureSink) -> None:
+    r"""Set the sections rendered by the current worker process, and the
+    figure backend and figure sink used to render them."""
+    _worker_state.update(sections=sections, backend=backend, sink=sink)
+
+
+def _render_worker_section(item: tuple[int, str, list[str], int]) -> str:
+    r"""Render the HTML body of a section in a worker process.
+
+    The figure images are written before the HTML body is returned,
+    so the HTML never references an image that does not exist.
+    """
+    index, number, tags, depth = item
+    sink = _worker_state["sink"]
+    with use_figure_backend(_worker_state["backend"]), use_figure_sink(sink):
+        body = _worker_state["sections"][index].render_html_body(
+            number=number, tags=tags, depth=depth
+        )
+    sink.flush()
+    return body
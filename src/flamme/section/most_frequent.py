@@ -13,17 +13,20 @@ __all__ = [
 import logging
 from typing import TYPE_CHECKING
 
+import numpy as np
 from coola.utils import repr_indent, repr_mapping
-from jinja2 import Template
 
 from flamme.section.base import BaseSection
 from flamme.section.utils import (
     GO_TO_TOP,
+    get_template,
     render_html_toc,
+    render_table_rows,
     tags2id,
     tags2title,
     valid_h_tag,
 )
+from flamme.utils.count import FrequencyTable, to_frequency_table
 
 if TYPE_CHECKING:
     from collections import Counter
@@ -37,8 +40,8 @@ class MostFrequentValuesSection(BaseSection):
     given columns.
 
     Args:
-        counter: The counter with the number of occurrences
-            for all values.
+        counter: The counter or frequency table with the number of
+            occurrences for all values.
         column: The column name.
         top: The maximum number of values to show.
 
@@ -53,7 +56,7 @@ class MostFrequentValuesSection(BaseSection):
     ... )
     >>> section
     MostFrequentValuesSection(
-      (counter): Counter({'c': 6, 'a': 4, 'b': 2})
+      (counter): FrequencyTable(num_values=3, total=12, null_count=0, other_count=0)
       (column): col
       (top): 100
       (total): 12
@@ -64,12 +67,12 @@ class MostFrequentValuesSection(BaseSection):
     ```
     """
 
-    def __init__(self, counter: Counter, column: str, top: int = 100) -> None:
-        self._counter = counter
+    def __init__(self, counter: Counter | FrequencyTable, column: str, top: int = 100) -> None:
+        self._counter = to_frequency_table(counter)
         self._column = column
         self._top = top
 
-        self._total = sum(self._counter.values())
+        self._total = self._counter.total
 
     def __repr__(self) -> str:
         args = repr_indent(
@@ -89,7 +92,7 @@ class MostFrequentValuesSection(BaseSection):
 
     def render_html_body(self, number: str = "", tags: Sequence[str] = (), depth: int = 0) -> str:
         logger.info("Rendering the most frequent values section...")
-        return Template(create_section_template()).render(
+        return get_template(create_section_template()).render(
             {
                 "go_to_top": GO_TO_TOP,
                 "id": tags2id(tags),
@@ -142,20 +145,27 @@ This section analyzes the {{top}} most frequent values in <em>{{column}}</em>.
 """
 
 
-def create_frequent_values_table(counter: Counter, top: int = 100, reverse: bool = False) -> str:
+def create_frequent_values_table(
+    counter: Counter | FrequencyTable, top: int = 100, reverse: bool = False
+) -> str:
     r"""Return a HTML representation of a table with the most (or least)
     frequent values.
 
     Args:
-        counter: The counter with the number of occurrences
-            for all values.
+        counter: The counter or frequency table with the number of
+            occurrences for all values.
         top: The maximum number of values to show.
         reverse: If ``True``, it returns a table with the least
             frequent values (a.k.a. tail), otherwise it returns a
             table with the most frequent values (a.k.a. head).
 
     Returns:
-        The HTML representation of the table.
+        The HTML representation of the table. If the counts are
+            estimated (see ``FrequencyTable.max_error``), the counts
+            are prefixed with ~ and their maximum overestimation is
+            shown above the table. The least frequent values of a
+            sketch are not the least frequent values of the data, so
+            they are not shown.
 
     Example usage:
 
@@ -167,15 +177,28 @@ def create_frequent_values_table(counter: Counter, top: int = 100, reverse: bool
 
     ```
     """
-    total = sum(counter.values())
-    most_common = counter.most_common()[-top:][::-1] if reverse else counter.most_common(top)
-    rows = []
-    cumcount = 0
-    for value, count in most_common:
-        cumcount += count
-        rows.append(create_table_row(value=value, count=count, total=total, cumcount=cumcount))
-    return Template(
-        """<table class="table table-hover table-responsive w-auto" >
+    table = to_frequency_table(counter)
+    if reverse and table.approximate:
+        return (
+            "<span>&#9888;</span> The least common values are not shown because the counts "
+            "are estimated with a sketch that only keeps the most common values"
+        )
+    total, max_error = table.total, table.max_error
+    table = table.tail(top) if reverse else table.head(top)
+    values, counts = table.values.to_list(), table.counts.tolist()
+    if reverse:
+        values, counts = values[::-1], counts[::-1]
+    rows = _render_table_rows(
+        values=values,
+        counts=counts,
+        total=total,
+        cumcounts=np.cumsum(counts).tolist(),
+        approximate=max_error > 0,
+    )
+    return get_template(
+        """{% if max_error %}<p><span>&#9888;</span> The counts are estimated with a sketch and
+can be overestimated by up to {{max_error}} occurrences.</p>
+{% endif %}<table class="table table-hover table-responsive w-auto" >
     <thead class="thead table-group-divider">
         <tr>
             <th>value</th>
@@ -190,7 +213,7 @@ def create_frequent_values_table(counter: Counter, top: int = 100, reverse: bool
     </tbody>
 </table>
 """
-    ).render({"rows": "\n".join(rows)})
+    ).render({"rows": rows, "max_error": f"{max_error:,}" if max_error else ""})
 
 
 def create_table_row(value: str, count: int, total: int, cumcount: int) -> str:
@@ -214,21 +237,51 @@ def create_table_row(value: str, count: int, total: int, cumcount: int) -> str:
 
     ```
     """
-    pct = 100 * count / total if total > 0 else float("nan")
-    cum_percentage = 100 * cumcount / total if total > 0 else float("nan")
-    return Template(
+    return _render_table_rows(values=[value], counts=[count], total=total, cumcounts=[cumcount])
+
+
+def _render_table_rows(
+    values: Sequence[str],
+    counts: Sequence[int],
+    total: int,
+    cumcounts: Sequence[int],
+    *,
+    approximate: bool = False,
+) -> str:
+    r"""Return the HTML code of the table rows with the number of
+    occurrences of each value.
+
+    Args:
+        values: The string representation of each value.
+        counts: The number of occurrences of each value.
+        total: The total number of occurrences.
+        cumcounts: The cumulative number of occurrences of each
+            value.
+        approximate: If ``True``, the counts and percentages are
+            flagged as estimated values.
+
+    Returns:
+        The HTML code of the rows.
+    """
+    prefix = "~" if approximate else ""
+    return render_table_rows(
         """<tr>
     <th>{{value}}</th>
     <td {{num_style}}>{{count}}</td>
     <td {{num_style}}>{{percentage}}</td>
     <td {{num_style}}>{{cum_percentage}}</td>
-</tr>"""
-    ).render(
-        {
-            "num_style": 'style="text-align: right;"',
-            "value": value,
-            "count": f"{count:,}",
-            "percentage": f"{pct:.2f}",
-            "cum_percentage": f"{cum_percentage:.2f}",
-        }
+</tr>""",
+        columns={
+            "value": values,
+            "count": [f"{prefix}{count:,}" for count in counts],
+            "percentage": [
+                f"{prefix}{100 * count / total if total > 0 else float('nan'):.2f}"
+                for count in counts
+            ],
+            "cum_percentage": [
+                f"{prefix}{100 * cumcount / total if total > 0 else float('nan'):.2f}"
+                for cumcount in cumcounts
+            ],
+        },
+        num_style='style="text-align: right;"',
     )
@@ -16,14 +16,15 @@ from typing import TYPE_CHECKING
 
 import polars as pl
 from coola.utils import repr_indent, repr_mapping
-from jinja2 import Template
 from matplotlib import pyplot as plt
 
 from flamme.plot.utils import readable_xticklabels
 from flamme.section.base import BaseSection
 from flamme.section.utils import (
     GO_TO_TOP,
+    get_template,
     render_html_toc,
+    render_table_rows,
     tags2id,
     tags2title,
     valid_h_tag,
@@ -144,7 +145,7 @@ class NullValueSection(BaseSection):
     def render_html_body(self, number: str = "", tags: Sequence[str] = (), depth: int = 0) -> str:
         logger.info("Rendering the null value distribution of all columns...")
         frame = self._get_dataframe()
-        return Template(create_section_template()).render(
+        return get_template(create_section_template()).render(
             {
                 "go_to_top": GO_TO_TOP,
                 "id": tags2id(tags),
@@ -309,15 +310,12 @@ def create_table(frame: pl.DataFrame) -> str:
 
     ```
     """
-    rows = [
-        create_table_row(column=column, null_count=null, total_count=total)
-        for column, null, total in zip(
-            frame["column"],
-            frame["null"],
-            frame["total"],
-        )
-    ]
-    return Template(
+    rows = _render_table_rows(
+        columns=frame["column"].to_list(),
+        null_counts=frame["null"].to_list(),
+        total_counts=frame["total"].to_list(),
+    )
+    return get_template(
         """<table class="table table-hover table-responsive w-auto" >
     <thead class="thead table-group-divider">
         <tr>
@@ -333,7 +331,7 @@ def create_table(frame: pl.DataFrame) -> str:
     </tbody>
 </table>
 """
-    ).render({"rows": "\n".join(rows)})
+    ).render({"rows": rows})
 
 
 def create_table_row(column: str, null_count: int, total_count: int) -> str:
@@ -356,23 +354,45 @@ def create_table_row(column: str, null_count: int, total_count: int) -> str:
 
     ```
     """
-    pct = null_count / total_count if total_count > 0 else float("nan")
-    pct_color = pct if total_count > 0 else 0
-    return Template(
+    return _render_table_rows(
+        columns=[column], null_counts=[null_count], total_counts=[total_count]
+    )
+
+
+def _render_table_rows(
+    columns: Sequence[str], null_counts: Sequence[int], total_counts: Sequence[int]
+) -> str:
+    r"""Return the HTML code of the table rows with the number of null
+    values of each column.
+
+    Args:
+        columns: The column names.
+        null_counts: The number of null values of each column.
+        total_counts: The total number of rows of each column.
+
+    Returns:
+        The HTML code of the rows.
+    """
+    pcts = [
+        null / total if total > 0 else float("nan")
+        for null, total in zip(null_counts, total_counts)
+    ]
+    pct_colors = [pct if total > 0 else 0 for pct, total in zip(pcts, total_counts)]
+    return render_table_rows(
         """<tr>
     <th style="background-color: rgba(0, 191, 255, {{null_pct}})">{{column}}</th>
     <td {{num_style}}>{{null_pct}}</td>
     <td {{num_style}}>{{null_count}}</td>
     <td {{num_style}}>{{total_count}}</td>
-</tr>"""
-    ).render(
-        {
-            "num_style": (
+</tr>""",
+        columns={
+            "column": columns,
+            "num_style": [
                 f'style="text-align: right; background-color: rgba(0, 191, 255, {pct_color})"'
-            ),
-            "column": column,
-            "null_count": f"{null_count:,}",
-            "null_pct": f"{pct:.4f}",
-            "total_count": f"{total_count:,}",
-        }
+                for pct_color in pct_colors
+            ],
+            "null_pct": [f"{pct:.4f}" for pct in pcts],
+            "null_count": [f"{null:,}" for null in null_counts],
+            "total_count": [f"{total:,}" for total in total_counts],
+        },
     )
@@ -7,28 +7,32 @@ __all__ = [
     "TemporalNullValueSection",
     "create_section_template",
     "create_temporal_null_figure",
+    "create_temporal_null_figure_from_counts",
     "create_temporal_null_table",
+    "create_temporal_null_table_from_counts",
     "create_temporal_null_table_row",
 ]
 
 import logging
 from typing import TYPE_CHECKING
 
+import numpy as np
 from coola.utils import repr_indent, repr_mapping
-from jinja2 import Template
 from matplotlib import pyplot as plt
 
-from flamme.plot import plot_null_temporal
+from flamme.plot import null_temporal_figure_data, plot_null_temporal, render_figure_data
 from flamme.plot.utils import readable_xticklabels
 from flamme.section.base import BaseSection
 from flamme.section.utils import (
     GO_TO_TOP,
+    get_template,
     render_html_toc,
+    render_table_rows,
     tags2id,
     tags2title,
     valid_h_tag,
 )
-from flamme.utils.figure import figure2html
+from flamme.utils.figure import figure2html, get_figure_backend
 from flamme.utils.null import compute_temporal_null_count
 
 if TYPE_CHECKING:
@@ -51,6 +55,11 @@ class TemporalNullValueSection(BaseSection):
         period: The temporal period e.g. monthly or daily.
         figsize: The figure size in inches. The first
             dimension is the width and the second is the height.
+        base_period: If not ``None``, the statistics are computed
+            from the temporal cube with this base period, which is
+            shared by all the sections with the same DataFrame,
+            datetime column and base period. The windows of
+            ``period`` must be unions of windows of ``base_period``.
 
     Example usage:
 
@@ -87,6 +96,7 @@ class TemporalNullValueSection(BaseSection):
       (dt_column): datetime
       (period): 1mo
       (figsize): None
+      (base_period): None
     )
     >>> section.get_statistics()
     {}
@@ -101,6 +111,8 @@ class TemporalNullValueSection(BaseSection):
         dt_column: str,
         period: str,
         figsize: tuple[float, float] | None = None,
+        *,
+        base_period: str | None = None,
     ) -> None:
         if dt_column not in frame:
             msg = (
@@ -114,6 +126,7 @@ class TemporalNullValueSection(BaseSection):
         self._dt_column = dt_column
         self._period = period
         self._figsize = figsize
+        self._base_period = base_period
 
     def __repr__(self) -> str:
         args = repr_indent(
@@ -123,14 +136,16 @@ class TemporalNullValueSection(BaseSection):
                     "dt_column": self._dt_column,
                     "period": self._period,
                     "figsize": self._figsize,
+                    "base_period": self._base_period,
                 }
             )
         )
         return f"{self.__class__.__qualname__}(\n  {args}\n)"
 
     @property
-    def frame(self) -> pl.DataFrame:
-        r"""The DataFrame to analyze."""
+    def frame(self) -> pl.DataFrame | None:
+        r"""The DataFrame to analyze or ``None`` if the section was
+        materialized."""
         return self._frame
 
     @property
@@ -156,15 +171,34 @@ class TemporalNullValueSection(BaseSection):
         """
         return self._figsize
 
+    @property
+    def base_period(self) -> str | None:
+        r"""The base period of the temporal cube or ``None`` if the
+        statistics are computed from the rows."""
+        return self._base_period
+
     def get_statistics(self) -> dict:
         return {}
 
+    def get_figure_data(self) -> dict[str, dict]:
+        nulls, totals, labels = self._get_temporal_null_count()
+        return {
+            "temporal_null": null_temporal_figure_data(nulls=nulls, totals=totals, labels=labels)
+        }
+
+    def materialize(self) -> None:
+        if self._frame is None:
+            return
+        self._get_temporal_null_count()
+        self._frame = None
+
     def render_html_body(self, number: str = "", tags: Sequence[str] = (), depth: int = 0) -> str:
         logger.info(
             "Rendering the temporal distribution of null values for all columns "
             f"| datetime column: {self._dt_column} | period: {self._period}"
         )
-        return Template(create_section_template()).render(
+        data = self._get_data()
+        return get_template(create_section_template()).render(
             {
                 "go_to_top": GO_TO_TOP,
                 "id": tags2id(tags),
@@ -172,13 +206,8 @@ class TemporalNullValueSection(BaseSection):
                 "title": tags2title(tags),
                 "section": number,
                 "dt_column": self._dt_column,
-                "figure": self._create_temporal_null_figure(),
-                "table": create_temporal_null_table(
-                    frame=self._frame,
-                    columns=self._columns,
-                    dt_column=self._dt_column,
-                    period=self._period,
-                ),
+                "figure": data["figure"],
+                "table": data["table"],
             }
         )
 
@@ -187,16 +216,43 @@ class TemporalNullValueSection(BaseSection):
     ) -> str:
         return render_html_toc(number=number, tags=tags, depth=depth, max_depth=max_depth)
 
+    def _get_data(self) -> dict[str, str]:
+        r"""Return the HTML elements of the section.
+
+        The figure and the table are rendered from the null counts, so
+        they can be rendered after the section was materialized.
+        """
+        return {
+            "figure": self._create_temporal_null_figure(),
+            "table": create_temporal_null_table_from_counts(*self._get_temporal_null_count()),
+        }
+
     def _create_temporal_null_figure(self) -> str:
-        fig = create_temporal_null_figure(
-            frame=self._frame,
-            columns=self._columns,
-            dt_column=self._dt_column,
-            period=self._period,
-            figsize=self._figsize,
+        if get_figure_backend() != "matplotlib":
+            return render_figure_data(self.get_figure_data()["temporal_null"], self._figsize)
+        nulls, totals, labels = self._get_temporal_null_count()
+        fig = create_temporal_null_figure_from_counts(
+            nulls=nulls, totals=totals, labels=labels, figsize=self._figsize
         )
         return figure2html(fig, close_fig=True)
 
+    def _get_temporal_null_count(self) -> tuple[np.ndarray, np.ndarray, list[str]]:
+        r"""Return the number of null values, the total number of values
+        and the label of each temporal window."""
+
+        def compute() -> tuple[np.ndarray, np.ndarray, list[str]]:
+            if self._frame.is_empty():
+                return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), []
+            return compute_temporal_null_count(
+                frame=self._frame,
+                columns=self._columns,
+                dt_column=self._dt_column,
+                period=self._period,
+                base_period=self._base_period,
+            )
+
+        return self._memoize("temporal_null_count", compute)
+
 
 def create_section_template() -> str:
     r"""Return the template of the section.
@@ -285,6 +341,46 @@ def create_temporal_null_figure(
     nulls, totals, labels = compute_temporal_null_count(
         frame=frame, columns=columns, dt_column=dt_column, period=period
     )
+    return create_temporal_null_figure_from_counts(
+        nulls=nulls, totals=totals, labels=labels, figsize=figsize
+    )
+
+
+def create_temporal_null_figure_from_counts(
+    nulls: np.ndarray,
+    totals: np.ndarray,
+    labels: Sequence[str],
+    figsize: tuple[float, float] | None = None,
+) -> plt.Figure | None:
+    r"""Create a figure with the temporal null value distribution from
+    the precomputed counts.
+
+    Args:
+        nulls: The number of null values for each temporal window.
+        totals: The total number of values for each temporal window.
+        labels: The label of each temporal window.
+        figsize: The figure size in inches. The first
+            dimension is the width and the second is the height.
+
+    Returns:
+        The generated figure.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from flamme.section.null_temp import create_temporal_null_figure_from_counts
+    >>> fig = create_temporal_null_figure_from_counts(
+    ...     nulls=np.array([1, 0, 2]),
+    ...     totals=np.array([4, 2, 4]),
+    ...     labels=["2020-01", "2020-02", "2020-03"],
+    ... )
+
+    ```
+    """
+    if len(labels) == 0:
+        return None
     fig, ax = plt.subplots(figsize=figsize)
     plot_null_temporal(ax=ax, labels=labels, nulls=nulls, totals=totals)
     readable_xticklabels(ax, max_num_xticks=100)
@@ -342,10 +438,41 @@ def create_temporal_null_table(
     nulls, totals, labels = compute_temporal_null_count(
         frame=frame, columns=columns, dt_column=dt_column, period=period
     )
-    rows = []
-    for label, null, total in zip(labels, nulls, totals):
-        rows.append(create_temporal_null_table_row(label=label, num_nulls=null, total=total))
-    return Template(
+    return create_temporal_null_table_from_counts(nulls=nulls, totals=totals, labels=labels)
+
+
+def create_temporal_null_table_from_counts(
+    nulls: np.ndarray, totals: np.ndarray, labels: Sequence[str]
+) -> str:
+    r"""Create a HTML representation of a table with the temporal
+    distribution of null values from the precomputed counts.
+
+    Args:
+        nulls: The number of null values for each temporal window.
+        totals: The total number of values for each temporal window.
+        labels: The label of each temporal window.
+
+    Returns:
+        The HTML representation of the table.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from flamme.section.null_temp import create_temporal_null_table_from_counts
+    >>> table = create_temporal_null_table_from_counts(
+    ...     nulls=np.array([1, 0, 2]),
+    ...     totals=np.array([4, 2, 4]),
+    ...     labels=["2020-01", "2020-02", "2020-03"],
+    ... )
+
+    ```
+    """
+    if len(labels) == 0:
+        return ""
+    rows = _render_temporal_null_table_rows(labels=labels, nulls=nulls, totals=totals)
+    return get_template(
         """<details>
     <summary>[show statistics per temporal period]</summary>
 
@@ -369,7 +496,7 @@ def create_temporal_null_table(
     </table>
 </details>
 """
-    ).render({"rows": "\n".join(rows), "period": period})
+    ).render({"rows": rows})
 
 
 def create_temporal_null_table_row(label: str, num_nulls: int, total: int) -> str:
@@ -392,8 +519,30 @@ def create_temporal_null_table_row(label: str, num_nulls: int, total: int) -> st
 
     ```
     """
-    num_non_nulls = total - num_nulls
-    return Template(
+    return _render_temporal_null_table_rows(labels=[label], nulls=[num_nulls], totals=[total])
+
+
+def _render_temporal_null_table_rows(
+    labels: Sequence[str], nulls: Sequence[int], totals: Sequence[int]
+) -> str:
+    r"""Return the HTML code of the table rows with the number of null
+    values for each temporal period.
+
+    Args:
+        labels: The label of each row.
+        nulls: The number of null values of each row.
+        totals: The total number of values of each row.
+
+    Returns:
+        The HTML code of the rows.
+    """
+    nulls = np.asarray(nulls, dtype=np.int64)
+    totals = np.asarray(totals, dtype=np.int64)
+    non_nulls = totals - nulls
+    with np.errstate(divide="ignore", invalid="ignore"):
+        null_pcts = 100 * nulls / totals
+        non_null_pcts = 100 * non_nulls / totals
+    return render_table_rows(
         """<tr>
     <th>{{label}}</th>
     <td {{num_style}}>{{num_nulls}}</td>
@@ -401,15 +550,14 @@ def create_temporal_null_table_row(label: str, num_nulls: int, total: int) -> st
     <td {{num_style}}>{{total}}</td>
     <td {{num_style}}>{{num_nulls_pct}}</td>
     <td {{num_style}}>{{num_non_nulls_pct}}</td>
-</tr>"""
-    ).render(
-        {
-            "num_style": 'style="text-align: right;"',
-            "label": label,
-            "num_nulls": f"{num_nulls:,}",
-            "num_non_nulls": f"{num_non_nulls:,}",
-            "total": f"{total:,}",
-            "num_nulls_pct": f"{100 * num_nulls / total:.2f}%",
-            "num_non_nulls_pct": f"{100 * num_non_nulls / total:.2f}%",
-        }
+</tr>""",
+        columns={
+            "label": labels,
+            "num_nulls": [f"{value:,}" for value in nulls.tolist()],
+            "num_non_nulls": [f"{value:,}" for value in non_nulls.tolist()],
+            "total": [f"{value:,}" for value in totals.tolist()],
+            "num_nulls_pct": [f"{value:.2f}%" for value in null_pcts.tolist()],
+            "num_non_nulls_pct": [f"{value:.2f}%" for value in non_null_pcts.tolist()],
+        },
+        num_style='style="text-align: right;"',
     )
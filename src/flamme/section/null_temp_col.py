@@ -7,32 +7,45 @@ __all__ = [
     "ColumnTemporalNullValueSection",
     "create_section_template",
     "create_table_section",
+    "create_table_section_from_counts",
     "create_temporal_null_figure",
+    "create_temporal_null_figure_from_counts",
     "create_temporal_null_figures",
+    "create_temporal_null_figures_from_counts",
+    "create_temporal_null_heatmap",
+    "create_temporal_null_heatmap_from_counts",
     "create_temporal_null_table",
+    "create_temporal_null_table_from_counts",
     "create_temporal_null_table_row",
 ]
 
 import logging
 from typing import TYPE_CHECKING
 
+import numpy as np
 from coola.utils import repr_indent, repr_mapping, str_indent
 from grizz.utils.imports import is_tqdm_available
-from jinja2 import Template
 from matplotlib import pyplot as plt
 
-from flamme.plot import plot_null_temporal
+from flamme.plot import (
+    null_temporal_figure_data,
+    plot_null_temporal,
+    plot_null_temporal_heatmap,
+    render_figure_data,
+)
 from flamme.plot.utils import readable_xticklabels
 from flamme.section.base import BaseSection
 from flamme.section.utils import (
     GO_TO_TOP,
+    get_template,
     render_html_toc,
+    render_table_rows,
     tags2id,
     tags2title,
     valid_h_tag,
 )
-from flamme.utils.figure import MISSING_FIGURE_MESSAGE, figure2html
-from flamme.utils.null import compute_temporal_null_count
+from flamme.utils.figure import MISSING_FIGURE_MESSAGE, figure2html, get_figure_backend
+from flamme.utils.null import compute_null_pattern_order, compute_temporal_null_matrix
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -61,6 +74,21 @@ class ColumnTemporalNullValueSection(BaseSection):
         ncols: The number of columns.
         figsize: The figure size in inches. The first dimension
             is the width and the second is the height.
+        base_period: If not ``None``, the statistics are computed
+            from the temporal cube with this base period, which is
+            shared by all the sections with the same DataFrame,
+            datetime column and base period. The windows of
+            ``period`` must be unions of windows of ``base_period``.
+        mode: The rendering mode of the figure. ``'grid'`` draws a
+            figure for each column, which is readable for small sets
+            of columns. ``'heatmap'`` draws a single heatmap with the
+            percentage of null values of each column and period.
+        cluster: If ``True`` and ``mode='heatmap'``, the columns with
+            similar temporal null patterns are next to each other in
+            the heatmap.
+
+    Raises:
+        ValueError: if ``mode`` is not valid.
 
     Example usage:
 
@@ -98,6 +126,9 @@ class ColumnTemporalNullValueSection(BaseSection):
       (period): M
       (ncols): 2
       (figsize): (7, 5)
+      (base_period): None
+      (mode): grid
+      (cluster): False
     )
     >>> section.get_statistics()
     {}
@@ -113,13 +144,23 @@ class ColumnTemporalNullValueSection(BaseSection):
         period: str,
         ncols: int = 2,
         figsize: tuple[float, float] = (7, 5),
+        *,
+        base_period: str | None = None,
+        mode: str = "grid",
+        cluster: bool = False,
     ) -> None:
+        if mode not in {"grid", "heatmap"}:
+            msg = f"Incorrect mode: {mode}. The valid modes are 'grid' and 'heatmap'"
+            raise ValueError(msg)
         self._frame = frame
         self._columns = tuple(columns)
         self._dt_column = dt_column
         self._period = period
         self._ncols = min(ncols, len(self._columns))
         self._figsize = figsize
+        self._base_period = base_period
+        self._mode = mode
+        self._cluster = cluster
 
     def __repr__(self) -> str:
         args = repr_indent(
@@ -130,14 +171,18 @@ class ColumnTemporalNullValueSection(BaseSection):
                     "period": self._period,
                     "ncols": self._ncols,
                     "figsize": self._figsize,
+                    "base_period": self._base_period,
+                    "mode": self._mode,
+                    "cluster": self._cluster,
                 }
             )
         )
         return f"{self.__class__.__qualname__}(\n  {args}\n)"
 
     @property
-    def frame(self) -> pl.DataFrame:
-        r"""The DataFrame to analyze."""
+    def frame(self) -> pl.DataFrame | None:
+        r"""The DataFrame to analyze or ``None`` if the section was
+        materialized."""
         return self._frame
 
     @property
@@ -168,15 +213,47 @@ class ColumnTemporalNullValueSection(BaseSection):
         """
         return self._figsize
 
+    @property
+    def base_period(self) -> str | None:
+        r"""The base period of the temporal cube or ``None`` if the
+        statistics are computed from the rows."""
+        return self._base_period
+
+    @property
+    def mode(self) -> str:
+        r"""The rendering mode of the figure."""
+        return self._mode
+
+    @property
+    def cluster(self) -> bool:
+        r"""Indicate if the columns are clustered in the heatmap."""
+        return self._cluster
+
     def get_statistics(self) -> dict:
         return {}
 
+    def get_figure_data(self) -> dict[str, dict]:
+        nulls, totals, labels = self._get_temporal_null_matrix()
+        return {
+            column: null_temporal_figure_data(
+                nulls=nulls[i], totals=totals, labels=labels, title=f"column: {column}"
+            )
+            for i, column in enumerate(self._columns)
+        }
+
+    def materialize(self) -> None:
+        if self._frame is None:
+            return
+        self._get_temporal_null_matrix()
+        self._frame = None
+
     def render_html_body(self, number: str = "", tags: Sequence[str] = (), depth: int = 0) -> str:
         logger.info(
             f"Rendering the temporal null value distribution of the following columns: "
             f"{self._columns}\ndatetime column: {self._dt_column} | period: {self._period}"
         )
-        return Template(create_section_template()).render(
+        data = self._get_data()
+        return get_template(create_section_template()).render(
             {
                 "go_to_top": GO_TO_TOP,
                 "id": tags2id(tags),
@@ -184,20 +261,8 @@ class ColumnTemporalNullValueSection(BaseSection):
                 "title": tags2title(tags),
                 "section": number,
                 "column": self._dt_column,
-                "figure": create_temporal_null_figure(
-                    frame=self._frame,
-                    columns=self._columns,
-                    dt_column=self._dt_column,
-                    period=self._period,
-                    ncols=self._ncols,
-                    figsize=self._figsize,
-                ),
-                "table": create_table_section(
-                    frame=self._frame,
-                    columns=self._columns,
-                    dt_column=self._dt_column,
-                    period=self._period,
-                ),
+                "figure": data["figure"],
+                "table": data["table"],
             }
         )
 
@@ -206,6 +271,53 @@ class ColumnTemporalNullValueSection(BaseSection):
     ) -> str:
         return render_html_toc(number=number, tags=tags, depth=depth, max_depth=max_depth)
 
+    def _get_temporal_null_matrix(self) -> tuple[np.ndarray, np.ndarray, list[str]]:
+        r"""Return the number of null values of each column, the total
+        number of values and the label of each temporal window."""
+
+        def compute() -> tuple[np.ndarray, np.ndarray, list[str]]:
+            return compute_temporal_null_matrix(
+                frame=self._frame,
+                columns=self._columns,
+                dt_column=self._dt_column,
+                period=self._period,
+                base_period=self._base_period,
+            )
+
+        return self._memoize("temporal_null_matrix", compute)
+
+    def _get_data(self) -> dict[str, str]:
+        r"""Return the HTML elements of the section.
+
+        The figure and the table are rendered from the null matrix, so
+        they can be rendered after the section was materialized.
+        """
+        nulls, totals, labels = self._get_temporal_null_matrix()
+        if self._mode == "heatmap":
+            figure = create_temporal_null_heatmap_from_counts(
+                columns=self._columns,
+                nulls=nulls,
+                totals=totals,
+                labels=labels,
+                figsize=self._figsize,
+                cluster=self._cluster,
+            )
+        else:
+            figure = create_temporal_null_figure_from_counts(
+                columns=self._columns,
+                nulls=nulls,
+                totals=totals,
+                labels=labels,
+                ncols=self._ncols,
+                figsize=self._figsize,
+            )
+        return {
+            "figure": figure,
+            "table": create_table_section_from_counts(
+                columns=self._columns, nulls=nulls, totals=totals, labels=labels
+            ),
+        }
+
 
 def create_section_template() -> str:
     r"""Return the template of the section.
@@ -247,6 +359,8 @@ def create_temporal_null_figure(
     period: str,
     ncols: int = 2,
     figsize: tuple[float, float] = (7, 5),
+    *,
+    base_period: str | None = None,
 ) -> str:
     r"""Create a HTML representation of a figure with the temporal null
     value distribution.
@@ -261,6 +375,8 @@ def create_temporal_null_figure(
         ncols: The number of columns.
         figsize: The figure size in inches. The first dimension
             is the width and the second is the height.
+        base_period: If not ``None``, the statistics are computed
+            from the temporal cube with this base period.
 
     Returns:
         The HTML representation of the figure.
@@ -299,11 +415,66 @@ def create_temporal_null_figure(
     """
     if frame.is_empty():
         return MISSING_FIGURE_MESSAGE
-    figures = create_temporal_null_figures(
-        frame=frame, columns=columns, dt_column=dt_column, period=period, figsize=figsize
+    nulls, totals, labels = compute_temporal_null_matrix(
+        frame=frame,
+        columns=columns,
+        dt_column=dt_column,
+        period=period,
+        base_period=base_period,
+    )
+    return create_temporal_null_figure_from_counts(
+        columns=columns, nulls=nulls, totals=totals, labels=labels, ncols=ncols, figsize=figsize
+    )
+
+
+def create_temporal_null_figure_from_counts(
+    columns: Sequence[str],
+    nulls: np.ndarray,
+    totals: np.ndarray,
+    labels: Sequence[str],
+    *,
+    ncols: int = 2,
+    figsize: tuple[float, float] = (7, 5),
+) -> str:
+    r"""Create a HTML representation of a figure with the temporal null
+    value distribution from the precomputed counts.
+
+    Args:
+        columns: The column names.
+        nulls: The number of null values, where the first dimension
+            represents the columns and the second dimension represents
+            the temporal windows.
+        totals: The total number of values for each temporal window.
+        labels: The label of each temporal window.
+        ncols: The number of columns.
+        figsize: The figure size in inches. The first dimension
+            is the width and the second is the height.
+
+    Returns:
+        The HTML representation of the figure.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from flamme.section.null_temp_col import create_temporal_null_figure_from_counts
+    >>> figure = create_temporal_null_figure_from_counts(
+    ...     columns=["col1", "col2"],
+    ...     nulls=np.array([[0, 1, 2], [1, 1, 0]]),
+    ...     totals=np.array([5, 5, 5]),
+    ...     labels=["2020-01", "2020-02", "2020-03"],
+    ... )
+
+    ```
+    """
+    if not labels:
+        return MISSING_FIGURE_MESSAGE
+    figures = create_temporal_null_figures_from_counts(
+        columns=columns, nulls=nulls, totals=totals, labels=labels, figsize=figsize
     )
     figures = add_column_to_figure(columns=columns, figures=figures)
-    return Template(
+    return get_template(
         """<div class="container-fluid text-center">
   <div class="row align-items-start">
     {{columns}}
@@ -319,6 +490,8 @@ def create_temporal_null_figures(
     dt_column: str,
     period: str,
     figsize: tuple[float, float] = (7, 5),
+    *,
+    base_period: str | None = None,
 ) -> list[str]:
     r"""Create a HTML representation of each figure with the temporal
     null value distribution.
@@ -332,6 +505,8 @@ def create_temporal_null_figures(
         period: The temporal period e.g. monthly or daily.
         figsize: The figure size in inches. The first dimension
             is the width and the second is the height.
+        base_period: If not ``None``, the statistics are computed
+            from the temporal cube with this base period.
 
     Returns:
         The HTML representations of the figures.
@@ -371,21 +546,219 @@ def create_temporal_null_figures(
     if frame.is_empty():
         return []
 
+    nulls, totals, labels = compute_temporal_null_matrix(
+        frame=frame,
+        columns=columns,
+        dt_column=dt_column,
+        period=period,
+        base_period=base_period,
+    )
+    return create_temporal_null_figures_from_counts(
+        columns=columns, nulls=nulls, totals=totals, labels=labels, figsize=figsize
+    )
+
+
+def create_temporal_null_figures_from_counts(
+    columns: Sequence[str],
+    nulls: np.ndarray,
+    totals: np.ndarray,
+    labels: Sequence[str],
+    *,
+    figsize: tuple[float, float] = (7, 5),
+) -> list[str]:
+    r"""Create a HTML representation of each figure with the temporal
+    null value distribution from the precomputed counts.
+
+    Args:
+        columns: The column names.
+        nulls: The number of null values, where the first dimension
+            represents the columns and the second dimension represents
+            the temporal windows.
+        totals: The total number of values for each temporal window.
+        labels: The label of each temporal window.
+        figsize: The figure size in inches. The first dimension
+            is the width and the second is the height.
+
+    Returns:
+        The HTML representations of the figures.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from flamme.section.null_temp_col import create_temporal_null_figures_from_counts
+    >>> figures = create_temporal_null_figures_from_counts(
+    ...     columns=["col1", "col2"],
+    ...     nulls=np.array([[0, 1, 2], [1, 1, 0]]),
+    ...     totals=np.array([5, 5, 5]),
+    ...     labels=["2020-01", "2020-02", "2020-03"],
+    ... )
+
+    ```
+    """
+    if not labels:
+        return []
+    matplotlib = get_figure_backend() == "matplotlib"
     figures = []
-    for column in tqdm(columns, desc="generating figures"):
+    for i, column in enumerate(tqdm(columns, desc="generating figures")):
+        if not matplotlib:
+            data = null_temporal_figure_data(
+                nulls=nulls[i], totals=totals, labels=labels, title=f"column: {column}"
+            )
+            figures.append(render_figure_data(data, figsize=figsize))
+            continue
         fig, ax = plt.subplots(figsize=figsize)
         ax.set_title(f"column: {column}")
-
-        nulls, totals, labels = compute_temporal_null_count(
-            frame=frame, columns=[column], dt_column=dt_column, period=period
-        )
-        plot_null_temporal(ax=ax, labels=labels, nulls=nulls, totals=totals)
+        plot_null_temporal(ax=ax, labels=labels, nulls=nulls[i], totals=totals)
         readable_xticklabels(ax, max_num_xticks=50)
         figures.append(figure2html(fig, close_fig=True))
 
     return figures
 
 
+def create_temporal_null_heatmap(
+    frame: pl.DataFrame,
+    columns: Sequence[str],
+    dt_column: str,
+    period: str,
+    figsize: tuple[float, float] = (7, 5),
+    *,
+    base_period: str | None = None,
+    cluster: bool = False,
+) -> str:
+    r"""Create a HTML representation of a heatmap with the temporal null
+    value distribution of all the columns.
+
+    The heatmap is drawn from the matrix of null counts, so a single
+    figure is generated whatever the number of columns.
+
+    Args:
+        frame: The DataFrame to analyze.
+        columns: The list of columns to analyze. A row of the heatmap
+            is generated for each column.
+        dt_column: The datetime column used to analyze
+            the temporal distribution.
+        period: The temporal period e.g. monthly or daily.
+        figsize: The figure size in inches. The first dimension
+            is the width and the second is the height. The height
+            grows with the number of columns.
+        base_period: If not ``None``, the statistics are computed
+            from the temporal cube with this base period.
+        cluster: If ``True``, the columns with similar temporal null
+            patterns are next to each other.
+
+    Returns:
+        The HTML representation of the figure.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from datetime import datetime, timezone
+    >>> import polars as pl
+    >>> from flamme.section.null_temp_col import create_temporal_null_heatmap
+    >>> frame = pl.DataFrame(
+    ...     {
+    ...         "int": [None, 1, 0, 1],
+    ...         "float": [1.2, 4.2, None, 2.2],
+    ...         "str": ["A", "B", None, None],
+    ...         "datetime": [
+    ...             datetime(year=2020, month=1, day=3, tzinfo=timezone.utc),
+    ...             datetime(year=2020, month=2, day=3, tzinfo=timezone.utc),
+    ...             datetime(year=2020, month=3, day=3, tzinfo=timezone.utc),
+    ...             datetime(year=2020, month=4, day=3, tzinfo=timezone.utc),
+    ...         ],
+    ...     },
+    ...     schema={
+    ...         "int": pl.Int64,
+    ...         "float": pl.Float64,
+    ...         "str": pl.String,
+    ...         "datetime": pl.Datetime(time_unit="us", time_zone="UTC"),
+    ...     },
+    ... )
+    >>> figure = create_temporal_null_heatmap(
+    ...     frame=frame, columns=["float", "int", "str"], dt_column="datetime", period="1mo"
+    ... )
+
+    ```
+    """
+    if frame.is_empty() or not columns:
+        return MISSING_FIGURE_MESSAGE
+    nulls, totals, labels = compute_temporal_null_matrix(
+        frame=frame,
+        columns=columns,
+        dt_column=dt_column,
+        period=period,
+        base_period=base_period,
+    )
+    return create_temporal_null_heatmap_from_counts(
+        columns=columns,
+        nulls=nulls,
+        totals=totals,
+        labels=labels,
+        figsize=figsize,
+        cluster=cluster,
+    )
+
+
+def create_temporal_null_heatmap_from_counts(
+    columns: Sequence[str],
+    nulls: np.ndarray,
+    totals: np.ndarray,
+    labels: Sequence[str],
+    *,
+    figsize: tuple[float, float] = (7, 5),
+    cluster: bool = False,
+) -> str:
+    r"""Create a HTML representation of a heatmap with the temporal null
+    value distribution of all the columns from the precomputed counts.
+
+    Args:
+        columns: The column names.
+        nulls: The number of null values, where the first dimension
+            represents the columns and the second dimension represents
+            the temporal windows.
+        totals: The total number of values for each temporal window.
+        labels: The label of each temporal window.
+        figsize: The figure size in inches. The first dimension
+            is the width and the second is the height. The height
+            grows with the number of columns.
+        cluster: If ``True``, the columns with similar temporal null
+            patterns are next to each other.
+
+    Returns:
+        The HTML representation of the figure.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from flamme.section.null_temp_col import create_temporal_null_heatmap_from_counts
+    >>> figure = create_temporal_null_heatmap_from_counts(
+    ...     columns=["col1", "col2"],
+    ...     nulls=np.array([[0, 1, 2], [1, 1, 0]]),
+    ...     totals=np.array([5, 5, 5]),
+    ...     labels=["2020-01", "2020-02", "2020-03"],
+    ... )
+
+    ```
+    """
+    if not labels or not columns:
+        return MISSING_FIGURE_MESSAGE
+    columns = list(columns)
+    if cluster:
+        order = compute_null_pattern_order(nulls=nulls, totals=totals)
+        nulls = nulls[order]
+        columns = [columns[i] for i in order]
+    width, height = figsize
+    fig, ax = plt.subplots(figsize=(width, max(height, 0.25 * len(columns))))
+    plot_null_temporal_heatmap(ax=ax, nulls=nulls, totals=totals, columns=columns, labels=labels)
+    readable_xticklabels(ax, max_num_xticks=50)
+    return figure2html(fig, close_fig=True)
+
+
 def add_column_to_figure(columns: Sequence[str], figures: Sequence[str]) -> list[str]:
     r"""Add the column name to the HTML representation of the figure.
 
@@ -448,7 +821,12 @@ def split_figures_by_column(figures: Sequence[str], ncols: int) -> list[str]:
 
 
 def create_table_section(
-    frame: pl.DataFrame, columns: Sequence[str], dt_column: str, period: str
+    frame: pl.DataFrame,
+    columns: Sequence[str],
+    dt_column: str,
+    period: str,
+    *,
+    base_period: str | None = None,
 ) -> str:
     r"""Return a HTML representation of a table with the temporal
     distribution of null values.
@@ -460,6 +838,8 @@ def create_table_section(
             the temporal distribution.
         period: The temporal period e.g. monthly or
             daily.
+        base_period: If not ``None``, the statistics are computed
+            from the temporal cube with this base period.
 
     Returns:
         The HTML representation of the table.
@@ -498,13 +878,59 @@ def create_table_section(
     """
     if frame.is_empty():
         return ""
+    nulls, totals, labels = compute_temporal_null_matrix(
+        frame=frame,
+        columns=columns,
+        dt_column=dt_column,
+        period=period,
+        base_period=base_period,
+    )
+    return create_table_section_from_counts(
+        columns=columns, nulls=nulls, totals=totals, labels=labels
+    )
+
+
+def create_table_section_from_counts(
+    columns: Sequence[str], nulls: np.ndarray, totals: np.ndarray, labels: Sequence[str]
+) -> str:
+    r"""Return a HTML representation of a table with the temporal
+    distribution of null values from the precomputed counts.
+
+    Args:
+        columns: The column names.
+        nulls: The number of null values, where the first dimension
+            represents the columns and the second dimension represents
+            the temporal windows.
+        totals: The total number of values for each temporal window.
+        labels: The label of each temporal window.
+
+    Returns:
+        The HTML representation of the table.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from flamme.section.null_temp_col import create_table_section_from_counts
+    >>> table = create_table_section_from_counts(
+    ...     columns=["col1", "col2"],
+    ...     nulls=np.array([[0, 1, 2], [1, 1, 0]]),
+    ...     totals=np.array([5, 5, 5]),
+    ...     labels=["2020-01", "2020-02", "2020-03"],
+    ... )
+
+    ```
+    """
+    if not labels:
+        return ""
     tables = []
-    for column in columns:
-        table = create_temporal_null_table(
-            frame=frame, column=column, dt_column=dt_column, period=period
+    for column, column_nulls in zip(columns, nulls):
+        table = create_temporal_null_table_from_counts(
+            column=column, nulls=column_nulls, totals=totals, labels=labels
         )
         tables.append(f'<p style="margin-top: 1rem;">\n\n{table}\n')
-    return Template(
+    return get_template(
         """<details>
     <summary>[show statistics per temporal period]</summary>
 
@@ -518,7 +944,12 @@ def create_table_section(
 
 
 def create_temporal_null_table(
-    frame: pl.DataFrame, column: str, dt_column: str, period: str
+    frame: pl.DataFrame,
+    column: str,
+    dt_column: str,
+    period: str,
+    *,
+    base_period: str | None = None,
 ) -> str:
     r"""Return a HTML representation of a table with the temporal
     distribution of null values.
@@ -530,6 +961,8 @@ def create_temporal_null_table(
             the temporal distribution.
         period: The temporal period e.g. monthly or
             daily.
+        base_period: If not ``None``, the statistics are computed
+            from the temporal cube with this base period.
 
     Returns:
         The HTML representation of the table.
@@ -568,14 +1001,50 @@ def create_temporal_null_table(
     """
     if frame.is_empty():
         return ""
-    nulls, totals, labels = compute_temporal_null_count(
-        frame=frame, columns=[column], dt_column=dt_column, period=period
+    nulls, totals, labels = compute_temporal_null_matrix(
+        frame=frame,
+        columns=[column],
+        dt_column=dt_column,
+        period=period,
+        base_period=base_period,
     )
-    rows = [
-        create_temporal_null_table_row(label=label, null=null, total=total)
-        for label, null, total in zip(labels, nulls, totals)
-    ]
-    return Template(
+    return create_temporal_null_table_from_counts(
+        column=column, nulls=nulls[0], totals=totals, labels=labels
+    )
+
+
+def create_temporal_null_table_from_counts(
+    column: str, nulls: np.ndarray, totals: np.ndarray, labels: Sequence[str]
+) -> str:
+    r"""Return a HTML representation of a table with the temporal
+    distribution of null values from the precomputed counts.
+
+    Args:
+        column: The column name.
+        nulls: The number of null values for each temporal window.
+        totals: The total number of values for each temporal window.
+        labels: The label of each temporal window.
+
+    Returns:
+        The HTML representation of the table.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from flamme.section.null_temp_col import create_temporal_null_table_from_counts
+    >>> table = create_temporal_null_table_from_counts(
+    ...     column="col",
+    ...     nulls=np.array([0, 1, 2]),
+    ...     totals=np.array([5, 5, 5]),
+    ...     labels=["2020-01", "2020-02", "2020-03"],
+    ... )
+
+    ```
+    """
+    rows = _render_temporal_null_table_rows(labels=labels, nulls=nulls, totals=totals)
+    return get_template(
         """<table class="table table-hover table-responsive w-auto" >
     <thead class="thead table-group-divider">
         <tr>
@@ -596,7 +1065,7 @@ def create_temporal_null_table(
     </tbody>
 </table>
 """
-    ).render({"rows": "\n".join(rows), "column": column, "period": period})
+    ).render({"rows": rows, "column": column})
 
 
 def create_temporal_null_table_row(label: str, null: int, total: int) -> str:
@@ -619,24 +1088,45 @@ def create_temporal_null_table_row(label: str, null: int, total: int) -> str:
 
     ```
     """
-    non_null = total - null
-    return Template(
+    return _render_temporal_null_table_rows(labels=[label], nulls=[null], totals=[total])
+
+
+def _render_temporal_null_table_rows(
+    labels: Sequence[str], nulls: Sequence[int], totals: Sequence[int]
+) -> str:
+    r"""Return the HTML code of the table rows with the temporal
+    distribution of null values.
+
+    Args:
+        labels: The label of each row.
+        nulls: The number of null values of each row.
+        totals: The total number of values of each row.
+
+    Returns:
+        The HTML code of the rows.
+    """
+    nulls = np.asarray(nulls, dtype=np.int64)
+    totals = np.asarray(totals, dtype=np.int64)
+    non_nulls = totals - nulls
+    with np.errstate(divide="ignore", invalid="ignore"):
+        null_pcts = 100 * nulls / totals
+        non_null_pcts = 100 * non_nulls / totals
+    return render_table_rows(
         """<tr>
     <th>{{label}}</th>
     <td {{num_style}}>{{null}}</td>
     <td {{num_style}}>{{non_null}}</td>
     <td {{num_style}}>{{total}}</td>
-    <td {{num_style}}>{{nulls_pct}}</td>
+    <td {{num_style}}>{{null_pct}}</td>
     <td {{num_style}}>{{non_null_pct}}</td>
-</tr>"""
-    ).render(
-        {
-            "num_style": 'style="text-align: right;"',
-            "label": label,
-            "nulls": f"{null:,}",
-            "non_null": f"{non_null:,}",
-            "total": f"{total:,}",
-            "nulls_pct": f"{100 * null / total:.2f}%",
-            "non_null_pct": f"{100 * non_null / total:.2f}%",
-        }
+</tr>""",
+        columns={
+            "label": labels,
+            "null": [f"{value:,}" for value in nulls.tolist()],
+            "non_null": [f"{value:,}" for value in non_nulls.tolist()],
+            "total": [f"{value:,}" for value in totals.tolist()],
+            "null_pct": [f"{value:.2f}%" for value in null_pcts.tolist()],
+            "non_null_pct": [f"{value:.2f}%" for value in non_null_pcts.tolist()],
+        },
+        num_style='style="text-align: right;"',
     )
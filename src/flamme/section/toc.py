@@ -11,7 +11,7 @@ from coola.utils import repr_indent, repr_mapping
 from flamme.section.base import BaseSection
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterator, Sequence
 
 
 class TableOfContentSection(BaseSection):
@@ -70,6 +70,12 @@ class TableOfContentSection(BaseSection):
     def get_statistics(self) -> dict:
         return self._section.get_statistics()
 
+    def get_figure_data(self) -> dict[str, dict]:
+        return self._section.get_figure_data()
+
+    def materialize(self) -> None:
+        self._section.materialize()
+
     def render_html_body(self, number: str = "", tags: Sequence[str] = (), depth: int = 0) -> str:
         toc = self._section.render_html_toc(
             number=number, tags=tags, depth=0, max_depth=self._max_toc_depth
@@ -77,6 +83,15 @@ class TableOfContentSection(BaseSection):
         body = self._section.render_html_body(number=number, tags=tags, depth=depth)
         return f"{toc}\n\n{body}"
 
+    def iter_html_body(
+        self, number: str = "", tags: Sequence[str] = (), depth: int = 0
+    ) -> Iterator[str]:
+        toc = self._section.render_html_toc(
+            number=number, tags=tags, depth=0, max_depth=self._max_toc_depth
+        )
+        yield f"{toc}\n"
+        yield from self._section.iter_html_body(number=number, tags=tags, depth=depth)
+
     def render_html_toc(
         self, number: str = "", tags: Sequence[str] = (), depth: int = 0, max_depth: int = 1
     ) -> str:
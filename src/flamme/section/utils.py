@@ -4,19 +4,31 @@ from __future__ import annotations
 
 __all__ = [
     "GO_TO_TOP",
+    "get_template",
     "render_html_toc",
+    "render_table_rows",
     "tags2id",
     "tags2title",
     "valid_h_tag",
 ]
 
-from typing import TYPE_CHECKING
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+from jinja2 import Environment
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Mapping, Sequence
+
+    from jinja2 import Template
 
 GO_TO_TOP = '<a href="#">Go to top</a>'
 
+# The environment used to compile the templates of the sections. It has
+# the same options as ``jinja2.Template``, so the rendered HTML is the
+# same.
+_environment = Environment()  # noqa: S701
+
 
 def tags2id(tags: Sequence[str]) -> str:
     r"""Convert a sequence of tags to a string that can be used as ID in
@@ -117,3 +129,76 @@ def render_html_toc(
         return ""
     tag = tags[-1] if tags else ""
     return f'<li><a href="#{tags2id(tags)}">{number} {tag}</a></li>'
+
+
+@lru_cache(maxsize=256)
+def get_template(source: str) -> Template:
+    r"""Return the compiled template of a template source.
+
+    The templates are compiled only once per process, and the compiled
+    templates are shared by all the sections.
+
+    Args:
+        source: The template source.
+
+    Returns:
+        The compiled template.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from flamme.section.utils import get_template
+    >>> get_template("<p>{{value}}</p>").render({"value": 42})
+    '<p>42</p>'
+    >>> get_template("<p>{{value}}</p>") is get_template("<p>{{value}}</p>")
+    True
+
+    ```
+    """
+    return _environment.from_string(source)
+
+
+def render_table_rows(
+    row_template: str, columns: Mapping[str, Sequence[Any]], **kwargs: Any
+) -> str:
+    r"""Render the rows of a table with a single template call.
+
+    The row template is wrapped in a loop template, so the table is
+    rendered in bulk from columnar data instead of rendering a
+    template for each row. The output is the same as rendering the
+    row template for each row and joining the rows with a new line.
+
+    Args:
+        row_template: The template source of a row. The values of
+            the row are available with the column names.
+        columns: The values of each column. All the columns must
+            have the same length, and the column names must be valid
+            Python identifiers.
+        **kwargs: The variables shared by all the rows
+            (e.g. a style).
+
+    Returns:
+        The HTML code of the rows.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from flamme.section.utils import render_table_rows
+    >>> render_table_rows(
+    ...     "<tr><th>{{label}}</th><td {{style}}>{{count}}</td></tr>",
+    ...     columns={"label": ["a", "b"], "count": ["1", "2"]},
+    ...     style='class="num"',
+    ... )
+    '<tr><th>a</th><td class="num">1</td></tr>\n<tr><th>b</th><td class="num">2</td></tr>'
+
+    ```
+    """
+    names = list(columns)
+    template = get_template(
+        f"{{% for {', '.join(names)} in rows %}}{{% if not loop.first %}}\n{{% endif %}}"
+        f"{row_template}{{% endfor %}}"
+    )
+    rows = columns[names[0]] if len(names) == 1 else zip(*columns.values())
+    return template.render(rows=rows, **kwargs)
@@ -2,18 +2,308 @@ r"""Contain utility functions for NumPy arrays."""
 
 from __future__ import annotations
 
-__all__ = ["filter_range", "nonnan", "rand_replace"]
+__all__ = ["SortedArray", "filter_range", "nonnan", "rand_replace", "to_sorted_array"]
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
 
-def filter_range(array: np.ndarray, xmin: float, xmax: float) -> np.ndarray:
+
+class SortedArray:
+    r"""Implement a view of the non-NaN values of an array sorted in
+    ascending order.
+
+    The values are sorted once, and the sorted buffer is used to
+    answer the quantile, extremum, range and histogram queries without
+    sorting or copying the values again. The range filters return
+    views of the same buffer.
+
+    Args:
+        array: The values. The array is flattened and the NaN values
+            are ignored.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from flamme.utils.array import SortedArray
+    >>> array = SortedArray(np.array([5.0, 1.0, float("nan"), 3.0, 2.0, 4.0]))
+    >>> array
+    SortedArray(size=5, dtype=float64)
+    >>> array.values
+    array([1., 2., 3., 4., 5.])
+    >>> array.min(), array.max()
+    (1.0, 5.0)
+    >>> array.quantile([0.25, 0.5])
+    array([2., 3.])
+    >>> array.filter_range(xmin=2, xmax=4).values
+    array([2., 3., 4.])
+    >>> array.histogram(bins=2)
+    (array([2, 3]), array([1., 3., 5.]))
+
+    ```
+    """
+
+    def __init__(self, array: np.ndarray) -> None:
+        values = np.sort(np.asarray(array).ravel())
+        if np.issubdtype(values.dtype, np.inexact) and values.size > 0:
+            # The NaN values are at the end of the sorted array.
+            values = values[: np.searchsorted(values, np.nan, side="left")]
+        values.flags.writeable = False
+        self._values = values
+
+    def __len__(self) -> int:
+        return self._values.size
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__qualname__}(size={self.size:,}, dtype={self.dtype})"
+
+    @property
+    def dtype(self) -> np.dtype:
+        r"""The data type of the values."""
+        return self._values.dtype
+
+    @property
+    def size(self) -> int:
+        r"""The number of non-NaN values."""
+        return self._values.size
+
+    @property
+    def values(self) -> np.ndarray:
+        r"""The read-only sorted values."""
+        return self._values
+
+    def count(self, lower: float | None = None, upper: float | None = None) -> int:
+        r"""Return the number of values in a range.
+
+        Args:
+            lower: The lower bound of the range (included).
+                If ``None``, there is no lower bound.
+            upper: The upper bound of the range (included).
+                If ``None``, there is no upper bound.
+
+        Returns:
+            The number of values in the range.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from flamme.utils.array import SortedArray
+        >>> array = SortedArray(np.array([-2, -1, 0, 0, 1, 2, 3]))
+        >>> array.count(lower=1)
+        3
+        >>> array.count(lower=0, upper=0)
+        2
+
+        ```
+        """
+        start, stop = self._find_bounds(lower, upper)
+        return max(stop - start, 0)
+
+    def filter_range(self, xmin: float, xmax: float) -> SortedArray:
+        r"""Return the values in a given range.
+
+        Args:
+            xmin: The lower bound of the range (included).
+            xmax: The upper bound of the range (included).
+
+        Returns:
+            A view of the values in the given range. The values are
+                not copied.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from flamme.utils.array import SortedArray
+        >>> SortedArray(np.arange(10)).filter_range(xmin=-1, xmax=5).values
+        array([0, 1, 2, 3, 4, 5])
+
+        ```
+        """
+        start, stop = self._find_bounds(xmin, xmax)
+        out = self.__class__.__new__(self.__class__)
+        out._values = self._values[start : max(start, stop)]
+        return out
+
+    def histogram(
+        self, bins: int | None = None, range: tuple[float, float] | None = None  # noqa: A002
+    ) -> tuple[np.ndarray, np.ndarray]:
+        r"""Compute the histogram of the values.
+
+        The output is the same as ``numpy.histogram`` with equal-width
+        bins, but the bins are found by binary search in the sorted
+        values.
+
+        Args:
+            bins: The number of equal-width bins. If ``None``, 10
+                bins are used.
+            range: The lower and upper range of the bins. If ``None``,
+                the range is ``(min, max)``.
+
+        Returns:
+            A tuple with the number of values in each bin and the bin
+                edges.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from flamme.utils.array import SortedArray
+        >>> SortedArray(np.arange(10)).histogram(bins=5)
+        (array([2, 2, 2, 2, 2]), array([0. , 1.8, 3.6, 5.4, 7.2, 9. ]))
+
+        ```
+        """
+        bins = 10 if bins is None else bins
+        if range is not None:
+            first, last = range
+        elif self.size == 0:
+            first, last = 0, 1
+        else:
+            first, last = self._values[0], self._values[-1]
+        if first == last:
+            first, last = first - 0.5, last + 0.5
+        edges = np.linspace(
+            first, last, bins + 1, endpoint=True, dtype=np.result_type(first, last, 1.0)
+        )
+        # The last bin includes its upper edge like ``numpy.histogram``.
+        indices = np.searchsorted(self._values, edges, side="left")
+        indices[-1] = np.searchsorted(self._values, edges[-1], side="right")
+        return np.diff(indices), edges
+
+    def max(self) -> float:
+        r"""Return the maximum value.
+
+        Returns:
+            The maximum value or NaN if there is no value.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from flamme.utils.array import SortedArray
+        >>> SortedArray(np.array([5, 1, 3])).max()
+        5
+
+        ```
+        """
+        if self.size == 0:
+            return float("nan")
+        return self._values[-1].item()
+
+    def min(self) -> float:
+        r"""Return the minimum value.
+
+        Returns:
+            The minimum value or NaN if there is no value.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from flamme.utils.array import SortedArray
+        >>> SortedArray(np.array([5, 1, 3])).min()
+        1
+
+        ```
+        """
+        if self.size == 0:
+            return float("nan")
+        return self._values[0].item()
+
+    def nunique(self) -> int:
+        r"""Return the number of unique values.
+
+        Returns:
+            The number of unique values.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from flamme.utils.array import SortedArray
+        >>> SortedArray(np.array([5, 1, 3, 1, 5, float("nan")])).nunique()
+        3
+
+        ```
+        """
+        if self.size == 0:
+            return 0
+        return int(np.count_nonzero(self._values[1:] != self._values[:-1])) + 1
+
+    def quantile(self, q: float | Sequence[float]) -> float | np.ndarray:
+        r"""Compute the q-th quantiles of the values.
+
+        The quantiles are computed with the ``'linear'`` method of
+        ``numpy.quantile``.
+
+        Args:
+            q: The quantile or sequence of quantiles to compute.
+                Values must be between 0 and 1 inclusive.
+
+        Returns:
+            The quantile value or an array with the quantile values.
+                The values are NaN if there is no value.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from flamme.utils.array import SortedArray
+        >>> array = SortedArray(np.arange(101))
+        >>> array.quantile(0.5)
+        50.0
+        >>> array.quantile([0.001, 0.25, 0.999])
+        array([ 0.1, 25. , 99.9])
+
+        ```
+        """
+        qs = np.asarray(q, dtype=np.float64)
+        if self.size == 0:
+            out = np.full(qs.shape, np.nan)
+        else:
+            index = qs * (self.size - 1)
+            lower = np.floor(index).astype(np.int64)
+            upper = np.minimum(lower + 1, self.size - 1)
+            a = self._values[lower].astype(np.float64)
+            b = self._values[upper].astype(np.float64)
+            gamma = index - lower
+            # Same interpolation as ``numpy.quantile``.
+            diff = b - a
+            out = np.where(gamma >= 0.5, b - diff * (1 - gamma), a + diff * gamma)
+        if out.ndim == 0:
+            return out.item()
+        return out
+
+    def _find_bounds(self, lower: float | None, upper: float | None) -> tuple[int, int]:
+        r"""Find the indices of the first value greater or equal to
+        ``lower`` and of the first value greater than ``upper``."""
+        start = 0 if lower is None else int(np.searchsorted(self._values, lower, side="left"))
+        stop = (
+            self.size if upper is None else int(np.searchsorted(self._values, upper, side="right"))
+        )
+        return start, stop
+
+
+def filter_range(array: np.ndarray | SortedArray, xmin: float, xmax: float) -> np.ndarray:
     r"""Filter in the values in a given range.
 
     Args:
-        array: The input array.
+        array: The input array. If it is a ``SortedArray``, the
+            output is a view of its sorted values.
         xmin: The lower bound of the range.
         xmax: The upper bound of the range.
 
@@ -32,6 +322,8 @@ def filter_range(array: np.ndarray, xmin: float, xmax: float) -> np.ndarray:
 
     ```
     """
+    if isinstance(array, SortedArray):
+        return array.filter_range(xmin=xmin, xmax=xmax).values
     return np.extract(np.logical_and(xmin <= array, array <= xmax), array)
 
 
@@ -95,3 +387,32 @@ def rand_replace(
         rng = np.random.default_rng()
     mask = rng.choice([True, False], size=arr.shape, p=[prob, 1.0 - prob])
     return np.where(mask, value, arr)
+
+
+def to_sorted_array(array: np.ndarray | SortedArray) -> SortedArray:
+    r"""Return a sorted view of the non-NaN values of an array.
+
+    Args:
+        array: The input array or a sorted view.
+
+    Returns:
+        The sorted view. The input is returned if it is already a
+            ``SortedArray``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from flamme.utils.array import to_sorted_array
+    >>> array = to_sorted_array(np.array([3, 1, 2]))
+    >>> array
+    SortedArray(size=3, dtype=int64)
+    >>> to_sorted_array(array) is array
+    True
+
+    ```
+    """
+    if isinstance(array, SortedArray):
+        return array
+    return SortedArray(array)
@@ -0,0 +1,288 @@
+r"""Contain utility functions to compute the statistics to draw
+boxplots."""
+
+from __future__ import annotations
+
+__all__ = [
+    "compute_boxplot_stats",
+    "compute_temporal_boxplot_stats",
+    "get_boxplot_stats_expression",
+]
+
+import math
+
+import numpy as np
+import polars as pl
+
+from flamme.utils.array import SortedArray
+from flamme.utils.temporal import get_temporal_index
+
+# The statistics used by ``matplotlib.axes.Axes.bxp`` to draw a box.
+_BOXPLOT_STATS = ("mean", "med", "q1", "q3", "cilo", "cihi", "whislo", "whishi")
+
+
+def compute_boxplot_stats(
+    data: pl.Series | np.ndarray | SortedArray, max_fliers: int = 100
+) -> dict:
+    r"""Compute the statistics to draw the boxplot of some values.
+
+    The statistics are the same as ``matplotlib.cbook.boxplot_stats``
+    with the default whiskers (1.5 IQR), but the null and NaN values
+    are ignored and the number of fliers is bounded. The output can
+    be given to ``matplotlib.axes.Axes.bxp``.
+
+    Args:
+        data: The values as a series, an array, or a sorted view.
+            The statistics of a sorted view are computed without
+            sorting the values again.
+        max_fliers: The maximum number of fliers kept on each side
+            of the whiskers. The most extreme flier is always kept and
+            the other fliers are sampled at regular intervals of the
+            sorted fliers.
+
+    Returns:
+        The boxplot statistics. The fliers are a 1-d array and the
+            other statistics are floats (NaN if there is no value).
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from flamme.utils.boxplot import compute_boxplot_stats
+    >>> stats = compute_boxplot_stats(np.array([1.0, 2.0, 3.0, 4.0, 100.0]))
+    >>> stats["med"], stats["q1"], stats["q3"], stats["whislo"], stats["whishi"]
+    (3.0, 2.0, 4.0, 1.0, 4.0)
+    >>> stats["fliers"]
+    array([100.])
+
+    ```
+    """
+    if isinstance(data, SortedArray):
+        return _compute_boxplot_stats_sorted(data, max_fliers=max_fliers)
+    if isinstance(data, np.ndarray):
+        data = pl.Series(values=data.ravel())
+    stats = data.to_frame("values").select(
+        get_boxplot_stats_expression("values", max_fliers=max_fliers)
+    )
+    return _to_boxplot_stats(stats.item())
+
+
+def compute_temporal_boxplot_stats(
+    frame: pl.DataFrame, column: str, dt_column: str, period: str, max_fliers: int = 100
+) -> tuple[list[dict], list[str]]:
+    r"""Compute the statistics to draw a boxplot for each temporal
+    window.
+
+    The statistics of all the temporal windows are computed with a
+    single grouped polars query, so only the statistics and the
+    bounded fliers are materialized.
+
+    Args:
+        frame: The DataFrame to analyze.
+        column: The column to analyze. It must be numeric.
+        dt_column: The datetime column used to create the temporal
+            windows.
+        period: The temporal period e.g. monthly or daily.
+        max_fliers: The maximum number of fliers kept on each side
+            of the whiskers for each temporal window.
+            See ``compute_boxplot_stats``.
+
+    Returns:
+        A tuple with the boxplot statistics and the name of each
+            temporal window.
+
+    Raises:
+        ValueError: if the datetime column has null values.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from datetime import datetime, timezone
+    >>> import polars as pl
+    >>> from flamme.utils.boxplot import compute_temporal_boxplot_stats
+    >>> stats, steps = compute_temporal_boxplot_stats(
+    ...     frame=pl.DataFrame(
+    ...         {
+    ...             "col": [1.2, 4.2, 0.0, 1.0, 4.2, 42.0],
+    ...             "datetime": [
+    ...                 datetime(year=2020, month=1, day=3, tzinfo=timezone.utc),
+    ...                 datetime(year=2020, month=1, day=4, tzinfo=timezone.utc),
+    ...                 datetime(year=2020, month=1, day=5, tzinfo=timezone.utc),
+    ...                 datetime(year=2020, month=2, day=3, tzinfo=timezone.utc),
+    ...                 datetime(year=2020, month=3, day=3, tzinfo=timezone.utc),
+    ...                 datetime(year=2020, month=4, day=3, tzinfo=timezone.utc),
+    ...             ],
+    ...         }
+    ...     ),
+    ...     column="col",
+    ...     dt_column="datetime",
+    ...     period="1mo",
+    ... )
+    >>> [s["med"] for s in stats]
+    [1.2, 1.0, 4.2, 42.0]
+    >>> steps
+    ['2020-01', '2020-02', '2020-03', '2020-04']
+
+    ```
+    """
+    if frame.is_empty():
+        return [], []
+    index = get_temporal_index(frame, dt_column)
+    stats = (
+        index.sort(frame.select(column, dt_column))
+        .group_by_dynamic(dt_column, every=period)
+        .agg(get_boxplot_stats_expression(column, max_fliers=max_fliers).alias("stats"))
+    )
+    return [_to_boxplot_stats(s) for s in stats["stats"]], index.get_step_names(period)
+
+
+def get_boxplot_stats_expression(column: str | pl.Expr, max_fliers: int = 100) -> pl.Expr:
+    r"""Return an expression that computes the statistics to draw the
+    boxplot of a column.
+
+    The expression can be used in a selection or in the aggregation
+    of a group-by. See ``compute_boxplot_stats`` for more information
+    about the statistics.
+
+    Args:
+        column: The column to analyze or an expression with the
+            values. It must be numeric.
+        max_fliers: The maximum number of fliers kept on each side
+            of the whiskers.
+
+    Returns:
+        An expression that computes a struct with the boxplot
+            statistics. The statistics are null if there is no value.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import polars as pl
+    >>> from flamme.utils.boxplot import get_boxplot_stats_expression
+    >>> frame = pl.DataFrame({"col": [1.0, 2.0, 3.0, 4.0, 100.0, None]})
+    >>> stats = frame.select(get_boxplot_stats_expression("col")).item()
+    >>> stats["med"], stats["whislo"], stats["whishi"], stats["fliers"]
+    (3.0, 1.0, 4.0, [100.0])
+
+    ```
+    """
+    values = pl.col(column) if isinstance(column, str) else column
+    values = values.cast(pl.Float64).drop_nulls().drop_nans()
+    q1 = values.quantile(0.25, interpolation="linear")
+    med = values.quantile(0.5, interpolation="linear")
+    q3 = values.quantile(0.75, interpolation="linear")
+    iqr = q3 - q1
+    # Like matplotlib, the whiskers are the most extreme values within
+    # 1.5 IQR of the box, and they never go inside the box.
+    whislo = pl.min_horizontal(values.filter(values >= q1 - 1.5 * iqr).min(), q1)
+    whishi = pl.max_horizontal(values.filter(values <= q3 + 1.5 * iqr).max(), q3)
+    notch = 1.57 * iqr / values.len().cast(pl.Float64).sqrt()
+    return pl.struct(
+        values.mean().alias("mean"),
+        med.alias("med"),
+        q1.alias("q1"),
+        q3.alias("q3"),
+        (med - notch).alias("cilo"),
+        (med + notch).alias("cihi"),
+        whislo.alias("whislo"),
+        whishi.alias("whishi"),
+        _sample_sorted(values.filter(values < whislo).sort(), max_fliers)
+        .implode()
+        .list.concat(
+            _sample_sorted(
+                values.filter(values > whishi).sort(descending=True), max_fliers
+            ).implode()
+        )
+        .alias("fliers"),
+    )
+
+
+def _compute_boxplot_stats_sorted(array: SortedArray, max_fliers: int) -> dict:
+    r"""Compute the boxplot statistics of a sorted view.
+
+    Args:
+        array: The sorted view of the values.
+        max_fliers: The maximum number of fliers kept on each side
+            of the whiskers.
+
+    Returns:
+        The boxplot statistics.
+    """
+    if array.size == 0:
+        return _to_boxplot_stats({})
+    values = array.values.astype(np.float64)
+    q1, med, q3 = np.quantile(values, [0.25, 0.5, 0.75]).tolist()
+    iqr = q3 - q1
+    start = np.searchsorted(values, q1 - 1.5 * iqr, side="left")
+    end = np.searchsorted(values, q3 + 1.5 * iqr, side="right")
+    whislo = min(values[start].item(), q1) if start < values.size else q1
+    whishi = max(values[end - 1].item(), q3) if end > 0 else q3
+    lower = values[: np.searchsorted(values, whislo, side="left")]
+    upper = values[np.searchsorted(values, whishi, side="right") :][::-1]
+    notch = 1.57 * iqr / math.sqrt(values.size)
+    return {
+        "mean": values.mean().item(),
+        "med": med,
+        "q1": q1,
+        "q3": q3,
+        "cilo": med - notch,
+        "cihi": med + notch,
+        "whislo": whislo,
+        "whishi": whishi,
+        "fliers": np.concatenate(
+            [_sample_sorted_array(lower, max_fliers), _sample_sorted_array(upper, max_fliers)]
+        ),
+    }
+
+
+def _sample_sorted(values: pl.Expr, num: int) -> pl.Expr:
+    r"""Return an expression that samples at most ``num`` values at
+    regular intervals, starting with the first value.
+
+    Args:
+        values: The expression with the sorted values.
+        num: The maximum number of values to keep.
+
+    Returns:
+        The expression with the sampled values.
+    """
+    size = pl.min_horizontal(values.len(), num)
+    return values.gather((pl.int_range(0, size, dtype=pl.Int64) * values.len()) // size)
+
+
+def _sample_sorted_array(values: np.ndarray, num: int) -> np.ndarray:
+    r"""Sample at most ``num`` values at regular intervals, starting
+    with the first value.
+
+    Args:
+        values: The sorted values.
+        num: The maximum number of values to keep.
+
+    Returns:
+        The sampled values.
+    """
+    size = min(values.size, num)
+    if size == 0:
+        return values[:0]
+    return values[(np.arange(size) * values.size) // size]
+
+
+def _to_boxplot_stats(stats: dict) -> dict:
+    r"""Convert the statistics computed by polars to the format used by
+    ``matplotlib.axes.Axes.bxp``.
+
+    Args:
+        stats: The statistics computed by polars. The missing and null
+            statistics are converted to NaN.
+
+    Returns:
+        The boxplot statistics.
+    """
+    out = {
+        name: float("nan") if stats.get(name) is None else stats[name] for name in _BOXPLOT_STATS
+    }
+    out["fliers"] = np.asarray(stats.get("fliers") or [], dtype=np.float64)
+    return out
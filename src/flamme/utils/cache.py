@@ -0,0 +1,385 @@
+r"""Contain a cache to share the results of expensive computations
+between the analyzers and sections of a report."""
+
+from __future__ import annotations
+
+__all__ = [
+    "ComputationCache",
+    "enable_computation_cache",
+    "frame_cache",
+    "get_computation_cache",
+]
+
+import copy
+import functools
+import inspect
+import logging
+import sys
+import threading
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, TypeVar
+
+import numpy as np
+import polars as pl
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator, Hashable
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# The cache used by the functions decorated with ``frame_cache``.
+_state: dict[str, ComputationCache | None] = {"cache": None}
+
+
+class ComputationCache:
+    r"""Implement a LRU cache to store the results of computations on
+    DataFrames.
+
+    The results are indexed by a fingerprint of the DataFrame, the
+    name of the operation and its arguments. The fingerprint is
+    based on the identity, shape and schema of the DataFrame, so
+    computing it does not read the data. The entries associated to a
+    DataFrame are removed when the DataFrame is garbage collected.
+    The least recently used entries are removed when the total size
+    of the cached results is larger than ``max_bytes``.
+
+    The cached results are shared, so the callers receive read-only
+    views of the numpy arrays and copies of the dictionaries and
+    lists. The computed values are not modified.
+
+    Args:
+        max_bytes: The maximum total size of the cached results
+            in bytes.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import polars as pl
+    >>> from flamme.utils.cache import ComputationCache
+    >>> cache = ComputationCache(max_bytes=1024)
+    >>> frame = pl.DataFrame({"col": [1, 2, 3]})
+    >>> cache.get_or_compute(frame, "sum", (), lambda: frame["col"].sum())
+    6
+    >>> cache.get_or_compute(frame, "sum", (), lambda: frame["col"].sum())
+    6
+    >>> cache.hits, cache.misses
+    (1, 1)
+
+    ```
+    """
+
+    def __init__(self, max_bytes: int = 2**30) -> None:
+        self._max_bytes = int(max_bytes)
+        self._entries: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._num_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.RLock()
+        # The identifiers of the DataFrames with a finalizer.
+        self._frame_ids: set[int] = set()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__qualname__}(num_entries={len(self):,}, "
+            f"num_bytes={self._num_bytes:,}, max_bytes={self._max_bytes:,}, "
+            f"hits={self._hits:,}, misses={self._misses:,})"
+        )
+
+    @property
+    def hits(self) -> int:
+        r"""The number of computations found in the cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        r"""The number of computations not found in the cache."""
+        return self._misses
+
+    @property
+    def max_bytes(self) -> int:
+        r"""The maximum total size of the cached results in bytes."""
+        return self._max_bytes
+
+    @property
+    def num_bytes(self) -> int:
+        r"""The total size of the cached results in bytes."""
+        return self._num_bytes
+
+    def clear(self) -> None:
+        r"""Remove all the entries and reset the counters.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import polars as pl
+        >>> from flamme.utils.cache import ComputationCache
+        >>> cache = ComputationCache()
+        >>> frame = pl.DataFrame({"col": [1, 2, 3]})
+        >>> cache.get_or_compute(frame, "sum", (), lambda: frame["col"].sum())
+        6
+        >>> cache.clear()
+        >>> len(cache)
+        0
+
+        ```
+        """
+        with self._lock:
+            self._entries.clear()
+            self._num_bytes = 0
+            self._hits = 0
+            self._misses = 0
+
+    def get_or_compute(
+        self, frame: pl.DataFrame, operation: str, args: Hashable, fn: Callable[[], T]
+    ) -> T:
+        r"""Return the cached result of an operation or compute it.
+
+        Args:
+            frame: The DataFrame used by the operation.
+            operation: The name of the operation.
+            args: The arguments of the operation except the
+                DataFrame. They must be hashable.
+            fn: The function to compute the result if it is not in
+                the cache.
+
+        Returns:
+            The result of the operation.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import polars as pl
+        >>> from flamme.utils.cache import ComputationCache
+        >>> cache = ComputationCache()
+        >>> frame = pl.DataFrame({"col": [1, 2, 3]})
+        >>> cache.get_or_compute(frame, "max", ("col",), lambda: frame["col"].max())
+        3
+
+        ```
+        """
+        key = (_get_fingerprint(frame), operation, args)
+        with self._lock:
+            if key in self._entries:
+                self._hits += 1
+                self._entries.move_to_end(key)
+                return _share(self._entries[key][0])
+            self._misses += 1
+        value = fn()
+        if not self._add(frame, key, value):
+            return value
+        return _share(value)
+
+    def _add(self, frame: pl.DataFrame, key: Hashable, value: Any) -> bool:
+        r"""Add a value to the cache and remove the least recently used
+        values if the cache is too large.
+
+        Returns ``False`` if the value is too large to be cached.
+        """
+        size = _get_size(value)
+        if size > self._max_bytes:
+            logger.debug(f"The result of {key[1]} is too large to be cached ({size:,} bytes)")
+            return False
+        with self._lock:
+            if key in self._entries:
+                return True
+            self._entries[key] = (value, size)
+            self._num_bytes += size
+            while self._num_bytes > self._max_bytes:
+                _, (_, old_size) = self._entries.popitem(last=False)
+                self._num_bytes -= old_size
+            if id(frame) not in self._frame_ids:
+                self._frame_ids.add(id(frame))
+                weakref.finalize(frame, self._remove_frame, id(frame))
+        return True
+
+    def _remove_frame(self, frame_id: int) -> None:
+        r"""Remove the entries associated to a DataFrame that was garbage
+        collected."""
+        with self._lock:
+            self._frame_ids.discard(frame_id)
+            for key in [key for key in self._entries if key[0][0] == frame_id]:
+                _, size = self._entries.pop(key)
+                self._num_bytes -= size
+
+
+def get_computation_cache() -> ComputationCache | None:
+    r"""Return the cache used by the functions decorated with
+    ``frame_cache``.
+
+    Returns:
+        The active cache or ``None`` if there is no active cache.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from flamme.utils.cache import get_computation_cache
+    >>> get_computation_cache()
+
+    ```
+    """
+    return _state["cache"]
+
+
+@contextmanager
+def enable_computation_cache(
+    cache: ComputationCache | None = None,
+) -> Generator[ComputationCache, None, None]:
+    r"""Context manager to share the results of the functions decorated
+    with ``frame_cache``.
+
+    The cache is shared by all the threads, so it can be used with the
+    thread executor of ``MappingAnalyzer``.
+
+    Args:
+        cache: The cache to use. If ``None``, a new cache is created.
+
+    Yields:
+        The active cache.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import polars as pl
+    >>> from flamme.utils.cache import enable_computation_cache
+    >>> from flamme.utils.null import compute_null_count
+    >>> frame = pl.DataFrame({"col1": [1, None, 3], "col2": [None, None, 1]})
+    >>> with enable_computation_cache() as cache:
+    ...     compute_null_count(frame)
+    ...     compute_null_count(frame)
+    ...
+    array([1, 2])
+    array([1, 2])
+    >>> cache.hits, cache.misses
+    (1, 1)
+
+    ```
+    """
+    if cache is None:
+        cache = ComputationCache()
+    previous = _state["cache"]
+    _state["cache"] = cache
+    try:
+        yield cache
+    finally:
+        _state["cache"] = previous
+        logger.debug(f"computation cache: {cache}")
+
+
+def frame_cache(fn: Callable[..., T]) -> Callable[..., T]:
+    r"""Decorate a function that computes a result from a DataFrame, so
+    the result is stored in the active computation cache.
+
+    The first argument of the function must be the DataFrame, and the
+    other arguments must be hashable or sequences of hashable values.
+    The function is called without cache if there is no active cache
+    or if the first argument is not a DataFrame.
+
+    Args:
+        fn: The function to decorate.
+
+    Returns:
+        The decorated function.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import polars as pl
+    >>> from flamme.utils.cache import enable_computation_cache, frame_cache
+    >>> @frame_cache
+    ... def compute_sum(frame: pl.DataFrame, column: str) -> int:
+    ...     return frame[column].sum()
+    ...
+    >>> frame = pl.DataFrame({"col": [1, 2, 3]})
+    >>> with enable_computation_cache() as cache:
+    ...     compute_sum(frame, "col")
+    ...     compute_sum(frame, column="col")
+    ...
+    6
+    6
+    >>> cache.hits
+    1
+
+    ```
+    """
+    signature = inspect.signature(fn)
+    operation = f"{fn.__module__}.{fn.__qualname__}"
+
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> T:
+        cache = _state["cache"]
+        if cache is None:
+            return fn(*args, **kwargs)
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        frame, *others = bound.arguments.values()
+        if not isinstance(frame, pl.DataFrame):
+            return fn(*args, **kwargs)
+        return cache.get_or_compute(
+            frame,
+            operation,
+            tuple(_to_hashable(value) for value in others),
+            lambda: fn(*args, **kwargs),
+        )
+
+    return wrapper
+
+
+def _get_fingerprint(frame: pl.DataFrame) -> tuple:
+    r"""Return a cheap fingerprint of a DataFrame."""
+    return id(frame), frame.shape, tuple(frame.schema.items())
+
+
+def _get_size(value: Any) -> int:
+    r"""Return an estimation of the size of a value in bytes."""
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (pl.DataFrame, pl.Series)):
+        return value.estimated_size()
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            _get_size(key) + _get_size(val) for key, val in value.items()
+        )
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(_get_size(item) for item in value)
+    return sys.getsizeof(value)
+
+
+def _share(value: Any) -> Any:
+    r"""Return a value of the cache that can be given to a caller.
+
+    The numpy arrays are returned as read-only views and the
+    dictionaries (e.g. ``Counter``) and lists are copied, so a
+    caller cannot modify the cached value.
+    """
+    if isinstance(value, np.ndarray):
+        view = value.view()
+        view.flags.writeable = False
+        return view
+    if isinstance(value, dict):
+        out = copy.copy(value)
+        for key, item in out.items():
+            out[key] = _share(item)
+        return out
+    if type(value) in {list, tuple}:
+        return type(value)(_share(item) for item in value)
+    return value
+
+
+def _to_hashable(value: Any) -> Hashable:
+    r"""Convert the lists to tuples so they can be used in a key."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_to_hashable(item) for item in value)
+    return value
@@ -2,20 +2,513 @@ r"""Contain utility functions for counting."""
 
 from __future__ import annotations
 
-__all__ = ["compute_nunique", "compute_temporal_count", "compute_temporal_value_counts"]
+__all__ = [
+    "FrequencyTable",
+    "compute_frequency_table",
+    "compute_most_frequent_values",
+    "compute_nunique",
+    "compute_temporal_count",
+    "compute_temporal_value_counts",
+    "compute_value_counts",
+    "estimate_nunique",
+    "to_frequency_table",
+]
+
+from collections import Counter
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 import polars as pl
 
+from flamme.utils.cache import frame_cache
+from flamme.utils.cube import get_temporal_cube
+from flamme.utils.sketch import HyperLogLog, SpaceSaving
 from flamme.utils.sorting import mixed_typed_sort
-from flamme.utils.temporal import to_step_names
+from flamme.utils.temporal import TemporalIndex, get_temporal_index
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+class FrequencyTable:
+    r"""Implement a table with the number of occurrences of each value.
+
+    The values are stored in a polars series and the counts in a numpy
+    array, sorted by decreasing number of occurrences, so the most and
+    least frequent values are obtained without sorting Python
+    objects. The values with the same number of occurrences keep
+    their input order. The null values are represented by a null
+    value in the table.
+
+    The total number of occurrences can be larger than the sum of the
+    counts, for example if the table was truncated or if it was
+    created from a sketch. The difference is the number of
+    occurrences of the values that are not in the table
+    (a.k.a. other values).
+
+    Args:
+        values: The values.
+        counts: The number of occurrences of each value.
+        total: The total number of occurrences. If ``None``, it is
+            the sum of the counts.
+        max_error: The maximum overestimation of the counts, for
+            example if the table was created from a sketch. ``0``
+            means the counts are exact.
+
+    Raises:
+        ValueError: if the values and counts have different lengths.
+        ValueError: if the total is lower than the sum of the counts.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from flamme.utils.count import FrequencyTable
+    >>> table = FrequencyTable(values=["a", "b", "c", None], counts=[4, 2, 6, 1])
+    >>> table
+    FrequencyTable(num_values=4, total=13, null_count=1, other_count=0)
+    >>> table.most_common()
+    [('c', 6), ('a', 4), ('b', 2), (None, 1)]
+    >>> table.head(2)
+    FrequencyTable(num_values=2, total=13, null_count=0, other_count=3)
+    >>> table.head(2).cumulative_percentages()
+    array([46.15..., 76.92...])
+
+    ```
+    """
+
+    def __init__(
+        self,
+        values: pl.Series | Sequence[Any],
+        counts: np.ndarray | Sequence[int],
+        total: int | None = None,
+        *,
+        max_error: int = 0,
+    ) -> None:
+        if not isinstance(values, pl.Series):
+            values = _create_series(values)
+        counts = np.asarray(counts, dtype=np.int64).ravel()
+        if values.len() != counts.size:
+            msg = (
+                f"values and counts must have the same length "
+                f"(received: {values.len():,} and {counts.size:,})"
+            )
+            raise ValueError(msg)
+        if counts.size > 1 and np.any(np.diff(counts) > 0):
+            order = np.argsort(-counts, kind="stable")
+            values, counts = values.gather(order), counts[order]
+        counts.flags.writeable = False
+        self._values = values
+        self._counts = counts
+        count = int(counts.sum())
+        self._total = count if total is None else int(total)
+        if self._total < count:
+            msg = (
+                f"total must be greater or equal to the sum of the counts "
+                f"(received: {self._total:,} and {count:,})"
+            )
+            raise ValueError(msg)
+        self._max_error = int(max_error)
+
+    def __len__(self) -> int:
+        return self._counts.size
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__qualname__}(num_values={len(self):,}, total={self._total:,}, "
+            f"null_count={self.null_count:,}, other_count={self.other_count:,})"
+        )
+
+    def __sizeof__(self) -> int:
+        return object.__sizeof__(self) + self._values.estimated_size() + self._counts.nbytes
+
+    @property
+    def values(self) -> pl.Series:
+        r"""The values sorted by decreasing number of occurrences."""
+        return self._values
+
+    @property
+    def counts(self) -> np.ndarray:
+        r"""The number of occurrences of each value.
+
+        The array is read-only.
+        """
+        return self._counts
+
+    @property
+    def total(self) -> int:
+        r"""The total number of occurrences."""
+        return self._total
+
+    @property
+    def max_error(self) -> int:
+        r"""The maximum overestimation of the counts.
+
+        It is ``0`` if the counts are exact. The true number of
+        occurrences of a value is between its count minus
+        ``max_error`` and its count.
+        """
+        return self._max_error
+
+    @property
+    def approximate(self) -> bool:
+        r"""Indicate if the counts are estimated."""
+        return self._max_error > 0
+
+    @property
+    def null_count(self) -> int:
+        r"""The number of occurrences of the null values in the table."""
+        if not self._values.null_count():
+            return 0
+        return int(self._counts[self._values.is_null().to_numpy()].sum())
+
+    @property
+    def other_count(self) -> int:
+        r"""The number of occurrences of the values that are not in the
+        table."""
+        return self._total - int(self._counts.sum())
+
+    @classmethod
+    def from_series(cls, series: pl.Series) -> FrequencyTable:
+        r"""Instantiate a table with the number of occurrences of the
+        values in a series.
+
+        The values are counted with polars, so only the unique values
+        are converted to Python objects. The values with the same
+        number of occurrences are sorted by first occurrence, like
+        ``collections.Counter.most_common``.
+
+        Args:
+            series: The series to analyze.
+
+        Returns:
+            The frequency table.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import polars as pl
+        >>> from flamme.utils.count import FrequencyTable
+        >>> table = FrequencyTable.from_series(pl.Series(["a", "b", None, "a", "a", None]))
+        >>> table.most_common()
+        [('a', 3), (None, 2), ('b', 1)]
+
+        ```
+        """
+        counts = (
+            series.alias("value")
+            .to_frame()
+            .with_row_index("index")
+            .group_by("value")
+            .agg(pl.len().alias("count"), pl.col("index").first())
+            .sort(["count", "index"], descending=[True, False])
+        )
+        return cls(values=counts["value"], counts=counts["count"].to_numpy())
+
+    @classmethod
+    def from_counter(cls, counter: Counter) -> FrequencyTable:
+        r"""Instantiate a table from a counter.
+
+        Args:
+            counter: The counter with the number of occurrences of
+                each value. The null values are represented by
+                ``None``.
+
+        Returns:
+            The frequency table.
+
+        Example usage:
+
+        ```pycon
+
+        >>> from collections import Counter
+        >>> from flamme.utils.count import FrequencyTable
+        >>> table = FrequencyTable.from_counter(Counter({"a": 4, "b": 2, "c": 6}))
+        >>> table.most_common()
+        [('c', 6), ('a', 4), ('b', 2)]
+
+        ```
+        """
+        return cls(values=list(counter.keys()), counts=list(counter.values()))
+
+    @classmethod
+    def from_sketch(cls, sketch: SpaceSaving) -> FrequencyTable:
+        r"""Instantiate a table from a ``SpaceSaving`` sketch.
+
+        Args:
+            sketch: The sketch with the most frequent values.
+
+        Returns:
+            The frequency table. The occurrences of the values that
+                are not tracked by the sketch are counted in
+                ``other_count``, and the maximum overestimation of
+                the counts is stored in ``max_error``.
+
+        Example usage:
+
+        ```pycon
+
+        >>> from flamme.utils.count import FrequencyTable
+        >>> from flamme.utils.sketch import SpaceSaving
+        >>> sketch = SpaceSaving(capacity=1)
+        >>> sketch.update(["a", "b", "a", None])
+        >>> table = FrequencyTable.from_sketch(sketch)
+        >>> table
+        FrequencyTable(num_values=2, total=4, null_count=1, other_count=1)
+        >>> table.max_error
+        1
+
+        ```
+        """
+        counter = sketch.to_counter()
+        return cls(
+            values=list(counter.keys()),
+            counts=list(counter.values()),
+            total=sketch.total,
+            max_error=sketch.max_error,
+        )
+
+    def cumulative_percentages(self) -> np.ndarray:
+        r"""Return the cumulative percentage of occurrences of the values.
+
+        Returns:
+            The cumulative percentage of occurrences of the values,
+                relative to the total number of occurrences.
+
+        Example usage:
+
+        ```pycon
+
+        >>> from flamme.utils.count import FrequencyTable
+        >>> table = FrequencyTable(values=["a", "b", "c"], counts=[6, 3, 1])
+        >>> table.cumulative_percentages()
+        array([ 60.,  90., 100.])
+
+        ```
+        """
+        return _to_percentages(np.cumsum(self._counts), self._total)
+
+    def percentages(self) -> np.ndarray:
+        r"""Return the percentage of occurrences of each value.
+
+        Returns:
+            The percentage of occurrences of each value, relative to
+                the total number of occurrences.
+
+        Example usage:
+
+        ```pycon
+
+        >>> from flamme.utils.count import FrequencyTable
+        >>> table = FrequencyTable(values=["a", "b", "c"], counts=[6, 3, 1])
+        >>> table.percentages()
+        array([60., 30., 10.])
+
+        ```
+        """
+        return _to_percentages(self._counts, self._total)
+
+    def head(self, n: int) -> FrequencyTable:
+        r"""Return the table with the ``n`` most frequent values.
+
+        The total number of occurrences is kept, so the occurrences of
+        the other values are counted in ``other_count``.
+
+        Args:
+            n: The number of values to keep.
+
+        Returns:
+            The truncated table.
+
+        Example usage:
+
+        ```pycon
+
+        >>> from flamme.utils.count import FrequencyTable
+        >>> table = FrequencyTable(values=["a", "b", "c"], counts=[6, 3, 1])
+        >>> table.head(2).most_common()
+        [('a', 6), ('b', 3)]
+        >>> table.head(2).other_count
+        1
+
+        ```
+        """
+        n = max(n, 0)
+        return self.__class__(
+            values=self._values.head(n),
+            counts=self._counts[:n],
+            total=self._total,
+            max_error=self._max_error,
+        )
+
+    def tail(self, n: int) -> FrequencyTable:
+        r"""Return the table with the ``n`` least frequent values.
+
+        The total number of occurrences is kept, so the occurrences of
+        the other values are counted in ``other_count``.
+
+        Args:
+            n: The number of values to keep.
+
+        Returns:
+            The truncated table. The values are still sorted by
+                decreasing number of occurrences.
+
+        Example usage:
+
+        ```pycon
+
+        >>> from flamme.utils.count import FrequencyTable
+        >>> table = FrequencyTable(values=["a", "b", "c"], counts=[6, 3, 1])
+        >>> table.tail(2).most_common()
+        [('b', 3), ('c', 1)]
+
+        ```
+        """
+        n = max(n, 0)
+        return self.__class__(
+            values=self._values.tail(n),
+            counts=self._counts[self._counts.size - min(n, self._counts.size) :],
+            total=self._total,
+            max_error=self._max_error,
+        )
+
+    def merge(self, other: FrequencyTable) -> FrequencyTable:
+        r"""Merge the table with another table.
+
+        Args:
+            other: The other table.
+
+        Returns:
+            The merged table. The number of occurrences of the
+                values in both tables and their maximum
+                overestimations are added.
+
+        Example usage:
+
+        ```pycon
+
+        >>> from flamme.utils.count import FrequencyTable
+        >>> table1 = FrequencyTable(values=["a", "b"], counts=[6, 3])
+        >>> table2 = FrequencyTable(values=["b", "c"], counts=[4, 1])
+        >>> table1.merge(table2).most_common()
+        [('b', 7), ('a', 6), ('c', 1)]
+
+        ```
+        """
+        max_error = self._max_error + other.max_error
+        if not len(other):
+            return self.__class__(
+                self._values, self._counts, total=self._total + other.total, max_error=max_error
+            )
+        if not len(self):
+            return self.__class__(
+                other.values, other.counts, total=self._total + other.total, max_error=max_error
+            )
+        counts = (
+            pl.concat(
+                [
+                    pl.DataFrame({"value": self._values, "count": self._counts}),
+                    pl.DataFrame({"value": other.values, "count": other.counts}),
+                ],
+                how="vertical_relaxed",
+            )
+            .group_by("value", maintain_order=True)
+            .agg(pl.col("count").sum())
+        )
+        return self.__class__(
+            values=counts["value"],
+            counts=counts["count"].to_numpy(),
+            total=self._total + other.total,
+            max_error=max_error,
+        )
+
+    def most_common(self, n: int | None = None) -> list[tuple[Any, int]]:
+        r"""Return the most frequent values and their number of
+        occurrences.
+
+        Args:
+            n: The number of values to return. If ``None``, all the
+                values are returned.
+
+        Returns:
+            The list of values and counts sorted by decreasing count,
+                like ``collections.Counter.most_common``.
+
+        Example usage:
+
+        ```pycon
+
+        >>> from flamme.utils.count import FrequencyTable
+        >>> table = FrequencyTable(values=["a", "b", "c"], counts=[6, 3, 1])
+        >>> table.most_common(2)
+        [('a', 6), ('b', 3)]
+
+        ```
+        """
+        table = self if n is None else self.head(n)
+        return list(zip(table.values.to_list(), table.counts.tolist()))
+
+    def to_counter(self) -> Counter:
+        r"""Return a counter with the number of occurrences of each value.
 
+        Returns:
+            The counter. The null values are represented by ``None``.
 
-def compute_nunique(frame: pl.DataFrame) -> np.ndarray:
+        Example usage:
+
+        ```pycon
+
+        >>> from flamme.utils.count import FrequencyTable
+        >>> table = FrequencyTable(values=["a", None, "c"], counts=[6, 3, 1])
+        >>> table.to_counter()
+        Counter({'a': 6, None: 3, 'c': 1})
+
+        ```
+        """
+        return Counter(dict(self.most_common()))
+
+
+def to_frequency_table(counter: Counter | FrequencyTable) -> FrequencyTable:
+    r"""Convert a counter to a frequency table.
+
+    Args:
+        counter: The counter or frequency table to convert.
+
+    Returns:
+        The frequency table. The input is returned if it is already
+            a frequency table.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from collections import Counter
+    >>> from flamme.utils.count import to_frequency_table
+    >>> to_frequency_table(Counter({"a": 4, "b": 2, "c": 6}))
+    FrequencyTable(num_values=3, total=12, null_count=0, other_count=0)
+
+    ```
+    """
+    if isinstance(counter, FrequencyTable):
+        return counter
+    return FrequencyTable.from_counter(counter)
+
+
+@frame_cache
+def compute_nunique(
+    frame: pl.DataFrame, *, approximate: bool = False, precision: int = 14
+) -> np.ndarray:
     r"""Return the number of unique values in each column.
 
     Args:
         frame: The DataFrame to analyze.
+        approximate: If ``True``, the number of unique values is
+            estimated with a ``HyperLogLog`` sketch instead of
+            computing the exact number of unique values.
+        precision: The precision of the ``HyperLogLog`` sketch.
+            It is ignored if ``approximate`` is ``False``.
 
     Returns:
         An array with the number of unique values in each column.
@@ -38,18 +531,176 @@ def compute_nunique(frame: pl.DataFrame) -> np.ndarray:
     >>> count = compute_nunique(frame)
     >>> count
     array([3, 4, 3])
+    >>> compute_nunique(frame, approximate=True)
+    array([3, 4, 3])
 
     ```
     """
     if (ncols := frame.shape[1]) == 0:
         return np.zeros(ncols, dtype=np.int64)
+    if approximate:
+        return np.array(
+            [estimate_nunique(series, precision=precision) for series in frame], dtype=np.int64
+        )
     return frame.select(pl.all().n_unique()).to_numpy()[0].astype(np.int64)
 
 
+def estimate_nunique(series: pl.Series, precision: int = 14) -> int:
+    r"""Estimate the number of unique values in a series with a
+    ``HyperLogLog`` sketch.
+
+    Args:
+        series: The series to analyze.
+        precision: The precision of the ``HyperLogLog`` sketch.
+
+    Returns:
+        The estimated number of unique values. The null values are
+            counted as one value like ``polars.Series.n_unique``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import polars as pl
+    >>> from flamme.utils.count import estimate_nunique
+    >>> estimate_nunique(pl.Series(["a", "b", None, "a"]))
+    3
+
+    ```
+    """
+    sketch = HyperLogLog(precision=precision)
+    sketch.update(series)
+    return sketch.estimate()
+
+
+def compute_most_frequent_values(
+    series: pl.Series, top: int | None = None
+) -> list[tuple[Any, int]]:
+    r"""Return the most frequent values in a series and their number of
+    occurrences.
+
+    The values are counted with polars, so only the unique values are
+    converted to Python objects. The values with the same number of
+    occurrences are sorted by first occurrence, like
+    ``collections.Counter.most_common``.
+
+    Args:
+        series: The series to analyze.
+        top: The number of values to return. If ``None``, all the
+            values are returned.
+
+    Returns:
+        The list of values and counts sorted by decreasing count.
+            The null values are represented by ``None``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import polars as pl
+    >>> from flamme.utils.count import compute_most_frequent_values
+    >>> compute_most_frequent_values(pl.Series(["a", "b", None, "a", "a", None]))
+    [('a', 3), (None, 2), ('b', 1)]
+    >>> compute_most_frequent_values(pl.Series(["a", "b", None, "a", "a", None]), top=2)
+    [('a', 3), (None, 2)]
+
+    ```
+    """
+    return FrequencyTable.from_series(series).most_common(top)
+
+
+@frame_cache
+def compute_frequency_table(
+    frame: pl.DataFrame, column: str, drop_nulls: bool = False, capacity: int | None = None
+) -> FrequencyTable:
+    r"""Return a table with the number of occurrences of each value in a
+    column.
+
+    Args:
+        frame: The DataFrame to analyze.
+        column: The column to analyze.
+        drop_nulls: If ``True``, the null values are ignored.
+        capacity: If not ``None``, the number of occurrences are
+            approximated with a ``SpaceSaving`` sketch that keeps
+            the ``capacity`` most frequent values. It bounds the
+            memory for columns with many unique values.
+
+    Returns:
+        The frequency table.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import polars as pl
+    >>> from flamme.utils.count import compute_frequency_table
+    >>> frame = pl.DataFrame({"col": ["a", "b", None, "a", "a", None]})
+    >>> table = compute_frequency_table(frame, column="col")
+    >>> table
+    FrequencyTable(num_values=3, total=6, null_count=2, other_count=0)
+    >>> table.most_common()
+    [('a', 3), (None, 2), ('b', 1)]
+    >>> compute_frequency_table(frame, column="col", capacity=1)
+    FrequencyTable(num_values=2, total=6, null_count=2, other_count=1)
+
+    ```
+    """
+    series = frame[column]
+    if drop_nulls:
+        series = series.drop_nulls()
+    if capacity is not None:
+        sketch = SpaceSaving(capacity=capacity)
+        sketch.update(series)
+        return FrequencyTable.from_sketch(sketch)
+    return FrequencyTable.from_series(series)
+
+
+@frame_cache
+def compute_value_counts(
+    frame: pl.DataFrame, column: str, drop_nulls: bool = False, capacity: int | None = None
+) -> Counter:
+    r"""Return the number of occurrences of each value in a column.
+
+    Args:
+        frame: The DataFrame to analyze.
+        column: The column to analyze.
+        drop_nulls: If ``True``, the null values are ignored.
+        capacity: If not ``None``, the number of occurrences are
+            approximated with a ``SpaceSaving`` sketch that keeps
+            the ``capacity`` most frequent values. It bounds the
+            memory for columns with many unique values.
+
+    Returns:
+        A counter with the number of occurrences of each value.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import polars as pl
+    >>> from flamme.utils.count import compute_value_counts
+    >>> frame = pl.DataFrame({"col": ["a", "b", None, "a", "a", None]})
+    >>> compute_value_counts(frame, column="col")
+    Counter({'a': 3, None: 2, 'b': 1})
+    >>> compute_value_counts(frame, column="col", drop_nulls=True)
+    Counter({'a': 3, 'b': 1})
+    >>> compute_value_counts(frame, column="col", capacity=1)
+    Counter({'a': 3, None: 2})
+
+    ```
+    """
+    return compute_frequency_table(
+        frame, column=column, drop_nulls=drop_nulls, capacity=capacity
+    ).to_counter()
+
+
+@frame_cache
 def compute_temporal_count(
     frame: pl.DataFrame,
     dt_column: str,
     period: str,
+    *,
+    base_period: str | None = None,
 ) -> tuple[np.ndarray, list[str]]:
     r"""Prepare the data to create the figure and table.
 
@@ -58,6 +709,9 @@ def compute_temporal_count(
         dt_column: The datetime column used to analyze
             the temporal distribution.
         period: The temporal period e.g. monthly or daily.
+        base_period: If not ``None``, the counts are computed from
+            the temporal cube with this base period, which is shared
+            by all the periods that can be rolled up from it.
 
     Returns:
         A tuple with the counts and the temporal steps.
@@ -102,16 +756,14 @@ def compute_temporal_count(
     if frame.is_empty():
         return np.array([], dtype=np.int64), []
 
-    groups = (
-        frame.select(pl.col(dt_column).alias("datetime"), pl.lit(1).alias("count"))
-        .sort("datetime")
-        .group_by_dynamic("datetime", every=period)
-    )
-    steps = to_step_names(groups=groups, period=period)
-    counts = groups.agg(pl.col("count").sum())["count"].to_numpy().astype(np.int64)
-    return counts, steps
+    if base_period is not None:
+        cube = get_temporal_cube(frame, dt_column=dt_column, period=base_period)
+        return cube.get_num_rows(period), cube.get_step_names(period)
+    index = get_temporal_index(frame, dt_column)
+    return np.diff(index.get_offsets(period)), index.get_step_names(period)
 
 
+@frame_cache
 def compute_temporal_value_counts(
     frame: pl.DataFrame,
     column: str,
@@ -184,12 +836,16 @@ def compute_temporal_value_counts(
     if frame.is_empty():
         return np.zeros((0, 0), dtype=np.int64), [], []
 
-    frame = frame.select(pl.col(dt_column).alias("__datetime__"), pl.col(column).alias("value"))
+    index = get_temporal_index(frame, dt_column)
+    frame = index.sort(
+        frame.select(pl.col(dt_column).alias("__datetime__"), pl.col(column).alias("value"))
+    )
     if drop_nulls:
         frame = frame.drop_nulls()
+        index = TemporalIndex(frame["__datetime__"])
 
-    groups = frame.sort(["__datetime__", "value"]).group_by_dynamic("__datetime__", every=period)
-    steps = to_step_names(groups=groups, period="1mo")
+    groups = frame.group_by_dynamic("__datetime__", every=period)
+    steps = index.get_step_names(period)
     frame_counts = (
         groups.agg(pl.col("value").value_counts())
         .explode("value")
@@ -200,3 +856,22 @@ def compute_temporal_value_counts(
     frame_counts = frame_counts.select(mixed_typed_sort(frame_counts.columns))
     counts = frame_counts.fill_null(0.0).to_numpy().astype(np.int64).transpose()
     return counts, steps, list(frame_counts.columns)
+
+
+def _create_series(values: Sequence[Any]) -> pl.Series:
+    r"""Create a series from a sequence of values.
+
+    The values with mixed types are stored in a series of objects.
+    """
+    try:
+        return pl.Series(values)
+    except TypeError:
+        return pl.Series(values, dtype=pl.Object)
+
+
+def _to_percentages(counts: np.ndarray, total: int) -> np.ndarray:
+    r"""Convert the numbers of occurrences to percentages of the
+    total."""
+    if total == 0:
+        return np.full(counts.shape, np.nan)
+    return 100.0 * counts / total
@@ -0,0 +1,649 @@
+r"""Contain a temporal cube to compute the temporal statistics for
+several periods from the same partial aggregates."""
+
+from __future__ import annotations
+
+__all__ = ["TemporalCube", "get_temporal_cube"]
+
+import logging
+import sys
+import threading
+import weakref
+from typing import TYPE_CHECKING
+
+import numpy as np
+import polars as pl
+from grizz.utils.interval import interval_to_strftime_format
+
+from flamme.utils.cache import frame_cache
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+logger = logging.getLogger(__name__)
+
+# The quantiles reported by ``TemporalCube.get_stats``.
+QUANTILES = {
+    "q01": 0.01,
+    "q05": 0.05,
+    "q10": 0.1,
+    "q25": 0.25,
+    "median": 0.5,
+    "q75": 0.75,
+    "q90": 0.9,
+    "q95": 0.95,
+    "q99": 0.99,
+}
+
+
+class TemporalCube:
+    r"""Implement a temporal cube with mergeable partial aggregates.
+
+    The cube computes, for each temporal window of the base period,
+    the number of rows and, for each column, the number of null
+    values. For the numeric columns, it also computes the mean, the
+    sum of squared deviations from the mean, the minimum, the maximum,
+    and a quantile sketch with ``num_quantiles`` evenly spaced
+    quantiles. The statistics of
+    a coarser period are computed by merging the partial aggregates
+    of the base windows, so the raw rows are read once for all the
+    periods. Each window of the coarser period must be a union of
+    windows of the base period e.g. ``'1d'`` can be rolled up to
+    ``'1w'`` or ``'1mo'``, but ``'1w'`` cannot be rolled up to
+    ``'1mo'``.
+
+    The counts and the extrema are exact. The means and the sums of
+    squared deviations are merged with the parallel algorithm of Chan
+    et al., so the standard deviation does not suffer from the
+    cancellation of the sum of squares formula. The quantiles of a
+    rolled up window are approximated by merging the quantile
+    sketches of its base windows.
+
+    The partial aggregates of a column are computed the first time
+    the column is requested. The cube only keeps a weak reference to
+    the DataFrame, so the DataFrame must be alive when a new column
+    is requested.
+
+    Args:
+        frame: The DataFrame to analyze.
+        dt_column: The datetime column used to create the temporal
+            windows.
+        period: The base temporal period e.g. daily. It should be the
+            finest period that is analyzed.
+        num_quantiles: The number of quantiles in the quantile sketch
+            of each base window. The quantiles are denser in the
+            tails, and the quantiles reported by ``get_stats`` are
+            added to the sketch.
+
+    Raises:
+        ValueError: if the datetime column has null values.
+        ValueError: if ``num_quantiles`` is lower than 2.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from datetime import datetime, timezone
+    >>> import polars as pl
+    >>> from flamme.utils.cube import TemporalCube
+    >>> frame = pl.DataFrame(
+    ...     {
+    ...         "col": [1.0, None, 3.0, 4.0],
+    ...         "datetime": [
+    ...             datetime(year=2020, month=1, day=3, tzinfo=timezone.utc),
+    ...             datetime(year=2020, month=1, day=4, tzinfo=timezone.utc),
+    ...             datetime(year=2020, month=1, day=4, tzinfo=timezone.utc),
+    ...             datetime(year=2020, month=2, day=3, tzinfo=timezone.utc),
+    ...         ],
+    ...     },
+    ... )
+    >>> cube = TemporalCube(frame, dt_column="datetime", period="1d")
+    >>> cube.get_step_names("1d")
+    ['2020-01-03', '2020-01-04', '2020-02-03']
+    >>> cube.get_num_rows("1mo")
+    array([3, 1])
+    >>> cube.get_null_count(["col"], period="1mo")
+    array([[1, 0]])
+
+    ```
+    """
+
+    def __init__(
+        self, frame: pl.DataFrame, dt_column: str, period: str, num_quantiles: int = 101
+    ) -> None:
+        if num_quantiles < 2:
+            msg = f"num_quantiles must be greater or equal to 2 (received: {num_quantiles})"
+            raise ValueError(msg)
+        if frame[dt_column].null_count():
+            msg = f"The datetime column {dt_column} has null values which are not supported"
+            raise ValueError(msg)
+        self._frame = weakref.ref(frame)
+        self._dt_column = dt_column
+        self._period = period
+        self._num_quantiles = num_quantiles
+        # The levels are denser in the tails, where the distributions
+        # change faster, and include the reported quantiles.
+        self._levels = np.unique(
+            np.concatenate(
+                [
+                    (1.0 - np.cos(np.pi * np.arange(num_quantiles) / (num_quantiles - 1))) / 2.0,
+                    list(QUANTILES.values()),
+                ]
+            )
+        )
+
+        windows = (
+            frame.group_by(self._get_step_expr())
+            .agg(pl.len().cast(pl.Int64).alias("num_rows"))
+            .sort("step")
+        )
+        self._steps = windows["step"]
+        self._num_rows = windows["num_rows"].to_numpy()
+        # The partial aggregates of each column. The rows are aligned
+        # with the base windows.
+        self._partials: dict[str, dict[str, np.ndarray]] = {}
+        # The start and the offsets of the windows of each period.
+        self._rollups: dict[str, tuple[list, np.ndarray]] = {}
+        self._lock = threading.RLock()
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__qualname__}(dt_column={self._dt_column}, period={self._period}, "
+            f"num_windows={len(self._num_rows):,}, num_quantiles={self._num_quantiles:,}, "
+            f"columns={list(self._partials)})"
+        )
+
+    def __sizeof__(self) -> int:
+        return (
+            object.__sizeof__(self)
+            + self._steps.estimated_size()
+            + self._num_rows.nbytes
+            + sum(
+                sum(array.nbytes for array in partials.values())
+                for partials in self._partials.values()
+            )
+            + sum(
+                sys.getsizeof(starts) + offsets.nbytes for starts, offsets in self._rollups.values()
+            )
+        )
+
+    @property
+    def dt_column(self) -> str:
+        r"""The datetime column used to create the temporal windows."""
+        return self._dt_column
+
+    @property
+    def period(self) -> str:
+        r"""The base temporal period."""
+        return self._period
+
+    def prepare(self, columns: Sequence[str]) -> None:
+        r"""Compute the partial aggregates of some columns.
+
+        The partial aggregates of all the missing columns are
+        computed with a single group-by, so it is faster to prepare
+        all the columns before requesting their statistics one by one.
+
+        Args:
+            columns: The columns to prepare.
+
+        Example usage:
+
+        ```pycon
+
+        >>> from datetime import datetime, timezone
+        >>> import polars as pl
+        >>> from flamme.utils.cube import TemporalCube
+        >>> frame = pl.DataFrame(
+        ...     {
+        ...         "col1": [1, 2, 3],
+        ...         "col2": [1.2, 4.2, None],
+        ...         "datetime": [
+        ...             datetime(year=2020, month=1, day=3, tzinfo=timezone.utc),
+        ...             datetime(year=2020, month=1, day=4, tzinfo=timezone.utc),
+        ...             datetime(year=2020, month=3, day=3, tzinfo=timezone.utc),
+        ...         ],
+        ...     },
+        ... )
+        >>> cube = TemporalCube(frame, dt_column="datetime", period="1d")
+        >>> cube.prepare(["col1", "col2"])
+        >>> cube
+        TemporalCube(dt_column=datetime, period=1d, num_windows=3, num_quantiles=101, columns=['col1', 'col2'])
+
+        ```
+        """
+        self._get_partials(columns)
+
+    def get_step_names(self, period: str) -> list[str]:
+        r"""Return the name of each temporal window.
+
+        Args:
+            period: The temporal period e.g. monthly or daily.
+
+        Returns:
+            A list that contains the name of each temporal window.
+
+        Raises:
+            ValueError: if the period cannot be computed from the base
+                period.
+
+        Example usage:
+
+        ```pycon
+
+        >>> from datetime import datetime, timezone
+        >>> import polars as pl
+        >>> from flamme.utils.cube import TemporalCube
+        >>> frame = pl.DataFrame(
+        ...     {
+        ...         "datetime": [
+        ...             datetime(year=2020, month=1, day=3, tzinfo=timezone.utc),
+        ...             datetime(year=2020, month=2, day=3, tzinfo=timezone.utc),
+        ...         ],
+        ...     },
+        ... )
+        >>> cube = TemporalCube(frame, dt_column="datetime", period="1d")
+        >>> cube.get_step_names("1mo")
+        ['2020-01', '2020-02']
+
+        ```
+        """
+        format_dt = interval_to_strftime_format(period)
+        return [start.strftime(format_dt) for start in self._get_rollup(period)[0]]
+
+    def get_num_rows(self, period: str) -> np.ndarray:
+        r"""Return the number of rows of each temporal window.
+
+        Args:
+            period: The temporal period e.g. monthly or daily.
+
+        Returns:
+            A 1-d array with the number of rows of each temporal
+                window.
+
+        Raises:
+            ValueError: if the period cannot be computed from the base
+                period.
+
+        Example usage:
+
+        ```pycon
+
+        >>> from datetime import datetime, timezone
+        >>> import polars as pl
+        >>> from flamme.utils.cube import TemporalCube
+        >>> frame = pl.DataFrame(
+        ...     {
+        ...         "datetime": [
+        ...             datetime(year=2020, month=1, day=3, tzinfo=timezone.utc),
+        ...             datetime(year=2020, month=1, day=4, tzinfo=timezone.utc),
+        ...             datetime(year=2020, month=2, day=3, tzinfo=timezone.utc),
+        ...         ],
+        ...     },
+        ... )
+        >>> cube = TemporalCube(frame, dt_column="datetime", period="1d")
+        >>> cube.get_num_rows("1mo")
+        array([2, 1])
+
+        ```
+        """
+        return _reduce(np.add, self._num_rows, self._get_rollup(period)[1])
+
+    def get_null_count(self, columns: Sequence[str], period: str) -> np.ndarray:
+        r"""Return the number of null values of each column and temporal
+        window.
+
+        Args:
+            columns: The columns to analyze.
+            period: The temporal period e.g. monthly or daily.
+
+        Returns:
+            A 2-d array with the number of null values. The first
+                dimension represents the columns and the second
+                dimension represents the temporal windows.
+
+        Raises:
+            ValueError: if the period cannot be computed from the base
+                period.
+
+        Example usage:
+
+        ```pycon
+
+        >>> from datetime import datetime, timezone
+        >>> import polars as pl
+        >>> from flamme.utils.cube import TemporalCube
+        >>> frame = pl.DataFrame(
+        ...     {
+        ...         "col1": [1, None, None],
+        ...         "col2": ["a", "b", None],
+        ...         "datetime": [
+        ...             datetime(year=2020, month=1, day=3, tzinfo=timezone.utc),
+        ...             datetime(year=2020, month=1, day=4, tzinfo=timezone.utc),
+        ...             datetime(year=2020, month=2, day=3, tzinfo=timezone.utc),
+        ...         ],
+        ...     },
+        ... )
+        >>> cube = TemporalCube(frame, dt_column="datetime", period="1d")
+        >>> cube.get_null_count(["col1", "col2"], period="1mo")
+        array([[1, 1],
+               [0, 1]])
+
+        ```
+        """
+        offsets = self._get_rollup(period)[1]
+        partials = self._get_partials(columns)
+        nulls = np.zeros((len(columns), len(offsets) - 1), dtype=np.int64)
+        for i, column in enumerate(columns):
+            nulls[i] = _reduce(np.add, partials[column]["null"], offsets)
+        return nulls
+
+    def get_stats(self, column: str, period: str) -> pl.DataFrame:
+        r"""Return a DataFrame with stats for each temporal window.
+
+        The output has the same columns as ``compute_temporal_stats``.
+        The number of unique values cannot be merged, so the column
+        ``nunique`` is null.
+
+        Args:
+            column: The numeric column to analyze.
+            period: The temporal period e.g. monthly or daily.
+
+        Returns:
+            A DataFrame with stats for each temporal window.
+
+        Raises:
+            ValueError: if the column is not numeric.
+            ValueError: if the period cannot be computed from the base
+                period.
+
+        Example usage:
+
+        ```pycon
+
+        >>> from datetime import datetime, timezone
+        >>> import polars as pl
+        >>> from flamme.utils.cube import TemporalCube
+        >>> frame = pl.DataFrame(
+        ...     {
+        ...         "col": [1.0, 2.0, 3.0, 4.0],
+        ...         "datetime": [
+        ...             datetime(year=2020, month=1, day=3, tzinfo=timezone.utc),
+        ...             datetime(year=2020, month=1, day=4, tzinfo=timezone.utc),
+        ...             datetime(year=2020, month=1, day=4, tzinfo=timezone.utc),
+        ...             datetime(year=2020, month=2, day=3, tzinfo=timezone.utc),
+        ...         ],
+        ...     },
+        ... )
+        >>> cube = TemporalCube(frame, dt_column="datetime", period="1d")
+        >>> stats = cube.get_stats("col", period="1mo")
+        >>> stats.select("step", "count", "mean", "min", "max")
+        shape: (2, 5)
+        ┌─────────────────────────┬───────┬──────┬─────┬─────┐
+        │ step                    ┆ count ┆ mean ┆ min ┆ max │
+        │ ---                     ┆ ---   ┆ ---  ┆ --- ┆ --- │
+        │ datetime[μs, UTC]       ┆ i64   ┆ f64  ┆ f64 ┆ f64 │
+        ╞═════════════════════════╪═══════╪══════╪═════╪═════╡
+        │ 2020-01-01 00:00:00 UTC ┆ 3     ┆ 2.0  ┆ 1.0 ┆ 3.0 │
+        │ 2020-02-01 00:00:00 UTC ┆ 1     ┆ 4.0  ┆ 4.0 ┆ 4.0 │
+        └─────────────────────────┴───────┴──────┴─────┴─────┘
+
+        ```
+        """
+        starts, offsets = self._get_rollup(period)
+        partials = self._get_partials([column])[column]
+        if "quantiles" not in partials:
+            msg = f"The column {column} is not numeric"
+            raise ValueError(msg)
+        count, mean, m2 = _merge_moments(
+            counts=partials["count"], means=partials["mean"], m2s=partials["m2"], offsets=offsets
+        )
+        with np.errstate(invalid="ignore", divide="ignore"):
+            std = np.sqrt(m2 / (count - 1))
+        quantiles = np.full((len(starts), len(self._levels)), np.nan)
+        for i, (start, end) in enumerate(zip(offsets[:-1], offsets[1:])):
+            quantiles[i] = _merge_quantiles(
+                quantiles=partials["quantiles"][start:end],
+                weights=partials["count"][start:end],
+                levels=self._levels,
+            )
+        stats = pl.DataFrame(
+            {
+                "step": pl.Series(starts, dtype=self._steps.dtype),
+                "count": self.get_num_rows(period),
+                "nunique": pl.Series([None] * len(starts), dtype=pl.Int64),
+                "mean": mean,
+                "std": std,
+                "min": _reduce(np.fmin, partials["min"], offsets),
+                **{
+                    name: [np.interp(q, self._levels, row) for row in quantiles]
+                    for name, q in QUANTILES.items()
+                },
+                "max": _reduce(np.fmax, partials["max"], offsets),
+                "__count__": count,
+            },
+        )
+        return stats.select(
+            "step",
+            "count",
+            "nunique",
+            *[
+                pl.when(pl.col("__count__") > (1 if name == "std" else 0))
+                .then(pl.col(name))
+                .cast(pl.Float64)
+                .alias(name)
+                for name in ["mean", "std", "min", *QUANTILES, "max"]
+            ],
+        )
+
+    def _get_step_expr(self) -> pl.Expr:
+        r"""Return the expression to compute the start of the base
+        window of each row."""
+        return pl.col(self._dt_column).dt.truncate(self._period).alias("step")
+
+    def _get_partials(self, columns: Sequence[str]) -> dict[str, dict[str, np.ndarray]]:
+        r"""Return the partial aggregates of some columns, and compute
+        the missing ones."""
+        with self._lock:
+            missing = [column for column in dict.fromkeys(columns) if column not in self._partials]
+            if missing:
+                self._partials.update(self._compute_partials(missing))
+            return {column: self._partials[column] for column in columns}
+
+    def _compute_partials(self, columns: Sequence[str]) -> dict[str, dict[str, np.ndarray]]:
+        r"""Compute the partial aggregates of some columns."""
+        frame = self._frame()
+        if frame is None:
+            msg = "The DataFrame used to create the temporal cube was garbage collected"
+            raise RuntimeError(msg)
+        logger.debug(
+            f"Computing the temporal partial aggregates of {len(columns):,} columns "
+            f"(period: {self._period})..."
+        )
+        numeric = [column for column in columns if frame.schema[column].is_numeric()]
+        exprs = [pl.col(column).null_count().alias(f"{i}/null") for i, column in enumerate(columns)]
+        for column in numeric:
+            i = columns.index(column)
+            value = pl.col(column).cast(pl.Float64)
+            exprs.extend(
+                [
+                    value.mean().alias(f"{i}/mean"),
+                    (value - value.mean()).pow(2).sum().alias(f"{i}/m2"),
+                    value.min().alias(f"{i}/min"),
+                    value.max().alias(f"{i}/max"),
+                ]
+            )
+        aggs = frame.group_by(self._get_step_expr()).agg(exprs).sort("step")
+
+        partials = {}
+        for i, column in enumerate(columns):
+            null = aggs[f"{i}/null"].cast(pl.Int64).to_numpy()
+            partials[column] = {"null": null, "count": self._num_rows - null}
+        for column in numeric:
+            i = columns.index(column)
+            partials[column].update(
+                {
+                    key: aggs[f"{i}/{key}"].cast(pl.Float64).to_numpy()
+                    for key in ["mean", "m2", "min", "max"]
+                }
+            )
+            partials[column]["quantiles"] = self._compute_quantiles(
+                frame, column, partials[column]["count"]
+            )
+        for arrays in partials.values():
+            for array in arrays.values():
+                array.flags.writeable = False
+        return partials
+
+    def _compute_quantiles(
+        self, frame: pl.DataFrame, column: str, counts: np.ndarray
+    ) -> np.ndarray:
+        r"""Compute the quantile sketch of each base window.
+
+        The values are sorted by window and value, so the quantiles
+        of all the windows are gathered with a single indexing
+        operation.
+        """
+        values = (
+            frame.select(self._get_step_expr(), pl.col(column).cast(pl.Float64).alias("value"))
+            .drop_nulls("value")
+            .sort("step", "value")["value"]
+            .to_numpy()
+        )
+        quantiles = np.full((len(counts), len(self._levels)), np.nan)
+        if values.size == 0:
+            return quantiles
+        starts = np.cumsum(counts) - counts
+        # The halves are rounded up like the ``'nearest'`` interpolation
+        # of polars.
+        indices = starts[:, None] + np.floor(
+            self._levels[None, :] * np.maximum(counts - 1, 0)[:, None] + 0.5
+        ).astype(np.int64)
+        valid = counts > 0
+        quantiles[valid] = values[indices[valid]]
+        return quantiles
+
+    def _get_rollup(self, period: str) -> tuple[list, np.ndarray]:
+        r"""Return the start of each window of the period and the
+        offsets of its base windows."""
+        with self._lock:
+            if period not in self._rollups:
+                self._rollups[period] = self._compute_rollup(period)
+            return self._rollups[period]
+
+    def _compute_rollup(self, period: str) -> tuple[list, np.ndarray]:
+        r"""Compute the start of each window of the period and the
+        offsets of its base windows."""
+        starts = self._steps.dt.truncate(period)
+        ends = self._steps.dt.offset_by(self._period)
+        end_starts = ends.dt.truncate(period)
+        if not ((end_starts == starts) | (end_starts == ends)).all():
+            msg = (
+                f"The period {period} cannot be computed from the base period {self._period} "
+                "because some base windows overlap two windows"
+            )
+            raise ValueError(msg)
+        runs = starts.rle()
+        offsets = np.zeros(runs.len() + 1, dtype=np.int64)
+        np.cumsum(runs.struct.field("len").to_numpy(), out=offsets[1:])
+        offsets.flags.writeable = False
+        return runs.struct.field("value").to_list(), offsets
+
+
+@frame_cache
+def get_temporal_cube(frame: pl.DataFrame, dt_column: str, period: str) -> TemporalCube:
+    r"""Return the temporal cube of a DataFrame.
+
+    The cube is stored in the active computation cache, so it is
+    computed once per DataFrame, datetime column and base period, and
+    shared by the temporal analyzers and sections.
+
+    Args:
+        frame: The DataFrame to analyze.
+        dt_column: The datetime column used to create the temporal
+            windows.
+        period: The base temporal period e.g. daily.
+
+    Returns:
+        The temporal cube.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from datetime import datetime, timezone
+    >>> import polars as pl
+    >>> from flamme.utils.cube import get_temporal_cube
+    >>> frame = pl.DataFrame(
+    ...     {
+    ...         "col": [1, 2, 3],
+    ...         "datetime": [
+    ...             datetime(year=2020, month=1, day=3, tzinfo=timezone.utc),
+    ...             datetime(year=2020, month=1, day=4, tzinfo=timezone.utc),
+    ...             datetime(year=2020, month=3, day=3, tzinfo=timezone.utc),
+    ...         ],
+    ...     },
+    ... )
+    >>> cube = get_temporal_cube(frame, dt_column="datetime", period="1d")
+    >>> cube
+    TemporalCube(dt_column=datetime, period=1d, num_windows=3, num_quantiles=101, columns=[])
+
+    ```
+    """
+    return TemporalCube(frame, dt_column=dt_column, period=period)
+
+
+def _reduce(ufunc: np.ufunc, values: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    r"""Reduce the values of the base windows of each window."""
+    if offsets.size < 2:
+        return np.zeros(0, dtype=values.dtype)
+    return ufunc.reduceat(values, offsets[:-1])
+
+
+def _merge_moments(
+    counts: np.ndarray, means: np.ndarray, m2s: np.ndarray, offsets: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    r"""Merge the number of values, the mean, and the sum of squared
+    deviations from the mean of the base windows of each window.
+
+    The merge follows the parallel algorithm of Chan et al.: the sum
+    of squared deviations of a window is the sum of the ones of its
+    base windows plus the squared deviations of the base window means
+    from the window mean, weighted by the base window counts.
+    """
+    count = _reduce(np.add, counts, offsets)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        # The mean of an empty base window is NaN, and it has no weight.
+        weighted = np.where(counts > 0, counts * means, 0.0)
+        mean = _reduce(np.add, weighted, offsets) / count
+        delta = np.where(counts > 0, means - np.repeat(mean, np.diff(offsets)), 0.0)
+    m2 = _reduce(np.add, m2s + counts * delta**2, offsets)
+    return count, mean, m2
+
+
+def _merge_quantiles(quantiles: np.ndarray, weights: np.ndarray, levels: np.ndarray) -> np.ndarray:
+    r"""Merge the quantile sketches of several windows.
+
+    Each quantile of a window holds the values whose rank is closer
+    to its rank than to the rank of the other quantiles, so the
+    merge is exact if each window has fewer values than quantiles.
+    The quantiles of the merged windows are then read from the
+    weighted values.
+    """
+    valid = weights > 0
+    quantiles, weights = quantiles[valid], weights[valid]
+    if quantiles.shape[0] == 0:
+        return np.full(levels.shape, np.nan)
+    if quantiles.shape[0] == 1:
+        return quantiles[0]
+    values, masses = [], []
+    for row, weight in zip(quantiles, weights):
+        ranks, indices = np.unique(np.floor(levels * (weight - 1) + 0.5), return_index=True)
+        edges = np.concatenate([[0], np.floor((ranks[:-1] + ranks[1:]) / 2) + 1, [weight]])
+        values.append(row[indices])
+        masses.append(np.diff(edges))
+    values = np.concatenate(values)
+    order = np.argsort(values, kind="stable")
+    cumsum = np.cumsum(np.concatenate(masses)[order])
+    ranks = np.floor(levels * (cumsum[-1] - 1) + 0.5)
+    return values[order][np.searchsorted(cumsum, ranks, side="right")]
@@ -3,15 +3,14 @@ r"""Contain utility functions to manage data types."""
 from __future__ import annotations
 
 __all__ = [
+    "dtype_types",
     "frame_types",
     "series_types",
 ]
 
 import logging
-from typing import TYPE_CHECKING
 
-if TYPE_CHECKING:
-    import polars as pl
+import polars as pl
 
 
 logger = logging.getLogger(__name__)
@@ -72,6 +71,49 @@ def series_types(series: pl.Series) -> set[type]:
     return {type(x) for x in series.to_list()}
 
 
+def dtype_types(dtype: pl.DataType, null_count: int, num_rows: int) -> set[type] | None:
+    r"""Return the value types of a column from its data type and its
+    number of null values.
+
+    The values of a column have the Python type of the column data
+    type, and the null values are ``None``. It gives the same output
+    as ``series_types`` without converting the values to Python
+    objects.
+
+    Args:
+        dtype: The column data type.
+        null_count: The number of null values in the column.
+        num_rows: The number of rows in the column.
+
+    Returns:
+        The value types in the column, or ``None`` if they cannot be
+            found from the data type e.g. for ``polars.Object``
+            columns.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import polars as pl
+    >>> from flamme.utils.dtype import dtype_types
+    >>> dtype_types(pl.Float64(), null_count=0, num_rows=4)
+    {<class 'float'>}
+    >>> dtype_types(pl.String(), null_count=4, num_rows=4)
+    {<class 'NoneType'>}
+    >>> dtype_types(pl.Object(), null_count=0, num_rows=4)
+
+    ```
+    """
+    if dtype == pl.Object:
+        return None
+    types = set()
+    if null_count > 0:
+        types.add(type(None))
+    if null_count < num_rows:
+        types.add(dtype.to_python())
+    return types
+
+
 TYPE_NAMES = {}
 
 
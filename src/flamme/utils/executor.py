@@ -0,0 +1,149 @@
+r"""Contain utility functions to execute tasks in parallel."""
+
+from __future__ import annotations
+
+__all__ = ["is_parallel_worker", "parallel_map"]
+
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, TypeVar
+
+import polars as pl
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+EXECUTORS = ("process", "thread")
+
+# Indicate if the current thread is a worker of a thread pool.
+_thread_state = threading.local()
+# Indicate if the current process is a worker of a process pool.
+_process_state = {"worker": False}
+
+
+def is_parallel_worker() -> bool:
+    r"""Indicate if the code is executed by a worker of
+    ``parallel_map``.
+
+    This function is used to avoid nested pools, because the nested
+    tasks would compete for the same cores.
+
+    Returns:
+        ``True`` if the code is executed by a worker, otherwise
+            ``False``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from flamme.utils.executor import is_parallel_worker, parallel_map
+    >>> is_parallel_worker()
+    False
+    >>> parallel_map(lambda _: is_parallel_worker(), [1, 2], executor="thread")
+    [True, True]
+
+    ```
+    """
+    return getattr(_thread_state, "worker", False) or _process_state["worker"]
+
+
+def parallel_map(
+    fn: Callable[[Any], T],
+    items: Iterable[Any],
+    executor: str | None = None,
+    max_workers: int | None = None,
+    *,
+    initializer: Callable[..., Any] | None = None,
+    initargs: tuple[Any, ...] = (),
+) -> list[T]:
+    r"""Apply a function to each item, possibly in parallel.
+
+    The outputs are returned in the same order as the inputs.
+    The items are processed sequentially if ``executor`` is ``None``,
+    if there are less than two items, or if the function is called
+    by a worker of another ``parallel_map`` call.
+
+    Args:
+        fn: The function to apply to each item. It must be picklable
+            if ``executor='process'``.
+        items: The items to process.
+        executor: The executor used to process the items.
+            The valid values are ``None`` (sequential), ``'thread'``
+            and ``'process'``.
+        max_workers: The maximum number of workers. If ``None``, it
+            is the size of the polars thread pool for ``'thread'``
+            and the number of CPUs for ``'process'``.
+        initializer: An optional function called at the start of
+            each worker process with ``initargs``. It can be used to
+            send data only once to each worker process instead of
+            once per item. It is not used by the other executors.
+        initargs: The arguments given to ``initializer``.
+
+    Returns:
+        The outputs of the function for each item.
+
+    Raises:
+        ValueError: if the executor is invalid.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from flamme.utils.executor import parallel_map
+    >>> parallel_map(str, [1, 2, 3])
+    ['1', '2', '3']
+    >>> parallel_map(str, [1, 2, 3], executor="thread", max_workers=2)
+    ['1', '2', '3']
+
+    ```
+    """
+    if executor is not None and executor not in EXECUTORS:
+        msg = f"Incorrect executor: {executor}. The valid values are: None, {EXECUTORS}"
+        raise ValueError(msg)
+    items = list(items)
+    if executor is None or len(items) < 2 or is_parallel_worker():
+        return [fn(item) for item in items]
+    if max_workers is None:
+        max_workers = pl.thread_pool_size() if executor == "thread" else os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, len(items)))
+    logger.debug(f"Processing {len(items):,} items with {max_workers:,} {executor} workers...")
+    if executor == "thread":
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(_ThreadTask(fn), items))
+    # The processes are spawned because forking a process that uses the
+    # polars thread pool can deadlock.
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_process_worker,
+        initargs=(initializer, initargs),
+    ) as pool:
+        return list(pool.map(fn, items))
+
+
+class _ThreadTask:
+    r"""Wrap a function to mark the thread as a worker."""
+
+    def __init__(self, fn: Callable[[Any], T]) -> None:
+        self._fn = fn
+
+    def __call__(self, item: Any) -> T:
+        _thread_state.worker = True
+        try:
+            return self._fn(item)
+        finally:
+            _thread_state.worker = False
+
+
+def _init_process_worker(initializer: Callable[..., Any] | None, initargs: tuple[Any, ...]) -> None:
+    r"""Mark the process as a worker and call the user initializer."""
+    _process_state["worker"] = True
+    if initializer is not None:
+        initializer(*initargs)
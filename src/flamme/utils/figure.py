@@ -2,22 +2,52 @@ r"""Contain utility functions to manage matplotlib figures."""
 
 from __future__ import annotations
 
-__all__ = ["MISSING_FIGURE_MESSAGE", "figure2html"]
+__all__ = [
+    "FIGURE_BACKENDS",
+    "MISSING_FIGURE_MESSAGE",
+    "figure2html",
+    "get_figure_backend",
+    "get_figure_sink",
+    "use_figure_backend",
+    "use_figure_sink",
+]
 
-import base64
-import io
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
 
 from matplotlib import pyplot as plt
 
+from flamme.utils.figure_sink import InlineFigureSink
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    from flamme.utils.figure_sink import BaseFigureSink
+
 MISSING_FIGURE_MESSAGE = (
     "<span>&#9888;</span> No figure is generated because of missing or incorrect data"
 )
 
+# The backends used to draw the figures. ``'svg'`` draws the simple
+# bar, histogram and line figures as inline SVG (see
+# ``flamme.plot.svg``) and uses matplotlib for the other figures.
+# ``'client'`` embeds the data of the simple figures as JSON so they
+# are drawn by the browser (see ``flamme.plot.figure_data``).
+FIGURE_BACKENDS = ("matplotlib", "svg", "client")
+
+# The backend used by the sections to draw the figures, and the sink
+# used to store the images of the matplotlib figures.
+_state: dict[str, Any] = {"backend": "matplotlib", "sink": InlineFigureSink()}
+
 
 def figure2html(fig: plt.Figure | None, reactive: bool = True, close_fig: bool = False) -> str:
     r"""Convert a matplotlib figure to a string that can be used in a
     HTML file.
 
+    The image of the figure is stored by the active figure sink (see
+    ``use_figure_sink``). By default, the image is inlined in the
+    HTML as a base64-encoded PNG image.
+
     Args:
         fig: The figure to convert.
         reactive: If ``True``, the generated is configured to be
@@ -42,11 +72,130 @@ def figure2html(fig: plt.Figure | None, reactive: bool = True, close_fig: bool =
     if fig is None:
         return MISSING_FIGURE_MESSAGE
     fig.tight_layout()
-    img = io.BytesIO()
-    fig.savefig(img, format="png", bbox_inches="tight")
-    img.seek(0)
-    data = base64.b64encode(img.getvalue()).decode("utf-8")
+    src = get_figure_sink().save(fig)
     if close_fig:
         plt.close(fig)
     style = 'style="width:100%; height:auto;" ' if reactive else False
-    return f'<img {style}src="data:image/png;charset=utf-8;base64, {data}">'
+    return f'<img {style}src="{src}">'
+
+
+def get_figure_backend() -> str:
+    r"""Return the backend used by the sections to draw the figures.
+
+    Returns:
+        The name of the active backend.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from flamme.utils.figure import get_figure_backend
+    >>> get_figure_backend()
+    'matplotlib'
+
+    ```
+    """
+    return _state["backend"]
+
+
+@contextmanager
+def use_figure_backend(backend: str) -> Generator[str, None, None]:
+    r"""Context manager to set the backend used by the sections to draw
+    the figures.
+
+    The backend is shared by all the threads.
+
+    Args:
+        backend: The name of the backend. The valid backends are
+            ``'matplotlib'``, ``'svg'`` and ``'client'``.
+
+    Yields:
+        The name of the active backend.
+
+    Raises:
+        ValueError: if the backend is not valid.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from flamme.utils.figure import get_figure_backend, use_figure_backend
+    >>> with use_figure_backend("svg"):
+    ...     get_figure_backend()
+    ...
+    'svg'
+    >>> get_figure_backend()
+    'matplotlib'
+
+    ```
+    """
+    if backend not in FIGURE_BACKENDS:
+        msg = f"Incorrect figure backend: {backend}. The valid backends are {FIGURE_BACKENDS}"
+        raise ValueError(msg)
+    previous = _state["backend"]
+    _state["backend"] = backend
+    try:
+        yield backend
+    finally:
+        _state["backend"] = previous
+
+
+def get_figure_sink() -> BaseFigureSink:
+    r"""Return the sink used to store the images of the matplotlib
+    figures.
+
+    Returns:
+        The active figure sink.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from flamme.utils.figure import get_figure_sink
+    >>> get_figure_sink()
+    InlineFigureSink()
+
+    ```
+    """
+    return _state["sink"]
+
+
+@contextmanager
+def use_figure_sink(sink: BaseFigureSink) -> Generator[BaseFigureSink, None, None]:
+    r"""Context manager to set the sink used to store the images of the
+    matplotlib figures.
+
+    The sink is shared by all the threads. The sink is not closed
+    when the context is exited.
+
+    Args:
+        sink: The figure sink.
+
+    Yields:
+        The active figure sink.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import tempfile
+    >>> from matplotlib import pyplot as plt
+    >>> from flamme.utils.figure import figure2html, get_figure_sink, use_figure_sink
+    >>> from flamme.utils.figure_sink import DirectoryFigureSink
+    >>> with tempfile.TemporaryDirectory() as tmpdir:
+    ...     with DirectoryFigureSink(tmpdir, url="figures") as sink, use_figure_sink(sink):
+    ...         fig, ax = plt.subplots()
+    ...         figure2html(fig)[:46]
+    ...
+    '<img style="width:100%; height:auto;" src="fig'
+    >>> get_figure_sink()
+    InlineFigureSink()
+
+    ```
+    """
+    previous = _state["sink"]
+    _state["sink"] = sink
+    try:
+        yield sink
+    finally:
+        _state["sink"] = previous
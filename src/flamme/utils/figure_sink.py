@@ -0,0 +1,518 @@
+r"""Contain the figure sinks, which store the images of the matplotlib
+figures of a report.
+
+By default, the images are base64-encoded and inlined in the HTML
+report. The other sinks write the images next to the report, so the
+HTML report stays small, and the images are referenced by relative
+path. These sinks compress and write the images in a background
+thread pool, so the rendering of the report overlaps with the
+encoding of the images, and the identical images are written only
+once.
+"""
+
+from __future__ import annotations
+
+__all__ = [
+    "FIGURE_SINKS",
+    "IMAGE_FORMATS",
+    "ArchiveFigureSink",
+    "BaseFigureSink",
+    "DirectoryFigureSink",
+    "InlineFigureSink",
+    "create_figure_sink",
+]
+
+import base64
+import hashlib
+import io
+import logging
+import os
+import shutil
+import threading
+import zipfile
+from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+from coola.utils.path import sanitize_path
+from PIL import Image
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from types import TracebackType
+
+    from matplotlib import pyplot as plt
+
+logger = logging.getLogger(__name__)
+
+# The valid figure sinks. See ``create_figure_sink``.
+FIGURE_SINKS = ("inline", "directory", "archive")
+
+# The image formats supported by the sinks that write the images next
+# to the report.
+IMAGE_FORMATS = ("png", "webp")
+
+
+class BaseFigureSink(ABC):
+    r"""Define the base class to store the images of the matplotlib
+    figures of a report.
+
+    The sinks can be used as context managers, and they are closed
+    when the context is exited.
+    """
+
+    def __enter__(self) -> BaseFigureSink:  # noqa: PYI034
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    @abstractmethod
+    def save(self, fig: plt.Figure) -> str:
+        r"""Save the image of a figure.
+
+        Args:
+            fig: The figure to save.
+
+        Returns:
+            The URL of the image, which can be used as the ``src``
+                attribute of an ``img`` element.
+        """
+
+    def close(self) -> None:  # noqa: B027
+        r"""Wait until all the images are written and release the
+        resources of the sink.
+
+        This method does nothing by default.
+        """
+
+    def flush(self) -> None:  # noqa: B027
+        r"""Wait until all the images saved so far are written.
+
+        This method does nothing by default.
+        """
+
+    def for_worker(self) -> BaseFigureSink:
+        r"""Return a sink that can be used in a worker process to save
+        the images of the same report.
+
+        The returned sink must be picklable. The images written by
+        the worker sinks must be flushed before this sink is closed.
+
+        Returns:
+            The sink to use in a worker process.
+        """
+        return self
+
+
+class InlineFigureSink(BaseFigureSink):
+    r"""Implement a figure sink that inlines the images in the HTML
+    report as base64-encoded PNG images.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from matplotlib import pyplot as plt
+    >>> from flamme.utils.figure_sink import InlineFigureSink
+    >>> sink = InlineFigureSink()
+    >>> fig, ax = plt.subplots()
+    >>> sink.save(fig)[:22]
+    'data:image/png;charset'
+
+    ```
+    """
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__qualname__}()"
+
+    def save(self, fig: plt.Figure) -> str:
+        img = io.BytesIO()
+        fig.savefig(img, format="png", bbox_inches="tight")
+        data = base64.b64encode(img.getvalue()).decode("utf-8")
+        return f"data:image/png;charset=utf-8;base64, {data}"
+
+
+class BaseEncodingFigureSink(BaseFigureSink):
+    r"""Define a base class for the figure sinks that compress and
+    write the images in a background thread pool.
+
+    The figure is rendered in the calling thread as an uncompressed
+    PNG image, because matplotlib is not thread-safe. The compression
+    to the final format and the writing are done by the thread pool.
+    The images are named after the hash of their content, so the
+    identical images are written only once.
+
+    Args:
+        url: The URL of the directory with the images, relative to
+            the HTML report.
+        image_format: The format of the images. The valid formats
+            are ``'png'`` and ``'webp'``. The WebP images are
+            lossless.
+        max_workers: The maximum number of threads used to compress
+            and write the images.
+        max_pending: The maximum number of images waiting to be
+            compressed. The calling thread waits if there are more
+            images, so the memory used by the uncompressed images is
+            bounded.
+
+    Raises:
+        ValueError: if the image format is not supported.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        image_format: str = "png",
+        max_workers: int = 4,
+        max_pending: int = 16,
+    ) -> None:
+        if image_format not in IMAGE_FORMATS:
+            msg = f"Incorrect image format: {image_format}. The valid formats are {IMAGE_FORMATS}"
+            raise ValueError(msg)
+        self._url = url.rstrip("/")
+        self._image_format = image_format
+        self._max_workers = int(max_workers)
+        self._max_pending = int(max_pending)
+        self._pool: ThreadPoolExecutor | None = None
+        self._pending: deque[Future] = deque()
+        self._names: set[str] = set()
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict[str, Any]:
+        # The thread pool and the pending images are not sent to the
+        # worker processes.
+        state = self.__dict__.copy()
+        state.update(_pool=None, _pending=deque(), _names=set(), _lock=None)
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @property
+    def image_format(self) -> str:
+        r"""The format of the images."""
+        return self._image_format
+
+    @property
+    def url(self) -> str:
+        r"""The URL of the directory with the images, relative to the
+        HTML report."""
+        return self._url
+
+    def close(self) -> None:
+        self.flush()
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def flush(self) -> None:
+        while self._pending:
+            self._pending.popleft().result()
+
+    def save(self, fig: plt.Figure) -> str:
+        img = io.BytesIO()
+        fig.savefig(img, format="png", bbox_inches="tight", pil_kwargs={"compress_level": 0})
+        raw = img.getvalue()
+        name = f"{hashlib.sha256(raw).hexdigest()[:32]}.{self._image_format}"
+        with self._lock:
+            is_new = name not in self._names
+            self._names.add(name)
+        if is_new:
+            while len(self._pending) >= self._max_pending:
+                self._pending.popleft().result()
+            self._pending.append(self._get_pool().submit(self._encode_and_write, name, raw))
+        return f"{self._url}/{name}"
+
+    @abstractmethod
+    def _write(self, name: str, data: bytes) -> None:
+        r"""Write an image.
+
+        This method is called by the threads of the pool.
+
+        Args:
+            name: The name of the image.
+            data: The encoded image.
+        """
+
+    def _encode_and_write(self, name: str, raw: bytes) -> None:
+        r"""Compress an uncompressed PNG image and write it.
+
+        Args:
+            name: The name of the image.
+            raw: The uncompressed PNG image.
+        """
+        with Image.open(io.BytesIO(raw)) as image:
+            out = io.BytesIO()
+            if self._image_format == "webp":
+                image.save(out, format="webp", lossless=True)
+            else:
+                image.save(out, format="png", compress_level=6)
+        self._write(name, out.getvalue())
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        r"""Return the thread pool, which is created the first time
+        an image is saved."""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="flamme-figure"
+            )
+        return self._pool
+
+
+class DirectoryFigureSink(BaseEncodingFigureSink):
+    r"""Implement a figure sink that writes the images in a directory
+    and references them by relative path.
+
+    Args:
+        path: The directory where to write the images. It is
+            created if it does not exist.
+        url: The URL of the directory with the images, relative to
+            the HTML report. If ``None``, the directory name is used,
+            so the directory must be next to the report.
+        image_format: The format of the images. The valid formats
+            are ``'png'`` and ``'webp'``.
+        max_workers: The maximum number of threads used to compress
+            and write the images.
+        max_pending: The maximum number of images waiting to be
+            compressed.
+
+    Raises:
+        ValueError: if the image format is not supported.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import tempfile
+    >>> from pathlib import Path
+    >>> from matplotlib import pyplot as plt
+    >>> from flamme.utils.figure_sink import DirectoryFigureSink
+    >>> with tempfile.TemporaryDirectory() as tmpdir:
+    ...     with DirectoryFigureSink(Path(tmpdir).joinpath("figures")) as sink:
+    ...         fig, ax = plt.subplots()
+    ...         url = sink.save(fig)
+    ...     url.startswith("figures/")
+    ...
+    True
+
+    ```
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        url: str | None = None,
+        image_format: str = "png",
+        max_workers: int = 4,
+        max_pending: int = 16,
+    ) -> None:
+        self._path = sanitize_path(path)
+        super().__init__(
+            url=self._path.name if url is None else url,
+            image_format=image_format,
+            max_workers=max_workers,
+            max_pending=max_pending,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__qualname__}(path={self._path}, url={self._url}, "
+            f"image_format={self._image_format})"
+        )
+
+    @property
+    def path(self) -> Path:
+        r"""The directory where the images are written."""
+        return self._path
+
+    def _write(self, name: str, data: bytes) -> None:
+        path = self._path.joinpath(name)
+        if path.is_file():
+            return
+        self._path.mkdir(parents=True, exist_ok=True)
+        # The image is renamed once it is complete, so the workers
+        # writing the same image never see a partial file.
+        tmp_path = path.with_name(f"{name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(data)
+        tmp_path.replace(path)
+
+
+class ArchiveFigureSink(BaseEncodingFigureSink):
+    r"""Implement a figure sink that writes the images in a single ZIP
+    archive next to the report.
+
+    The images are stored in the archive under the directory
+    ``url``, so extracting the archive next to the report restores
+    the relative paths used by the report. The images are already
+    compressed, so they are stored without compression in the
+    archive. The images saved by the worker processes are written in
+    a staging directory, and they are moved to the archive when the
+    sink is closed.
+
+    Args:
+        path: The path of the ZIP archive. It is overwritten if it
+            exists.
+        url: The URL of the directory with the images, relative to
+            the HTML report. If ``None``, the archive name without
+            suffix is used.
+        image_format: The format of the images. The valid formats
+            are ``'png'`` and ``'webp'``.
+        max_workers: The maximum number of threads used to compress
+            and write the images.
+        max_pending: The maximum number of images waiting to be
+            compressed.
+
+    Raises:
+        ValueError: if the image format is not supported.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import tempfile
+    >>> import zipfile
+    >>> from pathlib import Path
+    >>> from matplotlib import pyplot as plt
+    >>> from flamme.utils.figure_sink import ArchiveFigureSink
+    >>> with tempfile.TemporaryDirectory() as tmpdir:
+    ...     path = Path(tmpdir).joinpath("figures.zip")
+    ...     with ArchiveFigureSink(path) as sink:
+    ...         fig, ax = plt.subplots()
+    ...         url = sink.save(fig)
+    ...     zipfile.ZipFile(path).namelist() == [url]
+    ...
+    True
+
+    ```
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        url: str | None = None,
+        image_format: str = "png",
+        max_workers: int = 4,
+        max_pending: int = 16,
+    ) -> None:
+        self._path = sanitize_path(path)
+        super().__init__(
+            url=self._path.stem if url is None else url,
+            image_format=image_format,
+            max_workers=max_workers,
+            max_pending=max_pending,
+        )
+        self._archive: zipfile.ZipFile | None = None
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__qualname__}(path={self._path}, url={self._url}, "
+            f"image_format={self._image_format})"
+        )
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = super().__getstate__()
+        state["_archive"] = None
+        return state
+
+    @property
+    def path(self) -> Path:
+        r"""The path of the ZIP archive."""
+        return self._path
+
+    def close(self) -> None:
+        super().close()
+        staging = self._get_staging_path()
+        if staging.is_dir():
+            for path in sorted(staging.iterdir()):
+                if path.suffix == f".{self._image_format}" and path.name not in self._names:
+                    self._names.add(path.name)
+                    self._write(path.name, path.read_bytes())
+            shutil.rmtree(staging)
+        if self._archive is None:
+            # An empty archive is created if there is no image.
+            self._get_archive()
+        self._archive.close()
+        self._archive = None
+
+    def for_worker(self) -> DirectoryFigureSink:
+        return DirectoryFigureSink(
+            path=self._get_staging_path(),
+            url=self._url,
+            image_format=self._image_format,
+            max_workers=self._max_workers,
+            max_pending=self._max_pending,
+        )
+
+    def _get_archive(self) -> zipfile.ZipFile:
+        r"""Return the archive, which is created the first time an
+        image is written."""
+        if self._archive is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            self._archive = zipfile.ZipFile(self._path, mode="w")
+        return self._archive
+
+    def _get_staging_path(self) -> Path:
+        r"""Return the directory where the worker processes write the
+        images."""
+        return self._path.with_name(f"{self._path.name}.parts")
+
+    def _write(self, name: str, data: bytes) -> None:
+        with self._lock:
+            self._get_archive().writestr(
+                f"{self._url}/{name}", data, compress_type=zipfile.ZIP_STORED
+            )
+
+
+def create_figure_sink(
+    sink: str, report_path: Path | str, image_format: str = "png"
+) -> BaseFigureSink:
+    r"""Create the figure sink of a report.
+
+    Args:
+        sink: The name of the sink. ``'inline'`` inlines the images
+            in the report. ``'directory'`` writes the images in the
+            directory ``<report name>_figures`` next to the report.
+            ``'archive'`` writes the images in the ZIP archive
+            ``<report name>_figures.zip`` next to the report.
+        report_path: The path of the HTML report.
+        image_format: The format of the images written next to the
+            report. The valid formats are ``'png'`` and ``'webp'``.
+
+    Returns:
+        The figure sink.
+
+    Raises:
+        ValueError: if the sink is not valid.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from flamme.utils.figure_sink import create_figure_sink
+    >>> create_figure_sink("directory", "/path/to/report.html")
+    DirectoryFigureSink(path=/path/to/report_figures, url=report_figures, image_format=png)
+
+    ```
+    """
+    if sink not in FIGURE_SINKS:
+        msg = f"Incorrect figure sink: {sink}. The valid sinks are {FIGURE_SINKS}"
+        raise ValueError(msg)
+    if sink == "inline":
+        return InlineFigureSink()
+    report_path = sanitize_path(report_path)
+    name = f"{report_path.stem}_figures"
+    if sink == "directory":
+        return DirectoryFigureSink(
+            path=report_path.with_name(name), url=name, image_format=image_format
+        )
+    return ArchiveFigureSink(
+        path=report_path.with_name(f"{name}.zip"), url=name, image_format=image_format
+    )
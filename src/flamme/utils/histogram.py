@@ -0,0 +1,71 @@
+r"""Contain utility functions to compute histograms."""
+
+from __future__ import annotations
+
+__all__ = ["compute_histogram"]
+
+import numpy as np
+import polars as pl
+
+from flamme.utils.array import SortedArray
+
+
+def compute_histogram(
+    data: pl.Series | np.ndarray | SortedArray,
+    bins: int | None = None,
+    range: tuple[float, float] | None = None,  # noqa: A002
+) -> tuple[np.ndarray, np.ndarray]:
+    r"""Compute the histogram of some values with equal-width bins.
+
+    The output is the same as ``numpy.histogram`` with equal-width
+    bins, but the null and NaN values are ignored. The bin index of
+    each value is computed with polars, so only the bin counts and
+    the bin edges are materialized as NumPy arrays. If ``data`` is a
+    ``SortedArray``, the bins are found by binary search in the
+    sorted values.
+
+    Args:
+        data: The values as a series, an array, or a sorted view.
+        bins: The number of equal-width bins. If ``None``, 10 bins
+            are used.
+        range: The lower and upper range of the bins. If ``None``,
+            the range is ``(min, max)``.
+
+    Returns:
+        A tuple with the number of values in each bin and the bin
+            edges.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import polars as pl
+    >>> from flamme.utils.histogram import compute_histogram
+    >>> compute_histogram(pl.Series([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, None]), bins=5)
+    (array([2, 2, 2, 2, 2]), array([0. , 1.8, 3.6, 5.4, 7.2, 9. ]))
+
+    ```
+    """
+    if isinstance(data, SortedArray):
+        return data.histogram(bins=bins, range=range)
+    if isinstance(data, np.ndarray):
+        data = pl.Series(values=data.ravel())
+    bins = 10 if bins is None else bins
+    series = data.drop_nulls().cast(pl.Float64)
+    series = series.filter(series.is_not_nan())
+    if range is not None:
+        first, last = range
+    elif series.is_empty():
+        first, last = 0.0, 1.0
+    else:
+        first, last = series.min(), series.max()
+    if first == last:
+        first, last = first - 0.5, last + 0.5
+    edges = np.linspace(first, last, bins + 1, endpoint=True, dtype=np.float64)
+    series = series.filter(series.is_between(first, last))
+    # A value belongs to the bin ``[edges[i], edges[i + 1])`` and the last
+    # bin includes its upper edge like ``numpy.histogram``.
+    indices = (pl.Series(values=edges).search_sorted(series, side="right") - 1).clip(
+        upper_bound=bins - 1
+    )
+    return np.bincount(indices.to_numpy(), minlength=bins), edges
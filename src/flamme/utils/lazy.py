@@ -0,0 +1,74 @@
+r"""Contain utility functions to compute aggregations with polars
+expressions."""
+
+from __future__ import annotations
+
+__all__ = ["collect_expressions"]
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    import polars as pl
+
+logger = logging.getLogger(__name__)
+
+
+def collect_expressions(
+    frame: pl.DataFrame | pl.LazyFrame, expressions: Mapping[str, pl.Expr]
+) -> dict[str, Any]:
+    r"""Compute multiple aggregations with a single ``collect``.
+
+    All the expressions are merged into a single query plan, so the
+    data are scanned only once and the common sub-expressions are
+    computed only once. Each expression must return a single value
+    e.g. ``pl.col("a").null_count()``. Use ``implode()`` to return
+    several values.
+
+    Args:
+        frame: The DataFrame or LazyFrame with the data to aggregate.
+        expressions: The aggregations to compute. The keys are used
+            to name the outputs.
+
+    Returns:
+        A dictionary with the result of each aggregation.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import polars as pl
+    >>> from flamme.utils.lazy import collect_expressions
+    >>> frame = pl.DataFrame(
+    ...     {
+    ...         "float": [1.2, 4.2, None, 2.2],
+    ...         "int": [None, 1, 0, 1],
+    ...         "str": ["A", "B", None, None],
+    ...     },
+    ...     schema={"float": pl.Float64, "int": pl.Int64, "str": pl.String},
+    ... )
+    >>> collect_expressions(
+    ...     frame,
+    ...     {
+    ...         "num_rows": pl.len(),
+    ...         "float_nulls": pl.col("float").null_count(),
+    ...         "str_nulls": pl.col("str").null_count(),
+    ...     },
+    ... )
+    {'num_rows': 4, 'float_nulls': 1, 'str_nulls': 2}
+
+    ```
+    """
+    if not expressions:
+        return {}
+    logger.debug(f"Computing {len(expressions):,} aggregations in a single query...")
+    out = frame.lazy().select([expr.alias(key) for key, expr in expressions.items()]).collect()
+    if out.shape[0] != 1:
+        msg = (
+            "The expressions must return a single value but the output has "
+            f"{out.shape[0]:,} rows"
+        )
+        raise RuntimeError(msg)
+    return out.row(0, named=True)
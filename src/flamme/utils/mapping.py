@@ -2,7 +2,56 @@ r"""Contain utility functions for mappings."""
 
 from __future__ import annotations
 
-__all__ = ["sort_by_keys"]
+__all__ = ["add_key_prefix", "remove_key_prefix", "sort_by_keys"]
+
+from typing import Any
+
+
+def add_key_prefix(mapping: dict[str, Any], prefix: str) -> dict[str, Any]:
+    r"""Add a prefix to all the keys of a dictionary.
+
+    Args:
+        mapping: The dictionary to update.
+        prefix: The prefix to add.
+
+    Returns:
+        The dictionary with the prefixed keys.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from flamme.utils.mapping import add_key_prefix
+    >>> add_key_prefix({"cat": 5, "dog": 1}, prefix="0/")
+    {'0/cat': 5, '0/dog': 1}
+
+    ```
+    """
+    return {f"{prefix}{key}": value for key, value in mapping.items()}
+
+
+def remove_key_prefix(mapping: dict[str, Any], prefix: str) -> dict[str, Any]:
+    r"""Return the items whose key starts with a given prefix, and
+    remove the prefix from the keys.
+
+    Args:
+        mapping: The dictionary to filter.
+        prefix: The prefix to remove.
+
+    Returns:
+        The dictionary with only the items that have the prefix.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from flamme.utils.mapping import remove_key_prefix
+    >>> remove_key_prefix({"0/cat": 5, "0/dog": 1, "1/fish": 2}, prefix="0/")
+    {'cat': 5, 'dog': 1}
+
+    ```
+    """
+    return {key[len(prefix) :]: value for key, value in mapping.items() if key.startswith(prefix)}
 
 
 def sort_by_keys(mapping: dict) -> dict:
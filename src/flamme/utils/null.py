@@ -2,15 +2,23 @@ r"""Contain utility functions to analyze data with null values."""
 
 from __future__ import annotations
 
-__all__ = ["compute_null", "compute_null_count", "compute_temporal_null_count"]
+__all__ = [
+    "compute_null",
+    "compute_null_count",
+    "compute_null_pattern_order",
+    "compute_temporal_null_count",
+    "compute_temporal_null_matrix",
+]
 
 from typing import TYPE_CHECKING
 
 import numpy as np
 import polars as pl
-import polars.selectors as cs
+from grizz.utils.interval import interval_to_strftime_format
+from scipy.cluster.hierarchy import leaves_list, linkage
 
-from flamme.utils.temporal import to_step_names
+from flamme.utils.cache import frame_cache
+from flamme.utils.cube import get_temporal_cube
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -71,6 +79,7 @@ def compute_null(frame: pl.DataFrame) -> pl.DataFrame:
     )
 
 
+@frame_cache
 def compute_null_count(frame: pl.DataFrame) -> np.ndarray:
     r"""Return the number of null values in each column.
 
@@ -106,11 +115,53 @@ def compute_null_count(frame: pl.DataFrame) -> np.ndarray:
     return frame.null_count().to_numpy()[0].astype(int)
 
 
+def compute_null_pattern_order(nulls: np.ndarray, totals: np.ndarray) -> np.ndarray:
+    r"""Compute an order of the columns where the columns with similar
+    temporal null patterns are next to each other.
+
+    The columns are ordered by an average-linkage hierarchical
+    clustering of their percentages of null values per temporal
+    period.
+
+    Args:
+        nulls: The number of null values, where the first dimension
+            represents the columns and the second dimension represents
+            the periods.
+        totals: The number of rows per period.
+
+    Returns:
+        The indices of the columns in the new order.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from flamme.utils.null import compute_null_pattern_order
+    >>> compute_null_pattern_order(
+    ...     nulls=np.array([[0, 0, 5], [5, 5, 0], [0, 1, 5]]), totals=np.array([5, 5, 5])
+    ... )
+    array([1, 0, 2])
+
+    ```
+    """
+    nulls = np.asarray(nulls)
+    if nulls.shape[0] < 3:
+        return np.arange(nulls.shape[0])
+    totals = np.asarray(totals)
+    ratios = np.divide(
+        nulls, totals[None, :], out=np.zeros(nulls.shape, dtype=float), where=totals[None, :] > 0
+    )
+    return leaves_list(linkage(ratios, method="average")).astype(np.int64)
+
+
 def compute_temporal_null_count(
     frame: pl.DataFrame,
     columns: Sequence[str],
     dt_column: str,
     period: str,
+    *,
+    base_period: str | None = None,
 ) -> tuple[np.ndarray, np.ndarray, list]:
     r"""Compute the number of null values per temporal segments.
 
@@ -120,6 +171,9 @@ def compute_temporal_null_count(
         dt_column: The datetime column used to analyze
             the temporal distribution.
         period: The temporal period e.g. monthly or daily.
+        base_period: If not ``None``, the counts are computed from
+            the temporal cube with this base period, which is shared
+            by all the periods that can be rolled up from it.
 
     Returns:
         A tuple with 3 values. The first value is a numpy NDArray
@@ -166,15 +220,145 @@ def compute_temporal_null_count(
 
     ```
     """
-    frame_na = frame.select(cs.by_name(columns).is_null().cast(pl.Int64), pl.col(dt_column))
-    groups = frame_na.sort(dt_column).group_by_dynamic(dt_column, every=period)
-    steps = to_step_names(groups=groups, period=period)
-
-    nulls = np.zeros(len(steps), dtype=np.int64)
-    totals = np.zeros(len(steps), dtype=np.int64)
-    if columns:
-        nulls += groups.agg(cs.by_name(columns).sum()).drop(dt_column).sum_horizontal().to_numpy()
-        totals += (
-            groups.agg(cs.by_name(columns).count()).drop(dt_column).sum_horizontal().to_numpy()
+    nulls, num_rows, labels = compute_temporal_null_matrix(
+        frame=frame, columns=columns, dt_column=dt_column, period=period, base_period=base_period
+    )
+    return nulls.sum(axis=0), num_rows * len(columns), labels
+
+
+def compute_temporal_null_matrix(
+    frame: pl.DataFrame,
+    columns: Sequence[str],
+    dt_column: str,
+    period: str,
+    *,
+    base_period: str | None = None,
+) -> tuple[np.ndarray, np.ndarray, list[str]]:
+    r"""Compute the number of null values of each column per temporal
+    segments.
+
+    The null values of the columns are counted with a single group-by
+    that reads the validity bitmaps of the columns, and the result is
+    cached.
+
+    Args:
+        frame: The DataFrame to analyze.
+        columns: The list of columns to analyze.
+        dt_column: The datetime column used to analyze
+            the temporal distribution.
+        period: The temporal period e.g. monthly or daily.
+        base_period: If not ``None``, the counts are computed from
+            the temporal cube with this base period, which is shared
+            by all the periods that can be rolled up from it.
+
+    Returns:
+        A tuple with 3 values. The first value is a 2-d numpy NDArray
+            that contains the number of null values, where the first
+            dimension represents the columns and the second dimension
+            represents the periods. The second value is a numpy
+            NDArray that contains the number of rows per period. The
+            third value is a list that contains the label of each
+            period.
+
+    Raises:
+        ValueError: if the datetime column has null values.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from datetime import datetime, timezone
+    >>> import polars as pl
+    >>> from flamme.utils.null import compute_temporal_null_matrix
+    >>> nulls, num_rows, labels = compute_temporal_null_matrix(
+    ...     frame=pl.DataFrame(
+    ...         {
+    ...             "col1": [None, float("nan"), 0.0, 1.0],
+    ...             "col2": [None, 1, 0, None],
+    ...             "datetime": [
+    ...                 datetime(year=2020, month=1, day=3, tzinfo=timezone.utc),
+    ...                 datetime(year=2020, month=2, day=3, tzinfo=timezone.utc),
+    ...                 datetime(year=2020, month=3, day=3, tzinfo=timezone.utc),
+    ...                 datetime(year=2020, month=4, day=3, tzinfo=timezone.utc),
+    ...             ],
+    ...         },
+    ...         schema={
+    ...             "col1": pl.Float64,
+    ...             "col2": pl.Int64,
+    ...             "datetime": pl.Datetime(time_unit="us", time_zone="UTC"),
+    ...         },
+    ...     ),
+    ...     columns=["col1", "col2"],
+    ...     dt_column="datetime",
+    ...     period="1mo",
+    ... )
+    >>> nulls
+    array([[1, 0, 0, 0],
+           [1, 0, 0, 1]])
+    >>> num_rows
+    array([1, 1, 1, 1])
+    >>> labels
+    ['2020-01', '2020-02', '2020-03', '2020-04']
+
+    ```
+    """
+    if base_period is not None:
+        cube = get_temporal_cube(frame, dt_column=dt_column, period=base_period)
+        return (
+            cube.get_null_count(columns, period=period),
+            cube.get_num_rows(period),
+            cube.get_step_names(period),
         )
-    return nulls, totals, steps
+    return _compute_temporal_null_matrix(
+        frame=frame, columns=columns, dt_column=dt_column, period=period
+    )
+
+
+@frame_cache
+def _compute_temporal_null_matrix(
+    frame: pl.DataFrame, columns: Sequence[str], dt_column: str, period: str
+) -> tuple[np.ndarray, np.ndarray, list[str]]:
+    r"""Compute the number of null values of each column per temporal
+    segments.
+
+    Args:
+        frame: The DataFrame to analyze.
+        columns: The list of columns to analyze.
+        dt_column: The datetime column used to analyze
+            the temporal distribution.
+        period: The temporal period e.g. monthly or daily.
+
+    Returns:
+        A tuple with the number of null values of each column and
+            period, the number of rows of each period, and the label
+            of each period.
+
+    Raises:
+        ValueError: if the datetime column has null values.
+    """
+    if frame[dt_column].null_count():
+        msg = "The datetime column has null values which are not supported"
+        raise ValueError(msg)
+    # ``null_count`` reads the validity bitmap of each group, so no
+    # mask is materialized, and the rows are grouped without sorting
+    # the DataFrame.
+    counts = (
+        frame.group_by(pl.col(dt_column).dt.truncate(period).alias("step"))
+        .agg(
+            pl.len().cast(pl.Int64).alias("num_rows"),
+            *(
+                pl.col(column).null_count().cast(pl.Int64).alias(f"{i}/null")
+                for i, column in enumerate(columns)
+            ),
+        )
+        .sort("step")
+    )
+    nulls = np.zeros((len(columns), counts.shape[0]), dtype=np.int64)
+    for i in range(len(columns)):
+        nulls[i] = counts[f"{i}/null"].to_numpy()
+    format_dt = interval_to_strftime_format(period)
+    return (
+        nulls,
+        counts["num_rows"].to_numpy(),
+        [step.strftime(format_dt) for step in counts["step"].to_list()],
+    )
@@ -6,22 +6,43 @@ __all__ = ["find_range"]
 
 import numpy as np
 
+from flamme.utils.array import SortedArray
+from flamme.utils.sketch import KllSketch
+
 
 def find_range(
-    values: np.ndarray,
+    values: np.ndarray | SortedArray | KllSketch,
     xmin: float | str | None = None,
     xmax: float | str | None = None,
+    *,
+    approximate: bool = False,
+    k: int = 200,
+    seed: int | None = 0,
 ) -> tuple[float, float]:
     r"""Find a valid range of value.
 
     Args:
-        values: The values used to find the quantiles.
+        values: The values used to find the quantiles, a sorted view
+            of these values, or a sketch of these values. The
+            quantiles of a sorted view are computed without sorting
+            the values again.
         xmin: The minimum value of the range or its
             associated quantile. ``q0.1`` means the 10% quantile.
             ``0`` is the minimum value and ``1`` is the maximum value.
         xmax: The maximum value of the range or its
             associated quantile. ``q0.9`` means the 90% quantile.
             ``0`` is the minimum value and ``1`` is the maximum value.
+        approximate: If ``True``, the quantiles are approximated with
+            a ``KllSketch`` instead of sorting the values. The
+            quantiles are always approximated if ``values`` is a
+            sketch.
+        k: The parameter that controls the accuracy and the size of
+            the sketch used when ``approximate=True``.
+            See ``KllSketch``.
+        seed: The random seed of the sketch used when
+            ``approximate=True``. The default seed makes the
+            approximated range reproducible. If ``None``, the sketch
+            is not seeded.
 
     Returns:
         The range of values in the format ``(min, max)``.
@@ -40,11 +61,24 @@ def find_range(
     (5, 50)
     >>> find_range(data, xmin="q0.1", xmax="q0.9")
     (10.0, 90.0)
+    >>> find_range(data, xmin="q0.1", xmax="q0.9", approximate=True)
+    (10.0, 90.0)
+    >>> from flamme.utils.array import SortedArray
+    >>> find_range(SortedArray(data), xmin="q0.1", xmax="q0.9")
+    (10.0, 90.0)
 
     ```
     """
+    if isinstance(values, KllSketch):
+        return _find_range_sketch(values, xmin=xmin, xmax=xmax)
+    if isinstance(values, SortedArray):
+        return _find_range_sorted(values, xmin=xmin, xmax=xmax)
     if values.size == 0:
         return float("nan"), float("nan")
+    if approximate and any(isinstance(x, str) for x in [xmin, xmax]):
+        sketch = KllSketch(k=k, seed=seed)
+        sketch.update(values)
+        return _find_range_sketch(sketch, xmin=xmin, xmax=xmax)
     if xmin is None:
         xmin = np.nanmin(values).item()
     if xmax is None:
@@ -60,3 +94,43 @@ def find_range(
     if isinstance(xmax, np.number):
         xmax = xmax.item()
     return (xmin, xmax)
+
+
+def _find_range_sketch(
+    sketch: KllSketch, xmin: float | str | None = None, xmax: float | str | None = None
+) -> tuple[float, float]:
+    r"""Find a valid range of value by using a sketch of the values.
+
+    See ``find_range`` for the description of the arguments.
+    """
+    if sketch.count == 0:
+        return float("nan"), float("nan")
+    if xmin is None:
+        xmin = sketch.min
+    if xmax is None:
+        xmax = sketch.max
+    if isinstance(xmin, str):
+        xmin = sketch.quantile(float(xmin[1:]))
+    if isinstance(xmax, str):
+        xmax = sketch.quantile(float(xmax[1:]))
+    return (xmin, xmax)
+
+
+def _find_range_sorted(
+    array: SortedArray, xmin: float | str | None = None, xmax: float | str | None = None
+) -> tuple[float, float]:
+    r"""Find a valid range of value by using the sorted values.
+
+    See ``find_range`` for the description of the arguments.
+    """
+    if array.size == 0:
+        return float("nan"), float("nan")
+    if xmin is None:
+        xmin = array.min()
+    if xmax is None:
+        xmax = array.max()
+    if isinstance(xmin, str):
+        xmin = array.quantile(float(xmin[1:]))
+    if isinstance(xmax, str):
+        xmax = array.quantile(float(xmax[1:]))
+    return (xmin, xmax)
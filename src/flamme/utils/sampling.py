@@ -0,0 +1,118 @@
+r"""Contain utility functions to sample rows from a stream of
+DataFrames."""
+
+from __future__ import annotations
+
+__all__ = ["ReservoirSampler"]
+
+import logging
+
+import numpy as np
+import polars as pl
+
+logger = logging.getLogger(__name__)
+
+KEY_COLUMN = "__sampling_key__"
+
+
+class ReservoirSampler:
+    r"""Implement a reservoir sampler to draw a uniform sample of rows
+    from a stream of DataFrames.
+
+    Each row gets a random key and the sampler keeps the rows with the
+    ``num_rows`` smallest keys, so the sample is a uniform sample
+    without replacement of all the rows seen so far. The memory usage
+    is bounded by the size of the sample and of the current batch.
+
+    Args:
+        num_rows: The maximum number of rows in the sample.
+        seed: The random seed used to sample the rows.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import polars as pl
+    >>> from flamme.utils.sampling import ReservoirSampler
+    >>> sampler = ReservoirSampler(num_rows=3)
+    >>> sampler.update(pl.DataFrame({"col": [1, 2, 3, 4]}))
+    >>> sampler.update(pl.DataFrame({"col": [5, 6]}))
+    >>> sampler.num_seen_rows
+    6
+    >>> sampler.sample.shape
+    (3, 1)
+
+    ```
+    """
+
+    def __init__(self, num_rows: int, seed: int = 0) -> None:
+        if num_rows < 0:
+            msg = f"num_rows must be greater or equal to 0 (received: {num_rows})"
+            raise ValueError(msg)
+        self._num_rows = int(num_rows)
+        self._seed = seed
+        self._rng = np.random.default_rng(seed)
+        self._reservoir: pl.DataFrame | None = None
+        self._num_seen_rows = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__qualname__}(num_rows={self._num_rows:,}, seed={self._seed}, "
+            f"num_seen_rows={self._num_seen_rows:,})"
+        )
+
+    @property
+    def num_seen_rows(self) -> int:
+        r"""The number of rows given to the sampler."""
+        return self._num_seen_rows
+
+    @property
+    def sample(self) -> pl.DataFrame:
+        r"""The sampled rows in the order they were seen.
+
+        The DataFrame is empty if no batch was given to the sampler.
+        """
+        if self._reservoir is None:
+            return pl.DataFrame()
+        return self._reservoir.sort(f"{KEY_COLUMN}_index").drop(KEY_COLUMN, f"{KEY_COLUMN}_index")
+
+    def update(self, batch: pl.DataFrame) -> None:
+        r"""Update the sample with a new batch of rows.
+
+        Args:
+            batch: The new rows. It must have the same schema as the
+                previous batches.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import polars as pl
+        >>> from flamme.utils.sampling import ReservoirSampler
+        >>> sampler = ReservoirSampler(num_rows=10)
+        >>> sampler.update(pl.DataFrame({"col": [1, 2, 3, 4]}))
+        >>> sampler.sample
+        shape: (4, 1)
+        ┌─────┐
+        │ col │
+        │ --- │
+        │ i64 │
+        ╞═════╡
+        │ 1   │
+        │ 2   │
+        │ 3   │
+        │ 4   │
+        └─────┘
+
+        ```
+        """
+        batch = batch.with_columns(
+            pl.Series(KEY_COLUMN, self._rng.random(batch.shape[0])),
+            pl.int_range(self._num_seen_rows, self._num_seen_rows + batch.shape[0])
+            .cast(pl.Int64)
+            .alias(f"{KEY_COLUMN}_index"),
+        )
+        self._num_seen_rows += batch.shape[0]
+        if self._reservoir is not None:
+            batch = pl.concat([self._reservoir, batch], how="vertical")
+        self._reservoir = batch.bottom_k(self._num_rows, by=KEY_COLUMN)
@@ -0,0 +1,992 @@
+r"""Contain mergeable sketches to approximate some statistics of a
+stream of values."""
+
+from __future__ import annotations
+
+__all__ = ["HyperLogLog", "KllSketch", "SpaceSaving"]
+
+import logging
+import math
+from collections import Counter
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import polars as pl
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+logger = logging.getLogger(__name__)
+
+# The ratio between the capacities of two consecutive levels.
+CAPACITY_RATIO = 2.0 / 3.0
+
+# The seed of the hash function used by ``HyperLogLog``. It must be the
+# same for all the sketches, so the sketches can be merged.
+HASH_SEED = 0
+
+
+class KllSketch:
+    r"""Implement a KLL sketch to approximate the quantiles of a stream
+    of values.
+
+    The sketch keeps a bounded number of values organized in levels.
+    A value at level ``h`` represents ``2**h`` values of the stream.
+    When a level is full, its values are sorted and one value out of
+    two is promoted to the next level. The rank error of the
+    quantiles decreases with ``k`` (about 1.7% for ``k=100`` and
+    0.9% for ``k=200``) and does not depend on the number of values.
+    The quantiles are exact while the number of values is not
+    greater than ``k``. The minimum and maximum values are always exact.
+
+    The sketches are mergeable, so the sketches computed on several
+    partitions of the data can be combined without reading the data
+    again. The sketches can be serialized with ``to_dict`` and
+    ``from_dict``.
+
+    Reference: Karnin, Lang and Liberty. Optimal Quantile
+    Approximation in Streams. FOCS 2016.
+
+    Args:
+        k: The parameter that controls the accuracy and the size of
+            the sketch.
+        seed: The random seed used to select the promoted values.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from flamme.utils.sketch import KllSketch
+    >>> sketch = KllSketch(k=200)
+    >>> sketch.update(np.arange(101))
+    >>> sketch
+    KllSketch(k=200, count=101, num_retained=101)
+    >>> sketch.quantile([0.1, 0.5, 0.9])
+    array([10., 50., 90.])
+    >>> other = KllSketch(k=200)
+    >>> other.update(np.arange(101, 200))
+    >>> sketch.merge(other)
+    >>> sketch.count
+    200
+    >>> sketch.quantile(0.5)
+    99.5
+
+    ```
+    """
+
+    def __init__(self, k: int = 200, seed: int | None = None) -> None:
+        if k < 8:
+            msg = f"k must be greater or equal to 8 (received: {k})"
+            raise ValueError(msg)
+        self._k = int(k)
+        self._rng = np.random.default_rng(seed)
+        self._levels: list[np.ndarray] = [np.empty(0, dtype=np.float64)]
+        self._count = 0
+        self._min = float("nan")
+        self._max = float("nan")
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__qualname__}(k={self._k:,}, count={self._count:,}, "
+            f"num_retained={self.num_retained:,})"
+        )
+
+    def __sizeof__(self) -> int:
+        return object.__sizeof__(self) + sum(level.nbytes for level in self._levels)
+
+    @property
+    def k(self) -> int:
+        r"""The parameter that controls the accuracy and the size of the
+        sketch."""
+        return self._k
+
+    @property
+    def count(self) -> int:
+        r"""The number of values given to the sketch."""
+        return self._count
+
+    @property
+    def min(self) -> float:
+        r"""The minimum value or NaN if the sketch is empty."""
+        return self._min
+
+    @property
+    def max(self) -> float:
+        r"""The maximum value or NaN if the sketch is empty."""
+        return self._max
+
+    @property
+    def num_retained(self) -> int:
+        r"""The number of values stored in the sketch."""
+        return sum(level.size for level in self._levels)
+
+    def update(self, values: np.ndarray | pl.Series | Sequence[float]) -> None:
+        r"""Update the sketch with new values.
+
+        The NaN and null values are ignored.
+
+        Args:
+            values: The new values.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from flamme.utils.sketch import KllSketch
+        >>> sketch = KllSketch()
+        >>> sketch.update(np.array([1.0, 2.0, float("nan"), 4.0]))
+        >>> sketch.count
+        3
+
+        ```
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return
+        self._update_range(values.min().item(), values.max().item())
+        self._count += values.size
+        # The values are added by chunks, so only small arrays are sorted.
+        chunk_size = 8 * self._k
+        for start in range(0, values.size, chunk_size):
+            self._levels[0] = np.concatenate([self._levels[0], values[start : start + chunk_size]])
+            self._compress()
+
+    def merge(self, other: KllSketch) -> None:
+        r"""Merge another sketch into the current sketch.
+
+        Args:
+            other: The sketch to merge. It is not modified.
+
+        Raises:
+            ValueError: if the sketches have different ``k``.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from flamme.utils.sketch import KllSketch
+        >>> sketch1, sketch2 = KllSketch(), KllSketch()
+        >>> sketch1.update(np.array([1.0, 2.0]))
+        >>> sketch2.update(np.array([3.0, 4.0, 5.0]))
+        >>> sketch1.merge(sketch2)
+        >>> sketch1.count, sketch1.min, sketch1.max
+        (5, 1.0, 5.0)
+
+        ```
+        """
+        if other.k != self._k:
+            msg = f"Cannot merge sketches with different k: {self._k} and {other.k}"
+            raise ValueError(msg)
+        if other.count == 0:
+            return
+        self._update_range(other.min, other.max)
+        self._count += other.count
+        while len(self._levels) < len(other._levels):
+            self._levels.append(np.empty(0, dtype=np.float64))
+        for level, values in enumerate(other._levels):
+            self._levels[level] = np.concatenate([self._levels[level], values])
+        self._compress()
+
+    def quantile(
+        self, q: float | Sequence[float], interpolation: str = "linear"
+    ) -> float | np.ndarray:
+        r"""Return the approximate quantiles.
+
+        The quantiles are exact while no value has been discarded.
+
+        Args:
+            q: The quantile or quantiles to compute. The values must
+                be between 0 and 1 inclusive.
+            interpolation: The interpolation method. If ``'linear'``,
+                the quantiles are linearly interpolated between the
+                values like ``numpy.quantile``. If ``'nearest'``, the
+                quantiles are the values with the nearest rank like
+                ``polars.Series.quantile``.
+
+        Returns:
+            The quantile values. NaN is returned if the sketch is
+                empty.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from flamme.utils.sketch import KllSketch
+        >>> sketch = KllSketch()
+        >>> sketch.update(np.arange(11))
+        >>> sketch.quantile(0.25)
+        2.5
+        >>> sketch.quantile([0.0, 1.0])
+        array([ 0., 10.])
+        >>> sketch.quantile(0.25, interpolation="nearest")
+        3.0
+
+        ```
+        """
+        if interpolation not in {"linear", "nearest"}:
+            msg = (
+                f"Incorrect interpolation: {interpolation}. "
+                "The valid values are: 'linear' and 'nearest'"
+            )
+            raise ValueError(msg)
+        ranks = np.asarray(q, dtype=np.float64)
+        if self._count == 0:
+            out = np.full(ranks.shape, np.nan)
+        else:
+            values = np.concatenate(self._levels)
+            weights = np.concatenate(
+                [
+                    np.full(level.size, 2**i, dtype=np.float64)
+                    for i, level in enumerate(self._levels)
+                ]
+            )
+            order = np.argsort(values, kind="stable")
+            values, weights = values[order], weights[order]
+            cumsum = np.cumsum(weights)
+            total = cumsum[-1]
+            values = np.concatenate([[self._min], values, [self._max]])
+            if interpolation == "nearest":
+                ranks = np.floor(ranks * (total - 1.0) + 0.5)
+                out = values[np.searchsorted(cumsum, ranks, side="right") + 1]
+                # The first and last ranks are the exact minimum and maximum.
+                out = np.where(ranks <= 0, self._min, np.where(ranks >= total - 1, self._max, out))
+            else:
+                # Each value is located at the center of the ranks it
+                # represents.
+                positions = cumsum - (weights + 1.0) / 2.0
+                out = np.interp(
+                    ranks * (total - 1.0),
+                    np.concatenate([[0.0], positions, [total - 1.0]]),
+                    values,
+                )
+        if out.ndim == 0:
+            return out.item()
+        return out
+
+    def to_dict(self) -> dict[str, Any]:
+        r"""Return a serializable representation of the sketch.
+
+        Returns:
+            A dictionary with only built-in types, so it can be
+                serialized in JSON.
+
+        Example usage:
+
+        ```pycon
+
+        >>> from flamme.utils.sketch import KllSketch
+        >>> sketch = KllSketch(k=8)
+        >>> sketch.update([1.0, 2.0, 3.0])
+        >>> sketch.to_dict()
+        {'k': 8, 'count': 3, 'min': 1.0, 'max': 3.0, 'levels': [[1.0, 2.0, 3.0]]}
+
+        ```
+        """
+        return {
+            "k": self._k,
+            "count": self._count,
+            "min": self._min,
+            "max": self._max,
+            "levels": [level.tolist() for level in self._levels],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], seed: int | None = None) -> KllSketch:
+        r"""Instantiate a sketch from its serializable representation.
+
+        Args:
+            data: The representation returned by ``to_dict``.
+            seed: The random seed used to select the promoted values.
+
+        Returns:
+            The sketch.
+
+        Example usage:
+
+        ```pycon
+
+        >>> from flamme.utils.sketch import KllSketch
+        >>> sketch = KllSketch.from_dict(
+        ...     {"k": 8, "count": 3, "min": 1.0, "max": 3.0, "levels": [[1.0, 2.0, 3.0]]}
+        ... )
+        >>> sketch.quantile(0.5)
+        2.0
+
+        ```
+        """
+        sketch = cls(k=data["k"], seed=seed)
+        sketch._count = int(data["count"])
+        sketch._min = float(data["min"])
+        sketch._max = float(data["max"])
+        sketch._levels = [np.asarray(level, dtype=np.float64) for level in data["levels"]]
+        return sketch
+
+    def _capacity(self, level: int) -> int:
+        r"""Return the maximum number of values at a level."""
+        depth = len(self._levels) - level - 1
+        return max(2, math.ceil(self._k * CAPACITY_RATIO**depth))
+
+    def _compress(self) -> None:
+        r"""Compact the levels that have more values than their
+        capacity."""
+        level = 0
+        while level < len(self._levels):
+            values = self._levels[level]
+            if values.size > self._capacity(level):
+                if level + 1 == len(self._levels):
+                    self._levels.append(np.empty(0, dtype=np.float64))
+                values = np.sort(values)
+                # The last value is kept at the current level if the
+                # number of values is odd.
+                size = values.size - values.size % 2
+                offset = self._rng.integers(2)
+                self._levels[level + 1] = np.concatenate(
+                    [self._levels[level + 1], values[offset:size:2]]
+                )
+                self._levels[level] = values[size:]
+            level += 1
+
+    def _update_range(self, vmin: float, vmax: float) -> None:
+        r"""Update the minimum and maximum values."""
+        self._min = vmin if self._count == 0 else min(self._min, vmin)
+        self._max = vmax if self._count == 0 else max(self._max, vmax)
+
+
+class HyperLogLog:
+    r"""Implement a HyperLogLog sketch to approximate the number of
+    unique values of a stream of values.
+
+    Each value is hashed to 64 bits. The first ``precision`` bits
+    select a register and the register keeps the maximum position of
+    the first non-zero bit of the other bits. The sketch uses
+    ``2**precision`` bytes and the relative standard error of the
+    estimate is about ``1.04 / sqrt(2**precision)`` (0.8% for
+    ``precision=14``). The null and NaN values are counted as one
+    value like ``polars.Series.n_unique``.
+
+    The sketches are mergeable, so the sketches computed on several
+    partitions of the data can be combined without reading the data
+    again. The sketches can be serialized with ``to_dict`` and
+    ``from_dict``.
+
+    Reference: Flajolet, Fusy, Gandouet and Meunier. HyperLogLog:
+    the analysis of a near-optimal cardinality estimation algorithm.
+    AofA 2007.
+
+    Args:
+        precision: The number of bits used to select the register.
+            It controls the accuracy and the size of the sketch.
+            It must be between 4 and 18.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import numpy as np
+    >>> from flamme.utils.sketch import HyperLogLog
+    >>> sketch = HyperLogLog(precision=14)
+    >>> sketch.update(np.array([1, 2, 3, 2, 1]))
+    >>> sketch
+    HyperLogLog(precision=14)
+    >>> sketch.estimate()
+    3
+    >>> other = HyperLogLog(precision=14)
+    >>> other.update(np.array([3, 4, 5]))
+    >>> sketch.merge(other)
+    >>> sketch.estimate()
+    5
+
+    ```
+    """
+
+    def __init__(self, precision: int = 14) -> None:
+        if not 4 <= precision <= 18:
+            msg = f"precision must be between 4 and 18 (received: {precision})"
+            raise ValueError(msg)
+        self._precision = int(precision)
+        self._registers = np.zeros(2**self._precision, dtype=np.uint8)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__qualname__}(precision={self._precision})"
+
+    def __sizeof__(self) -> int:
+        return object.__sizeof__(self) + self._registers.nbytes
+
+    @property
+    def precision(self) -> int:
+        r"""The number of bits used to select the register."""
+        return self._precision
+
+    def update(self, values: np.ndarray | pl.Series | Sequence[Any]) -> None:
+        r"""Update the sketch with new values.
+
+        Args:
+            values: The new values. The values must have the same
+                type in all the updates and merged sketches because
+                the hash of a value depends on its type.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import polars as pl
+        >>> from flamme.utils.sketch import HyperLogLog
+        >>> sketch = HyperLogLog()
+        >>> sketch.update(pl.Series(["a", "b", None, "a"]))
+        >>> sketch.estimate()
+        3
+
+        ```
+        """
+        if not isinstance(values, pl.Series):
+            values = pl.Series(np.ravel(values) if isinstance(values, np.ndarray) else values)
+        if values.len() == 0:
+            return
+        hashes = values.hash(seed=HASH_SEED).to_numpy()
+        num_bits = 64 - self._precision
+        indices = (hashes >> np.uint64(num_bits)).astype(np.int64)
+        # The leading bits are shifted out, so the number of leading
+        # zeros is computed on the other bits.
+        remaining = hashes << np.uint64(self._precision)
+        ranks = np.minimum(64 - _bit_length(remaining), num_bits) + 1
+        np.maximum.at(self._registers, indices, ranks.astype(np.uint8))
+
+    def merge(self, other: HyperLogLog) -> None:
+        r"""Merge another sketch into the current sketch.
+
+        Args:
+            other: The sketch to merge. It is not modified.
+
+        Raises:
+            ValueError: if the sketches have different precisions.
+
+        Example usage:
+
+        ```pycon
+
+        >>> from flamme.utils.sketch import HyperLogLog
+        >>> sketch1, sketch2 = HyperLogLog(), HyperLogLog()
+        >>> sketch1.update([1, 2, 3])
+        >>> sketch2.update([2, 3, 4])
+        >>> sketch1.merge(sketch2)
+        >>> sketch1.estimate()
+        4
+
+        ```
+        """
+        if other.precision != self._precision:
+            msg = (
+                "Cannot merge sketches with different precisions: "
+                f"{self._precision} and {other.precision}"
+            )
+            raise ValueError(msg)
+        np.maximum(self._registers, other._registers, out=self._registers)
+
+    def estimate(self) -> int:
+        r"""Return the estimated number of unique values.
+
+        Returns:
+            The estimated number of unique values.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> from flamme.utils.sketch import HyperLogLog
+        >>> sketch = HyperLogLog()
+        >>> sketch.estimate()
+        0
+        >>> sketch.update(np.arange(10))
+        >>> sketch.estimate()
+        10
+
+        ```
+        """
+        num_registers = self._registers.size
+        estimate = (
+            _get_alpha(num_registers)
+            * num_registers**2
+            / np.exp2(-self._registers.astype(np.float64)).sum()
+        )
+        num_zeros = int(np.count_nonzero(self._registers == 0))
+        if estimate <= 2.5 * num_registers and num_zeros > 0:
+            # Linear counting is more accurate for small cardinalities.
+            estimate = num_registers * math.log(num_registers / num_zeros)
+        return round(estimate)
+
+    def to_dict(self) -> dict[str, Any]:
+        r"""Return a serializable representation of the sketch.
+
+        Returns:
+            A dictionary with only built-in types, so it can be
+                serialized in JSON.
+
+        Example usage:
+
+        ```pycon
+
+        >>> from flamme.utils.sketch import HyperLogLog
+        >>> sketch = HyperLogLog(precision=4)
+        >>> sketch.to_dict()
+        {'precision': 4, 'registers': [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]}
+
+        ```
+        """
+        return {"precision": self._precision, "registers": self._registers.tolist()}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> HyperLogLog:
+        r"""Instantiate a sketch from its serializable representation.
+
+        Args:
+            data: The representation returned by ``to_dict``.
+
+        Returns:
+            The sketch.
+
+        Raises:
+            ValueError: if the number of registers does not match
+                the precision.
+
+        Example usage:
+
+        ```pycon
+
+        >>> from flamme.utils.sketch import HyperLogLog
+        >>> sketch = HyperLogLog.from_dict(
+        ...     {"precision": 4, "registers": [1, 0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]}
+        ... )
+        >>> sketch.estimate()
+        2
+
+        ```
+        """
+        sketch = cls(precision=data["precision"])
+        registers = np.asarray(data["registers"], dtype=np.uint8)
+        if registers.shape != sketch._registers.shape:
+            msg = (
+                f"Incorrect number of registers: {registers.size:,} "
+                f"(expected: {sketch._registers.size:,})"
+            )
+            raise ValueError(msg)
+        sketch._registers = registers.copy()
+        return sketch
+
+
+def _bit_length(values: np.ndarray) -> np.ndarray:
+    r"""Return the number of bits required to represent each unsigned
+    64-bit integer.
+
+    The integers are split in two 32-bit halves, so the conversion to
+    float is exact.
+    """
+    high = np.frexp((values >> np.uint64(32)).astype(np.float64))[1]
+    low = np.frexp((values & np.uint64(0xFFFFFFFF)).astype(np.float64))[1]
+    return np.where(high > 0, high + 32, low)
+
+
+def _get_alpha(num_registers: int) -> float:
+    r"""Return the constant used to correct the bias of the HyperLogLog
+    estimate."""
+    if num_registers == 16:
+        return 0.673
+    if num_registers == 32:
+        return 0.697
+    if num_registers == 64:
+        return 0.709
+    return 0.7213 / (1.0 + 1.079 / num_registers)
+
+
+class SpaceSaving:
+    r"""Implement a Space-Saving sketch to find the most frequent values
+    of a stream of values.
+
+    The sketch keeps at most ``capacity`` values with their estimated
+    number of occurrences and the maximum overestimation of each
+    count. The values are counted by batch with polars, so the values
+    are not converted to Python objects. The estimated count of a
+    value is never lower than its true count, and the true count is
+    at least the estimated count minus the error. The values that are
+    not tracked occurred at most ``max_error`` times, which is about
+    ``num_values / capacity`` in the worst case. The counts are exact
+    while the number of unique values is not greater than
+    ``capacity``. The null values are counted exactly and separately.
+
+    The sketches are mergeable, so the sketches computed on several
+    batches of the data can be combined without reading the data
+    again. The sketches can be serialized with ``to_dict`` and
+    ``from_dict``.
+
+    Reference: Metwally, Agrawal and El Abbadi. Efficient
+    Computation of Frequent and Top-k Elements in Data Streams.
+    ICDT 2005.
+
+    Args:
+        capacity: The maximum number of values tracked by the sketch.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import polars as pl
+    >>> from flamme.utils.sketch import SpaceSaving
+    >>> sketch = SpaceSaving(capacity=100)
+    >>> sketch.update(pl.Series(["a", "b", None, "a", "c", "a"]))
+    >>> sketch
+    SpaceSaving(capacity=100, total=6, num_retained=3, max_error=0)
+    >>> sketch.most_common(2)
+    [('a', 3), ('b', 1)]
+    >>> other = SpaceSaving(capacity=100)
+    >>> other.update(pl.Series(["b", "b"]))
+    >>> sketch.merge(other)
+    >>> sketch.to_counter()
+    Counter({'a': 3, 'b': 3, 'c': 1, None: 1})
+
+    ```
+    """
+
+    def __init__(self, capacity: int = 1000) -> None:
+        if capacity < 1:
+            msg = f"capacity must be greater or equal to 1 (received: {capacity})"
+            raise ValueError(msg)
+        self._capacity = int(capacity)
+        # The tracked values sorted by decreasing count. It is None
+        # until the first non-null value because the data type of
+        # the values is unknown.
+        self._frame: pl.DataFrame | None = None
+        self._total = 0
+        self._null_count = 0
+        self._max_error = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__qualname__}(capacity={self._capacity:,}, total={self._total:,}, "
+            f"num_retained={self.num_retained:,}, max_error={self._max_error:,})"
+        )
+
+    def __sizeof__(self) -> int:
+        size = object.__sizeof__(self)
+        if self._frame is not None:
+            size += self._frame.estimated_size()
+        return size
+
+    @property
+    def capacity(self) -> int:
+        r"""The maximum number of values tracked by the sketch."""
+        return self._capacity
+
+    @property
+    def total(self) -> int:
+        r"""The number of values given to the sketch, including the null
+        values."""
+        return self._total
+
+    @property
+    def null_count(self) -> int:
+        r"""The number of null values."""
+        return self._null_count
+
+    @property
+    def max_error(self) -> int:
+        r"""The maximum number of occurrences of a value that is not
+        tracked.
+
+        It is ``0`` if the counts are exact.
+        """
+        return self._max_error
+
+    @property
+    def num_retained(self) -> int:
+        r"""The number of values tracked by the sketch."""
+        return 0 if self._frame is None else self._frame.shape[0]
+
+    def update(self, values: pl.Series | Sequence[Any]) -> None:
+        r"""Update the sketch with new values.
+
+        Args:
+            values: The new values. The values must have compatible
+                data types in all the updates and merged sketches.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import polars as pl
+        >>> from flamme.utils.sketch import SpaceSaving
+        >>> sketch = SpaceSaving(capacity=2)
+        >>> sketch.update(pl.Series([1, 2, 1, 3, 1, 2, 4]))
+        >>> sketch.most_common()
+        [(1, 3), (2, 2)]
+        >>> sketch.max_error
+        1
+
+        ```
+        """
+        if not isinstance(values, pl.Series):
+            values = pl.Series(values)
+        self._total += values.len()
+        self._null_count += values.null_count()
+        counts = (
+            values.drop_nulls()
+            .alias("value")
+            .to_frame()
+            .group_by("value", maintain_order=True)
+            .agg(pl.len().cast(pl.Int64).alias("count"))
+            .with_columns(pl.lit(0, dtype=pl.Int64).alias("error"))
+        )
+        self._merge_counts(counts, max_error=0)
+
+    def merge(self, other: SpaceSaving) -> None:
+        r"""Merge another sketch into the current sketch.
+
+        The capacity of the current sketch is used for the merged
+        sketch.
+
+        Args:
+            other: The sketch to merge. It is not modified.
+
+        Example usage:
+
+        ```pycon
+
+        >>> from flamme.utils.sketch import SpaceSaving
+        >>> sketch1, sketch2 = SpaceSaving(), SpaceSaving()
+        >>> sketch1.update(["a", "b", "a"])
+        >>> sketch2.update(["b", "c", "b"])
+        >>> sketch1.merge(sketch2)
+        >>> sketch1.most_common()
+        [('b', 3), ('a', 2), ('c', 1)]
+
+        ```
+        """
+        self._total += other.total
+        self._null_count += other.null_count
+        if other._frame is None:
+            # The values that are not tracked by the current sketch
+            # can occur in the other sketch.
+            self._max_error += other.max_error
+            return
+        self._merge_counts(other._frame, max_error=other.max_error)
+
+    def most_common(self, n: int | None = None) -> list[tuple[Any, int]]:
+        r"""Return the most frequent values and their estimated number of
+        occurrences.
+
+        Args:
+            n: The number of values to return. If ``None``, all the
+                tracked values are returned.
+
+        Returns:
+            The list of values and counts sorted by decreasing count,
+                like ``collections.Counter.most_common``.
+
+        Example usage:
+
+        ```pycon
+
+        >>> from flamme.utils.sketch import SpaceSaving
+        >>> sketch = SpaceSaving()
+        >>> sketch.update(["a", "b", None, "b"])
+        >>> sketch.most_common()
+        [('b', 2), ('a', 1), (None, 1)]
+        >>> sketch.most_common(1)
+        [('b', 2)]
+
+        ```
+        """
+        return self.to_counter().most_common(n)
+
+    def get_errors(self) -> dict[Any, int]:
+        r"""Return the maximum overestimation of the count of each tracked
+        value.
+
+        Returns:
+            A dictionary with the error of each tracked value. The
+                true count of a value is between its estimated count
+                minus its error and its estimated count.
+
+        Example usage:
+
+        ```pycon
+
+        >>> from flamme.utils.sketch import SpaceSaving
+        >>> sketch = SpaceSaving(capacity=2)
+        >>> sketch.update([1, 2, 1])
+        >>> sketch.update([3, 3, 1])
+        >>> sketch.update([2, 2])
+        >>> sketch.most_common()
+        [(1, 3), (2, 3)]
+        >>> sketch.get_errors()
+        {1: 0, 2: 1}
+
+        ```
+        """
+        if self._frame is None:
+            return {}
+        return dict(zip(self._frame["value"].to_list(), self._frame["error"].to_list()))
+
+    def to_counter(self) -> Counter:
+        r"""Return a counter with the estimated number of occurrences of
+        the tracked values and the null values.
+
+        Returns:
+            The counter. The null values are represented by ``None``.
+
+        Example usage:
+
+        ```pycon
+
+        >>> from flamme.utils.sketch import SpaceSaving
+        >>> sketch = SpaceSaving()
+        >>> sketch.update(["a", "b", None, "b"])
+        >>> sketch.to_counter()
+        Counter({'b': 2, 'a': 1, None: 1})
+
+        ```
+        """
+        counter = Counter()
+        if self._frame is not None:
+            counter.update(
+                dict(zip(self._frame["value"].to_list(), self._frame["count"].to_list()))
+            )
+        if self._null_count:
+            counter[None] = self._null_count
+        return counter
+
+    def to_dict(self) -> dict[str, Any]:
+        r"""Return a serializable representation of the sketch.
+
+        Returns:
+            A dictionary with only built-in types, so it can be
+                serialized in JSON if the values can be serialized.
+
+        Example usage:
+
+        ```pycon
+
+        >>> from flamme.utils.sketch import SpaceSaving
+        >>> sketch = SpaceSaving(capacity=10)
+        >>> sketch.update(["a", "b", "a"])
+        >>> sketch.to_dict()
+        {'capacity': 10, 'total': 3, 'null_count': 0, 'max_error': 0,
+         'values': ['a', 'b'], 'counts': [2, 1], 'errors': [0, 0]}
+
+        ```
+        """
+        frame = self._frame
+        if frame is None:
+            frame = pl.DataFrame({"value": [], "count": [], "error": []})
+        return {
+            "capacity": self._capacity,
+            "total": self._total,
+            "null_count": self._null_count,
+            "max_error": self._max_error,
+            "values": frame["value"].to_list(),
+            "counts": frame["count"].to_list(),
+            "errors": frame["error"].to_list(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> SpaceSaving:
+        r"""Instantiate a sketch from its serializable representation.
+
+        Args:
+            data: The representation returned by ``to_dict``.
+
+        Returns:
+            The sketch.
+
+        Example usage:
+
+        ```pycon
+
+        >>> from flamme.utils.sketch import SpaceSaving
+        >>> sketch = SpaceSaving.from_dict(
+        ...     {
+        ...         "capacity": 10,
+        ...         "total": 3,
+        ...         "null_count": 0,
+        ...         "max_error": 0,
+        ...         "values": ["a", "b"],
+        ...         "counts": [2, 1],
+        ...         "errors": [0, 0],
+        ...     }
+        ... )
+        >>> sketch.most_common()
+        [('a', 2), ('b', 1)]
+
+        ```
+        """
+        sketch = cls(capacity=data["capacity"])
+        sketch._total = int(data["total"])
+        sketch._null_count = int(data["null_count"])
+        sketch._max_error = int(data["max_error"])
+        if data["values"]:
+            sketch._frame = pl.DataFrame(
+                {
+                    "value": pl.Series(data["values"]),
+                    "count": pl.Series(data["counts"], dtype=pl.Int64),
+                    "error": pl.Series(data["errors"], dtype=pl.Int64),
+                }
+            )
+        return sketch
+
+    def _merge_counts(self, counts: pl.DataFrame, max_error: int) -> None:
+        r"""Merge the counts of another summary into the sketch.
+
+        The values that are not tracked by a summary are assumed to
+        occur ``max_error`` times in this summary, so the estimated
+        counts are never lower than the true counts.
+
+        Args:
+            counts: The summary to merge. It has the columns
+                ``'value'``, ``'count'`` and ``'error'``.
+            max_error: The maximum number of occurrences of a value
+                that is not tracked by the summary.
+        """
+        if counts.is_empty():
+            self._max_error += max_error
+            return
+        if self._frame is None:
+            frame = counts.with_columns(
+                pl.col("count") + self._max_error, pl.col("error") + self._max_error
+            )
+        else:
+            frame = (
+                pl.concat(
+                    [
+                        self._frame.with_columns(pl.lit(True).alias("__left__")),
+                        counts.with_columns(pl.lit(False).alias("__left__")),
+                    ],
+                    how="vertical_relaxed",
+                )
+                .group_by("value", maintain_order=True)
+                .agg(
+                    pl.col("count").sum(),
+                    pl.col("error").sum(),
+                    pl.col("__left__").any().alias("__in_left__"),
+                    pl.col("__left__").not_().any().alias("__in_right__"),
+                )
+            )
+            missing = pl.when(pl.col("__in_left__")).then(0).otherwise(self._max_error) + pl.when(
+                pl.col("__in_right__")
+            ).then(0).otherwise(max_error)
+            frame = frame.select(
+                "value",
+                (pl.col("count") + missing).cast(pl.Int64),
+                (pl.col("error") + missing).cast(pl.Int64),
+            )
+        self._max_error += max_error
+        frame = frame.sort("count", descending=True, maintain_order=True)
+        if frame.shape[0] > self._capacity:
+            # The dropped values occurred at most as many times as the
+            # most frequent dropped value.
+            self._max_error = max(self._max_error, frame["count"][self._capacity])
+            frame = frame.head(self._capacity)
+        self._frame = frame
@@ -3,30 +3,243 @@ r"""Contain statistics utility functions."""
 from __future__ import annotations
 
 __all__ = [
+    "ContinuousStatisticsSketch",
     "compute_statistics_continuous",
     "compute_statistics_continuous_array",
+    "compute_statistics_continuous_frame",
     "compute_statistics_continuous_series",
+    "get_statistics_continuous_expression",
     "quantile",
 ]
 
+import math
 from typing import TYPE_CHECKING
 
 import numpy as np
 import polars as pl
 from scipy.stats import kurtosis, skew
 
-from flamme.utils.array import nonnan
+from flamme.utils.array import SortedArray, nonnan
+from flamme.utils.cache import frame_cache
+from flamme.utils.count import estimate_nunique
+from flamme.utils.sketch import HyperLogLog, KllSketch
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
+_QUANTILES = {
+    "q001": 0.001,
+    "q01": 0.01,
+    "q05": 0.05,
+    "q10": 0.1,
+    "q25": 0.25,
+    "median": 0.5,
+    "q75": 0.75,
+    "q90": 0.9,
+    "q95": 0.95,
+    "q99": 0.99,
+    "q999": 0.999,
+}
+
+
+class ContinuousStatisticsSketch:
+    r"""Implement a sketch to compute the descriptive statistics of a
+    stream of continuous values.
+
+    The sketch returns the same statistics as
+    ``compute_statistics_continuous_series``. The counts, the moments,
+    the extrema and the sign counts are exact. The quantiles are
+    approximated with a ``KllSketch`` and the number of unique values
+    is estimated with a ``HyperLogLog`` sketch, so the memory usage
+    does not depend on the number of values. The moments of each
+    batch are merged with the pairwise update formulas of Pébay.
+
+    Reference: Pébay. Formulas for Robust, One-Pass Parallel
+    Computation of Covariances and Arbitrary-Order Statistical
+    Moments. Sandia Report SAND2008-6212, 2008.
 
-def compute_statistics_continuous(data: np.ndarray | pl.Series) -> dict[str, float]:
+    Args:
+        k: The parameter that controls the accuracy and the size of
+            the quantile sketch. See ``KllSketch``.
+        precision: The precision of the unique value sketch.
+            See ``HyperLogLog``.
+        seed: The random seed of the quantile sketch.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import polars as pl
+    >>> from flamme.utils.stats import ContinuousStatisticsSketch
+    >>> sketch = ContinuousStatisticsSketch()
+    >>> sketch.update(pl.Series([None, *list(range(50))]))
+    >>> sketch.update(pl.Series([*list(range(50, 101)), None]))
+    >>> sketch
+    ContinuousStatisticsSketch(count=103)
+    >>> sketch.get_statistics()
+    {'count': 103, 'nunique': 101, 'num_non_nulls': 101, 'num_nulls': 2,
+     'mean': 50.0, 'std': 29.15..., 'skewness': 0.0, 'kurtosis': -1.20..., 'min': 0.0,
+     'q001': 0.1, 'q01': 1.0, 'q05': 5.0, 'q10': 10.0, 'q25': 25.0, 'median': 50.0,
+     'q75': 75.0, 'q90': 90.0, 'q95': 95.0, 'q99': 99.0, 'q999': 99.9, 'max': 100.0,
+     '>0': 100, '<0': 0, '=0': 1}
+
+    ```
+    """
+
+    def __init__(self, k: int = 200, precision: int = 14, seed: int | None = 0) -> None:
+        self._quantiles = KllSketch(k=k, seed=seed)
+        self._nunique = HyperLogLog(precision=precision)
+        self._count = 0
+        self._num_nulls = 0
+        # The number of values, the mean and the sums of the powers of
+        # the deviations to the mean of the non-NaN values.
+        self._moments = (0, 0.0, 0.0, 0.0, 0.0)
+        self._signs = np.zeros(3, dtype=np.int64)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__qualname__}(count={self._count:,})"
+
+    @property
+    def count(self) -> int:
+        r"""The number of values given to the sketch, including the null
+        values."""
+        return self._count
+
+    def update(self, series: pl.Series) -> None:
+        r"""Update the sketch with new values.
+
+        Args:
+            series: The new values. The series must have the same data
+                type in all the updates.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import polars as pl
+        >>> from flamme.utils.stats import ContinuousStatisticsSketch
+        >>> sketch = ContinuousStatisticsSketch()
+        >>> sketch.update(pl.Series([1.0, None, 3.0]))
+        >>> sketch.get_statistics()["mean"]
+        2.0
+
+        ```
+        """
+        self._count += series.len()
+        self._num_nulls += series.null_count()
+        self._nunique.update(series)
+        values = nonnan(series.drop_nulls().cast(pl.Float64).to_numpy())
+        if values.size == 0:
+            return
+        self._quantiles.update(values)
+        self._signs += [
+            np.count_nonzero(values > 0),
+            np.count_nonzero(values < 0),
+            np.count_nonzero(values == 0),
+        ]
+        mean = values.mean()
+        deviations = values - mean
+        self._moments = _merge_moments(
+            self._moments,
+            (
+                values.size,
+                mean.item(),
+                np.sum(deviations**2).item(),
+                np.sum(deviations**3).item(),
+                np.sum(deviations**4).item(),
+            ),
+        )
+
+    def get_statistics(self) -> dict[str, float]:
+        r"""Return the descriptive statistics of the values.
+
+        Returns:
+            The descriptive statistics. See
+                ``compute_statistics_continuous_series``.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import polars as pl
+        >>> from flamme.utils.stats import ContinuousStatisticsSketch
+        >>> sketch = ContinuousStatisticsSketch()
+        >>> sketch.update(pl.Series([1.0, None, 3.0]))
+        >>> sketch.get_statistics()["num_nulls"]
+        1
+
+        ```
+        """
+        stats = {
+            "count": self._count,
+            "nunique": self._nunique.estimate() if self._count else 0,
+            "num_non_nulls": self._count - self._num_nulls,
+            "num_nulls": self._num_nulls,
+        }
+        num_values, mean, m2, m3, m4 = self._moments
+        nan = float("nan")
+        quantiles = quantile(self._quantiles, q=list(_QUANTILES.values()))
+        return stats | {
+            "mean": mean if num_values else nan,
+            "std": math.sqrt(m2 / num_values) if num_values else nan,
+            # Like ``scipy.stats.skew`` and ``scipy.stats.kurtosis``,
+            # the statistics of constant values are NaN.
+            "skewness": math.sqrt(num_values) * m3 / m2**1.5 if m2 > 0 else nan,
+            "kurtosis": num_values * m4 / m2**2 - 3.0 if m2 > 0 else nan,
+            "min": self._quantiles.min,
+            **{name: quantiles[q] for name, q in _QUANTILES.items()},
+            "max": self._quantiles.max,
+            ">0": int(self._signs[0]),
+            "<0": int(self._signs[1]),
+            "=0": int(self._signs[2]),
+        }
+
+    def get_quantile_values(self, num_values: int) -> np.ndarray:
+        r"""Return evenly spaced quantiles of the values.
+
+        The quantiles can be used as a small sample with the same
+        distribution as the values, for example to draw a histogram
+        or a boxplot.
+
+        Args:
+            num_values: The number of quantiles.
+
+        Returns:
+            The quantiles sorted in ascending order.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import numpy as np
+        >>> import polars as pl
+        >>> from flamme.utils.stats import ContinuousStatisticsSketch
+        >>> sketch = ContinuousStatisticsSketch()
+        >>> sketch.update(pl.Series(np.arange(101)))
+        >>> sketch.get_quantile_values(5)
+        array([  0.,  25.,  50.,  75., 100.])
+
+        ```
+        """
+        if self._quantiles.count == 0 or num_values <= 0:
+            return np.zeros(0, dtype=np.float64)
+        return self._quantiles.quantile(np.linspace(0.0, 1.0, num_values))
+
+
+def compute_statistics_continuous(
+    data: np.ndarray | pl.Series, *, approximate: bool = False, approximate_nunique: bool = False
+) -> dict[str, float]:
     r"""Return several descriptive statistics for the data with
     continuous values.
 
     Args:
         data: The data to analyze.
+        approximate: If ``True``, the quantiles and the median are
+            approximated with a ``KllSketch`` instead of sorting the
+            data. See ``compute_statistics_continuous_array``.
+        approximate_nunique: If ``True``, the number of unique
+            values is estimated with a ``HyperLogLog`` sketch.
+            See ``compute_statistics_continuous_array``.
 
     Returns:
         The descriptive statistics for the input data.
@@ -47,16 +260,30 @@ def compute_statistics_continuous(data: np.ndarray | pl.Series) -> dict[str, flo
     ```
     """
     if isinstance(data, pl.Series):
-        return compute_statistics_continuous_series(data)
-    return compute_statistics_continuous_array(data)
+        return compute_statistics_continuous_series(
+            data, approximate=approximate, approximate_nunique=approximate_nunique
+        )
+    return compute_statistics_continuous_array(
+        data, approximate=approximate, approximate_nunique=approximate_nunique
+    )
 
 
-def compute_statistics_continuous_array(array: np.ndarray) -> dict[str, float]:
+def compute_statistics_continuous_array(
+    array: np.ndarray, *, approximate: bool = False, approximate_nunique: bool = False
+) -> dict[str, float]:
     r"""Return several descriptive statistics for the data with
     continuous values.
 
     Args:
         array: The data to analyze.
+        approximate: If ``True``, the quantiles and the median are
+            approximated with a ``KllSketch`` and the data are not
+            sorted. The rank error of the approximated quantiles is
+            about 1%. The other statistics are exact.
+        approximate_nunique: If ``True``, the number of unique
+            values is estimated with a ``HyperLogLog`` sketch instead
+            of sorting the data. The relative error of the estimate
+            is about 1%.
 
     Returns:
         The descriptive statistics for the input data.
@@ -77,14 +304,25 @@ def compute_statistics_continuous_array(array: np.ndarray) -> dict[str, float]:
     ```
     """
     array = array.ravel().astype(np.float64)
-    array_nonnan = nonnan(array)
-    stats = {
-        "count": int(array.size),
-        "nunique": int(np.unique(array).size),
-        "num_non_nulls": int(array_nonnan.size),
-    }
+    if approximate:
+        # The quantiles are approximated with a sketch, so the values
+        # are not sorted.
+        values = nonnan(array)
+        array_nonnan = None
+    else:
+        # The values are sorted once to compute the quantiles, the
+        # extrema, the number of unique values and the sign counts.
+        array_nonnan = SortedArray(array)
+        values = array_nonnan.values
+    if approximate_nunique:
+        nunique = estimate_nunique(pl.Series(array))
+    elif array_nonnan is None:
+        nunique = pl.Series(values).n_unique() + int(values.size < array.size)
+    else:
+        nunique = array_nonnan.nunique() + int(values.size < array.size)
+    stats = {"count": int(array.size), "nunique": nunique, "num_non_nulls": int(values.size)}
     stats["num_nulls"] = stats["count"] - stats["num_non_nulls"]
-    if array_nonnan.size == 0:
+    if values.size == 0:
         return stats | {
             "mean": float("nan"),
             "std": float("nan"),
@@ -108,38 +346,64 @@ def compute_statistics_continuous_array(array: np.ndarray) -> dict[str, float]:
             "=0": 0,
         }
     quantiles = quantile(
-        array_nonnan, q=[0.001, 0.01, 0.05, 0.1, 0.25, 0.75, 0.9, 0.95, 0.99, 0.999]
+        values if array_nonnan is None else array_nonnan,
+        q=[0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 0.75, 0.9, 0.95, 0.99, 0.999],
+        approximate=approximate,
     )
+    if array_nonnan is None:
+        extrema_signs = {
+            "min": values.min().item(),
+            "max": values.max().item(),
+            ">0": int(np.count_nonzero(values > 0)),
+            "<0": int(np.count_nonzero(values < 0)),
+            "=0": int(np.count_nonzero(values == 0)),
+        }
+    else:
+        extrema_signs = {
+            "min": array_nonnan.min(),
+            "max": array_nonnan.max(),
+            ">0": array_nonnan.size - array_nonnan.count(upper=0),
+            "<0": array_nonnan.size - array_nonnan.count(lower=0),
+            "=0": array_nonnan.count(lower=0, upper=0),
+        }
     return stats | {
-        "mean": np.mean(array_nonnan).item(),
-        "std": np.std(array_nonnan).item(),
-        "skewness": float(skew(array_nonnan)),
-        "kurtosis": float(kurtosis(array_nonnan)),
-        "min": np.min(array_nonnan).item(),
+        "mean": np.mean(values).item(),
+        "std": np.std(values).item(),
+        "skewness": float(skew(values)),
+        "kurtosis": float(kurtosis(values)),
+        "min": extrema_signs["min"],
         "q001": quantiles[0.001],
         "q01": quantiles[0.01],
         "q05": quantiles[0.05],
         "q10": quantiles[0.1],
         "q25": quantiles[0.25],
-        "median": np.median(array_nonnan).item(),
+        "median": quantiles[0.5],
         "q75": quantiles[0.75],
         "q90": quantiles[0.9],
         "q95": quantiles[0.95],
         "q99": quantiles[0.99],
         "q999": quantiles[0.999],
-        "max": np.max(array_nonnan).item(),
-        ">0": (array > 0).sum().item(),
-        "<0": (array < 0).sum().item(),
-        "=0": (array == 0).sum().item(),
+        "max": extrema_signs["max"],
+        ">0": extrema_signs[">0"],
+        "<0": extrema_signs["<0"],
+        "=0": extrema_signs["=0"],
     }
 
 
-def compute_statistics_continuous_series(series: pl.Series) -> dict[str, float]:
+def compute_statistics_continuous_series(
+    series: pl.Series, *, approximate: bool = False, approximate_nunique: bool = False
+) -> dict[str, float]:
     r"""Return several descriptive statistics for the data with
     continuous values.
 
     Args:
         series: The series to analyze.
+        approximate: If ``True``, the quantiles and the median are
+            approximated with a ``KllSketch`` instead of sorting the
+            data. See ``compute_statistics_continuous_array``.
+        approximate_nunique: If ``True``, the number of unique
+            values is estimated with a ``HyperLogLog`` sketch.
+            See ``compute_statistics_continuous_array``.
 
     Returns:
         The descriptive statistics for the input data.
@@ -161,20 +425,160 @@ def compute_statistics_continuous_series(series: pl.Series) -> dict[str, float]:
     """
     stats = {
         "count": int(series.shape[0]),
-        "nunique": series.n_unique(),
+        "nunique": estimate_nunique(series) if approximate_nunique else series.n_unique(),
         "num_nulls": int(series.null_count()),
     }
     stats["num_non_nulls"] = stats["count"] - stats["num_nulls"]
-    return compute_statistics_continuous_array(series.drop_nulls().to_numpy()) | stats
+    return (
+        compute_statistics_continuous_array(
+            series.drop_nulls().to_numpy(),
+            approximate=approximate,
+            approximate_nunique=approximate_nunique,
+        )
+        | stats
+    )
+
 
+@frame_cache
+def compute_statistics_continuous_frame(
+    frame: pl.DataFrame, columns: Sequence[str] | None = None
+) -> pl.DataFrame:
+    r"""Return several descriptive statistics for multiple columns with
+    continuous values.
+
+    All the statistics of all the columns are computed with a single
+    polars query, so the columns are analyzed in parallel by the
+    polars engine. The statistics are the same as the statistics
+    returned by ``compute_statistics_continuous_series``.
+
+    Args:
+        frame: The DataFrame to analyze.
+        columns: The columns to analyze. If ``None``, all the numeric
+            columns are analyzed.
+
+    Returns:
+        A DataFrame with one row per column. The first column
+            (``column``) contains the column names and the other
+            columns contain the statistics.
+
+    Example usage:
+
+    ```pycon
 
-def quantile(array: np.ndarray, q: Sequence[float]) -> dict[float, float]:
+    >>> import polars as pl
+    >>> from flamme.utils.stats import compute_statistics_continuous_frame
+    >>> frame = pl.DataFrame({"col1": list(range(101)), "col2": [float(i) for i in range(101)]})
+    >>> stats = compute_statistics_continuous_frame(frame)
+    >>> stats.select("column", "count", "mean", "median", "max")
+    shape: (2, 5)
+    ┌────────┬───────┬──────┬────────┬───────┐
+    │ column ┆ count ┆ mean ┆ median ┆ max   │
+    │ ---    ┆ ---   ┆ ---  ┆ ---    ┆ ---   │
+    │ str    ┆ i64   ┆ f64  ┆ f64    ┆ f64   │
+    ╞════════╪═══════╪══════╪════════╪═══════╡
+    │ col1   ┆ 101   ┆ 50.0 ┆ 50.0   ┆ 100.0 │
+    │ col2   ┆ 101   ┆ 50.0 ┆ 50.0   ┆ 100.0 │
+    └────────┴───────┴──────┴────────┴───────┘
+
+    ```
+    """
+    if columns is None:
+        columns = [col for col, dtype in frame.schema.items() if dtype.is_numeric()]
+    columns = list(columns)
+    schema = {"column": pl.String, **_continuous_statistics_schema()}
+    if not columns:
+        return pl.DataFrame(schema=schema)
+    row = frame.select(
+        [get_statistics_continuous_expression(col).alias(str(i)) for i, col in enumerate(columns)]
+    ).row(0)
+    return pl.DataFrame(
+        [{"column": col, **stats} for col, stats in zip(columns, row)], schema=schema
+    )
+
+
+def get_statistics_continuous_expression(column: str) -> pl.Expr:
+    r"""Return the expression to compute several descriptive statistics
+    of a column with continuous values.
+
+    The expression returns a single struct value with the same
+    statistics as ``compute_statistics_continuous_series``, so it can
+    be merged with other aggregations in a single query.
+    The NaN values are ignored to compute the moments, the extrema
+    and the quantiles, and the statistics of a column without values
+    are NaN.
+
+    Args:
+        column: The column to analyze.
+
+    Returns:
+        The expression that returns a struct with the statistics.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import polars as pl
+    >>> from flamme.utils.stats import get_statistics_continuous_expression
+    >>> frame = pl.DataFrame({"col": list(range(101))})
+    >>> stats = frame.select(get_statistics_continuous_expression("col")).item()
+    >>> stats["count"], stats["mean"], stats["median"], stats[">0"]
+    (101, 50.0, 50.0, 100)
+
+    ```
+    """
+    col = pl.col(column)
+    values = col.cast(pl.Float64).fill_nan(None)
+    count = pl.len().cast(pl.Int64)
+    num_nulls = col.null_count().cast(pl.Int64)
+    nan = float("nan")
+    return pl.struct(
+        count.alias("count"),
+        col.n_unique().cast(pl.Int64).alias("nunique"),
+        (count - num_nulls).alias("num_non_nulls"),
+        num_nulls.alias("num_nulls"),
+        values.mean().fill_null(nan).alias("mean"),
+        values.std(ddof=0).fill_null(nan).alias("std"),
+        values.skew().fill_null(nan).alias("skewness"),
+        values.kurtosis().fill_null(nan).alias("kurtosis"),
+        values.min().fill_null(nan).alias("min"),
+        *[
+            values.quantile(q, interpolation="linear").fill_null(nan).alias(name)
+            for name, q in _QUANTILES.items()
+        ],
+        values.max().fill_null(nan).alias("max"),
+        (values > 0).sum().cast(pl.Int64).alias(">0"),
+        (values < 0).sum().cast(pl.Int64).alias("<0"),
+        (values == 0).sum().cast(pl.Int64).alias("=0"),
+    )
+
+
+def quantile(
+    array: np.ndarray | SortedArray | KllSketch,
+    q: Sequence[float],
+    *,
+    approximate: bool = False,
+    k: int = 200,
+    seed: int | None = 0,
+) -> dict[float, float]:
     r"""Compute the q-th quantile of the data.
 
     Args:
-        array: The input data.
+        array: The input data, a sorted view of the input data, or a
+            sketch of the input data. The quantiles of a sorted view
+            are computed without sorting the data again.
         q: The quantiles to compute. Values must be between 0 and 1
             inclusive.
+        approximate: If ``True``, the quantiles are approximated with
+            a ``KllSketch`` instead of sorting the data. The
+            quantiles are always approximated if ``array`` is a
+            sketch.
+        k: The parameter that controls the accuracy and the size of
+            the sketch used when ``approximate=True``.
+            See ``KllSketch``.
+        seed: The random seed of the sketch used when
+            ``approximate=True``. The default seed makes the
+            approximated quantiles reproducible. If ``None``, the
+            sketch is not seeded.
 
     Returns:
         A dictionary with the quantiles values.
@@ -191,7 +595,81 @@ def quantile(array: np.ndarray, q: Sequence[float]) -> dict[float, float]:
 
     ```
     """
+    if isinstance(array, KllSketch):
+        return dict(zip(q, array.quantile(q).tolist()))
+    if isinstance(array, SortedArray) and not approximate:
+        return dict(zip(q, array.quantile(q).tolist()))
+    if isinstance(array, SortedArray):
+        array = array.values
     array = array.ravel()
     if array.size == 0:
         return {v: float("nan") for v in q}
+    if approximate:
+        sketch = KllSketch(k=k, seed=seed)
+        sketch.update(array)
+        return dict(zip(q, sketch.quantile(q).tolist()))
     return dict(zip(q, np.quantile(array.astype(np.float64), q).tolist()))
+
+
+def _continuous_statistics_schema() -> dict[str, pl.DataType]:
+    r"""Return the schema of the descriptive statistics of a column with
+    continuous values.
+
+    Returns:
+        The schema of the statistics.
+    """
+    return {
+        "count": pl.Int64,
+        "nunique": pl.Int64,
+        "num_non_nulls": pl.Int64,
+        "num_nulls": pl.Int64,
+        "mean": pl.Float64,
+        "std": pl.Float64,
+        "skewness": pl.Float64,
+        "kurtosis": pl.Float64,
+        "min": pl.Float64,
+        **dict.fromkeys(_QUANTILES, pl.Float64),
+        "max": pl.Float64,
+        ">0": pl.Int64,
+        "<0": pl.Int64,
+        "=0": pl.Int64,
+    }
+
+
+def _merge_moments(
+    moments1: tuple[int, float, float, float, float],
+    moments2: tuple[int, float, float, float, float],
+) -> tuple[int, float, float, float, float]:
+    r"""Merge the number of values, the mean and the sums of the powers
+    of the deviations to the mean of two sets of values.
+
+    Args:
+        moments1: The moments of the first set of values.
+        moments2: The moments of the second set of values.
+
+    Returns:
+        The moments of the union of the two sets of values.
+    """
+    n1, mean1, m2_1, m3_1, m4_1 = moments1
+    n2, mean2, m2_2, m3_2, m4_2 = moments2
+    if n1 == 0:
+        return moments2
+    n = n1 + n2
+    delta = mean2 - mean1
+    delta_n = delta / n
+    mean = mean1 + n2 * delta_n
+    m2 = m2_1 + m2_2 + delta * delta_n * n1 * n2
+    m3 = (
+        m3_1
+        + m3_2
+        + delta * delta_n**2 * n1 * n2 * (n1 - n2)
+        + 3.0 * delta_n * (n1 * m2_2 - n2 * m2_1)
+    )
+    m4 = (
+        m4_1
+        + m4_2
+        + delta * delta_n**3 * n1 * n2 * (n1 * n1 - n1 * n2 + n2 * n2)
+        + 6.0 * delta_n**2 * (n1 * n1 * m2_2 + n2 * n2 * m2_1)
+        + 4.0 * delta_n * (n1 * m3_2 - n2 * m3_1)
+    )
+    return n, mean, m2, m3, m4
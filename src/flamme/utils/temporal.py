@@ -2,18 +2,375 @@ r"""Contain utility functions to do temporal transformations."""
 
 from __future__ import annotations
 
-__all__ = ["compute_temporal_stats", "to_step_names", "to_temporal_frames"]
+__all__ = [
+    "TemporalIndex",
+    "compute_temporal_sketches",
+    "compute_temporal_stats",
+    "get_temporal_index",
+    "to_step_names",
+    "to_temporal_frames",
+]
 
+import sys
+import threading
+import weakref
 
+import numpy as np
 import polars as pl
 from grizz.utils.interval import interval_to_strftime_format
 
+from flamme.utils.cache import frame_cache
+from flamme.utils.cube import get_temporal_cube
+from flamme.utils.sketch import KllSketch
 
+# The quantiles computed for each temporal window.
+QUANTILES = {
+    "q01": 0.01,
+    "q05": 0.05,
+    "q10": 0.1,
+    "q25": 0.25,
+    "median": 0.5,
+    "q75": 0.75,
+    "q90": 0.9,
+    "q95": 0.95,
+    "q99": 0.99,
+}
+
+
+class TemporalIndex:
+    r"""Implement an index to group the rows of a DataFrame by temporal
+    window.
+
+    The index holds the permutation that sorts the rows by datetime,
+    or nothing if the rows are already sorted, so the DataFrame is
+    sorted at most once. It also holds the offsets of the temporal
+    windows in the sorted DataFrame for each period. The windows are
+    the same as the windows of ``group_by_dynamic`` with the default
+    options.
+
+    The index must only be used with DataFrames that have the same
+    rows, in the same order, as the DataFrame used to create it.
+    Use ``get_temporal_index`` to share the index between the
+    analyzers and sections of a report.
+
+    Args:
+        datetimes: The datetime values of each row.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from datetime import datetime, timezone
+    >>> import polars as pl
+    >>> from flamme.utils.temporal import TemporalIndex
+    >>> frame = pl.DataFrame(
+    ...     {
+    ...         "col": [1, 2, 3, 4],
+    ...         "datetime": [
+    ...             datetime(year=2020, month=2, day=3, tzinfo=timezone.utc),
+    ...             datetime(year=2020, month=1, day=3, tzinfo=timezone.utc),
+    ...             datetime(year=2020, month=1, day=4, tzinfo=timezone.utc),
+    ...             datetime(year=2020, month=3, day=3, tzinfo=timezone.utc),
+    ...         ],
+    ...     },
+    ... )
+    >>> index = TemporalIndex(frame["datetime"])
+    >>> index.is_sorted
+    False
+    >>> index.sort(frame)["col"].to_list()
+    [2, 3, 1, 4]
+    >>> index.get_offsets("1mo")
+    array([0, 2, 3, 4])
+    >>> index.get_step_names("1mo")
+    ['2020-01', '2020-02', '2020-03']
+
+    ```
+    """
+
+    def __init__(self, datetimes: pl.Series) -> None:
+        self._is_sorted = datetimes.is_sorted()
+        self._permutation = None
+        if not self._is_sorted:
+            self._permutation = datetimes.arg_sort()
+            datetimes = datetimes.gather(self._permutation)
+        self._datetimes = datetimes.set_sorted()
+        # The window starts and offsets for each period.
+        self._windows: dict[str, tuple[list, np.ndarray]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._datetimes.len()
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__qualname__}(num_rows={len(self):,}, "
+            f"is_sorted={self._is_sorted}, periods={sorted(self._windows)})"
+        )
+
+    def __sizeof__(self) -> int:
+        size = object.__sizeof__(self) + self._datetimes.estimated_size()
+        if self._permutation is not None:
+            size += self._permutation.estimated_size()
+        return size + sum(
+            sys.getsizeof(starts) + offsets.nbytes for starts, offsets in self._windows.values()
+        )
+
+    @property
+    def is_sorted(self) -> bool:
+        r"""Indicate if the rows were already sorted by datetime."""
+        return self._is_sorted
+
+    def sort(self, frame: pl.DataFrame) -> pl.DataFrame:
+        r"""Sort the rows of a DataFrame by datetime.
+
+        Args:
+            frame: The DataFrame to sort. It must have the same rows
+                as the DataFrame used to create the index.
+
+        Returns:
+            The sorted DataFrame. It is the input DataFrame if the
+                rows are already sorted.
+
+        Raises:
+            ValueError: if the DataFrame does not have the same
+                number of rows as the index.
+
+        Example usage:
+
+        ```pycon
+
+        >>> from datetime import datetime, timezone
+        >>> import polars as pl
+        >>> from flamme.utils.temporal import TemporalIndex
+        >>> frame = pl.DataFrame(
+        ...     {
+        ...         "col": [1, 2, 3],
+        ...         "datetime": [
+        ...             datetime(year=2020, month=2, day=3, tzinfo=timezone.utc),
+        ...             datetime(year=2020, month=1, day=3, tzinfo=timezone.utc),
+        ...             datetime(year=2020, month=1, day=4, tzinfo=timezone.utc),
+        ...         ],
+        ...     },
+        ... )
+        >>> index = TemporalIndex(frame["datetime"])
+        >>> index.sort(frame.select("col"))["col"].to_list()
+        [2, 3, 1]
+
+        ```
+        """
+        if frame.shape[0] != len(self):
+            msg = (
+                f"The DataFrame has {frame.shape[0]:,} rows but the temporal index "
+                f"has {len(self):,} rows"
+            )
+            raise ValueError(msg)
+        if self._permutation is None:
+            return frame
+        return frame.select(pl.all().gather(self._permutation))
+
+    def get_offsets(self, period: str) -> np.ndarray:
+        r"""Return the offsets of the temporal windows in the sorted
+        DataFrame.
+
+        Args:
+            period: The temporal period e.g. monthly or daily.
+
+        Returns:
+            A 1-d array with ``num_windows + 1`` offsets. The rows of
+                the i-th window are between ``offsets[i]`` and
+                ``offsets[i + 1]`` in the sorted DataFrame.
+
+        Raises:
+            ValueError: if the datetime column has null values.
+
+        Example usage:
+
+        ```pycon
+
+        >>> from datetime import datetime, timezone
+        >>> import polars as pl
+        >>> from flamme.utils.temporal import TemporalIndex
+        >>> index = TemporalIndex(
+        ...     pl.Series(
+        ...         [
+        ...             datetime(year=2020, month=1, day=3, tzinfo=timezone.utc),
+        ...             datetime(year=2020, month=1, day=4, tzinfo=timezone.utc),
+        ...             datetime(year=2020, month=3, day=3, tzinfo=timezone.utc),
+        ...         ]
+        ...     )
+        ... )
+        >>> index.get_offsets("1mo")
+        array([0, 2, 3])
+
+        ```
+        """
+        return self._get_windows(period)[1]
+
+    def get_step_names(self, period: str) -> list[str]:
+        r"""Return the name of each temporal window.
+
+        Args:
+            period: The temporal period e.g. monthly or daily.
+
+        Returns:
+            A list that contains the name of each temporal window.
+
+        Raises:
+            ValueError: if the datetime column has null values.
+
+        Example usage:
+
+        ```pycon
+
+        >>> from datetime import datetime, timezone
+        >>> import polars as pl
+        >>> from flamme.utils.temporal import TemporalIndex
+        >>> index = TemporalIndex(
+        ...     pl.Series(
+        ...         [
+        ...             datetime(year=2020, month=1, day=3, tzinfo=timezone.utc),
+        ...             datetime(year=2020, month=1, day=4, tzinfo=timezone.utc),
+        ...             datetime(year=2020, month=3, day=3, tzinfo=timezone.utc),
+        ...         ]
+        ...     )
+        ... )
+        >>> index.get_step_names("1mo")
+        ['2020-01', '2020-03']
+
+        ```
+        """
+        format_dt = interval_to_strftime_format(period)
+        return [start.strftime(format_dt) for start in self._get_windows(period)[0]]
+
+    def split(self, frame: pl.DataFrame, period: str) -> list[pl.DataFrame]:
+        r"""Split a DataFrame by temporal window.
+
+        Args:
+            frame: The DataFrame to split. It must have the same rows
+                as the DataFrame used to create the index.
+            period: The temporal period e.g. monthly or daily.
+
+        Returns:
+            The sorted DataFrame of each temporal window.
+
+        Example usage:
+
+        ```pycon
+
+        >>> from datetime import datetime, timezone
+        >>> import polars as pl
+        >>> from flamme.utils.temporal import TemporalIndex
+        >>> frame = pl.DataFrame(
+        ...     {
+        ...         "col": [1, 2, 3],
+        ...         "datetime": [
+        ...             datetime(year=2020, month=2, day=3, tzinfo=timezone.utc),
+        ...             datetime(year=2020, month=1, day=3, tzinfo=timezone.utc),
+        ...             datetime(year=2020, month=1, day=4, tzinfo=timezone.utc),
+        ...         ],
+        ...     },
+        ... )
+        >>> index = TemporalIndex(frame["datetime"])
+        >>> [x["col"].to_list() for x in index.split(frame, period="1mo")]
+        [[2, 3], [1]]
+
+        ```
+        """
+        frame = self.sort(frame)
+        offsets = self.get_offsets(period).tolist()
+        return [frame.slice(start, end - start) for start, end in zip(offsets[:-1], offsets[1:])]
+
+    def _get_windows(self, period: str) -> tuple[list, np.ndarray]:
+        r"""Return the start and the offsets of the temporal windows."""
+        with self._lock:
+            if period not in self._windows:
+                self._windows[period] = self._compute_windows(period)
+            return self._windows[period]
+
+    def _compute_windows(self, period: str) -> tuple[list, np.ndarray]:
+        r"""Compute the start and the offsets of the temporal windows."""
+        if self._datetimes.null_count():
+            msg = "The datetime column has null values which are not supported"
+            raise ValueError(msg)
+        runs = self._datetimes.dt.truncate(period).rle()
+        offsets = np.zeros(runs.len() + 1, dtype=np.int64)
+        np.cumsum(runs.struct.field("len").to_numpy(), out=offsets[1:])
+        offsets.flags.writeable = False
+        return runs.struct.field("value").to_list(), offsets
+
+
+# The temporal indices of the live DataFrames. The indices of a
+# DataFrame are removed when the DataFrame is garbage collected.
+_indices: dict[tuple[int, str], TemporalIndex] = {}
+_indices_lock = threading.Lock()
+
+
+def get_temporal_index(frame: pl.DataFrame, dt_column: str) -> TemporalIndex:
+    r"""Return the temporal index of a DataFrame.
+
+    The index is memoized per DataFrame and datetime column, even if
+    the computation cache is disabled, so it is computed once and
+    shared by the temporal analyzers and sections. The index is
+    released when the DataFrame is garbage collected.
+
+    Args:
+        frame: The DataFrame to index.
+        dt_column: The datetime column used to create the temporal
+            windows.
+
+    Returns:
+        The temporal index.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from datetime import datetime, timezone
+    >>> import polars as pl
+    >>> from flamme.utils.temporal import get_temporal_index
+    >>> frame = pl.DataFrame(
+    ...     {
+    ...         "col": [1, 2, 3],
+    ...         "datetime": [
+    ...             datetime(year=2020, month=1, day=3, tzinfo=timezone.utc),
+    ...             datetime(year=2020, month=1, day=4, tzinfo=timezone.utc),
+    ...             datetime(year=2020, month=3, day=3, tzinfo=timezone.utc),
+    ...         ],
+    ...     },
+    ... )
+    >>> index = get_temporal_index(frame, dt_column="datetime")
+    >>> index
+    TemporalIndex(num_rows=3, is_sorted=True, periods=[])
+
+    ```
+    """
+    key = (id(frame), dt_column)
+    with _indices_lock:
+        index = _indices.get(key)
+        if index is None:
+            if not any(frame_id == key[0] for frame_id, _ in _indices):
+                weakref.finalize(frame, _remove_indices, key[0])
+            index = _indices[key] = TemporalIndex(frame[dt_column])
+        return index
+
+
+def _remove_indices(frame_id: int) -> None:
+    r"""Remove the temporal indices of a DataFrame that was garbage
+    collected."""
+    with _indices_lock:
+        for key in [key for key in _indices if key[0] == frame_id]:
+            del _indices[key]
+
+
+@frame_cache
 def compute_temporal_stats(
     frame: pl.DataFrame,
     column: str,
     dt_column: str,
     period: str,
+    *,
+    base_period: str | None = None,
+    approximate: bool = False,
 ) -> pl.DataFrame:
     r"""Return a DataFrame with stats for each temporal window.
 
@@ -23,6 +380,17 @@ def compute_temporal_stats(
         dt_column: The datetime column used to create the temporal
             DataFrames.
         period: The temporal period e.g. monthly or daily.
+        base_period: If not ``None``, the stats are computed from
+            the temporal cube with this base period, which is shared
+            by all the periods that can be rolled up from it.
+            The quantiles are approximated and the number of unique
+            values is not computed. See ``TemporalCube`` for more
+            information.
+        approximate: If ``True``, the quantiles of each temporal
+            window are approximated with a ``KllSketch``. The NaN
+            values are ignored by the approximated quantiles.
+            See ``compute_temporal_sketches``. It is ignored if
+            ``base_period`` is not ``None``.
 
     Returns:
         A DataFrame with stats for each temporal window.
@@ -71,31 +439,133 @@ def compute_temporal_stats(
 
     ```
     """
-    return (
-        frame.select(column, dt_column)
-        .sort(dt_column)
-        .group_by_dynamic(dt_column, every=period)
-        .agg(
-            pl.col(column).len().cast(pl.Int64).alias("count"),
-            pl.col(column).n_unique().cast(pl.Int64).alias("nunique"),
-            pl.col(column).mean().cast(pl.Float64).alias("mean"),
-            pl.col(column).std().cast(pl.Float64).alias("std"),
-            pl.col(column).min().cast(pl.Float64).alias("min"),
-            pl.col(column).quantile(0.01).cast(pl.Float64).alias("q01"),
-            pl.col(column).quantile(0.05).cast(pl.Float64).alias("q05"),
-            pl.col(column).quantile(0.1).cast(pl.Float64).alias("q10"),
-            pl.col(column).quantile(0.25).cast(pl.Float64).alias("q25"),
-            pl.col(column).median().cast(pl.Float64).alias("median"),
-            pl.col(column).quantile(0.75).cast(pl.Float64).alias("q75"),
-            pl.col(column).quantile(0.9).cast(pl.Float64).alias("q90"),
-            pl.col(column).quantile(0.95).cast(pl.Float64).alias("q95"),
-            pl.col(column).quantile(0.99).cast(pl.Float64).alias("q99"),
-            pl.col(column).max().cast(pl.Float64).alias("max"),
+    if base_period is not None:
+        return get_temporal_cube(frame, dt_column=dt_column, period=base_period).get_stats(
+            column, period=period
         )
+    index = get_temporal_index(frame, dt_column)
+    aggregations = [
+        pl.col(column).len().cast(pl.Int64).alias("count"),
+        pl.col(column).n_unique().cast(pl.Int64).alias("nunique"),
+        pl.col(column).mean().cast(pl.Float64).alias("mean"),
+        pl.col(column).std().cast(pl.Float64).alias("std"),
+        pl.col(column).min().cast(pl.Float64).alias("min"),
+    ]
+    if not approximate:
+        aggregations.extend(
+            (pl.col(column).median() if name == "median" else pl.col(column).quantile(q))
+            .cast(pl.Float64)
+            .alias(name)
+            for name, q in QUANTILES.items()
+        )
+    aggregations.append(pl.col(column).max().cast(pl.Float64).alias("max"))
+    stats = (
+        index.sort(frame.select(column, dt_column))
+        .group_by_dynamic(dt_column, every=period)
+        .agg(*aggregations)
         .rename({dt_column: "step"})
     )
+    if not approximate:
+        return stats
+    sketches, _ = compute_temporal_sketches(
+        frame, column=column, dt_column=dt_column, period=period
+    )
+    # The interpolation methods are the same as the polars methods:
+    # nearest rank for the quantiles and linear for the median.
+    quantiles = np.array(
+        [
+            np.where(
+                [name == "median" for name in QUANTILES],
+                sketch.quantile(list(QUANTILES.values())),
+                sketch.quantile(list(QUANTILES.values()), interpolation="nearest"),
+            )
+            for sketch in sketches
+        ],
+        dtype=np.float64,
+    ).reshape(len(sketches), len(QUANTILES))
+    return stats.with_columns(
+        pl.Series(name, quantiles[:, i], dtype=pl.Float64, nan_to_null=True)
+        for i, name in enumerate(QUANTILES)
+    ).select(["step", "count", "nunique", "mean", "std", "min", *QUANTILES, "max"])
+
+
+def compute_temporal_sketches(
+    frame: pl.DataFrame,
+    column: str,
+    dt_column: str,
+    period: str,
+    *,
+    k: int = 200,
+    seed: int | None = 0,
+) -> tuple[list[KllSketch], list[str]]:
+    r"""Return a quantile sketch of the values for each temporal window.
+
+    The sketches are mergeable, so the sketches of the same temporal
+    window computed on several partitions of the data can be merged
+    to approximate the quantiles of the window without reading the
+    data again. The NaN and null values are ignored.
+
+    Args:
+        frame: The DataFrame to analyze.
+        column: The column to analyze. It must be numeric.
+        dt_column: The datetime column used to create the temporal
+            windows.
+        period: The temporal period e.g. monthly or daily.
+        k: The parameter that controls the accuracy and the size of
+            the sketches. See ``KllSketch``.
+        seed: The random seed of the sketches. The default seed makes
+            the approximated quantiles reproducible. If ``None``,
+            the sketches are not seeded.
+
+    Returns:
+        A tuple with the sketches and the names of the temporal
+            windows.
+
+    Raises:
+        ValueError: if the datetime column has null values.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from datetime import datetime, timezone
+    >>> import polars as pl
+    >>> from flamme.utils.temporal import compute_temporal_sketches
+    >>> frame = pl.DataFrame(
+    ...     {
+    ...         "col": [1.2, 4.2, 0.0, 1.0],
+    ...         "datetime": [
+    ...             datetime(year=2020, month=1, day=3, tzinfo=timezone.utc),
+    ...             datetime(year=2020, month=1, day=4, tzinfo=timezone.utc),
+    ...             datetime(year=2020, month=1, day=5, tzinfo=timezone.utc),
+    ...             datetime(year=2020, month=2, day=3, tzinfo=timezone.utc),
+    ...         ],
+    ...     }
+    ... )
+    >>> sketches, steps = compute_temporal_sketches(
+    ...     frame, column="col", dt_column="datetime", period="1mo"
+    ... )
+    >>> sketches
+    [KllSketch(k=200, count=3, num_retained=3), KllSketch(k=200, count=1, num_retained=1)]
+    >>> steps
+    ['2020-01', '2020-02']
+    >>> sketches[0].quantile(0.5)
+    1.2
+
+    ```
+    """
+    index = get_temporal_index(frame, dt_column)
+    offsets = index.get_offsets(period)
+    values = index.sort(frame.select(column))[column].cast(pl.Float64).to_numpy()
+    sketches = []
+    for start, end in zip(offsets[:-1], offsets[1:]):
+        sketch = KllSketch(k=k, seed=seed)
+        sketch.update(values[start:end])
+        sketches.append(sketch)
+    return sketches, index.get_step_names(period)
 
 
+@frame_cache
 def to_temporal_frames(
     frame: pl.DataFrame,
     dt_column: str,
@@ -183,10 +653,8 @@ def to_temporal_frames(
     if frame.is_empty():
         return [], []
 
-    groups = frame.sort(dt_column).group_by_dynamic(dt_column, every=period)
-    steps = to_step_names(groups=groups, period=period)
-    frames = [frame for _, frame in groups]
-    return frames, steps
+    index = get_temporal_index(frame, dt_column)
+    return index.split(frame, period=period), index.get_step_names(period)
 
 
 def to_step_names(groups: pl.GroupBy, period: str) -> list[str]:
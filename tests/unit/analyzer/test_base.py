@@ -2,14 +2,54 @@ from __future__ import annotations
 
 import logging
 from collections import Counter
-from typing import TYPE_CHECKING
 
+import polars as pl
+import pytest
 from objectory import OBJECT_TARGET
 
-from flamme.analyzer import NullValueAnalyzer, is_analyzer_config, setup_analyzer
+from flamme.analyzer import (
+    DuplicatedRowAnalyzer,
+    MarkdownAnalyzer,
+    NullValueAnalyzer,
+    is_analyzer_config,
+    setup_analyzer,
+)
+from flamme.section import DuplicatedRowSection, MarkdownSection
+
+##################################
+#     Tests for BaseAnalyzer     #
+##################################
+
+
+def test_base_analyzer_get_expressions_default() -> None:
+    assert MarkdownAnalyzer(desc="meow").get_expressions(pl.Schema({"float": pl.Float64})) == {}
+
+
+def test_base_analyzer_analyze_results_default() -> None:
+    section = MarkdownAnalyzer(desc="meow").analyze_results(
+        pl.DataFrame({"float": [1.2, 4.2]}, schema={"float": pl.Float64}), results={}
+    )
+    assert isinstance(section, MarkdownSection)
+
+
+def test_base_analyzer_is_streamable_default() -> None:
+    assert not DuplicatedRowAnalyzer().is_streamable()
+
+
+def test_base_analyzer_finalize_default_sample() -> None:
+    analyzer = DuplicatedRowAnalyzer()
+    analyzer.update(pl.DataFrame({"col": [1, 2, 1]}))
+    section = analyzer.finalize(sample=pl.DataFrame({"col": [1, 1]}))
+    assert isinstance(section, DuplicatedRowSection)
+    assert section.frame.shape == (2, 1)
+
+
+def test_base_analyzer_finalize_default_no_sample() -> None:
+    analyzer = DuplicatedRowAnalyzer()
+    analyzer.update(pl.DataFrame({"col": [1, 2, 1]}))
+    with pytest.raises(RuntimeError, match="cannot analyze the data by batches"):
+        analyzer.finalize()
 
-if TYPE_CHECKING:
-    import pytest
 
 ########################################
 #     Tests for is_analyzer_config     #
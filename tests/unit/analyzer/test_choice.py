@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from unittest.mock import patch
+
 import polars as pl
 import pytest
 from coola import objects_are_allclose
@@ -7,6 +9,7 @@ from coola import objects_are_allclose
 from flamme.analyzer import ChoiceAnalyzer, DuplicatedRowAnalyzer, NullValueAnalyzer
 from flamme.analyzer.choice import NumUniqueSelection
 from flamme.section import DuplicatedRowSection, NullValueSection
+from flamme.utils.lazy import collect_expressions
 from flamme.utils.null import compute_null_count
 
 ####################################
@@ -75,6 +78,50 @@ def test_mapping_analyzer_get_statistics_duplicate() -> None:
     assert objects_are_allclose(section.get_statistics(), {"num_rows": 4, "num_unique_rows": 3})
 
 
+def test_mapping_analyzer_get_expressions() -> None:
+    analyzer = ChoiceAnalyzer(
+        {"small": NullValueAnalyzer(), "large": DuplicatedRowAnalyzer()},
+        selection_fn=NumUniqueSelection(column="col"),
+    )
+    assert sorted(analyzer.get_expressions(pl.Schema({"col": pl.Float64}))) == ["selection/nunique"]
+
+
+def test_mapping_analyzer_get_expressions_callable() -> None:
+    analyzer = ChoiceAnalyzer({"duplicate": DuplicatedRowAnalyzer()}, selection_fn=selection_fn)
+    assert analyzer.get_expressions(pl.Schema({"col": pl.Float64})) == {}
+
+
+def test_mapping_analyzer_analyze_num_unique_selection() -> None:
+    frame = pl.DataFrame({"col": [1.2, 4.2, None, 2.2]}, schema={"col": pl.Float64})
+    analyzer = ChoiceAnalyzer(
+        {"small": NullValueAnalyzer(), "large": DuplicatedRowAnalyzer()},
+        selection_fn=NumUniqueSelection(column="col", threshold=2),
+    )
+    with patch("flamme.analyzer.choice.collect_expressions", wraps=collect_expressions) as collect:
+        section = analyzer.analyze(frame)
+    collect.assert_called_once()
+    assert list(collect.call_args.args[1]) == ["selection/nunique"]
+    assert isinstance(section, DuplicatedRowSection)
+    assert objects_are_allclose(section.get_statistics(), {"num_rows": 4, "num_unique_rows": 4})
+
+
+def test_mapping_analyzer_analyze_results_only_selected_analyzer() -> None:
+    frame = pl.DataFrame({"col": [1.2, 4.2, None, 2.2]}, schema={"col": pl.Float64})
+    small, large = NullValueAnalyzer(), DuplicatedRowAnalyzer()
+    analyzer = ChoiceAnalyzer(
+        {"small": small, "large": large},
+        selection_fn=NumUniqueSelection(column="col", threshold=2),
+    )
+    with (
+        patch.object(small, "get_expressions", wraps=small.get_expressions) as small_exprs,
+        patch.object(large, "get_expressions", wraps=large.get_expressions) as large_exprs,
+    ):
+        section = analyzer.analyze_results(frame, {"selection/nunique": 3})
+    small_exprs.assert_not_called()
+    large_exprs.assert_called_once()
+    assert isinstance(section, DuplicatedRowSection)
+
+
 ########################################
 #     Tests for NumUniqueSelection     #
 ########################################
@@ -116,3 +163,40 @@ def test_num_unique_selection_call_threshold_10() -> None:
     select = NumUniqueSelection(column="col", threshold=10)
     assert select(pl.DataFrame({"col": list(range(10))})) == "small"
     assert select(pl.DataFrame({"col": list(range(11))})) == "large"
+
+
+def test_num_unique_selection_get_expressions() -> None:
+    assert list(
+        NumUniqueSelection(column="col").get_expressions(pl.Schema({"col": pl.Float64}))
+    ) == ["nunique"]
+
+
+def test_num_unique_selection_get_expressions_approximate() -> None:
+    assert (
+        NumUniqueSelection(column="col", approximate=True).get_expressions(
+            pl.Schema({"col": pl.Float64})
+        )
+        == {}
+    )
+
+
+def test_num_unique_selection_get_expressions_missing_column() -> None:
+    assert NumUniqueSelection(column="col").get_expressions(pl.Schema({"x": pl.Float64})) == {}
+
+
+def test_num_unique_selection_select_results() -> None:
+    select = NumUniqueSelection(column="col", threshold=10)
+    frame = pl.DataFrame({"col": list(range(10))})
+    assert select.select_results(frame, {"nunique": 10}) == "small"
+    assert select.select_results(frame, {"nunique": 11}) == "large"
+
+
+def test_num_unique_selection_select_results_empty() -> None:
+    select = NumUniqueSelection(column="col", threshold=10)
+    assert select.select_results(pl.DataFrame({"col": list(range(11))}), {}) == "large"
+
+
+def test_num_unique_selection_call_approximate() -> None:
+    select = NumUniqueSelection(column="col", threshold=10, approximate=True)
+    assert select(pl.DataFrame({"col": list(range(10))})) == "small"
+    assert select(pl.DataFrame({"col": list(range(11))})) == "large"
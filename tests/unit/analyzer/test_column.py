@@ -3,8 +3,13 @@ from __future__ import annotations
 import polars as pl
 from coola import objects_are_equal
 
-from flamme.analyzer import ColumnSubsetAnalyzer, NullValueAnalyzer
-from flamme.section import NullValueSection
+from flamme.analyzer import (
+    ColumnSubsetAnalyzer,
+    DuplicatedRowAnalyzer,
+    NullValueAnalyzer,
+)
+from flamme.section import DuplicatedRowSection, NullValueSection
+from flamme.utils.lazy import collect_expressions
 
 ##########################################
 #     Tests for ColumnSubsetAnalyzer     #
@@ -59,3 +64,82 @@ def test_column_subset_analyzer_get_statistics_empty() -> None:
             "total_count": (0, 0),
         },
     )
+
+
+def test_column_subset_analyzer_get_expressions() -> None:
+    assert sorted(
+        ColumnSubsetAnalyzer(
+            columns=["float", "str"], analyzer=NullValueAnalyzer()
+        ).get_expressions(pl.Schema({"float": pl.Float64, "int": pl.Int64, "str": pl.String}))
+    ) == ["analyzer/null_count/float", "analyzer/null_count/str", "analyzer/num_rows"]
+
+
+def test_column_subset_analyzer_get_expressions_missing_column() -> None:
+    assert (
+        ColumnSubsetAnalyzer(
+            columns=["float", "str"], analyzer=NullValueAnalyzer()
+        ).get_expressions(pl.Schema({"float": pl.Float64, "int": pl.Int64}))
+        == {}
+    )
+
+
+def test_column_subset_analyzer_analyze_results() -> None:
+    frame = pl.DataFrame(
+        {
+            "float": [1.2, 4.2, None, 2.2],
+            "int": [None, 1, 0, 1],
+            "str": ["A", "B", None, None],
+        },
+        schema={"float": pl.Float64, "int": pl.Int64, "str": pl.String},
+    )
+    analyzer = ColumnSubsetAnalyzer(columns=["float", "str"], analyzer=NullValueAnalyzer())
+    section = analyzer.analyze_results(
+        frame, collect_expressions(frame, analyzer.get_expressions(frame.schema))
+    )
+    assert isinstance(section, NullValueSection)
+    assert objects_are_equal(
+        section.get_statistics(),
+        {
+            "columns": ("float", "str"),
+            "null_count": (1, 2),
+            "total_count": (4, 4),
+        },
+    )
+
+
+def test_column_subset_analyzer_is_streamable() -> None:
+    assert ColumnSubsetAnalyzer(columns=["float"], analyzer=NullValueAnalyzer()).is_streamable()
+
+
+def test_column_subset_analyzer_is_streamable_false() -> None:
+    assert not ColumnSubsetAnalyzer(
+        columns=["float"], analyzer=DuplicatedRowAnalyzer()
+    ).is_streamable()
+
+
+def test_column_subset_analyzer_update_finalize() -> None:
+    analyzer = ColumnSubsetAnalyzer(columns=["float", "str"], analyzer=NullValueAnalyzer())
+    frame = pl.DataFrame(
+        {
+            "float": [1.2, 4.2, None, 2.2],
+            "int": [None, 1, 0, 1],
+            "str": ["A", "B", None, None],
+        },
+        schema={"float": pl.Float64, "int": pl.Int64, "str": pl.String},
+    )
+    for batch in frame.iter_slices(n_rows=3):
+        analyzer.update(batch)
+    section = analyzer.finalize()
+    assert isinstance(section, NullValueSection)
+    assert objects_are_equal(
+        section.get_statistics(),
+        {"columns": ("float", "str"), "null_count": (1, 2), "total_count": (4, 4)},
+    )
+
+
+def test_column_subset_analyzer_finalize_sample() -> None:
+    section = ColumnSubsetAnalyzer(columns=["col1"], analyzer=DuplicatedRowAnalyzer()).finalize(
+        sample=pl.DataFrame({"col1": [1, 2], "col2": [3, 4]})
+    )
+    assert isinstance(section, DuplicatedRowSection)
+    assert section.frame.columns == ["col1"]
@@ -179,3 +179,48 @@ def test_column_continuous_analyzer_analyze_missing_column() -> None:
     section = ColumnContinuousAnalyzer(column="col2").analyze(pl.DataFrame({"col": []}))
     assert isinstance(section, EmptySection)
     assert objects_are_equal(section.get_statistics(), {})
+
+
+def test_column_continuous_analyzer_is_streamable() -> None:
+    assert ColumnContinuousAnalyzer(column="col").is_streamable()
+
+
+def test_column_continuous_analyzer_update_finalize(dataframe: pl.DataFrame) -> None:
+    analyzer = ColumnContinuousAnalyzer(column="col")
+    for batch in dataframe.iter_slices(n_rows=10):
+        analyzer.update(batch)
+    section = analyzer.finalize()
+    assert isinstance(section, ColumnContinuousSection)
+    stats = section.get_statistics()
+    expected = analyzer.analyze(dataframe).get_statistics()
+    assert abs(stats.pop("nunique") - expected.pop("nunique")) <= 2
+    assert objects_are_allclose(stats, expected)
+    assert section.series.name == "col"
+    assert section.series.dtype == pl.Int64
+    assert section.series.len() == 1000
+
+
+def test_column_continuous_analyzer_update_finalize_num_quantiles(
+    dataframe: pl.DataFrame,
+) -> None:
+    analyzer = ColumnContinuousAnalyzer(column="col", num_quantiles=5)
+    analyzer.update(dataframe)
+    assert_series_equal(
+        analyzer.finalize().series, pl.Series("col", [0, 25, 50, 75, 100], dtype=pl.Int64)
+    )
+
+
+def test_column_continuous_analyzer_finalize_reset(dataframe: pl.DataFrame) -> None:
+    analyzer = ColumnContinuousAnalyzer(column="col")
+    analyzer.update(dataframe)
+    analyzer.finalize()
+    analyzer.update(dataframe[:10])
+    assert analyzer.finalize().get_statistics()["count"] == 10
+
+
+def test_column_continuous_analyzer_finalize_missing_column() -> None:
+    analyzer = ColumnContinuousAnalyzer(column="col2")
+    analyzer.update(pl.DataFrame({"col": [1.0, 2.0]}))
+    section = analyzer.finalize()
+    assert isinstance(section, EmptySection)
+    assert objects_are_equal(section.get_statistics(), {})
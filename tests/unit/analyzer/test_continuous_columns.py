@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timezone
+
+import numpy as np
+import polars as pl
+import pytest
+from coola import objects_are_allclose
+from jinja2 import Template
+
+from flamme.analyzer import ContinuousColumnsAnalyzer, MappingAnalyzer, NullValueAnalyzer
+from flamme.section import (
+    ColumnContinuousAdvancedSection,
+    ColumnContinuousSection,
+    ColumnTemporalContinuousSection,
+    SectionDict,
+)
+from flamme.utils.cache import enable_computation_cache
+from flamme.utils.cube import get_temporal_cube
+from flamme.utils.lazy import collect_expressions
+from flamme.utils.stats import compute_statistics_continuous
+
+
+@pytest.fixture
+def dataframe() -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "float": [1.2, 4.2, None, 2.2, float("nan"), -1.0],
+            "int": [None, 1, 0, 1, 5, 2],
+            "str": ["A", "B", None, None, "C", "D"],
+            "datetime": [
+                datetime(year=2020, month=1, day=3, tzinfo=timezone.utc),
+                datetime(year=2020, month=1, day=4, tzinfo=timezone.utc),
+                datetime(year=2020, month=2, day=3, tzinfo=timezone.utc),
+                datetime(year=2020, month=2, day=4, tzinfo=timezone.utc),
+                datetime(year=2020, month=3, day=3, tzinfo=timezone.utc),
+                datetime(year=2020, month=4, day=3, tzinfo=timezone.utc),
+            ],
+        },
+        schema={
+            "float": pl.Float64,
+            "int": pl.Int64,
+            "str": pl.String,
+            "datetime": pl.Datetime(time_unit="us", time_zone="UTC"),
+        },
+    )
+
+
+###############################################
+#     Tests for ContinuousColumnsAnalyzer     #
+###############################################
+
+
+def test_continuous_columns_analyzer_str() -> None:
+    assert str(ContinuousColumnsAnalyzer()).startswith("ContinuousColumnsAnalyzer(")
+
+
+def test_continuous_columns_analyzer_analyze(dataframe: pl.DataFrame) -> None:
+    section = ContinuousColumnsAnalyzer(
+        dt_column="datetime", periods=["1mo", "1w"], nbins=10, yscale="linear", figsize=(7, 3)
+    ).analyze(dataframe)
+    assert isinstance(section, SectionDict)
+    assert list(section.sections) == ["float", "int"]
+    sections = section.sections["float"].sections
+    assert list(sections) == ["overall", "1mo", "1w", "advanced"]
+    assert isinstance(sections["overall"], ColumnContinuousSection)
+    assert sections["overall"].column == "float"
+    assert sections["overall"].nbins == 10
+    assert sections["overall"].yscale == "linear"
+    assert sections["overall"].figsize == (7, 3)
+    assert isinstance(sections["1mo"], ColumnTemporalContinuousSection)
+    assert sections["1mo"].period == "1mo"
+    assert sections["1mo"].dt_column == "datetime"
+    assert isinstance(sections["advanced"], ColumnContinuousAdvancedSection)
+    assert sections["advanced"].nbins == 10
+
+
+@pytest.mark.parametrize("column", ["float", "int"])
+def test_continuous_columns_analyzer_analyze_statistics(
+    dataframe: pl.DataFrame, column: str
+) -> None:
+    section = ContinuousColumnsAnalyzer().analyze(dataframe)
+    expected = compute_statistics_continuous(dataframe[column])
+    for name in ["overall", "advanced"]:
+        assert objects_are_allclose(
+            section.sections[column].sections[name].get_statistics(), expected, equal_nan=True
+        )
+
+
+def test_continuous_columns_analyzer_analyze_columns(dataframe: pl.DataFrame) -> None:
+    section = ContinuousColumnsAnalyzer(columns=["int", "missing"]).analyze(dataframe)
+    assert list(section.sections) == ["int"]
+
+
+def test_continuous_columns_analyzer_analyze_non_numeric_columns(
+    dataframe: pl.DataFrame, caplog: pytest.LogCaptureFixture
+) -> None:
+    analyzer = ContinuousColumnsAnalyzer(columns=["str", "float", "datetime"])
+    assert list(analyzer.get_expressions(dataframe.schema)) == ["statistics/float"]
+    with caplog.at_level(logging.WARNING):
+        section = analyzer.analyze(dataframe)
+    assert list(section.sections) == ["float"]
+    assert "because they are not numeric: ['str', 'datetime']" in caplog.text
+
+
+def test_continuous_columns_analyzer_analyze_non_numeric_columns_mapping(
+    dataframe: pl.DataFrame,
+) -> None:
+    section = MappingAnalyzer(
+        {
+            "continuous": ContinuousColumnsAnalyzer(columns=["str", "int"]),
+            "null": NullValueAnalyzer(),
+        }
+    ).analyze(dataframe)
+    assert list(section.sections["continuous"].sections) == ["int"]
+    assert section.sections["null"].get_statistics()["null_count"] == (1, 1, 2, 0)
+
+
+def test_continuous_columns_analyzer_analyze_no_temporal(dataframe: pl.DataFrame) -> None:
+    section = ContinuousColumnsAnalyzer(periods=["1mo"]).analyze(dataframe)
+    assert list(section.sections["float"].sections) == ["overall", "advanced"]
+
+
+def test_continuous_columns_analyzer_analyze_missing_dt_column(dataframe: pl.DataFrame) -> None:
+    section = ContinuousColumnsAnalyzer(dt_column="missing", periods=["1mo"]).analyze(dataframe)
+    assert list(section.sections["float"].sections) == ["overall", "advanced"]
+
+
+def test_continuous_columns_analyzer_analyze_advanced_false(dataframe: pl.DataFrame) -> None:
+    section = ContinuousColumnsAnalyzer(advanced=False).analyze(dataframe)
+    assert list(section.sections["float"].sections) == ["overall"]
+
+
+def test_continuous_columns_analyzer_analyze_empty() -> None:
+    section = ContinuousColumnsAnalyzer().analyze(pl.DataFrame({"str": ["A", "B"]}))
+    assert isinstance(section, SectionDict)
+    assert section.sections == {}
+
+
+def test_continuous_columns_analyzer_analyze_empty_rows(dataframe: pl.DataFrame) -> None:
+    section = ContinuousColumnsAnalyzer().analyze(dataframe.head(0))
+    stats = section.sections["float"].sections["overall"].get_statistics()
+    assert stats["count"] == 0
+    assert np.isnan(stats["mean"])
+
+
+def test_continuous_columns_analyzer_analyze_base_period(dataframe: pl.DataFrame) -> None:
+    with enable_computation_cache():
+        section = ContinuousColumnsAnalyzer(
+            dt_column="datetime", periods=["1mo"], base_period="1d"
+        ).analyze(dataframe)
+        cube = get_temporal_cube(dataframe, dt_column="datetime", period="1d")
+        assert "columns=['float', 'int']" in repr(cube)
+    assert section.sections["int"].sections["1mo"].base_period == "1d"
+
+
+def test_continuous_columns_analyzer_get_expressions(dataframe: pl.DataFrame) -> None:
+    analyzer = ContinuousColumnsAnalyzer(columns=["float", "int", "missing"])
+    assert sorted(analyzer.get_expressions(dataframe.schema)) == [
+        "statistics/float",
+        "statistics/int",
+    ]
+
+
+def test_continuous_columns_analyzer_analyze_results(dataframe: pl.DataFrame) -> None:
+    analyzer = MappingAnalyzer(
+        {"null": NullValueAnalyzer(), "continuous": ContinuousColumnsAnalyzer()}
+    )
+    results = collect_expressions(dataframe, analyzer.get_expressions(dataframe.schema))
+    section = analyzer.analyze_results(dataframe, results)
+    stats = section.sections["continuous"].sections["int"].sections["overall"].get_statistics()
+    assert stats["count"] == 6
+    assert stats["num_nulls"] == 1
+
+
+def test_continuous_columns_analyzer_render_html_body(dataframe: pl.DataFrame) -> None:
+    section = ContinuousColumnsAnalyzer(dt_column="datetime", periods=["1mo"]).analyze(dataframe)
+    assert isinstance(Template(section.render_html_body()).render(), str)
@@ -103,6 +103,22 @@ def test_column_temporal_continuous_analyzer_figsize(
     assert section.figsize == figsize
 
 
+def test_column_temporal_continuous_analyzer_base_period(dataframe: pl.DataFrame) -> None:
+    section = ColumnTemporalContinuousAnalyzer(
+        column="col", dt_column="datetime", period="1mo", base_period="1d"
+    ).analyze(dataframe)
+    assert isinstance(section, ColumnTemporalContinuousSection)
+    assert section.base_period == "1d"
+
+
+def test_column_temporal_continuous_analyzer_base_period_default(dataframe: pl.DataFrame) -> None:
+    section = ColumnTemporalContinuousAnalyzer(
+        column="col", dt_column="datetime", period="1mo"
+    ).analyze(dataframe)
+    assert isinstance(section, ColumnTemporalContinuousSection)
+    assert section.base_period is None
+
+
 def test_column_temporal_continuous_analyzer_analyze(dataframe: pl.DataFrame) -> None:
     section = ColumnTemporalContinuousAnalyzer(
         column="col", dt_column="datetime", period="1mo"
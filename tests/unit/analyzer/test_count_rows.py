@@ -73,6 +73,18 @@ def test_temporal_row_count_analyzer_figsize_default(dataframe: pl.DataFrame) ->
     assert section.figsize is None
 
 
+def test_temporal_row_count_analyzer_base_period(dataframe: pl.DataFrame) -> None:
+    section = TemporalRowCountAnalyzer(
+        dt_column="datetime", period="1mo", base_period="1d"
+    ).analyze(dataframe)
+    assert section.base_period == "1d"
+
+
+def test_temporal_row_count_analyzer_base_period_default(dataframe: pl.DataFrame) -> None:
+    section = TemporalRowCountAnalyzer(dt_column="datetime", period="1mo").analyze(dataframe)
+    assert section.base_period is None
+
+
 def test_temporal_row_count_analyzer_get_statistics(dataframe: pl.DataFrame) -> None:
     section = TemporalRowCountAnalyzer(dt_column="datetime", period="1mo").analyze(dataframe)
     assert isinstance(section, TemporalRowCountSection)
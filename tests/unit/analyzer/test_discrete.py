@@ -85,6 +85,24 @@ def test_column_discrete_analyzer_analyze_drop_nulls_true() -> None:
     )
 
 
+def test_column_discrete_analyzer_analyze_capacity() -> None:
+    section = ColumnDiscreteAnalyzer(column="int", capacity=100).analyze(
+        pl.DataFrame(
+            {
+                "float": [1.2, 4.2, None, 2.2],
+                "int": [None, 1, 0, 1],
+                "str": ["A", "B", None, None],
+            },
+            schema={"float": pl.Float64, "int": pl.Int64, "str": pl.String},
+        )
+    )
+    assert isinstance(section, ColumnDiscreteSection)
+    assert objects_are_equal(
+        section.get_statistics(),
+        {"most_common": [(1, 2), (0, 1), (None, 1)], "null_values": 1, "nunique": 3, "total": 4},
+    )
+
+
 def test_column_discrete_analyzer_analyze_empty_no_row() -> None:
     section = ColumnDiscreteAnalyzer(column="int").analyze(
         pl.DataFrame({"float": [], "int": [], "str": []})
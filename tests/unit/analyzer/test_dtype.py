@@ -5,6 +5,7 @@ from coola import objects_are_equal
 
 from flamme.analyzer import DataTypeAnalyzer
 from flamme.section import DataTypeSection
+from flamme.utils.lazy import collect_expressions
 
 ########################################
 #     Tests for ColumnTypeAnalyzer     #
@@ -48,3 +49,55 @@ def test_column_type_analyzer_get_statistics_empty_no_column() -> None:
     section = DataTypeAnalyzer().analyze(pl.DataFrame({}))
     assert isinstance(section, DataTypeSection)
     assert objects_are_equal(section.get_statistics(), {})
+
+
+def test_column_type_analyzer_get_statistics_object() -> None:
+    section = DataTypeAnalyzer().analyze(
+        pl.DataFrame({"col": pl.Series([1, "a", None], dtype=pl.Object)})
+    )
+    assert isinstance(section, DataTypeSection)
+    assert objects_are_equal(section.get_statistics(), {"col": {int, str, type(None)}})
+
+
+def test_column_type_analyzer_get_expressions() -> None:
+    assert sorted(
+        DataTypeAnalyzer().get_expressions(pl.Schema({"float": pl.Float64, "int": pl.Int64}))
+    ) == ["null_count/float", "null_count/int", "num_rows"]
+
+
+def test_column_type_analyzer_analyze_results() -> None:
+    frame = pl.DataFrame(
+        {"int": [None, 1, 0, 1], "float": [1.2, 4.2, float("nan"), 2.2]},
+        schema={"int": pl.Int64, "float": pl.Float64},
+    )
+    analyzer = DataTypeAnalyzer()
+    section = analyzer.analyze_results(
+        frame, collect_expressions(frame, analyzer.get_expressions(frame.schema))
+    )
+    assert isinstance(section, DataTypeSection)
+    assert objects_are_equal(section.get_statistics(), {"float": {float}, "int": {int, type(None)}})
+
+
+def test_column_type_analyzer_is_streamable() -> None:
+    assert DataTypeAnalyzer().is_streamable()
+
+
+def test_column_type_analyzer_update_finalize() -> None:
+    analyzer = DataTypeAnalyzer()
+    analyzer.update(
+        pl.DataFrame({"int": [1, 0], "str": ["A", "B"]}, schema={"int": pl.Int64, "str": pl.String})
+    )
+    analyzer.update(
+        pl.DataFrame(
+            {"int": [None, 1], "str": ["C", "D"]}, schema={"int": pl.Int64, "str": pl.String}
+        )
+    )
+    section = analyzer.finalize()
+    assert isinstance(section, DataTypeSection)
+    assert objects_are_equal(section.get_statistics(), {"int": {int, type(None)}, "str": {str}})
+
+
+def test_column_type_analyzer_finalize_empty() -> None:
+    section = DataTypeAnalyzer().finalize()
+    assert isinstance(section, DataTypeSection)
+    assert objects_are_equal(section.get_statistics(), {})
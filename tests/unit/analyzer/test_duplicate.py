@@ -7,6 +7,7 @@ from polars.testing import assert_frame_equal
 
 from flamme.analyzer import DuplicatedRowAnalyzer
 from flamme.section import DuplicatedRowSection
+from flamme.utils.lazy import collect_expressions
 
 
 @pytest.fixture
@@ -82,3 +83,27 @@ def test_duplicated_row_analyzer_get_statistics_missing_column() -> None:
     section = DuplicatedRowAnalyzer().analyze(pl.DataFrame({}))
     assert isinstance(section, DuplicatedRowSection)
     assert objects_are_equal(section.get_statistics(), {"num_rows": 0, "num_unique_rows": 0})
+
+
+def test_duplicated_row_analyzer_get_expressions() -> None:
+    assert list(
+        DuplicatedRowAnalyzer().get_expressions(pl.Schema({"col1": pl.Float64, "col2": pl.Int64}))
+    ) == ["num_unique_rows"]
+
+
+def test_duplicated_row_analyzer_get_expressions_missing_column() -> None:
+    assert (
+        DuplicatedRowAnalyzer(columns=["col1", "col3"]).get_expressions(
+            pl.Schema({"col1": pl.Float64, "col2": pl.Int64})
+        )
+        == {}
+    )
+
+
+def test_duplicated_row_analyzer_analyze_results(dataframe: pl.DataFrame) -> None:
+    analyzer = DuplicatedRowAnalyzer(columns=["col2", "col3"])
+    section = analyzer.analyze_results(
+        dataframe, collect_expressions(dataframe, analyzer.get_expressions(dataframe.schema))
+    )
+    assert isinstance(section, DuplicatedRowSection)
+    assert objects_are_equal(section.get_statistics(), {"num_rows": 4, "num_unique_rows": 2})
@@ -6,6 +6,7 @@ from coola import objects_are_equal
 
 from flamme.analyzer import DataFrameSummaryAnalyzer
 from flamme.section import DataFrameSummarySection
+from flamme.utils.lazy import collect_expressions
 
 
 @pytest.fixture
@@ -78,6 +79,14 @@ def test_column_type_analyzer_top(dataframe: pl.DataFrame, top: int) -> None:
     assert section.top == top
 
 
+@pytest.mark.parametrize("approximate", [True, False])
+def test_column_type_analyzer_approximate(dataframe: pl.DataFrame, approximate: bool) -> None:
+    section = DataFrameSummaryAnalyzer(approximate=approximate).analyze(dataframe)
+    assert isinstance(section, DataFrameSummarySection)
+    assert section.approximate == approximate
+    assert section.get_nunique() == (5, 2, 4)
+
+
 def test_column_type_analyzer_top_incorrect() -> None:
     with pytest.raises(ValueError, match="Incorrect top value .*. top must be positive"):
         DataFrameSummaryAnalyzer(top=-1)
@@ -104,3 +113,120 @@ def test_column_type_analyzer_sort() -> None:
             "nunique": (5, 2, 4),
         },
     )
+
+
+def test_column_type_analyzer_is_streamable() -> None:
+    assert not DataFrameSummaryAnalyzer().is_streamable()
+
+
+def test_column_type_analyzer_is_streamable_approximate() -> None:
+    assert DataFrameSummaryAnalyzer(approximate=True).is_streamable()
+
+
+@pytest.mark.parametrize("sort", [True, False])
+def test_column_type_analyzer_update_finalize(dataframe: pl.DataFrame, sort: bool) -> None:
+    analyzer = DataFrameSummaryAnalyzer(top=2, sort=sort, approximate=True)
+    for batch in dataframe.select(["col3", "col1", "col2"]).iter_slices(n_rows=4):
+        analyzer.update(batch)
+    section = analyzer.finalize()
+    assert isinstance(section, DataFrameSummarySection)
+    assert section.frame is None
+    assert objects_are_equal(
+        section.get_statistics(),
+        {
+            "columns": ("col1", "col2", "col3") if sort else ("col3", "col1", "col2"),
+            "dtypes": (
+                (pl.Float64(), pl.Int64(), pl.String())
+                if sort
+                else (pl.String(), pl.Float64(), pl.Int64())
+            ),
+            "null_count": (1, 0, 2) if sort else (2, 1, 0),
+            "nunique": (5, 2, 4) if sort else (4, 5, 2),
+        },
+    )
+    assert objects_are_equal(
+        section.get_most_frequent_values(top=1),
+        (
+            (
+                ((2.2, 2),),
+                ((1, 5),),
+                (("B", 2),),
+            )
+            if sort
+            else (
+                (("B", 2),),
+                ((2.2, 2),),
+                ((1, 5),),
+            )
+        ),
+    )
+    assert "number of rows: 6<" in section.render_html_body()
+
+
+def test_column_type_analyzer_finalize_reset(dataframe: pl.DataFrame) -> None:
+    analyzer = DataFrameSummaryAnalyzer(approximate=True)
+    analyzer.update(dataframe)
+    analyzer.finalize()
+    analyzer.update(dataframe[:2])
+    assert objects_are_equal(
+        analyzer.finalize().get_statistics(),
+        {
+            "columns": ("col1", "col2", "col3"),
+            "dtypes": (pl.Float64(), pl.Int64(), pl.String()),
+            "null_count": (0, 0, 0),
+            "nunique": (2, 1, 2),
+        },
+    )
+
+
+def test_column_type_analyzer_finalize_empty() -> None:
+    assert objects_are_equal(
+        DataFrameSummaryAnalyzer(approximate=True).finalize().get_statistics(),
+        {"columns": (), "dtypes": (), "null_count": (), "nunique": ()},
+    )
+
+
+def test_column_type_analyzer_finalize_sample(dataframe: pl.DataFrame) -> None:
+    assert objects_are_equal(
+        DataFrameSummaryAnalyzer().finalize(dataframe).get_statistics(),
+        {
+            "columns": ("col1", "col2", "col3"),
+            "dtypes": (pl.Float64(), pl.Int64(), pl.String()),
+            "null_count": (1, 0, 2),
+            "nunique": (5, 2, 4),
+        },
+    )
+
+
+def test_column_type_analyzer_get_expressions() -> None:
+    assert sorted(
+        DataFrameSummaryAnalyzer().get_expressions(
+            pl.Schema({"col1": pl.Float64, "col2": pl.Int64})
+        )
+    ) == ["null_count/col1", "null_count/col2", "nunique/col1", "nunique/col2"]
+
+
+def test_column_type_analyzer_get_expressions_approximate() -> None:
+    assert sorted(
+        DataFrameSummaryAnalyzer(approximate=True).get_expressions(
+            pl.Schema({"col1": pl.Float64, "col2": pl.Int64})
+        )
+    ) == ["null_count/col1", "null_count/col2"]
+
+
+def test_column_type_analyzer_analyze_results(dataframe: pl.DataFrame) -> None:
+    analyzer = DataFrameSummaryAnalyzer(sort=True)
+    section = analyzer.analyze_results(
+        dataframe.select(["col3", "col1", "col2"]),
+        collect_expressions(dataframe, analyzer.get_expressions(dataframe.schema)),
+    )
+    assert isinstance(section, DataFrameSummarySection)
+    assert objects_are_equal(
+        section.get_statistics(),
+        {
+            "columns": ("col1", "col2", "col3"),
+            "dtypes": (pl.Float64(), pl.Int64(), pl.String()),
+            "null_count": (1, 0, 2),
+            "nunique": (5, 2, 4),
+        },
+    )
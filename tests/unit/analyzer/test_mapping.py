@@ -1,16 +1,24 @@
 from __future__ import annotations
 
+from unittest.mock import patch
+
 import polars as pl
 import pytest
-from coola import objects_are_allclose
+from coola import objects_are_allclose, objects_are_equal
 
 from flamme.analyzer import (
+    ChoiceAnalyzer,
+    ColumnSubsetAnalyzer,
+    DataFrameSummaryAnalyzer,
     DataTypeAnalyzer,
     DuplicatedRowAnalyzer,
     MappingAnalyzer,
     NullValueAnalyzer,
+    TableOfContentAnalyzer,
 )
+from flamme.analyzer.choice import NumUniqueSelection
 from flamme.section import SectionDict
+from flamme.utils.lazy import collect_expressions
 
 #####################################
 #     Tests for MappingAnalyzer     #
@@ -162,3 +170,191 @@ def test_mapping_analyzer_add_analyzer_replace_ok_true() -> None:
     assert len(analyzer.analyzers) == 2
     assert isinstance(analyzer.analyzers["section1"], NullValueAnalyzer)
     assert isinstance(analyzer.analyzers["section2"], DuplicatedRowAnalyzer)
+
+
+def test_mapping_analyzer_get_expressions() -> None:
+    analyzer = MappingAnalyzer(
+        {
+            "section1": NullValueAnalyzer(),
+            "section2": DuplicatedRowAnalyzer(),
+            "section3": MappingAnalyzer({"null": NullValueAnalyzer()}),
+        }
+    )
+    assert sorted(analyzer.get_expressions(pl.Schema({"float": pl.Float64}))) == [
+        "0/null_count/float",
+        "0/num_rows",
+        "1/num_unique_rows",
+        "2/0/null_count/float",
+        "2/0/num_rows",
+    ]
+
+
+def test_mapping_analyzer_get_expressions_empty() -> None:
+    assert MappingAnalyzer({}).get_expressions(pl.Schema({"float": pl.Float64})) == {}
+
+
+def test_mapping_analyzer_analyze_single_collect() -> None:
+    frame = pl.DataFrame(
+        {"float": [1.2, 4.2, None, 2.2], "int": [None, 1, 0, 1]},
+        schema={"float": pl.Float64, "int": pl.Int64},
+    )
+    analyzer = MappingAnalyzer(
+        {
+            "null": NullValueAnalyzer(),
+            "nested": MappingAnalyzer(
+                {
+                    "null": NullValueAnalyzer(),
+                    "toc": TableOfContentAnalyzer(NullValueAnalyzer()),
+                }
+            ),
+        }
+    )
+    with patch("flamme.analyzer.mapping.collect_expressions", wraps=collect_expressions) as collect:
+        section = analyzer.analyze(frame)
+    collect.assert_called_once()
+    stats = {"columns": ("float", "int"), "null_count": (1, 1), "total_count": (4, 4)}
+    assert objects_are_equal(
+        section.get_statistics(),
+        {"null": stats, "nested": {"null": stats, "toc": stats}},
+    )
+
+
+def test_mapping_analyzer_analyze_single_collect_analyzers() -> None:
+    frame = pl.DataFrame(
+        {"float": [1.2, 4.2, None, 4.2], "int": [None, 1, 0, 1]},
+        schema={"float": pl.Float64, "int": pl.Int64},
+    )
+    analyzer = MappingAnalyzer(
+        {
+            "summary": DataFrameSummaryAnalyzer(),
+            "dtype": DataTypeAnalyzer(),
+            "duplicate": DuplicatedRowAnalyzer(),
+            "subset": ColumnSubsetAnalyzer(columns=["int"], analyzer=NullValueAnalyzer()),
+            "choice": ChoiceAnalyzer(
+                {"small": NullValueAnalyzer(), "large": DuplicatedRowAnalyzer()},
+                selection_fn=NumUniqueSelection(column="int", threshold=2),
+            ),
+        }
+    )
+    with (
+        patch("flamme.analyzer.mapping.collect_expressions", wraps=collect_expressions) as collect,
+        patch.object(pl.DataFrame, "unique") as unique,
+    ):
+        section = analyzer.analyze(frame)
+        stats = section.get_statistics()
+    collect.assert_called_once()
+    unique.assert_not_called()
+    assert objects_are_equal(
+        stats,
+        {
+            "summary": {
+                "columns": ("float", "int"),
+                "null_count": (1, 1),
+                "nunique": (3, 3),
+                "dtypes": (pl.Float64(), pl.Int64()),
+            },
+            "dtype": {"float": {float, type(None)}, "int": {int, type(None)}},
+            "duplicate": {"num_rows": 4, "num_unique_rows": 3},
+            "subset": {"columns": ("int",), "null_count": (1,), "total_count": (4,)},
+            "choice": {"num_rows": 4, "num_unique_rows": 3},
+        },
+    )
+
+
+@pytest.mark.parametrize("max_workers", [None, 1, 2])
+def test_mapping_analyzer_executor_thread(max_workers: int | None) -> None:
+    frame = pl.DataFrame(
+        {"float": [1.2, 4.2, None, 2.2], "int": [None, 1, 0, 1]},
+        schema={"float": pl.Float64, "int": pl.Int64},
+    )
+    section = MappingAnalyzer(
+        {
+            "null": NullValueAnalyzer(),
+            "duplicate": DuplicatedRowAnalyzer(),
+            "nested": MappingAnalyzer(
+                {"null": NullValueAnalyzer(), "duplicate": DuplicatedRowAnalyzer()},
+                executor="thread",
+            ),
+            "column": ColumnSubsetAnalyzer(columns=["int"], analyzer=NullValueAnalyzer()),
+        },
+        executor="thread",
+        max_workers=max_workers,
+    ).analyze(frame)
+    assert isinstance(section, SectionDict)
+    assert list(section.sections) == ["null", "duplicate", "nested", "column"]
+    assert list(section.sections["nested"].sections) == ["null", "duplicate"]
+    stats = {"columns": ("float", "int"), "null_count": (1, 1), "total_count": (4, 4)}
+    assert objects_are_equal(
+        section.get_statistics(),
+        {
+            "null": stats,
+            "duplicate": {"num_rows": 4, "num_unique_rows": 4},
+            "nested": {"null": stats, "duplicate": {"num_rows": 4, "num_unique_rows": 4}},
+            "column": {"columns": ("int",), "null_count": (1,), "total_count": (4,)},
+        },
+    )
+
+
+def test_mapping_analyzer_executor_incorrect() -> None:
+    with pytest.raises(ValueError, match=r"Incorrect executor: process\."):
+        MappingAnalyzer({"null": NullValueAnalyzer()}, executor="process")
+
+
+def test_mapping_analyzer_render_executor_process() -> None:
+    frame = pl.DataFrame(
+        {"float": [1.2, 4.2, None, 2.2], "int": [None, 1, 0, 1]},
+        schema={"float": pl.Float64, "int": pl.Int64},
+    )
+    analyzers = {"null": NullValueAnalyzer(), "duplicate": DuplicatedRowAnalyzer()}
+    section = MappingAnalyzer(analyzers, render_executor="process", render_max_workers=2).analyze(
+        frame
+    )
+    assert section._executor == "process"
+    assert section._max_workers == 2
+    assert (
+        section.render_html_body() == MappingAnalyzer(analyzers).analyze(frame).render_html_body()
+    )
+
+
+def test_mapping_analyzer_render_executor_incorrect() -> None:
+    with pytest.raises(ValueError, match=r"Incorrect render_executor: thread\."):
+        MappingAnalyzer({"null": NullValueAnalyzer()}, render_executor="thread")
+
+
+def test_mapping_analyzer_is_streamable() -> None:
+    assert MappingAnalyzer(
+        {"null": NullValueAnalyzer(), "dtype": DataTypeAnalyzer()}
+    ).is_streamable()
+
+
+def test_mapping_analyzer_is_streamable_false() -> None:
+    assert not MappingAnalyzer(
+        {"null": NullValueAnalyzer(), "duplicate": DuplicatedRowAnalyzer()}
+    ).is_streamable()
+
+
+def test_mapping_analyzer_is_streamable_empty() -> None:
+    assert MappingAnalyzer({}).is_streamable()
+
+
+def test_mapping_analyzer_update_finalize() -> None:
+    analyzer = MappingAnalyzer(
+        {"null": NullValueAnalyzer(), "duplicate": DuplicatedRowAnalyzer()}, max_toc_depth=1
+    )
+    frame = pl.DataFrame({"col1": [1, 2, None, 2], "col2": ["a", None, "b", None]})
+    for batch in frame.iter_slices(n_rows=3):
+        analyzer.update(batch)
+    section = analyzer.finalize(sample=frame.head(2))
+    assert isinstance(section, SectionDict)
+    assert section.max_toc_depth == 1
+    assert objects_are_equal(
+        section.get_statistics(),
+        {
+            "null": {
+                "columns": ("col1", "col2"),
+                "null_count": (1, 2),
+                "total_count": (4, 4),
+            },
+            "duplicate": {"num_rows": 2, "num_unique_rows": 2},
+        },
+    )
@@ -49,3 +49,17 @@ def test_markdown_analyzer_get_statistics_empty() -> None:
     section = MarkdownAnalyzer(desc="hello cats!").analyze(pl.DataFrame({}))
     assert isinstance(section, MarkdownSection)
     assert section.get_statistics() == {}
+
+
+@markdown_available
+def test_markdown_analyzer_is_streamable() -> None:
+    assert MarkdownAnalyzer(desc="hello cats!").is_streamable()
+
+
+@markdown_available
+def test_markdown_analyzer_update_finalize() -> None:
+    analyzer = MarkdownAnalyzer(desc="hello cats!")
+    analyzer.update(pl.DataFrame({"col": [1, 2, 3]}))
+    section = analyzer.finalize()
+    assert isinstance(section, MarkdownSection)
+    assert section.get_statistics() == {}
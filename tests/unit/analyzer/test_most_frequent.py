@@ -43,6 +43,23 @@ def test_most_frequent_values_analyzer_get_statistics_drop_nulls_true(
     )
 
 
+def test_most_frequent_values_analyzer_get_statistics_capacity(dataframe: pl.DataFrame) -> None:
+    section = MostFrequentValuesAnalyzer(column="col", capacity=100).analyze(dataframe)
+    assert isinstance(section, MostFrequentValuesSection)
+    assert objects_are_equal(
+        section.get_statistics(),
+        {"most_common": [(1.0, 3), (None, 2), (42.0, 1), (22.0, 1), (2.0, 1)]},
+    )
+
+
+def test_most_frequent_values_analyzer_get_statistics_capacity_small(
+    dataframe: pl.DataFrame,
+) -> None:
+    section = MostFrequentValuesAnalyzer(column="col", top=1, capacity=2).analyze(dataframe)
+    assert isinstance(section, MostFrequentValuesSection)
+    assert objects_are_equal(section.get_statistics(), {"most_common": [(1.0, 3)]})
+
+
 def test_most_frequent_values_analyzer_get_statistics_empty_no_row() -> None:
     section = MostFrequentValuesAnalyzer(column="col").analyze(
         pl.DataFrame({"col": []}, schema={"col": pl.Int64})
@@ -55,3 +72,50 @@ def test_most_frequent_values_analyzer_get_statistics_empty_no_column() -> None:
     section = MostFrequentValuesAnalyzer(column="col").analyze(pl.DataFrame({}))
     assert isinstance(section, EmptySection)
     assert objects_are_equal(section.get_statistics(), {})
+
+
+def test_most_frequent_values_analyzer_is_streamable() -> None:
+    assert not MostFrequentValuesAnalyzer(column="col").is_streamable()
+
+
+def test_most_frequent_values_analyzer_is_streamable_capacity() -> None:
+    assert MostFrequentValuesAnalyzer(column="col", capacity=100).is_streamable()
+
+
+@pytest.mark.parametrize("drop_nulls", [True, False])
+def test_most_frequent_values_analyzer_update_finalize(
+    dataframe: pl.DataFrame, drop_nulls: bool
+) -> None:
+    analyzer = MostFrequentValuesAnalyzer(column="col", drop_nulls=drop_nulls, capacity=100)
+    for batch in dataframe.iter_slices(n_rows=3):
+        analyzer.update(batch)
+    section = analyzer.finalize()
+    assert isinstance(section, MostFrequentValuesSection)
+    assert objects_are_equal(section.get_statistics(), analyzer.analyze(dataframe).get_statistics())
+
+
+def test_most_frequent_values_analyzer_finalize_reset(dataframe: pl.DataFrame) -> None:
+    analyzer = MostFrequentValuesAnalyzer(column="col", capacity=100)
+    analyzer.update(dataframe)
+    analyzer.finalize()
+    analyzer.update(dataframe[:2])
+    assert objects_are_equal(
+        analyzer.finalize().get_statistics(), {"most_common": [(1.0, 1), (42.0, 1)]}
+    )
+
+
+def test_most_frequent_values_analyzer_finalize_missing_column() -> None:
+    analyzer = MostFrequentValuesAnalyzer(column="col", capacity=100)
+    analyzer.update(pl.DataFrame({"col2": [1, 2]}))
+    section = analyzer.finalize()
+    assert isinstance(section, EmptySection)
+    assert objects_are_equal(section.get_statistics(), {})
+
+
+def test_most_frequent_values_analyzer_finalize_sample(dataframe: pl.DataFrame) -> None:
+    section = MostFrequentValuesAnalyzer(column="col").finalize(dataframe)
+    assert isinstance(section, MostFrequentValuesSection)
+    assert objects_are_equal(
+        section.get_statistics(),
+        {"most_common": [(1.0, 3), (None, 2), (42.0, 1), (22.0, 1), (2.0, 1)]},
+    )
@@ -7,6 +7,7 @@ from coola import objects_are_equal
 
 from flamme.analyzer import NullValueAnalyzer
 from flamme.section import NullValueSection
+from flamme.utils.lazy import collect_expressions
 
 
 @pytest.fixture
@@ -77,3 +78,60 @@ def test_null_value_analyzer_get_statistics_empty_no_column() -> None:
         section.get_statistics(),
         {"columns": (), "null_count": (), "total_count": ()},
     )
+
+
+def test_null_value_analyzer_is_streamable() -> None:
+    assert NullValueAnalyzer().is_streamable()
+
+
+def test_null_value_analyzer_update_finalize(dataframe: pl.DataFrame) -> None:
+    analyzer = NullValueAnalyzer()
+    for batch in dataframe.iter_slices(n_rows=3):
+        analyzer.update(batch)
+    assert objects_are_equal(
+        analyzer.finalize().get_statistics(), analyzer.analyze(dataframe).get_statistics()
+    )
+
+
+def test_null_value_analyzer_finalize_reset(dataframe: pl.DataFrame) -> None:
+    analyzer = NullValueAnalyzer()
+    analyzer.update(dataframe)
+    analyzer.finalize()
+    analyzer.update(dataframe)
+    assert objects_are_equal(
+        analyzer.finalize().get_statistics(),
+        {
+            "columns": ("float", "int", "str"),
+            "null_count": (1, 1, 2),
+            "total_count": (4, 4, 4),
+        },
+    )
+
+
+def test_null_value_analyzer_finalize_empty() -> None:
+    assert objects_are_equal(
+        NullValueAnalyzer().finalize().get_statistics(),
+        {"columns": (), "null_count": (), "total_count": ()},
+    )
+
+
+def test_null_value_analyzer_get_expressions() -> None:
+    assert sorted(
+        NullValueAnalyzer().get_expressions(pl.Schema({"float": pl.Float64, "int": pl.Int64}))
+    ) == ["null_count/float", "null_count/int", "num_rows"]
+
+
+def test_null_value_analyzer_analyze_results(dataframe: pl.DataFrame) -> None:
+    analyzer = NullValueAnalyzer()
+    section = analyzer.analyze_results(
+        dataframe, collect_expressions(dataframe, analyzer.get_expressions(dataframe.schema))
+    )
+    assert isinstance(section, NullValueSection)
+    assert objects_are_equal(
+        section.get_statistics(),
+        {
+            "columns": ("float", "int", "str"),
+            "null_count": (1, 1, 2),
+            "total_count": (4, 4, 4),
+        },
+    )
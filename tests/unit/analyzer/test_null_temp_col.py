@@ -106,6 +106,32 @@ def test_column_temporal_null_value_analyzer_figsize(
     assert section.figsize == figsize
 
 
+def test_column_temporal_null_value_analyzer_base_period(dataframe: pl.DataFrame) -> None:
+    section = ColumnTemporalNullValueAnalyzer(
+        dt_column="datetime", period="1mo", base_period="1d"
+    ).analyze(dataframe)
+    assert section.base_period == "1d"
+
+
+def test_column_temporal_null_value_analyzer_base_period_default(dataframe: pl.DataFrame) -> None:
+    section = ColumnTemporalNullValueAnalyzer(dt_column="datetime", period="1mo").analyze(dataframe)
+    assert section.base_period is None
+
+
+def test_column_temporal_null_value_analyzer_mode(dataframe: pl.DataFrame) -> None:
+    section = ColumnTemporalNullValueAnalyzer(
+        dt_column="datetime", period="1mo", mode="heatmap", cluster=True
+    ).analyze(dataframe)
+    assert section.mode == "heatmap"
+    assert section.cluster
+
+
+def test_column_temporal_null_value_analyzer_mode_default(dataframe: pl.DataFrame) -> None:
+    section = ColumnTemporalNullValueAnalyzer(dt_column="datetime", period="1mo").analyze(dataframe)
+    assert section.mode == "grid"
+    assert not section.cluster
+
+
 def test_column_temporal_null_value_analyzer_get_statistics(dataframe: pl.DataFrame) -> None:
     section = ColumnTemporalNullValueAnalyzer(dt_column="datetime", period="M").analyze(dataframe)
     assert isinstance(section, ColumnTemporalNullValueSection)
@@ -4,7 +4,11 @@ import polars as pl
 import pytest
 from coola import objects_are_equal
 
-from flamme.analyzer import DuplicatedRowAnalyzer, TableOfContentAnalyzer
+from flamme.analyzer import (
+    DuplicatedRowAnalyzer,
+    NullValueAnalyzer,
+    TableOfContentAnalyzer,
+)
 from flamme.section import TableOfContentSection
 
 
@@ -60,3 +64,29 @@ def test_table_of_content_analyzer_get_statistics_missing_column() -> None:
     section = TableOfContentAnalyzer(DuplicatedRowAnalyzer()).analyze(pl.DataFrame({}))
     assert isinstance(section, TableOfContentSection)
     assert objects_are_equal(section.get_statistics(), {"num_rows": 0, "num_unique_rows": 0})
+
+
+def test_table_of_content_analyzer_is_streamable() -> None:
+    assert TableOfContentAnalyzer(NullValueAnalyzer()).is_streamable()
+
+
+def test_table_of_content_analyzer_is_streamable_false() -> None:
+    assert not TableOfContentAnalyzer(DuplicatedRowAnalyzer()).is_streamable()
+
+
+def test_table_of_content_analyzer_update_finalize(dataframe: pl.DataFrame) -> None:
+    analyzer = TableOfContentAnalyzer(NullValueAnalyzer(), max_toc_depth=2)
+    for batch in dataframe.iter_slices(n_rows=3):
+        analyzer.update(batch)
+    section = analyzer.finalize()
+    assert isinstance(section, TableOfContentSection)
+    assert objects_are_equal(
+        section.get_statistics(),
+        {"columns": ("col1", "col2", "col3"), "null_count": (0, 0, 0), "total_count": (4, 4, 4)},
+    )
+
+
+def test_table_of_content_analyzer_finalize_sample(dataframe: pl.DataFrame) -> None:
+    section = TableOfContentAnalyzer(DuplicatedRowAnalyzer()).finalize(sample=dataframe)
+    assert isinstance(section, TableOfContentSection)
+    assert objects_are_equal(section.get_statistics(), {"num_rows": 4, "num_unique_rows": 3})
@@ -1,13 +1,21 @@
 from __future__ import annotations
 
+from unittest.mock import patch
+
 import polars as pl
 import pytest
 from coola import objects_are_equal
 from grizz.transformer import BaseTransformer, SqlTransformer
 from objectory import OBJECT_TARGET
 
-from flamme.analyzer import BaseAnalyzer, NullValueAnalyzer, TransformAnalyzer
-from flamme.section import NullValueSection
+from flamme.analyzer import (
+    BaseAnalyzer,
+    DuplicatedRowAnalyzer,
+    NullValueAnalyzer,
+    TransformAnalyzer,
+)
+from flamme.section import DuplicatedRowSection, NullValueSection
+from flamme.utils.lazy import collect_expressions
 
 #######################################
 #     Tests for TransformAnalyzer     #
@@ -95,3 +103,52 @@ def test_transform_analyzer_get_statistics_empty() -> None:
             "total_count": (0, 0, 0),
         },
     )
+
+
+def test_transform_analyzer_get_expressions() -> None:
+    assert (
+        TransformAnalyzer(
+            transformer=SqlTransformer("SELECT * FROM self WHERE float > 1"),
+            analyzer=NullValueAnalyzer(),
+        ).get_expressions(pl.Schema({"float": pl.Float64}))
+        == {}
+    )
+
+
+def test_transform_analyzer_analyze_results() -> None:
+    analyzer = TransformAnalyzer(
+        transformer=SqlTransformer("SELECT * FROM self WHERE float > 1"),
+        analyzer=NullValueAnalyzer(),
+    )
+    with patch(
+        "flamme.analyzer.transform.collect_expressions", wraps=collect_expressions
+    ) as collect:
+        section = analyzer.analyze_results(
+            pl.DataFrame(
+                {"float": [1.2, 4.2, None, 2.2], "int": [None, 1, 0, 1]},
+                schema={"float": pl.Float64, "int": pl.Int64},
+            ),
+            {},
+        )
+    collect.assert_called_once()
+    assert isinstance(section, NullValueSection)
+    assert objects_are_equal(
+        section.get_statistics(),
+        {"columns": ("float", "int"), "null_count": (0, 1), "total_count": (3, 3)},
+    )
+
+
+def test_transform_analyzer_materialize() -> None:
+    section = TransformAnalyzer(
+        transformer=SqlTransformer("SELECT * FROM self WHERE float > 1"),
+        analyzer=DuplicatedRowAnalyzer(),
+        materialize=True,
+    ).analyze(
+        pl.DataFrame(
+            {"float": [1.2, 4.2, 4.2, 0.2], "int": [None, 1, 1, 1]},
+            schema={"float": pl.Float64, "int": pl.Int64},
+        )
+    )
+    assert isinstance(section, DuplicatedRowSection)
+    assert section.frame is None
+    assert objects_are_equal(section.get_statistics(), {"num_rows": 3, "num_unique_rows": 2})
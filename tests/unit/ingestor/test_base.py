@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import logging
+from collections import Counter
+from typing import TYPE_CHECKING
+
+from objectory import OBJECT_TARGET
+
+from flamme.ingestor import (
+    ParquetBatchIngestor,
+    is_batch_ingestor_config,
+    setup_batch_ingestor,
+)
+
+if TYPE_CHECKING:
+    import pytest
+
+##############################################
+#     Tests for is_batch_ingestor_config     #
+##############################################
+
+
+def test_is_batch_ingestor_config_true() -> None:
+    assert is_batch_ingestor_config(
+        {OBJECT_TARGET: "flamme.ingestor.ParquetBatchIngestor", "path": "/path/to/data.parquet"}
+    )
+
+
+def test_is_batch_ingestor_config_false() -> None:
+    assert not is_batch_ingestor_config({OBJECT_TARGET: "collections.Counter"})
+
+
+##########################################
+#     Tests for setup_batch_ingestor     #
+##########################################
+
+
+def test_setup_batch_ingestor_object() -> None:
+    ingestor = ParquetBatchIngestor(path="/path/to/data.parquet")
+    assert setup_batch_ingestor(ingestor) is ingestor
+
+
+def test_setup_batch_ingestor_dict() -> None:
+    assert isinstance(
+        setup_batch_ingestor(
+            {
+                OBJECT_TARGET: "flamme.ingestor.ParquetBatchIngestor",
+                "path": "/path/to/data.parquet",
+            }
+        ),
+        ParquetBatchIngestor,
+    )
+
+
+def test_setup_batch_ingestor_incorrect_type(caplog: pytest.LogCaptureFixture) -> None:
+    with caplog.at_level(level=logging.WARNING):
+        assert isinstance(setup_batch_ingestor({OBJECT_TARGET: "collections.Counter"}), Counter)
+        assert caplog.messages
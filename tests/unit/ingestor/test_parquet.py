@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+from flamme.ingestor import ParquetBatchIngestor
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture(scope="module")
+def frame() -> pl.DataFrame:
+    return pl.DataFrame(
+        {"col1": [1, 2, None, 4, 5], "col2": ["a", "b", "c", None, "e"]},
+        schema={"col1": pl.Int64, "col2": pl.String},
+    )
+
+
+@pytest.fixture(scope="module")
+def frame_path(tmp_path_factory: pytest.TempPathFactory, frame: pl.DataFrame) -> Path:
+    path = tmp_path_factory.mktemp("data").joinpath("frame.parquet")
+    frame.write_parquet(path)
+    return path
+
+
+##########################################
+#     Tests for ParquetBatchIngestor     #
+##########################################
+
+
+def test_parquet_batch_ingestor_str(frame_path: Path) -> None:
+    assert str(ParquetBatchIngestor(frame_path)).startswith("ParquetBatchIngestor(")
+
+
+def test_parquet_batch_ingestor_iter_batches(frame_path: Path, frame: pl.DataFrame) -> None:
+    batches = list(ParquetBatchIngestor(frame_path, batch_size=2).iter_batches())
+    assert len(batches) == 3
+    assert_frame_equal(pl.concat(batches), frame)
+
+
+def test_parquet_batch_ingestor_iter_batches_batch_size(frame_path: Path) -> None:
+    assert [
+        batch.shape for batch in ParquetBatchIngestor(frame_path, batch_size=2).iter_batches()
+    ] == [
+        (2, 2),
+        (2, 2),
+        (1, 2),
+    ]
+
+
+def test_parquet_batch_ingestor_iter_batches_columns(frame_path: Path, frame: pl.DataFrame) -> None:
+    batches = list(ParquetBatchIngestor(frame_path, columns=["col2"]).iter_batches())
+    assert_frame_equal(pl.concat(batches), frame.select("col2"))
+
+
+def test_parquet_batch_ingestor_iter_batches_empty(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("frame.parquet")
+    pl.DataFrame(
+        {"col1": [], "col2": []}, schema={"col1": pl.Int64, "col2": pl.String}
+    ).write_parquet(path)
+    batches = list(ParquetBatchIngestor(path).iter_batches())
+    assert len(batches) == 1
+    assert batches[0].shape == (0, 2)
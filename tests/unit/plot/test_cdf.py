@@ -4,6 +4,7 @@ import numpy as np
 from matplotlib import pyplot as plt
 
 from flamme.plot import plot_cdf
+from flamme.utils.array import SortedArray
 
 ##############################
 #     Tests for plot_cdf     #
@@ -23,3 +24,8 @@ def test_plot_cdf_empty() -> None:
 def test_plot_cdf_nan() -> None:
     _fig, ax = plt.subplots()
     plot_cdf(ax, array=np.array([1, 2, np.nan, 3, np.nan]))
+
+
+def test_plot_cdf_sorted_array() -> None:
+    _fig, ax = plt.subplots()
+    plot_cdf(ax, array=SortedArray(np.array([1, 2, np.nan, 3, np.nan])), xmin=1.5, xmax=2.5)
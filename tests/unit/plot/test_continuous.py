@@ -4,18 +4,29 @@ from typing import TYPE_CHECKING
 
 import numpy as np
 import pytest
+from coola import objects_are_allclose
 from matplotlib import pyplot as plt
 
 from flamme.plot import (
     boxplot_continuous,
     boxplot_continuous_temporal,
+    bxp_continuous_temporal,
     hist_continuous,
     hist_continuous2,
 )
+from flamme.utils.array import SortedArray
+from flamme.utils.boxplot import compute_boxplot_stats
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
+    from matplotlib.axes import Axes
+
+
+def get_num_fliers(ax: Axes) -> int:
+    return sum(len(line.get_xdata()) for line in ax.lines if line.get_marker() == "o")
+
+
 #######################################
 #    Tests for boxplot_continuous     #
 #######################################
@@ -48,6 +59,17 @@ def test_boxplot_continuous_empty() -> None:
     boxplot_continuous(ax=ax, array=np.array([]))
 
 
+def test_boxplot_continuous_sorted_array() -> None:
+    _fig, ax = plt.subplots()
+    boxplot_continuous(ax=ax, array=SortedArray(np.arange(101)), xmin="q0.1", xmax="q0.9")
+
+
+def test_boxplot_continuous_max_fliers() -> None:
+    _fig, ax = plt.subplots()
+    boxplot_continuous(ax=ax, array=np.random.default_rng(42).standard_cauchy(10000), max_fliers=5)
+    assert get_num_fliers(ax) == 10
+
+
 ################################################
 #    Tests for boxplot_continuous_temporal     #
 ################################################
@@ -106,6 +128,93 @@ def test_boxplot_continuous_temporal_incorrect_lengths() -> None:
         boxplot_continuous_temporal(ax=ax, data=[np.ones(5), np.zeros(4)], steps=[1, 2, 3])
 
 
+def test_boxplot_continuous_temporal_sorted_array() -> None:
+    _fig, ax = plt.subplots()
+    boxplot_continuous_temporal(
+        ax=ax,
+        data=[SortedArray(np.arange(10)), SortedArray(np.array([1.0, np.nan, 3.0]))],
+        steps=["a", "b"],
+        yscale="auto",
+    )
+
+
+def test_boxplot_continuous_temporal_max_fliers() -> None:
+    rng = np.random.default_rng(42)
+    _fig, ax = plt.subplots()
+    boxplot_continuous_temporal(
+        ax=ax,
+        data=[rng.standard_cauchy(10000) for _ in range(3)],
+        steps=["a", "b", "c"],
+        max_fliers=5,
+    )
+    assert get_num_fliers(ax) == 30
+
+
+#############################################
+#    Tests for bxp_continuous_temporal     #
+#############################################
+
+
+@pytest.fixture
+def stats_temp(data_temp: Sequence[np.ndarray]) -> list[dict]:
+    return [compute_boxplot_stats(x) for x in data_temp]
+
+
+def test_bxp_continuous_temporal(stats_temp: Sequence[dict]) -> None:
+    _fig, ax = plt.subplots()
+    bxp_continuous_temporal(ax=ax, stats=stats_temp, steps=list(range(len(stats_temp))))
+    assert [label.get_text() for label in ax.get_xticklabels()] == [
+        str(i) for i in range(len(stats_temp))
+    ]
+
+
+def test_bxp_continuous_temporal_ymin_ymax(stats_temp: Sequence[dict]) -> None:
+    _fig, ax = plt.subplots()
+    bxp_continuous_temporal(
+        ax=ax, stats=stats_temp, steps=list(range(len(stats_temp))), ymin=-1.0, ymax=1.0
+    )
+    assert ax.get_ylim() == (-1.0, 1.0)
+
+
+def test_bxp_continuous_temporal_default_range() -> None:
+    _fig, ax = plt.subplots()
+    bxp_continuous_temporal(
+        ax=ax,
+        stats=[compute_boxplot_stats(np.array([1.0, 2.0, 3.0, 4.0, 100.0]))],
+        steps=["a"],
+    )
+    assert ax.get_ylim() == (1.0, 100.0)
+
+
+@pytest.mark.parametrize("yscale", ["linear", "log", "symlog"])
+def test_bxp_continuous_temporal_yscale(stats_temp: Sequence[dict], yscale: str) -> None:
+    _fig, ax = plt.subplots()
+    bxp_continuous_temporal(
+        ax=ax, stats=stats_temp, steps=list(range(len(stats_temp))), yscale=yscale
+    )
+    assert ax.get_yscale() == yscale
+
+
+def test_bxp_continuous_temporal_nan() -> None:
+    _fig, ax = plt.subplots()
+    bxp_continuous_temporal(
+        ax=ax,
+        stats=[compute_boxplot_stats(np.array([])), compute_boxplot_stats(np.arange(10))],
+        steps=["a", "b"],
+    )
+
+
+def test_bxp_continuous_temporal_empty() -> None:
+    _fig, ax = plt.subplots()
+    bxp_continuous_temporal(ax=ax, stats=[], steps=[])
+
+
+def test_bxp_continuous_temporal_incorrect_lengths() -> None:
+    _fig, ax = plt.subplots()
+    with pytest.raises(RuntimeError, match="stats and steps have different lengths"):
+        bxp_continuous_temporal(ax=ax, stats=[compute_boxplot_stats(np.ones(5))], steps=[1, 2, 3])
+
+
 ####################################
 #    Tests for hist_continuous     #
 ####################################
@@ -173,6 +282,27 @@ def test_hist_continuous_nan() -> None:
     hist_continuous(ax=ax, array=np.array([1, 2, 3, np.nan, 4, np.nan, np.nan]))
 
 
+@pytest.mark.parametrize("density", [True, False])
+def test_hist_continuous_same_counts(density: bool) -> None:
+    values = np.random.default_rng(42).normal(size=1000)
+    _fig, ax = plt.subplots()
+    hist_continuous(ax=ax, array=values, nbins=20, xmin="q0.05", xmax="q0.95", density=density)
+    counts, edges = np.histogram(
+        values,
+        bins=20,
+        range=tuple(np.quantile(values, [0.05, 0.95]).tolist()),
+        density=density,
+    )
+    data = ax.patches[0].get_data()
+    assert objects_are_allclose(data.values, counts.astype(float))
+    assert objects_are_allclose(data.edges, edges)
+
+
+def test_hist_continuous_sorted_array() -> None:
+    _fig, ax = plt.subplots()
+    hist_continuous(ax=ax, array=SortedArray(np.arange(101)), nbins=10, yscale="auto")
+
+
 #####################################
 #    Tests for hist_continuous2     #
 #####################################
@@ -239,6 +369,20 @@ def test_hist_continuous2_array2_empty() -> None:
     hist_continuous2(ax=ax, array1=np.arange(101), array2=np.array([]))
 
 
+@pytest.mark.parametrize("density", [True, False])
+def test_hist_continuous2_same_counts(density: bool) -> None:
+    rng = np.random.default_rng(42)
+    array1, array2 = rng.normal(size=1000), rng.normal(loc=1.0, size=500)
+    _fig, ax = plt.subplots()
+    hist_continuous2(ax=ax, array1=array1, array2=array2, nbins=20, density=density)
+    edges = np.linspace(min(array1.min(), array2.min()), max(array1.max(), array2.max()), 21)
+    for patch, array in zip(ax.patches, [array1, array2]):
+        assert objects_are_allclose(
+            patch.get_data().values,
+            np.histogram(array, bins=edges, density=density)[0].astype(float),
+        )
+
+
 def test_hist_continuous2_nan() -> None:
     _fig, ax = plt.subplots()
     hist_continuous2(
@@ -0,0 +1,315 @@
+from __future__ import annotations
+
+import json
+import re
+from xml.etree import ElementTree
+
+import numpy as np
+import pytest
+
+from flamme.plot import (
+    bar_figure_data,
+    downsample_figure_data,
+    figure_data2html,
+    figure_data2svg,
+    get_figure_data_script,
+    histogram_figure_data,
+    null_temporal_figure_data,
+    render_figure_data,
+)
+from flamme.utils.figure import MISSING_FIGURE_MESSAGE, use_figure_backend
+
+
+def parse_figure_data(figure: str) -> dict:
+    match = re.search(r'<script type="application/json">(.*)</script>', figure)
+    assert match is not None
+    return json.loads(match.group(1))
+
+
+#####################################
+#     Tests for bar_figure_data     #
+#####################################
+
+
+def test_bar_figure_data() -> None:
+    assert bar_figure_data(
+        labels=["a", "b", 3],
+        counts=np.array([5, 100, 42]),
+        title="my title",
+        xlabel="values",
+        ylabel="number of occurrences",
+    ) == {
+        "type": "bar",
+        "labels": ["a", "b", "3"],
+        "counts": [5.0, 100.0, 42.0],
+        "yscale": "linear",
+        "title": "my title",
+        "xlabel": "values",
+        "ylabel": "number of occurrences",
+        "ordered": False,
+    }
+
+
+def test_bar_figure_data_yscale_auto() -> None:
+    assert bar_figure_data(labels=["a", "b"], counts=[1, 100000], yscale="auto")["yscale"] == "log"
+
+
+def test_bar_figure_data_empty() -> None:
+    assert bar_figure_data(labels=[], counts=[], yscale="auto")["counts"] == []
+
+
+def test_bar_figure_data_incorrect_lengths() -> None:
+    with pytest.raises(RuntimeError, match=r"labels \(2\) and counts \(1\) have different lengths"):
+        bar_figure_data(labels=["a", "b"], counts=[5])
+
+
+def test_bar_figure_data_json() -> None:
+    data = bar_figure_data(labels=["a", "b"], counts=np.array([5, 3], dtype=np.int64))
+    assert json.loads(json.dumps(data)) == data
+
+
+###########################################
+#     Tests for histogram_figure_data     #
+###########################################
+
+
+def test_histogram_figure_data() -> None:
+    assert histogram_figure_data(
+        counts=np.array([2, 5, 3]),
+        edges=np.array([0.0, 1.0, 2.0, 3.0]),
+        cdf=np.array([0.2, 0.7, 1.0]),
+        quantiles={"q0.05": np.float64(0.5)},
+    ) == {
+        "type": "histogram",
+        "counts": [2.0, 5.0, 3.0],
+        "edges": [0.0, 1.0, 2.0, 3.0],
+        "yscale": "linear",
+        "title": None,
+        "xlabel": None,
+        "ylabel": "number of occurrences",
+        "cdf": [0.2, 0.7, 1.0],
+        "quantiles": {"q0.05": 0.5},
+    }
+
+
+def test_histogram_figure_data_quantiles_nan() -> None:
+    assert histogram_figure_data(
+        counts=np.array([2, 5, 3]),
+        edges=np.array([0.0, 1.0, 2.0, 3.0]),
+        quantiles={"q0.05": float("nan"), "q0.95": 2.5},
+    )["quantiles"] == {"q0.95": 2.5}
+
+
+def test_histogram_figure_data_incorrect_lengths() -> None:
+    with pytest.raises(RuntimeError, match="edges must have one more item than counts"):
+        histogram_figure_data(counts=np.array([2, 5, 3]), edges=np.array([0.0, 1.0, 2.0]))
+
+
+###############################################
+#     Tests for null_temporal_figure_data     #
+###############################################
+
+
+def test_null_temporal_figure_data() -> None:
+    assert null_temporal_figure_data(
+        nulls=np.array([1, 2]), totals=np.array([10, 12]), labels=["jan", "feb"], title="col"
+    ) == {
+        "type": "null_temporal",
+        "nulls": [1.0, 2.0],
+        "totals": [10.0, 12.0],
+        "labels": ["jan", "feb"],
+        "title": "col",
+    }
+
+
+def test_null_temporal_figure_data_incorrect_nulls() -> None:
+    with pytest.raises(RuntimeError, match=r"nulls \(1\) and totals \(2\) have different lengths"):
+        null_temporal_figure_data(nulls=[1], totals=[10, 12], labels=["jan", "feb"])
+
+
+def test_null_temporal_figure_data_incorrect_labels() -> None:
+    with pytest.raises(RuntimeError, match=r"nulls \(2\) and labels \(1\) have different lengths"):
+        null_temporal_figure_data(nulls=[1, 2], totals=[10, 12], labels=["jan"])
+
+
+############################################
+#     Tests for downsample_figure_data     #
+############################################
+
+
+def test_downsample_figure_data_small() -> None:
+    data = bar_figure_data(labels=["a", "b", "c"], counts=[4, 3, 2])
+    assert downsample_figure_data(data, max_points=3) is data
+
+
+def test_downsample_figure_data_bar() -> None:
+    data = downsample_figure_data(
+        bar_figure_data(labels=list("abcdefghij"), counts=list(range(10, 0, -1))), max_points=4
+    )
+    assert data["labels"] == ["a", "b", "c", "others (7)"]
+    assert data["counts"] == [10.0, 9.0, 8.0, 28.0]
+
+
+def test_downsample_figure_data_bar_ordered() -> None:
+    data = downsample_figure_data(
+        bar_figure_data(labels=list("abcdefghij"), counts=list(range(10)), ordered=True),
+        max_points=4,
+    )
+    assert data["labels"] == ["a", "d", "g", "j"]
+    assert data["counts"] == [3.0, 12.0, 21.0, 9.0]
+
+
+def test_downsample_figure_data_histogram() -> None:
+    counts = np.arange(1000)
+    data = downsample_figure_data(
+        histogram_figure_data(
+            counts=counts,
+            edges=np.linspace(0.0, 1.0, 1001),
+            cdf=np.cumsum(counts) / counts.sum(),
+        ),
+        max_points=300,
+    )
+    assert len(data["counts"]) == 250
+    assert len(data["edges"]) == 251
+    assert len(data["cdf"]) == 250
+    assert sum(data["counts"]) == counts.sum()
+    assert data["edges"][0] == 0.0
+    assert data["edges"][-1] == 1.0
+    assert data["cdf"][-1] == 1.0
+
+
+def test_downsample_figure_data_histogram_without_cdf() -> None:
+    data = downsample_figure_data(
+        histogram_figure_data(counts=np.ones(10), edges=np.linspace(0.0, 1.0, 11)), max_points=5
+    )
+    assert data["counts"] == [2.0, 2.0, 2.0, 2.0, 2.0]
+    assert data["cdf"] is None
+
+
+def test_downsample_figure_data_null_temporal() -> None:
+    data = downsample_figure_data(
+        null_temporal_figure_data(
+            nulls=[1, 2, 3, 4, 5], totals=[10, 10, 10, 10, 10], labels=list("abcde")
+        ),
+        max_points=3,
+    )
+    assert data["nulls"] == [3.0, 7.0, 5.0]
+    assert data["totals"] == [20.0, 20.0, 10.0]
+    assert data["labels"] == ["a", "c", "e"]
+
+
+def test_downsample_figure_data_incorrect_type() -> None:
+    with pytest.raises(ValueError, match="Incorrect figure type: meow"):
+        downsample_figure_data({"type": "meow"})
+
+
+######################################
+#     Tests for figure_data2html     #
+######################################
+
+
+def test_figure_data2html() -> None:
+    data = bar_figure_data(labels=["a", "b", "c"], counts=[5, 100, 42])
+    figure = figure_data2html(data)
+    assert figure.startswith('<div class="flamme-figure"')
+    assert 'data-width="640" data-height="480"' in figure
+    assert parse_figure_data(figure) == data
+
+
+def test_figure_data2html_figsize() -> None:
+    figure = figure_data2html(bar_figure_data(labels=["a"], counts=[5]), figsize=(7, 3))
+    assert 'data-width="700" data-height="300"' in figure
+
+
+def test_figure_data2html_escape() -> None:
+    data = bar_figure_data(labels=["</script>", "a&b"], counts=[5, 3], title="<b>")
+    figure = figure_data2html(data)
+    assert figure.count("</script>") == 1
+    assert "<b>" not in figure
+    assert parse_figure_data(figure) == data
+
+
+def test_figure_data2html_downsample() -> None:
+    figure = figure_data2html(
+        bar_figure_data(labels=list(range(1000)), counts=np.ones(1000), ordered=True),
+        max_points=100,
+    )
+    assert len(parse_figure_data(figure)["counts"]) == 100
+
+
+def test_figure_data2html_empty() -> None:
+    assert figure_data2html(bar_figure_data(labels=[], counts=[])) == MISSING_FIGURE_MESSAGE
+
+
+def test_figure_data2html_empty_null_temporal() -> None:
+    assert (
+        figure_data2html(null_temporal_figure_data(nulls=[], totals=[], labels=[]))
+        == MISSING_FIGURE_MESSAGE
+    )
+
+
+#####################################
+#     Tests for figure_data2svg     #
+#####################################
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        bar_figure_data(labels=["a", "b", "c"], counts=[5, 100, 42], ordered=True),
+        histogram_figure_data(
+            counts=np.array([2, 5, 3]),
+            edges=np.array([0.0, 1.0, 2.0, 3.0]),
+            cdf=np.array([0.2, 0.7, 1.0]),
+            quantiles={"q0.05": 0.5},
+        ),
+        null_temporal_figure_data(nulls=[1, 2], totals=[10, 12], labels=["jan", "feb"]),
+    ],
+)
+def test_figure_data2svg(data: dict) -> None:
+    root = ElementTree.fromstring(figure_data2svg(data, figsize=(7, 3)))  # noqa: S314
+    assert root.get("viewBox") == "0 0 700 300"
+
+
+def test_figure_data2svg_empty() -> None:
+    assert figure_data2svg(bar_figure_data(labels=[], counts=[])) == MISSING_FIGURE_MESSAGE
+
+
+def test_figure_data2svg_incorrect_type() -> None:
+    with pytest.raises(ValueError, match="Incorrect figure type: meow"):
+        figure_data2svg({"type": "meow"})
+
+
+############################################
+#     Tests for get_figure_data_script     #
+############################################
+
+
+def test_get_figure_data_script() -> None:
+    script = get_figure_data_script()
+    assert script.startswith("<script>")
+    assert script.endswith("</script>")
+    assert "flamme-figure" in script
+    assert script.count("</script>") == 1
+
+
+########################################
+#     Tests for render_figure_data     #
+########################################
+
+
+def test_render_figure_data_svg() -> None:
+    with use_figure_backend("svg"):
+        figure = render_figure_data(bar_figure_data(labels=["a", "b"], counts=[5, 3]))
+    assert figure.startswith("<svg")
+
+
+def test_render_figure_data_client() -> None:
+    with use_figure_backend("client"):
+        figure = render_figure_data(bar_figure_data(labels=["a", "b"], counts=[5, 3]))
+    assert figure.startswith('<div class="flamme-figure"')
+
+
+def test_render_figure_data_matplotlib() -> None:
+    with pytest.raises(ValueError, match="cannot draw the figure data"):
+        render_figure_data(bar_figure_data(labels=["a", "b"], counts=[5, 3]))
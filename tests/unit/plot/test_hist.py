@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from coola import objects_are_allclose
+from matplotlib import pyplot as plt
+
+from flamme.plot import plot_histogram, plot_histogram2
+
+####################################
+#     Tests for plot_histogram     #
+####################################
+
+
+def test_plot_histogram() -> None:
+    _fig, ax = plt.subplots()
+    plot_histogram(ax, counts=np.array([2, 5, 3]), edges=np.array([0.0, 1.0, 2.0, 3.0]))
+    data = ax.patches[0].get_data()
+    assert objects_are_allclose(data.values, np.array([2.0, 5.0, 3.0]))
+    assert objects_are_allclose(data.edges, np.array([0.0, 1.0, 2.0, 3.0]))
+
+
+def test_plot_histogram_density() -> None:
+    _fig, ax = plt.subplots()
+    plot_histogram(
+        ax, counts=np.array([2, 6, 2]), edges=np.array([0.0, 0.5, 1.0, 2.0]), density=True
+    )
+    assert objects_are_allclose(ax.patches[0].get_data().values, np.array([0.4, 1.2, 0.2]))
+
+
+def test_plot_histogram_density_empty() -> None:
+    _fig, ax = plt.subplots()
+    plot_histogram(ax, counts=np.array([0, 0]), edges=np.array([0.0, 0.5, 1.0]), density=True)
+    assert objects_are_allclose(ax.patches[0].get_data().values, np.array([0.0, 0.0]))
+
+
+def test_plot_histogram_label() -> None:
+    _fig, ax = plt.subplots()
+    plot_histogram(ax, counts=np.array([2, 5]), edges=np.array([0.0, 1.0, 2.0]), label="meow")
+    assert ax.patches[0].get_label() == "meow"
+
+
+def test_plot_histogram_incorrect_edges() -> None:
+    _fig, ax = plt.subplots()
+    with pytest.raises(RuntimeError, match="edges must have one more item than counts"):
+        plot_histogram(ax, counts=np.array([2, 5]), edges=np.array([0.0, 1.0]))
+
+
+#####################################
+#     Tests for plot_histogram2     #
+#####################################
+
+
+def test_plot_histogram2() -> None:
+    _fig, ax = plt.subplots()
+    plot_histogram2(
+        ax,
+        counts1=np.array([2, 5, 3]),
+        counts2=np.array([4, 1, 0]),
+        edges=np.array([0.0, 1.0, 2.0, 3.0]),
+        label1="2020-01",
+        label2="2020-02",
+    )
+    assert len(ax.patches) == 2
+    assert objects_are_allclose(ax.patches[1].get_data().values, np.array([4.0, 1.0, 0.0]))
+    assert [patch.get_label() for patch in ax.patches] == ["2020-01", "2020-02"]
+    assert ax.get_xlim() == (0.0, 3.0)
+
+
+def test_plot_histogram2_density() -> None:
+    _fig, ax = plt.subplots()
+    plot_histogram2(
+        ax,
+        counts1=np.array([2, 6, 2]),
+        counts2=np.array([5, 5, 0]),
+        edges=np.array([0.0, 0.5, 1.0, 2.0]),
+        density=True,
+    )
+    assert objects_are_allclose(ax.patches[0].get_data().values, np.array([0.4, 1.2, 0.2]))
+    assert ax.get_ylabel() == "density (number of occurrences/total)"
+
+
+@pytest.mark.parametrize("yscale", ["linear", "log", "auto"])
+def test_plot_histogram2_yscale(yscale: str) -> None:
+    _fig, ax = plt.subplots()
+    plot_histogram2(
+        ax,
+        counts1=np.array([2, 5, 3]),
+        counts2=np.array([4, 1, 0]),
+        edges=np.array([0.0, 1.0, 2.0, 3.0]),
+        yscale=yscale,
+    )
+    assert ax.get_yscale() in {"linear", "log", "symlog"}
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import numpy as np
 import pytest
 from matplotlib import pyplot as plt
 
-from flamme.plot import plot_null_temporal
+from flamme.plot import plot_null_temporal, plot_null_temporal_heatmap
 
 ########################################
 #     Tests for plot_null_temporal     #
@@ -39,3 +40,64 @@ def test_plot_null_temporal_incorrect_labels() -> None:
             totals=[10, 12, 14, 16],
             labels=["jan", "feb", "mar", "apr", "may"],
         )
+
+
+################################################
+#     Tests for plot_null_temporal_heatmap     #
+################################################
+
+
+def test_plot_null_temporal_heatmap() -> None:
+    _fig, ax = plt.subplots()
+    plot_null_temporal_heatmap(
+        ax,
+        nulls=np.array([[1, 2, 3, 4], [0, 0, 5, 6]]),
+        totals=[10, 12, 14, 16],
+        columns=["col1", "col2"],
+        labels=["jan", "feb", "mar", "apr"],
+    )
+    assert len(ax.images) == 1
+    assert np.allclose(
+        ax.images[0].get_array(), [[0.1, 2 / 12, 3 / 14, 0.25], [0, 0, 5 / 14, 6 / 16]]
+    )
+    assert [label.get_text() for label in ax.get_yticklabels()] == ["col1", "col2"]
+
+
+def test_plot_null_temporal_heatmap_zero_total() -> None:
+    _fig, ax = plt.subplots()
+    plot_null_temporal_heatmap(
+        ax, nulls=np.array([[0, 1]]), totals=[0, 2], columns=["col"], labels=["jan", "feb"]
+    )
+    array = ax.images[0].get_array()
+    assert array.mask[0, 0]
+    assert array[0, 1] == 0.5
+
+
+def test_plot_null_temporal_heatmap_empty() -> None:
+    _fig, ax = plt.subplots()
+    plot_null_temporal_heatmap(ax, nulls=np.zeros((0, 0)), totals=[], columns=[], labels=[])
+    assert len(ax.images) == 0
+
+
+def test_plot_null_temporal_heatmap_incorrect_nulls() -> None:
+    _fig, ax = plt.subplots()
+    with pytest.raises(RuntimeError, match="nulls must have the shape"):
+        plot_null_temporal_heatmap(
+            ax,
+            nulls=np.array([[1, 2, 3, 4]]),
+            totals=[10, 12, 14, 16],
+            columns=["col1", "col2"],
+            labels=["jan", "feb", "mar", "apr"],
+        )
+
+
+def test_plot_null_temporal_heatmap_incorrect_labels() -> None:
+    _fig, ax = plt.subplots()
+    with pytest.raises(RuntimeError, match=r"totals \(4\) and labels \(3\) have different lengths"):
+        plot_null_temporal_heatmap(
+            ax,
+            nulls=np.array([[1, 2, 3, 4]]),
+            totals=[10, 12, 14, 16],
+            columns=["col1"],
+            labels=["jan", "feb", "mar"],
+        )
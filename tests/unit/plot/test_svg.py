@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+from xml.etree import ElementTree
+
+import numpy as np
+import pytest
+
+from flamme.plot import svg_bar, svg_histogram, svg_null_temporal
+from flamme.utils.figure import MISSING_FIGURE_MESSAGE
+
+
+def parse_svg(figure: str) -> ElementTree.Element:
+    root = ElementTree.fromstring(figure)  # noqa: S314
+    assert root.tag == "{http://www.w3.org/2000/svg}svg"
+    return root
+
+
+def get_texts(figure: str) -> list[str]:
+    return [element.text for element in parse_svg(figure).iter("{http://www.w3.org/2000/svg}text")]
+
+
+#############################
+#     Tests for svg_bar     #
+#############################
+
+
+def test_svg_bar() -> None:
+    figure = svg_bar(
+        labels=["a", "b", "c", "d"],
+        counts=[5, 100, 42, 27],
+        title="my title",
+        xlabel="values",
+        ylabel="number of occurrences",
+    )
+    texts = get_texts(figure)
+    assert texts[0] == "my title"
+    assert {"a", "b", "c", "d", "values", "number of occurrences"}.issubset(texts)
+
+
+@pytest.mark.parametrize("yscale", ["auto", "linear", "log", "symlog"])
+def test_svg_bar_yscale(yscale: str) -> None:
+    parse_svg(svg_bar(labels=["a", "b", "c", "d"], counts=[5, 10000, 0, 27], yscale=yscale))
+
+
+def test_svg_bar_yscale_incorrect() -> None:
+    with pytest.raises(ValueError, match="Incorrect scale: meow"):
+        svg_bar(labels=["a", "b"], counts=[5, 100], yscale="meow")
+
+
+@pytest.mark.parametrize("figsize", [(7, 3), (1.5, 1.5)])
+def test_svg_bar_figsize(figsize: tuple[float, float]) -> None:
+    root = parse_svg(svg_bar(labels=["a", "b"], counts=[5, 100], figsize=figsize))
+    assert root.get("viewBox") == f"0 0 {round(figsize[0] * 100)} {round(figsize[1] * 100)}"
+
+
+def test_svg_bar_zero_counts() -> None:
+    parse_svg(svg_bar(labels=["a", "b"], counts=[0, 0]))
+
+
+def test_svg_bar_max_num_xticks() -> None:
+    labels = [f"label{i}" for i in range(1000)]
+    texts = get_texts(svg_bar(labels=labels, counts=np.ones(1000), max_num_xticks=10))
+    assert len([text for text in texts if text.startswith("label")]) == 10
+
+
+def test_svg_bar_escape() -> None:
+    assert "<b>" in get_texts(svg_bar(labels=["<b>", "&"], counts=[1, 2]))
+
+
+def test_svg_bar_empty() -> None:
+    assert svg_bar(labels=[], counts=[]) == MISSING_FIGURE_MESSAGE
+
+
+def test_svg_bar_incorrect_lengths() -> None:
+    with pytest.raises(RuntimeError, match=r"labels \(2\) and counts \(3\) have different lengths"):
+        svg_bar(labels=["a", "b"], counts=[1, 2, 3])
+
+
+###################################
+#     Tests for svg_histogram     #
+###################################
+
+
+def test_svg_histogram() -> None:
+    figure = svg_histogram(
+        counts=np.array([2, 5, 3]), edges=np.array([0.0, 1.0, 2.0, 3.0]), title="my title"
+    )
+    assert get_texts(figure)[0] == "my title"
+
+
+@pytest.mark.parametrize("yscale", ["auto", "linear", "log", "symlog"])
+def test_svg_histogram_yscale(yscale: str) -> None:
+    parse_svg(
+        svg_histogram(
+            counts=np.array([2, 5000, 0]), edges=np.array([-1.0, 1.0, 2.0, 3.0]), yscale=yscale
+        )
+    )
+
+
+def test_svg_histogram_cdf() -> None:
+    figure = svg_histogram(
+        counts=np.array([2, 5, 3]),
+        edges=np.array([0.0, 1.0, 2.0, 3.0]),
+        cdf=np.array([0.2, 0.7, 1.0]),
+    )
+    assert "cumulative distribution function (CDF)" in get_texts(figure)
+
+
+def test_svg_histogram_quantiles() -> None:
+    texts = get_texts(
+        svg_histogram(
+            counts=np.array([2, 5, 3]),
+            edges=np.array([0.0, 1.0, 2.0, 3.0]),
+            quantiles={"q0.05": 0.5, "q0.95": 5.0},
+        )
+    )
+    assert "q0.05" in texts
+    assert "q0.95" not in texts
+
+
+def test_svg_histogram_single_value() -> None:
+    parse_svg(svg_histogram(counts=np.array([5]), edges=np.array([1.0, 1.0])))
+
+
+def test_svg_histogram_empty() -> None:
+    assert svg_histogram(counts=np.array([]), edges=np.array([0.0])) == MISSING_FIGURE_MESSAGE
+
+
+def test_svg_histogram_incorrect_edges() -> None:
+    with pytest.raises(RuntimeError, match="edges must have one more item than counts"):
+        svg_histogram(counts=np.array([2, 5, 3]), edges=np.array([0.0, 1.0, 2.0]))
+
+
+#######################################
+#     Tests for svg_null_temporal     #
+#######################################
+
+
+def test_svg_null_temporal() -> None:
+    texts = get_texts(
+        svg_null_temporal(
+            nulls=[1, 2, 3, 4],
+            totals=[10, 12, 14, 16],
+            labels=["jan", "feb", "mar", "apr"],
+            title="column: col",
+        )
+    )
+    assert texts[0] == "column: col"
+    assert {"jan", "apr", "total", "null", "percentage"}.issubset(texts)
+
+
+def test_svg_null_temporal_zero_total() -> None:
+    parse_svg(svg_null_temporal(nulls=[0, 0], totals=[0, 2], labels=["jan", "feb"]))
+
+
+def test_svg_null_temporal_empty() -> None:
+    assert svg_null_temporal(nulls=[], totals=[], labels=[]) == MISSING_FIGURE_MESSAGE
+
+
+def test_svg_null_temporal_incorrect_total() -> None:
+    with pytest.raises(RuntimeError, match=r"nulls \(4\) and totals \(5\) have different lengths"):
+        svg_null_temporal(
+            nulls=[1, 2, 3, 4], totals=[10, 12, 14, 16, 18], labels=["jan", "feb", "mar", "apr"]
+        )
+
+
+def test_svg_null_temporal_incorrect_labels() -> None:
+    with pytest.raises(RuntimeError, match=r"nulls \(4\) and labels \(5\) have different lengths"):
+        svg_null_temporal(
+            nulls=[1, 2, 3, 4],
+            totals=[10, 12, 14, 16],
+            labels=["jan", "feb", "mar", "apr", "may"],
+        )
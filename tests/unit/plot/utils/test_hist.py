@@ -4,6 +4,7 @@ import numpy as np
 import pytest
 
 from flamme.plot.utils.hist import adjust_nbins, find_nbins
+from flamme.utils.array import SortedArray
 
 ##################################
 #     Tests for adjust_nbins     #
@@ -20,6 +21,19 @@ def test_adjust_nbins_float(dtype: np.dtype) -> None:
     assert adjust_nbins(nbins=100, array=np.array([1, 4, 5, 6], dtype=dtype)) == 100
 
 
+@pytest.mark.parametrize(
+    ("array", "nbins"),
+    [
+        (np.array([1, 4, 5, 6]), 6),
+        (np.array([1.0, 4.0, 5.0, 6.0]), 100),
+        (np.array([1, 1]), 1),
+        (np.array([], dtype=np.int64), 100),
+    ],
+)
+def test_adjust_nbins_sorted_array(array: np.ndarray, nbins: int) -> None:
+    assert adjust_nbins(nbins=100, array=SortedArray(array)) == nbins
+
+
 def test_adjust_nbins_initial() -> None:
     assert adjust_nbins(nbins=100, array=np.array([100, 0])) == 100
 
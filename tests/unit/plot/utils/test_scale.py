@@ -3,7 +3,12 @@ from __future__ import annotations
 import numpy as np
 import pytest
 
-from flamme.plot.utils import auto_yscale_continuous, auto_yscale_discrete
+from flamme.plot.utils import (
+    auto_yscale_continuous,
+    auto_yscale_discrete,
+    auto_yscale_histogram,
+)
+from flamme.utils.array import SortedArray
 
 ############################################
 #     Tests for auto_yscale_continuous     #
@@ -41,6 +46,24 @@ def test_auto_yscale_continuous_log(array: np.ndarray) -> None:
     assert auto_yscale_continuous(array, nbins=10) == "log"
 
 
+@pytest.mark.parametrize(
+    "array",
+    [
+        np.ones(100),
+        np.arange(100),
+        np.asarray([]),
+        np.asarray([1] * 100 + list(range(1, 11))),
+        np.asarray([10] * 1000 + list(range(1, 11)) + [float("nan")]),
+        np.asarray([1] * 100 + list(range(-5, 11))),
+    ],
+)
+@pytest.mark.parametrize("nbins", [None, 10])
+def test_auto_yscale_continuous_sorted_array(array: np.ndarray, nbins: int | None) -> None:
+    assert auto_yscale_continuous(SortedArray(array), nbins=nbins) == auto_yscale_continuous(
+        array, nbins=nbins
+    )
+
+
 @pytest.mark.parametrize(
     "array",
     [
@@ -80,3 +103,27 @@ def test_auto_yscale_discrete_threshold_100() -> None:
 
 def test_auto_yscale_discrete_min_count_0() -> None:
     assert auto_yscale_discrete(min_count=0, max_count=5) == "linear"
+
+
+###########################################
+#     Tests for auto_yscale_histogram     #
+###########################################
+
+
+@pytest.mark.parametrize(
+    "counts",
+    [np.array([5, 3, 4]), np.array([500, 3]), np.array([500, 0, 0]), np.array([0, 0, 0])],
+)
+def test_auto_yscale_histogram_linear(counts: np.ndarray) -> None:
+    assert auto_yscale_histogram(counts=counts, edges=np.arange(counts.size + 1)) == "linear"
+
+
+def test_auto_yscale_histogram_log() -> None:
+    assert (
+        auto_yscale_histogram(counts=np.array([500, 3, 4]), edges=np.array([1, 2, 3, 4])) == "log"
+    )
+
+
+@pytest.mark.parametrize("edges", [np.array([0, 1, 2, 3]), np.array([-1, 0, 1, 2])])
+def test_auto_yscale_histogram_symlog(edges: np.ndarray) -> None:
+    assert auto_yscale_histogram(counts=np.array([500, 3, 4]), edges=edges) == "symlog"
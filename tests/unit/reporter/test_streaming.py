@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import re
+import zipfile
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import polars as pl
+import pytest
+from grizz.transformer import Sequential
+
+from flamme.analyzer import (
+    ColumnContinuousAnalyzer,
+    DataTypeAnalyzer,
+    DuplicatedRowAnalyzer,
+    MappingAnalyzer,
+    NullValueAnalyzer,
+)
+from flamme.ingestor import ParquetBatchIngestor
+from flamme.reporter import StreamingReporter
+from flamme.utils.figure import get_figure_backend, get_figure_sink
+from flamme.utils.figure_sink import InlineFigureSink
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture(scope="module")
+def frame_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    path = tmp_path_factory.mktemp("data").joinpath("frame.parquet")
+    frame = pl.DataFrame(
+        {
+            "col1": [1, 2, 3, 4, 5],
+            "col2": ["a", "b", None, "d", "e"],
+            "col3": [1.2, 2.2, 3.2, None, None],
+        }
+    )
+    frame.write_parquet(path)
+    return path
+
+
+#######################################
+#     Tests for StreamingReporter     #
+#######################################
+
+
+def test_streaming_reporter_str(frame_path: Path, tmp_path: Path) -> None:
+    assert str(
+        StreamingReporter(
+            ingestor=ParquetBatchIngestor(frame_path),
+            transformer=Sequential(transformers=[]),
+            analyzer=NullValueAnalyzer(),
+            report_path=tmp_path.joinpath("report.html"),
+        )
+    ).startswith("StreamingReporter(")
+
+
+def test_streaming_reporter_compute(frame_path: Path, tmp_path: Path) -> None:
+    report_path = tmp_path.joinpath("report.html")
+    StreamingReporter(
+        ingestor=ParquetBatchIngestor(frame_path, batch_size=2),
+        transformer=Sequential(transformers=[]),
+        analyzer=MappingAnalyzer({"null": NullValueAnalyzer(), "dtype": DataTypeAnalyzer()}),
+        report_path=report_path,
+    ).compute()
+    assert report_path.is_file()
+
+
+def test_streaming_reporter_compute_update_per_batch(frame_path: Path, tmp_path: Path) -> None:
+    analyzer = NullValueAnalyzer()
+    with patch.object(analyzer, "update", wraps=analyzer.update) as update:
+        StreamingReporter(
+            ingestor=ParquetBatchIngestor(frame_path, batch_size=2),
+            transformer=Sequential(transformers=[]),
+            analyzer=analyzer,
+            report_path=tmp_path.joinpath("report.html"),
+        ).compute()
+    assert update.call_count == 3
+
+
+def test_streaming_reporter_compute_not_streamable(frame_path: Path, tmp_path: Path) -> None:
+    report_path = tmp_path.joinpath("report.html")
+    reporter = StreamingReporter(
+        ingestor=ParquetBatchIngestor(frame_path),
+        transformer=Sequential(transformers=[]),
+        analyzer=MappingAnalyzer(
+            {"null": NullValueAnalyzer(), "duplicate": DuplicatedRowAnalyzer()}
+        ),
+        report_path=report_path,
+    )
+    with (
+        patch.object(ParquetBatchIngestor, "iter_batches") as iter_batches,
+        pytest.raises(RuntimeError, match="Some analyzers cannot analyze the data by batches"),
+    ):
+        reporter.compute()
+    iter_batches.assert_not_called()
+    assert not report_path.is_file()
+
+
+def test_streaming_reporter_compute_sample(frame_path: Path, tmp_path: Path) -> None:
+    report_path = tmp_path.joinpath("report.html")
+    analyzer = MappingAnalyzer({"null": NullValueAnalyzer(), "duplicate": DuplicatedRowAnalyzer()})
+    with patch.object(analyzer, "finalize", wraps=analyzer.finalize) as finalize:
+        StreamingReporter(
+            ingestor=ParquetBatchIngestor(frame_path, batch_size=2),
+            transformer=Sequential(transformers=[]),
+            analyzer=analyzer,
+            report_path=report_path,
+            sample_size=3,
+        ).compute()
+    assert report_path.is_file()
+    assert finalize.call_args.args[0].shape == (3, 3)
+
+
+def test_streaming_reporter_compute_figure_backend_svg(frame_path: Path, tmp_path: Path) -> None:
+    report_path = tmp_path.joinpath("report.html")
+    StreamingReporter(
+        ingestor=ParquetBatchIngestor(frame_path, batch_size=2),
+        transformer=Sequential(transformers=[]),
+        analyzer=ColumnContinuousAnalyzer(column="col3"),
+        report_path=report_path,
+        sample_size=5,
+        figure_backend="svg",
+    ).compute()
+    assert "<svg" in report_path.read_text()
+    assert get_figure_backend() == "matplotlib"
+
+
+def test_streaming_reporter_compute_figure_backend_client(frame_path: Path, tmp_path: Path) -> None:
+    report_path = tmp_path.joinpath("report.html")
+    StreamingReporter(
+        ingestor=ParquetBatchIngestor(frame_path, batch_size=2),
+        transformer=Sequential(transformers=[]),
+        analyzer=ColumnContinuousAnalyzer(column="col3"),
+        report_path=report_path,
+        sample_size=5,
+        figure_backend="client",
+    ).compute()
+    report = report_path.read_text()
+    assert report.count('<div class="flamme-figure"') == 1
+    assert report.count("<script>") == 1
+    assert get_figure_backend() == "matplotlib"
+
+
+def test_streaming_reporter_incorrect_figure_backend(frame_path: Path, tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="Incorrect figure backend: png"):
+        StreamingReporter(
+            ingestor=ParquetBatchIngestor(frame_path),
+            transformer=Sequential(transformers=[]),
+            analyzer=NullValueAnalyzer(),
+            report_path=tmp_path.joinpath("report.html"),
+            figure_backend="png",
+        )
+
+
+@pytest.mark.parametrize("figure_sink", ["directory", "archive"])
+def test_streaming_reporter_compute_figure_sink(
+    frame_path: Path, tmp_path: Path, figure_sink: str
+) -> None:
+    report_path = tmp_path.joinpath("report.html")
+    StreamingReporter(
+        ingestor=ParquetBatchIngestor(frame_path),
+        transformer=Sequential(transformers=[]),
+        analyzer=ColumnContinuousAnalyzer(column="col3"),
+        report_path=report_path,
+        sample_size=5,
+        figure_sink=figure_sink,
+    ).compute()
+    report = report_path.read_text()
+    assert "base64" not in report
+    assert 'src="report_figures/' in report
+    if figure_sink == "archive":
+        with zipfile.ZipFile(tmp_path.joinpath("report_figures.zip")) as archive:
+            archive.extractall(tmp_path)
+    for src in re.findall(r'src="([^"]+)"', report):
+        assert tmp_path.joinpath(src).is_file()
+    assert isinstance(get_figure_sink(), InlineFigureSink)
+
+
+def test_streaming_reporter_incorrect_figure_sink(frame_path: Path, tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="Incorrect figure sink: s3"):
+        StreamingReporter(
+            ingestor=ParquetBatchIngestor(frame_path),
+            transformer=Sequential(transformers=[]),
+            analyzer=NullValueAnalyzer(),
+            report_path=tmp_path.joinpath("report.html"),
+            figure_sink="s3",
+        )
@@ -1,8 +1,17 @@
 from __future__ import annotations
 
+import io
+from typing import TYPE_CHECKING
+
+import pytest
 from jinja2 import Template
 
-from flamme.reporter.utils import create_html_report
+from flamme.reporter.utils import create_html_report, save_html_report, write_html_report
+from flamme.utils.figure import use_figure_backend
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
 
 ########################################
 #     Tests for create_html_report     #
@@ -11,3 +20,84 @@ from flamme.reporter.utils import create_html_report
 
 def test_create_html_report() -> None:
     assert isinstance(Template(create_html_report(toc="", body="")).render(), str)
+
+
+def test_create_html_report_matplotlib() -> None:
+    assert "<script>" not in create_html_report(toc="", body="")
+
+
+def test_create_html_report_client() -> None:
+    with use_figure_backend("client"):
+        report = create_html_report(toc="", body="")
+    assert report.count("<script>") == 1
+
+
+#######################################
+#     Tests for write_html_report     #
+#######################################
+
+
+def test_write_html_report() -> None:
+    file = io.StringIO()
+    write_html_report(
+        file, toc="<ul>\n<li>1</li>\n</ul>", body=["<p>\nmeow\n</p>", "", "<p>bark</p>"]
+    )
+    assert file.getvalue() == create_html_report(
+        toc="<ul>\n<li>1</li>\n</ul>", body="<p>\nmeow\n</p>\n\n<p>bark</p>"
+    )
+
+
+def test_write_html_report_empty() -> None:
+    file = io.StringIO()
+    write_html_report(file, toc="", body=[])
+    assert file.getvalue() == create_html_report(toc="", body="")
+
+
+def test_write_html_report_iterator() -> None:
+    def body() -> Iterator[str]:
+        yield "<p>meow</p>"
+        yield "<p>bark</p>"
+
+    file = io.StringIO()
+    write_html_report(file, toc="", body=body())
+    assert file.getvalue() == create_html_report(toc="", body="<p>meow</p>\n<p>bark</p>")
+
+
+def test_write_html_report_client() -> None:
+    file = io.StringIO()
+    with use_figure_backend("client"):
+        write_html_report(file, toc="", body=["<p>meow</p>"])
+    assert file.getvalue().count("<script>") == 1
+
+
+######################################
+#     Tests for save_html_report     #
+######################################
+
+
+def test_save_html_report(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data", "report.html")
+    save_html_report(path, toc="<ul></ul>", body=["<p>meow</p>", "<p>bark</p>"])
+    assert path.read_text() == create_html_report(toc="<ul></ul>", body="<p>meow</p>\n<p>bark</p>")
+    assert [file.name for file in path.parent.iterdir()] == ["report.html"]
+
+
+def test_save_html_report_overwrite(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("report.html")
+    path.write_text("abc")
+    save_html_report(path, toc="", body=["<p>meow</p>"])
+    assert "<p>meow</p>" in path.read_text()
+
+
+def test_save_html_report_error(tmp_path: Path) -> None:
+    def body() -> Iterator[str]:
+        yield "<p>meow</p>"
+        msg = "bark"
+        raise RuntimeError(msg)
+
+    path = tmp_path.joinpath("report.html")
+    path.write_text("abc")
+    with pytest.raises(RuntimeError, match="bark"):
+        save_html_report(path, toc="", body=body())
+    assert path.read_text() == "abc"
+    assert [file.name for file in tmp_path.iterdir()] == ["report.html"]
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import re
+import zipfile
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -8,8 +10,17 @@ import pytest
 from grizz.ingestor import ParquetIngestor
 from grizz.transformer import Sequential
 
-from flamme.analyzer import NullValueAnalyzer
+from flamme.analyzer import (
+    ColumnContinuousAnalyzer,
+    DataFrameSummaryAnalyzer,
+    DuplicatedRowAnalyzer,
+    MappingAnalyzer,
+    NullValueAnalyzer,
+)
 from flamme.reporter import Reporter
+from flamme.utils.cache import get_computation_cache
+from flamme.utils.figure import get_figure_backend, get_figure_sink
+from flamme.utils.figure_sink import InlineFigureSink
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -55,3 +66,114 @@ def test_reporter_compute(frame_path: Path, tmp_path: Path) -> None:
         report_path=report_path,
     ).compute()
     assert report_path.is_file()
+
+
+def test_reporter_compute_materialize(frame_path: Path, tmp_path: Path) -> None:
+    report_path = tmp_path.joinpath("report.html")
+    Reporter(
+        ingestor=ParquetIngestor(frame_path),
+        transformer=Sequential(transformers=[]),
+        analyzer=MappingAnalyzer(
+            {"null": NullValueAnalyzer(), "duplicate": DuplicatedRowAnalyzer()}
+        ),
+        report_path=report_path,
+        materialize=True,
+    ).compute()
+    assert report_path.is_file()
+
+
+def test_reporter_compute_cache(frame_path: Path, tmp_path: Path) -> None:
+    report_path = tmp_path.joinpath("report.html")
+    Reporter(
+        ingestor=ParquetIngestor(frame_path),
+        transformer=Sequential(transformers=[]),
+        analyzer=MappingAnalyzer(
+            {"null": NullValueAnalyzer(), "summary": DataFrameSummaryAnalyzer()}
+        ),
+        report_path=report_path,
+        cache_max_bytes=2**20,
+    ).compute()
+    assert report_path.is_file()
+    assert get_computation_cache() is None
+
+
+def test_reporter_compute_figure_backend_svg(frame_path: Path, tmp_path: Path) -> None:
+    report_path = tmp_path.joinpath("report.html")
+    Reporter(
+        ingestor=ParquetIngestor(frame_path),
+        transformer=Sequential(transformers=[]),
+        analyzer=ColumnContinuousAnalyzer(column="col3"),
+        report_path=report_path,
+        figure_backend="svg",
+    ).compute()
+    assert "<svg" in report_path.read_text()
+    assert get_figure_backend() == "matplotlib"
+
+
+def test_reporter_compute_figure_backend_client(frame_path: Path, tmp_path: Path) -> None:
+    report_path = tmp_path.joinpath("report.html")
+    Reporter(
+        ingestor=ParquetIngestor(frame_path),
+        transformer=Sequential(transformers=[]),
+        analyzer=ColumnContinuousAnalyzer(column="col3"),
+        report_path=report_path,
+        figure_backend="client",
+    ).compute()
+    report = report_path.read_text()
+    assert report.count('<div class="flamme-figure"') == 1
+    assert report.count("<script>") == 1
+    assert get_figure_backend() == "matplotlib"
+
+
+def test_reporter_compute_figure_backend_matplotlib(frame_path: Path, tmp_path: Path) -> None:
+    report_path = tmp_path.joinpath("report.html")
+    Reporter(
+        ingestor=ParquetIngestor(frame_path),
+        transformer=Sequential(transformers=[]),
+        analyzer=ColumnContinuousAnalyzer(column="col3"),
+        report_path=report_path,
+    ).compute()
+    assert "<svg" not in report_path.read_text()
+
+
+def test_reporter_incorrect_figure_backend(frame_path: Path, tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="Incorrect figure backend: png"):
+        Reporter(
+            ingestor=ParquetIngestor(frame_path),
+            transformer=Sequential(transformers=[]),
+            analyzer=NullValueAnalyzer(),
+            report_path=tmp_path.joinpath("report.html"),
+            figure_backend="png",
+        )
+
+
+@pytest.mark.parametrize("figure_sink", ["directory", "archive"])
+def test_reporter_compute_figure_sink(frame_path: Path, tmp_path: Path, figure_sink: str) -> None:
+    report_path = tmp_path.joinpath("report.html")
+    Reporter(
+        ingestor=ParquetIngestor(frame_path),
+        transformer=Sequential(transformers=[]),
+        analyzer=ColumnContinuousAnalyzer(column="col3"),
+        report_path=report_path,
+        figure_sink=figure_sink,
+    ).compute()
+    report = report_path.read_text()
+    assert "base64" not in report
+    assert 'src="report_figures/' in report
+    if figure_sink == "archive":
+        with zipfile.ZipFile(tmp_path.joinpath("report_figures.zip")) as archive:
+            archive.extractall(tmp_path)
+    for src in re.findall(r'src="([^"]+)"', report):
+        assert tmp_path.joinpath(src).is_file()
+    assert isinstance(get_figure_sink(), InlineFigureSink)
+
+
+def test_reporter_incorrect_figure_sink(frame_path: Path, tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="Incorrect figure sink: s3"):
+        Reporter(
+            ingestor=ParquetIngestor(frame_path),
+            transformer=Sequential(transformers=[]),
+            analyzer=NullValueAnalyzer(),
+            report_path=tmp_path.joinpath("report.html"),
+            figure_sink="s3",
+        )
@@ -35,6 +35,13 @@ def test_content_section_render_html_body_args() -> None:
     )
 
 
+def test_content_section_iter_html_body() -> None:
+    section = ContentSection(content="meow")
+    assert list(section.iter_html_body(number="1.", tags=["meow"], depth=1)) == [
+        section.render_html_body(number="1.", tags=["meow"], depth=1)
+    ]
+
+
 def test_content_section_render_html_toc() -> None:
     section = ContentSection(content="meow")
     assert isinstance(Template(section.render_html_toc()).render(), str)
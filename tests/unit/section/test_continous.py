@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from unittest.mock import patch
+
 import matplotlib.pyplot as plt
 import numpy as np
 import polars as pl
@@ -12,10 +14,18 @@ from flamme.section import ColumnContinuousSection
 from flamme.section.continuous import (
     create_boxplot_figure,
     create_histogram_figure,
+    create_histogram_figure_data,
+    create_histogram_svg,
     create_section_template,
     create_stats_table,
     to_array,
 )
+from flamme.utils.array import SortedArray
+from flamme.utils.figure import MISSING_FIGURE_MESSAGE, use_figure_backend
+from flamme.utils.stats import (
+    compute_statistics_continuous,
+    compute_statistics_continuous_frame,
+)
 
 
 @pytest.fixture
@@ -122,6 +132,29 @@ def test_column_continuous_section_get_statistics(series: pl.Series, stats: dict
     assert objects_are_allclose(section.get_statistics(), stats, atol=1e-2)
 
 
+def test_column_continuous_section_get_statistics_precomputed(
+    series: pl.Series, stats: dict
+) -> None:
+    section = ColumnContinuousSection(series=series, column="col", statistics=stats)
+    assert objects_are_equal(section.get_statistics(), stats)
+
+
+def test_column_continuous_section_get_statistics_frame(series: pl.Series, stats: dict) -> None:
+    statistics = compute_statistics_continuous_frame(pl.DataFrame({"col": series})).row(
+        0, named=True
+    )
+    statistics.pop("column")
+    section = ColumnContinuousSection(series=series, column="col", statistics=statistics)
+    assert objects_are_allclose(section.get_statistics(), stats, atol=1e-2)
+
+
+def test_column_continuous_section_render_html_body_precomputed(
+    series: pl.Series, stats: dict
+) -> None:
+    section = ColumnContinuousSection(series=series, column="col", statistics=stats)
+    assert isinstance(Template(section.render_html_body()).render(), str)
+
+
 def test_column_continuous_section_get_statistics_empty_row() -> None:
     section = ColumnContinuousSection(series=pl.Series(values=[], dtype=pl.Int64), column="col")
     assert objects_are_allclose(
@@ -238,6 +271,29 @@ def test_column_continuous_section_render_html_body_args(series: pl.Series) -> N
     )
 
 
+def test_column_continuous_section_render_html_body_svg(series: pl.Series) -> None:
+    section = ColumnContinuousSection(series=series, column="col")
+    with use_figure_backend("svg"):
+        html = section.render_html_body()
+    # The histogram is drawn as SVG and the boxplot with matplotlib.
+    assert html.count("<svg") == 1
+    assert html.count("<img") == 1
+
+
+def test_column_continuous_section_render_html_body_client(series: pl.Series) -> None:
+    section = ColumnContinuousSection(series=series, column="col")
+    with use_figure_backend("client"):
+        html = section.render_html_body()
+    assert html.count('<div class="flamme-figure"') == 1
+    assert html.count("<img") == 1
+
+
+def test_column_continuous_section_get_figure_data(series: pl.Series) -> None:
+    data = ColumnContinuousSection(series=series, column="col", nbins=4).get_figure_data()
+    assert list(data) == ["histogram"]
+    assert data["histogram"]["counts"] == [25.0, 25.0, 25.0, 26.0]
+
+
 def test_column_continuous_section_render_html_body_empty() -> None:
     section = ColumnContinuousSection(series=pl.Series(values=[], dtype=pl.Int64), column="col")
     assert isinstance(Template(section.render_html_body()).render(), str)
@@ -255,6 +311,26 @@ def test_column_continuous_section_render_html_toc_args(series: pl.Series) -> No
     )
 
 
+def test_column_continuous_section_get_statistics_memoized(series: pl.Series) -> None:
+    section = ColumnContinuousSection(series=series, column="col")
+    with patch(
+        "flamme.section.continuous.compute_statistics_continuous",
+        wraps=compute_statistics_continuous,
+    ) as compute:
+        stats = section.get_statistics()
+        section.render_html_body()
+        assert objects_are_equal(section.get_statistics(), stats)
+    compute.assert_called_once()
+
+
+def test_column_continuous_section_render_html_body_to_array_once(series: pl.Series) -> None:
+    section = ColumnContinuousSection(series=series, column="col")
+    with patch("flamme.section.continuous.to_array", wraps=to_array) as convert:
+        section.render_html_body()
+        section.render_html_body()
+    assert sum(isinstance(call.args[0], pl.Series) for call in convert.call_args_list) == 1
+
+
 #############################################
 #     Tests for create_section_template     #
 #############################################
@@ -292,6 +368,12 @@ def test_create_boxplot_figure_empty() -> None:
     assert create_boxplot_figure(series=pl.Series([None, None], dtype=pl.Int64)) is None
 
 
+def test_create_boxplot_figure_sorted_array(series: pl.Series) -> None:
+    assert isinstance(
+        create_boxplot_figure(series=SortedArray(series.drop_nulls().to_numpy())), plt.Figure
+    )
+
+
 ############################################
 #    Tests for create_histogram_figure     #
 ############################################
@@ -301,6 +383,19 @@ def test_create_histogram_figure(series: pl.Series) -> None:
     assert isinstance(create_histogram_figure(series=series, column="col"), plt.Figure)
 
 
+def test_create_histogram_figure_sorted_array(series: pl.Series) -> None:
+    assert isinstance(
+        create_histogram_figure(
+            series=SortedArray(series.drop_nulls().to_numpy()), column="col", nbins=200
+        ),
+        plt.Figure,
+    )
+
+
+def test_create_histogram_figure_sorted_array_empty() -> None:
+    assert create_histogram_figure(series=SortedArray(np.array([])), column="col") is None
+
+
 @pytest.mark.parametrize("nbins", [1, 2, 4])
 def test_create_histogram_figure_nbins(series: pl.Series, nbins: int) -> None:
     assert isinstance(create_histogram_figure(series=series, column="col", nbins=nbins), plt.Figure)
@@ -338,6 +433,72 @@ def test_create_histogram_figure_empty() -> None:
     )
 
 
+#################################################
+#    Tests for create_histogram_figure_data     #
+#################################################
+
+
+def test_create_histogram_figure_data(series: pl.Series) -> None:
+    data = create_histogram_figure_data(series=series, column="col", nbins=4)
+    assert data["type"] == "histogram"
+    assert data["title"] == "data distribution for column col"
+    assert data["counts"] == [25.0, 25.0, 25.0, 26.0]
+    assert data["edges"] == [0.0, 25.0, 50.0, 75.0, 100.0]
+    assert objects_are_allclose(data["cdf"], [25 / 101, 50 / 101, 75 / 101, 1.0])
+    assert objects_are_allclose(data["quantiles"], {"q0.05": 5.0, "q0.95": 95.0})
+
+
+def test_create_histogram_figure_data_range(series: pl.Series) -> None:
+    data = create_histogram_figure_data(series=series, column="col", nbins=2, xmin=50, xmax=100)
+    assert data["counts"] == [25.0, 26.0]
+    # The values on the left of the range are included in the CDF.
+    assert objects_are_allclose(data["cdf"], [75 / 101, 1.0])
+
+
+def test_create_histogram_figure_data_empty() -> None:
+    data = create_histogram_figure_data(
+        series=pl.Series([None, None], dtype=pl.Int64), column="col"
+    )
+    assert data["counts"] == []
+    assert data["cdf"] is None
+
+
+#########################################
+#    Tests for create_histogram_svg     #
+#########################################
+
+
+def test_create_histogram_svg(series: pl.Series) -> None:
+    figure = create_histogram_svg(series=series, column="col")
+    assert figure.startswith("<svg")
+    assert "data distribution for column col" in figure
+    assert "q0.05" in figure
+
+
+def test_create_histogram_svg_sorted_array(series: pl.Series) -> None:
+    assert create_histogram_svg(
+        series=SortedArray(np.arange(101)), column="col"
+    ) == create_histogram_svg(series=series, column="col")
+
+
+@pytest.mark.parametrize("yscale", ["auto", "linear", "log", "symlog"])
+def test_create_histogram_svg_yscale(series: pl.Series, yscale: str) -> None:
+    assert create_histogram_svg(series=series, column="col", yscale=yscale).startswith("<svg")
+
+
+def test_create_histogram_svg_range(series: pl.Series) -> None:
+    assert create_histogram_svg(
+        series=series, column="col", nbins=10, xmin="q0.1", xmax="q0.9"
+    ).startswith("<svg")
+
+
+def test_create_histogram_svg_empty() -> None:
+    assert (
+        create_histogram_svg(series=pl.Series([None, None], dtype=pl.Int64), column="col")
+        == MISSING_FIGURE_MESSAGE
+    )
+
+
 #######################################
 #    Tests for create_stats_table     #
 #######################################
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import numpy as np
 import polars as pl
 import pytest
-from coola import objects_are_allclose
+from coola import objects_are_allclose, objects_are_equal
 from jinja2 import Template
 from matplotlib import pyplot as plt
 from polars.testing import assert_series_equal
@@ -12,6 +13,8 @@ from flamme.section.continuous_advanced import (
     create_histogram_range_figure,
     create_section_template,
 )
+from flamme.utils.array import SortedArray
+from flamme.utils.stats import compute_statistics_continuous_frame
 
 
 @pytest.fixture
@@ -107,6 +110,31 @@ def test_column_continuous_advanced_section_get_statistics(series: pl.Series, st
     assert objects_are_allclose(section.get_statistics(), stats, atol=1e-2)
 
 
+def test_column_continuous_advanced_section_get_statistics_precomputed(
+    series: pl.Series, stats: dict
+) -> None:
+    section = ColumnContinuousAdvancedSection(series=series, column="col", statistics=stats)
+    assert objects_are_equal(section.get_statistics(), stats)
+
+
+def test_column_continuous_advanced_section_get_statistics_frame(
+    series: pl.Series, stats: dict
+) -> None:
+    statistics = compute_statistics_continuous_frame(pl.DataFrame({"col": series})).row(
+        0, named=True
+    )
+    statistics.pop("column")
+    section = ColumnContinuousAdvancedSection(series=series, column="col", statistics=statistics)
+    assert objects_are_allclose(section.get_statistics(), stats, atol=1e-2)
+
+
+def test_column_continuous_advanced_section_render_html_body_precomputed(
+    series: pl.Series, stats: dict
+) -> None:
+    section = ColumnContinuousAdvancedSection(series=series, column="col", statistics=stats)
+    assert isinstance(Template(section.render_html_body()).render(), str)
+
+
 def test_column_continuous_advanced_section_get_statistics_empty_row() -> None:
     section = ColumnContinuousAdvancedSection(series=pl.Series([], dtype=pl.Int64), column="col")
     assert objects_are_allclose(
@@ -262,6 +290,22 @@ def test_create_histogram_range_figure(series: pl.Series) -> None:
     assert isinstance(create_histogram_range_figure(series=series, column="col"), plt.Figure)
 
 
+def test_create_histogram_range_figure_sorted_array(series: pl.Series) -> None:
+    assert isinstance(
+        create_histogram_range_figure(
+            series=SortedArray(series.drop_nulls().to_numpy()),
+            column="col",
+            xmin="q0.25",
+            xmax="q0.75",
+        ),
+        plt.Figure,
+    )
+
+
+def test_create_histogram_range_figure_sorted_array_empty() -> None:
+    assert create_histogram_range_figure(series=SortedArray(np.array([])), column="col") is None
+
+
 @pytest.mark.parametrize("nbins", [1, 2, 4])
 def test_create_histogram_range_figure_nbins(series: pl.Series, nbins: int) -> None:
     assert isinstance(
@@ -1,21 +1,29 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from typing import TYPE_CHECKING
 
 import matplotlib.pyplot as plt
 import numpy as np
 import polars as pl
 import pytest
-from coola import objects_are_allclose
+from coola import objects_are_allclose, objects_are_equal
 from jinja2 import Template
 from polars.testing import assert_frame_equal
 
 from flamme.section.continuous_drift import (
     ColumnContinuousTemporalDriftSection,
+    compute_temporal_drift_histograms,
     create_section_template,
     create_temporal_drift_figure,
+    create_temporal_drift_figure_from_counts,
 )
 from flamme.utils.data import datetime_range
+from flamme.utils.figure import use_figure_sink
+from flamme.utils.figure_sink import DirectoryFigureSink
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 
 @pytest.fixture
@@ -445,3 +453,135 @@ def test_create_temporal_drift_figure_missing_columns() -> None:
         )
         is None
     )
+
+
+def test_column_continuous_section_materialize(dataframe: pl.DataFrame) -> None:
+    section = ColumnContinuousTemporalDriftSection(
+        frame=dataframe, column="col", dt_column="datetime", period="1mo"
+    )
+    html = section.render_html_body()
+    section.materialize()
+    assert section.frame is None
+    assert section.render_html_body() == html
+
+
+def test_column_continuous_section_materialize_render_figures(
+    dataframe: pl.DataFrame, tmp_path: Path
+) -> None:
+    section = ColumnContinuousTemporalDriftSection(
+        frame=dataframe, column="col", dt_column="datetime", period="1mo"
+    )
+    section.materialize()
+    with DirectoryFigureSink(tmp_path, url="figures") as sink, use_figure_sink(sink):
+        html = section.render_html_body()
+    assert 'src="figures/' in html
+
+
+def test_column_continuous_section_materialize_twice(dataframe: pl.DataFrame) -> None:
+    section = ColumnContinuousTemporalDriftSection(
+        frame=dataframe, column="col", dt_column="datetime", period="1mo"
+    )
+    section.materialize()
+    section.materialize()
+    assert isinstance(Template(section.render_html_body()).render(), str)
+
+
+#######################################################
+#    Tests for compute_temporal_drift_histograms     #
+#######################################################
+
+
+def test_compute_temporal_drift_histograms() -> None:
+    counts, edges = compute_temporal_drift_histograms(
+        frame=pl.DataFrame(
+            {
+                "col": [0.0, 1.0, 2.0, None, 3.0],
+                "datetime": [
+                    datetime(year=2020, month=2, day=1, tzinfo=timezone.utc),
+                    datetime(year=2020, month=1, day=1, tzinfo=timezone.utc),
+                    datetime(year=2020, month=2, day=2, tzinfo=timezone.utc),
+                    datetime(year=2020, month=2, day=3, tzinfo=timezone.utc),
+                    datetime(year=2020, month=1, day=2, tzinfo=timezone.utc),
+                ],
+            },
+            schema={"col": pl.Float64, "datetime": pl.Datetime(time_unit="us", time_zone="UTC")},
+        ),
+        column="col",
+        dt_column="datetime",
+        period="1mo",
+        nbins=3,
+    )
+    assert objects_are_equal(
+        counts, {"2020-01": np.array([0, 1, 1]), "2020-02": np.array([1, 0, 1])}
+    )
+    assert objects_are_allclose(edges, np.array([0.0, 1.0, 2.0, 3.0]))
+
+
+def test_compute_temporal_drift_histograms_range(dataframe: pl.DataFrame) -> None:
+    counts, edges = compute_temporal_drift_histograms(
+        frame=dataframe,
+        column="col",
+        dt_column="datetime",
+        period="1mo",
+        nbins=5,
+        xmin=-1.0,
+        xmax=1.0,
+    )
+    assert list(counts) == ["2018-01", "2018-02", "2018-03", "2018-04"]
+    assert objects_are_allclose(edges, np.array([-1.0, -0.6, -0.2, 0.2, 0.6, 1.0]))
+
+
+def test_compute_temporal_drift_histograms_empty() -> None:
+    assert (
+        compute_temporal_drift_histograms(
+            frame=pl.DataFrame(
+                {"col": [], "datetime": []},
+                schema={
+                    "col": pl.Float64,
+                    "datetime": pl.Datetime(time_unit="us", time_zone="UTC"),
+                },
+            ),
+            column="col",
+            dt_column="datetime",
+            period="1mo",
+        )
+        is None
+    )
+
+
+def test_compute_temporal_drift_histograms_missing_column(dataframe: pl.DataFrame) -> None:
+    assert (
+        compute_temporal_drift_histograms(
+            frame=dataframe, column="missing", dt_column="datetime", period="1mo"
+        )
+        is None
+    )
+
+
+##############################################################
+#    Tests for create_temporal_drift_figure_from_counts     #
+##############################################################
+
+
+@pytest.mark.parametrize("num_steps", [2, 3])
+def test_create_temporal_drift_figure_from_counts(num_steps: int) -> None:
+    fig = create_temporal_drift_figure_from_counts(
+        counts={f"2020-0{i + 1}": np.array([i, 1, 2]) for i in range(num_steps)},
+        edges=np.array([0.0, 1.0, 2.0, 3.0]),
+    )
+    assert isinstance(fig, plt.Figure)
+
+
+def test_create_temporal_drift_figure_from_counts_same_as_frame(dataframe: pl.DataFrame) -> None:
+    counts, edges = compute_temporal_drift_histograms(
+        frame=dataframe, column="col", dt_column="datetime", period="1mo"
+    )
+    fig1 = create_temporal_drift_figure_from_counts(counts=counts, edges=edges)
+    fig2 = create_temporal_drift_figure(
+        frame=dataframe, column="col", dt_column="datetime", period="1mo"
+    )
+    assert len(fig1.axes) == len(fig2.axes) == 4
+
+
+def test_create_temporal_drift_figure_from_counts_empty() -> None:
+    assert create_temporal_drift_figure_from_counts(counts={}, edges=np.array([0.0, 1.0])) is None
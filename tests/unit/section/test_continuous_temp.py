@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from typing import TYPE_CHECKING
+from unittest.mock import patch
 
+import numpy as np
 import polars as pl
 import pytest
 from coola import objects_are_equal
@@ -12,9 +15,19 @@ from flamme.section import ColumnTemporalContinuousSection
 from flamme.section.continuous_temp import (
     create_section_template,
     create_temporal_figure,
+    create_temporal_figure_from_stats,
     create_temporal_table,
+    create_temporal_table_from_stats,
     create_temporal_table_row,
 )
+from flamme.utils.boxplot import compute_boxplot_stats
+from flamme.utils.cube import get_temporal_cube
+from flamme.utils.figure import use_figure_sink
+from flamme.utils.figure_sink import DirectoryFigureSink
+from flamme.utils.temporal import compute_temporal_stats
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 
 @pytest.fixture
@@ -232,6 +245,26 @@ def test_column_temporal_continuous_section_render_html_toc_args(
     )
 
 
+def test_column_temporal_continuous_section_base_period(dataframe: pl.DataFrame) -> None:
+    assert (
+        ColumnTemporalContinuousSection(
+            frame=dataframe, column="col", dt_column="datetime", period="1mo", base_period="1d"
+        ).base_period
+        == "1d"
+    )
+
+
+def test_column_temporal_continuous_section_render_html_body_base_period(
+    dataframe: pl.DataFrame,
+) -> None:
+    section = ColumnTemporalContinuousSection(
+        frame=dataframe, column="col", dt_column="datetime", period="1mo", base_period="1d"
+    )
+    with patch("flamme.utils.temporal.get_temporal_cube", wraps=get_temporal_cube) as cube:
+        assert isinstance(Template(section.render_html_body()).render(), str)
+    cube.assert_called_once()
+
+
 #############################################
 #     Tests for create_section_template     #
 #############################################
@@ -288,6 +321,25 @@ def test_create_temporal_figure_figsize(
     )
 
 
+def test_create_temporal_figure_max_fliers() -> None:
+    frame = pl.DataFrame(
+        {
+            "col": np.random.default_rng(42).standard_cauchy(10000),
+            "datetime": pl.datetime_range(
+                datetime(year=2020, month=1, day=1, tzinfo=timezone.utc),
+                datetime(year=2020, month=3, day=31, tzinfo=timezone.utc),
+                interval="1d",
+                eager=True,
+            ).sample(10000, with_replacement=True, seed=42),
+        }
+    )
+    fig = create_temporal_figure(frame=frame, column="col", dt_column="datetime", period="1mo")
+    num_fliers = sum(
+        len(line.get_xdata()) for line in fig.axes[0].lines if line.get_marker() == "o"
+    )
+    assert num_fliers <= 600
+
+
 def test_create_temporal_figure_empty() -> None:
     assert (
         create_temporal_figure(
@@ -306,6 +358,22 @@ def test_create_temporal_figure_empty() -> None:
     )
 
 
+######################################################
+#    Tests for create_temporal_figure_from_stats     #
+######################################################
+
+
+def test_create_temporal_figure_from_stats() -> None:
+    fig = create_temporal_figure_from_stats(
+        stats=[compute_boxplot_stats(np.arange(10)), compute_boxplot_stats(np.arange(5))],
+        steps=["2020-01", "2020-02"],
+        yscale="log",
+        figsize=(7, 3),
+    )
+    assert isinstance(fig, plt.Figure)
+    assert fig.axes[0].get_yscale() == "log"
+
+
 ##########################################
 #    Tests for create_temporal_table     #
 ##########################################
@@ -341,6 +409,26 @@ def test_create_temporal_table_empty() -> None:
     )
 
 
+#####################################################
+#    Tests for create_temporal_table_from_stats     #
+#####################################################
+
+
+def test_create_temporal_table_from_stats(dataframe: pl.DataFrame) -> None:
+    stats = compute_temporal_stats(
+        frame=dataframe, column="col", dt_column="datetime", period="1mo"
+    )
+    assert create_temporal_table_from_stats(stats=stats, column="col") == create_temporal_table(
+        frame=dataframe, column="col", dt_column="datetime", period="1mo"
+    )
+
+
+def test_create_temporal_table_from_stats_none() -> None:
+    assert create_temporal_table_from_stats(stats=None, column="col") == (
+        "<span>&#9888;</span> No table is generated because the column is empty"
+    )
+
+
 ##############################################
 #    Tests for create_temporal_table_row     #
 ##############################################
@@ -396,3 +484,34 @@ def test_create_temporal_table_row_none() -> None:
         ),
         str,
     )
+
+
+def test_column_temporal_continuous_section_materialize(dataframe: pl.DataFrame) -> None:
+    section = ColumnTemporalContinuousSection(
+        frame=dataframe, column="col", dt_column="datetime", period="1mo"
+    )
+    html = section.render_html_body()
+    section.materialize()
+    assert section._frame is None
+    assert section.render_html_body() == html
+
+
+def test_column_temporal_continuous_section_materialize_render_figures(
+    dataframe: pl.DataFrame, tmp_path: Path
+) -> None:
+    section = ColumnTemporalContinuousSection(
+        frame=dataframe, column="col", dt_column="datetime", period="1mo"
+    )
+    section.materialize()
+    with DirectoryFigureSink(tmp_path, url="figures") as sink, use_figure_sink(sink):
+        html = section.render_html_body()
+    assert 'src="figures/' in html
+
+
+def test_column_temporal_continuous_section_materialize_twice(dataframe: pl.DataFrame) -> None:
+    section = ColumnTemporalContinuousSection(
+        frame=dataframe, column="col", dt_column="datetime", period="1mo"
+    )
+    section.materialize()
+    section.materialize()
+    assert isinstance(Template(section.render_html_body()).render(), str)
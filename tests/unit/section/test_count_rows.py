@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from unittest.mock import patch
 
 import matplotlib.pyplot as plt
+import numpy as np
 import polars as pl
 import pytest
 from coola import objects_are_allclose
@@ -13,9 +15,13 @@ from flamme.section import TemporalRowCountSection
 from flamme.section.count_rows import (
     create_section_template,
     create_temporal_count_figure,
+    create_temporal_count_figure_from_counts,
     create_temporal_count_table,
+    create_temporal_count_table_from_counts,
     create_temporal_count_table_row,
 )
+from flamme.utils.count import compute_temporal_count
+from flamme.utils.figure import use_figure_backend
 
 
 @pytest.fixture
@@ -136,6 +142,41 @@ def test_column_temporal_row_count_section_render_html_body(dataframe: pl.DataFr
     assert isinstance(Template(section.render_html_body()).render(), str)
 
 
+def test_column_temporal_row_count_section_render_html_body_svg(dataframe: pl.DataFrame) -> None:
+    section = TemporalRowCountSection(frame=dataframe, dt_column="datetime", period="1mo")
+    with use_figure_backend("svg"):
+        html = section.render_html_body()
+    assert "<svg" in html
+    assert "<img" not in html
+
+
+def test_column_temporal_row_count_section_render_html_body_client(
+    dataframe: pl.DataFrame,
+) -> None:
+    section = TemporalRowCountSection(frame=dataframe, dt_column="datetime", period="1mo")
+    with use_figure_backend("client"):
+        html = section.render_html_body()
+    assert '<div class="flamme-figure"' in html
+    assert "<img" not in html
+
+
+def test_column_temporal_row_count_section_get_figure_data(dataframe: pl.DataFrame) -> None:
+    assert TemporalRowCountSection(
+        frame=dataframe, dt_column="datetime", period="1mo"
+    ).get_figure_data() == {
+        "temporal_count": {
+            "type": "bar",
+            "labels": ["2020-01", "2020-02", "2020-03", "2020-04"],
+            "counts": [3.0, 1.0, 1.0, 1.0],
+            "yscale": "linear",
+            "title": None,
+            "xlabel": None,
+            "ylabel": "number of rows",
+            "ordered": True,
+        }
+    }
+
+
 def test_column_temporal_row_count_section_render_html_body_args(dataframe: pl.DataFrame) -> None:
     section = TemporalRowCountSection(
         frame=dataframe,
@@ -171,6 +212,47 @@ def test_column_temporal_row_count_section_render_html_toc_args(dataframe: pl.Da
     )
 
 
+def test_column_temporal_row_count_section_base_period(dataframe: pl.DataFrame) -> None:
+    assert (
+        TemporalRowCountSection(
+            frame=dataframe, dt_column="datetime", period="1mo", base_period="1d"
+        ).base_period
+        == "1d"
+    )
+
+
+def test_column_temporal_row_count_section_base_period_default(dataframe: pl.DataFrame) -> None:
+    assert (
+        TemporalRowCountSection(frame=dataframe, dt_column="datetime", period="1mo").base_period
+        is None
+    )
+
+
+def test_column_temporal_row_count_section_render_html_body_base_period(
+    dataframe: pl.DataFrame,
+) -> None:
+    assert (
+        TemporalRowCountSection(
+            frame=dataframe, dt_column="datetime", period="1mo", base_period="1d"
+        ).render_html_body()
+        == (
+            TemporalRowCountSection(frame=dataframe, dt_column="datetime", period="1mo")
+        ).render_html_body()
+    )
+
+
+def test_temporal_row_count_section_render_html_body_compute_once(
+    dataframe: pl.DataFrame,
+) -> None:
+    section = TemporalRowCountSection(frame=dataframe, dt_column="datetime", period="1mo")
+    with patch(
+        "flamme.section.count_rows.compute_temporal_count", wraps=compute_temporal_count
+    ) as compute:
+        section.render_html_body()
+        section.render_html_body()
+    compute.assert_called_once()
+
+
 #############################################
 #     Tests for create_section_template     #
 #############################################
@@ -216,6 +298,24 @@ def test_create_temporal_count_figure_missing_column() -> None:
     )
 
 
+#############################################################
+#    Tests for create_temporal_count_figure_from_counts     #
+#############################################################
+
+
+def test_create_temporal_count_figure_from_counts() -> None:
+    assert isinstance(
+        create_temporal_count_figure_from_counts(
+            counts=np.array([3, 1, 1, 1]), labels=["2020-01", "2020-02", "2020-03", "2020-04"]
+        ),
+        plt.Figure,
+    )
+
+
+def test_create_temporal_count_figure_from_counts_empty() -> None:
+    assert create_temporal_count_figure_from_counts(counts=np.array([]), labels=[]) is None
+
+
 ################################################
 #    Tests for create_temporal_count_table     #
 ################################################
@@ -246,6 +346,21 @@ def test_create_temporal_count_table_empty() -> None:
     )
 
 
+############################################################
+#    Tests for create_temporal_count_table_from_counts     #
+############################################################
+
+
+def test_create_temporal_count_table_from_counts(dataframe: pl.DataFrame) -> None:
+    assert create_temporal_count_table_from_counts(
+        counts=np.array([3, 1, 1, 1]), labels=["2020-01", "2020-02", "2020-03", "2020-04"]
+    ) == create_temporal_count_table(frame=dataframe, dt_column="datetime", period="1mo")
+
+
+def test_create_temporal_count_table_from_counts_empty() -> None:
+    assert create_temporal_count_table_from_counts(counts=np.array([]), labels=[]) == ""
+
+
 ####################################################
 #    Tests for create_temporal_count_table_row     #
 ####################################################
@@ -10,10 +10,13 @@ from matplotlib import pyplot as plt
 from flamme.section import ColumnDiscreteSection
 from flamme.section.discrete import (
     create_histogram,
+    create_histogram_figure_data,
     create_histogram_section,
     create_section_template,
     create_table,
 )
+from flamme.utils.count import FrequencyTable
+from flamme.utils.figure import use_figure_backend
 
 ###########################################
 #     Tests for ColumnDiscreteSection     #
@@ -73,6 +76,30 @@ def test_column_discrete_section_get_statistics() -> None:
     )
 
 
+def test_column_discrete_section_get_statistics_frequency_table() -> None:
+    section = ColumnDiscreteSection(
+        counter=FrequencyTable(values=["a", "b", None, "c"], counts=[4, 2, 1, 0]),
+        null_values=1,
+        column="col",
+    )
+    assert objects_are_allclose(
+        section.get_statistics(),
+        {
+            "most_common": [("a", 4), ("b", 2), (None, 1)],
+            "null_values": 1,
+            "nunique": 3,
+            "total": 7,
+        },
+    )
+
+
+def test_column_discrete_section_render_html_body_frequency_table() -> None:
+    section = ColumnDiscreteSection(
+        counter=FrequencyTable(values=["a", "b", None], counts=[4, 2, 1]), column="col"
+    )
+    assert isinstance(Template(section.render_html_body()).render(), str)
+
+
 def test_column_discrete_section_get_statistics_empty_row() -> None:
     section = ColumnDiscreteSection(counter=Counter({"a": 0, "b": 0, "c": 0}), column="col")
     assert objects_are_allclose(
@@ -101,6 +128,45 @@ def test_column_discrete_section_render_html_body_args() -> None:
     )
 
 
+def test_column_discrete_section_get_figure_data() -> None:
+    data = ColumnDiscreteSection(
+        counter=Counter({"a": 4, "b": 2, "c": 6, None: 3, "d": 0}), column="col"
+    ).get_figure_data()
+    assert data == {
+        "histogram": {
+            "type": "bar",
+            "labels": ["c", "a", "b"],
+            "counts": [6.0, 4.0, 2.0],
+            "yscale": "linear",
+            "title": "number of occurrences for each value of col",
+            "xlabel": "values",
+            "ylabel": "number of occurrences",
+            "ordered": False,
+        }
+    }
+
+
+def test_column_discrete_section_get_figure_data_empty() -> None:
+    data = ColumnDiscreteSection(counter=Counter(), column="col").get_figure_data()
+    assert data["histogram"]["counts"] == []
+
+
+def test_column_discrete_section_render_html_body_svg() -> None:
+    section = ColumnDiscreteSection(counter=Counter({"a": 4, "b": 2, "c": 6}), column="col")
+    with use_figure_backend("svg"):
+        html = section.render_html_body()
+    assert "<svg" in html
+    assert "<img" not in html
+
+
+def test_column_discrete_section_render_html_body_client() -> None:
+    section = ColumnDiscreteSection(counter=Counter({"a": 4, "b": 2, "c": 6}), column="col")
+    with use_figure_backend("client"):
+        html = section.render_html_body()
+    assert '<div class="flamme-figure"' in html
+    assert "<img" not in html
+
+
 def test_column_discrete_section_render_html_body_empty() -> None:
     section = ColumnDiscreteSection(counter=Counter({}), column="col")
     assert isinstance(Template(section.render_html_body()).render(), str)
@@ -142,6 +208,15 @@ def test_create_histogram_section_empty() -> None:
     assert isinstance(create_histogram_section(counter=Counter({}), column="col"), str)
 
 
+def test_create_histogram_section_frequency_table() -> None:
+    assert isinstance(
+        create_histogram_section(
+            counter=FrequencyTable(values=["a", None, "c"], counts=[4, 2, 6]), column="col"
+        ),
+        str,
+    )
+
+
 @pytest.mark.parametrize("yscale", ["auto", "linear", "log"])
 def test_create_histogram_section_yscale(yscale: str) -> None:
     assert isinstance(
@@ -183,6 +258,28 @@ def test_create_histogram_empty() -> None:
     assert create_histogram(column="col", names=[], counts=[]) is None
 
 
+##################################################
+#     Tests for create_histogram_figure_data     #
+##################################################
+
+
+def test_create_histogram_figure_data() -> None:
+    data = create_histogram_figure_data(
+        counter=FrequencyTable(values=["a", None, "c"], counts=[4, 2, 6]), column="col"
+    )
+    assert data["labels"] == ["c", "a"]
+    assert data["counts"] == [6.0, 4.0]
+    assert data["title"] == "number of occurrences for each value of col"
+
+
+@pytest.mark.parametrize("yscale", ["linear", "log"])
+def test_create_histogram_figure_data_yscale(yscale: str) -> None:
+    assert (
+        create_histogram_figure_data(counter=Counter({"a": 4, "b": 2}), yscale=yscale)["yscale"]
+        == yscale
+    )
+
+
 ##################################
 #     Tests for create_table     #
 ##################################
@@ -194,3 +291,30 @@ def test_create_table() -> None:
 
 def test_create_table_empty() -> None:
     assert isinstance(create_table(counter=Counter({}), column="col"), str)
+
+
+def test_create_table_approximate() -> None:
+    table = create_table(
+        counter=FrequencyTable(values=["a", "b"], counts=[4, 2], total=10, max_error=2),
+        column="col",
+        max_rows=2,
+    )
+    assert "Head: 2 most common values" in table
+    assert "Tail: least common values" in table
+    assert "least common values are not shown" in table
+    assert "~4" in table
+
+
+def test_column_discrete_section_render_html_body_approximate() -> None:
+    body = ColumnDiscreteSection(
+        counter=FrequencyTable(values=["a", "b"], counts=[4, 2], total=10, max_error=2),
+        column="col",
+    ).render_html_body()
+    assert "number of unique values:</b> &ge;2" in body
+
+
+def test_create_table_frequency_table() -> None:
+    table = create_table(
+        counter=FrequencyTable(values=["a", "b", "c"], counts=[4, 2, 6]), column="col", max_rows=2
+    )
+    assert "Head: 2 most common values" in table
@@ -70,6 +70,11 @@ def test_duplicated_rows_section_get_statistics_columns(dataframe: pl.DataFrame)
     assert objects_are_equal(section.get_statistics(), {"num_rows": 4, "num_unique_rows": 2})
 
 
+def test_duplicated_rows_section_get_statistics_num_unique_rows(dataframe: pl.DataFrame) -> None:
+    section = DuplicatedRowSection(frame=dataframe, num_unique_rows=2)
+    assert objects_are_equal(section.get_statistics(), {"num_rows": 4, "num_unique_rows": 2})
+
+
 def test_duplicated_rows_section_get_statistics_empty_row() -> None:
     section = DuplicatedRowSection(
         frame=pl.DataFrame(
@@ -148,3 +153,21 @@ def test_create_duplicate_table() -> None:
 
 def test_create_duplicate_table_0() -> None:
     assert isinstance(create_duplicate_table(num_rows=0, num_unique_rows=0), str)
+
+
+def test_duplicated_rows_section_materialize(dataframe: pl.DataFrame) -> None:
+    section = DuplicatedRowSection(frame=dataframe)
+    html = section.render_html_body()
+    section.materialize()
+    assert section.frame is None
+    assert repr(section).startswith("DuplicatedRowSection(\n  (frame): (4, 3)")
+    assert objects_are_equal(section.get_statistics(), {"num_rows": 4, "num_unique_rows": 3})
+    assert section.render_html_body() == html
+
+
+def test_duplicated_rows_section_materialize_columns(dataframe: pl.DataFrame) -> None:
+    section = DuplicatedRowSection(frame=dataframe, columns=["col2", "col3"])
+    html = section.render_html_body()
+    section.materialize()
+    section.materialize()
+    assert section.render_html_body() == html
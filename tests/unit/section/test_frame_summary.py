@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+from unittest.mock import patch
+
 import polars as pl
 import pytest
-from coola import objects_are_allclose
+from coola import objects_are_allclose, objects_are_equal
 from jinja2 import Template
 
 from flamme.section import DataFrameSummarySection
 from flamme.section.frame_summary import create_table, create_table_row
+from flamme.utils.count import FrequencyTable, compute_nunique
+from flamme.utils.null import compute_null_count
 
 
 @pytest.fixture
@@ -39,6 +43,11 @@ def test_dataframe_summary_section_top(dataframe: pl.DataFrame, top: int) -> Non
     assert DataFrameSummarySection(dataframe, top=top).top == top
 
 
+@pytest.mark.parametrize("approximate", [True, False])
+def test_dataframe_summary_section_approximate(dataframe: pl.DataFrame, approximate: bool) -> None:
+    assert DataFrameSummarySection(dataframe, approximate=approximate).approximate == approximate
+
+
 def test_dataframe_summary_section_top_incorrect(dataframe: pl.DataFrame) -> None:
     with pytest.raises(ValueError, match=r"Incorrect top value \(-1\). top must be positive"):
         DataFrameSummarySection(dataframe, top=-1)
@@ -68,6 +77,10 @@ def test_dataframe_summary_section_get_nunique_empty() -> None:
     assert DataFrameSummarySection(pl.DataFrame({})).get_nunique() == ()
 
 
+def test_dataframe_summary_section_get_nunique_approximate(dataframe: pl.DataFrame) -> None:
+    assert DataFrameSummarySection(dataframe, approximate=True).get_nunique() == (5, 2, 4)
+
+
 def test_dataframe_summary_section_get_dtypes(dataframe: pl.DataFrame) -> None:
     assert DataFrameSummarySection(dataframe).get_dtypes() == (
         pl.Float64(),
@@ -154,6 +167,24 @@ def test_column_temporal_null_value_section_render_html_body_empty() -> None:
     assert isinstance(Template(section.render_html_body()).render(), str)
 
 
+def test_dataframe_summary_section_render_html_body_approximate(
+    dataframe: pl.DataFrame,
+) -> None:
+    html = Template(
+        DataFrameSummarySection(dataframe, approximate=True).render_html_body()
+    ).render()
+    assert "estimated with HyperLogLog" in html
+    assert "~5 (83.33%)" in html
+
+
+def test_dataframe_summary_section_render_html_body_not_approximate(
+    dataframe: pl.DataFrame,
+) -> None:
+    html = Template(DataFrameSummarySection(dataframe).render_html_body()).render()
+    assert "estimated with HyperLogLog" not in html
+    assert "~5" not in html
+
+
 def test_column_temporal_null_value_section_render_html_toc(dataframe: pl.DataFrame) -> None:
     section = DataFrameSummarySection(dataframe)
     assert isinstance(Template(section.render_html_toc()).render(), str)
@@ -166,6 +197,55 @@ def test_column_temporal_null_value_section_render_html_toc_args(dataframe: pl.D
     )
 
 
+def test_dataframe_summary_section_render_html_body_compute_once(
+    dataframe: pl.DataFrame,
+) -> None:
+    section = DataFrameSummarySection(frame=dataframe)
+    with (
+        patch(
+            "flamme.section.frame_summary.compute_null_count", wraps=compute_null_count
+        ) as null_count,
+        patch("flamme.section.frame_summary.compute_nunique", wraps=compute_nunique) as nunique,
+    ):
+        section.get_statistics()
+        section.render_html_body()
+    null_count.assert_called_once()
+    nunique.assert_called_once()
+
+
+def test_dataframe_summary_section_precomputed(dataframe: pl.DataFrame) -> None:
+    section = DataFrameSummarySection(frame=dataframe, null_count=[1, 0, 2], nunique=[5, 2, 4])
+    with (
+        patch(
+            "flamme.section.frame_summary.compute_null_count", wraps=compute_null_count
+        ) as null_count,
+        patch("flamme.section.frame_summary.compute_nunique", wraps=compute_nunique) as nunique,
+    ):
+        assert section.get_null_count() == (1, 0, 2)
+        assert section.get_nunique() == (5, 2, 4)
+    null_count.assert_not_called()
+    nunique.assert_not_called()
+
+
+def test_dataframe_summary_section_precomputed_schema_only(dataframe: pl.DataFrame) -> None:
+    section = DataFrameSummarySection(
+        frame=pl.DataFrame(schema=dataframe.schema),
+        top=1,
+        null_count=[1, 0, 2],
+        nunique=[5, 2, 4],
+        num_rows=6,
+        most_frequent_values=[[(2.2, 2)], [(1, 5)], [("B", 2)]],
+    )
+    assert section.get_statistics() == {
+        "columns": ("float", "int", "str"),
+        "null_count": (1, 0, 2),
+        "nunique": (5, 2, 4),
+        "dtypes": (pl.Float64(), pl.Int64(), pl.String()),
+    }
+    assert section.get_most_frequent_values(top=1) == (((2.2, 2),), ((1, 5),), (("B", 2),))
+    assert "number of rows: 6<" in section.render_html_body()
+
+
 ##################################
 #     Tests for create_table     #
 ##################################
@@ -222,6 +302,31 @@ def test_create_table_row() -> None:
     )
 
 
+def test_create_table_row_approximate() -> None:
+    row = create_table_row(
+        column="col",
+        null=5,
+        nunique=42,
+        dtype=pl.Float64(),
+        most_frequent_values=[("C", 12), ("A", 5), ("B", 4)],
+        total=100,
+        approximate=True,
+    )
+    assert "~42 (42.00%)" in row
+
+
+def test_create_table_row_frequency_table() -> None:
+    row = create_table_row(
+        column="col",
+        null=5,
+        nunique=42,
+        dtype=pl.Float64(),
+        most_frequent_values=FrequencyTable(values=["A", "B", "C"], counts=[5, 4, 12]),
+        total=100,
+    )
+    assert "C (12.00%), A (5.00%), B (4.00%)" in row
+
+
 def test_create_table_row_empty() -> None:
     assert isinstance(
         create_table_row(
@@ -234,3 +339,15 @@ def test_create_table_row_empty() -> None:
         ),
         str,
     )
+
+
+def test_dataframe_summary_section_materialize(dataframe: pl.DataFrame) -> None:
+    section = DataFrameSummarySection(frame=dataframe, top=2)
+    stats = section.get_statistics()
+    values = section.get_most_frequent_values(top=2)
+    html = section.render_html_body()
+    section.materialize()
+    assert section.frame is None
+    assert objects_are_equal(section.get_statistics(), stats)
+    assert objects_are_equal(section.get_most_frequent_values(top=2), values)
+    assert section.render_html_body() == html
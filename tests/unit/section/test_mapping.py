@@ -1,12 +1,28 @@
 from __future__ import annotations
 
+import re
+import zipfile
+from collections import Counter
+from typing import TYPE_CHECKING
 from unittest.mock import Mock
 
+import polars as pl
 import pytest
 from coola import objects_are_allclose
 from jinja2 import Template
 
-from flamme.section import BaseSection, SectionDict
+from flamme.section import (
+    BaseSection,
+    ColumnDiscreteSection,
+    ContentSection,
+    DuplicatedRowSection,
+    SectionDict,
+)
+from flamme.utils.figure import use_figure_backend, use_figure_sink
+from flamme.utils.figure_sink import ArchiveFigureSink, DirectoryFigureSink
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 
 @pytest.fixture
@@ -126,6 +142,38 @@ def test_capacity_distribution_section_render_html_body_args(
     )
 
 
+@pytest.mark.parametrize("max_toc_depth", [0, 1, 2])
+@pytest.mark.parametrize("tags", [(), ("meow",)])
+def test_section_dict_iter_html_body(max_toc_depth: int, tags: tuple[str, ...]) -> None:
+    frame = pl.DataFrame({"float": [1.2, 4.2, None, 2.2], "int": [None, 1, 0, 1]})
+    section = SectionDict(
+        {
+            "content": ContentSection("meow"),
+            "nested": SectionDict(
+                {"content": ContentSection("bark"), "duplicate": DuplicatedRowSection(frame)},
+                max_toc_depth=max_toc_depth,
+            ),
+            "empty": SectionDict({}, max_toc_depth=0),
+        },
+        max_toc_depth=max_toc_depth,
+    )
+    fragments = list(section.iter_html_body(number="1.", tags=tags, depth=1))
+    assert len(fragments) > 4
+    assert "\n".join(fragments) == section.render_html_body(number="1.", tags=tags, depth=1)
+
+
+def test_section_dict_iter_html_body_empty() -> None:
+    section = SectionDict({}, max_toc_depth=0)
+    assert list(section.iter_html_body()) == [""]
+
+
+def test_section_dict_iter_html_body_executor_process() -> None:
+    sections = {"content": ContentSection("meow"), "other": ContentSection("bark")}
+    assert list(SectionDict(sections, executor="process").iter_html_body()) == list(
+        SectionDict(sections).iter_html_body()
+    )
+
+
 def test_capacity_distribution_section_render_html_toc(sections: dict) -> None:
     section = SectionDict(sections)
     assert isinstance(Template(section.render_html_toc()).render(), str)
@@ -156,3 +204,117 @@ def test_capacity_distribution_section_render_html_toc_empty_toc() -> None:
         }
     )
     assert isinstance(Template(section.render_html_toc()).render(), str)
+
+
+@pytest.mark.parametrize("max_workers", [None, 1, 2])
+def test_section_dict_render_html_body_executor_process(max_workers: int | None) -> None:
+    frame = pl.DataFrame(
+        {"float": [1.2, 4.2, None, 2.2], "int": [None, 1, 0, 1]},
+        schema={"float": pl.Float64, "int": pl.Int64},
+    )
+    sections = {
+        "content": ContentSection("meow"),
+        "duplicate": DuplicatedRowSection(frame),
+        "nested": SectionDict(
+            {"content": ContentSection("bark"), "duplicate": DuplicatedRowSection(frame)},
+            executor="process",
+        ),
+    }
+    assert SectionDict(
+        sections, max_toc_depth=2, executor="process", max_workers=max_workers
+    ).render_html_body(number="1.", tags=["meow"], depth=1) == SectionDict(
+        sections, max_toc_depth=2
+    ).render_html_body(
+        number="1.", tags=["meow"], depth=1
+    )
+
+
+def test_section_dict_render_html_body_executor_process_single_section() -> None:
+    section = SectionDict({"content": ContentSection("meow")}, executor="process")
+    assert (
+        section.render_html_body()
+        == SectionDict({"content": ContentSection("meow")}).render_html_body()
+    )
+
+
+def test_section_dict_render_html_body_executor_process_figure_backend() -> None:
+    sections = {
+        "discrete1": ColumnDiscreteSection(counter=Counter({"a": 4, "b": 2}), column="col1"),
+        "discrete2": ColumnDiscreteSection(counter=Counter({"c": 1, "d": 5}), column="col2"),
+    }
+    with use_figure_backend("svg"):
+        body = SectionDict(sections, executor="process", max_workers=2).render_html_body()
+        assert body == SectionDict(sections).render_html_body()
+    assert "<svg" in body
+
+
+def test_section_dict_render_html_body_executor_process_directory_sink(tmp_path: Path) -> None:
+    sections = {
+        "discrete1": ColumnDiscreteSection(counter=Counter({"a": 4, "b": 2}), column="col1"),
+        "discrete2": ColumnDiscreteSection(counter=Counter({"c": 1, "d": 5}), column="col2"),
+    }
+    path = tmp_path.joinpath("figures")
+    with DirectoryFigureSink(path) as sink, use_figure_sink(sink):
+        body = SectionDict(sections, executor="process", max_workers=2).render_html_body()
+    srcs = re.findall(r'src="(figures/[^"]+)"', body)
+    assert len(srcs) == 2
+    assert all(tmp_path.joinpath(src).is_file() for src in srcs)
+
+
+def test_section_dict_render_html_body_executor_process_archive_sink(tmp_path: Path) -> None:
+    sections = {
+        "discrete1": ColumnDiscreteSection(counter=Counter({"a": 4, "b": 2}), column="col1"),
+        "discrete2": ColumnDiscreteSection(counter=Counter({"c": 1, "d": 5}), column="col2"),
+    }
+    path = tmp_path.joinpath("figures.zip")
+    with ArchiveFigureSink(path) as sink, use_figure_sink(sink):
+        body = SectionDict(sections, executor="process", max_workers=2).render_html_body()
+    srcs = re.findall(r'src="(figures/[^"]+)"', body)
+    assert len(srcs) == 2
+    with zipfile.ZipFile(path) as archive:
+        assert sorted(archive.namelist()) == sorted(srcs)
+    assert [file.name for file in tmp_path.iterdir()] == ["figures.zip"]
+
+
+def test_section_dict_executor_incorrect() -> None:
+    with pytest.raises(ValueError, match=r"Incorrect executor: thread\."):
+        SectionDict({}, executor="thread")
+
+
+def test_section_dict_get_figure_data() -> None:
+    section = SectionDict(
+        {
+            "discrete": ColumnDiscreteSection(counter={"a": 4, "b": 2}, column="col"),
+            "nested": SectionDict(
+                {
+                    "content": ContentSection("meow"),
+                    "discrete": ColumnDiscreteSection(counter={"c": 6}, column="col"),
+                }
+            ),
+        }
+    )
+    data = section.get_figure_data()
+    assert list(data) == ["discrete/histogram", "nested/discrete/histogram"]
+    assert data["discrete/histogram"]["counts"] == [4.0, 2.0]
+    assert data["nested/discrete/histogram"]["counts"] == [6.0]
+
+
+def test_section_dict_get_figure_data_empty() -> None:
+    assert SectionDict({"content": ContentSection("meow")}).get_figure_data() == {}
+
+
+def test_section_dict_materialize() -> None:
+    frame = pl.DataFrame({"col1": [1, 2, 2], "col2": [1, 2, 2]})
+    section = SectionDict(
+        {
+            "duplicate": DuplicatedRowSection(frame),
+            "nested": SectionDict({"duplicate": DuplicatedRowSection(frame)}),
+        }
+    )
+    section.materialize()
+    assert section.sections["duplicate"].frame is None
+    assert section.sections["nested"].sections["duplicate"].frame is None
+    assert section.get_statistics() == {
+        "duplicate": {"num_rows": 3, "num_unique_rows": 2},
+        "nested": {"duplicate": {"num_rows": 3, "num_unique_rows": 2}},
+    }
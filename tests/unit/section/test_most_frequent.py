@@ -11,6 +11,7 @@ from flamme.section.most_frequent import (
     create_section_template,
     create_table_row,
 )
+from flamme.utils.count import FrequencyTable
 
 ###############################################
 #     Tests for MostFrequentValuesSection     #
@@ -38,6 +39,13 @@ def test_most_frequent_values_section_get_statistics_top2() -> None:
     assert objects_are_allclose(section.get_statistics(), {"most_common": [("c", 6), ("a", 4)]})
 
 
+def test_most_frequent_values_section_get_statistics_frequency_table() -> None:
+    section = MostFrequentValuesSection(
+        counter=FrequencyTable(values=["a", "b", "c"], counts=[4, 2, 6]), column="col", top=2
+    )
+    assert objects_are_allclose(section.get_statistics(), {"most_common": [("c", 6), ("a", 4)]})
+
+
 def test_most_frequent_values_section_get_statistics_empty_column() -> None:
     section = MostFrequentValuesSection(counter=Counter({}), column="col")
     assert objects_are_allclose(section.get_statistics(), {"most_common": []})
@@ -100,6 +108,59 @@ def test_create_frequent_values_table_empty() -> None:
     assert isinstance(create_frequent_values_table(Counter({})), str)
 
 
+def test_create_frequent_values_table_frequency_table() -> None:
+    table = create_frequent_values_table(
+        FrequencyTable(values=["a", "b", "c", "d"], counts=[4, 2, 6, 8]), top=2
+    )
+    assert table.index("<th>d</th>") < table.index("<th>c</th>")
+    assert "<th>a</th>" not in table
+    assert "70.00" in table
+
+
+def test_create_frequent_values_table_frequency_table_reverse_true() -> None:
+    table = create_frequent_values_table(
+        FrequencyTable(values=["a", "b", "c", "d"], counts=[4, 2, 6, 8]), top=2, reverse=True
+    )
+    assert table.index("<th>b</th>") < table.index("<th>a</th>")
+    assert "<th>c</th>" not in table
+    assert "30.00" in table
+
+
+def test_create_frequent_values_table_approximate() -> None:
+    table = create_frequent_values_table(
+        FrequencyTable(values=["a", "b"], counts=[4, 2], total=10, max_error=2), top=2
+    )
+    assert "overestimated by up to 2 occurrences" in table
+    assert "~4" in table
+    assert "~40.00" in table
+
+
+def test_create_frequent_values_table_approximate_reverse_true() -> None:
+    table = create_frequent_values_table(
+        FrequencyTable(values=["a", "b"], counts=[4, 2], total=10, max_error=2),
+        top=2,
+        reverse=True,
+    )
+    assert "least common values are not shown" in table
+    assert "<th>a</th>" not in table
+
+
+def test_create_frequent_values_table_exact() -> None:
+    table = create_frequent_values_table(
+        FrequencyTable(values=["a", "b"], counts=[4, 2], total=10), top=2
+    )
+    assert "overestimated" not in table
+    assert "~" not in table
+
+
+def test_create_frequent_values_table_other_count() -> None:
+    table = create_frequent_values_table(
+        FrequencyTable(values=["a", "b"], counts=[4, 2], total=10), top=2
+    )
+    assert "40.00" in table
+    assert "60.00" in table
+
+
 ######################################
 #     Tests for create_table_row     #
 ######################################
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from typing import TYPE_CHECKING
+from unittest.mock import patch
 
 import matplotlib.pyplot as plt
+import numpy as np
 import polars as pl
 import pytest
 from coola import objects_are_allclose
@@ -13,9 +16,17 @@ from flamme.section import TemporalNullValueSection
 from flamme.section.null_temp import (
     create_section_template,
     create_temporal_null_figure,
+    create_temporal_null_figure_from_counts,
     create_temporal_null_table,
+    create_temporal_null_table_from_counts,
     create_temporal_null_table_row,
 )
+from flamme.utils.figure import use_figure_backend, use_figure_sink
+from flamme.utils.figure_sink import DirectoryFigureSink
+from flamme.utils.null import compute_temporal_null_count
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 
 @pytest.fixture
@@ -153,6 +164,51 @@ def test_temporal_null_value_section_render_html_body(dataframe: pl.DataFrame) -
     assert isinstance(Template(section.render_html_body()).render(), str)
 
 
+def test_temporal_null_value_section_render_html_body_svg(dataframe: pl.DataFrame) -> None:
+    section = TemporalNullValueSection(
+        frame=dataframe, columns=["col1", "col2"], dt_column="datetime", period="1mo"
+    )
+    with use_figure_backend("svg"):
+        html = section.render_html_body()
+    assert "<svg" in html
+    assert "<img" not in html
+
+
+def test_temporal_null_value_section_render_html_body_client(dataframe: pl.DataFrame) -> None:
+    section = TemporalNullValueSection(
+        frame=dataframe, columns=["col1", "col2"], dt_column="datetime", period="1mo"
+    )
+    with use_figure_backend("client"):
+        html = section.render_html_body()
+    assert '<div class="flamme-figure"' in html
+    assert "<img" not in html
+
+
+def test_temporal_null_value_section_get_figure_data(dataframe: pl.DataFrame) -> None:
+    assert TemporalNullValueSection(
+        frame=dataframe, columns=["col1", "col2"], dt_column="datetime", period="1mo"
+    ).get_figure_data() == {
+        "temporal_null": {
+            "type": "null_temporal",
+            "nulls": [2.0, 0.0, 0.0, 1.0],
+            "totals": [2.0, 2.0, 2.0, 2.0],
+            "labels": ["2020-01", "2020-02", "2020-03", "2020-04"],
+            "title": None,
+        }
+    }
+
+
+def test_temporal_null_value_section_get_figure_data_materialize(
+    dataframe: pl.DataFrame,
+) -> None:
+    section = TemporalNullValueSection(
+        frame=dataframe, columns=["col1", "col2"], dt_column="datetime", period="1mo"
+    )
+    data = section.get_figure_data()
+    section.materialize()
+    assert section.get_figure_data() == data
+
+
 def test_temporal_null_value_section_render_html_body_args(dataframe: pl.DataFrame) -> None:
     section = TemporalNullValueSection(
         frame=dataframe, columns=["col1", "col2"], dt_column="datetime", period="1mo"
@@ -190,6 +246,50 @@ def test_temporal_null_value_section_render_html_toc_args(dataframe: pl.DataFram
     )
 
 
+def test_temporal_null_value_section_base_period(dataframe: pl.DataFrame) -> None:
+    assert (
+        TemporalNullValueSection(
+            frame=dataframe,
+            columns=["col1", "col2"],
+            dt_column="datetime",
+            period="1mo",
+            base_period="1d",
+        ).base_period
+        == "1d"
+    )
+
+
+def test_temporal_null_value_section_render_html_body_base_period(
+    dataframe: pl.DataFrame,
+) -> None:
+    assert TemporalNullValueSection(
+        frame=dataframe,
+        columns=["col1", "col2"],
+        dt_column="datetime",
+        period="1mo",
+        base_period="1d",
+    ).render_html_body() == (
+        TemporalNullValueSection(
+            frame=dataframe, columns=["col1", "col2"], dt_column="datetime", period="1mo"
+        ).render_html_body()
+    )
+
+
+def test_temporal_null_value_section_render_html_body_compute_once(
+    dataframe: pl.DataFrame,
+) -> None:
+    section = TemporalNullValueSection(
+        frame=dataframe, columns=["col1", "col2"], dt_column="datetime", period="1mo"
+    )
+    with patch(
+        "flamme.section.null_temp.compute_temporal_null_count",
+        wraps=compute_temporal_null_count,
+    ) as compute:
+        section.render_html_body()
+        section.render_html_body()
+    compute.assert_called_once()
+
+
 #############################################
 #     Tests for create_section_template     #
 #############################################
@@ -225,6 +325,27 @@ def test_create_temporal_null_figure_empty(dataframe_empty: pl.DataFrame) -> Non
     )
 
 
+############################################################
+#    Tests for create_temporal_null_figure_from_counts     #
+############################################################
+
+
+def test_create_temporal_null_figure_from_counts() -> None:
+    assert isinstance(
+        create_temporal_null_figure_from_counts(
+            nulls=np.array([1, 0, 2]), totals=np.array([4, 2, 4]), labels=["a", "b", "c"]
+        ),
+        plt.Figure,
+    )
+
+
+def test_create_temporal_null_figure_from_counts_empty() -> None:
+    assert (
+        create_temporal_null_figure_from_counts(nulls=np.array([]), totals=np.array([]), labels=[])
+        is None
+    )
+
+
 ###############################################
 #    Tests for create_temporal_null_table     #
 ###############################################
@@ -251,6 +372,29 @@ def test_create_temporal_null_table_empty(dataframe_empty: pl.DataFrame) -> None
     )
 
 
+###########################################################
+#    Tests for create_temporal_null_table_from_counts     #
+###########################################################
+
+
+def test_create_temporal_null_table_from_counts(dataframe: pl.DataFrame) -> None:
+    nulls, totals, labels = compute_temporal_null_count(
+        frame=dataframe, columns=["col1", "col2"], dt_column="datetime", period="1mo"
+    )
+    assert create_temporal_null_table_from_counts(
+        nulls=nulls, totals=totals, labels=labels
+    ) == create_temporal_null_table(
+        frame=dataframe, columns=["col1", "col2"], dt_column="datetime", period="1mo"
+    )
+
+
+def test_create_temporal_null_table_from_counts_empty() -> None:
+    assert (
+        create_temporal_null_table_from_counts(nulls=np.array([]), totals=np.array([]), labels=[])
+        == ""
+    )
+
+
 ###################################################
 #    Tests for create_temporal_null_table_row     #
 ###################################################
@@ -258,3 +402,34 @@ def test_create_temporal_null_table_empty(dataframe_empty: pl.DataFrame) -> None
 
 def test_create_temporal_null_table_row() -> None:
     assert isinstance(create_temporal_null_table_row(label="meow", num_nulls=5, total=42), str)
+
+
+def test_temporal_null_value_section_materialize(dataframe: pl.DataFrame) -> None:
+    section = TemporalNullValueSection(
+        frame=dataframe, columns=["col1", "col2"], dt_column="datetime", period="1mo"
+    )
+    html = section.render_html_body()
+    section.materialize()
+    assert section.frame is None
+    assert section.render_html_body() == html
+
+
+def test_temporal_null_value_section_materialize_render_figures(
+    dataframe: pl.DataFrame, tmp_path: Path
+) -> None:
+    section = TemporalNullValueSection(
+        frame=dataframe, columns=["col1", "col2"], dt_column="datetime", period="1mo"
+    )
+    section.materialize()
+    with DirectoryFigureSink(tmp_path, url="figures") as sink, use_figure_sink(sink):
+        html = section.render_html_body()
+    assert 'src="figures/' in html
+
+
+def test_temporal_null_value_section_materialize_twice(dataframe: pl.DataFrame) -> None:
+    section = TemporalNullValueSection(
+        frame=dataframe, columns=["col1", "col2"], dt_column="datetime", period="1mo"
+    )
+    section.materialize()
+    section.materialize()
+    assert isinstance(Template(section.render_html_body()).render(), str)
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from typing import TYPE_CHECKING
+from unittest.mock import patch
 
+import numpy as np
 import polars as pl
 import pytest
 from coola import objects_are_allclose, objects_are_equal
@@ -13,12 +16,25 @@ from flamme.section.null_temp_col import (
     add_column_to_figure,
     create_section_template,
     create_table_section,
+    create_table_section_from_counts,
     create_temporal_null_figure,
+    create_temporal_null_figure_from_counts,
     create_temporal_null_figures,
+    create_temporal_null_figures_from_counts,
+    create_temporal_null_heatmap,
+    create_temporal_null_heatmap_from_counts,
     create_temporal_null_table,
+    create_temporal_null_table_from_counts,
     create_temporal_null_table_row,
     split_figures_by_column,
 )
+from flamme.utils.cache import enable_computation_cache
+from flamme.utils.figure import MISSING_FIGURE_MESSAGE, use_figure_backend, use_figure_sink
+from flamme.utils.figure_sink import DirectoryFigureSink
+from flamme.utils.null import compute_temporal_null_matrix
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 
 @pytest.fixture
@@ -260,6 +276,136 @@ def test_column_temporal_null_value_section_render_html_toc_args(
     )
 
 
+def test_column_temporal_null_value_section_base_period(dataframe: pl.DataFrame) -> None:
+    assert (
+        ColumnTemporalNullValueSection(
+            frame=dataframe,
+            columns=["float", "int", "str"],
+            dt_column="datetime",
+            period="1mo",
+            base_period="1d",
+        ).base_period
+        == "1d"
+    )
+
+
+def test_column_temporal_null_value_section_render_html_body_base_period(
+    dataframe: pl.DataFrame,
+) -> None:
+    assert ColumnTemporalNullValueSection(
+        frame=dataframe,
+        columns=["float", "int", "str"],
+        dt_column="datetime",
+        period="1mo",
+        base_period="1d",
+    ).render_html_body() == (
+        ColumnTemporalNullValueSection(
+            frame=dataframe, columns=["float", "int", "str"], dt_column="datetime", period="1mo"
+        ).render_html_body()
+    )
+
+
+def test_column_temporal_null_value_section_mode_default(dataframe: pl.DataFrame) -> None:
+    section = ColumnTemporalNullValueSection(
+        frame=dataframe, columns=["float", "int", "str"], dt_column="datetime", period="1mo"
+    )
+    assert section.mode == "grid"
+    assert not section.cluster
+
+
+def test_column_temporal_null_value_section_mode_heatmap(dataframe: pl.DataFrame) -> None:
+    section = ColumnTemporalNullValueSection(
+        frame=dataframe,
+        columns=["float", "int", "str"],
+        dt_column="datetime",
+        period="1mo",
+        mode="heatmap",
+        cluster=True,
+    )
+    assert section.mode == "heatmap"
+    assert section.cluster
+
+
+def test_column_temporal_null_value_section_mode_incorrect(dataframe: pl.DataFrame) -> None:
+    with pytest.raises(ValueError, match="Incorrect mode: bar"):
+        ColumnTemporalNullValueSection(
+            frame=dataframe,
+            columns=["float", "int", "str"],
+            dt_column="datetime",
+            period="1mo",
+            mode="bar",
+        )
+
+
+@pytest.mark.parametrize("cluster", [True, False])
+def test_column_temporal_null_value_section_render_html_body_heatmap(
+    dataframe: pl.DataFrame, cluster: bool
+) -> None:
+    section = ColumnTemporalNullValueSection(
+        frame=dataframe,
+        columns=["float", "int", "str"],
+        dt_column="datetime",
+        period="1mo",
+        mode="heatmap",
+        cluster=cluster,
+    )
+    with patch("flamme.section.null_temp_col.create_temporal_null_figures") as create_figures:
+        html = section.render_html_body()
+    assert isinstance(Template(html).render(), str)
+    assert html.count("<img") == 1
+    create_figures.assert_not_called()
+
+
+def test_column_temporal_null_value_section_render_html_body_heatmap_cluster_cache(
+    dataframe: pl.DataFrame,
+) -> None:
+    section = ColumnTemporalNullValueSection(
+        frame=dataframe,
+        columns=["float", "int", "str"],
+        dt_column="datetime",
+        period="1mo",
+        mode="heatmap",
+        cluster=True,
+    )
+    with enable_computation_cache():
+        html = section.render_html_body()
+    assert isinstance(Template(html).render(), str)
+    assert html.count("<img") == 1
+
+
+@pytest.mark.parametrize("mode", ["grid", "heatmap"])
+def test_column_temporal_null_value_section_render_html_body_single_count(
+    dataframe: pl.DataFrame, mode: str
+) -> None:
+    section = ColumnTemporalNullValueSection(
+        frame=dataframe,
+        columns=["float", "int", "str"],
+        dt_column="datetime",
+        period="1mo",
+        mode=mode,
+    )
+    with patch(
+        "flamme.section.null_temp_col.compute_temporal_null_matrix",
+        wraps=compute_temporal_null_matrix,
+    ) as compute:
+        section.render_html_body()
+    compute.assert_called_once()
+
+
+def test_column_temporal_null_value_section_materialize_heatmap(dataframe: pl.DataFrame) -> None:
+    section = ColumnTemporalNullValueSection(
+        frame=dataframe,
+        columns=["float", "int", "str"],
+        dt_column="datetime",
+        period="1mo",
+        mode="heatmap",
+    )
+    html = section.render_html_body()
+    section.materialize()
+    assert section.frame is None
+    assert section.render_html_body() == html
+
+
 #############################################
 #     Tests for create_section_template     #
 #############################################
@@ -300,6 +446,31 @@ def test_create_temporal_null_figure_ncols(dataframe: pl.DataFrame, ncols: int)
     )
 
 
+#############################################################
+#     Tests for create_temporal_null_figure_from_counts     #
+#############################################################
+
+
+def test_create_temporal_null_figure_from_counts() -> None:
+    figure = create_temporal_null_figure_from_counts(
+        columns=["col1", "col2"],
+        nulls=np.array([[0, 1, 2], [1, 1, 0]]),
+        totals=np.array([5, 5, 5]),
+        labels=["2020-01", "2020-02", "2020-03"],
+        ncols=1,
+    )
+    assert figure.count("<img") == 2
+
+
+def test_create_temporal_null_figure_from_counts_empty() -> None:
+    assert (
+        create_temporal_null_figure_from_counts(
+            columns=["col"], nulls=np.zeros((1, 0)), totals=np.array([]), labels=[]
+        )
+        == MISSING_FIGURE_MESSAGE
+    )
+
+
 ##################################################
 #     Tests for create_temporal_null_figures     #
 ##################################################
@@ -327,6 +498,57 @@ def test_create_temporal_null_figures_subset(dataframe: pl.DataFrame) -> None:
     assert len(figures) == 2
 
 
+def test_create_temporal_null_figures_single_count(dataframe: pl.DataFrame) -> None:
+    with patch(
+        "flamme.section.null_temp_col.compute_temporal_null_matrix",
+        wraps=compute_temporal_null_matrix,
+    ) as compute:
+        figures = create_temporal_null_figures(
+            frame=dataframe,
+            columns=["float", "int", "str"],
+            dt_column="datetime",
+            period="1mo",
+        )
+    assert len(figures) == 3
+    compute.assert_called_once()
+
+
+def test_create_temporal_null_figures_svg(dataframe: pl.DataFrame) -> None:
+    with use_figure_backend("svg"):
+        figures = create_temporal_null_figures(
+            frame=dataframe,
+            columns=["float", "int", "str"],
+            dt_column="datetime",
+            period="1mo",
+        )
+    assert len(figures) == 3
+    assert all(figure.startswith("<svg") for figure in figures)
+    assert "column: int" in figures[1]
+
+
+def test_create_temporal_null_figures_client(dataframe: pl.DataFrame) -> None:
+    with use_figure_backend("client"):
+        figures = create_temporal_null_figures(
+            frame=dataframe,
+            columns=["float", "int", "str"],
+            dt_column="datetime",
+            period="1mo",
+        )
+    assert len(figures) == 3
+    assert all(figure.startswith('<div class="flamme-figure"') for figure in figures)
+
+
+def test_create_temporal_null_figures_base_period(dataframe: pl.DataFrame) -> None:
+    figures = create_temporal_null_figures(
+        frame=dataframe,
+        columns=["float", "int", "str"],
+        dt_column="datetime",
+        period="1mo",
+        base_period="1d",
+    )
+    assert len(figures) == 3
+
+
 def test_create_temporal_null_figures_empty() -> None:
     assert (
         create_temporal_null_figures(
@@ -351,6 +573,123 @@ def test_create_temporal_null_figures_empty_rows(dataframe_empty: pl.DataFrame)
     )
 
 
+##############################################################
+#     Tests for create_temporal_null_figures_from_counts     #
+##############################################################
+
+
+def test_create_temporal_null_figures_from_counts() -> None:
+    figures = create_temporal_null_figures_from_counts(
+        columns=["col1", "col2"],
+        nulls=np.array([[0, 1, 2], [1, 1, 0]]),
+        totals=np.array([5, 5, 5]),
+        labels=["2020-01", "2020-02", "2020-03"],
+    )
+    assert len(figures) == 2
+
+
+def test_create_temporal_null_figures_from_counts_empty() -> None:
+    assert (
+        create_temporal_null_figures_from_counts(
+            columns=["col"], nulls=np.zeros((1, 0)), totals=np.array([]), labels=[]
+        )
+        == []
+    )
+
+
+##################################################
+#     Tests for create_temporal_null_heatmap     #
+##################################################
+
+
+@pytest.mark.parametrize("cluster", [True, False])
+def test_create_temporal_null_heatmap(dataframe: pl.DataFrame, cluster: bool) -> None:
+    figure = create_temporal_null_heatmap(
+        frame=dataframe,
+        columns=["float", "int", "str"],
+        dt_column="datetime",
+        period="1mo",
+        cluster=cluster,
+    )
+    assert isinstance(figure, str)
+    assert figure.count("<img") == 1
+
+
+def test_create_temporal_null_heatmap_single_count(dataframe: pl.DataFrame) -> None:
+    with patch(
+        "flamme.section.null_temp_col.compute_temporal_null_matrix",
+        wraps=compute_temporal_null_matrix,
+    ) as compute:
+        create_temporal_null_heatmap(
+            frame=dataframe,
+            columns=["float", "int", "str"],
+            dt_column="datetime",
+            period="1mo",
+            cluster=True,
+        )
+    compute.assert_called_once()
+
+
+def test_create_temporal_null_heatmap_base_period(dataframe: pl.DataFrame) -> None:
+    assert isinstance(
+        create_temporal_null_heatmap(
+            frame=dataframe,
+            columns=["float", "int", "str"],
+            dt_column="datetime",
+            period="1mo",
+            base_period="1d",
+        ),
+        str,
+    )
+
+
+def test_create_temporal_null_heatmap_empty_columns(dataframe: pl.DataFrame) -> None:
+    assert (
+        create_temporal_null_heatmap(
+            frame=dataframe, columns=[], dt_column="datetime", period="1mo"
+        )
+        == MISSING_FIGURE_MESSAGE
+    )
+
+
+def test_create_temporal_null_heatmap_empty_rows(dataframe_empty: pl.DataFrame) -> None:
+    assert (
+        create_temporal_null_heatmap(
+            frame=dataframe_empty,
+            columns=["float", "int", "str"],
+            dt_column="datetime",
+            period="1mo",
+        )
+        == MISSING_FIGURE_MESSAGE
+    )
+
+
+##############################################################
+#     Tests for create_temporal_null_heatmap_from_counts     #
+##############################################################
+
+
+@pytest.mark.parametrize("cluster", [True, False])
+def test_create_temporal_null_heatmap_from_counts(cluster: bool) -> None:
+    figure = create_temporal_null_heatmap_from_counts(
+        columns=["col1", "col2"],
+        nulls=np.array([[0, 1, 2], [1, 1, 0]]),
+        totals=np.array([5, 5, 5]),
+        labels=["2020-01", "2020-02", "2020-03"],
+        cluster=cluster,
+    )
+    assert figure.count("<img") == 1
+
+
+def test_create_temporal_null_heatmap_from_counts_empty() -> None:
+    assert (
+        create_temporal_null_heatmap_from_counts(
+            columns=["col"], nulls=np.zeros((1, 0)), totals=np.array([]), labels=[]
+        )
+        == MISSING_FIGURE_MESSAGE
+    )
+
+
 ##########################################
 #     Tests for add_column_to_figure     #
 ##########################################
@@ -440,6 +779,21 @@ def test_create_table_section(dataframe: pl.DataFrame) -> None:
     )
 
 
+def test_create_table_section_single_count(dataframe: pl.DataFrame) -> None:
+    with patch(
+        "flamme.section.null_temp_col.compute_temporal_null_matrix",
+        wraps=compute_temporal_null_matrix,
+    ) as compute:
+        table = create_table_section(
+            frame=dataframe,
+            columns=["float", "int", "str"],
+            dt_column="datetime",
+            period="1mo",
+        )
+    assert table.count("column: ") == 3
+    compute.assert_called_once()
+
+
 def test_create_table_section_empty(dataframe_empty: pl.DataFrame) -> None:
     assert (
         create_table_section(
@@ -452,6 +806,41 @@ def test_create_table_section_empty(dataframe_empty: pl.DataFrame) -> None:
     )
 
 
+#####################################################
+#    Tests for create_table_section_from_counts     #
+#####################################################
+
+
+def test_create_table_section_from_counts() -> None:
+    table = create_table_section_from_counts(
+        columns=["col1", "col2"],
+        nulls=np.array([[0, 1, 2], [1, 1, 0]]),
+        totals=np.array([5, 5, 5]),
+        labels=["2020-01", "2020-02", "2020-03"],
+    )
+    assert table.count("column: ") == 2
+
+
+def test_create_table_section_from_counts_same_as_frame(dataframe: pl.DataFrame) -> None:
+    nulls, totals, labels = compute_temporal_null_matrix(
+        frame=dataframe, columns=["float", "int"], dt_column="datetime", period="1mo"
+    )
+    assert create_table_section_from_counts(
+        columns=["float", "int"], nulls=nulls, totals=totals, labels=labels
+    ) == create_table_section(
+        frame=dataframe, columns=["float", "int"], dt_column="datetime", period="1mo"
+    )
+
+
+def test_create_table_section_from_counts_empty() -> None:
+    assert (
+        create_table_section_from_counts(
+            columns=["col"], nulls=np.zeros((1, 0)), totals=np.array([]), labels=[]
+        )
+        == ""
+    )
+
+
 ###############################################
 #    Tests for create_temporal_null_table     #
 ###############################################
@@ -481,10 +870,120 @@ def test_create_temporal_null_table_empty(dataframe_empty: pl.DataFrame) -> None
     )
 
 
+###########################################################
+#    Tests for create_temporal_null_table_from_counts     #
+###########################################################
+
+
+def test_create_temporal_null_table_from_counts() -> None:
+    table = create_temporal_null_table_from_counts(
+        column="col",
+        nulls=np.array([0, 1, 2]),
+        totals=np.array([5, 5, 5]),
+        labels=["2020-01", "2020-02", "2020-03"],
+    )
+    assert "column: col" in table
+    assert table.count("<th>2020-") == 3
+
+
+def test_create_temporal_null_table_from_counts_same_as_frame(dataframe: pl.DataFrame) -> None:
+    nulls, totals, labels = compute_temporal_null_matrix(
+        frame=dataframe, columns=["int"], dt_column="datetime", period="1mo"
+    )
+    assert create_temporal_null_table_from_counts(
+        column="int", nulls=nulls[0], totals=totals, labels=labels
+    ) == create_temporal_null_table(
+        frame=dataframe, column="int", dt_column="datetime", period="1mo"
+    )
+
+
+def test_create_temporal_null_table_from_counts_empty() -> None:
+    assert isinstance(
+        create_temporal_null_table_from_counts(
+            column="col", nulls=np.array([]), totals=np.array([]), labels=[]
+        ),
+        str,
+    )
+
+
 ###################################################
 #    Tests for create_temporal_null_table_row     #
 ###################################################
 
 
 def test_create_temporal_null_table_row() -> None:
-    assert isinstance(create_temporal_null_table_row(label="meow", null=5, total=42), str)
+    assert create_temporal_null_table_row(label="meow", null=5, total=42) == (
+        "<tr>\n"
+        "    <th>meow</th>\n"
+        '    <td style="text-align: right;">5</td>\n'
+        '    <td style="text-align: right;">37</td>\n'
+        '    <td style="text-align: right;">42</td>\n'
+        '    <td style="text-align: right;">11.90%</td>\n'
+        '    <td style="text-align: right;">88.10%</td>\n'
+        "</tr>"
+    )
+
+
+def test_column_temporal_null_value_section_materialize(dataframe: pl.DataFrame) -> None:
+    section = ColumnTemporalNullValueSection(
+        frame=dataframe, columns=["float", "int", "str"], dt_column="datetime", period="1mo"
+    )
+    html = section.render_html_body()
+    section.materialize()
+    assert section.frame is None
+    assert section.render_html_body() == html
+
+
+def test_column_temporal_null_value_section_materialize_render_figures(
+    dataframe: pl.DataFrame, tmp_path: Path
+) -> None:
+    section = ColumnTemporalNullValueSection(
+        frame=dataframe, columns=["float", "int", "str"], dt_column="datetime", period="1mo"
+    )
+    section.materialize()
+    with DirectoryFigureSink(tmp_path, url="figures") as sink, use_figure_sink(sink):
+        html = section.render_html_body()
+    assert 'src="figures/' in html
+
+
+def test_column_temporal_null_value_section_materialize_twice(dataframe: pl.DataFrame) -> None:
+    section = ColumnTemporalNullValueSection(
+        frame=dataframe, columns=["float", "int", "str"], dt_column="datetime", period="1mo"
+    )
+    section.materialize()
+    section.materialize()
+    assert isinstance(Template(section.render_html_body()).render(), str)
+
+
+def test_column_temporal_null_value_section_get_figure_data(dataframe: pl.DataFrame) -> None:
+    data = ColumnTemporalNullValueSection(
+        frame=dataframe, columns=["float", "int"], dt_column="datetime", period="1mo"
+    ).get_figure_data()
+    assert data == {
+        "float": {
+            "type": "null_temporal",
+            "nulls": [0.0, 0.0, 1.0, 0.0],
+            "totals": [1.0, 1.0, 1.0, 1.0],
+            "labels": ["2020-01", "2020-02", "2020-03", "2020-04"],
+            "title": "column: float",
+        },
+        "int": {
+            "type": "null_temporal",
+            "nulls": [1.0, 0.0, 0.0, 0.0],
+            "totals": [1.0, 1.0, 1.0, 1.0],
+            "labels": ["2020-01", "2020-02", "2020-03", "2020-04"],
+            "title": "column: int",
+        },
+    }
+
+
+def test_column_temporal_null_value_section_get_figure_data_materialize(
+    dataframe: pl.DataFrame,
+) -> None:
+    section = ColumnTemporalNullValueSection(
+        frame=dataframe, columns=["float", "int", "str"], dt_column="datetime", period="1mo"
+    )
+    data = section.get_figure_data()
+    section.materialize()
+    assert section.frame is None
+    assert objects_are_equal(section.get_figure_data(), data)
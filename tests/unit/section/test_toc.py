@@ -5,7 +5,11 @@ import pytest
 from coola import objects_are_equal
 from jinja2 import Template
 
-from flamme.section import DuplicatedRowSection, TableOfContentSection
+from flamme.section import (
+    ColumnDiscreteSection,
+    DuplicatedRowSection,
+    TableOfContentSection,
+)
 
 
 @pytest.fixture
@@ -89,6 +93,13 @@ def test_table_of_content_section_render_html_body_args(
     )
 
 
+def test_table_of_content_section_iter_html_body(dataframe: pl.DataFrame) -> None:
+    section = TableOfContentSection(DuplicatedRowSection(frame=dataframe))
+    assert "\n".join(
+        section.iter_html_body(number="1.", tags=["meow"], depth=1)
+    ) == section.render_html_body(number="1.", tags=["meow"], depth=1)
+
+
 def test_table_of_content_section_render_html_toc(dataframe: pl.DataFrame) -> None:
     section = TableOfContentSection(DuplicatedRowSection(frame=dataframe))
     assert isinstance(Template(section.render_html_toc()).render(), str)
@@ -101,3 +112,22 @@ def test_table_of_content_section_render_html_toc_args(
     assert isinstance(
         Template(section.render_html_toc(number="1.", tags=["meow"], depth=1)).render(), str
     )
+
+
+def test_table_of_content_section_materialize(dataframe: pl.DataFrame) -> None:
+    inner = DuplicatedRowSection(frame=dataframe)
+    section = TableOfContentSection(inner)
+    section.materialize()
+    assert inner.frame is None
+    assert section.get_statistics() == {"num_rows": 4, "num_unique_rows": 3}
+
+
+def test_table_of_content_section_get_figure_data() -> None:
+    inner = ColumnDiscreteSection(counter={"a": 4, "b": 2}, column="col")
+    assert objects_are_equal(
+        TableOfContentSection(inner).get_figure_data(), inner.get_figure_data()
+    )
+
+
+def test_table_of_content_section_get_figure_data_empty(dataframe: pl.DataFrame) -> None:
+    assert TableOfContentSection(DuplicatedRowSection(frame=dataframe)).get_figure_data() == {}
@@ -1,6 +1,15 @@
 from __future__ import annotations
 
-from flamme.section.utils import render_html_toc, tags2id, tags2title, valid_h_tag
+from jinja2 import Template
+
+from flamme.section.utils import (
+    get_template,
+    render_html_toc,
+    render_table_rows,
+    tags2id,
+    tags2title,
+    valid_h_tag,
+)
 
 #############################
 #     Tests for tags2id     #
@@ -83,3 +92,60 @@ def test_render_html_toc_tags_without_number() -> None:
 
 def test_render_html_toc_max_depth() -> None:
     assert render_html_toc(depth=2, max_depth=2) == ""
+
+
+##################################
+#     Tests for get_template     #
+##################################
+
+
+def test_get_template() -> None:
+    assert get_template("<p>{{value}}</p>").render({"value": 42}) == "<p>42</p>"
+
+
+def test_get_template_cached() -> None:
+    assert get_template("<p>{{value}}</p>") is get_template("<p>{{value}}</p>")
+
+
+def test_get_template_same_as_template() -> None:
+    source = "<p>\n  {{value}}\n</p>\n"
+    assert get_template(source).render({"value": "<b>"}) == Template(source).render(
+        {"value": "<b>"}
+    )
+
+
+#######################################
+#     Tests for render_table_rows     #
+#######################################
+
+
+def test_render_table_rows() -> None:
+    assert render_table_rows(
+        "<tr><th>{{label}}</th><td {{style}}>{{count}}</td></tr>",
+        columns={"label": ["a", "b", "c"], "count": [1, 2, 3]},
+        style='class="num"',
+    ) == (
+        '<tr><th>a</th><td class="num">1</td></tr>\n'
+        '<tr><th>b</th><td class="num">2</td></tr>\n'
+        '<tr><th>c</th><td class="num">3</td></tr>'
+    )
+
+
+def test_render_table_rows_same_as_template() -> None:
+    row = "<tr>\n    <th>{{label}}</th>\n    <td>{{count}}</td>\n</tr>"
+    labels, counts = ["a", "b"], ["1,000", "2"]
+    assert render_table_rows(row, columns={"label": labels, "count": counts}) == "\n".join(
+        Template(row).render({"label": label, "count": count})
+        for label, count in zip(labels, counts)
+    )
+
+
+def test_render_table_rows_1_column() -> None:
+    assert (
+        render_table_rows("<li>{{value}}</li>", columns={"value": ["a", "b"]})
+        == "<li>a</li>\n<li>b</li>"
+    )
+
+
+def test_render_table_rows_empty() -> None:
+    assert render_table_rows("<li>{{value}}</li>", columns={"value": []}) == ""
@@ -4,7 +4,135 @@ import numpy as np
 import pytest
 from coola import objects_are_equal
 
-from flamme.utils.array import filter_range, nonnan, rand_replace
+from flamme.utils.array import (
+    SortedArray,
+    filter_range,
+    nonnan,
+    rand_replace,
+    to_sorted_array,
+)
+
+#################################
+#     Tests for SortedArray     #
+#################################
+
+
+def test_sorted_array_repr() -> None:
+    assert repr(SortedArray(np.arange(10))) == "SortedArray(size=10, dtype=int64)"
+
+
+@pytest.mark.parametrize("dtype", [np.int64, np.float32, np.float64])
+def test_sorted_array_values(dtype: np.dtype) -> None:
+    array = SortedArray(np.array([5, 1, 4, 2, 3], dtype=dtype))
+    assert objects_are_equal(array.values, np.array([1, 2, 3, 4, 5], dtype=dtype))
+    assert array.dtype == dtype
+    assert array.size == 5
+    assert len(array) == 5
+
+
+def test_sorted_array_values_nan() -> None:
+    array = SortedArray(np.array([[5.0, float("nan")], [1.0, 3.0]]))
+    assert objects_are_equal(array.values, np.array([1.0, 3.0, 5.0]))
+
+
+def test_sorted_array_values_only_nans() -> None:
+    assert SortedArray(np.array([float("nan"), float("nan")])).size == 0
+
+
+def test_sorted_array_values_readonly() -> None:
+    array = SortedArray(np.array([5, 1, 4]))
+    with pytest.raises(ValueError, match="read-only"):
+        array.values[0] = 1
+
+
+def test_sorted_array_empty() -> None:
+    array = SortedArray(np.array([]))
+    assert array.size == 0
+    assert np.isnan(array.min())
+    assert np.isnan(array.max())
+    assert np.isnan(array.quantile(0.5))
+    assert array.nunique() == 0
+    assert array.count() == 0
+
+
+def test_sorted_array_count() -> None:
+    array = SortedArray(np.array([-2, -1, 0, 0, 1, 2, 3]))
+    assert array.count() == 7
+    assert array.count(lower=1) == 3
+    assert array.count(upper=-1) == 2
+    assert array.count(lower=0, upper=0) == 2
+    assert array.count(lower=5, upper=0) == 0
+
+
+def test_sorted_array_filter_range() -> None:
+    array = SortedArray(np.arange(10, dtype=np.float64))
+    out = array.filter_range(xmin=1.5, xmax=5)
+    assert isinstance(out, SortedArray)
+    assert objects_are_equal(out.values, np.array([2.0, 3.0, 4.0, 5.0]))
+    assert np.shares_memory(out.values, array.values)
+
+
+def test_sorted_array_filter_range_empty() -> None:
+    assert SortedArray(np.arange(10)).filter_range(xmin=5, xmax=1).size == 0
+
+
+@pytest.mark.parametrize("bins", [None, 1, 3, 10, 50])
+@pytest.mark.parametrize("range_", [None, (-1.0, 1.0), (0.5, 0.5)])
+def test_sorted_array_histogram_same_as_numpy(
+    bins: int | None, range_: tuple[float, float] | None
+) -> None:
+    values = np.random.default_rng(42).normal(size=1000)
+    counts, edges = SortedArray(values).histogram(bins=bins, range=range_)
+    expected_counts, expected_edges = np.histogram(values, bins=bins or 10, range=range_)
+    assert objects_are_equal(counts, expected_counts)
+    assert objects_are_equal(edges, expected_edges)
+
+
+def test_sorted_array_histogram_int() -> None:
+    values = np.array([1, 1, 2, 5, 5, 5])
+    counts, edges = SortedArray(values).histogram(bins=4)
+    expected_counts, expected_edges = np.histogram(values, bins=4)
+    assert objects_are_equal(counts, expected_counts)
+    assert objects_are_equal(edges, expected_edges)
+
+
+def test_sorted_array_histogram_empty() -> None:
+    counts, edges = SortedArray(np.array([])).histogram(bins=2)
+    assert objects_are_equal(counts, np.array([0, 0]))
+    assert objects_are_equal(edges, np.array([0.0, 0.5, 1.0]))
+
+
+def test_sorted_array_min_max() -> None:
+    array = SortedArray(np.array([5.0, -1.0, float("nan"), 3.0]))
+    assert array.min() == -1.0
+    assert array.max() == 5.0
+
+
+def test_sorted_array_nunique() -> None:
+    assert SortedArray(np.array([5, 1, 3, 1, 5, 5])).nunique() == 3
+
+
+def test_sorted_array_quantile_same_as_numpy() -> None:
+    values = np.random.default_rng(42).normal(size=1001)
+    q = np.linspace(0.0, 1.0, 101)
+    assert objects_are_equal(SortedArray(values).quantile(q), np.quantile(values, q))
+
+
+def test_sorted_array_quantile_int() -> None:
+    assert objects_are_equal(
+        SortedArray(np.arange(101)).quantile([0.001, 0.5, 0.999]), np.array([0.1, 50.0, 99.9])
+    )
+
+
+def test_sorted_array_quantile_scalar() -> None:
+    assert SortedArray(np.arange(11)).quantile(0.25) == 2.5
+
+
+def test_sorted_array_quantile_single_value() -> None:
+    assert objects_are_equal(
+        SortedArray(np.array([4.2])).quantile([0.0, 0.5, 1.0]), np.full(3, 4.2)
+    )
+
 
 ##################################
 #     Tests for filter_range     #
@@ -30,6 +158,12 @@ def test_filter_range_empty() -> None:
     assert np.array_equal(filter_range(np.array([]), xmin=1, xmax=5), np.array([]))
 
 
+def test_filter_range_sorted_array() -> None:
+    assert np.array_equal(
+        filter_range(SortedArray(np.array([9, 1, 5, 3, 7])), xmin=2, xmax=7), np.array([3, 5, 7])
+    )
+
+
 ############################
 #     Tests for nonnan     #
 ############################
@@ -76,3 +210,19 @@ def test_rand_replace_different_seeds() -> None:
         rand_replace(np.arange(100), value=-1, prob=0.4, rng=np.random.default_rng(1)),
         rand_replace(np.arange(100), value=-1, prob=0.4, rng=np.random.default_rng(2)),
     )
+
+
+#####################################
+#     Tests for to_sorted_array     #
+#####################################
+
+
+def test_to_sorted_array_array() -> None:
+    array = to_sorted_array(np.array([3, 1, 2]))
+    assert isinstance(array, SortedArray)
+    assert objects_are_equal(array.values, np.array([1, 2, 3]))
+
+
+def test_to_sorted_array_sorted_array() -> None:
+    array = SortedArray(np.array([3, 1, 2]))
+    assert to_sorted_array(array) is array
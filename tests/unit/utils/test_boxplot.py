@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import numpy as np
+import polars as pl
+import pytest
+from coola import objects_are_allclose, objects_are_equal
+from matplotlib import cbook
+
+from flamme.utils.array import SortedArray
+from flamme.utils.boxplot import (
+    compute_boxplot_stats,
+    compute_temporal_boxplot_stats,
+    get_boxplot_stats_expression,
+)
+
+STATS = ["mean", "med", "q1", "q3", "cilo", "cihi", "whislo", "whishi"]
+
+
+@pytest.fixture
+def dataframe() -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "col": [1.2, 4.2, None, 0.0, 100.0, 1.0, 4.2, 42.0, float("nan")],
+            "datetime": [
+                datetime(year=2020, month=1, day=3, tzinfo=timezone.utc),
+                datetime(year=2020, month=1, day=4, tzinfo=timezone.utc),
+                datetime(year=2020, month=1, day=5, tzinfo=timezone.utc),
+                datetime(year=2020, month=1, day=6, tzinfo=timezone.utc),
+                datetime(year=2020, month=1, day=7, tzinfo=timezone.utc),
+                datetime(year=2020, month=2, day=3, tzinfo=timezone.utc),
+                datetime(year=2020, month=3, day=3, tzinfo=timezone.utc),
+                datetime(year=2020, month=4, day=3, tzinfo=timezone.utc),
+                datetime(year=2020, month=5, day=3, tzinfo=timezone.utc),
+            ],
+        },
+        schema={
+            "col": pl.Float64,
+            "datetime": pl.Datetime(time_unit="us", time_zone="UTC"),
+        },
+    )
+
+
+def assert_same_as_matplotlib(stats: dict, values: np.ndarray) -> None:
+    expected = cbook.boxplot_stats(values)[0]
+    assert objects_are_allclose(
+        {k: float(stats[k]) for k in STATS}, {k: float(expected[k]) for k in STATS}
+    )
+    assert objects_are_allclose(np.sort(stats["fliers"]), np.sort(expected["fliers"]).astype(float))
+
+
+###########################################
+#     Tests for compute_boxplot_stats     #
+###########################################
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        np.random.default_rng(42).standard_cauchy(1000),
+        np.random.default_rng(42).standard_normal(50),
+        np.random.default_rng(42).integers(0, 10, 100),
+        np.array([1.0, 2.0, 3.0, 4.0, 100.0]),
+        np.array([1.0]),
+    ],
+)
+@pytest.mark.parametrize("wrapper", [np.asarray, SortedArray, pl.Series])
+def test_compute_boxplot_stats_same_as_matplotlib(values: np.ndarray, wrapper: type) -> None:
+    assert_same_as_matplotlib(compute_boxplot_stats(wrapper(values), max_fliers=10000), values)
+
+
+@pytest.mark.parametrize("wrapper", [np.asarray, SortedArray, pl.Series])
+def test_compute_boxplot_stats_nan(wrapper: type) -> None:
+    stats = compute_boxplot_stats(wrapper(np.array([1.0, 2.0, np.nan, 3.0, 4.0, 100.0])))
+    assert_same_as_matplotlib(stats, np.array([1.0, 2.0, 3.0, 4.0, 100.0]))
+
+
+def test_compute_boxplot_stats_null() -> None:
+    stats = compute_boxplot_stats(pl.Series([1.0, 2.0, None, 3.0, 4.0, 100.0]))
+    assert_same_as_matplotlib(stats, np.array([1.0, 2.0, 3.0, 4.0, 100.0]))
+
+
+@pytest.mark.parametrize("wrapper", [np.asarray, SortedArray])
+def test_compute_boxplot_stats_empty(wrapper: type) -> None:
+    stats = compute_boxplot_stats(wrapper(np.array([])))
+    assert all(np.isnan(stats[k]) for k in STATS)
+    assert objects_are_equal(stats["fliers"], np.array([], dtype=np.float64))
+
+
+@pytest.mark.parametrize("wrapper", [np.asarray, SortedArray, pl.Series])
+def test_compute_boxplot_stats_max_fliers(wrapper: type) -> None:
+    values = np.concatenate([np.full(100, 5.0), np.arange(-20.0, 0.0), np.arange(11.0, 31.0)])
+    fliers = compute_boxplot_stats(wrapper(values), max_fliers=4)["fliers"]
+    assert objects_are_equal(fliers, np.array([-20.0, -15.0, -10.0, -5.0, 30.0, 25.0, 20.0, 15.0]))
+
+
+def test_compute_boxplot_stats_max_fliers_sorted_array() -> None:
+    values = np.random.default_rng(42).standard_cauchy(10000)
+    assert objects_are_equal(
+        compute_boxplot_stats(values, max_fliers=10)["fliers"],
+        compute_boxplot_stats(SortedArray(values), max_fliers=10)["fliers"],
+    )
+
+
+####################################################
+#     Tests for compute_temporal_boxplot_stats     #
+####################################################
+
+
+def test_compute_temporal_boxplot_stats(dataframe: pl.DataFrame) -> None:
+    stats, steps = compute_temporal_boxplot_stats(
+        dataframe, column="col", dt_column="datetime", period="1mo"
+    )
+    assert steps == ["2020-01", "2020-02", "2020-03", "2020-04", "2020-05"]
+    assert len(stats) == 5
+    assert_same_as_matplotlib(stats[0], np.array([1.2, 4.2, 0.0, 100.0]))
+    assert_same_as_matplotlib(stats[1], np.array([1.0]))
+    assert_same_as_matplotlib(stats[3], np.array([42.0]))
+    assert all(np.isnan(stats[4][k]) for k in STATS)
+    assert stats[4]["fliers"].size == 0
+
+
+def test_compute_temporal_boxplot_stats_unsorted(dataframe: pl.DataFrame) -> None:
+    stats, steps = compute_temporal_boxplot_stats(
+        dataframe.reverse(), column="col", dt_column="datetime", period="1mo"
+    )
+    assert steps == ["2020-01", "2020-02", "2020-03", "2020-04", "2020-05"]
+    assert_same_as_matplotlib(stats[0], np.array([1.2, 4.2, 0.0, 100.0]))
+
+
+def test_compute_temporal_boxplot_stats_max_fliers() -> None:
+    frame = pl.DataFrame(
+        {
+            "col": np.random.default_rng(42).standard_cauchy(10000),
+            "datetime": pl.datetime_range(
+                datetime(year=2020, month=1, day=1, tzinfo=timezone.utc),
+                datetime(year=2020, month=3, day=31, tzinfo=timezone.utc),
+                interval="1d",
+                eager=True,
+            ).sample(10000, with_replacement=True, seed=42),
+        }
+    )
+    stats, _ = compute_temporal_boxplot_stats(
+        frame, column="col", dt_column="datetime", period="1mo", max_fliers=3
+    )
+    assert [s["fliers"].size for s in stats] == [6, 6, 6]
+
+
+def test_compute_temporal_boxplot_stats_empty() -> None:
+    assert compute_temporal_boxplot_stats(
+        pl.DataFrame(
+            {"col": [], "datetime": []},
+            schema={"col": pl.Float64, "datetime": pl.Datetime(time_unit="us", time_zone="UTC")},
+        ),
+        column="col",
+        dt_column="datetime",
+        period="1mo",
+    ) == ([], [])
+
+
+##################################################
+#     Tests for get_boxplot_stats_expression     #
+##################################################
+
+
+def test_get_boxplot_stats_expression(dataframe: pl.DataFrame) -> None:
+    stats = dataframe.select(get_boxplot_stats_expression("col")).item()
+    assert stats["med"] == 4.2
+    assert stats["fliers"] == [100.0]
+
+
+def test_get_boxplot_stats_expression_expr(dataframe: pl.DataFrame) -> None:
+    stats = dataframe.select(get_boxplot_stats_expression(pl.col("col") * 2)).item()
+    assert stats["med"] == 8.4
+
+
+def test_get_boxplot_stats_expression_int() -> None:
+    stats = pl.DataFrame({"col": [1, 2, 3, 4, 100]}).select(get_boxplot_stats_expression("col"))
+    assert stats.item()["whishi"] == 4.0
+
+
+def test_get_boxplot_stats_expression_group_by(dataframe: pl.DataFrame) -> None:
+    stats = (
+        dataframe.with_columns(group=pl.col("datetime").dt.month() == 1)
+        .group_by("group")
+        .agg(get_boxplot_stats_expression("col").alias("stats"))
+        .sort("group")
+    )
+    assert [s["med"] for s in stats["stats"]] == [4.2, 2.7]
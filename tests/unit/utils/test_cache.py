@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import gc
+from collections import Counter
+from unittest.mock import Mock
+
+import numpy as np
+import polars as pl
+import pytest
+from coola import objects_are_equal
+
+from flamme.utils.cache import (
+    ComputationCache,
+    enable_computation_cache,
+    frame_cache,
+    get_computation_cache,
+)
+from flamme.utils.null import compute_null_count
+
+
+@pytest.fixture
+def frame() -> pl.DataFrame:
+    return pl.DataFrame({"col1": [1, None, 3], "col2": [None, None, 1]})
+
+
+@frame_cache
+def compute_sum(frame: pl.DataFrame, columns: list[str], scale: int = 1) -> int:
+    return sum(frame[col].sum() for col in columns) * scale
+
+
+######################################
+#     Tests for ComputationCache     #
+######################################
+
+
+def test_computation_cache_repr() -> None:
+    assert repr(ComputationCache()).startswith("ComputationCache(")
+
+
+def test_computation_cache_max_bytes() -> None:
+    assert ComputationCache(max_bytes=1024).max_bytes == 1024
+
+
+def test_computation_cache_get_or_compute(frame: pl.DataFrame) -> None:
+    cache = ComputationCache()
+    fn = Mock(return_value=42)
+    assert cache.get_or_compute(frame, "op", (), fn) == 42
+    assert cache.get_or_compute(frame, "op", (), fn) == 42
+    fn.assert_called_once()
+    assert cache.hits == 1
+    assert cache.misses == 1
+    assert len(cache) == 1
+
+
+def test_computation_cache_get_or_compute_different_keys(frame: pl.DataFrame) -> None:
+    cache = ComputationCache()
+    assert cache.get_or_compute(frame, "op", ("a",), lambda: 1) == 1
+    assert cache.get_or_compute(frame, "op", ("b",), lambda: 2) == 2
+    assert cache.get_or_compute(frame, "op2", ("a",), lambda: 3) == 3
+    assert cache.get_or_compute(frame.clone(), "op", ("a",), lambda: 4) == 4
+    assert cache.misses == 4
+    assert cache.hits == 0
+
+
+def test_computation_cache_get_or_compute_readonly(frame: pl.DataFrame) -> None:
+    cache = ComputationCache()
+    value = np.arange(3)
+    array = cache.get_or_compute(frame, "op", (), lambda: value)
+    assert not array.flags.writeable
+    assert value.flags.writeable
+    assert not cache.get_or_compute(frame, "op", (), lambda: value).flags.writeable
+
+
+def test_computation_cache_get_or_compute_copy_dict(frame: pl.DataFrame) -> None:
+    cache = ComputationCache()
+    counter = cache.get_or_compute(frame, "op", (), lambda: Counter({"a": 1}))
+    counter["b"] += 2
+    out = cache.get_or_compute(frame, "op", (), lambda: Counter())
+    assert isinstance(out, Counter)
+    assert out == Counter({"a": 1})
+
+
+def test_computation_cache_lru_eviction(frame: pl.DataFrame) -> None:
+    cache = ComputationCache(max_bytes=200)
+    cache.get_or_compute(frame, "op", (1,), lambda: np.zeros(10))  # 80 bytes
+    cache.get_or_compute(frame, "op", (2,), lambda: np.zeros(10))
+    cache.get_or_compute(frame, "op", (1,), lambda: np.zeros(10))  # mark as recently used
+    cache.get_or_compute(frame, "op", (3,), lambda: np.zeros(10))
+    assert len(cache) == 2
+    assert cache.num_bytes == 160
+    fn = Mock(return_value=np.zeros(10))
+    cache.get_or_compute(frame, "op", (1,), fn)
+    fn.assert_not_called()
+    cache.get_or_compute(frame, "op", (2,), fn)
+    fn.assert_called_once()
+
+
+def test_computation_cache_too_large(frame: pl.DataFrame) -> None:
+    cache = ComputationCache(max_bytes=10)
+    array = cache.get_or_compute(frame, "op", (), lambda: np.zeros(10))
+    assert array.flags.writeable
+    assert len(cache) == 0
+    assert cache.num_bytes == 0
+
+
+def test_computation_cache_remove_frame() -> None:
+    cache = ComputationCache()
+    frame = pl.DataFrame({"col": [1, 2, 3]})
+    cache.get_or_compute(frame, "op", (), lambda: np.zeros(10))
+    assert len(cache) == 1
+    del frame
+    gc.collect()
+    assert len(cache) == 0
+    assert cache.num_bytes == 0
+
+
+def test_computation_cache_clear(frame: pl.DataFrame) -> None:
+    cache = ComputationCache()
+    cache.get_or_compute(frame, "op", (), lambda: 1)
+    cache.get_or_compute(frame, "op", (), lambda: 1)
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.num_bytes == 0
+    assert cache.hits == 0
+    assert cache.misses == 0
+
+
+##############################################
+#     Tests for enable_computation_cache     #
+##############################################
+
+
+def test_enable_computation_cache() -> None:
+    assert get_computation_cache() is None
+    with enable_computation_cache() as cache:
+        assert get_computation_cache() is cache
+    assert get_computation_cache() is None
+
+
+def test_enable_computation_cache_with_cache() -> None:
+    cache = ComputationCache()
+    with enable_computation_cache(cache) as active:
+        assert active is cache
+
+
+def test_enable_computation_cache_nested() -> None:
+    with enable_computation_cache() as cache1:
+        with enable_computation_cache() as cache2:
+            assert get_computation_cache() is cache2
+        assert get_computation_cache() is cache1
+
+
+def test_enable_computation_cache_compute_null_count(frame: pl.DataFrame) -> None:
+    with enable_computation_cache() as cache:
+        assert objects_are_equal(compute_null_count(frame), np.array([1, 2]))
+        assert objects_are_equal(compute_null_count(frame), np.array([1, 2]))
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+#################################
+#     Tests for frame_cache     #
+#################################
+
+
+def test_frame_cache_without_cache(frame: pl.DataFrame) -> None:
+    assert compute_sum(frame, ["col1", "col2"]) == 5
+
+
+def test_frame_cache(frame: pl.DataFrame) -> None:
+    with enable_computation_cache() as cache:
+        assert compute_sum(frame, ["col1", "col2"]) == 5
+        assert compute_sum(frame, columns=["col1", "col2"], scale=1) == 5
+        assert compute_sum(frame, ["col1", "col2"], scale=2) == 10
+        assert compute_sum(frame, ["col1"]) == 4
+    assert cache.hits == 1
+    assert cache.misses == 3
+
+
+def test_frame_cache_not_frame() -> None:
+    @frame_cache
+    def compute_total(array: np.ndarray) -> int:
+        return array.sum().item()
+
+    with enable_computation_cache() as cache:
+        assert compute_total(np.array([1, 2, 3])) == 6
+    assert cache.hits == 0
+    assert cache.misses == 0
+    assert len(cache) == 0
@@ -1,15 +1,235 @@
+from collections import Counter
 from datetime import datetime, timezone
 
 import numpy as np
 import polars as pl
 import pytest
-from coola import objects_are_equal
+from coola import objects_are_allclose, objects_are_equal
 
 from flamme.utils.count import (
+    FrequencyTable,
+    compute_frequency_table,
+    compute_most_frequent_values,
     compute_nunique,
     compute_temporal_count,
     compute_temporal_value_counts,
+    compute_value_counts,
+    estimate_nunique,
+    to_frequency_table,
 )
+from flamme.utils.sketch import SpaceSaving
+
+####################################
+#     Tests for FrequencyTable     #
+####################################
+
+
+def test_frequency_table_repr() -> None:
+    assert repr(FrequencyTable(values=["a"], counts=[1])).startswith("FrequencyTable(")
+
+
+def test_frequency_table_sorted() -> None:
+    table = FrequencyTable(values=["a", "b", "c", "d"], counts=[4, 2, 6, 2])
+    assert table.values.to_list() == ["c", "a", "b", "d"]
+    assert objects_are_equal(table.counts, np.array([6, 4, 2, 2]))
+    assert len(table) == 4
+    assert table.total == 14
+
+
+def test_frequency_table_counts_readonly() -> None:
+    table = FrequencyTable(values=["a", "b"], counts=[4, 2])
+    with pytest.raises(ValueError, match="read-only"):
+        table.counts[0] = 1
+
+
+def test_frequency_table_series() -> None:
+    table = FrequencyTable(values=pl.Series([1, 2, None]), counts=np.array([1, 5, 2]))
+    assert table.values.dtype == pl.Int64
+    assert table.most_common() == [(2, 5), (None, 2), (1, 1)]
+
+
+def test_frequency_table_mixed_types() -> None:
+    table = FrequencyTable(values=["a", 1, None], counts=[1, 3, 2])
+    assert table.most_common() == [(1, 3), (None, 2), ("a", 1)]
+    assert table.null_count == 2
+
+
+def test_frequency_table_empty() -> None:
+    table = FrequencyTable(values=[], counts=[])
+    assert len(table) == 0
+    assert table.total == 0
+    assert table.null_count == 0
+    assert table.other_count == 0
+    assert table.most_common() == []
+    assert objects_are_equal(table.percentages(), np.array([], dtype=np.float64))
+
+
+def test_frequency_table_incorrect_length() -> None:
+    with pytest.raises(ValueError, match="values and counts must have the same length"):
+        FrequencyTable(values=["a", "b"], counts=[1])
+
+
+def test_frequency_table_incorrect_total() -> None:
+    with pytest.raises(ValueError, match="total must be greater or equal to the sum of the counts"):
+        FrequencyTable(values=["a", "b"], counts=[1, 2], total=2)
+
+
+def test_frequency_table_null_count() -> None:
+    assert FrequencyTable(values=["a", None], counts=[1, 4]).null_count == 4
+
+
+def test_frequency_table_other_count() -> None:
+    assert FrequencyTable(values=["a", "b"], counts=[1, 4], total=10).other_count == 5
+
+
+def test_frequency_table_from_series() -> None:
+    values = ["d", "c", None, "b", "a", "b", "c", "d", "a", None, "b"]
+    table = FrequencyTable.from_series(pl.Series(values))
+    assert table.most_common() == Counter(values).most_common()
+    assert table.total == 11
+    assert table.null_count == 2
+
+
+def test_frequency_table_from_series_empty() -> None:
+    table = FrequencyTable.from_series(pl.Series([], dtype=pl.Int64))
+    assert len(table) == 0
+    assert table.total == 0
+
+
+def test_frequency_table_from_counter() -> None:
+    table = FrequencyTable.from_counter(Counter({"a": 4, None: 2, "c": 6}))
+    assert table.most_common() == [("c", 6), ("a", 4), (None, 2)]
+
+
+def test_frequency_table_from_counter_empty() -> None:
+    assert len(FrequencyTable.from_counter(Counter())) == 0
+
+
+def test_frequency_table_from_sketch() -> None:
+    sketch = SpaceSaving(capacity=2)
+    sketch.update(["a", "b", "a", "c", None, "a"])
+    table = FrequencyTable.from_sketch(sketch)
+    assert table.most_common(1) == [("a", 3)]
+    assert table.total == 6
+    assert table.null_count == 1
+    assert table.other_count == 1
+    assert table.max_error == 1
+    assert table.approximate
+
+
+def test_frequency_table_from_sketch_exact() -> None:
+    sketch = SpaceSaving(capacity=10)
+    sketch.update(["a", "b", "a"])
+    table = FrequencyTable.from_sketch(sketch)
+    assert table.max_error == 0
+    assert not table.approximate
+
+
+def test_frequency_table_max_error_default() -> None:
+    table = FrequencyTable(values=["a", "b"], counts=[6, 3])
+    assert table.max_error == 0
+    assert not table.approximate
+
+
+def test_frequency_table_max_error_head_tail() -> None:
+    table = FrequencyTable(values=["a", "b", "c"], counts=[6, 3, 1], max_error=2)
+    assert table.head(1).max_error == 2
+    assert table.tail(1).max_error == 2
+
+
+def test_frequency_table_percentages() -> None:
+    table = FrequencyTable(values=["a", "b", "c"], counts=[6, 3, 1])
+    assert objects_are_allclose(table.percentages(), np.array([60.0, 30.0, 10.0]))
+    assert objects_are_allclose(table.cumulative_percentages(), np.array([60.0, 90.0, 100.0]))
+
+
+def test_frequency_table_percentages_other_count() -> None:
+    table = FrequencyTable(values=["a", "b"], counts=[6, 2], total=10)
+    assert objects_are_allclose(table.percentages(), np.array([60.0, 20.0]))
+    assert objects_are_allclose(table.cumulative_percentages(), np.array([60.0, 80.0]))
+
+
+def test_frequency_table_percentages_zero_total() -> None:
+    table = FrequencyTable(values=["a"], counts=[0])
+    assert objects_are_equal(table.percentages(), np.array([float("nan")]), equal_nan=True)
+
+
+@pytest.mark.parametrize(("n", "expected"), [(0, []), (2, [("a", 6), ("b", 3)])])
+def test_frequency_table_head(n: int, expected: list) -> None:
+    table = FrequencyTable(values=["a", "b", "c"], counts=[6, 3, 1]).head(n)
+    assert table.most_common() == expected
+    assert table.total == 10
+
+
+def test_frequency_table_head_larger() -> None:
+    table = FrequencyTable(values=["a", "b", "c"], counts=[6, 3, 1]).head(10)
+    assert len(table) == 3
+    assert table.other_count == 0
+
+
+@pytest.mark.parametrize(("n", "expected"), [(0, []), (2, [("b", 3), ("c", 1)])])
+def test_frequency_table_tail(n: int, expected: list) -> None:
+    table = FrequencyTable(values=["a", "b", "c"], counts=[6, 3, 1]).tail(n)
+    assert table.most_common() == expected
+    assert table.total == 10
+
+
+def test_frequency_table_tail_larger() -> None:
+    table = FrequencyTable(values=["a", "b", "c"], counts=[6, 3, 1]).tail(10)
+    assert table.most_common() == [("a", 6), ("b", 3), ("c", 1)]
+
+
+def test_frequency_table_tail_same_as_counter() -> None:
+    counter = Counter({"a": 4, "b": 2, "c": 6, "d": 2, "e": 1})
+    assert FrequencyTable.from_counter(counter).tail(3).most_common() == counter.most_common()[-3:]
+
+
+def test_frequency_table_merge() -> None:
+    table = FrequencyTable(values=["a", "b", None], counts=[6, 3, 1]).merge(
+        FrequencyTable(values=["b", "c", None], counts=[4, 1, 2], total=10)
+    )
+    assert table.most_common() == [("b", 7), ("a", 6), (None, 3), ("c", 1)]
+    assert table.total == 20
+    assert table.other_count == 3
+    assert table.max_error == 0
+
+
+def test_frequency_table_merge_max_error() -> None:
+    table = FrequencyTable(values=["a"], counts=[6], max_error=1).merge(
+        FrequencyTable(values=["a"], counts=[4], max_error=2)
+    )
+    assert table.most_common() == [("a", 10)]
+    assert table.max_error == 3
+
+
+def test_frequency_table_merge_empty() -> None:
+    table = FrequencyTable(values=["a"], counts=[2])
+    assert table.merge(FrequencyTable(values=[], counts=[])).most_common() == [("a", 2)]
+    assert FrequencyTable(values=[], counts=[]).merge(table).most_common() == [("a", 2)]
+
+
+def test_frequency_table_to_counter() -> None:
+    assert objects_are_equal(
+        FrequencyTable(values=["a", None, "c"], counts=[6, 3, 1]).to_counter(),
+        Counter({"a": 6, None: 3, "c": 1}),
+    )
+
+
+########################################
+#     Tests for to_frequency_table     #
+########################################
+
+
+def test_to_frequency_table_counter() -> None:
+    table = to_frequency_table(Counter({"a": 4, "b": 2, "c": 6}))
+    assert isinstance(table, FrequencyTable)
+    assert table.most_common() == [("c", 6), ("a", 4), ("b", 2)]
+
+
+def test_to_frequency_table_frequency_table() -> None:
+    table = FrequencyTable(values=["a"], counts=[1])
+    assert to_frequency_table(table) is table
+
 
 ####################################
 #    Tests for compute_nunique     #
@@ -48,6 +268,72 @@ def test_compute_nunique_empty() -> None:
     assert objects_are_equal(compute_nunique(frame=pl.DataFrame({})), np.array([], dtype=np.int64))
 
 
+def test_compute_nunique_approximate() -> None:
+    assert objects_are_equal(
+        compute_nunique(
+            frame=pl.DataFrame(
+                {
+                    "int": [None, 1, 0, 1],
+                    "float": [1.2, 4.2, None, 2.2],
+                    "str": ["A", "B", None, None],
+                },
+                schema={"int": pl.Int64, "float": pl.Float64, "str": pl.String},
+            ),
+            approximate=True,
+        ),
+        np.array([3, 4, 3], dtype=np.int64),
+    )
+
+
+def test_compute_nunique_approximate_large() -> None:
+    rng = np.random.default_rng(42)
+    frame = pl.DataFrame(
+        {"int": rng.integers(0, 50_000, size=200_000), "float": rng.normal(size=200_000)}
+    )
+    assert objects_are_allclose(
+        compute_nunique(frame, approximate=True, precision=12).astype(np.float64),
+        compute_nunique(frame).astype(np.float64),
+        rtol=0.07,
+    )
+
+
+def test_compute_nunique_approximate_empty_rows() -> None:
+    assert objects_are_equal(
+        compute_nunique(
+            frame=pl.DataFrame(
+                {"int": [], "float": [], "str": []},
+                schema={"int": pl.Int64, "float": pl.Float64, "str": pl.String},
+            ),
+            approximate=True,
+        ),
+        np.array([0, 0, 0], dtype=np.int64),
+    )
+
+
+def test_compute_nunique_approximate_empty() -> None:
+    assert objects_are_equal(
+        compute_nunique(frame=pl.DataFrame({}), approximate=True), np.array([], dtype=np.int64)
+    )
+
+
+#####################################
+#    Tests for estimate_nunique     #
+#####################################
+
+
+def test_estimate_nunique() -> None:
+    assert estimate_nunique(pl.Series(["a", "b", None, "a"])) == 3
+
+
+def test_estimate_nunique_empty() -> None:
+    assert estimate_nunique(pl.Series([], dtype=pl.Float64)) == 0
+
+
+def test_estimate_nunique_precision() -> None:
+    series = pl.Series(np.arange(100_000))
+    assert estimate_nunique(series, precision=10) == pytest.approx(100_000, rel=0.15)
+
+
 ###########################################
 #    Tests for compute_temporal_count     #
 ###########################################
@@ -98,6 +384,16 @@ def test_compute_temporal_count_biweekly(dataframe: pl.DataFrame) -> None:
     )
 
 
+@pytest.mark.parametrize("period", ["1mo", "2w", "1y"])
+def test_compute_temporal_count_base_period(dataframe: pl.DataFrame, period: str) -> None:
+    assert objects_are_equal(
+        compute_temporal_count(
+            frame=dataframe, dt_column="datetime", period=period, base_period="1d"
+        ),
+        compute_temporal_count(frame=dataframe, dt_column="datetime", period=period),
+    )
+
+
 def test_compute_temporal_count_empty() -> None:
     assert objects_are_equal(
         compute_temporal_count(
@@ -180,6 +476,32 @@ def test_compute_temporal_value_counts_drop_nulls() -> None:
     assert objects_are_equal(values, ["0.0", "1.0", "4.2", "42.0"])
 
 
+def test_compute_temporal_value_counts_yearly_unsorted() -> None:
+    counts, steps, values = compute_temporal_value_counts(
+        pl.DataFrame(
+            {
+                "col": [1, 2, 1, 3],
+                "datetime": [
+                    datetime(year=2021, month=3, day=3, tzinfo=timezone.utc),
+                    datetime(year=2020, month=1, day=4, tzinfo=timezone.utc),
+                    datetime(year=2020, month=2, day=5, tzinfo=timezone.utc),
+                    datetime(year=2022, month=1, day=6, tzinfo=timezone.utc),
+                ],
+            },
+            schema={
+                "col": pl.Int64,
+                "datetime": pl.Datetime(time_unit="us", time_zone="UTC"),
+            },
+        ),
+        column="col",
+        dt_column="datetime",
+        period="1y",
+    )
+    assert objects_are_equal(counts, np.array([[1, 1, 0], [1, 0, 0], [0, 0, 1]]))
+    assert objects_are_equal(steps, ["2020", "2021", "2022"])
+    assert objects_are_equal(values, ["1", "2", "3"])
+
+
 def test_compute_temporal_value_counts_empty() -> None:
     counts, steps, values = compute_temporal_value_counts(
         pl.DataFrame(
@@ -196,3 +518,133 @@ def test_compute_temporal_value_counts_empty() -> None:
     assert objects_are_equal(counts, np.zeros((0, 0), dtype=np.int64))
     assert objects_are_equal(steps, [])
     assert objects_are_equal(values, [])
+
+
+#################################################
+#    Tests for compute_most_frequent_values     #
+#################################################
+
+
+def test_compute_most_frequent_values() -> None:
+    assert objects_are_equal(
+        compute_most_frequent_values(pl.Series(["a", "b", None, "a", "a", None, "c"])),
+        [("a", 3), (None, 2), ("b", 1), ("c", 1)],
+    )
+
+
+def test_compute_most_frequent_values_ties_first_occurrence() -> None:
+    values = ["d", "c", "b", "a", "b", "c", "d", "a"]
+    assert objects_are_equal(
+        compute_most_frequent_values(pl.Series(values)), Counter(values).most_common()
+    )
+
+
+@pytest.mark.parametrize("top", [0, 1, 2, 10])
+def test_compute_most_frequent_values_top(top: int) -> None:
+    values = [1, 2, None, 1, 1, None, 3]
+    assert objects_are_equal(
+        compute_most_frequent_values(pl.Series(values), top=top), Counter(values).most_common(top)
+    )
+
+
+def test_compute_most_frequent_values_nan() -> None:
+    assert objects_are_allclose(
+        compute_most_frequent_values(pl.Series([1.0, float("nan"), 1.0, float("nan"), 2.0])),
+        [(1.0, 2), (float("nan"), 2), (2.0, 1)],
+        equal_nan=True,
+    )
+
+
+def test_compute_most_frequent_values_empty() -> None:
+    assert compute_most_frequent_values(pl.Series([], dtype=pl.String)) == []
+
+
+############################################
+#    Tests for compute_frequency_table     #
+############################################
+
+
+def test_compute_frequency_table() -> None:
+    table = compute_frequency_table(pl.DataFrame({"col": ["a", "b", None, "a", "a", None]}), "col")
+    assert table.most_common() == [("a", 3), (None, 2), ("b", 1)]
+    assert table.total == 6
+
+
+def test_compute_frequency_table_drop_nulls() -> None:
+    table = compute_frequency_table(
+        pl.DataFrame({"col": ["a", "b", None, "a", "a", None]}), "col", drop_nulls=True
+    )
+    assert table.most_common() == [("a", 3), ("b", 1)]
+    assert table.total == 4
+
+
+def test_compute_frequency_table_capacity() -> None:
+    table = compute_frequency_table(
+        pl.DataFrame({"col": ["a", "b", "c", "a", "a", "b", "d"]}), "col", capacity=2
+    )
+    assert table.most_common(1) == [("a", 3)]
+    assert len(table) == 2
+    assert table.total == 7
+
+
+def test_compute_frequency_table_empty() -> None:
+    table = compute_frequency_table(pl.DataFrame({"col": []}, schema={"col": pl.String}), "col")
+    assert len(table) == 0
+    assert table.total == 0
+
+
+#########################################
+#    Tests for compute_value_counts     #
+#########################################
+
+
+def test_compute_value_counts() -> None:
+    assert objects_are_equal(
+        compute_value_counts(pl.DataFrame({"col": ["a", "b", None, "a", "a", None]}), "col"),
+        Counter({"a": 3, None: 2, "b": 1}),
+    )
+
+
+def test_compute_value_counts_drop_nulls() -> None:
+    assert objects_are_equal(
+        compute_value_counts(
+            pl.DataFrame({"col": ["a", "b", None, "a", "a", None]}), "col", drop_nulls=True
+        ),
+        Counter({"a": 3, "b": 1}),
+    )
+
+
+def test_compute_value_counts_empty() -> None:
+    assert objects_are_equal(
+        compute_value_counts(pl.DataFrame({"col": []}, schema={"col": pl.String}), "col"),
+        Counter(),
+    )
+
+
+def test_compute_value_counts_capacity() -> None:
+    assert objects_are_equal(
+        compute_value_counts(
+            pl.DataFrame({"col": ["a", "b", None, "a", "a", None]}), "col", capacity=10
+        ),
+        Counter({"a": 3, None: 2, "b": 1}),
+    )
+
+
+def test_compute_value_counts_capacity_small() -> None:
+    counter = compute_value_counts(
+        pl.DataFrame({"col": ["a", "b", "c", "a", "a", "b", "d"]}), "col", capacity=2
+    )
+    assert counter.most_common(1) == [("a", 3)]
+    assert len(counter) == 2
+
+
+def test_compute_value_counts_capacity_drop_nulls() -> None:
+    assert objects_are_equal(
+        compute_value_counts(
+            pl.DataFrame({"col": ["a", "b", None, "a", "a", None]}),
+            "col",
+            drop_nulls=True,
+            capacity=10,
+        ),
+        Counter({"a": 3, "b": 1}),
+    )
@@ -0,0 +1,276 @@
+from __future__ import annotations
+
+import gc
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import polars as pl
+import pytest
+from coola import objects_are_allclose, objects_are_equal
+from polars.testing import assert_frame_equal
+
+from flamme.utils.cache import enable_computation_cache
+from flamme.utils.cube import TemporalCube, get_temporal_cube
+from flamme.utils.null import compute_temporal_null_count
+from flamme.utils.temporal import compute_temporal_stats
+
+
+@pytest.fixture
+def dataframe() -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "float": [1.2, 4.2, None, 2.2, 0.0, 5.0],
+            "int": [None, 1, 0, 1, 3, None],
+            "str": ["A", "B", None, None, "C", "D"],
+            "datetime": [
+                datetime(year=2020, month=2, day=3, tzinfo=timezone.utc),
+                datetime(year=2020, month=1, day=3, tzinfo=timezone.utc),
+                datetime(year=2020, month=1, day=4, tzinfo=timezone.utc),
+                datetime(year=2020, month=1, day=4, tzinfo=timezone.utc),
+                datetime(year=2020, month=1, day=31, tzinfo=timezone.utc),
+                datetime(year=2020, month=3, day=1, tzinfo=timezone.utc),
+            ],
+        },
+        schema={
+            "float": pl.Float64,
+            "int": pl.Int64,
+            "str": pl.String,
+            "datetime": pl.Datetime(time_unit="us", time_zone="UTC"),
+        },
+    )
+
+
+@pytest.fixture
+def dataframe_large() -> pl.DataFrame:
+    rng = np.random.default_rng(42)
+    start = datetime(year=2020, month=1, day=1, tzinfo=timezone.utc)
+    return pl.DataFrame(
+        {
+            "col": rng.normal(size=20_000),
+            "datetime": [
+                start + timedelta(minutes=int(minutes))
+                for minutes in rng.integers(0, 60 * 24 * 100, size=20_000)
+            ],
+        }
+    )
+
+
+##################################
+#     Tests for TemporalCube     #
+##################################
+
+
+def test_temporal_cube_repr(dataframe: pl.DataFrame) -> None:
+    assert repr(TemporalCube(dataframe, dt_column="datetime", period="1d")).startswith(
+        "TemporalCube("
+    )
+
+
+def test_temporal_cube_dt_column(dataframe: pl.DataFrame) -> None:
+    assert TemporalCube(dataframe, dt_column="datetime", period="1d").dt_column == "datetime"
+
+
+def test_temporal_cube_period(dataframe: pl.DataFrame) -> None:
+    assert TemporalCube(dataframe, dt_column="datetime", period="1d").period == "1d"
+
+
+def test_temporal_cube_incorrect_num_quantiles(dataframe: pl.DataFrame) -> None:
+    with pytest.raises(ValueError, match="num_quantiles must be greater or equal to 2"):
+        TemporalCube(dataframe, dt_column="datetime", period="1d", num_quantiles=1)
+
+
+def test_temporal_cube_null_datetime() -> None:
+    frame = pl.DataFrame(
+        {
+            "col": [1, 2],
+            "datetime": [datetime(year=2020, month=1, day=1, tzinfo=timezone.utc), None],
+        }
+    )
+    with pytest.raises(ValueError, match="The datetime column datetime has null values"):
+        TemporalCube(frame, dt_column="datetime", period="1d")
+
+
+def test_temporal_cube_prepare(dataframe: pl.DataFrame) -> None:
+    cube = TemporalCube(dataframe, dt_column="datetime", period="1d")
+    cube.prepare(["float", "str"])
+    assert repr(cube).endswith("columns=['float', 'str'])")
+    assert_frame_equal(
+        cube.get_stats("float", period="1mo"),
+        TemporalCube(dataframe, dt_column="datetime", period="1d").get_stats("float", period="1mo"),
+    )
+
+
+def test_temporal_cube_prepare_frame_garbage_collected() -> None:
+    frame = pl.DataFrame(
+        {
+            "col": [1, None],
+            "datetime": [datetime(year=2020, month=1, day=1, tzinfo=timezone.utc)] * 2,
+        }
+    )
+    cube = TemporalCube(frame, dt_column="datetime", period="1d")
+    del frame
+    gc.collect()
+    with pytest.raises(RuntimeError, match="was garbage collected"):
+        cube.prepare(["col"])
+
+
+@pytest.mark.parametrize(
+    ("period", "steps"),
+    [
+        ("1d", ["2020-01-03", "2020-01-04", "2020-01-31", "2020-02-03", "2020-03-01"]),
+        ("1mo", ["2020-01", "2020-02", "2020-03"]),
+        ("1y", ["2020"]),
+    ],
+)
+def test_temporal_cube_get_step_names(
+    dataframe: pl.DataFrame, period: str, steps: list[str]
+) -> None:
+    cube = TemporalCube(dataframe, dt_column="datetime", period="1d")
+    assert cube.get_step_names(period) == steps
+
+
+def test_temporal_cube_get_step_names_incorrect_period(dataframe: pl.DataFrame) -> None:
+    cube = TemporalCube(dataframe, dt_column="datetime", period="1w")
+    with pytest.raises(ValueError, match="The period 1mo cannot be computed from the base period"):
+        cube.get_step_names("1mo")
+
+
+def test_temporal_cube_get_num_rows(dataframe: pl.DataFrame) -> None:
+    cube = TemporalCube(dataframe, dt_column="datetime", period="1d")
+    assert objects_are_equal(cube.get_num_rows("1d"), np.array([1, 2, 1, 1, 1]))
+    assert objects_are_equal(cube.get_num_rows("1mo"), np.array([4, 1, 1]))
+
+
+def test_temporal_cube_get_num_rows_empty(dataframe: pl.DataFrame) -> None:
+    cube = TemporalCube(dataframe.clear(), dt_column="datetime", period="1d")
+    assert objects_are_equal(cube.get_num_rows("1mo"), np.array([], dtype=np.int64))
+
+
+def test_temporal_cube_get_null_count(dataframe: pl.DataFrame) -> None:
+    cube = TemporalCube(dataframe, dt_column="datetime", period="1d")
+    assert objects_are_equal(
+        cube.get_null_count(["float", "int", "str"], period="1mo"),
+        np.array([[1, 0, 0], [0, 1, 1], [2, 0, 0]]),
+    )
+
+
+def test_temporal_cube_get_null_count_no_columns(dataframe: pl.DataFrame) -> None:
+    cube = TemporalCube(dataframe, dt_column="datetime", period="1d")
+    assert objects_are_equal(
+        cube.get_null_count([], period="1mo"), np.zeros((0, 3), dtype=np.int64)
+    )
+
+
+@pytest.mark.parametrize("period", ["1d", "1w", "1mo", "1y"])
+def test_temporal_cube_get_null_count_same_as_rows(dataframe: pl.DataFrame, period: str) -> None:
+    cube = TemporalCube(dataframe, dt_column="datetime", period="1d")
+    nulls, totals, steps = compute_temporal_null_count(
+        dataframe, columns=["float", "int", "str"], dt_column="datetime", period=period
+    )
+    assert objects_are_equal(
+        cube.get_null_count(["float", "int", "str"], period=period).sum(axis=0), nulls
+    )
+    assert objects_are_equal(cube.get_num_rows(period) * 3, totals)
+    assert objects_are_equal(cube.get_step_names(period), steps)
+
+
+def test_temporal_cube_get_null_count_frame_garbage_collected() -> None:
+    frame = pl.DataFrame(
+        {
+            "col": [1, None],
+            "datetime": [datetime(year=2020, month=1, day=1, tzinfo=timezone.utc)] * 2,
+        }
+    )
+    cube = TemporalCube(frame, dt_column="datetime", period="1d")
+    del frame
+    gc.collect()
+    with pytest.raises(RuntimeError, match="was garbage collected"):
+        cube.get_null_count(["col"], period="1d")
+
+
+def test_temporal_cube_get_stats_base_period(dataframe: pl.DataFrame) -> None:
+    cube = TemporalCube(dataframe, dt_column="datetime", period="1d")
+    assert_frame_equal(
+        cube.get_stats("float", period="1d").drop("nunique", "median"),
+        compute_temporal_stats(dataframe, column="float", dt_column="datetime", period="1d").drop(
+            "nunique", "median"
+        ),
+    )
+
+
+def test_temporal_cube_get_stats_rollup(dataframe: pl.DataFrame) -> None:
+    stats = TemporalCube(dataframe, dt_column="datetime", period="1d").get_stats(
+        "int", period="1mo"
+    )
+    assert objects_are_equal(stats["count"].to_list(), [4, 1, 1])
+    assert objects_are_equal(stats["nunique"].to_list(), [None, None, None])
+    assert stats["mean"][0] == pytest.approx(1.25)
+    assert stats["std"][0] == pytest.approx(np.std([1, 0, 1, 3], ddof=1))
+    assert objects_are_equal(stats["mean"].to_list()[1:], [None, None])
+    assert objects_are_equal(stats["std"].to_list()[1:], [None, None])
+    assert objects_are_equal(stats["min"].to_list(), [0.0, None, None])
+    assert objects_are_equal(stats["median"].to_list(), [1.0, None, None])
+    assert objects_are_equal(stats["max"].to_list(), [3.0, None, None])
+
+
+def test_temporal_cube_get_stats_not_numeric(dataframe: pl.DataFrame) -> None:
+    cube = TemporalCube(dataframe, dt_column="datetime", period="1d")
+    with pytest.raises(ValueError, match="The column str is not numeric"):
+        cube.get_stats("str", period="1mo")
+
+
+def test_temporal_cube_get_stats_empty(dataframe: pl.DataFrame) -> None:
+    frame = dataframe.clear()
+    stats = TemporalCube(frame, dt_column="datetime", period="1d").get_stats("float", period="1mo")
+    assert stats.shape == (0, 16)
+
+
+@pytest.mark.parametrize("period", ["1w", "1mo"])
+def test_temporal_cube_get_stats_approximation(dataframe_large: pl.DataFrame, period: str) -> None:
+    cube = TemporalCube(dataframe_large, dt_column="datetime", period="1d")
+    stats = cube.get_stats("col", period=period)
+    expected = compute_temporal_stats(
+        dataframe_large, column="col", dt_column="datetime", period=period
+    )
+    assert objects_are_equal(stats["step"].to_list(), expected["step"].to_list())
+    assert objects_are_equal(stats["count"].to_list(), expected["count"].to_list())
+    for name in ["mean", "std", "min", "max"]:
+        assert objects_are_allclose(stats[name].to_list(), expected[name].to_list())
+    for name in ["q05", "q25", "q75", "q95"]:
+        assert np.abs(stats[name].to_numpy() - expected[name].to_numpy()).max() < 0.05
+
+
+def test_temporal_cube_get_stats_large_offset(dataframe_large: pl.DataFrame) -> None:
+    # The sum of squares formula loses all the significant digits of
+    # the variance when the mean is large compared to the deviation.
+    frame = dataframe_large.with_columns(pl.col("col") + 1e9)
+    stats = TemporalCube(frame, dt_column="datetime", period="1d").get_stats("col", period="1mo")
+    expected = compute_temporal_stats(frame, column="col", dt_column="datetime", period="1mo")
+    assert objects_are_allclose(stats["std"].to_list(), expected["std"].to_list(), rtol=1e-6)
+
+
+def test_temporal_cube_computes_columns_once(dataframe: pl.DataFrame) -> None:
+    cube = TemporalCube(dataframe, dt_column="datetime", period="1d")
+    cube.get_null_count(["float", "int"], period="1mo")
+    partials = cube._partials["float"]
+    cube.get_stats("float", period="1w")
+    assert cube._partials["float"] is partials
+
+
+#######################################
+#     Tests for get_temporal_cube     #
+#######################################
+
+
+def test_get_temporal_cube(dataframe: pl.DataFrame) -> None:
+    cube = get_temporal_cube(dataframe, dt_column="datetime", period="1d")
+    assert isinstance(cube, TemporalCube)
+    assert cube.period == "1d"
+
+
+def test_get_temporal_cube_cache(dataframe: pl.DataFrame) -> None:
+    with enable_computation_cache() as cache:
+        cube = get_temporal_cube(dataframe, dt_column="datetime", period="1d")
+        assert get_temporal_cube(dataframe, dt_column="datetime", period="1d") is cube
+        assert get_temporal_cube(dataframe, dt_column="datetime", period="1w") is not cube
+    assert cache.hits == 1
@@ -5,7 +5,12 @@ import polars as pl
 import pyarrow as pa
 import pytest
 
-from flamme.utils.dtype import compact_type_name, frame_types, series_types
+from flamme.utils.dtype import (
+    compact_type_name,
+    dtype_types,
+    frame_types,
+    series_types,
+)
 
 
 @pytest.fixture
@@ -39,6 +44,35 @@ def dtypes() -> dict[str, pa.DataType]:
     }
 
 
+#################################
+#     Tests for dtype_types     #
+#################################
+
+
+@pytest.mark.parametrize(
+    "series",
+    [
+        pl.Series([1, 2, None], dtype=pl.Int64),
+        pl.Series([1.0, float("nan")], dtype=pl.Float64),
+        pl.Series(["a", None], dtype=pl.String),
+        pl.Series([True, False], dtype=pl.Boolean),
+        pl.Series(["a", "b"], dtype=pl.Categorical),
+        pl.Series([[1], None], dtype=pl.List(pl.Int64)),
+        pl.Series([{"a": 1}, None]),
+        pl.Series([None, None], dtype=pl.Null),
+        pl.Series([], dtype=pl.Int64),
+    ],
+)
+def test_dtype_types(series: pl.Series) -> None:
+    assert dtype_types(
+        series.dtype, null_count=series.null_count(), num_rows=series.len()
+    ) == series_types(series)
+
+
+def test_dtype_types_object() -> None:
+    assert dtype_types(pl.Object(), null_count=0, num_rows=2) is None
+
+
 #################################
 #     Tests for frame_types     #
 #################################
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from flamme.utils.executor import is_parallel_worker, parallel_map
+
+########################################
+#     Tests for is_parallel_worker     #
+########################################
+
+
+def test_is_parallel_worker_false() -> None:
+    assert not is_parallel_worker()
+
+
+def test_is_parallel_worker_thread() -> None:
+    assert parallel_map(lambda _: is_parallel_worker(), [1, 2, 3], executor="thread") == [
+        True,
+        True,
+        True,
+    ]
+    assert not is_parallel_worker()
+
+
+##################################
+#     Tests for parallel_map     #
+##################################
+
+
+@pytest.mark.parametrize("executor", [None, "thread", "process"])
+def test_parallel_map(executor: str | None) -> None:
+    assert parallel_map(abs, [-1, 2, -3, 4, -5], executor=executor, max_workers=2) == [
+        1,
+        2,
+        3,
+        4,
+        5,
+    ]
+
+
+@pytest.mark.parametrize("executor", [None, "thread", "process"])
+def test_parallel_map_empty(executor: str | None) -> None:
+    assert parallel_map(abs, [], executor=executor) == []
+
+
+def test_parallel_map_thread_ordered() -> None:
+    assert parallel_map(str, range(100), executor="thread", max_workers=8) == [
+        str(i) for i in range(100)
+    ]
+
+
+def test_parallel_map_thread_uses_threads() -> None:
+    main = threading.get_ident()
+    idents = parallel_map(lambda _: threading.get_ident(), [1, 2], executor="thread")
+    assert main not in idents
+
+
+def test_parallel_map_sequential_uses_main_thread() -> None:
+    main = threading.get_ident()
+    assert parallel_map(lambda _: threading.get_ident(), [1, 2]) == [main, main]
+
+
+def test_parallel_map_nested_sequential() -> None:
+    def fn(x: int) -> list[int]:
+        return parallel_map(lambda _: threading.get_ident(), [x, x], executor="thread")
+
+    idents = parallel_map(fn, [1, 2], executor="thread")
+    # The nested calls are executed by the worker thread.
+    assert all(ident[0] == ident[1] for ident in idents)
+
+
+def test_parallel_map_thread_exception() -> None:
+    def fn(x: int) -> int:
+        if x == 2:
+            msg = "incorrect value"
+            raise ValueError(msg)
+        return x
+
+    with pytest.raises(ValueError, match="incorrect value"):
+        parallel_map(fn, [1, 2, 3], executor="thread")
+
+
+def test_parallel_map_incorrect_executor() -> None:
+    with pytest.raises(ValueError, match=r"Incorrect executor: gpu\."):
+        parallel_map(abs, [1, 2], executor="gpu")
+
+
+_initializer_state = {"offset": 0}
+
+
+def _set_offset(offset: int) -> None:
+    _initializer_state["offset"] = offset
+
+
+def _add_offset(value: int) -> int:
+    return value + _initializer_state["offset"]
+
+
+def test_parallel_map_process_initializer() -> None:
+    assert parallel_map(
+        _add_offset,
+        [1, 2, 3],
+        executor="process",
+        max_workers=2,
+        initializer=_set_offset,
+        initargs=(10,),
+    ) == [11, 12, 13]
+    assert _initializer_state["offset"] == 0
@@ -1,9 +1,22 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import pytest
 from matplotlib import pyplot as plt
 
-from flamme.utils.figure import MISSING_FIGURE_MESSAGE, figure2html
+from flamme.utils.figure import (
+    MISSING_FIGURE_MESSAGE,
+    figure2html,
+    get_figure_backend,
+    get_figure_sink,
+    use_figure_backend,
+    use_figure_sink,
+)
+from flamme.utils.figure_sink import DirectoryFigureSink, InlineFigureSink
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 #################################
 #     Tests for figure2html     #
@@ -29,3 +42,100 @@ def test_figure2html_reactive(reactive: bool) -> None:
 
 def test_figure2html_none() -> None:
     assert figure2html(None) == MISSING_FIGURE_MESSAGE
+
+
+def test_figure2html_inline() -> None:
+    fig, _ = plt.subplots()
+    assert figure2html(fig).startswith(
+        '<img style="width:100%; height:auto;" src="data:image/png;charset=utf-8;base64, '
+    )
+
+
+def test_figure2html_directory_sink(tmp_path: Path) -> None:
+    fig, _ = plt.subplots()
+    with DirectoryFigureSink(tmp_path.joinpath("figures")) as sink, use_figure_sink(sink):
+        html = figure2html(fig)
+    src = html.split('src="')[1][:-2]
+    assert src.startswith("figures/")
+    assert tmp_path.joinpath(src).is_file()
+
+
+########################################
+#     Tests for get_figure_backend     #
+########################################
+
+
+def test_get_figure_backend_default() -> None:
+    assert get_figure_backend() == "matplotlib"
+
+
+#####################################
+#     Tests for get_figure_sink     #
+#####################################
+
+
+def test_get_figure_sink_default() -> None:
+    assert isinstance(get_figure_sink(), InlineFigureSink)
+
+
+########################################
+#     Tests for use_figure_backend     #
+########################################
+
+
+@pytest.mark.parametrize("backend", ["matplotlib", "svg", "client"])
+def test_use_figure_backend(backend: str) -> None:
+    with use_figure_backend(backend) as active:
+        assert active == backend
+        assert get_figure_backend() == backend
+    assert get_figure_backend() == "matplotlib"
+
+
+def test_use_figure_backend_nested() -> None:
+    with use_figure_backend("svg"):
+        with use_figure_backend("matplotlib"):
+            assert get_figure_backend() == "matplotlib"
+        assert get_figure_backend() == "svg"
+
+
+def test_use_figure_backend_exception() -> None:
+    def fail() -> None:
+        with use_figure_backend("svg"):
+            msg = "meow"
+            raise RuntimeError(msg)
+
+    with pytest.raises(RuntimeError, match="meow"):
+        fail()
+    assert get_figure_backend() == "matplotlib"
+
+
+def test_use_figure_backend_incorrect() -> None:
+    with (
+        pytest.raises(ValueError, match="Incorrect figure backend: png"),
+        use_figure_backend("png"),
+    ):
+        pass
+
+
+#####################################
+#     Tests for use_figure_sink     #
+#####################################
+
+
+def test_use_figure_sink(tmp_path: Path) -> None:
+    sink = DirectoryFigureSink(tmp_path)
+    with use_figure_sink(sink) as active:
+        assert active is sink
+        assert get_figure_sink() is sink
+    assert isinstance(get_figure_sink(), InlineFigureSink)
+
+
+def test_use_figure_sink_exception(tmp_path: Path) -> None:
+    def fail() -> None:
+        with use_figure_sink(DirectoryFigureSink(tmp_path)):
+            msg = "meow"
+            raise RuntimeError(msg)
+
+    with pytest.raises(RuntimeError, match="meow"):
+        fail()
+    assert isinstance(get_figure_sink(), InlineFigureSink)
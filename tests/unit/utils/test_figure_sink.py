@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import pickle
+import re
+import zipfile
+from typing import TYPE_CHECKING
+
+import pytest
+from matplotlib import pyplot as plt
+from PIL import Image
+
+from flamme.utils.figure_sink import (
+    ArchiveFigureSink,
+    DirectoryFigureSink,
+    InlineFigureSink,
+    create_figure_sink,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def create_figure(value: float = 1.0) -> plt.Figure:
+    fig, ax = plt.subplots()
+    ax.plot([0, 1], [0, value])
+    return fig
+
+
+######################################
+#     Tests for InlineFigureSink     #
+######################################
+
+
+def test_inline_figure_sink_repr() -> None:
+    assert repr(InlineFigureSink()) == "InlineFigureSink()"
+
+
+def test_inline_figure_sink_save() -> None:
+    assert (
+        InlineFigureSink()
+        .save(create_figure())
+        .startswith("data:image/png;charset=utf-8;base64, iVBOR")
+    )
+
+
+def test_inline_figure_sink_for_worker() -> None:
+    sink = InlineFigureSink()
+    assert sink.for_worker() is sink
+
+
+def test_inline_figure_sink_context_manager() -> None:
+    with InlineFigureSink() as sink:
+        assert isinstance(sink, InlineFigureSink)
+
+
+#########################################
+#     Tests for DirectoryFigureSink     #
+#########################################
+
+
+def test_directory_figure_sink_repr(tmp_path: Path) -> None:
+    assert repr(DirectoryFigureSink(tmp_path.joinpath("figures"))).startswith(
+        "DirectoryFigureSink("
+    )
+
+
+def test_directory_figure_sink_url_default(tmp_path: Path) -> None:
+    assert DirectoryFigureSink(tmp_path.joinpath("figures")).url == "figures"
+
+
+def test_directory_figure_sink_url(tmp_path: Path) -> None:
+    assert DirectoryFigureSink(tmp_path, url="report_figures/").url == "report_figures"
+
+
+def test_directory_figure_sink_path(tmp_path: Path) -> None:
+    assert DirectoryFigureSink(tmp_path.joinpath("figures")).path == tmp_path.joinpath("figures")
+
+
+@pytest.mark.parametrize("image_format", ["png", "webp"])
+def test_directory_figure_sink_save(tmp_path: Path, image_format: str) -> None:
+    path = tmp_path.joinpath("figures")
+    with DirectoryFigureSink(path, image_format=image_format) as sink:
+        url = sink.save(create_figure())
+    assert re.fullmatch(rf"figures/[0-9a-f]{{32}}\.{image_format}", url)
+    assert [file.name for file in path.iterdir()] == [url.split("/")[1]]
+    with Image.open(tmp_path.joinpath(url)) as image:
+        assert image.format == image_format.upper()
+
+
+def test_directory_figure_sink_save_deduplicate(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("figures")
+    with DirectoryFigureSink(path, max_workers=2, max_pending=1) as sink:
+        urls = [sink.save(create_figure(value)) for value in (1.0, 2.0, 1.0, 2.0, 1.0)]
+    assert urls[0] == urls[2] == urls[4]
+    assert urls[1] == urls[3]
+    assert urls[0] != urls[1]
+    assert len(list(path.iterdir())) == 2
+
+
+def test_directory_figure_sink_flush(tmp_path: Path) -> None:
+    sink = DirectoryFigureSink(tmp_path)
+    url = sink.save(create_figure())
+    sink.flush()
+    assert tmp_path.joinpath(url.split("/")[1]).is_file()
+    sink.close()
+
+
+def test_directory_figure_sink_close_without_figure(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("figures")
+    DirectoryFigureSink(path).close()
+    assert not path.exists()
+
+
+def test_directory_figure_sink_pickle(tmp_path: Path) -> None:
+    with DirectoryFigureSink(tmp_path, url="figures") as sink:
+        sink.save(create_figure())
+        worker = pickle.loads(pickle.dumps(sink.for_worker()))  # noqa: S301
+    assert worker.url == "figures"
+    with worker:
+        url = worker.save(create_figure(2.0))
+    assert tmp_path.joinpath(url.split("/")[1]).is_file()
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_directory_figure_sink_incorrect_image_format(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="Incorrect image format: jpeg"):
+        DirectoryFigureSink(tmp_path, image_format="jpeg")
+
+
+#######################################
+#     Tests for ArchiveFigureSink     #
+#######################################
+
+
+def test_archive_figure_sink_repr(tmp_path: Path) -> None:
+    assert repr(ArchiveFigureSink(tmp_path.joinpath("figures.zip"))).startswith(
+        "ArchiveFigureSink("
+    )
+
+
+def test_archive_figure_sink_url_default(tmp_path: Path) -> None:
+    assert ArchiveFigureSink(tmp_path.joinpath("figures.zip")).url == "figures"
+
+
+def test_archive_figure_sink_path(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("figures.zip")
+    assert ArchiveFigureSink(path).path == path
+
+
+@pytest.mark.parametrize("image_format", ["png", "webp"])
+def test_archive_figure_sink_save(tmp_path: Path, image_format: str) -> None:
+    path = tmp_path.joinpath("figures.zip")
+    with ArchiveFigureSink(path, image_format=image_format) as sink:
+        urls = [sink.save(create_figure(value)) for value in (1.0, 2.0, 1.0)]
+    assert urls[0] == urls[2]
+    with zipfile.ZipFile(path) as archive:
+        assert sorted(archive.namelist()) == sorted(set(urls))
+        assert all(info.compress_type == zipfile.ZIP_STORED for info in archive.infolist())
+        archive.extractall(tmp_path)
+    with Image.open(tmp_path.joinpath(urls[0])) as image:
+        assert image.format == image_format.upper()
+
+
+def test_archive_figure_sink_for_worker(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("figures.zip")
+    with ArchiveFigureSink(path, url="report_figures") as sink:
+        url1 = sink.save(create_figure(1.0))
+        worker = pickle.loads(pickle.dumps(sink.for_worker()))  # noqa: S301
+        assert isinstance(worker, DirectoryFigureSink)
+        with worker:
+            url2 = worker.save(create_figure(2.0))
+            url3 = worker.save(create_figure(1.0))
+    assert url1 == url3
+    assert url2.startswith("report_figures/")
+    with zipfile.ZipFile(path) as archive:
+        assert sorted(archive.namelist()) == sorted([url1, url2])
+    assert [file.name for file in tmp_path.iterdir()] == ["figures.zip"]
+
+
+def test_archive_figure_sink_close_without_figure(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("figures.zip")
+    ArchiveFigureSink(path).close()
+    with zipfile.ZipFile(path) as archive:
+        assert archive.namelist() == []
+
+
+def test_archive_figure_sink_incorrect_image_format(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="Incorrect image format: jpeg"):
+        ArchiveFigureSink(tmp_path.joinpath("figures.zip"), image_format="jpeg")
+
+
+########################################
+#     Tests for create_figure_sink     #
+########################################
+
+
+def test_create_figure_sink_inline(tmp_path: Path) -> None:
+    assert isinstance(
+        create_figure_sink("inline", tmp_path.joinpath("report.html")), InlineFigureSink
+    )
+
+
+def test_create_figure_sink_directory(tmp_path: Path) -> None:
+    sink = create_figure_sink("directory", tmp_path.joinpath("report.html"), image_format="webp")
+    assert isinstance(sink, DirectoryFigureSink)
+    assert sink.path == tmp_path.joinpath("report_figures")
+    assert sink.url == "report_figures"
+    assert sink.image_format == "webp"
+
+
+def test_create_figure_sink_archive(tmp_path: Path) -> None:
+    sink = create_figure_sink("archive", tmp_path.joinpath("report.html"))
+    assert isinstance(sink, ArchiveFigureSink)
+    assert sink.path == tmp_path.joinpath("report_figures.zip")
+    assert sink.url == "report_figures"
+    assert sink.image_format == "png"
+
+
+def test_create_figure_sink_incorrect(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="Incorrect figure sink: s3"):
+        create_figure_sink("s3", tmp_path.joinpath("report.html"))
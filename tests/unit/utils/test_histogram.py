@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import numpy as np
+import polars as pl
+import pytest
+from coola import objects_are_allclose, objects_are_equal
+
+from flamme.utils.array import SortedArray
+from flamme.utils.histogram import compute_histogram
+
+#######################################
+#     Tests for compute_histogram     #
+#######################################
+
+
+def test_compute_histogram() -> None:
+    assert objects_are_allclose(
+        compute_histogram(pl.Series([0, 1, 2, 3, 4, 5, 6, 7, 8, 9]), bins=5),
+        (np.array([2, 2, 2, 2, 2]), np.array([0.0, 1.8, 3.6, 5.4, 7.2, 9.0])),
+    )
+
+
+def test_compute_histogram_default_bins() -> None:
+    counts, edges = compute_histogram(pl.Series(list(range(100))))
+    assert objects_are_equal(counts, np.full(10, 10))
+    assert edges.shape == (11,)
+
+
+def test_compute_histogram_range() -> None:
+    assert objects_are_allclose(
+        compute_histogram(pl.Series([0, 1, 2, 3, 4, 5, 6, 7, 8, 9]), bins=2, range=(2, 6)),
+        (np.array([2, 3]), np.array([2.0, 4.0, 6.0])),
+    )
+
+
+def test_compute_histogram_null_nan() -> None:
+    assert objects_are_allclose(
+        compute_histogram(pl.Series([1.0, None, float("nan"), 3.0, 2.0]), bins=2),
+        (np.array([1, 2]), np.array([1.0, 2.0, 3.0])),
+    )
+
+
+def test_compute_histogram_single_value() -> None:
+    assert objects_are_allclose(
+        compute_histogram(pl.Series([2, 2, 2]), bins=2),
+        (np.array([0, 3]), np.array([1.5, 2.0, 2.5])),
+    )
+
+
+def test_compute_histogram_empty() -> None:
+    assert objects_are_allclose(
+        compute_histogram(pl.Series([], dtype=pl.Float64), bins=2),
+        (np.array([0, 0]), np.array([0.0, 0.5, 1.0])),
+    )
+
+
+def test_compute_histogram_array() -> None:
+    assert objects_are_allclose(
+        compute_histogram(np.array([[1.0, 2.0], [np.nan, 3.0]]), bins=2),
+        (np.array([1, 2]), np.array([1.0, 2.0, 3.0])),
+    )
+
+
+def test_compute_histogram_sorted_array() -> None:
+    assert objects_are_allclose(
+        compute_histogram(SortedArray(np.array([3.0, np.nan, 1.0, 2.0])), bins=2),
+        (np.array([1, 2]), np.array([1.0, 2.0, 3.0])),
+    )
+
+
+@pytest.mark.parametrize("bins", [1, 7, 100])
+@pytest.mark.parametrize("range", [None, (-1.0, 1.0), (0.5, 10.0)])
+def test_compute_histogram_same_as_numpy(
+    bins: int, range: tuple[float, float] | None  # noqa: A002
+) -> None:
+    values = np.random.default_rng(42).normal(size=10000)
+    counts, edges = compute_histogram(pl.Series(values), bins=bins, range=range)
+    expected_counts, expected_edges = np.histogram(values, bins=bins, range=range)
+    assert objects_are_equal(counts, expected_counts)
+    assert objects_are_allclose(edges, expected_edges)
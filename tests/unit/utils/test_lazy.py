@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import polars as pl
+import pytest
+
+from flamme.utils.lazy import collect_expressions
+
+
+@pytest.fixture
+def dataframe() -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "float": [1.2, 4.2, None, 2.2],
+            "int": [None, 1, 0, 1],
+            "str": ["A", "B", None, None],
+        },
+        schema={"float": pl.Float64, "int": pl.Int64, "str": pl.String},
+    )
+
+
+#########################################
+#     Tests for collect_expressions     #
+#########################################
+
+
+def test_collect_expressions(dataframe: pl.DataFrame) -> None:
+    assert collect_expressions(
+        dataframe,
+        {
+            "num_rows": pl.len(),
+            "float_nulls": pl.col("float").null_count(),
+            "int_max": pl.col("int").max(),
+        },
+    ) == {"num_rows": 4, "float_nulls": 1, "int_max": 1}
+
+
+def test_collect_expressions_lazy(dataframe: pl.DataFrame) -> None:
+    assert collect_expressions(
+        dataframe.lazy(), {"num_rows": pl.len(), "str_nulls": pl.col("str").null_count()}
+    ) == {"num_rows": 4, "str_nulls": 2}
+
+
+def test_collect_expressions_implode(dataframe: pl.DataFrame) -> None:
+    assert collect_expressions(
+        dataframe, {"values": pl.col("int").drop_nulls().unique().sort().implode()}
+    ) == {"values": [0, 1]}
+
+
+def test_collect_expressions_same_name(dataframe: pl.DataFrame) -> None:
+    assert collect_expressions(dataframe, {"a": pl.col("int").sum(), "b": pl.col("int").sum()}) == {
+        "a": 2,
+        "b": 2,
+    }
+
+
+def test_collect_expressions_empty_expressions(dataframe: pl.DataFrame) -> None:
+    assert collect_expressions(dataframe, {}) == {}
+
+
+def test_collect_expressions_empty_rows() -> None:
+    assert collect_expressions(
+        pl.DataFrame({"float": []}, schema={"float": pl.Float64}),
+        {"num_rows": pl.len(), "nulls": pl.col("float").null_count()},
+    ) == {"num_rows": 0, "nulls": 0}
+
+
+def test_collect_expressions_not_aggregation(dataframe: pl.DataFrame) -> None:
+    with pytest.raises(RuntimeError, match="The expressions must return a single value"):
+        collect_expressions(dataframe, {"float": pl.col("float")})
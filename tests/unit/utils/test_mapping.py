@@ -1,6 +1,39 @@
 from __future__ import annotations
 
-from flamme.utils.mapping import sort_by_keys
+from flamme.utils.mapping import add_key_prefix, remove_key_prefix, sort_by_keys
+
+####################################
+#     Tests for add_key_prefix     #
+####################################
+
+
+def test_add_key_prefix() -> None:
+    assert add_key_prefix({"dog": 1, "cat": 5}, prefix="0/") == {"0/dog": 1, "0/cat": 5}
+
+
+def test_add_key_prefix_empty() -> None:
+    assert add_key_prefix({}, prefix="0/") == {}
+
+
+#######################################
+#     Tests for remove_key_prefix     #
+#######################################
+
+
+def test_remove_key_prefix() -> None:
+    assert remove_key_prefix({"0/dog": 1, "0/cat": 5, "1/fish": 2}, prefix="0/") == {
+        "dog": 1,
+        "cat": 5,
+    }
+
+
+def test_remove_key_prefix_nested() -> None:
+    assert remove_key_prefix({"1/0/dog": 1, "10/cat": 5}, prefix="1/") == {"0/dog": 1}
+
+
+def test_remove_key_prefix_empty() -> None:
+    assert remove_key_prefix({}, prefix="0/") == {}
+
 
 ##################################
 #     Tests for sort_by_keys     #
@@ -9,10 +9,13 @@ import pytest
 from coola import objects_are_equal
 from polars.testing import assert_frame_equal
 
+from flamme.utils.cache import enable_computation_cache
 from flamme.utils.null import (
     compute_null,
     compute_null_count,
+    compute_null_pattern_order,
     compute_temporal_null_count,
+    compute_temporal_null_matrix,
 )
 
 if TYPE_CHECKING:
@@ -134,6 +137,40 @@ def test_compute_null_count_empty() -> None:
     assert objects_are_equal(compute_null_count(pl.DataFrame({})), np.array([], dtype=np.int64))
 
 
+################################################
+#     Tests for compute_null_pattern_order     #
+################################################
+
+
+def test_compute_null_pattern_order() -> None:
+    order = compute_null_pattern_order(
+        nulls=np.array([[0, 0, 5, 5], [5, 5, 0, 0], [0, 1, 5, 5], [5, 4, 0, 0]]),
+        totals=np.array([5, 5, 5, 5]),
+    )
+    assert sorted(order.tolist()) == [0, 1, 2, 3]
+    # The columns with similar null patterns are next to each other.
+    position = {column: i for i, column in enumerate(order.tolist())}
+    assert abs(position[0] - position[2]) == 1
+    assert abs(position[1] - position[3]) == 1
+
+
+def test_compute_null_pattern_order_zero_total() -> None:
+    order = compute_null_pattern_order(
+        nulls=np.array([[0, 5], [0, 0], [0, 4]]), totals=np.array([0, 5])
+    )
+    assert sorted(order.tolist()) == [0, 1, 2]
+
+
+@pytest.mark.parametrize("num_columns", [0, 1, 2])
+def test_compute_null_pattern_order_few_columns(num_columns: int) -> None:
+    assert objects_are_equal(
+        compute_null_pattern_order(
+            nulls=np.zeros((num_columns, 3), dtype=int), totals=np.array([1, 2, 3])
+        ),
+        np.arange(num_columns),
+    )
+
+
 ################################################
 #    Tests for compute_temporal_null_count     #
 ################################################
@@ -248,3 +285,124 @@ def test_compute_temporal_null_count_biweekly(dataframe: pl.DataFrame) -> None:
             ["2019 week 52", "2020 week 04", "2020 week 08", "2020 week 12"],
         ),
     )
+
+
+@pytest.mark.parametrize("period", ["1mo", "2w", "1y"])
+def test_compute_temporal_null_count_base_period(dataframe: pl.DataFrame, period: str) -> None:
+    assert objects_are_equal(
+        compute_temporal_null_count(
+            frame=dataframe,
+            columns=["col1", "col2"],
+            dt_column="datetime",
+            period=period,
+            base_period="1d",
+        ),
+        compute_temporal_null_count(
+            frame=dataframe, columns=["col1", "col2"], dt_column="datetime", period=period
+        ),
+    )
+
+
+def test_compute_temporal_null_count_null_datetime(dataframe: pl.DataFrame) -> None:
+    with pytest.raises(ValueError, match="The datetime column has null values"):
+        compute_temporal_null_count(
+            frame=dataframe.with_columns(pl.lit(None, dtype=pl.Datetime).alias("datetime")),
+            columns=["col1", "col2"],
+            dt_column="datetime",
+            period="1mo",
+        )
+
+
+##################################################
+#    Tests for compute_temporal_null_matrix     #
+##################################################
+
+
+def test_compute_temporal_null_matrix(dataframe: pl.DataFrame) -> None:
+    assert objects_are_equal(
+        compute_temporal_null_matrix(
+            frame=dataframe, columns=["col1", "col2"], dt_column="datetime", period="1mo"
+        ),
+        (
+            np.array([[1, 0, 0, 0], [1, 0, 0, 1]], dtype=np.int64),
+            np.array([1, 1, 1, 1], dtype=np.int64),
+            ["2020-01", "2020-02", "2020-03", "2020-04"],
+        ),
+    )
+
+
+def test_compute_temporal_null_matrix_order(dataframe: pl.DataFrame) -> None:
+    assert objects_are_equal(
+        compute_temporal_null_matrix(
+            frame=dataframe, columns=("col2", "col1"), dt_column="datetime", period="1y"
+        ),
+        (
+            np.array([[2], [1]], dtype=np.int64),
+            np.array([4], dtype=np.int64),
+            ["2020"],
+        ),
+    )
+
+
+def test_compute_temporal_null_matrix_unsorted(dataframe: pl.DataFrame) -> None:
+    assert objects_are_equal(
+        compute_temporal_null_matrix(
+            frame=dataframe.reverse(), columns=["col2"], dt_column="datetime", period="1mo"
+        ),
+        (
+            np.array([[1, 0, 0, 1]], dtype=np.int64),
+            np.array([1, 1, 1, 1], dtype=np.int64),
+            ["2020-01", "2020-02", "2020-03", "2020-04"],
+        ),
+    )
+
+
+def test_compute_temporal_null_matrix_empty_columns(dataframe: pl.DataFrame) -> None:
+    assert objects_are_equal(
+        compute_temporal_null_matrix(
+            frame=dataframe, columns=[], dt_column="datetime", period="1mo"
+        ),
+        (
+            np.zeros((0, 4), dtype=np.int64),
+            np.array([1, 1, 1, 1], dtype=np.int64),
+            ["2020-01", "2020-02", "2020-03", "2020-04"],
+        ),
+    )
+
+
+def test_compute_temporal_null_matrix_empty(dataframe_empty: pl.DataFrame) -> None:
+    assert objects_are_equal(
+        compute_temporal_null_matrix(
+            frame=dataframe_empty, columns=["col1", "col2"], dt_column="datetime", period="1mo"
+        ),
+        (np.zeros((2, 0), dtype=np.int64), np.array([], dtype=np.int64), []),
+    )
+
+
+@pytest.mark.parametrize("period", ["1mo", "2w", "1y"])
+def test_compute_temporal_null_matrix_base_period(dataframe: pl.DataFrame, period: str) -> None:
+    assert objects_are_equal(
+        compute_temporal_null_matrix(
+            frame=dataframe,
+            columns=["col1", "col2"],
+            dt_column="datetime",
+            period=period,
+            base_period="1d",
+        ),
+        compute_temporal_null_matrix(
+            frame=dataframe, columns=["col1", "col2"], dt_column="datetime", period=period
+        ),
+    )
+
+
+def test_compute_temporal_null_matrix_cache(dataframe: pl.DataFrame) -> None:
+    with enable_computation_cache() as cache:
+        compute_temporal_null_matrix(
+            frame=dataframe, columns=["col2"], dt_column="datetime", period="1mo"
+        )
+        nulls, _, _ = compute_temporal_null_matrix(
+            frame=dataframe, columns=["col2"], dt_column="datetime", period="1mo"
+        )
+    assert cache.hits == 1
+    assert cache.misses == 1
+    assert objects_are_equal(nulls, np.array([[1, 0, 0, 1]], dtype=np.int64))
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import numpy as np
+import pytest
 from coola import objects_are_equal
 
+from flamme.utils.array import SortedArray
 from flamme.utils.range import find_range
+from flamme.utils.sketch import KllSketch
 
 ################################
 #     Tests for find_range     #
@@ -99,3 +102,69 @@ def test_find_range_nan_str() -> None:
         ),
         (1.0, 9.0),
     )
+
+
+def test_find_range_approximate() -> None:
+    assert objects_are_equal(
+        find_range(np.arange(101), xmin="q0.1", xmax="q0.9", approximate=True), (10.0, 90.0)
+    )
+
+
+def test_find_range_approximate_float() -> None:
+    assert objects_are_equal(find_range(np.arange(101), xmin=5.0, approximate=True), (5.0, 100))
+
+
+def test_find_range_approximate_large() -> None:
+    values = np.random.default_rng(42).normal(size=100_000)
+    xmin, xmax = find_range(values, xmin="q0.05", xmax="q0.95", approximate=True)
+    assert np.mean(values <= xmin) == pytest.approx(0.05, abs=0.01)
+    assert np.mean(values <= xmax) == pytest.approx(0.95, abs=0.01)
+
+
+def test_find_range_approximate_reproducible() -> None:
+    values = np.random.default_rng(42).normal(size=10_000)
+    assert objects_are_equal(
+        find_range(values, xmin="q0.05", xmax="q0.95", approximate=True, k=50, seed=1),
+        find_range(values, xmin="q0.05", xmax="q0.95", approximate=True, k=50, seed=1),
+    )
+
+
+def test_find_range_sketch() -> None:
+    sketch = KllSketch()
+    sketch.update(np.arange(101))
+    assert objects_are_equal(find_range(sketch), (0.0, 100.0))
+    assert objects_are_equal(find_range(sketch, xmin="q0.1", xmax="q0.9"), (10.0, 90.0))
+    assert objects_are_equal(find_range(sketch, xmin=5, xmax=50), (5, 50))
+
+
+def test_find_range_sketch_empty() -> None:
+    assert objects_are_equal(
+        find_range(KllSketch(), xmin="q0.1"), (float("nan"), float("nan")), equal_nan=True
+    )
+
+
+@pytest.mark.parametrize(
+    ("xmin", "xmax"),
+    [(None, None), ("q0.1", "q0.9"), (5, 50), ("q0", "q1"), (2.5, "q0.75"), ("q0.01", None)],
+)
+def test_find_range_sorted_array(xmin: float | str | None, xmax: float | str | None) -> None:
+    values = np.random.default_rng(42).normal(size=1000)
+    assert objects_are_equal(
+        find_range(SortedArray(values), xmin=xmin, xmax=xmax),
+        find_range(values, xmin=xmin, xmax=xmax),
+    )
+
+
+def test_find_range_sorted_array_nan() -> None:
+    assert objects_are_equal(
+        find_range(SortedArray(np.array([float("nan"), 0, 1, 2, 3, float("nan")])), xmin="q0.5"),
+        (1.5, 3.0),
+    )
+
+
+def test_find_range_sorted_array_empty() -> None:
+    assert objects_are_equal(
+        find_range(SortedArray(np.array([])), xmin="q0.1"),
+        (float("nan"), float("nan")),
+        equal_nan=True,
+    )
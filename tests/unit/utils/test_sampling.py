@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+from flamme.utils.sampling import ReservoirSampler
+
+######################################
+#     Tests for ReservoirSampler     #
+######################################
+
+
+def test_reservoir_sampler_repr() -> None:
+    assert repr(ReservoirSampler(num_rows=10)).startswith("ReservoirSampler(")
+
+
+def test_reservoir_sampler_incorrect_num_rows() -> None:
+    with pytest.raises(ValueError, match="num_rows must be greater or equal to 0"):
+        ReservoirSampler(num_rows=-1)
+
+
+def test_reservoir_sampler_sample_empty() -> None:
+    assert_frame_equal(ReservoirSampler(num_rows=10).sample, pl.DataFrame())
+
+
+def test_reservoir_sampler_update_small() -> None:
+    sampler = ReservoirSampler(num_rows=10)
+    sampler.update(pl.DataFrame({"col": [1, 2, 3]}))
+    sampler.update(pl.DataFrame({"col": [4, 5]}))
+    assert sampler.num_seen_rows == 5
+    assert_frame_equal(sampler.sample, pl.DataFrame({"col": [1, 2, 3, 4, 5]}))
+
+
+def test_reservoir_sampler_update_large() -> None:
+    sampler = ReservoirSampler(num_rows=100)
+    for i in range(10):
+        sampler.update(pl.DataFrame({"col": list(range(i * 1000, (i + 1) * 1000))}))
+    sample = sampler.sample
+    assert sampler.num_seen_rows == 10000
+    assert sample.shape == (100, 1)
+    assert sample["col"].is_sorted()
+    assert sample["col"].n_unique() == 100
+    # All the batches are represented in the sample.
+    assert (sample["col"] // 1000).n_unique() == 10
+
+
+def test_reservoir_sampler_update_empty_batch() -> None:
+    sampler = ReservoirSampler(num_rows=10)
+    sampler.update(pl.DataFrame({"col": []}, schema={"col": pl.Int64}))
+    assert_frame_equal(sampler.sample, pl.DataFrame({"col": []}, schema={"col": pl.Int64}))
+
+
+def test_reservoir_sampler_num_rows_0() -> None:
+    sampler = ReservoirSampler(num_rows=0)
+    sampler.update(pl.DataFrame({"col": [1, 2, 3]}))
+    assert sampler.sample.shape == (0, 1)
+
+
+def test_reservoir_sampler_seed() -> None:
+    samplers = [ReservoirSampler(num_rows=5, seed=1), ReservoirSampler(num_rows=5, seed=1)]
+    for sampler in samplers:
+        sampler.update(pl.DataFrame({"col": list(range(100))}))
+    assert_frame_equal(samplers[0].sample, samplers[1].sample)
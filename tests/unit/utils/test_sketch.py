@@ -0,0 +1,476 @@
+from __future__ import annotations
+
+import json
+import pickle
+from collections import Counter
+
+import numpy as np
+import polars as pl
+import pytest
+from coola import objects_are_allclose, objects_are_equal
+
+from flamme.utils.sketch import HyperLogLog, KllSketch, SpaceSaving
+
+QUANTILES = [0.01, 0.05, 0.1, 0.25, 0.5, 0.75, 0.9, 0.95, 0.99]
+
+
+def rank_error(values: np.ndarray, sketch: KllSketch) -> float:
+    values = np.sort(values)
+    estimates = sketch.quantile(QUANTILES)
+    return np.abs(np.searchsorted(values, estimates) / values.size - QUANTILES).max()
+
+
+###############################
+#     Tests for KllSketch     #
+###############################
+
+
+def test_kll_sketch_repr() -> None:
+    assert repr(KllSketch()).startswith("KllSketch(")
+
+
+@pytest.mark.parametrize("k", [8, 100, 200])
+def test_kll_sketch_k(k: int) -> None:
+    assert KllSketch(k=k).k == k
+
+
+def test_kll_sketch_incorrect_k() -> None:
+    with pytest.raises(ValueError, match="k must be greater or equal to 8"):
+        KllSketch(k=4)
+
+
+def test_kll_sketch_empty() -> None:
+    sketch = KllSketch()
+    assert sketch.count == 0
+    assert sketch.num_retained == 0
+    assert objects_are_equal(sketch.min, float("nan"), equal_nan=True)
+    assert objects_are_equal(sketch.max, float("nan"), equal_nan=True)
+    assert objects_are_equal(sketch.quantile(0.5), float("nan"), equal_nan=True)
+    assert objects_are_equal(
+        sketch.quantile([0.1, 0.9]), np.array([float("nan"), float("nan")]), equal_nan=True
+    )
+
+
+def test_kll_sketch_update() -> None:
+    sketch = KllSketch()
+    sketch.update(np.array([3.0, 1.0, float("nan"), 2.0]))
+    assert sketch.count == 3
+    assert sketch.min == 1.0
+    assert sketch.max == 3.0
+
+
+def test_kll_sketch_update_series() -> None:
+    sketch = KllSketch()
+    sketch.update(pl.Series([3, None, 1, 2]))
+    assert sketch.count == 3
+    assert sketch.quantile(0.5) == 2.0
+
+
+def test_kll_sketch_update_empty() -> None:
+    sketch = KllSketch()
+    sketch.update(np.array([]))
+    assert sketch.count == 0
+
+
+@pytest.mark.parametrize("q", [0.0, 0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99, 1.0])
+def test_kll_sketch_quantile_exact(q: float) -> None:
+    values = np.random.default_rng(42).normal(size=150)
+    sketch = KllSketch(k=200)
+    sketch.update(values)
+    assert sketch.quantile(q) == pytest.approx(np.quantile(values, q))
+
+
+@pytest.mark.parametrize("q", [0.0, 0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99, 1.0])
+def test_kll_sketch_quantile_nearest_exact(q: float) -> None:
+    values = np.random.default_rng(42).normal(size=150)
+    sketch = KllSketch(k=200)
+    sketch.update(values)
+    assert sketch.quantile(q, interpolation="nearest") == pl.Series(values).quantile(q)
+
+
+def test_kll_sketch_quantile_incorrect_interpolation() -> None:
+    sketch = KllSketch()
+    with pytest.raises(ValueError, match="Incorrect interpolation: cubic"):
+        sketch.quantile(0.5, interpolation="cubic")
+
+
+@pytest.mark.parametrize("k", [100, 200, 400])
+def test_kll_sketch_quantile_approximate(k: int) -> None:
+    values = np.random.default_rng(42).normal(size=100_000)
+    sketch = KllSketch(k=k, seed=0)
+    sketch.update(values)
+    assert sketch.count == 100_000
+    assert sketch.num_retained < 4 * k
+    assert rank_error(values, sketch) < 4.0 / k
+
+
+def test_kll_sketch_quantile_min_max() -> None:
+    values = np.random.default_rng(42).normal(size=10_000)
+    sketch = KllSketch(k=100, seed=0)
+    sketch.update(values)
+    assert objects_are_equal(sketch.quantile([0.0, 1.0]), np.array([values.min(), values.max()]))
+    assert objects_are_equal(
+        sketch.quantile([0.0, 1.0], interpolation="nearest"),
+        np.array([values.min(), values.max()]),
+    )
+
+
+def test_kll_sketch_merge() -> None:
+    sketch1, sketch2 = KllSketch(), KllSketch()
+    sketch1.update(np.array([1.0, 5.0]))
+    sketch2.update(np.array([3.0, 4.0, 2.0]))
+    sketch1.merge(sketch2)
+    assert sketch1.count == 5
+    assert sketch1.min == 1.0
+    assert sketch1.max == 5.0
+    assert sketch1.quantile(0.5) == 3.0
+    assert sketch2.count == 3
+
+
+def test_kll_sketch_merge_empty() -> None:
+    sketch = KllSketch()
+    sketch.update(np.array([1.0, 5.0]))
+    sketch.merge(KllSketch())
+    assert sketch.count == 2
+    assert sketch.quantile(1.0) == 5.0
+
+
+def test_kll_sketch_merge_into_empty() -> None:
+    other = KllSketch()
+    other.update(np.array([1.0, 5.0]))
+    sketch = KllSketch()
+    sketch.merge(other)
+    assert sketch.count == 2
+    assert sketch.min == 1.0
+    assert sketch.max == 5.0
+
+
+def test_kll_sketch_merge_incorrect_k() -> None:
+    with pytest.raises(ValueError, match="Cannot merge sketches with different k"):
+        KllSketch(k=100).merge(KllSketch(k=200))
+
+
+def test_kll_sketch_merge_partitions() -> None:
+    values = np.random.default_rng(42).normal(size=100_000)
+    sketches = []
+    for i, partition in enumerate(np.array_split(values, 10)):
+        sketch = KllSketch(k=200, seed=i)
+        sketch.update(partition)
+        sketches.append(sketch)
+    sketch = sketches[0]
+    for other in sketches[1:]:
+        sketch.merge(other)
+    assert sketch.count == 100_000
+    assert sketch.num_retained < 800
+    assert rank_error(values, sketch) < 0.02
+
+
+def test_kll_sketch_to_dict_from_dict() -> None:
+    sketch = KllSketch(k=50, seed=0)
+    sketch.update(np.random.default_rng(42).normal(size=10_000))
+    data = json.loads(json.dumps(sketch.to_dict()))
+    other = KllSketch.from_dict(data)
+    assert other.k == 50
+    assert other.count == 10_000
+    assert other.min == sketch.min
+    assert other.max == sketch.max
+    assert objects_are_equal(other.quantile(QUANTILES), sketch.quantile(QUANTILES))
+
+
+def test_kll_sketch_from_dict_merge() -> None:
+    sketch = KllSketch.from_dict(
+        {"k": 8, "count": 3, "min": 1.0, "max": 3.0, "levels": [[1.0, 2.0, 3.0]]}
+    )
+    sketch.update(np.array([4.0, 5.0]))
+    assert sketch.count == 5
+    assert objects_are_allclose(sketch.quantile([0.0, 0.5, 1.0]), np.array([1.0, 3.0, 5.0]))
+
+
+def test_kll_sketch_pickle() -> None:
+    sketch = KllSketch(seed=0)
+    sketch.update(np.arange(1000))
+    other = pickle.loads(pickle.dumps(sketch))  # noqa: S301
+    assert objects_are_equal(other.quantile(QUANTILES), sketch.quantile(QUANTILES))
+
+
+def test_kll_sketch_seed() -> None:
+    values = np.random.default_rng(42).normal(size=10_000)
+    sketch1, sketch2 = KllSketch(k=50, seed=1), KllSketch(k=50, seed=1)
+    sketch1.update(values)
+    sketch2.update(values)
+    assert objects_are_equal(sketch1.quantile(QUANTILES), sketch2.quantile(QUANTILES))
+
+
+#################################
+#     Tests for HyperLogLog     #
+#################################
+
+
+def test_hyperloglog_repr() -> None:
+    assert repr(HyperLogLog()).startswith("HyperLogLog(")
+
+
+@pytest.mark.parametrize("precision", [4, 12, 18])
+def test_hyperloglog_precision(precision: int) -> None:
+    assert HyperLogLog(precision=precision).precision == precision
+
+
+@pytest.mark.parametrize("precision", [3, 19])
+def test_hyperloglog_incorrect_precision(precision: int) -> None:
+    with pytest.raises(ValueError, match="precision must be between 4 and 18"):
+        HyperLogLog(precision=precision)
+
+
+def test_hyperloglog_estimate_empty() -> None:
+    assert HyperLogLog().estimate() == 0
+
+
+def test_hyperloglog_update_empty() -> None:
+    sketch = HyperLogLog()
+    sketch.update(np.array([]))
+    assert sketch.estimate() == 0
+
+
+def test_hyperloglog_update_small() -> None:
+    sketch = HyperLogLog()
+    sketch.update(np.array([1, 2, 3, 2, 1]))
+    assert sketch.estimate() == 3
+
+
+def test_hyperloglog_update_series_nulls() -> None:
+    sketch = HyperLogLog()
+    sketch.update(pl.Series(["a", "b", None, "a", None]))
+    assert sketch.estimate() == pl.Series(["a", "b", None, "a", None]).n_unique()
+
+
+def test_hyperloglog_update_nans() -> None:
+    sketch = HyperLogLog()
+    sketch.update(np.array([1.0, float("nan"), 2.0, float("nan")]))
+    assert sketch.estimate() == 3
+
+
+def test_hyperloglog_update_list() -> None:
+    sketch = HyperLogLog()
+    sketch.update(["a", "b", "a"])
+    assert sketch.estimate() == 2
+
+
+@pytest.mark.parametrize("precision", [10, 14])
+@pytest.mark.parametrize("num_uniques", [1_000, 50_000, 500_000])
+def test_hyperloglog_estimate_large(precision: int, num_uniques: int) -> None:
+    values = np.random.default_rng(42).permutation(np.repeat(np.arange(num_uniques), 2))
+    sketch = HyperLogLog(precision=precision)
+    sketch.update(values)
+    # The tolerance is about 4 times the relative standard error.
+    assert sketch.estimate() == pytest.approx(num_uniques, rel=4.2 / np.sqrt(2**precision))
+
+
+def test_hyperloglog_merge() -> None:
+    values = np.random.default_rng(42).integers(0, 20_000, size=100_000)
+    sketch = HyperLogLog()
+    sketch.update(values)
+    sketch1, sketch2 = HyperLogLog(), HyperLogLog()
+    sketch1.update(values[:40_000])
+    sketch2.update(values[40_000:])
+    sketch1.merge(sketch2)
+    assert sketch1.estimate() == sketch.estimate()
+
+
+def test_hyperloglog_merge_does_not_modify_other() -> None:
+    sketch1, sketch2 = HyperLogLog(), HyperLogLog()
+    sketch1.update([1, 2, 3])
+    sketch2.update([4])
+    sketch1.merge(sketch2)
+    assert sketch1.estimate() == 4
+    assert sketch2.estimate() == 1
+
+
+def test_hyperloglog_merge_incorrect_precision() -> None:
+    with pytest.raises(ValueError, match="Cannot merge sketches with different precisions"):
+        HyperLogLog(precision=10).merge(HyperLogLog(precision=12))
+
+
+def test_hyperloglog_to_dict_json() -> None:
+    sketch = HyperLogLog(precision=10)
+    sketch.update(np.arange(5_000))
+    other = HyperLogLog.from_dict(json.loads(json.dumps(sketch.to_dict())))
+    assert other.precision == 10
+    assert other.estimate() == sketch.estimate()
+
+
+def test_hyperloglog_from_dict_merge() -> None:
+    sketch = HyperLogLog.from_dict(HyperLogLog(precision=8).to_dict())
+    sketch.update([1, 2])
+    other = HyperLogLog(precision=8)
+    other.update([2, 3])
+    sketch.merge(other)
+    assert sketch.estimate() == 3
+
+
+def test_hyperloglog_from_dict_incorrect_registers() -> None:
+    with pytest.raises(ValueError, match="Incorrect number of registers"):
+        HyperLogLog.from_dict({"precision": 4, "registers": [0, 0, 0]})
+
+
+def test_hyperloglog_pickle() -> None:
+    sketch = HyperLogLog()
+    sketch.update(np.arange(1000))
+    other = pickle.loads(pickle.dumps(sketch))  # noqa: S301
+    assert other.estimate() == sketch.estimate()
+
+
+#################################
+#     Tests for SpaceSaving     #
+#################################
+
+
+def check_bounds(sketch: SpaceSaving, values: np.ndarray) -> None:
+    counter = Counter(values.tolist())
+    errors = sketch.get_errors()
+    for value, count in sketch.most_common():
+        assert counter[value] <= count
+        assert count - errors[value] <= counter[value]
+    for value, count in counter.items():
+        if value not in errors:
+            assert count <= sketch.max_error
+
+
+def test_space_saving_repr() -> None:
+    assert repr(SpaceSaving()).startswith("SpaceSaving(")
+
+
+@pytest.mark.parametrize("capacity", [1, 10, 1000])
+def test_space_saving_capacity(capacity: int) -> None:
+    assert SpaceSaving(capacity=capacity).capacity == capacity
+
+
+def test_space_saving_incorrect_capacity() -> None:
+    with pytest.raises(ValueError, match="capacity must be greater or equal to 1"):
+        SpaceSaving(capacity=0)
+
+
+def test_space_saving_empty() -> None:
+    sketch = SpaceSaving()
+    assert sketch.total == 0
+    assert sketch.null_count == 0
+    assert sketch.max_error == 0
+    assert sketch.num_retained == 0
+    assert sketch.most_common() == []
+    assert sketch.get_errors() == {}
+    assert objects_are_equal(sketch.to_counter(), Counter())
+
+
+def test_space_saving_update_exact() -> None:
+    values = ["a", "b", None, "a", "c", "a", None]
+    sketch = SpaceSaving()
+    sketch.update(pl.Series(values))
+    assert sketch.total == 7
+    assert sketch.null_count == 2
+    assert sketch.max_error == 0
+    assert objects_are_equal(sketch.to_counter(), Counter(values))
+    assert sketch.get_errors() == {"a": 0, "b": 0, "c": 0}
+
+
+def test_space_saving_update_list() -> None:
+    sketch = SpaceSaving()
+    sketch.update([1, 2, 1])
+    assert sketch.most_common() == [(1, 2), (2, 1)]
+
+
+def test_space_saving_update_empty() -> None:
+    sketch = SpaceSaving()
+    sketch.update(pl.Series([], dtype=pl.String))
+    assert sketch.total == 0
+    assert sketch.most_common() == []
+
+
+def test_space_saving_update_only_nulls() -> None:
+    sketch = SpaceSaving()
+    sketch.update(pl.Series([None, None], dtype=pl.String))
+    assert sketch.most_common() == [(None, 2)]
+
+
+def test_space_saving_update_batches_exact() -> None:
+    values = np.random.default_rng(42).integers(0, 50, size=1000)
+    sketch = SpaceSaving(capacity=50)
+    for batch in np.array_split(values, 7):
+        sketch.update(pl.Series(batch))
+    assert sketch.max_error == 0
+    assert objects_are_equal(dict(sketch.to_counter()), dict(Counter(values.tolist())))
+
+
+@pytest.mark.parametrize("capacity", [10, 100])
+def test_space_saving_update_batches_bounds(capacity: int) -> None:
+    values = np.random.default_rng(42).zipf(1.5, size=100_000)
+    sketch = SpaceSaving(capacity=capacity)
+    for batch in np.array_split(values, 20):
+        sketch.update(pl.Series(batch))
+    assert sketch.total == 100_000
+    assert sketch.num_retained == capacity
+    check_bounds(sketch, values)
+    assert [value for value, _ in sketch.most_common(3)] == [1, 2, 3]
+
+
+def test_space_saving_merge() -> None:
+    sketch1, sketch2 = SpaceSaving(), SpaceSaving()
+    sketch1.update(["a", "b", "a", None])
+    sketch2.update(["b", "c", "b"])
+    sketch1.merge(sketch2)
+    assert sketch1.total == 7
+    assert sketch1.null_count == 1
+    assert objects_are_equal(sketch1.to_counter(), Counter({"b": 3, "a": 2, "c": 1, None: 1}))
+    assert sketch2.total == 3
+
+
+def test_space_saving_merge_empty() -> None:
+    sketch = SpaceSaving()
+    sketch.update(["a", "b", "a"])
+    sketch.merge(SpaceSaving())
+    assert sketch.most_common() == [("a", 2), ("b", 1)]
+
+
+def test_space_saving_merge_into_empty() -> None:
+    sketch, other = SpaceSaving(), SpaceSaving()
+    other.update(["a", "b", "a"])
+    sketch.merge(other)
+    assert sketch.most_common() == [("a", 2), ("b", 1)]
+
+
+def test_space_saving_merge_bounds() -> None:
+    values = np.random.default_rng(42).zipf(1.5, size=100_000)
+    sketches = []
+    for batch in np.array_split(values, 10):
+        sketch = SpaceSaving(capacity=50)
+        sketch.update(pl.Series(batch))
+        sketches.append(sketch)
+    sketch = sketches[0]
+    for other in sketches[1:]:
+        sketch.merge(other)
+    assert sketch.total == 100_000
+    check_bounds(sketch, values)
+
+
+def test_space_saving_to_dict_json() -> None:
+    sketch = SpaceSaving(capacity=5)
+    sketch.update(pl.Series(np.random.default_rng(42).integers(0, 20, size=1000)))
+    sketch.update(pl.Series([None], dtype=pl.Int64))
+    other = SpaceSaving.from_dict(json.loads(json.dumps(sketch.to_dict())))
+    assert other.capacity == 5
+    assert other.total == sketch.total
+    assert other.null_count == 1
+    assert other.max_error == sketch.max_error
+    assert other.most_common() == sketch.most_common()
+    assert other.get_errors() == sketch.get_errors()
+
+
+def test_space_saving_to_dict_empty() -> None:
+    sketch = SpaceSaving.from_dict(SpaceSaving(capacity=3).to_dict())
+    assert sketch.capacity == 3
+    assert sketch.most_common() == []
+
+
+def test_space_saving_pickle() -> None:
+    sketch = SpaceSaving(capacity=5)
+    sketch.update(pl.Series(np.random.default_rng(42).integers(0, 20, size=1000)))
+    other = pickle.loads(pickle.dumps(sketch))  # noqa: S301
+    assert other.most_common() == sketch.most_common()
@@ -1,17 +1,128 @@
 from __future__ import annotations
 
+from unittest.mock import patch
+
 import numpy as np
 import polars as pl
 import pytest
-from coola import objects_are_allclose
+from coola import objects_are_allclose, objects_are_equal
 
+from flamme.utils.array import SortedArray
+from flamme.utils.sketch import KllSketch
 from flamme.utils.stats import (
+    ContinuousStatisticsSketch,
     compute_statistics_continuous,
     compute_statistics_continuous_array,
+    compute_statistics_continuous_frame,
     compute_statistics_continuous_series,
+    get_statistics_continuous_expression,
     quantile,
 )
 
+################################################
+#     Tests for ContinuousStatisticsSketch     #
+################################################
+
+
+def test_continuous_statistics_sketch_repr() -> None:
+    assert repr(ContinuousStatisticsSketch()) == "ContinuousStatisticsSketch(count=0)"
+
+
+def test_continuous_statistics_sketch_count() -> None:
+    sketch = ContinuousStatisticsSketch()
+    sketch.update(pl.Series([1.0, None, 3.0]))
+    sketch.update(pl.Series([4.0, float("nan")]))
+    assert sketch.count == 5
+
+
+@pytest.mark.parametrize("batch_size", [1, 7, 100, 1000])
+def test_continuous_statistics_sketch_get_statistics(batch_size: int) -> None:
+    # The quantile sketch is exact because it keeps all the values.
+    series = pl.Series(
+        np.concatenate([np.random.default_rng(42).lognormal(size=147), [np.nan, -1.0, 0.0]])
+    ).extend(pl.Series([None, None], dtype=pl.Float64))
+    sketch = ContinuousStatisticsSketch()
+    for batch in series.to_frame().iter_slices(n_rows=batch_size):
+        sketch.update(batch.to_series())
+    stats = sketch.get_statistics()
+    expected = compute_statistics_continuous_series(series)
+    assert abs(stats.pop("nunique") - expected.pop("nunique")) <= 2
+    assert objects_are_allclose(stats, expected, rtol=1e-8)
+
+
+def test_continuous_statistics_sketch_get_statistics_int() -> None:
+    sketch = ContinuousStatisticsSketch()
+    sketch.update(pl.Series([None, *list(range(50))]))
+    sketch.update(pl.Series([*list(range(50, 101)), None]))
+    stats = sketch.get_statistics()
+    expected = compute_statistics_continuous_series(pl.Series([None, *list(range(101)), None]))
+    assert abs(stats.pop("nunique") - expected.pop("nunique")) <= 2
+    assert objects_are_allclose(stats, expected)
+
+
+def test_continuous_statistics_sketch_get_statistics_single_numeric_value() -> None:
+    sketch = ContinuousStatisticsSketch()
+    sketch.update(pl.Series([1.0, 1.0]))
+    sketch.update(pl.Series([1.0]))
+    stats = sketch.get_statistics()
+    assert objects_are_allclose(
+        (stats["mean"], stats["std"], stats["skewness"], stats["kurtosis"]),
+        (1.0, 0.0, float("nan"), float("nan")),
+        equal_nan=True,
+    )
+
+
+def test_continuous_statistics_sketch_get_statistics_empty() -> None:
+    assert objects_are_allclose(
+        ContinuousStatisticsSketch().get_statistics(),
+        compute_statistics_continuous_series(pl.Series([], dtype=pl.Float64)),
+        equal_nan=True,
+    )
+
+
+def test_continuous_statistics_sketch_get_statistics_only_nulls() -> None:
+    sketch = ContinuousStatisticsSketch()
+    sketch.update(pl.Series([None, None], dtype=pl.Float64))
+    assert objects_are_allclose(
+        sketch.get_statistics(),
+        compute_statistics_continuous_series(pl.Series([None, None], dtype=pl.Float64)),
+        equal_nan=True,
+    )
+
+
+def test_continuous_statistics_sketch_get_statistics_large() -> None:
+    values = np.random.default_rng(42).normal(size=100_000)
+    sketch = ContinuousStatisticsSketch()
+    for batch in np.array_split(values, 10):
+        sketch.update(pl.Series(batch))
+    stats = sketch.get_statistics()
+    expected = compute_statistics_continuous_series(pl.Series(values))
+    assert objects_are_allclose(
+        {key: stats[key] for key in ("count", "mean", "std", "skewness", "kurtosis", "min", "max")},
+        {
+            key: expected[key]
+            for key in ("count", "mean", "std", "skewness", "kurtosis", "min", "max")
+        },
+        rtol=1e-8,
+    )
+    assert abs(stats["median"] - expected["median"]) < 0.05
+    assert abs(stats["nunique"] - expected["nunique"]) / expected["nunique"] < 0.05
+
+
+def test_continuous_statistics_sketch_get_quantile_values() -> None:
+    sketch = ContinuousStatisticsSketch()
+    sketch.update(pl.Series(np.arange(101)))
+    assert objects_are_allclose(
+        sketch.get_quantile_values(5), np.array([0.0, 25.0, 50.0, 75.0, 100.0])
+    )
+
+
+def test_continuous_statistics_sketch_get_quantile_values_empty() -> None:
+    assert objects_are_equal(
+        ContinuousStatisticsSketch().get_quantile_values(5), np.zeros(0, dtype=np.float64)
+    )
+
+
 ###################################################
 #     Tests for compute_statistics_continuous     #
 ###################################################
@@ -122,6 +233,14 @@ def test_compute_statistics_continuous_with_null(data: np.ndarray | pl.Series) -
     )
 
 
+@pytest.mark.parametrize("data", [np.arange(101), pl.Series(list(range(101)))])
+def test_compute_statistics_continuous_approximate(data: np.ndarray | pl.Series) -> None:
+    assert objects_are_allclose(
+        compute_statistics_continuous(data, approximate=True),
+        compute_statistics_continuous(data),
+    )
+
+
 #########################################################
 #     Tests for compute_statistics_continuous_array     #
 #########################################################
@@ -293,6 +412,67 @@ def test_compute_statistics_continuous_array_only_nans() -> None:
     )
 
 
+def test_compute_statistics_continuous_array_approximate() -> None:
+    array = np.random.default_rng(42).normal(size=100_000)
+    stats = compute_statistics_continuous_array(array, approximate=True)
+    expected = compute_statistics_continuous_array(array)
+    for key in ["count", "nunique", "num_non_nulls", "num_nulls", "mean", "std", "min", "max"]:
+        assert stats[key] == pytest.approx(expected[key])
+    # The sketch is seeded, so the rank error of the approximated
+    # quantiles is deterministic and below 1%.
+    for key, q in [
+        ("q05", 0.05),
+        ("q10", 0.1),
+        ("q25", 0.25),
+        ("median", 0.5),
+        ("q75", 0.75),
+        ("q90", 0.9),
+        ("q95", 0.95),
+    ]:
+        assert np.mean(array <= stats[key]) == pytest.approx(q, abs=0.01)
+
+
+def test_compute_statistics_continuous_array_approximate_does_not_sort() -> None:
+    array = np.array([3.0, -1.0, float("nan"), 0.0, 2.0, 2.0])
+    with patch.object(SortedArray, "__init__", return_value=None) as sorted_array:
+        stats = compute_statistics_continuous_array(array, approximate=True)
+    sorted_array.assert_not_called()
+    assert objects_are_equal(
+        {key: stats[key] for key in ["count", "nunique", "num_nulls", "min", "max"]},
+        {"count": 6, "nunique": 5, "num_nulls": 1, "min": -1.0, "max": 3.0},
+    )
+    assert objects_are_equal(
+        {key: stats[key] for key in [">0", "<0", "=0"]}, {">0": 3, "<0": 1, "=0": 1}
+    )
+
+
+def test_compute_statistics_continuous_array_approximate_nunique() -> None:
+    array = np.random.default_rng(42).integers(0, 50_000, size=200_000).astype(np.float64)
+    array[:10] = float("nan")
+    stats = compute_statistics_continuous_array(array, approximate_nunique=True)
+    expected = compute_statistics_continuous_array(array)
+    assert stats["nunique"] == pytest.approx(expected["nunique"], rel=0.05)
+    assert objects_are_equal(
+        {key: value for key, value in stats.items() if key != "nunique"},
+        {key: value for key, value in expected.items() if key != "nunique"},
+    )
+
+
+def test_compute_statistics_continuous_array_approximate_nunique_small() -> None:
+    stats = compute_statistics_continuous_array(
+        np.array([1.0, 2.0, float("nan"), 2.0, float("nan")]), approximate_nunique=True
+    )
+    assert stats["nunique"] == 3
+
+
+def test_compute_statistics_continuous_array_approximate_only_nans() -> None:
+    stats = compute_statistics_continuous_array(
+        np.array([float("nan"), float("nan")]), approximate=True
+    )
+    assert stats["num_nulls"] == 2
+    assert np.isnan(stats["median"])
+
+
 ##########################################################
 #     Tests for compute_statistics_continuous_series     #
 ##########################################################
@@ -464,6 +644,194 @@ def test_compute_statistics_continuous_series_only_nans() -> None:
     )
 
 
+def test_compute_statistics_continuous_series_approximate() -> None:
+    series = pl.Series([1.0, None, 2.0, 3.0, None, 4.0])
+    assert objects_are_allclose(
+        compute_statistics_continuous_series(series, approximate=True),
+        compute_statistics_continuous_series(series),
+    )
+
+
+def test_compute_statistics_continuous_series_approximate_nunique() -> None:
+    series = pl.Series([1.0, None, 2.0, 3.0, None, 4.0])
+    assert objects_are_equal(
+        compute_statistics_continuous_series(series, approximate_nunique=True),
+        compute_statistics_continuous_series(series),
+    )
+
+
+#########################################################
+#     Tests for compute_statistics_continuous_frame     #
+#########################################################
+
+
+def test_compute_statistics_continuous_frame() -> None:
+    stats = compute_statistics_continuous_frame(
+        pl.DataFrame({"col1": list(range(101)), "col2": [float(i) - 50 for i in range(101)]})
+    )
+    assert stats.columns == [
+        "column",
+        "count",
+        "nunique",
+        "num_non_nulls",
+        "num_nulls",
+        "mean",
+        "std",
+        "skewness",
+        "kurtosis",
+        "min",
+        "q001",
+        "q01",
+        "q05",
+        "q10",
+        "q25",
+        "median",
+        "q75",
+        "q90",
+        "q95",
+        "q99",
+        "q999",
+        "max",
+        ">0",
+        "<0",
+        "=0",
+    ]
+    assert objects_are_allclose(
+        stats.row(0, named=True),
+        {
+            "column": "col1",
+            "count": 101,
+            "nunique": 101,
+            "num_non_nulls": 101,
+            "num_nulls": 0,
+            "mean": 50.0,
+            "std": 29.154759474226502,
+            "skewness": 0.0,
+            "kurtosis": -1.2002400240024003,
+            "min": 0.0,
+            "q001": 0.1,
+            "q01": 1.0,
+            "q05": 5.0,
+            "q10": 10.0,
+            "q25": 25.0,
+            "median": 50.0,
+            "q75": 75.0,
+            "q90": 90.0,
+            "q95": 95.0,
+            "q99": 99.0,
+            "q999": 99.9,
+            "max": 100.0,
+            ">0": 100,
+            "<0": 0,
+            "=0": 1,
+        },
+    )
+    assert objects_are_allclose(
+        stats.row(1, named=True),
+        {
+            "column": "col2",
+            "count": 101,
+            "nunique": 101,
+            "num_non_nulls": 101,
+            "num_nulls": 0,
+            "mean": 0.0,
+            "std": 29.154759474226502,
+            "skewness": 0.0,
+            "kurtosis": -1.2002400240024003,
+            "min": -50.0,
+            "q001": -49.9,
+            "q01": -49.0,
+            "q05": -45.0,
+            "q10": -40.0,
+            "q25": -25.0,
+            "median": 0.0,
+            "q75": 25.0,
+            "q90": 40.0,
+            "q95": 45.0,
+            "q99": 49.0,
+            "q999": 49.9,
+            "max": 50.0,
+            ">0": 50,
+            "<0": 50,
+            "=0": 1,
+        },
+    )
+
+
+@pytest.mark.parametrize(
+    "series",
+    [
+        pl.Series([1.2, None, float("nan"), -4.0, 0.0, 2.5, None, 7.5], dtype=pl.Float64),
+        pl.Series([1, None, 3, -4, 0, 2, None, 7], dtype=pl.Int64),
+        pl.Series([1.0, 2.0, float("nan")], dtype=pl.Float32),
+        pl.Series([None, None], dtype=pl.Float64),
+        pl.Series([float("nan"), float("nan")], dtype=pl.Float64),
+        pl.Series([4.2], dtype=pl.Float64),
+    ],
+)
+def test_compute_statistics_continuous_frame_same_as_series(series: pl.Series) -> None:
+    stats = compute_statistics_continuous_frame(pl.DataFrame({"col": series})).row(0, named=True)
+    assert stats.pop("column") == "col"
+    assert objects_are_allclose(stats, compute_statistics_continuous_series(series), equal_nan=True)
+
+
+def test_compute_statistics_continuous_frame_columns() -> None:
+    stats = compute_statistics_continuous_frame(
+        pl.DataFrame({"col1": [1, 2, 3], "col2": [1.0, 2.0, 3.0], "col3": ["a", "b", "c"]}),
+        columns=["col2"],
+    )
+    assert stats["column"].to_list() == ["col2"]
+
+
+def test_compute_statistics_continuous_frame_numeric_columns() -> None:
+    stats = compute_statistics_continuous_frame(
+        pl.DataFrame({"col1": [1, 2, 3], "col2": [1.0, 2.0, 3.0], "col3": ["a", "b", "c"]})
+    )
+    assert stats["column"].to_list() == ["col1", "col2"]
+
+
+def test_compute_statistics_continuous_frame_no_columns() -> None:
+    stats = compute_statistics_continuous_frame(pl.DataFrame({"col": [1, 2, 3]}), columns=[])
+    assert stats.shape == (0, 25)
+    assert stats.schema["count"] == pl.Int64
+    assert stats.schema["mean"] == pl.Float64
+
+
+def test_compute_statistics_continuous_frame_empty() -> None:
+    stats = compute_statistics_continuous_frame(
+        pl.DataFrame({"col": []}, schema={"col": pl.Float64})
+    ).row(0, named=True)
+    assert stats["count"] == 0
+    assert stats[">0"] == 0
+    assert np.isnan(stats["mean"])
+    assert np.isnan(stats["median"])
+
+
+##########################################################
+#     Tests for get_statistics_continuous_expression     #
+##########################################################
+
+
+def test_get_statistics_continuous_expression() -> None:
+    series = pl.Series([1.2, None, float("nan"), -4.0, 0.0, 2.5, None, 7.5])
+    stats = pl.DataFrame({"col": series}).select(get_statistics_continuous_expression("col"))
+    assert stats.shape == (1, 1)
+    assert objects_are_allclose(
+        stats.item(), compute_statistics_continuous_series(series), equal_nan=True
+    )
+
+
+def test_get_statistics_continuous_expression_empty() -> None:
+    stats = (
+        pl.DataFrame({"col": []}, schema={"col": pl.Int64})
+        .select(get_statistics_continuous_expression("col"))
+        .item()
+    )
+    assert stats["count"] == 0
+    assert np.isnan(stats["mean"])
+    assert np.isnan(stats["q99"])
+
+
 ##############################
 #     Tests for quantile     #
 ##############################
@@ -499,3 +867,61 @@ def test_quantile_empty() -> None:
         {0.1: float("nan"), 0.5: float("nan"), 0.9: float("nan")},
         equal_nan=True,
     )
+
+
+def test_quantile_approximate() -> None:
+    assert objects_are_allclose(
+        quantile(np.arange(101), q=[0.1, 0.5, 0.9], approximate=True),
+        {0.1: 10.0, 0.5: 50.0, 0.9: 90.0},
+    )
+
+
+def test_quantile_approximate_reproducible() -> None:
+    array = np.random.default_rng(42).normal(size=10_000)
+    assert quantile(array, q=[0.05, 0.5, 0.95], approximate=True) == quantile(
+        array, q=[0.05, 0.5, 0.95], approximate=True
+    )
+
+
+def test_quantile_approximate_k_seed() -> None:
+    array = np.random.default_rng(42).normal(size=10_000)
+    assert quantile(array, q=[0.05, 0.5, 0.95], approximate=True, k=50, seed=1) == quantile(
+        array, q=[0.05, 0.5, 0.95], approximate=True, k=50, seed=1
+    )
+
+
+def test_quantile_sketch() -> None:
+    sketch = KllSketch()
+    sketch.update(np.arange(101))
+    assert objects_are_allclose(
+        quantile(sketch, q=[0.1, 0.5, 0.9]), {0.1: 10.0, 0.5: 50.0, 0.9: 90.0}
+    )
+
+
+def test_quantile_sorted_array() -> None:
+    values = np.random.default_rng(42).normal(size=1001)
+    q = [0.001, 0.01, 0.25, 0.5, 0.75, 0.99, 0.999]
+    assert objects_are_equal(quantile(SortedArray(values), q=q), quantile(values, q=q))
+
+
+def test_quantile_sorted_array_empty() -> None:
+    assert objects_are_allclose(
+        quantile(SortedArray(np.array([])), q=[0.1, 0.5]),
+        {0.1: float("nan"), 0.5: float("nan")},
+        equal_nan=True,
+    )
+
+
+def test_quantile_sorted_array_approximate() -> None:
+    assert objects_are_allclose(
+        quantile(SortedArray(np.arange(101)), q=[0.1, 0.5], approximate=True),
+        {0.1: 10.0, 0.5: 50.0},
+    )
+
+
+def test_quantile_sketch_empty() -> None:
+    assert objects_are_allclose(
+        quantile(KllSketch(), q=[0.1, 0.5]),
+        {0.1: float("nan"), 0.5: float("nan")},
+        equal_nan=True,
+    )
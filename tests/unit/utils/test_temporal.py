@@ -1,18 +1,184 @@
 from __future__ import annotations
 
+import gc
 from datetime import datetime, timezone
 
+import numpy as np
 import polars as pl
 import pytest
 from coola import objects_are_equal
 from polars.testing import assert_frame_equal
 
+from flamme.utils.cache import ComputationCache, enable_computation_cache
 from flamme.utils.temporal import (
+    TemporalIndex,
+    _indices,
+    compute_temporal_sketches,
     compute_temporal_stats,
+    get_temporal_index,
     to_step_names,
     to_temporal_frames,
 )
 
+###################################
+#     Tests for TemporalIndex     #
+###################################
+
+
+@pytest.fixture
+def datetimes() -> pl.Series:
+    return pl.Series(
+        "datetime",
+        [
+            datetime(year=2020, month=4, day=3, tzinfo=timezone.utc),
+            datetime(year=2020, month=1, day=1, tzinfo=timezone.utc),
+            datetime(year=2020, month=1, day=2, tzinfo=timezone.utc),
+            datetime(year=2020, month=1, day=3, tzinfo=timezone.utc),
+            datetime(year=2020, month=2, day=3, tzinfo=timezone.utc),
+            datetime(year=2020, month=3, day=3, tzinfo=timezone.utc),
+        ],
+        dtype=pl.Datetime(time_unit="us", time_zone="UTC"),
+    )
+
+
+def test_temporal_index_len(datetimes: pl.Series) -> None:
+    assert len(TemporalIndex(datetimes)) == 6
+
+
+def test_temporal_index_repr(datetimes: pl.Series) -> None:
+    assert repr(TemporalIndex(datetimes)).startswith("TemporalIndex(")
+
+
+def test_temporal_index_is_sorted_false(datetimes: pl.Series) -> None:
+    assert not TemporalIndex(datetimes).is_sorted
+
+
+def test_temporal_index_is_sorted_true(datetimes: pl.Series) -> None:
+    assert TemporalIndex(datetimes.sort()).is_sorted
+
+
+def test_temporal_index_sort(datetimes: pl.Series) -> None:
+    index = TemporalIndex(datetimes)
+    assert_frame_equal(
+        index.sort(pl.DataFrame({"col": [0, 1, 2, 3, 4, 5], "datetime": datetimes})),
+        pl.DataFrame({"col": [1, 2, 3, 4, 5, 0], "datetime": datetimes.sort()}),
+    )
+
+
+def test_temporal_index_sort_already_sorted(datetimes: pl.Series) -> None:
+    frame = pl.DataFrame({"col": [0, 1, 2, 3, 4, 5], "datetime": datetimes.sort()})
+    assert TemporalIndex(frame["datetime"]).sort(frame) is frame
+
+
+def test_temporal_index_sort_incorrect_num_rows(datetimes: pl.Series) -> None:
+    index = TemporalIndex(datetimes)
+    with pytest.raises(ValueError, match="The DataFrame has 2 rows but the temporal index has"):
+        index.sort(pl.DataFrame({"col": [0, 1]}))
+
+
+def test_temporal_index_get_offsets_monthly(datetimes: pl.Series) -> None:
+    assert objects_are_equal(
+        TemporalIndex(datetimes).get_offsets("1mo"), np.array([0, 3, 4, 5, 6], dtype=np.int64)
+    )
+
+
+def test_temporal_index_get_offsets_yearly(datetimes: pl.Series) -> None:
+    assert objects_are_equal(
+        TemporalIndex(datetimes).get_offsets("1y"), np.array([0, 6], dtype=np.int64)
+    )
+
+
+def test_temporal_index_get_offsets_empty() -> None:
+    index = TemporalIndex(pl.Series([], dtype=pl.Datetime(time_unit="us", time_zone="UTC")))
+    assert objects_are_equal(index.get_offsets("1mo"), np.array([0], dtype=np.int64))
+
+
+def test_temporal_index_get_offsets_null() -> None:
+    index = TemporalIndex(
+        pl.Series([datetime(year=2020, month=1, day=1, tzinfo=timezone.utc), None])
+    )
+    with pytest.raises(ValueError, match="The datetime column has null values"):
+        index.get_offsets("1mo")
+
+
+def test_temporal_index_get_offsets_read_only(datetimes: pl.Series) -> None:
+    assert not TemporalIndex(datetimes).get_offsets("1mo").flags.writeable
+
+
+@pytest.mark.parametrize("period", ["1h", "1d", "3d", "1w", "2w", "1mo", "1y"])
+def test_temporal_index_same_windows_as_group_by_dynamic(datetimes: pl.Series, period: str) -> None:
+    index = TemporalIndex(datetimes)
+    groups = (
+        pl.DataFrame({"datetime": datetimes})
+        .sort("datetime")
+        .group_by_dynamic("datetime", every=period)
+    )
+    assert objects_are_equal(
+        np.diff(index.get_offsets(period)).tolist(), groups.agg(pl.len())["len"].to_list()
+    )
+    assert objects_are_equal(index.get_step_names(period), to_step_names(groups, period))
+
+
+def test_temporal_index_get_step_names_monthly(datetimes: pl.Series) -> None:
+    assert objects_are_equal(
+        TemporalIndex(datetimes).get_step_names("1mo"),
+        ["2020-01", "2020-02", "2020-03", "2020-04"],
+    )
+
+
+def test_temporal_index_get_step_names_empty() -> None:
+    index = TemporalIndex(pl.Series([], dtype=pl.Datetime(time_unit="us", time_zone="UTC")))
+    assert objects_are_equal(index.get_step_names("1mo"), [])
+
+
+def test_temporal_index_split(datetimes: pl.Series) -> None:
+    frames = TemporalIndex(datetimes).split(pl.DataFrame({"col": [0, 1, 2, 3, 4, 5]}), period="1mo")
+    assert objects_are_equal(
+        frames,
+        [
+            pl.DataFrame({"col": [1, 2, 3]}),
+            pl.DataFrame({"col": [4]}),
+            pl.DataFrame({"col": [5]}),
+            pl.DataFrame({"col": [0]}),
+        ],
+    )
+
+
+########################################
+#     Tests for get_temporal_index     #
+########################################
+
+
+def test_get_temporal_index(datetimes: pl.Series) -> None:
+    index = get_temporal_index(pl.DataFrame({"datetime": datetimes}), dt_column="datetime")
+    assert isinstance(index, TemporalIndex)
+    assert len(index) == 6
+
+
+def test_get_temporal_index_memoized(datetimes: pl.Series) -> None:
+    frame = pl.DataFrame({"col": [0, 1, 2, 3, 4, 5], "datetime": datetimes})
+    index = get_temporal_index(frame, dt_column="datetime")
+    assert get_temporal_index(frame, dt_column="datetime") is index
+    assert get_temporal_index(frame.clone(), dt_column="datetime") is not index
+
+
+def test_get_temporal_index_cache(datetimes: pl.Series) -> None:
+    frame = pl.DataFrame({"col": [0, 1, 2, 3, 4, 5], "datetime": datetimes})
+    with enable_computation_cache(ComputationCache(max_bytes=0)):
+        index = get_temporal_index(frame, dt_column="datetime")
+        assert get_temporal_index(frame, dt_column="datetime") is index
+
+
+def test_get_temporal_index_remove_frame(datetimes: pl.Series) -> None:
+    frame = pl.DataFrame({"datetime": datetimes})
+    get_temporal_index(frame, dt_column="datetime")
+    key = (id(frame), "datetime")
+    assert key in _indices
+    del frame
+    gc.collect()
+    assert key not in _indices
+
+
 ############################################
 #     Tests for compute_temporal_stats     #
 ############################################
@@ -87,6 +253,83 @@ def test_compute_temporal_stats() -> None:
     )
 
 
+def test_compute_temporal_stats_base_period() -> None:
+    frame = pl.DataFrame(
+        {
+            "col": [1.2, 4.2, 0.0, 1.0, 4.2, 42.0],
+            "datetime": [
+                datetime(year=2020, month=1, day=3, tzinfo=timezone.utc),
+                datetime(year=2020, month=1, day=4, tzinfo=timezone.utc),
+                datetime(year=2020, month=1, day=5, tzinfo=timezone.utc),
+                datetime(year=2020, month=2, day=3, tzinfo=timezone.utc),
+                datetime(year=2020, month=3, day=3, tzinfo=timezone.utc),
+                datetime(year=2020, month=4, day=3, tzinfo=timezone.utc),
+            ],
+        },
+        schema={"col": pl.Float64, "datetime": pl.Datetime(time_unit="us", time_zone="UTC")},
+    )
+    stats = compute_temporal_stats(
+        frame=frame, column="col", dt_column="datetime", period="1mo", base_period="1d"
+    )
+    assert_frame_equal(
+        stats.select("step", "count", "mean", "min", "q25", "q75", "max"),
+        compute_temporal_stats(
+            frame=frame, column="col", dt_column="datetime", period="1mo"
+        ).select("step", "count", "mean", "min", "q25", "q75", "max"),
+    )
+    assert stats["nunique"].null_count() == 4
+
+
+def test_compute_temporal_stats_approximate() -> None:
+    frame = pl.DataFrame(
+        {
+            "col": [1.2, 4.2, 0.0, 1.0, 4.2, 42.0, None],
+            "datetime": [
+                datetime(year=2020, month=1, day=3, tzinfo=timezone.utc),
+                datetime(year=2020, month=1, day=4, tzinfo=timezone.utc),
+                datetime(year=2020, month=1, day=5, tzinfo=timezone.utc),
+                datetime(year=2020, month=2, day=3, tzinfo=timezone.utc),
+                datetime(year=2020, month=3, day=3, tzinfo=timezone.utc),
+                datetime(year=2020, month=4, day=3, tzinfo=timezone.utc),
+                datetime(year=2020, month=5, day=3, tzinfo=timezone.utc),
+            ],
+        },
+        schema={"col": pl.Float64, "datetime": pl.Datetime(time_unit="us", time_zone="UTC")},
+    )
+    # The quantiles are exact for small temporal windows.
+    assert_frame_equal(
+        compute_temporal_stats(
+            frame=frame, column="col", dt_column="datetime", period="1mo", approximate=True
+        ),
+        compute_temporal_stats(frame=frame, column="col", dt_column="datetime", period="1mo"),
+    )
+
+
+def test_compute_temporal_stats_approximate_large() -> None:
+    rng = np.random.default_rng(42)
+    frame = pl.DataFrame(
+        {
+            "col": rng.normal(size=10_000),
+            "datetime": pl.datetime_range(
+                start=datetime(year=2020, month=1, day=1, tzinfo=timezone.utc),
+                end=datetime(year=2020, month=4, day=1, tzinfo=timezone.utc),
+                interval="1h",
+                eager=True,
+            ).sample(10_000, with_replacement=True, seed=42),
+        }
+    )
+    stats = compute_temporal_stats(
+        frame=frame, column="col", dt_column="datetime", period="1mo", approximate=True
+    )
+    expected = compute_temporal_stats(frame=frame, column="col", dt_column="datetime", period="1mo")
+    assert_frame_equal(
+        stats.select("step", "count", "nunique", "mean", "std", "min", "max"),
+        expected.select("step", "count", "nunique", "mean", "std", "min", "max"),
+    )
+    for name in ["q05", "q25", "median", "q75", "q95"]:
+        assert np.abs(stats[name].to_numpy() - expected[name].to_numpy()).max() < 0.05
+
+
 def test_compute_temporal_stats_empty() -> None:
     out = compute_temporal_stats(
         pl.DataFrame(
@@ -143,6 +386,92 @@ def test_compute_temporal_stats_empty() -> None:
     )
 
 
+###############################################
+#     Tests for compute_temporal_sketches     #
+###############################################
+
+
+def test_compute_temporal_sketches() -> None:
+    frame = pl.DataFrame(
+        {
+            "col": [1.2, 4.2, 0.0, None, 4.2],
+            "datetime": [
+                datetime(year=2020, month=2, day=3, tzinfo=timezone.utc),
+                datetime(year=2020, month=1, day=4, tzinfo=timezone.utc),
+                datetime(year=2020, month=1, day=5, tzinfo=timezone.utc),
+                datetime(year=2020, month=1, day=3, tzinfo=timezone.utc),
+                datetime(year=2020, month=3, day=3, tzinfo=timezone.utc),
+            ],
+        },
+        schema={"col": pl.Float64, "datetime": pl.Datetime(time_unit="us", time_zone="UTC")},
+    )
+    sketches, steps = compute_temporal_sketches(
+        frame, column="col", dt_column="datetime", period="1mo", k=50
+    )
+    assert steps == ["2020-01", "2020-02", "2020-03"]
+    assert [sketch.k for sketch in sketches] == [50, 50, 50]
+    assert [sketch.count for sketch in sketches] == [2, 1, 1]
+    assert objects_are_equal(
+        [sketch.quantile([0.0, 1.0]).tolist() for sketch in sketches],
+        [[0.0, 4.2], [1.2, 1.2], [4.2, 4.2]],
+    )
+
+
+def test_compute_temporal_sketches_merge_partitions() -> None:
+    frame = pl.DataFrame(
+        {
+            "col": list(range(10)),
+            "datetime": [
+                datetime(year=2020, month=1, day=i + 1, tzinfo=timezone.utc) for i in range(10)
+            ],
+        },
+    )
+    sketches1, _ = compute_temporal_sketches(
+        frame.head(4), column="col", dt_column="datetime", period="1mo"
+    )
+    sketches2, _ = compute_temporal_sketches(
+        frame.tail(6), column="col", dt_column="datetime", period="1mo"
+    )
+    sketches1[0].merge(sketches2[0])
+    assert sketches1[0].quantile(0.5) == 4.5
+
+
+def test_compute_temporal_sketches_reproducible() -> None:
+    frame = pl.DataFrame(
+        {
+            "col": np.random.default_rng(42).normal(size=5_000),
+            "datetime": [
+                datetime(year=2020, month=1 + i % 2, day=1, tzinfo=timezone.utc)
+                for i in range(5_000)
+            ],
+        },
+    )
+    sketches1, _ = compute_temporal_sketches(
+        frame, column="col", dt_column="datetime", period="1mo"
+    )
+    sketches2, _ = compute_temporal_sketches(
+        frame, column="col", dt_column="datetime", period="1mo"
+    )
+    assert objects_are_equal(
+        [sketch.quantile([0.05, 0.5, 0.95]) for sketch in sketches1],
+        [sketch.quantile([0.05, 0.5, 0.95]) for sketch in sketches2],
+    )
+
+
+def test_compute_temporal_sketches_empty() -> None:
+    sketches, steps = compute_temporal_sketches(
+        pl.DataFrame(
+            {"col": [], "datetime": []},
+            schema={"col": pl.Float64, "datetime": pl.Datetime(time_unit="us", time_zone="UTC")},
+        ),
+        column="col",
+        dt_column="datetime",
+        period="1mo",
+    )
+    assert sketches == []
+    assert steps == []
+
+
 ########################################
 #     Tests for to_temporal_frames     #
 ########################################